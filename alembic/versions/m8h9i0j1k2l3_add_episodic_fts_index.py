@@ -0,0 +1,44 @@
+"""Add full-text index on episodic memory descriptions
+
+Revision ID: m8h9i0j1k2l3
+Revises: l7g8h9i0j1k2
+Create Date: 2026-10-18
+
+Hybrid lexical + vector recall (``HybridMemoryRetriever``) runs a
+``websearch_to_tsquery`` match against episode descriptions. Semantic
+memory already has ``idx_semantic_fts`` from the initial schema; this
+adds the matching GIN index for ``memory_episodes`` so the lexical leg
+is an index scan rather than a per-row ``to_tsvector`` over the whole
+table.
+
+The index expression must stay byte-identical to
+``empla.core.memory.hybrid.EPISODIC_TSVECTOR``. Built concurrently so
+it doesn't block episode writes from running employees.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "m8h9i0j1k2l3"
+down_revision: str | None = "l7g8h9i0j1k2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # NOTE: CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_episodes_fts
+            ON memory_episodes
+            USING gin (to_tsvector('english', description))
+            WHERE deleted_at IS NULL
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_episodes_fts")
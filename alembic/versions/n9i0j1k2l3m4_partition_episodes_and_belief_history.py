@@ -0,0 +1,166 @@
+"""Partition memory_episodes and belief_history by month
+
+Revision ID: n9i0j1k2l3m4
+Revises: m8h9i0j1k2l3
+Create Date: 2026-10-18
+
+Both tables are append-heavy and never pruned (``decay_beliefs`` alone
+writes a history row per belief per cycle), so vacuum and index
+maintenance pay for every row ever written while reads only touch
+recent months.
+
+This converts each into a declaratively RANGE-partitioned table:
+
+- ``memory_episodes`` by ``occurred_at``, ``belief_history`` by
+  ``changed_at``; one partition per calendar month named
+  ``<table>_pYYYYMM`` plus a ``<table>_default`` catch-all.
+- The primary key becomes ``(id, <partition column>)`` — Postgres
+  requires unique constraints on a partitioned table to include the
+  partition key. Nothing references either table by foreign key.
+- Partitions are created from the oldest existing row's month through
+  three months ahead; ``HistoryRetention`` (``empla memory retention``)
+  keeps pre-creating future months and archives expired ones.
+
+The conversion rewrites both tables under an ACCESS EXCLUSIVE lock, so
+run it in a maintenance window. Downgrade folds the attached partitions
+back into plain tables; months already archived to Parquet are not
+restored.
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "n9i0j1k2l3m4"
+down_revision: str | None = "m8h9i0j1k2l3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+MONTHS_AHEAD = 3
+
+# (table, partition column, FK clauses, index DDL templates)
+TABLES = {
+    "memory_episodes": {
+        "column": "occurred_at",
+        "fks": [
+            "FOREIGN KEY (employee_id) REFERENCES employees(id) ON DELETE CASCADE",
+            "FOREIGN KEY (tenant_id) REFERENCES tenants(id) ON DELETE CASCADE",
+        ],
+        "indexes": {
+            "idx_episodes_employee": ("ON {t} (employee_id, occurred_at) WHERE deleted_at IS NULL"),
+            "idx_episodes_type": "ON {t} (employee_id, episode_type) WHERE deleted_at IS NULL",
+            "idx_episodes_participants": (
+                "ON {t} USING gin (participants) WHERE deleted_at IS NULL"
+            ),
+            "idx_episodes_occurred": "ON {t} (occurred_at) WHERE deleted_at IS NULL",
+            "idx_episodes_tenant": "ON {t} (tenant_id) WHERE deleted_at IS NULL",
+            "idx_episodes_fts": (
+                "ON {t} USING gin (to_tsvector('english', description)) WHERE deleted_at IS NULL"
+            ),
+            "ix_memory_episodes_employee_id": "ON {t} (employee_id)",
+            "ix_memory_episodes_tenant_id": "ON {t} (tenant_id)",
+        },
+    },
+    "belief_history": {
+        "column": "changed_at",
+        "fks": [
+            "FOREIGN KEY (belief_id) REFERENCES beliefs(id) ON DELETE CASCADE",
+            "FOREIGN KEY (employee_id) REFERENCES employees(id) ON DELETE CASCADE",
+            "FOREIGN KEY (tenant_id) REFERENCES tenants(id) ON DELETE CASCADE",
+        ],
+        "indexes": {
+            "idx_belief_history_belief": "ON {t} (belief_id, changed_at)",
+            "idx_belief_history_employee": "ON {t} (employee_id, changed_at)",
+            "idx_belief_history_tenant": "ON {t} (tenant_id)",
+            "ix_belief_history_belief_id": "ON {t} (belief_id)",
+            "ix_belief_history_employee_id": "ON {t} (employee_id)",
+            "ix_belief_history_tenant_id": "ON {t} (tenant_id)",
+        },
+    },
+}
+
+
+def _add_months(month: datetime, count: int) -> datetime:
+    index = month.year * 12 + (month.month - 1) + count
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def _month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(UTC)
+    return datetime(moment.year, moment.month, 1, tzinfo=UTC)
+
+
+def _swap_out(table: str, spec: dict) -> str:
+    """Rename the live table aside and free its index names."""
+    legacy = f"{table}_unpartitioned"
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {legacy}_pkey")
+    for index in spec["indexes"]:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+    return legacy
+
+
+def _create_indexes(table: str, spec: dict) -> None:
+    for index, ddl in spec["indexes"].items():
+        op.execute(f"CREATE INDEX {index} " + ddl.format(t=table))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    current = _month_start(datetime.now(UTC))
+
+    for table, spec in TABLES.items():
+        column = spec["column"]
+        legacy = _swap_out(table, spec)
+
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {legacy} "
+            "INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS) "
+            f"PARTITION BY RANGE ({column})"
+        )
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, {column})")
+        for fk in spec["fks"]:
+            op.execute(f"ALTER TABLE {table} ADD {fk}")
+
+        oldest = bind.execute(text(f"SELECT min({column}) FROM {legacy}")).scalar()
+        month = _month_start(oldest) if oldest is not None else current
+        month = min(month, current)
+        while month <= _add_months(current, MONTHS_AHEAD):
+            op.execute(
+                f"CREATE TABLE {table}_p{month.year:04d}{month.month:02d} "
+                f"PARTITION OF {table} FOR VALUES FROM ('{month.isoformat()}') "
+                f"TO ('{_add_months(month, 1).isoformat()}')"
+            )
+            month = _add_months(month, 1)
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+        op.execute(f"DROP TABLE {legacy}")
+
+        # Indexes on the parent cascade to every partition (and to
+        # partitions created later).
+        _create_indexes(table, spec)
+
+
+def downgrade() -> None:
+    for table, spec in TABLES.items():
+        partitioned = f"{table}_partitioned"
+        op.execute(f"ALTER TABLE {table} RENAME TO {partitioned}")
+        op.execute(f"ALTER INDEX {table}_pkey RENAME TO {partitioned}_pkey")
+        for index in spec["indexes"]:
+            op.execute(f"DROP INDEX IF EXISTS {index}")
+
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {partitioned} "
+            "INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS)"
+        )
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)")
+        for fk in spec["fks"]:
+            op.execute(f"ALTER TABLE {table} ADD {fk}")
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {partitioned}")
+        # Dropping the parent drops every attached partition with it.
+        op.execute(f"DROP TABLE {partitioned}")
+        _create_indexes(table, spec)
@@ -0,0 +1,221 @@
+"""Add local CRM mirror tables
+
+Revision ID: o0j1k2l3m4n5
+Revises: n9i0j1k2l3m4
+Create Date: 2026-10-18
+
+``hubspot.get_pipeline_metrics`` used to page up to 10x100 deals from the
+HubSpot API on every call. The mirror keeps deals and contacts locally
+(seeded once, then updated by webhooks and ``lastmodifieddate`` delta
+searches) so pipeline aggregates and listings are indexed queries.
+
+``crm_sync_state`` holds the per-object-type seed time, delta watermark
+and webhook invalidation marker.
+
+The contact FTS index expression must stay byte-identical to
+``empla.models.crm.CONTACT_TSVECTOR``.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "o0j1k2l3m4n5"
+down_revision: str | None = "n9i0j1k2l3m4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _base_columns() -> list[sa.Column]:
+    """Columns inherited from TenantScopedModel."""
+    return [
+        sa.Column("id", sa.UUID(), nullable=False, comment="Unique identifier"),
+        sa.Column("tenant_id", sa.UUID(), nullable=False, comment="Tenant this record belongs to"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When this record was created (UTC)",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When this record was last updated (UTC)",
+        ),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When this record was soft-deleted (UTC), None if active",
+        ),
+    ]
+
+
+def _mirror_columns() -> list[sa.Column]:
+    """Provider identity + freshness columns shared by mirrored objects."""
+    return [
+        sa.Column(
+            "provider",
+            sa.String(length=50),
+            nullable=False,
+            comment="CRM provider (e.g., 'hubspot')",
+        ),
+        sa.Column(
+            "external_id", sa.String(length=64), nullable=False, comment="Object ID in the provider"
+        ),
+        sa.Column(
+            "properties",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+            comment="Raw provider properties as last seen",
+        ),
+        sa.Column(
+            "remote_updated_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Provider last-modified time; guards against out-of-order writes",
+        ),
+        sa.Column(
+            "synced_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When this row was last written from the provider",
+        ),
+    ]
+
+
+def _tenant_fk() -> sa.ForeignKeyConstraint:
+    return sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "crm_deals",
+        *_base_columns(),
+        *_mirror_columns(),
+        sa.Column(
+            "name",
+            sa.String(length=500),
+            server_default=sa.text("''"),
+            nullable=False,
+            comment="Deal name",
+        ),
+        sa.Column(
+            "stage",
+            sa.String(length=100),
+            nullable=True,
+            comment="Pipeline stage ID (e.g., 'qualifiedtobuy')",
+        ),
+        sa.Column("pipeline", sa.String(length=100), nullable=True, comment="Pipeline ID"),
+        sa.Column(
+            "amount", sa.Float(), nullable=True, comment="Deal amount in the portal currency"
+        ),
+        sa.Column(
+            "close_date",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Expected or actual close date",
+        ),
+        _tenant_fk(),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("tenant_id", "provider", "external_id", name="uq_crm_deals_external"),
+    )
+    op.create_index(op.f("ix_crm_deals_tenant_id"), "crm_deals", ["tenant_id"], unique=False)
+    op.create_index(
+        "idx_crm_deals_stage",
+        "crm_deals",
+        ["tenant_id", "provider", "stage"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "idx_crm_deals_updated",
+        "crm_deals",
+        ["tenant_id", "provider", sa.text("remote_updated_at DESC")],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+    op.create_table(
+        "crm_contacts",
+        *_base_columns(),
+        *_mirror_columns(),
+        sa.Column("email", sa.String(length=320), nullable=True, comment="Primary email address"),
+        sa.Column("first_name", sa.String(length=200), nullable=True),
+        sa.Column("last_name", sa.String(length=200), nullable=True),
+        sa.Column("company", sa.String(length=500), nullable=True),
+        _tenant_fk(),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id", "provider", "external_id", name="uq_crm_contacts_external"
+        ),
+    )
+    op.create_index(op.f("ix_crm_contacts_tenant_id"), "crm_contacts", ["tenant_id"], unique=False)
+    op.execute(
+        """
+        CREATE INDEX idx_crm_contacts_fts ON crm_contacts
+        USING gin (to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(company, '') || ' ' || translate(coalesce(email, ''), '@.', '  ')))
+        WHERE deleted_at IS NULL
+        """
+    )
+
+    op.create_table(
+        "crm_sync_state",
+        *_base_columns(),
+        sa.Column("provider", sa.String(length=50), nullable=False),
+        sa.Column(
+            "object_type",
+            sa.String(length=50),
+            nullable=False,
+            comment="Mirrored object type ('deals' or 'contacts')",
+        ),
+        sa.Column(
+            "seeded_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the last full seed completed",
+        ),
+        sa.Column(
+            "synced_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Start time of the last completed seed or delta sync",
+        ),
+        sa.Column(
+            "watermark",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Highest provider last-modified time mirrored so far",
+        ),
+        sa.Column(
+            "invalidated_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Latest webhook that could not be applied in place",
+        ),
+        _tenant_fk(),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id", "provider", "object_type", name="uq_crm_sync_state_object"
+        ),
+    )
+    op.create_index(
+        op.f("ix_crm_sync_state_tenant_id"), "crm_sync_state", ["tenant_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_crm_sync_state_tenant_id"), table_name="crm_sync_state")
+    op.drop_table("crm_sync_state")
+    op.execute("DROP INDEX IF EXISTS idx_crm_contacts_fts")
+    op.drop_index(op.f("ix_crm_contacts_tenant_id"), table_name="crm_contacts")
+    op.drop_table("crm_contacts")
+    op.drop_index("idx_crm_deals_updated", table_name="crm_deals")
+    op.drop_index("idx_crm_deals_stage", table_name="crm_deals")
+    op.drop_index(op.f("ix_crm_deals_tenant_id"), table_name="crm_deals")
+    op.drop_table("crm_deals")
@@ -0,0 +1,98 @@
+"""Add integration_sync_cursors table
+
+Revision ID: p1k2l3m4n5o6
+Revises: o0j1k2l3m4n5
+Create Date: 2026-10-18
+
+Per-employee incremental sync positions for delta-syncing adapters. The
+Gmail adapter stores its mailbox ``historyId`` (plus the unread-message
+index it maintains from History API deltas) here so a restarted employee
+resumes with one ``history.list`` call instead of re-listing the mailbox.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "p1k2l3m4n5o6"
+down_revision: str | None = "o0j1k2l3m4n5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "integration_sync_cursors",
+        sa.Column("id", sa.UUID(), nullable=False, comment="Unique identifier"),
+        sa.Column("tenant_id", sa.UUID(), nullable=False, comment="Tenant this record belongs to"),
+        sa.Column(
+            "employee_id",
+            sa.UUID(),
+            nullable=False,
+            comment="Employee whose mailbox/calendar this cursor tracks",
+        ),
+        sa.Column(
+            "provider",
+            sa.String(length=50),
+            nullable=False,
+            comment="Adapter provider (e.g., 'gmail', 'google_calendar')",
+        ),
+        sa.Column(
+            "resource",
+            sa.String(length=255),
+            nullable=False,
+            comment="Synced resource within the provider (mailbox address, calendar ID)",
+        ),
+        sa.Column(
+            "state",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+            comment="Adapter-defined cursor state (historyId, syncToken, ...)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When this record was created (UTC)",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When this record was last updated (UTC)",
+        ),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When this record was soft-deleted (UTC), None if active",
+        ),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["employee_id"], ["employees.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_integration_sync_cursors_tenant_id"),
+        "integration_sync_cursors",
+        ["tenant_id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_sync_cursor_employee_resource",
+        "integration_sync_cursors",
+        ["employee_id", "provider", "resource"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_sync_cursor_employee_resource", table_name="integration_sync_cursors")
+    op.drop_index(
+        op.f("ix_integration_sync_cursors_tenant_id"), table_name="integration_sync_cursors"
+    )
+    op.drop_table("integration_sync_cursors")
@@ -0,0 +1,54 @@
+"""Add integrations.webhook_token_hashes
+
+Revision ID: q2l3m4n5o6p7
+Revises: p1k2l3m4n5o6
+Create Date: 2026-10-18
+
+Keyed hashes of each integration's current and previous webhook token,
+GIN-indexed so the public webhook receiver finds the owning integration
+with one index probe instead of comparing the token against every
+integration of the provider.
+
+Schema only: the hashes are keyed with the API's settings
+(EMPLA_WEBHOOK_TOKEN_HASH_KEY, else EMPLA_JWT_SECRET), so backfill existing
+tokens with the API's environment after upgrading:
+
+    python -m empla.cli webhooks reindex-tokens
+
+Until then the receiver matches unindexed (NULL) rows by comparing tokens.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "q2l3m4n5o6p7"
+down_revision: str | None = "p1k2l3m4n5o6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "integrations",
+        sa.Column(
+            "webhook_token_hashes",
+            sa.ARRAY(sa.String(length=64)),
+            nullable=True,
+            comment="HMAC-SHA256 (hex) of the current and previous webhook token",
+        ),
+    )
+    op.create_index(
+        "idx_integrations_webhook_token_hashes",
+        "integrations",
+        ["webhook_token_hashes"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_where=sa.text("deleted_at IS NULL AND webhook_token_hashes IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_integrations_webhook_token_hashes", table_name="integrations")
+    op.drop_column("integrations", "webhook_token_hashes")
@@ -0,0 +1,75 @@
+"""Add keyset pagination indexes for the activity, inbox and webhook feeds
+
+Revision ID: r3m4n5o6p7q8
+Revises: q2l3m4n5o6p7
+Create Date: 2026-10-18
+
+The list endpoints page by cursor on (timestamp, id) newest first
+(``empla.services.pagination``). With ``id`` as the last index column the
+"rows after this cursor" condition is one index range scan that stops
+after page_size + 1 rows, however deep the page.
+
+The activity and inbox indexes replace their (scope, timestamp) versions,
+which they cover. The webhook feed gets a partial index of its own, as
+audit_log is shared with every other actor type. memory_episodes is
+partitioned (no CONCURRENTLY) and per-employee small enough that the
+existing (employee_id, occurred_at) index serves it.
+
+Built concurrently so writes from running employees are not blocked.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "r3m4n5o6p7q8"
+down_revision: str | None = "q2l3m4n5o6p7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # NOTE: CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_employee_keyset "
+            "ON employee_activities (employee_id, occurred_at, id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_tenant_keyset "
+            "ON employee_activities (tenant_id, occurred_at, id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inbox_tenant_keyset "
+            "ON inbox_messages (tenant_id, created_at DESC, id DESC) "
+            "WHERE deleted_at IS NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_webhook_keyset "
+            "ON audit_log (tenant_id, occurred_at, id) "
+            "WHERE actor_type = 'webhook' AND deleted_at IS NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_activities_employee_time")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_activities_tenant_time")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_inbox_tenant_created")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_employee_time "
+            "ON employee_activities (employee_id, occurred_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_tenant_time "
+            "ON employee_activities (tenant_id, occurred_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inbox_tenant_created "
+            "ON inbox_messages (tenant_id, created_at DESC) "
+            "WHERE deleted_at IS NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audit_webhook_keyset")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_inbox_tenant_keyset")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_activities_tenant_keyset")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_activities_employee_keyset")
@@ -0,0 +1,46 @@
+"""Add insert-order indexes for the live SSE feeds
+
+Revision ID: s4n5o6p7q8r9
+Revises: r3m4n5o6p7q8
+Create Date: 2026-10-18
+
+The API tails employee_activities, inbox_messages and audit_log for rows
+newer than a created_at high-water mark (``empla.services.live_feed``)
+across all tenants. (created_at, id) indexes keep each poll an index-only
+range scan over the last few seconds instead of a scan of the table.
+
+Built concurrently so writes from running employees are not blocked.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "s4n5o6p7q8r9"
+down_revision: str | None = "r3m4n5o6p7q8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # NOTE: CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_created "
+            "ON employee_activities (created_at, id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inbox_created "
+            "ON inbox_messages (created_at, id) WHERE deleted_at IS NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_created "
+            "ON audit_log (created_at, id)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audit_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_inbox_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_activities_created")
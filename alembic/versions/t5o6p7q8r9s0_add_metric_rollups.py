@@ -0,0 +1,130 @@
+"""Add metric_rollups
+
+Revision ID: t5o6p7q8r9s0
+Revises: s4n5o6p7q8r9
+Create Date: 2026-10-18
+
+Minute and hour aggregates of the raw ``metrics`` rows per (tenant,
+employee, metric_name), written by ``python -m empla.cli metrics rollup``
+(``empla.services.metric_rollups``) and read by the metrics endpoints.
+
+``idx_metrics_timestamp`` serves the rollup job's time-range scans and
+raw-row retention; it is built concurrently so cycle metric writes are
+not blocked.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "t5o6p7q8r9s0"
+down_revision: str | None = "s4n5o6p7q8r9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "metric_rollups",
+        sa.Column("id", sa.UUID(), nullable=False, comment="Unique identifier"),
+        sa.Column("tenant_id", sa.UUID(), nullable=False, comment="Tenant this record belongs to"),
+        sa.Column(
+            "employee_id",
+            sa.UUID(),
+            nullable=False,
+            comment="Employee the aggregated metrics relate to",
+        ),
+        sa.Column(
+            "metric_name",
+            sa.String(length=200),
+            nullable=False,
+            comment="Metric name (dotted notation: cycle.duration_seconds)",
+        ),
+        sa.Column(
+            "metric_type",
+            sa.String(length=20),
+            nullable=False,
+            comment="Type of the aggregated metric (counter, gauge, histogram)",
+        ),
+        sa.Column(
+            "resolution_seconds",
+            sa.Integer(),
+            nullable=False,
+            comment="Bucket width: 60 (minute) or 3600 (hour)",
+        ),
+        sa.Column(
+            "bucket_start",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Start of the bucket (UTC), aligned to the resolution",
+        ),
+        sa.Column(
+            "sample_count", sa.Integer(), nullable=False, comment="Raw metric rows in the bucket"
+        ),
+        sa.Column("value_sum", sa.Float(), nullable=False, comment="Sum of values"),
+        sa.Column("value_min", sa.Float(), nullable=False, comment="Smallest value"),
+        sa.Column("value_max", sa.Float(), nullable=False, comment="Largest value"),
+        sa.Column(
+            "histogram",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Log-bucketed value counts (histogram metrics only)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When this record was created (UTC)",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When this record was last updated (UTC)",
+        ),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When this record was soft-deleted (UTC), None if active",
+        ),
+        sa.CheckConstraint("resolution_seconds IN (60, 3600)", name="ck_metric_rollups_resolution"),
+        sa.ForeignKeyConstraint(["employee_id"], ["employees.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "employee_id",
+            "resolution_seconds",
+            "metric_name",
+            "bucket_start",
+            "tenant_id",
+            name="uq_metric_rollups_bucket",
+        ),
+    )
+    op.create_index(
+        "idx_metric_rollups_resolution",
+        "metric_rollups",
+        ["resolution_seconds", "bucket_start"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_metric_rollups_tenant_id"), "metric_rollups", ["tenant_id"], unique=False
+    )
+
+    # NOTE: CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_metrics_timestamp ON metrics ("timestamp")'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_metrics_timestamp")
+    op.drop_index(op.f("ix_metric_rollups_tenant_id"), table_name="metric_rollups")
+    op.drop_index("idx_metric_rollups_resolution", table_name="metric_rollups")
+    op.drop_table("metric_rollups")
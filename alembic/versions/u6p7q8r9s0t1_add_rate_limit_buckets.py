@@ -0,0 +1,47 @@
+"""Add rate_limit_buckets for shared API rate limits
+
+Revision ID: u6p7q8r9s0t1
+Revises: t5o6p7q8r9s0
+Create Date: 2026-10-18
+
+With EMPLA_RATE_LIMIT_BACKEND=postgres every API replica checks limits
+against this table (``empla.api.ratelimit.PostgresRateLimitStore``): one
+row per limited key holding its GCRA theoretical arrival time, advanced
+by a single upsert per request. The tat index serves the sweep of
+expired rows.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "u6p7q8r9s0t1"
+down_revision: str | None = "t5o6p7q8r9s0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column(
+            "key",
+            sa.String(length=255),
+            nullable=False,
+            comment="Limiter name and client identifier",
+        ),
+        sa.Column(
+            "tat",
+            sa.Float(),
+            nullable=False,
+            comment="Theoretical arrival time (Unix epoch seconds, database clock)",
+        ),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index("idx_rate_limit_buckets_tat", "rate_limit_buckets", ["tat"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_rate_limit_buckets_tat", table_name="rate_limit_buckets")
+    op.drop_table("rate_limit_buckets")
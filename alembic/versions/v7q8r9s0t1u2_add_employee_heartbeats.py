@@ -0,0 +1,119 @@
+"""Add employee_heartbeats for push-based runner health
+
+Revision ID: v7q8r9s0t1u2
+Revises: u6p7q8r9s0t1
+Create Date: 2026-10-19
+
+Every runner upserts its row here on an interval
+(``empla.services.heartbeat.HeartbeatReporter``); the status, health and
+fleet endpoints read it in one join instead of polling each runner's
+health server over HTTP.
+
+The table is UNLOGGED (it only ever holds the latest report per runner,
+and runners re-populate it within one interval after a crash) with
+fillfactor 70 so the frequent upserts stay HOT updates.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "v7q8r9s0t1u2"
+down_revision: str | None = "u6p7q8r9s0t1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "employee_heartbeats",
+        sa.Column("employee_id", sa.UUID(), nullable=False, comment="Employee the runner executes"),
+        sa.Column("tenant_id", sa.UUID(), nullable=False, comment="Tenant the employee belongs to"),
+        sa.Column(
+            "state",
+            sa.String(length=20),
+            nullable=False,
+            comment="Runner state: running, stopped after a clean shutdown, or crashed",
+        ),
+        sa.Column(
+            "error",
+            sa.Text(),
+            nullable=True,
+            comment="Why the runner crashed (redacted), set with state 'crashed'",
+        ),
+        sa.Column(
+            "phase",
+            sa.String(length=50),
+            nullable=True,
+            comment="BDI phase the loop was in at report time (idle between cycles)",
+        ),
+        sa.Column(
+            "cycle_count",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+            comment="Cycles started since the runner started",
+        ),
+        sa.Column(
+            "last_cycle_duration_seconds",
+            sa.Float(),
+            nullable=True,
+            comment="Duration of the last completed cycle",
+        ),
+        sa.Column(
+            "last_cycle_success",
+            sa.Boolean(),
+            nullable=True,
+            comment="Whether the last completed cycle succeeded",
+        ),
+        sa.Column(
+            "cost_usd",
+            sa.Float(),
+            server_default=sa.text("0"),
+            nullable=False,
+            comment="LLM cost since the runner started (USD)",
+        ),
+        sa.Column(
+            "tool_health",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+            comment="Per-integration status, call count, error rate and p95 latency",
+        ),
+        sa.Column("pid", sa.Integer(), nullable=True, comment="Runner process id on its host"),
+        sa.Column(
+            "host", sa.String(length=255), nullable=True, comment="Host the runner process runs on"
+        ),
+        sa.Column(
+            "health_port",
+            sa.Integer(),
+            nullable=True,
+            comment="Runner health server port on its host",
+        ),
+        sa.Column(
+            "started_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="When the runner started (UTC)",
+        ),
+        sa.Column(
+            "reported_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When the runner last reported (UTC, database clock)",
+        ),
+        sa.ForeignKeyConstraint(["employee_id"], ["employees.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("employee_id"),
+        prefixes=["UNLOGGED"],
+        postgresql_with={"fillfactor": 70},
+    )
+    op.create_index("idx_employee_heartbeats_tenant", "employee_heartbeats", ["tenant_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_employee_heartbeats_tenant", table_name="employee_heartbeats")
+    op.drop_table("employee_heartbeats")
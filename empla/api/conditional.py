@@ -0,0 +1,147 @@
+"""
+empla.api.conditional - Conditional GET (ETag / If-None-Match)
+
+Dashboard pages poll the same read endpoints every few seconds and almost
+always get back what they already have. Each poll used to run the full
+list query (count plus page) and serialize the result again.
+
+Endpoints that opt in compute a version token first. The token is one
+aggregate over the rows the response is built from: count, max
+``updated_at``, and the sum of the ``updated_at`` epochs. The sum catches
+an update committed by a transaction that started before the current
+maximum. That happens often, because the BDI loop holds its session open
+across a cycle, so ``now()`` in its writes lags its commit.
+
+- If the client's ``If-None-Match`` matches, the endpoint answers
+  ``304 Not Modified`` and never runs the full query.
+- Otherwise the response carries the ``ETag`` and is serialized in one
+  pass by pydantic's Rust encoder (:meth:`ConditionalGet.respond`),
+  rather than validated again and encoded by ``json.dumps``.
+
+The ETag is weak (``W/"..."``). It covers the version and the request path
+and query, so every page and filter combination gets its own tag.
+``Cache-Control: private, no-cache`` lets browsers store the response but
+makes them revalidate it on every poll.
+
+Example:
+    >>> @router.get("/{employee_id}/beliefs", response_model=BeliefListResponse)
+    ... async def list_beliefs(db: DBSession, auth: CurrentUser, employee_id: UUID,
+    ...                        conditional: Conditional = UNCONDITIONAL):
+    ...     etag = await conditional.etag(db, version_query(Belief, *filters))
+    ...     if conditional.matches(etag):
+    ...         return not_modified(etag)
+    ...     ...
+    ...     return conditional.respond(BeliefListResponse(...), etag)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import Annotated, Any, TypeVar
+
+from fastapi import Depends, Request, Response, status
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+CACHE_CONTROL = "private, no-cache"
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def version_query(model: Any, *criteria: ColumnElement[bool]) -> Select[Any]:
+    """
+    Build the version aggregate for the rows of ``model`` matching ``criteria``.
+
+    Pass the same filters the response is built from, but no ordering or
+    pagination: any insert, update, or delete in the filtered set changes
+    the result.
+    """
+    updated_at = model.updated_at
+    return select(
+        func.count(),
+        func.max(updated_at),
+        func.sum(func.extract("epoch", updated_at)),
+    ).where(*criteria)
+
+
+def _opaque_tags(header: str) -> set[str]:
+    """Opaque tags of an If-None-Match header, ignoring weakness prefixes."""
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+@dataclass(frozen=True)
+class ConditionalGet:
+    """
+    A GET request's cache validator and the scope its ETags cover.
+
+    ``enabled`` is False only for :data:`UNCONDITIONAL`, the default that
+    direct callers (tests, internal reuse) get. With it disabled,
+    endpoints skip the version query and return their models unchanged.
+    """
+
+    if_none_match: str | None = None
+    scope: str = ""
+    enabled: bool = True
+
+    def make_etag(self, *version: Any) -> str:
+        """Weak ETag for ``version`` within this request's path and query."""
+        digest = hashlib.blake2b(repr((self.scope, version)).encode(), digest_size=16).hexdigest()
+        return f'W/"{digest}"'
+
+    async def etag(self, db: AsyncSession, query: Select[Any]) -> str | None:
+        """Run a version query (see :func:`version_query`) and return the ETag."""
+        if not self.enabled:
+            return None
+        row = (await db.execute(query)).one()
+        return self.make_etag(*row)
+
+    def matches(self, etag: str | None) -> bool:
+        """
+        Whether the client already holds the representation tagged ``etag``.
+
+        Comparison is weak (RFC 9110 section 13.1.2). ``*`` is not honoured:
+        it only makes sense for writes, and matching it would turn a 404
+        for a missing resource into a 304.
+        """
+        if etag is None or not self.if_none_match:
+            return False
+        return etag.removeprefix("W/") in _opaque_tags(self.if_none_match)
+
+    def respond(self, model: M, etag: str | None) -> M | Response:
+        """Serialize ``model`` in one pass and attach the validators."""
+        if not self.enabled:
+            return model
+        headers = {"Cache-Control": CACHE_CONTROL}
+        if etag is not None:
+            headers["ETag"] = etag
+        return Response(
+            content=model.model_dump_json(),
+            media_type="application/json",
+            headers=headers,
+        )
+
+
+UNCONDITIONAL = ConditionalGet(enabled=False)
+
+
+def not_modified(etag: str | None) -> Response:
+    """304 response confirming the client's cached representation."""
+    headers = {"Cache-Control": CACHE_CONTROL}
+    if etag is not None:
+        headers["ETag"] = etag
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def get_conditional(request: Request) -> ConditionalGet:
+    """Dependency: read If-None-Match and scope ETags to the path and query."""
+    return ConditionalGet(
+        if_none_match=request.headers.get("if-none-match"),
+        scope=f"{request.url.path}?{request.url.query}",
+    )
+
+
+# Type alias for endpoints; give it the UNCONDITIONAL default so direct
+# calls need not build a request.
+Conditional = Annotated[ConditionalGet, Depends(get_conditional)]
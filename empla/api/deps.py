@@ -4,6 +4,10 @@ empla.api.deps - FastAPI Dependencies
 Provides reusable dependencies for API endpoints:
 - get_db: Database session
 - get_current_user: JWT authentication (returns AuthContext with user and tenant)
+
+Resolved principals are cached per token for a short TTL
+(empla.services.principal_cache), so most authenticated requests cost no
+queries before the endpoint's own.
 """
 
 import logging
@@ -18,6 +22,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from empla.models.tenant import Tenant, User
+from empla.services.principal_cache import get_principal_cache
 from empla.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -84,7 +89,9 @@ async def get_current_user(
     Validate JWT token and return the authenticated user context.
 
     Decodes the Bearer token as a JWT (HS256), extracts user_id and tenant_id
-    from claims, verifies the user and tenant exist and are active.
+    from claims, verifies the user and tenant exist and are active. A token
+    resolved within the principal cache TTL skips the two lookups; commits
+    that change the user or tenant drop its entry.
 
     Args:
         credentials: Bearer token from Authorization header
@@ -146,6 +153,16 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
+    # Tokens are keyed by issue time too, so a re-issued token never
+    # inherits another's entry. Tokens without iat are not cached.
+    iat = payload.get("iat")
+    cache_key = (user_id, tenant_id, iat) if isinstance(iat, int) else None
+    cache = get_principal_cache()
+    if cache_key is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return AuthContext(user=cached[0], tenant=cached[1])
+
     # Fetch user from database
     result = await db.execute(
         select(User).where(
@@ -185,6 +202,8 @@ async def get_current_user(
             detail="Tenant is not active",
         )
 
+    if cache_key is not None:
+        cache.put(cache_key, user, tenant)
     return AuthContext(user=user, tenant=tenant)
 
 
@@ -16,11 +16,15 @@ import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from empla.api.ratelimit import create_rate_limit_store
 from empla.api.v1.router import api_router
 from empla.models.database import get_engine, get_sessionmaker
+from empla.services.live_feed import LiveFeedHub
+from empla.services.pagination import InvalidCursorError
 from empla.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -53,6 +57,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     logger.info("Database connection pool initialized")
 
+    # Shared rate limit state for multi-replica deployments (None keeps
+    # each limiter's state in this process).
+    app.state.rate_limit_store = create_rate_limit_store(
+        settings.rate_limit_backend, app.state.sessionmaker
+    )
+
+    # One database tail per SSE feed, shared by every open stream.
+    app.state.live_feeds = LiveFeedHub(
+        app.state.sessionmaker,
+        poll_interval=settings.live_feed_poll_interval,
+        overlap_seconds=settings.live_feed_overlap_seconds,
+        queue_size=settings.live_feed_queue_size,
+    )
+
     # Long-lived httpx client for runner-proxy endpoints (PR #80 follow-up).
     # Bounded connection pool so a misbehaving runner can't exhaust sockets.
     import httpx as _httpx
@@ -67,6 +85,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down empla API server...")
     await app.state.runner_proxy_client.aclose()
+    await app.state.live_feeds.close()
     await engine.dispose()
     logger.info("Database connections closed")
 
@@ -102,6 +121,11 @@ def create_app() -> FastAPI:
     # Include API routes
     app.include_router(api_router, prefix="/api/v1")
 
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> JSONResponse:  # noqa: ARG001
+        """A stale or tampered ``cursor`` query parameter is a client error."""
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
     @app.get("/health")
     async def health_check() -> dict[str, str]:
         """Health check endpoint."""
@@ -1,33 +1,57 @@
 """
-empla.api.ratelimit - Simple Rate Limiting for API Endpoints
+empla.api.ratelimit - Rate Limiting for API Endpoints
 
-Provides in-memory rate limiting for API endpoints. Suitable for single-instance
-deployments. For multi-instance deployments, use Redis-based rate limiting.
+GCRA (generic cell rate algorithm) limiters: the token-bucket behaviour of
+"``max_requests`` per ``window_seconds``, bursts allowed" with a single
+number of state per key, the key's theoretical arrival time (TAT). Each
+check is one compare-and-advance of that number, so memory does not grow
+with traffic and the check maps onto one atomic database statement.
+
+State lives in a store:
+
+- MemoryRateLimitStore: per API process (the default).
+- PostgresRateLimitStore: shared by all replicas through the
+  ``rate_limit_buckets`` table, one ``INSERT ... ON CONFLICT ... RETURNING``
+  per check (``EMPLA_RATE_LIMIT_BACKEND=postgres``).
+
+The app lifespan puts the configured store on ``app.state.rate_limit_store``;
+the :class:`RateLimit` dependency uses it and falls back to the limiter's own
+in-process state when it is missing or failing (limits fail open rather than
+turning a database hiccup into 5xx/429s).
 
 Usage:
-    from empla.api.ratelimit import RateLimiter, RateLimitExceeded
+    from empla.api.ratelimit import RateLimit, RateLimiter
 
-    # Create a rate limiter: 10 requests per minute
-    limiter = RateLimiter(max_requests=10, window_seconds=60)
+    limiter = RateLimiter(max_requests=10, window_seconds=60, name="callback")
 
-    @router.get("/endpoint")
-    async def endpoint(request: Request):
-        client_ip = request.client.host
-        if not limiter.is_allowed(client_ip):
-            raise RateLimitExceeded()
+    @router.get("/endpoint", dependencies=[Depends(RateLimit(limiter))])
+    async def endpoint():
         return {"status": "ok"}
+
+Responses carry ``RateLimit-Limit``, ``RateLimit-Remaining``,
+``RateLimit-Reset`` and ``RateLimit-Policy`` headers; a 429 adds
+``Retry-After``.
 """
 
+from __future__ import annotations
+
 import logging
+import math
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
-from threading import Lock
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
 
-from fastapi import HTTPException, Request, status
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 logger = logging.getLogger(__name__)
 
+# Slack for float rounding when ``window / limit`` is not exact, so the
+# last request of a full burst is not refused by 1e-15 s.
+_EPSILON = 1e-9
+
 
 class RateLimitExceeded(HTTPException):
     """Exception raised when rate limit is exceeded."""
@@ -36,31 +60,220 @@ class RateLimitExceeded(HTTPException):
         self,
         retry_after: int = 60,
         detail: str = "Too many requests. Please try again later.",
+        headers: dict[str, str] | None = None,
     ) -> None:
         super().__init__(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=detail,
-            headers={"Retry-After": str(retry_after)},
+            headers={**(headers or {}), "Retry-After": str(retry_after)},
         )
         self.retry_after = retry_after
 
 
-@dataclass
-class RateLimitState:
-    """Tracks rate limit state for a single key."""
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of one rate limit check.
+
+    Attributes:
+        allowed: Whether the request may proceed.
+        limit: Requests allowed per window.
+        window_seconds: Window length.
+        remaining: Requests that would still be allowed right now.
+        reset_after: Seconds until the key's full allowance is back.
+        retry_after: Seconds until the next request would be allowed
+            (0 when allowed).
+    """
+
+    allowed: bool
+    limit: int
+    window_seconds: float
+    remaining: int
+    reset_after: float
+    retry_after: float
+
+    def headers(self) -> dict[str, str]:
+        """``RateLimit-*`` response headers for this decision."""
+        return {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(math.ceil(self.reset_after)),
+            "RateLimit-Policy": f"{self.limit};w={math.ceil(self.window_seconds)}",
+        }
+
+
+def gcra_decision(
+    limit: int, window: float, now: float, tat: float | None, granted_tat: float | None
+) -> RateLimitDecision:
+    """Build a decision from a key's TAT before and (if granted) after a check.
+
+    Args:
+        limit: Requests per window.
+        window: Window length in seconds.
+        now: Clock reading the check was made at.
+        tat: The key's TAT before the check (None for an unseen key).
+        granted_tat: The TAT after the check, or None if it was refused.
+    """
+    interval = window / limit
+    if granted_tat is not None:
+        backlog = max(0.0, granted_tat - now)
+        return RateLimitDecision(
+            allowed=True,
+            limit=limit,
+            window_seconds=window,
+            remaining=max(0, math.floor((window - backlog) / interval + _EPSILON)),
+            reset_after=backlog,
+            retry_after=0.0,
+        )
+    backlog = max(0.0, (tat or now) - now)
+    return RateLimitDecision(
+        allowed=False,
+        limit=limit,
+        window_seconds=window,
+        remaining=0,
+        reset_after=backlog,
+        retry_after=max(0.0, backlog + interval - window),
+    )
+
+
+class RateLimitStore(Protocol):
+    """Where limiter state lives. One atomic check per call."""
+
+    async def acquire(self, key: str, limit: int, window: float) -> RateLimitDecision: ...
+
+
+class MemoryRateLimitStore:
+    """
+    Per-process GCRA state: one float per active key.
+
+    Checks never await, so they are atomic on the event loop without a
+    lock. Keys whose TAT has passed hold no information (they are back to
+    a full allowance) and are swept every ``cleanup_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        cleanup_interval: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.cleanup_interval = cleanup_interval
+        self._clock = clock
+        self._tats: dict[str, float] = {}
+        self._last_cleanup = clock()
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    def acquire_now(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        """Synchronous check-and-advance."""
+        now = self._clock()
+        if now - self._last_cleanup >= self.cleanup_interval:
+            self._cleanup(now)
+        tat = self._tats.get(key)
+        candidate = max(tat or now, now) + window / limit
+        if candidate - now <= window + _EPSILON:
+            self._tats[key] = candidate
+            return gcra_decision(limit, window, now, tat, candidate)
+        logger.warning(
+            f"Rate limit exceeded for key: {key[:20]}...",
+            extra={"key_prefix": key[:20]},
+        )
+        return gcra_decision(limit, window, now, tat, None)
+
+    async def acquire(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        return self.acquire_now(key, limit, window)
+
+    def backlog(self, key: str) -> float:
+        """Seconds of allowance the key has used (0 when full)."""
+        tat = self._tats.get(key)
+        return 0.0 if tat is None else max(0.0, tat - self._clock())
+
+    def _cleanup(self, now: float) -> None:
+        """Drop keys that are back to a full allowance."""
+        expired = [key for key, tat in self._tats.items() if tat <= now]
+        for key in expired:
+            del self._tats[key]
+        self._last_cleanup = now
+        if expired:
+            logger.debug(f"Rate limiter cleanup: removed {len(expired)} stale entries")
+
+
+# One statement per check. ``granted`` advances the TAT only when the
+# request fits (the ON CONFLICT WHERE is evaluated against the locked,
+# latest row version); the outer SELECT reads the statement's snapshot,
+# i.e. the TAT from before this check, for the Retry-After of a refusal.
+_ACQUIRE_SQL = text("""
+WITH clock AS (
+    SELECT EXTRACT(EPOCH FROM clock_timestamp())::float8 AS now
+), granted AS (
+    INSERT INTO rate_limit_buckets AS b (key, tat)
+    SELECT :key, clock.now + :interval FROM clock
+    ON CONFLICT (key) DO UPDATE
+        SET tat = GREATEST(b.tat, EXCLUDED.tat - :interval) + :interval
+        WHERE GREATEST(b.tat, EXCLUDED.tat - :interval) + :interval
+              - (EXCLUDED.tat - :interval) <= :window + 1e-9
+    RETURNING b.tat
+)
+SELECT clock.now AS now,
+       (SELECT tat FROM granted) AS granted_tat,
+       (SELECT tat FROM rate_limit_buckets WHERE key = :key) AS tat
+FROM clock
+""")
+
+_SWEEP_SQL = text("""
+DELETE FROM rate_limit_buckets
+WHERE tat < EXTRACT(EPOCH FROM clock_timestamp())::float8
+""")
+
+
+class PostgresRateLimitStore:
+    """
+    GCRA state shared by API replicas in ``rate_limit_buckets``.
+
+    Each check is one upsert on a short-lived session, timed by the
+    database clock so replicas with skewed clocks agree. Expired rows are
+    swept every ``cleanup_interval`` seconds by whichever replica gets
+    there first (the DELETE is idempotent).
+    """
 
-    request_times: list[float] = field(default_factory=list)
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        cleanup_interval: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self.cleanup_interval = cleanup_interval
+        self._clock = clock
+        self._last_cleanup = clock()
+
+    async def acquire(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        sweep = self._clock() - self._last_cleanup >= self.cleanup_interval
+        async with self._sessionmaker() as session:
+            row = (
+                await session.execute(
+                    _ACQUIRE_SQL, {"key": key, "interval": window / limit, "window": window}
+                )
+            ).one()
+            if sweep:
+                self._last_cleanup = self._clock()
+                await session.execute(_SWEEP_SQL)
+            await session.commit()
+        return gcra_decision(limit, window, row.now, row.tat, row.granted_tat)
 
 
 class RateLimiter:
     """
-    Simple in-memory rate limiter using sliding window algorithm.
+    GCRA limiter: ``max_requests`` per ``window_seconds``, bursting up to
+    ``max_requests`` from a full allowance.
 
-    Not suitable for multi-instance deployments without shared state (e.g., Redis).
+    Requests earn back allowance continuously (one every
+    ``window_seconds / max_requests``) instead of all at once when a
+    window ends.
 
     Attributes:
         max_requests: Maximum number of requests allowed in the window
-        window_seconds: Size of the sliding window in seconds
+        window_seconds: Size of the window in seconds
+        name: Prefix for keys in a shared store
 
     Example:
         >>> limiter = RateLimiter(max_requests=5, window_seconds=60)
@@ -74,6 +287,9 @@ class RateLimiter:
         max_requests: int = 10,
         window_seconds: int = 60,
         cleanup_interval: int = 300,
+        *,
+        name: str = "default",
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """
         Initialize the rate limiter.
@@ -81,18 +297,44 @@ class RateLimiter:
         Args:
             max_requests: Maximum requests allowed per window
             window_seconds: Window size in seconds
-            cleanup_interval: How often to clean up old entries (seconds)
+            cleanup_interval: How often to clean up idle keys (seconds)
+            name: Limiter name; namespaces keys in a shared store
+            clock: Monotonic time source for in-process state (tests)
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.cleanup_interval = cleanup_interval
-        self._states: dict[str, RateLimitState] = defaultdict(RateLimitState)
-        self._lock = Lock()
-        self._last_cleanup = time.time()
+        self.name = name
+        self.local = MemoryRateLimitStore(cleanup_interval, clock)
+
+    @property
+    def emission_interval(self) -> float:
+        """Seconds of allowance one request uses."""
+        return self.window_seconds / self.max_requests
+
+    async def check(self, key: str, store: RateLimitStore | None = None) -> RateLimitDecision:
+        """
+        Check and count a request.
+
+        Args:
+            key: Identifier for rate limiting (e.g., IP address, user ID)
+            store: Shared store; the limiter's in-process state when None.
+                A failing store falls back to in-process state.
+        """
+        if store is None:
+            return self.local.acquire_now(key, self.max_requests, self.window_seconds)
+        try:
+            return await store.acquire(f"{self.name}:{key}", self.max_requests, self.window_seconds)
+        except Exception:
+            logger.warning(
+                "Shared rate limit store failed; using in-process limits",
+                exc_info=True,
+                extra={"limiter": self.name},
+            )
+            return self.local.acquire_now(key, self.max_requests, self.window_seconds)
 
     def is_allowed(self, key: str) -> bool:
         """
-        Check if a request is allowed for the given key.
+        Check and count a request against in-process state.
 
         Args:
             key: Identifier for rate limiting (e.g., IP address, user ID)
@@ -100,91 +342,81 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limit exceeded
         """
-        now = time.time()
-        cutoff = now - self.window_seconds
-
-        with self._lock:
-            # Periodic cleanup of old entries
-            if now - self._last_cleanup > self.cleanup_interval:
-                self._cleanup(now)
-
-            state = self._states[key]
-
-            # Remove old requests outside the window
-            state.request_times = [t for t in state.request_times if t > cutoff]
-
-            # Check if under limit
-            if len(state.request_times) >= self.max_requests:
-                logger.warning(
-                    f"Rate limit exceeded for key: {key[:20]}...",
-                    extra={"key_prefix": key[:20], "requests_in_window": len(state.request_times)},
-                )
-                return False
-
-            # Record this request
-            state.request_times.append(now)
-            return True
+        return self.local.acquire_now(key, self.max_requests, self.window_seconds).allowed
 
     def get_remaining(self, key: str) -> int:
         """
-        Get remaining requests allowed for the key.
+        Get remaining requests allowed for the key (in-process state).
 
         Args:
             key: Identifier for rate limiting
 
         Returns:
-            Number of remaining requests in current window
+            Number of requests that would be allowed right now
         """
-        now = time.time()
-        cutoff = now - self.window_seconds
-
-        with self._lock:
-            state = self._states[key]
-            current_count = len([t for t in state.request_times if t > cutoff])
-            return max(0, self.max_requests - current_count)
+        backlog = self.local.backlog(key)
+        return max(
+            0, math.floor((self.window_seconds - backlog) / self.emission_interval + _EPSILON)
+        )
 
     def get_reset_time(self, key: str) -> float:
         """
-        Get time until rate limit resets for the key.
+        Get time until the key's full allowance is back (in-process state).
 
         Args:
             key: Identifier for rate limiting
 
         Returns:
-            Seconds until oldest request expires from window
+            Seconds until the key is back to ``max_requests`` (0 if it is)
         """
-        now = time.time()
-        cutoff = now - self.window_seconds
-
-        with self._lock:
-            state = self._states[key]
-            valid_times = [t for t in state.request_times if t > cutoff]
+        return self.local.backlog(key)
 
-            if not valid_times:
-                return 0
 
-            oldest = min(valid_times)
-            return max(0, oldest + self.window_seconds - now)
-
-    def _cleanup(self, now: float) -> None:
-        """Remove stale entries to prevent memory growth."""
-        cutoff = now - self.window_seconds
-        keys_to_remove = []
-
-        for key, state in self._states.items():
-            # Remove old requests
-            state.request_times = [t for t in state.request_times if t > cutoff]
-            # Mark empty states for removal
-            if not state.request_times:
-                keys_to_remove.append(key)
+class RateLimit:
+    """
+    FastAPI dependency enforcing a limiter.
 
-        for key in keys_to_remove:
-            del self._states[key]
+    Sets ``RateLimit-*`` headers on the response (when the endpoint returns
+    a model rather than a Response of its own) and raises 429 with the
+    same headers plus ``Retry-After`` when the key is over its limit.
 
-        self._last_cleanup = now
+    Args:
+        limiter: Limiter to enforce.
+        key_func: Maps the request to its rate-limit key.
+        detail: 429 response detail.
+    """
 
-        if keys_to_remove:
-            logger.debug(f"Rate limiter cleanup: removed {len(keys_to_remove)} stale entries")
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        key_func: Callable[[Request], str] | None = None,
+        detail: str = "Too many requests. Please try again later.",
+    ) -> None:
+        self.limiter = limiter
+        self.key_func = key_func or get_client_identifier
+        self.detail = detail
+
+    async def __call__(self, request: Request, response: Response) -> RateLimitDecision:
+        store = getattr(request.app.state, "rate_limit_store", None)
+        decision = await self.limiter.check(self.key_func(request), store)
+        headers = decision.headers()
+        if not decision.allowed:
+            raise RateLimitExceeded(
+                retry_after=max(1, math.ceil(decision.retry_after)),
+                detail=self.detail,
+                headers=headers,
+            )
+        response.headers.update(headers)
+        return decision
+
+
+def create_rate_limit_store(
+    backend: str, sessionmaker: async_sessionmaker[AsyncSession]
+) -> RateLimitStore | None:
+    """The shared store for ``EMPLA_RATE_LIMIT_BACKEND`` (None for "memory")."""
+    if backend == "postgres":
+        return PostgresRateLimitStore(sessionmaker)
+    return None
 
 
 def get_client_identifier(request: Request) -> str:
@@ -216,9 +448,11 @@ def get_client_identifier(request: Request) -> str:
 oauth_callback_limiter = RateLimiter(
     max_requests=10,  # 10 OAuth callbacks per IP
     window_seconds=60,  # per minute
+    name="oauth_callback",
 )
 
 api_default_limiter = RateLimiter(
     max_requests=100,  # 100 requests per IP
     window_seconds=60,  # per minute
+    name="api_default",
 )
@@ -0,0 +1,153 @@
+"""
+empla.api.sse - Server-Sent Event Streams
+
+HTTP side of the live feeds (``empla.services.live_feed``). A stream:
+
+1. subscribes to the feed first, so nothing committed during step 2 is
+   missed;
+2. replays rows after the client's cursor (``Last-Event-ID`` header, set
+   automatically by EventSource on reconnect, or the ``cursor`` query
+   parameter), skipping them again if they also arrive live;
+3. forwards live events, with a comment line every heartbeat interval so
+   proxies keep the connection open.
+
+When the client cannot be caught up from its cursor (too many missed rows,
+or it fell behind the live queue) the stream sends a ``reset`` event and
+closes; the client should refetch the list and reconnect without a cursor.
+
+Streams authenticate with the same bearer token as the rest of the API,
+so browser clients use a fetch-based EventSource that can send headers.
+The request's database session is closed before streaming starts: an
+open stream holds no pooled connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from empla.services.live_feed import FeedEvent, FeedSpec, LiveFeedHub, RowPredicate
+from empla.services.pagination import decode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Client reconnect delay after a dropped connection (ms, sent as ``retry:``).
+_RETRY_MS = 3000
+
+
+def get_live_feeds(request: Request) -> LiveFeedHub:
+    """The API process's LiveFeedHub (created in the app lifespan)."""
+    hub = getattr(request.app.state, "live_feeds", None)
+    if hub is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Live feeds not available",
+        )
+    return hub
+
+
+# Type alias for the hub dependency
+LiveFeeds = Annotated[LiveFeedHub, Depends(get_live_feeds)]
+
+
+def format_event(event: FeedEvent, name: str) -> str:
+    """One SSE frame. Payloads are single-line JSON."""
+    return f"id: {event.cursor}\nevent: {name}\ndata: {event.data}\n\n"
+
+
+def _reset_frame(reason: str) -> str:
+    return f"event: reset\ndata: {json.dumps({'reason': reason})}\n\n"
+
+
+async def _event_stream(
+    hub: LiveFeedHub,
+    spec: FeedSpec,
+    tenant_id: UUID,
+    match: RowPredicate | None,
+    cursor: str | None,
+    heartbeat_seconds: float,
+) -> AsyncIterator[str]:
+    subscription = hub.subscribe(spec, tenant_id, match)
+    try:
+        yield f"retry: {_RETRY_MS}\n\n"
+
+        replayed: set[UUID] = set()
+        if cursor:
+            events, truncated = await hub.backfill(
+                spec, tenant_id, cursor, match=match, limit=hub.queue_size
+            )
+            if truncated:
+                yield _reset_frame("too many missed events")
+                return
+            for event in events:
+                replayed.add(event.id)
+                yield format_event(event, spec.name)
+
+        while True:
+            if subscription.overflowed:
+                yield _reset_frame("client fell behind")
+                return
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat_seconds)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event.id in replayed:
+                continue
+            yield format_event(event, spec.name)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+async def feed_stream_response(
+    request: Request,
+    db: AsyncSession,
+    hub: LiveFeedHub,
+    spec: FeedSpec,
+    tenant_id: UUID,
+    *,
+    match: RowPredicate | None = None,
+    cursor: str | None = None,
+) -> StreamingResponse:
+    """Build the ``text/event-stream`` response for one feed.
+
+    Args:
+        request: Incoming request (for ``Last-Event-ID``).
+        db: The request's session, closed here to release its connection.
+        hub: Live feed hub.
+        spec: Feed to stream.
+        tenant_id: Authenticated tenant.
+        match: Further row filter (e.g. one employee).
+        cursor: Resume position; ``Last-Event-ID`` takes precedence.
+
+    Raises:
+        InvalidCursorError: The resume cursor is malformed or from another
+            feed (400, before the stream starts).
+    """
+    from empla.settings import get_settings
+
+    resume = request.headers.get("last-event-id") or cursor
+    if resume:
+        decode_cursor(resume, spec.name, 2)
+    await db.close()
+
+    return StreamingResponse(
+        _event_stream(
+            hub,
+            spec,
+            tenant_id,
+            match,
+            resume,
+            get_settings().live_feed_heartbeat_seconds,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
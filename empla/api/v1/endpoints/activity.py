@@ -2,20 +2,30 @@
 empla.api.v1.endpoints.activity - Activity Feed Endpoints
 
 REST API endpoints for querying employee activity.
+
+The list endpoints page by keyset cursor: pass a response's ``next_cursor``
+back as ``cursor`` for the following page. ``total`` is a planner estimate
+on large feeds unless ``total=exact`` is requested (``total_is_estimate``
+says which); see empla.services.pagination. ``GET /activity/stream``
+pushes new activities as server-sent events instead of polling.
 """
 
 import logging
 from datetime import datetime
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 
 from empla.api.deps import CurrentUser, DBSession
+from empla.api.sse import LiveFeeds, feed_stream_response
+from empla.models.activity import EmployeeActivity
 from empla.models.employee import Employee
 from empla.services.activity_service import ActivityService
+from empla.services.live_feed import FeedSpec
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +55,8 @@ class ActivityListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class ActivitySummaryResponse(BaseModel):
@@ -54,12 +66,21 @@ class ActivitySummaryResponse(BaseModel):
     total: int
 
 
+def _serialize_activity(activity: EmployeeActivity) -> str:
+    return ActivityResponse.model_validate(activity).model_dump_json()
+
+
+ACTIVITY_FEED = FeedSpec(name="activity", model=EmployeeActivity, serialize=_serialize_activity)
+
+
 @router.get("", response_model=ActivityListResponse)
 async def list_all_activities(
     db: DBSession,
     auth: CurrentUser,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 50,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    total: Annotated[Literal["estimate", "exact"], Query()] = "estimate",
     event_type: Annotated[str | None, Query()] = None,
     min_importance: Annotated[float | None, Query(ge=0, le=1)] = None,
     since: Annotated[datetime | None, Query()] = None,
@@ -72,6 +93,8 @@ async def list_all_activities(
         auth: Current user context
         page: Page number (1-indexed)
         page_size: Items per page (max 100)
+        cursor: ``next_cursor`` from the previous page (overrides ``page``)
+        total: "exact" to count the feed instead of estimating large totals
         event_type: Filter by event type
         min_importance: Minimum importance score
         since: Activities after this time
@@ -83,23 +106,65 @@ async def list_all_activities(
 
     event_types = [event_type] if event_type else None
 
-    activities, total = await service.get_activities(
+    activities = await service.get_activities(
         tenant_id=auth.tenant_id,
         event_types=event_types,
         min_importance=min_importance,
         since=since,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        total=total,
     )
 
-    pages = (total + page_size - 1) // page_size if total > 0 else 1
+    count = activities.total or 0
+    pages = (count + page_size - 1) // page_size if count > 0 else 1
 
     return ActivityListResponse(
-        items=[ActivityResponse.model_validate(a) for a in activities],
-        total=total,
+        items=[ActivityResponse.model_validate(a) for a in activities.items],
+        total=count,
         page=page,
         page_size=page_size,
         pages=pages,
+        next_cursor=activities.next_cursor,
+        total_is_estimate=activities.total_is_estimate,
+    )
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_activities(
+    request: Request,
+    db: DBSession,
+    auth: CurrentUser,
+    hub: LiveFeeds,
+    employee_id: Annotated[UUID | None, Query()] = None,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+) -> StreamingResponse:
+    """
+    Stream new activities for the tenant as server-sent events.
+
+    Each ``activity`` event carries one ActivityResponse. Reconnects resume
+    after the ``Last-Event-ID`` the client received.
+
+    Args:
+        request: Incoming request
+        db: Database session (released before streaming)
+        auth: Current user context
+        hub: Live feed hub
+        employee_id: Only this employee's activities
+        cursor: Resume after this event id (if no Last-Event-ID header)
+
+    Returns:
+        ``text/event-stream`` response
+    """
+    match = None
+    if employee_id is not None:
+
+        def match(activity: EmployeeActivity) -> bool:
+            return activity.employee_id == employee_id
+
+    return await feed_stream_response(
+        request, db, hub, ACTIVITY_FEED, auth.tenant_id, match=match, cursor=cursor
     )
 
 
@@ -140,6 +205,8 @@ async def list_employee_activities(
     employee_id: UUID,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 50,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    total: Annotated[Literal["estimate", "exact"], Query()] = "estimate",
     event_type: Annotated[str | None, Query()] = None,
     min_importance: Annotated[float | None, Query(ge=0, le=1)] = None,
     since: Annotated[datetime | None, Query()] = None,
@@ -153,6 +220,8 @@ async def list_employee_activities(
         employee_id: Employee UUID
         page: Page number (1-indexed)
         page_size: Items per page (max 100)
+        cursor: ``next_cursor`` from the previous page (overrides ``page``)
+        total: "exact" to count the feed instead of estimating large totals
         event_type: Filter by event type
         min_importance: Minimum importance score
         since: Activities after this time
@@ -183,7 +252,7 @@ async def list_employee_activities(
 
     event_types = [event_type] if event_type else None
 
-    activities, total = await service.get_activities(
+    activities = await service.get_activities(
         tenant_id=auth.tenant_id,
         employee_id=employee_id,
         event_types=event_types,
@@ -191,16 +260,21 @@ async def list_employee_activities(
         since=since,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        total=total,
     )
 
-    pages = (total + page_size - 1) // page_size if total > 0 else 1
+    count = activities.total or 0
+    pages = (count + page_size - 1) // page_size if count > 0 else 1
 
     return ActivityListResponse(
-        items=[ActivityResponse.model_validate(a) for a in activities],
-        total=total,
+        items=[ActivityResponse.model_validate(a) for a in activities.items],
+        total=count,
         page=page,
         page_size=page_size,
         pages=pages,
+        next_cursor=activities.next_cursor,
+        total_is_estimate=activities.total_is_estimate,
     )
 
 
@@ -12,6 +12,7 @@ MUST be addressed before multi-tenant production deployment. Track in TODO.md.
 
 import logging
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
 import jwt
@@ -19,8 +20,9 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from sqlalchemy import select
 
-from empla.api.deps import CurrentUser, DBSession
+from empla.api.deps import CurrentUser, DBSession, RequireAdmin
 from empla.models.tenant import Tenant, User
+from empla.services.principal_cache import get_principal_cache
 from empla.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -161,3 +163,22 @@ async def get_current_user_info(
         tenant_name=auth.tenant.name,
         role=auth.user.role,
     )
+
+
+@router.get("/cache-stats")
+async def get_auth_cache_stats(
+    auth: RequireAdmin,  # noqa: ARG001
+) -> dict[str, Any]:
+    """
+    Principal cache counters for this API process (admin only).
+
+    ``hit_rate`` is the share of authenticated requests that skipped the
+    user and tenant lookups. Counters are per process and reset on restart.
+
+    Args:
+        auth: Authenticated admin context (injected by FastAPI)
+
+    Returns:
+        Entry count, hits, misses, hit rate and invalidations
+    """
+    return get_principal_cache().stats()
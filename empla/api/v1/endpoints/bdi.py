@@ -2,15 +2,18 @@
 empla.api.v1.endpoints.bdi - BDI State Endpoints
 
 Read-only endpoints for goals, intentions, and beliefs scoped to an employee.
+Lists support conditional GET (empla.api.conditional): a poll whose
+If-None-Match still matches gets a 304 without running the list query.
 """
 
 import logging
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from sqlalchemy import func, select
 
+from empla.api.conditional import UNCONDITIONAL, Conditional, not_modified, version_query
 from empla.api.deps import CurrentUser, DBSession
 from empla.api.v1.schemas.bdi import (
     BeliefListResponse,
@@ -66,7 +69,8 @@ async def list_employee_goals(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 50,
     goal_status: Annotated[str | None, Query(alias="status")] = None,
-) -> GoalListResponse:
+    conditional: Conditional = UNCONDITIONAL,
+) -> GoalListResponse | Response:
     """List goals for an employee."""
     if goal_status and goal_status not in _VALID_GOAL_STATUSES:
         raise HTTPException(
@@ -75,15 +79,19 @@ async def list_employee_goals(
         )
     await _verify_employee(db, employee_id, auth.tenant_id)
 
-    base = select(EmployeeGoal).where(
+    filters = [
         EmployeeGoal.employee_id == employee_id,
         EmployeeGoal.tenant_id == auth.tenant_id,
         EmployeeGoal.deleted_at.is_(None),
-    )
-
+    ]
     if goal_status:
-        base = base.where(EmployeeGoal.status == goal_status)
+        filters.append(EmployeeGoal.status == goal_status)
+
+    etag = await conditional.etag(db, version_query(EmployeeGoal, *filters))
+    if conditional.matches(etag):
+        return not_modified(etag)
 
+    base = select(EmployeeGoal).where(*filters)
     count_q = select(func.count()).select_from(base.subquery())
 
     total = (await db.execute(count_q)).scalar() or 0
@@ -97,12 +105,15 @@ async def list_employee_goals(
     result = await db.execute(query)
     goals = list(result.scalars().all())
 
-    return GoalListResponse(
-        items=[GoalResponse.model_validate(g) for g in goals],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=_pages(total, page_size),
+    return conditional.respond(
+        GoalListResponse(
+            items=[GoalResponse.model_validate(g) for g in goals],
+            total=total,
+            page=page,
+            page_size=page_size,
+            pages=_pages(total, page_size),
+        ),
+        etag,
     )
 
 
@@ -120,7 +131,8 @@ async def list_employee_intentions(
     page_size: Annotated[int, Query(ge=1, le=100)] = 50,
     intention_status: Annotated[str | None, Query(alias="status")] = None,
     goal_id: Annotated[UUID | None, Query()] = None,
-) -> IntentionListResponse:
+    conditional: Conditional = UNCONDITIONAL,
+) -> IntentionListResponse | Response:
     """List intentions for an employee."""
     if intention_status and intention_status not in _VALID_INTENTION_STATUSES:
         raise HTTPException(
@@ -129,17 +141,21 @@ async def list_employee_intentions(
         )
     await _verify_employee(db, employee_id, auth.tenant_id)
 
-    base = select(EmployeeIntention).where(
+    filters = [
         EmployeeIntention.employee_id == employee_id,
         EmployeeIntention.tenant_id == auth.tenant_id,
         EmployeeIntention.deleted_at.is_(None),
-    )
-
+    ]
     if intention_status:
-        base = base.where(EmployeeIntention.status == intention_status)
+        filters.append(EmployeeIntention.status == intention_status)
     if goal_id:
-        base = base.where(EmployeeIntention.goal_id == goal_id)
+        filters.append(EmployeeIntention.goal_id == goal_id)
 
+    etag = await conditional.etag(db, version_query(EmployeeIntention, *filters))
+    if conditional.matches(etag):
+        return not_modified(etag)
+
+    base = select(EmployeeIntention).where(*filters)
     count_q = select(func.count()).select_from(base.subquery())
     total = (await db.execute(count_q)).scalar() or 0
 
@@ -152,12 +168,15 @@ async def list_employee_intentions(
     result = await db.execute(query)
     intentions = list(result.scalars().all())
 
-    return IntentionListResponse(
-        items=[IntentionResponse.model_validate(i) for i in intentions],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=_pages(total, page_size),
+    return conditional.respond(
+        IntentionListResponse(
+            items=[IntentionResponse.model_validate(i) for i in intentions],
+            total=total,
+            page=page,
+            page_size=page_size,
+            pages=_pages(total, page_size),
+        ),
+        etag,
     )
 
 
@@ -175,21 +194,26 @@ async def list_employee_beliefs(
     page_size: Annotated[int, Query(ge=1, le=100)] = 50,
     belief_type: Annotated[str | None, Query()] = None,
     min_confidence: Annotated[float | None, Query(ge=0, le=1)] = None,
-) -> BeliefListResponse:
+    conditional: Conditional = UNCONDITIONAL,
+) -> BeliefListResponse | Response:
     """List beliefs for an employee."""
     await _verify_employee(db, employee_id, auth.tenant_id)
 
-    base = select(Belief).where(
+    filters = [
         Belief.employee_id == employee_id,
         Belief.tenant_id == auth.tenant_id,
         Belief.deleted_at.is_(None),
-    )
-
+    ]
     if belief_type:
-        base = base.where(Belief.belief_type == belief_type)
+        filters.append(Belief.belief_type == belief_type)
     if min_confidence is not None:
-        base = base.where(Belief.confidence >= min_confidence)
+        filters.append(Belief.confidence >= min_confidence)
+
+    etag = await conditional.etag(db, version_query(Belief, *filters))
+    if conditional.matches(etag):
+        return not_modified(etag)
 
+    base = select(Belief).where(*filters)
     count_q = select(func.count()).select_from(base.subquery())
     total = (await db.execute(count_q)).scalar() or 0
 
@@ -202,10 +226,13 @@ async def list_employee_beliefs(
     result = await db.execute(query)
     beliefs = list(result.scalars().all())
 
-    return BeliefListResponse(
-        items=[BeliefResponse.model_validate(b) for b in beliefs],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=_pages(total, page_size),
+    return conditional.respond(
+        BeliefListResponse(
+            items=[BeliefResponse.model_validate(b) for b in beliefs],
+            total=total,
+            page=page,
+            page_size=page_size,
+            pages=_pages(total, page_size),
+        ),
+        etag,
     )
@@ -3,11 +3,13 @@ empla.api.v1.endpoints.employee_control - Employee Lifecycle Control Endpoints
 
 REST API endpoints for starting, stopping, and controlling digital employees.
 Pause/resume work via DB-only updates — the employee subprocess reads its
-status from DB each cycle (pause-via-DB pattern).
+status from DB each cycle (pause-via-DB pattern). Status and health are
+read from the runners' heartbeats (empla.services.heartbeat), so they
+work from any API replica without contacting the runner.
 """
 
 import logging
-from typing import Any, cast
+from typing import cast
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
@@ -15,12 +17,18 @@ from sqlalchemy import select
 
 from empla.api.deps import CurrentUser, DBSession
 from empla.api.v1.schemas.employee import (
+    EmployeeHealthResponse,
+    EmployeeHeartbeatResponse,
     EmployeeStatus,
     EmployeeStatusResponse,
+    FleetStatusResponse,
     LifecycleStage,
 )
 from empla.models.employee import Employee
+from empla.models.heartbeat import EmployeeHeartbeat
 from empla.services.employee_manager import UnsupportedRoleError, get_employee_manager
+from empla.services.heartbeat import UNHEALTHY, runner_health, runtime_status_query
+from empla.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -239,6 +247,67 @@ async def resume_employee(
     )
 
 
+def _status_response(
+    employee: Employee,
+    heartbeat: EmployeeHeartbeat | None,
+    stale: bool | None,
+) -> EmployeeStatusResponse:
+    """Build a status response from an employee row and its heartbeat."""
+    health = runner_health(heartbeat, stale)
+    last_error = None
+    if health == "crashed" and heartbeat is not None:
+        last_error = heartbeat.error or "Runner crashed"
+    elif health == "stale" and heartbeat is not None:
+        last_error = f"No heartbeat since {heartbeat.reported_at.isoformat()}"
+    return EmployeeStatusResponse(
+        id=employee.id,
+        name=employee.name,
+        status=cast(EmployeeStatus, employee.status),
+        lifecycle_stage=cast(LifecycleStage, employee.lifecycle_stage),
+        is_running=health == "healthy",
+        is_paused=employee.status == "paused",
+        has_error=health in UNHEALTHY,
+        last_error=last_error,
+        last_activity=heartbeat.reported_at if heartbeat is not None else None,
+        cycle_count=heartbeat.cycle_count if heartbeat is not None else 0,
+        health=health,
+        heartbeat=(
+            EmployeeHeartbeatResponse.model_validate(heartbeat) if heartbeat is not None else None
+        ),
+    )
+
+
+# Declared before the GET /{employee_id}/... routes, which would otherwise
+# capture "fleet" as an employee id.
+@router.get("/fleet/status", response_model=FleetStatusResponse)
+async def get_fleet_status(
+    db: DBSession,
+    auth: CurrentUser,
+) -> FleetStatusResponse:
+    """
+    Get runtime status for all of the tenant's employees.
+
+    One query joining employees to their runner heartbeats; runners that
+    crashed or stopped reporting are counted as unhealthy.
+    """
+    result = await db.execute(
+        runtime_status_query(
+            auth.tenant_id,
+            stale_after_seconds=get_settings().heartbeat_stale_seconds,
+        )
+    )
+    items = [
+        _status_response(employee, heartbeat, stale) for employee, heartbeat, stale in result.all()
+    ]
+
+    return FleetStatusResponse(
+        items=items,
+        total=len(items),
+        healthy=sum(1 for item in items if item.health == "healthy"),
+        unhealthy=sum(1 for item in items if item.health in UNHEALTHY),
+    )
+
+
 @router.get("/{employee_id}/status", response_model=EmployeeStatusResponse)
 async def get_employee_status(
     db: DBSession,
@@ -248,48 +317,70 @@ async def get_employee_status(
     """
     Get runtime status for an employee.
 
-    Derives running state from the DB status field (active = running).
+    Reads the employee and its runner heartbeat in one query. The runner
+    counts as running while its heartbeat is fresh.
     """
-    employee = await get_employee_for_tenant(db, employee_id, auth.tenant_id)
-
-    return EmployeeStatusResponse(
-        id=employee.id,
-        name=employee.name,
-        status=cast(EmployeeStatus, employee.status),
-        lifecycle_stage=cast(LifecycleStage, employee.lifecycle_stage),
-        is_running=employee.status == "active",
-        is_paused=employee.status == "paused",
-        has_error=False,
-        last_error=None,
+    result = await db.execute(
+        runtime_status_query(
+            auth.tenant_id,
+            stale_after_seconds=get_settings().heartbeat_stale_seconds,
+            employee_id=employee_id,
+        )
     )
+    row = result.first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found",
+        )
+
+    employee, heartbeat, stale = row
+    return _status_response(employee, heartbeat, stale)
 
 
 @router.get(
     "/{employee_id}/health",
+    response_model=EmployeeHealthResponse,
     responses={
-        200: {"description": "Employee health data"},
-        503: {"description": "Employee health endpoint not reachable"},
+        200: {"description": "Runner is reporting heartbeats"},
+        503: {"description": "Runner never reported, shut down, crashed, or went stale"},
     },
 )
 async def get_employee_health(
     db: DBSession,
     auth: CurrentUser,
     employee_id: UUID,
-) -> dict[str, Any]:
+) -> EmployeeHealthResponse:
     """
-    Proxy health check to the employee subprocess.
+    Get runner health from the employee's latest heartbeat.
 
-    Returns the health data from the employee's health endpoint,
-    or 503 if the employee is not reachable.
+    Returns 503 unless the runner's heartbeat is fresh, so the endpoint
+    still works as a liveness probe.
     """
-    await get_employee_for_tenant(db, employee_id, auth.tenant_id)
-    manager = get_employee_manager()
+    result = await db.execute(
+        runtime_status_query(
+            auth.tenant_id,
+            stale_after_seconds=get_settings().heartbeat_stale_seconds,
+            employee_id=employee_id,
+        )
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found",
+        )
 
-    health = await manager.get_health(employee_id)
-    if health is None:
+    _employee, heartbeat, stale = row
+    health = runner_health(heartbeat, stale)
+    if health != "healthy":
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Employee health endpoint is not reachable",
+            detail=f"Employee runner is not healthy (heartbeat {health})",
         )
 
-    return health
+    return EmployeeHealthResponse(
+        employee_id=employee_id,
+        health=health,
+        heartbeat=EmployeeHeartbeatResponse.model_validate(heartbeat),
+    )
@@ -1,7 +1,8 @@
 """
 empla.api.v1.endpoints.employees - Employee CRUD Endpoints
 
-REST API endpoints for managing digital employees.
+REST API endpoints for managing digital employees. The list and detail
+reads support conditional GET (empla.api.conditional).
 """
 
 import logging
@@ -9,9 +10,10 @@ from datetime import UTC, datetime
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from sqlalchemy import func, select
 
+from empla.api.conditional import UNCONDITIONAL, Conditional, not_modified, version_query
 from empla.api.deps import CurrentUser, DBSession
 from empla.api.v1.schemas.employee import (
     EmployeeCreate,
@@ -34,7 +36,8 @@ async def list_employees(
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
     status_filter: Annotated[str | None, Query(alias="status")] = None,
     role_filter: Annotated[str | None, Query(alias="role")] = None,
-) -> EmployeeListResponse:
+    conditional: Conditional = UNCONDITIONAL,
+) -> EmployeeListResponse | Response:
     """
     List employees for the current tenant.
 
@@ -45,21 +48,26 @@ async def list_employees(
         page_size: Items per page (max 100)
         status_filter: Filter by status (onboarding, active, paused, terminated)
         role_filter: Filter by role (sales_ae, csm, pm, etc.)
+        conditional: If-None-Match validator of the request
 
     Returns:
-        Paginated list of employees
+        Paginated list of employees, or 304 if the client's copy is current
     """
-    # Base query scoped to tenant
-    query = select(Employee).where(
+    # Filters scoped to tenant
+    filters = [
         Employee.tenant_id == auth.tenant_id,
         Employee.deleted_at.is_(None),
-    )
-
-    # Apply filters
+    ]
     if status_filter:
-        query = query.where(Employee.status == status_filter)
+        filters.append(Employee.status == status_filter)
     if role_filter:
-        query = query.where(Employee.role == role_filter)
+        filters.append(Employee.role == role_filter)
+
+    etag = await conditional.etag(db, version_query(Employee, *filters))
+    if conditional.matches(etag):
+        return not_modified(etag)
+
+    query = select(Employee).where(*filters)
 
     # Count total
     count_query = select(func.count()).select_from(query.subquery())
@@ -85,12 +93,15 @@ async def list_employees(
         response.is_running = emp.status == "active"
         items.append(response)
 
-    return EmployeeListResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
+    return conditional.respond(
+        EmployeeListResponse(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            pages=pages,
+        ),
+        etag,
     )
 
 
@@ -236,7 +247,8 @@ async def get_employee(
     db: DBSession,
     auth: CurrentUser,
     employee_id: UUID,
-) -> EmployeeResponse:
+    conditional: Conditional = UNCONDITIONAL,
+) -> EmployeeResponse | Response:
     """
     Get a specific employee by ID.
 
@@ -244,20 +256,26 @@ async def get_employee(
         db: Database session
         auth: Current user context
         employee_id: Employee UUID
+        conditional: If-None-Match validator of the request
 
     Returns:
-        Employee details
+        Employee details, or 304 if the client's copy is current
 
     Raises:
         HTTPException: If employee not found
     """
-    result = await db.execute(
-        select(Employee).where(
-            Employee.id == employee_id,
-            Employee.tenant_id == auth.tenant_id,
-            Employee.deleted_at.is_(None),
-        )
-    )
+    filters = [
+        Employee.id == employee_id,
+        Employee.tenant_id == auth.tenant_id,
+        Employee.deleted_at.is_(None),
+    ]
+    # A missing employee has a version too, but 404s carry no ETag, so no
+    # client can hold one that matches it.
+    etag = await conditional.etag(db, version_query(Employee, *filters))
+    if conditional.matches(etag):
+        return not_modified(etag)
+
+    result = await db.execute(select(Employee).where(*filters))
     employee = result.scalar_one_or_none()
 
     if employee is None:
@@ -271,7 +289,7 @@ async def get_employee(
     response = EmployeeResponse.model_validate(employee)
     response.is_running = employee.status == "active"
 
-    return response
+    return conditional.respond(response, etag)
 
 
 @router.put("/{employee_id}", response_model=EmployeeResponse)
@@ -0,0 +1,136 @@
+"""
+empla.api.v1.endpoints.export - Bulk Export Endpoints
+
+Streams a whole dataset (activities, episodic memories, raw metrics) as
+NDJSON or CSV, optionally gzipped, instead of paging through the list
+endpoints. Reads go through a server-side cursor and are written chunk by
+chunk, so the API process holds one batch at a time however large the
+export is; see empla.services.export.
+
+Rows come in ascending ``(time, id)`` order. To resume an interrupted
+download, pass the last received row's time (``occurred_at`` or
+``timestamp``) and ``id`` as ``after_time`` and ``after_id``.
+"""
+
+import logging
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from empla.api.deps import DBSession, RequireAdmin
+from empla.models.employee import Employee
+from empla.services.export import (
+    EXPORTS,
+    MEDIA_TYPES,
+    ExportFormat,
+    ExportQuery,
+    export_chunks,
+    file_extension,
+)
+from empla.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("/{dataset}", response_class=StreamingResponse)
+async def export_dataset(
+    request: Request,
+    db: DBSession,
+    auth: RequireAdmin,
+    dataset: str,
+    fmt: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+    gzip: Annotated[bool, Query()] = False,
+    employee_id: Annotated[UUID | None, Query()] = None,
+    since: Annotated[datetime | None, Query()] = None,
+    until: Annotated[datetime | None, Query()] = None,
+    after_time: Annotated[datetime | None, Query()] = None,
+    after_id: Annotated[UUID | None, Query()] = None,
+) -> StreamingResponse:
+    """
+    Stream every row of a dataset for the tenant.
+
+    Admin only: an export covers all of the tenant's employees unless
+    ``employee_id`` narrows it.
+
+    Args:
+        request: Incoming request (for the app's session factory)
+        db: Database session (released before streaming)
+        auth: Current admin context
+        dataset: ``activities``, ``memories`` (episodic) or ``metrics``
+        fmt: ``ndjson`` or ``csv``
+        gzip: Gzip the body (served as a ``.gz`` file download)
+        employee_id: Only this employee's rows
+        since: Rows at or after this time
+        until: Rows before this time
+        after_time: Resume after the row with this time...
+        after_id: ...and this id
+
+    Returns:
+        Streaming file download
+
+    Raises:
+        HTTPException: Unknown dataset, unpaired resume parameters, or
+            employee not found
+    """
+    spec = EXPORTS.get(dataset)
+    if spec is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown dataset; choose one of {', '.join(EXPORTS)}",
+        )
+    try:
+        export = ExportQuery(
+            spec,
+            auth.tenant_id,
+            employee_id=employee_id,
+            since=since,
+            until=until,
+            after_time=after_time,
+            after_id=after_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    if employee_id is not None:
+        result = await db.execute(
+            select(Employee.id).where(
+                Employee.id == employee_id,
+                Employee.tenant_id == auth.tenant_id,
+                Employee.deleted_at.is_(None),
+            )
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Employee not found",
+            )
+    # The export streams on its own session; don't hold the request's
+    # pooled connection for the length of the download.
+    await db.close()
+
+    filename = f"{dataset}.{file_extension(fmt, compress=gzip)}"
+    logger.info(
+        "Export started",
+        extra={"tenant_id": str(auth.tenant_id), "dataset": dataset, "format": fmt},
+    )
+    return StreamingResponse(
+        export_chunks(
+            request.app.state.sessionmaker,
+            export,
+            fmt=fmt,
+            compress=gzip,
+            batch_size=get_settings().export_batch_size,
+        ),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
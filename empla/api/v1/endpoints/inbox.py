@@ -8,6 +8,7 @@ delete, and an admin in tenant A cannot touch tenant B's inbox.
 
 Endpoints:
     - ``GET  /inbox``           — paginated list + unread count
+    - ``GET  /inbox/stream``    — new messages as server-sent events
     - ``POST /inbox/{id}/read`` — mark as read (idempotent)
     - ``DELETE /inbox/{id}``    — soft-delete (idempotent 204)
 
@@ -21,23 +22,43 @@ from __future__ import annotations
 
 import logging
 from datetime import UTC, datetime
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select
 from sqlalchemy import update as sa_update
 
 from empla.api.deps import DBSession, RequireAdmin
+from empla.api.sse import LiveFeeds, feed_stream_response
 from empla.api.v1.schemas.inbox import (
     InboxListResponse,
     InboxMessageResponse,
     InboxPriority,
 )
 from empla.models.inbox import InboxMessage
+from empla.services.live_feed import FeedSpec
+from empla.services.pagination import SortKey, paginate
 
 logger = logging.getLogger(__name__)
 
+# Newest first; backed by idx_inbox_tenant_keyset.
+_INBOX_ORDER = (SortKey(InboxMessage.created_at), SortKey(InboxMessage.id))
+
+
+def _serialize_message(message: InboxMessage) -> str:
+    return InboxMessageResponse.model_validate(message).model_dump_json()
+
+
+# Same visibility as the list: not deleted, 'off' never surfaced.
+INBOX_FEED = FeedSpec(
+    name="inbox",
+    model=InboxMessage,
+    serialize=_serialize_message,
+    filters=(InboxMessage.deleted_at.is_(None), InboxMessage.priority != "off"),
+)
+
 router = APIRouter()
 
 
@@ -49,6 +70,8 @@ async def list_inbox_messages(
     priority: Annotated[InboxPriority | None, Query()] = None,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 50,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    total: Annotated[Literal["estimate", "exact"], Query()] = "estimate",
 ) -> InboxListResponse:
     """List inbox messages for the current tenant.
 
@@ -57,6 +80,9 @@ async def list_inbox_messages(
         priority: If set, filter to a single priority tier.
         page: 1-indexed page number.
         page_size: Items per page (1-100, default 50).
+        cursor: ``next_cursor`` from the previous page (overrides ``page``).
+        total: "exact" to count the filtered list rather than estimate it
+            when it is large.
 
     Returns:
         Paginated list + the tenant's total unread count (used by the
@@ -76,9 +102,17 @@ async def list_inbox_messages(
     if priority is not None:
         filters.append(InboxMessage.priority == priority)
 
-    # Count the filtered list
-    count_result = await db.execute(select(func.count()).where(*filters))
-    total = int(count_result.scalar() or 0)
+    # Filtered page + total (estimated for large inboxes; exact when the
+    # page shows the whole list).
+    result = await paginate(
+        db,
+        select(InboxMessage).where(*filters),
+        _INBOX_ORDER,
+        page_size=page_size,
+        cursor=cursor,
+        page=page,
+        total=total,
+    )
 
     # Tenant-wide unread count for the sidebar badge — uses the
     # idx_inbox_tenant_unread partial index and never reflects the
@@ -94,29 +128,41 @@ async def list_inbox_messages(
     )
     unread_count = int(unread_result.scalar() or 0)
 
-    offset = (page - 1) * page_size
-    query = (
-        select(InboxMessage)
-        .where(*filters)
-        .order_by(InboxMessage.created_at.desc())
-        .offset(offset)
-        .limit(page_size)
-    )
-    result = await db.execute(query)
-    items = [InboxMessageResponse.model_validate(m) for m in result.scalars()]
-
-    pages = (total + page_size - 1) // page_size if total > 0 else 1
+    items = [InboxMessageResponse.model_validate(m) for m in result.items]
+    count = result.total or 0
+    pages = (count + page_size - 1) // page_size if count > 0 else 1
 
     return InboxListResponse(
         items=items,
-        total=total,
+        total=count,
         unread_count=unread_count,
         page=page,
         page_size=page_size,
         pages=pages,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_inbox_messages(
+    request: Request,
+    db: DBSession,
+    auth: RequireAdmin,
+    hub: LiveFeeds,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+) -> StreamingResponse:
+    """Stream new inbox messages for the current tenant as server-sent events.
+
+    Replaces polling the list for the sidebar badge: each ``inbox`` event
+    is one InboxMessageResponse, and the client bumps its unread count.
+
+    Args:
+        cursor: Resume after this event id (if no ``Last-Event-ID`` header).
+    """
+    return await feed_stream_response(request, db, hub, INBOX_FEED, auth.tenant_id, cursor=cursor)
+
+
 @router.post("/{message_id}/read", response_model=InboxMessageResponse)
 async def mark_read(
     message_id: UUID,
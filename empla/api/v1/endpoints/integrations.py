@@ -14,17 +14,13 @@ import logging
 from urllib.parse import urlencode
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import RedirectResponse
 from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 
 from empla.api.deps import CurrentUser, DBSession, RequireAdmin
-from empla.api.ratelimit import (
-    RateLimitExceeded,
-    get_client_identifier,
-    oauth_callback_limiter,
-)
+from empla.api.ratelimit import RateLimit, oauth_callback_limiter
 from empla.api.v1.schemas.integration import (
     AuthorizationUrlRequest,
     AuthorizationUrlResponse,
@@ -428,9 +424,18 @@ async def list_credentials(
     return CredentialListResponse(items=items, total=len(items))
 
 
-@router.get("/callback")
+@router.get(
+    "/callback",
+    dependencies=[
+        Depends(
+            RateLimit(
+                oauth_callback_limiter,
+                detail="Too many OAuth callback requests. Please try again later.",
+            )
+        )
+    ],
+)
 async def oauth_callback(
-    request: Request,
     db: DBSession,
     state: str = Query(..., description="OAuth state parameter"),
     code: str = Query(default=None, description="Authorization code"),
@@ -444,15 +449,6 @@ async def oauth_callback(
     settings = get_settings()
     base = settings.frontend_base_url.rstrip("/")
 
-    # Rate limit check
-    client_id = get_client_identifier(request)
-    if not oauth_callback_limiter.is_allowed(client_id):
-        reset_time = int(oauth_callback_limiter.get_reset_time(client_id))
-        raise RateLimitExceeded(
-            retry_after=reset_time,
-            detail="Too many OAuth callback requests. Please try again later.",
-        )
-
     # Handle OAuth error from provider
     if error:
         logger.warning(
@@ -2,18 +2,19 @@
 empla.api.v1.endpoints.memory - Memory Read Endpoints
 
 Paginated, filtered read-only access to an employee's four memory systems:
-episodic, semantic, procedural, and working. Mirrors the pattern in
-``bdi.py`` — inline offset/limit pagination, tenant-scoped queries, and
+episodic, semantic, procedural, and working. Tenant-scoped queries and
 response schemas that explicitly avoid the lazy ``employee`` relationship
-to prevent N+1.
+to prevent N+1. The three long lists page by keyset cursor with estimated
+totals (``empla.services.pagination``); ``page`` still works for offset
+clients.
 """
 
 import logging
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 
 from empla.api.deps import CurrentUser, DBSession
 from empla.api.v1.schemas.memory import (
@@ -33,6 +34,7 @@ from empla.models.memory import (
     SemanticMemory,
     WorkingMemory,
 )
+from empla.services.pagination import SortKey, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +67,18 @@ _VALID_WORKING_ITEM_TYPES = {"task", "goal", "observation", "conversation", "con
 # thousands of items in one response.
 _MAX_WORKING_MEMORY_ITEMS = 200
 
+_EPISODIC_ORDER = (SortKey(EpisodicMemory.occurred_at), SortKey(EpisodicMemory.id))
+_SEMANTIC_ORDER = (
+    SortKey(SemanticMemory.confidence),
+    SortKey(SemanticMemory.updated_at),
+    SortKey(SemanticMemory.id),
+)
+_PROCEDURAL_ORDER = (
+    SortKey(ProceduralMemory.success_rate),
+    SortKey(ProceduralMemory.execution_count),
+    SortKey(ProceduralMemory.id),
+)
+
 
 async def _verify_employee(db: DBSession, employee_id: UUID, tenant_id: UUID) -> None:
     """Verify employee exists and belongs to tenant."""
@@ -98,6 +112,8 @@ async def list_episodic_memory(
     employee_id: UUID,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=50)] = 25,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    total: Annotated[Literal["estimate", "exact"], Query()] = "estimate",
     episode_type: Annotated[str | None, Query()] = None,
     min_importance: Annotated[float | None, Query(ge=0, le=1)] = None,
 ) -> EpisodicMemoryListResponse:
@@ -122,22 +138,19 @@ async def list_episodic_memory(
     if min_importance is not None:
         base = base.where(EpisodicMemory.importance >= min_importance)
 
-    total = (await db.execute(select(func.count()).select_from(base.subquery()))).scalar() or 0
-
-    query = (
-        base.order_by(EpisodicMemory.occurred_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+    result = await paginate(
+        db, base, _EPISODIC_ORDER, page_size=page_size, cursor=cursor, page=page, total=total
     )
-    result = await db.execute(query)
-    items = list(result.scalars().all())
+    count = result.total or 0
 
     return EpisodicMemoryListResponse(
-        items=[EpisodicMemoryResponse.model_validate(e) for e in items],
-        total=total,
+        items=[EpisodicMemoryResponse.model_validate(e) for e in result.items],
+        total=count,
         page=page,
         page_size=page_size,
-        pages=_pages(total, page_size),
+        pages=_pages(count, page_size),
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
@@ -153,6 +166,8 @@ async def list_semantic_memory(
     employee_id: UUID,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=50)] = 25,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    total: Annotated[Literal["estimate", "exact"], Query()] = "estimate",
     fact_type: Annotated[str | None, Query()] = None,
     subject: Annotated[str | None, Query()] = None,
     predicate: Annotated[str | None, Query()] = None,
@@ -183,22 +198,19 @@ async def list_semantic_memory(
     if min_confidence is not None:
         base = base.where(SemanticMemory.confidence >= min_confidence)
 
-    total = (await db.execute(select(func.count()).select_from(base.subquery()))).scalar() or 0
-
-    query = (
-        base.order_by(SemanticMemory.confidence.desc(), SemanticMemory.updated_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+    result = await paginate(
+        db, base, _SEMANTIC_ORDER, page_size=page_size, cursor=cursor, page=page, total=total
     )
-    result = await db.execute(query)
-    items = list(result.scalars().all())
+    count = result.total or 0
 
     return SemanticMemoryListResponse(
-        items=[SemanticMemoryResponse.model_validate(s) for s in items],
-        total=total,
+        items=[SemanticMemoryResponse.model_validate(s) for s in result.items],
+        total=count,
         page=page,
         page_size=page_size,
-        pages=_pages(total, page_size),
+        pages=_pages(count, page_size),
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
@@ -214,6 +226,8 @@ async def list_procedural_memory(
     employee_id: UUID,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=50)] = 25,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    total: Annotated[Literal["estimate", "exact"], Query()] = "estimate",
     procedure_type: Annotated[str | None, Query()] = None,
     min_success_rate: Annotated[float | None, Query(ge=0, le=1)] = None,
     is_playbook: Annotated[bool | None, Query()] = None,
@@ -241,22 +255,19 @@ async def list_procedural_memory(
     if is_playbook is not None:
         base = base.where(ProceduralMemory.is_playbook.is_(is_playbook))
 
-    total = (await db.execute(select(func.count()).select_from(base.subquery()))).scalar() or 0
-
-    query = (
-        base.order_by(ProceduralMemory.success_rate.desc(), ProceduralMemory.execution_count.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+    result = await paginate(
+        db, base, _PROCEDURAL_ORDER, page_size=page_size, cursor=cursor, page=page, total=total
     )
-    result = await db.execute(query)
-    items = list(result.scalars().all())
+    count = result.total or 0
 
     return ProceduralMemoryListResponse(
-        items=[ProceduralMemoryResponse.model_validate(p) for p in items],
-        total=total,
+        items=[ProceduralMemoryResponse.model_validate(p) for p in result.items],
+        total=count,
         page=page,
         page_size=page_size,
-        pages=_pages(total, page_size),
+        pages=_pages(count, page_size),
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
@@ -2,12 +2,16 @@
 empla.api.v1.endpoints.metrics - Cycle Metrics API
 
 Dashboard-facing endpoints for BDI loop performance metrics.
-Reads from the Metric table populated by the loop's _record_cycle_metrics().
+Reads the Metric table populated by the loop's _record_cycle_metrics(),
+through the minute/hour rollups where possible (see
+empla.services.metric_rollups): summaries aggregate rollup buckets plus
+the not-yet-rolled-up raw tail in one query, and charts return one point
+per bucket unless ``resolution=raw`` is asked for.
 """
 
 import logging
 from datetime import UTC, datetime, timedelta
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
@@ -17,11 +21,32 @@ from sqlalchemy import func, select
 from empla.api.deps import CurrentUser, DBSession
 from empla.models.audit import Metric
 from empla.models.employee import Employee
+from empla.services.metric_rollups import (
+    HOUR,
+    MINUTE,
+    history_resolution,
+    merge_points,
+    metric_points,
+    summary_resolution,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+Resolution = Literal["auto", "raw", "1m", "1h"]
+_RESOLUTION_SECONDS = {"1m": MINUTE, "1h": HOUR}
+_RESOLUTION_NAMES = {MINUTE: "1m", HOUR: "1h"}
+
+
+def _chart_resolution(resolution: Resolution, hours: int) -> int | None:
+    """Bucket width for a chart, or None for raw rows."""
+    if resolution == "raw":
+        return None
+    if resolution == "auto":
+        return history_resolution(hours)
+    return _RESOLUTION_SECONDS[resolution]
+
 
 # ============================================================================
 # Response Models
@@ -37,6 +62,12 @@ class MetricPoint(BaseModel):
     value: float
     timestamp: datetime
     tags: dict[str, Any] = Field(default_factory=dict)
+    # Bucketed points only: ``value`` is the bucket's sum for counters and
+    # mean otherwise; ``timestamp`` is the bucket start.
+    count: int | None = None
+    min: float | None = None
+    max: float | None = None
+    p95: float | None = Field(default=None, description="Histogram metrics only")
 
 
 class MetricSummary(BaseModel):
@@ -60,6 +91,7 @@ class MetricListResponse(BaseModel):
     total: int
     page: int
     pages: int
+    resolution: str = "raw"
 
 
 class CostSummary(BaseModel):
@@ -87,12 +119,22 @@ class CostHistoryResponse(BaseModel):
 
     items: list[CostHistoryPoint]
     total: int
+    resolution: str = "raw"
 
 
 # ============================================================================
 # Endpoints
 # ============================================================================
 
+_SUMMARY_METRICS = (
+    "cycle.duration_seconds",
+    "cycle.success",
+    "tool.calls_total",
+    "tool.calls_failed",
+    "tool.latency_sum_ms",
+)
+_COST_METRICS = ("llm.cost_usd", "cycle.duration_seconds", "llm.input_tokens", "llm.output_tokens")
+
 
 @router.get(
     "/employees/{employee_id}/summary",
@@ -107,6 +149,9 @@ async def get_metric_summary(
     """
     Get aggregated metrics for an employee over a time window.
 
+    Windows of a day or more are read from hour rollups, shorter ones from
+    minute rollups; the window start is rounded down to that bucket.
+
     Args:
         employee_id: Employee UUID.
         db: Database session.
@@ -117,67 +162,45 @@ async def get_metric_summary(
         Aggregated cycle duration, success rate, tool stats.
     """
     since = datetime.now(UTC) - timedelta(hours=hours)
-
-    # Cycle duration stats
-    duration_query = select(
-        func.count().label("cycle_count"),
-        func.avg(Metric.value).label("avg_duration"),
-        func.max(Metric.value).label("max_duration"),
-    ).where(
-        Metric.tenant_id == auth.tenant_id,
-        Metric.employee_id == employee_id,
-        Metric.metric_name == "cycle.duration_seconds",
-        Metric.timestamp >= since,
-        Metric.deleted_at.is_(None),
+    p = metric_points(
+        auth.tenant_id,
+        employee_id,
+        _SUMMARY_METRICS,
+        since,
+        summary_resolution(hours),
     )
-    result = await db.execute(duration_query)
-    row = result.one()
-    cycle_count = row.cycle_count or 0
-    avg_duration = float(row.avg_duration or 0)
-    max_duration = float(row.max_duration or 0)
 
-    # Success rate
-    success_query = select(func.avg(Metric.value)).where(
-        Metric.tenant_id == auth.tenant_id,
-        Metric.employee_id == employee_id,
-        Metric.metric_name == "cycle.success",
-        Metric.timestamp >= since,
-        Metric.deleted_at.is_(None),
-    )
-    success_result = await db.execute(success_query)
-    success_scalar = success_result.scalar()
-    success_rate = float(success_scalar) if success_scalar is not None else 0.0
-
-    # Tool call totals
-    tool_total_query = select(func.sum(Metric.value)).where(
-        Metric.tenant_id == auth.tenant_id,
-        Metric.employee_id == employee_id,
-        Metric.metric_name == "tool.calls_total",
-        Metric.timestamp >= since,
-        Metric.deleted_at.is_(None),
-    )
-    tool_total = float((await db.execute(tool_total_query)).scalar() or 0)
+    def named(name: str) -> Any:
+        return p.c.metric_name == name
+
+    # One pass over the points; each figure FILTERs its own metric.
+    row = (
+        await db.execute(
+            select(
+                func.sum(p.c.n).filter(named("cycle.duration_seconds")).label("cycle_count"),
+                func.sum(p.c.total).filter(named("cycle.duration_seconds")).label("duration_sum"),
+                func.max(p.c.hi).filter(named("cycle.duration_seconds")).label("max_duration"),
+                func.sum(p.c.n).filter(named("cycle.success")).label("success_count"),
+                func.sum(p.c.total).filter(named("cycle.success")).label("success_sum"),
+                func.sum(p.c.total).filter(named("tool.calls_total")).label("tool_total"),
+                func.sum(p.c.total).filter(named("tool.calls_failed")).label("tool_failed"),
+                func.sum(p.c.total).filter(named("tool.latency_sum_ms")).label("latency_sum"),
+            )
+        )
+    ).one()
 
-    tool_failed_query = select(func.sum(Metric.value)).where(
-        Metric.tenant_id == auth.tenant_id,
-        Metric.employee_id == employee_id,
-        Metric.metric_name == "tool.calls_failed",
-        Metric.timestamp >= since,
-        Metric.deleted_at.is_(None),
-    )
-    tool_failed = float((await db.execute(tool_failed_query)).scalar() or 0)
+    cycle_count = int(row.cycle_count or 0)
+    avg_duration = float(row.duration_sum or 0) / cycle_count if cycle_count else 0.0
+    max_duration = float(row.max_duration or 0)
+    success_count = int(row.success_count or 0)
+    success_rate = float(row.success_sum or 0) / success_count if success_count else 0.0
 
+    tool_total = float(row.tool_total or 0)
+    tool_failed = float(row.tool_failed or 0)
     tool_failure_rate = tool_failed / tool_total if tool_total > 0 else 0.0
 
     # Weighted avg tool latency: SUM(latency_sum) / SUM(calls_total)
-    latency_sum_query = select(func.sum(Metric.value)).where(
-        Metric.tenant_id == auth.tenant_id,
-        Metric.employee_id == employee_id,
-        Metric.metric_name == "tool.latency_sum_ms",
-        Metric.timestamp >= since,
-        Metric.deleted_at.is_(None),
-    )
-    latency_sum = float((await db.execute(latency_sum_query)).scalar() or 0)
+    latency_sum = float(row.latency_sum or 0)
     avg_latency = latency_sum / tool_total if tool_total > 0 else 0.0
 
     return MetricSummary(
@@ -205,6 +228,7 @@ async def get_metric_history(
     hours: Annotated[int, Query(ge=1, le=168)] = 24,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=200)] = 50,
+    resolution: Annotated[Resolution, Query()] = "auto",
 ) -> MetricListResponse:
     """
     Get time-series metric data for an employee.
@@ -217,12 +241,40 @@ async def get_metric_history(
         hours: Lookback window in hours.
         page: Page number.
         page_size: Results per page.
+        resolution: ``raw`` for individual rows, ``1m``/``1h`` for bucketed
+            points, or ``auto`` (minutes up to 6 hours, hours beyond).
 
     Returns:
         Paginated list of metric data points ordered by time (newest first).
     """
     since = datetime.now(UTC) - timedelta(hours=hours)
 
+    bucket = _chart_resolution(resolution, hours)
+    if bucket is not None:
+        p = metric_points(
+            auth.tenant_id, employee_id, (metric_name,), since, bucket, with_histogram=True
+        )
+        buckets = merge_points((await db.execute(select(p))).all(), bucket)
+        page_buckets = buckets[(page - 1) * page_size : page * page_size]
+        return MetricListResponse(
+            items=[
+                MetricPoint(
+                    metric_name=metric_name,
+                    value=b.value,
+                    timestamp=b.start,
+                    count=b.count,
+                    min=b.low,
+                    max=b.high,
+                    p95=b.quantile(0.95),
+                )
+                for b in page_buckets
+            ],
+            total=len(buckets),
+            page=page,
+            pages=(len(buckets) + page_size - 1) // page_size,
+            resolution=_RESOLUTION_NAMES[bucket],
+        )
+
     base_filter = [
         Metric.tenant_id == auth.tenant_id,
         Metric.employee_id == employee_id,
@@ -295,38 +347,28 @@ async def get_cost_summary(
     auth: CurrentUser,
     hours: Annotated[int, Query(ge=1, le=168)] = 24,
 ) -> CostSummary:
-    """Get aggregated LLM cost summary for an employee."""
+    """Get aggregated LLM cost summary for an employee (one pass, rollups first)."""
     await _verify_employee(db, employee_id, auth.tenant_id)
     since = datetime.now(UTC) - timedelta(hours=hours)
-    base = [
-        Metric.tenant_id == auth.tenant_id,
-        Metric.employee_id == employee_id,
-        Metric.timestamp >= since,
-        Metric.deleted_at.is_(None),
-    ]
-
-    # Total cost
-    cost_result = await db.execute(
-        select(func.sum(Metric.value)).where(*base, Metric.metric_name == "llm.cost_usd")
-    )
-    total_cost = float(cost_result.scalar() or 0)
-
-    # Total cycles (from cycle.duration_seconds count)
-    cycle_result = await db.execute(
-        select(func.count()).where(*base, Metric.metric_name == "cycle.duration_seconds")
-    )
-    total_cycles = int(cycle_result.scalar() or 0)
-
-    # Token totals
-    input_result = await db.execute(
-        select(func.sum(Metric.value)).where(*base, Metric.metric_name == "llm.input_tokens")
-    )
-    total_input = int(input_result.scalar() or 0)
-
-    output_result = await db.execute(
-        select(func.sum(Metric.value)).where(*base, Metric.metric_name == "llm.output_tokens")
-    )
-    total_output = int(output_result.scalar() or 0)
+    p = metric_points(auth.tenant_id, employee_id, _COST_METRICS, since, summary_resolution(hours))
+    row = (
+        await db.execute(
+            select(
+                func.sum(p.c.total).filter(p.c.metric_name == "llm.cost_usd").label("cost"),
+                func.sum(p.c.n).filter(p.c.metric_name == "cycle.duration_seconds").label("cycles"),
+                func.sum(p.c.total)
+                .filter(p.c.metric_name == "llm.input_tokens")
+                .label("tokens_in"),
+                func.sum(p.c.total)
+                .filter(p.c.metric_name == "llm.output_tokens")
+                .label("tokens_out"),
+            )
+        )
+    ).one()
+    total_cost = float(row.cost or 0)
+    total_cycles = int(row.cycles or 0)
+    total_input = int(row.tokens_in or 0)
+    total_output = int(row.tokens_out or 0)
 
     return CostSummary(
         employee_id=employee_id,
@@ -348,11 +390,28 @@ async def get_cost_history(
     db: DBSession,
     auth: CurrentUser,
     hours: Annotated[int, Query(ge=1, le=168)] = 24,
+    resolution: Annotated[Resolution, Query()] = "auto",
 ) -> CostHistoryResponse:
-    """Get time-series LLM cost data for an employee."""
+    """Get time-series LLM cost data for an employee.
+
+    Bucketed (the default) each point is a bucket's total cost; with
+    ``resolution=raw`` each point is one cycle (newest 500).
+    """
     await _verify_employee(db, employee_id, auth.tenant_id)
     since = datetime.now(UTC) - timedelta(hours=hours)
 
+    bucket = _chart_resolution(resolution, hours)
+    if bucket is not None:
+        p = metric_points(
+            auth.tenant_id, employee_id, ("llm.cost_usd",), since, bucket, with_histogram=True
+        )
+        buckets = merge_points((await db.execute(select(p))).all(), bucket)
+        return CostHistoryResponse(
+            items=[CostHistoryPoint(timestamp=b.start, cost_usd=b.total) for b in buckets],
+            total=len(buckets),
+            resolution=_RESOLUTION_NAMES[bucket],
+        )
+
     query = (
         select(Metric)
         .where(
@@ -8,22 +8,45 @@ in the reflection phase of the BDI loop.
 
 import logging
 from datetime import UTC, datetime
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import and_, func, select, update
 from sqlalchemy.exc import IntegrityError
 
+from empla.api.conditional import UNCONDITIONAL, Conditional, not_modified, version_query
 from empla.api.deps import CurrentUser, DBSession, RequireAdmin
 from empla.models.employee import Employee
 from empla.models.memory import ProceduralMemory
+from empla.services.pagination import SortKey, paginate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Never-promoted playbooks sort after every promoted one (NULLS LAST) while
+# keeping a non-NULL value for the keyset cursor.
+_NEVER_PROMOTED = datetime(1970, 1, 1, tzinfo=UTC)
+
+_PLAYBOOK_ORDERS: dict[str, tuple[SortKey, ...]] = {
+    "success_rate": (SortKey(ProceduralMemory.success_rate), SortKey(ProceduralMemory.id)),
+    "execution_count": (SortKey(ProceduralMemory.execution_count), SortKey(ProceduralMemory.id)),
+    "promoted_at": (
+        SortKey(
+            func.coalesce(ProceduralMemory.promoted_at, _NEVER_PROMOTED),
+            attr="promoted_at",
+            null_value=_NEVER_PROMOTED,
+        ),
+        SortKey(ProceduralMemory.id),
+    ),
+    "name": (
+        SortKey(ProceduralMemory.name, descending=False),
+        SortKey(ProceduralMemory.id, descending=False),
+    ),
+}
+
 
 # ============================================================================
 # Response Models
@@ -58,6 +81,8 @@ class PlaybookListResponse(BaseModel):
 
     items: list[PlaybookResponse]
     total: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class PlaybookStats(BaseModel):
@@ -181,11 +206,17 @@ async def list_playbooks(
     learned_from: Annotated[str | None, Query()] = None,
     sort_by: Annotated[str, Query()] = "success_rate",
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-) -> PlaybookListResponse:
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    total: Annotated[Literal["estimate", "exact"], Query()] = "estimate",
+    conditional: Conditional = UNCONDITIONAL,
+) -> PlaybookListResponse | Response:
     """List playbooks for an employee.
 
     Returns promoted procedures with their success rates, execution counts,
-    and other performance data for the dashboard playbook viewer.
+    and other performance data for the dashboard playbook viewer. Pass
+    ``next_cursor`` back as ``cursor`` (with the same ``sort_by``) for the
+    next ``limit`` playbooks. Answers 304 when the If-None-Match tag still
+    matches the filtered playbooks (empla.api.conditional).
     """
     await _verify_employee(db, employee_id, auth.tenant_id)
     filters = [
@@ -198,25 +229,31 @@ async def list_playbooks(
     if learned_from:
         filters.append(ProceduralMemory.learned_from == learned_from)
 
-    # Sort
-    sort_columns = {
-        "success_rate": ProceduralMemory.success_rate.desc(),
-        "execution_count": ProceduralMemory.execution_count.desc(),
-        "promoted_at": ProceduralMemory.promoted_at.desc().nullslast(),
-        "name": ProceduralMemory.name.asc(),
-    }
-    order = sort_columns.get(sort_by, ProceduralMemory.success_rate.desc())
-
-    # Count
-    count_result = await db.execute(select(func.count()).where(*filters))
-    total = int(count_result.scalar() or 0)
-
-    # Fetch
-    query = select(ProceduralMemory).where(*filters).order_by(order).limit(limit)
-    result = await db.execute(query)
-    items = [_to_response(p) for p in result.scalars()]
-
-    return PlaybookListResponse(items=items, total=total)
+    etag = await conditional.etag(db, version_query(ProceduralMemory, *filters))
+    if conditional.matches(etag):
+        return not_modified(etag)
+
+    if sort_by not in _PLAYBOOK_ORDERS:
+        sort_by = "success_rate"
+    result = await paginate(
+        db,
+        select(ProceduralMemory).where(*filters),
+        _PLAYBOOK_ORDERS[sort_by],
+        page_size=limit,
+        cursor=cursor,
+        total=total,
+        sort=sort_by,
+    )
+
+    return conditional.respond(
+        PlaybookListResponse(
+            items=[_to_response(p) for p in result.items],
+            total=result.total or 0,
+            next_cursor=result.next_cursor,
+            total_is_estimate=result.total_is_estimate,
+        ),
+        etag,
+    )
 
 
 def _to_response(p: ProceduralMemory) -> PlaybookResponse:
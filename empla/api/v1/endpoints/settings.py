@@ -21,10 +21,11 @@ from __future__ import annotations
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 from pydantic import ValidationError
 from sqlalchemy import select
 
+from empla.api.conditional import UNCONDITIONAL, Conditional, not_modified, version_query
 from empla.api.deps import CurrentUser, DBSession, RequireAdmin
 from empla.api.v1.schemas.settings import (
     TenantSettings,
@@ -77,16 +78,28 @@ def _load_settings(raw: dict | None) -> tuple[TenantSettings, bool]:
 
 
 @router.get("", response_model=TenantSettings)
-async def get_settings(db: DBSession, auth: CurrentUser) -> TenantSettings:
+async def get_settings(
+    db: DBSession,
+    auth: CurrentUser,
+    conditional: Conditional = UNCONDITIONAL,
+) -> TenantSettings | Response:
     """Return the tenant's current settings document (with defaults for blank fields).
 
     Read is available to any authenticated user in the tenant — non-admin
     users benefit from seeing the active cycle/cost policy their employees
-    run under. Writes require admin (see ``update_settings``).
+    run under. Writes require admin (see ``update_settings``). Versioned
+    by the tenant row, so an unchanged document is answered with a 304.
     """
+    etag = await conditional.etag(
+        db,
+        version_query(Tenant, Tenant.id == auth.tenant_id, Tenant.deleted_at.is_(None)),
+    )
+    if conditional.matches(etag):
+        return not_modified(etag)
+
     tenant = await _load_tenant(db, auth.tenant_id)
     settings, _corrupt = _load_settings(tenant.settings)
-    return settings
+    return conditional.respond(settings, etag)
 
 
 @router.put("", response_model=TenantSettingsUpdateResponse)
@@ -6,13 +6,14 @@ Public endpoints that receive webhooks from integration providers
 subprocesses so they process the event in their next BDI cycle.
 
 Authentication: X-Webhook-Token header (per-tenant, stored in
-Integration.oauth_config["webhook_token"]). Provider-specific HMAC
-signature verification can be added per provider.
+Integration.oauth_config["webhook_token"] and indexed by keyed hash in
+Integration.webhook_token_hashes). Provider-specific HMAC signature
+verification can be added per provider.
 
 Flow:
   External provider → POST /api/v1/webhooks/{provider} (X-Webhook-Token header)
-  → validate token against Integration table
-  → find employees that have credentials for this provider
+  → validate token against Integration table (one index probe)
+  → find employees that have credentials for this provider (cached)
   → EmployeeManager.wake_employee() for each
   → employee loop wakes, drains events, injects as observations
 
@@ -20,7 +21,9 @@ Employee routing:
   Only employees with an active IntegrationCredential for the webhook's
   provider are woken. This is the direct, predictable link: if an employee
   has a credential for HubSpot, they get HubSpot webhooks. Tenant-level
-  credentials (employee_id IS NULL) wake all active employees.
+  credentials (employee_id IS NULL) wake all active employees. The answer
+  is cached per (tenant, provider) and dropped when credentials or
+  employees change (see empla.services.webhook_routing).
 """
 
 from __future__ import annotations
@@ -29,18 +32,22 @@ import asyncio
 import logging
 import secrets
 import time as _time
+from collections.abc import Sequence
 from datetime import UTC, datetime
-from typing import Annotated
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Header, HTTPException, Path, Query, Request, status
-from sqlalchemy import func, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import or_, select
 
 from empla.api.deps import CurrentUser, DBSession
+from empla.api.sse import LiveFeeds, feed_stream_response
 from empla.api.v1.schemas.webhook import (
     WebhookAuditEvent,
     WebhookEvent,
     WebhookEventListResponse,
+    WebhookObjectChange,
     WebhookResponse,
     WebhookTokenCreateRequest,
     WebhookTokenInfo,
@@ -50,12 +57,22 @@ from empla.models.audit import AuditLog
 from empla.models.employee import Employee
 from empla.models.integration import Integration, IntegrationCredential
 from empla.services.employee_manager import get_employee_manager
+from empla.services.live_feed import FeedSpec
+from empla.services.pagination import SortKey, paginate
+from empla.services.webhook_routing import (
+    get_webhook_routing_cache,
+    webhook_token_digest,
+    webhook_token_hashes,
+)
 
 # 5-minute grace window for the previous token after rotation. Tuned so a
 # webhook provider that's about to retry a delivery with the old token
 # doesn't get a 401 in the seconds after the dashboard rotates.
 _TOKEN_ROTATION_GRACE_SECONDS = 300
 
+# Newest first; backed by idx_audit_webhook_keyset.
+_EVENT_ORDER = (SortKey(AuditLog.occurred_at), SortKey(AuditLog.id))
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -68,30 +85,55 @@ async def _find_tenant_by_webhook_token(
 
     Tokens live in ``Integration.oauth_config``. After a rotation the
     previous token is preserved for ``_TOKEN_ROTATION_GRACE_SECONDS`` so
-    in-flight deliveries don't 401. Uses constant-time comparison to
-    prevent timing side-channel attacks (this is the sole auth mechanism
-    on a public endpoint).
+    in-flight deliveries don't 401. The keyed hash of the presented token
+    selects candidate rows through the GIN index on
+    ``webhook_token_hashes`` (instead of loading every integration for the
+    provider); the match is then confirmed with a constant-time comparison
+    against the stored token, since this is the sole auth mechanism on a
+    public endpoint.
+
+    On a miss, integrations whose tokens were never indexed (hashes still
+    NULL because ``webhooks reindex-tokens`` has not run since the column
+    was added) are compared directly, so deliveries keep working until
+    the backfill.
     """
-    import hmac
-
+    columns = (Integration.id, Integration.tenant_id, Integration.oauth_config)
+    live = (
+        Integration.provider == provider,
+        Integration.status == "active",
+        # Match the soft-delete filter used by _get_integration and
+        # list_webhook_tokens. Without it, a soft-deleted integration
+        # whose oauth_config still carries a webhook_token would keep
+        # authenticating inbound webhooks — defense-in-depth gap.
+        Integration.deleted_at.is_(None),
+    )
     result = await db.execute(
-        select(
-            Integration.id,
-            Integration.tenant_id,
-            Integration.oauth_config,
-        ).where(
-            Integration.provider == provider,
-            Integration.status == "active",
-            # Match the soft-delete filter used by _get_integration and
-            # list_webhook_tokens. Without it, a soft-deleted integration
-            # whose oauth_config still carries a webhook_token would keep
-            # authenticating inbound webhooks — defense-in-depth gap.
-            Integration.deleted_at.is_(None),
-            Integration.oauth_config["webhook_token"].astext.is_not(None),
+        select(*columns).where(
+            *live, Integration.webhook_token_hashes.contains([webhook_token_digest(token)])
         )
     )
+    match = _match_webhook_token(result.all(), token)
+    if match is None:
+        result = await db.execute(
+            select(*columns).where(
+                *live,
+                Integration.webhook_token_hashes.is_(None),
+                or_(
+                    Integration.oauth_config["webhook_token"].astext.is_not(None),
+                    Integration.oauth_config["webhook_token_prev"].astext.is_not(None),
+                ),
+            )
+        )
+        match = _match_webhook_token(result.all(), token)
+    return match
+
+
+def _match_webhook_token(rows: Sequence[Any], token: str) -> tuple[UUID, UUID] | None:
+    """(tenant, integration) of the row whose current or in-grace previous token matches."""
+    import hmac
+
     now = _time.time()
-    for integration_id, tenant_id, oauth_config in result.all():
+    for integration_id, tenant_id, oauth_config in rows:
         stored = (oauth_config or {}).get("webhook_token")
         if stored and hmac.compare_digest(str(stored), token):
             return tenant_id, integration_id
@@ -114,7 +156,22 @@ async def _find_employees_for_provider(db: DBSession, tenant_id: UUID, provider:
     Routes webhooks to the right employees based on who actually has
     credentials for the provider. Tenant-level credentials (employee_id
     IS NULL) cause all active employees to be woken.
+
+    Answers are served from the process-wide routing cache when fresh.
     """
+    cache = get_webhook_routing_cache()
+    cached = cache.get(tenant_id, provider)
+    if cached is not None:
+        return cached
+    employee_ids = await _query_employees_for_provider(db, tenant_id, provider)
+    cache.put(tenant_id, provider, employee_ids)
+    return employee_ids
+
+
+async def _query_employees_for_provider(
+    db: DBSession, tenant_id: UUID, provider: str
+) -> list[UUID]:
+    """Uncached body of _find_employees_for_provider."""
     # Check if there's a tenant-level credential (shared across all employees)
     tenant_cred = await db.execute(
         select(IntegrationCredential.id)
@@ -158,6 +215,33 @@ async def _find_employees_for_provider(db: DBSession, tenant_id: UUID, provider:
     return list(result.scalars().all())
 
 
+async def _apply_webhook_handlers(
+    db: DBSession, provider: str, tenant_id: UUID, payload: object
+) -> None:
+    """Run the provider's state-sync handlers (e.g. the CRM mirror).
+
+    Best-effort: each handler commits on success and is rolled back on
+    failure. Handlers only keep caches fresh — the employees still get
+    woken, and the mirror's delta sync repairs anything missed here.
+    """
+    from empla.integrations.webhooks import get_webhook_handlers
+
+    for handler in get_webhook_handlers(provider):
+        try:
+            await handler(db, tenant_id, payload)
+            await db.commit()
+        except Exception:
+            try:
+                await db.rollback()
+            except Exception:
+                logger.exception("Rollback after webhook handler failure also failed")
+            logger.warning(
+                "Webhook handler failed (event still delivered)",
+                exc_info=True,
+                extra={"provider": provider, "tenant_id": str(tenant_id)},
+            )
+
+
 @router.post(
     "/{provider}",
     response_model=WebhookResponse,
@@ -181,7 +265,8 @@ async def receive_webhook(
     The endpoint:
     1. Validates the token against the Integration table
     2. Parses the provider-specific payload
-    3. Wakes employees that have credentials for this provider
+    3. Applies provider state-sync handlers (best-effort)
+    4. Wakes employees that have credentials for this provider
     """
     # Validate webhook token
     match = await _find_tenant_by_webhook_token(db, provider, x_webhook_token)
@@ -211,7 +296,7 @@ async def receive_webhook(
         ) from exc
 
     # Extract event type and summary using provider-specific parser
-    from empla.integrations.webhooks import get_webhook_parser
+    from empla.integrations.webhooks import get_webhook_object_extractor, get_webhook_parser
 
     parser = get_webhook_parser(provider)
     try:
@@ -224,6 +309,19 @@ async def receive_webhook(
         )
         event_type, summary = "unknown", ""
 
+    objects: list[WebhookObjectChange] = []
+    extract_objects = get_webhook_object_extractor(provider)
+    if extract_objects is not None:
+        try:
+            objects = [WebhookObjectChange(**ref) for ref in extract_objects(raw_payload)]
+        except Exception:
+            # Without refs the runner still merges the delivery per event type
+            logger.warning(
+                "Webhook object extractor failed for provider '%s'",
+                provider,
+                exc_info=True,
+            )
+
     # Build normalized event
     event = WebhookEvent(
         provider=provider,
@@ -231,8 +329,11 @@ async def receive_webhook(
         summary=summary,
         payload=raw_payload if isinstance(raw_payload, dict) else {"raw": raw_payload},
         received_at=datetime.now(UTC),
+        objects=objects,
     )
 
+    await _apply_webhook_handlers(db, provider, tenant_id, raw_payload)
+
     # Find employees that have credentials for this provider
     employee_ids = await _find_employees_for_provider(db, tenant_id, provider)
     if not employee_ids:
@@ -420,6 +521,7 @@ async def create_webhook_token(
     cfg.pop("webhook_token_prev", None)
     cfg.pop("rotated_at", None)
     integration.oauth_config = cfg
+    integration.webhook_token_hashes = webhook_token_hashes(cfg)
     await db.commit()
 
     return WebhookTokenIssued(
@@ -462,6 +564,7 @@ async def rotate_webhook_token(
     cfg["webhook_token_prev"] = old
     cfg["rotated_at"] = now
     integration.oauth_config = cfg
+    integration.webhook_token_hashes = webhook_token_hashes(cfg)
     await db.commit()
 
     return WebhookTokenIssued(
@@ -493,6 +596,7 @@ async def delete_webhook_token(
     cfg.pop("webhook_token_prev", None)
     cfg.pop("rotated_at", None)
     integration.oauth_config = cfg
+    integration.webhook_token_hashes = None
     await db.commit()
 
 
@@ -537,6 +641,18 @@ def _parse_audit_event(row: AuditLog) -> WebhookAuditEvent:
     )
 
 
+def _serialize_audit_event(row: AuditLog) -> str:
+    return _parse_audit_event(row).model_dump_json()
+
+
+WEBHOOK_EVENT_FEED = FeedSpec(
+    name="webhook_event",
+    model=AuditLog,
+    serialize=_serialize_audit_event,
+    filters=(AuditLog.actor_type == "webhook", AuditLog.deleted_at.is_(None)),
+)
+
+
 @router.get(
     "/events",
     response_model=WebhookEventListResponse,
@@ -547,6 +663,8 @@ async def list_webhook_events(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 50,
     provider: Annotated[str | None, Query(max_length=64, pattern=r"^[a-z][a-z0-9_]*$")] = None,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    total: Annotated[Literal["estimate", "exact"], Query()] = "estimate",
 ) -> WebhookEventListResponse:
     """List webhook events received for this tenant, newest first."""
     base = select(AuditLog).where(
@@ -560,19 +678,43 @@ async def list_webhook_events(
         # so `provider=hub` over-matched `webhook_hubspot_*` etc.
         base = base.where(AuditLog.details["provider"].astext == provider)
 
-    total = (await db.execute(select(func.count()).select_from(base.subquery()))).scalar() or 0
-
-    query = (
-        base.order_by(AuditLog.occurred_at.desc()).offset((page - 1) * page_size).limit(page_size)
+    result = await paginate(
+        db, base, _EVENT_ORDER, page_size=page_size, cursor=cursor, page=page, total=total
     )
-    result = await db.execute(query)
-    rows = list(result.scalars().all())
 
-    pages = (total + page_size - 1) // page_size if total > 0 else 1
+    count = result.total or 0
+    pages = (count + page_size - 1) // page_size if count > 0 else 1
     return WebhookEventListResponse(
-        items=[_parse_audit_event(r) for r in rows],
-        total=total,
+        items=[_parse_audit_event(r) for r in result.items],
+        total=count,
         page=page,
         page_size=page_size,
         pages=pages,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
+    )
+
+
+@router.get("/events/stream", response_class=StreamingResponse)
+async def stream_webhook_events(
+    request: Request,
+    db: DBSession,
+    auth: CurrentUser,
+    hub: LiveFeeds,
+    provider: Annotated[str | None, Query(max_length=64, pattern=r"^[a-z][a-z0-9_]*$")] = None,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+) -> StreamingResponse:
+    """Stream webhook events received for this tenant as server-sent events.
+
+    Each ``webhook_event`` event is one WebhookAuditEvent; reconnects resume
+    after ``Last-Event-ID`` (or ``cursor``).
+    """
+    match = None
+    if provider:
+
+        def match(row: AuditLog) -> bool:
+            return (row.details or {}).get("provider") == provider
+
+    return await feed_stream_response(
+        request, db, hub, WEBHOOK_EVENT_FEED, auth.tenant_id, match=match, cursor=cursor
     )
@@ -12,6 +12,7 @@ from empla.api.v1.endpoints import (
     bdi,
     employee_control,
     employees,
+    export,
     inbox,
     integrations,
     mcp_servers,
@@ -46,3 +47,4 @@ api_router.include_router(scheduler.router, prefix="/employees", tags=["schedule
 api_router.include_router(settings.router, prefix="/settings", tags=["settings"])
 api_router.include_router(role_builder.router, prefix="/employees", tags=["role-builder"])
 api_router.include_router(inbox.router, prefix="/inbox", tags=["inbox"])
+api_router.include_router(export.router, prefix="/export", tags=["export"])
@@ -15,6 +15,7 @@ from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 EmployeeRole = Literal["sales_ae", "csm", "pm", "sdr", "recruiter", "custom"]
 EmployeeStatus = Literal["onboarding", "active", "paused", "stopped", "terminated"]
 LifecycleStage = Literal["shadow", "supervised", "autonomous"]
+RunnerHealth = Literal["healthy", "stale", "crashed", "stopped", "unknown"]
 
 # Length cap for admin-supplied / LLM-generated role descriptions before they
 # get interpolated into employee system prompts. Matches
@@ -184,6 +185,34 @@ class EmployeeListResponse(BaseModel):
     pages: int
 
 
+class EmployeeHeartbeatResponse(BaseModel):
+    """Schema for a runner's latest heartbeat (employee_heartbeats row)."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    state: str
+    error: str | None = None
+    phase: str | None = None
+    cycle_count: int = Field(default=0, ge=0)
+    last_cycle_duration_seconds: float | None = None
+    last_cycle_success: bool | None = None
+    cost_usd: float = 0.0
+    tool_health: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    pid: int | None = None
+    host: str | None = None
+    health_port: int | None = None
+    started_at: datetime
+    reported_at: datetime
+
+
+class EmployeeHealthResponse(BaseModel):
+    """Schema for an employee's runner health, derived from its heartbeat."""
+
+    employee_id: UUID
+    health: RunnerHealth
+    heartbeat: EmployeeHeartbeatResponse | None = None
+
+
 class EmployeeStatusResponse(BaseModel):
     """Schema for employee runtime status."""
 
@@ -199,3 +228,14 @@ class EmployeeStatusResponse(BaseModel):
     last_activity: datetime | None = None
     cycle_count: int = Field(default=0, ge=0)
     error_count: int = Field(default=0, ge=0)
+    health: RunnerHealth = "unknown"
+    heartbeat: EmployeeHeartbeatResponse | None = None
+
+
+class FleetStatusResponse(BaseModel):
+    """Schema for the runtime status of all of a tenant's employees."""
+
+    items: list[EmployeeStatusResponse]
+    total: int
+    healthy: int
+    unhealthy: int = Field(description="Runners that crashed or whose heartbeat went stale")
@@ -119,6 +119,12 @@ class InboxListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: str | None = Field(
+        default=None, description="Pass as ``cursor`` for the next page; null on the last."
+    )
+    total_is_estimate: bool = Field(
+        default=False, description="``total`` is approximate (request total=exact to count)."
+    )
 
 
 class InboxMarkReadRequest(BaseModel):
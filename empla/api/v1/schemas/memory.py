@@ -46,6 +46,8 @@ class EpisodicMemoryListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 # =========================================================================
@@ -78,6 +80,8 @@ class SemanticMemoryListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 # =========================================================================
@@ -113,6 +117,8 @@ class ProceduralMemoryListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 # =========================================================================
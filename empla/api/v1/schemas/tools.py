@@ -27,6 +27,25 @@ class ToolCatalogResponse(BaseModel):
     health: dict[str, "IntegrationHealthResponse"] = {}
 
 
+class LatencyWindowResponse(BaseModel):
+    """Latency percentiles and error rate over the runner's sliding window."""
+
+    seconds: float
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    error_rate: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class ToolLatencyResponse(BaseModel):
+    name: str
+    window: LatencyWindowResponse
+
+
 class IntegrationHealthResponse(BaseModel):
     name: str
     status: str
@@ -37,6 +56,10 @@ class IntegrationHealthResponse(BaseModel):
     avg_latency_ms: float = 0.0
     error_rate: float = 0.0
     last_error: str | None = None
+    # Optional so older runners (lifetime counters only) still validate.
+    window: LatencyWindowResponse | None = None
+    # Only on /tools/{name}/health, for the requested tool.
+    tool: ToolLatencyResponse | None = None
 
 
 class BlockedToolEntry(BaseModel):
@@ -11,6 +11,15 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 
+class WebhookObjectChange(BaseModel):
+    """One object changed by a webhook delivery (for per-object coalescing)."""
+
+    object_type: str = Field(description="Provider object type (e.g. 'deal')")
+    object_id: str = Field(description="Provider object ID")
+    event_type: str = Field(description="Provider-specific event type for this object")
+    detail: dict[str, Any] = Field(default_factory=dict, description="Small change detail")
+
+
 class WebhookEvent(BaseModel):
     """Normalized event from an external webhook.
 
@@ -23,6 +32,10 @@ class WebhookEvent(BaseModel):
     summary: str = Field(default="", description="Human-readable summary for the LLM")
     payload: dict[str, Any] = Field(default_factory=dict, description="Raw event payload")
     received_at: datetime = Field(description="When the webhook was received")
+    objects: list[WebhookObjectChange] = Field(
+        default_factory=list,
+        description="Objects this delivery changed, when the provider identifies them",
+    )
 
 
 class WebhookResponse(BaseModel):
@@ -94,3 +107,9 @@ class WebhookEventListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: str | None = Field(
+        default=None, description="Pass as ``cursor`` for the next page; null on the last."
+    )
+    total_is_estimate: bool = Field(
+        default=False, description="``total`` is approximate (request total=exact to count)."
+    )
@@ -28,6 +28,7 @@ BeliefType = Literal["state", "event", "causal", "evaluative"]
 
 if TYPE_CHECKING:
     from empla.core.loop.models import Observation
+    from empla.core.memory.archive import HistoryArchive
     from empla.llm import LLMService
 
 
@@ -228,6 +229,7 @@ class BeliefSystem:
         employee_id: UUID,
         tenant_id: UUID,
         llm_service: "LLMService",
+        archive: "HistoryArchive | None" = None,
     ) -> None:
         """
         Initialize BeliefSystem.
@@ -237,11 +239,14 @@ class BeliefSystem:
             employee_id: Employee this belief system belongs to
             tenant_id: Tenant ID for multi-tenancy
             llm_service: LLM service for belief extraction from observations
+            archive: Optional cold-tier archive; ``get_belief_history`` falls
+                back to archived months when the hot partitions run short
         """
         self.session = session
         self.employee_id = employee_id
         self.tenant_id = tenant_id
         self._llm_service = llm_service
+        self.archive = archive
 
     async def update_beliefs(
         self,
@@ -712,14 +717,22 @@ class BeliefSystem:
         subject: str | None = None,
         predicate: str | None = None,
         limit: int = 100,
+        since: datetime | None = None,
+        include_archived: bool = False,
     ) -> list[BeliefHistory]:
         """
         Get belief change history.
 
+        Only the hot partitions are read unless ``since`` reaches before the
+        hot window or ``include_archived`` asks for all time: archived months
+        are Parquet files, too slow to scan on every short read.
+
         Args:
             subject: Filter by subject (optional, can be used independently)
             predicate: Filter by predicate (optional, can be used independently)
             limit: Maximum number of records to return
+            since: Only changes at or after this time (optional)
+            include_archived: Also read archived months when ``since`` is None
 
         Returns:
             List of BeliefHistory records
@@ -748,11 +761,49 @@ class BeliefSystem:
             if predicate:
                 query = query.where(Belief.predicate == predicate)
 
+        if since is not None:
+            query = query.where(BeliefHistory.changed_at >= since)
+
         result = await self.session.execute(
             query.order_by(BeliefHistory.changed_at.desc()).limit(limit)
         )
+        history = list(result.scalars().all())
+
+        # Archived months are older than every hot row: only read them when
+        # the hot partitions didn't fill the limit and the caller asked for
+        # a window that reaches past the hot cutoff.
+        if (
+            len(history) < limit
+            and self.archive is not None
+            and (since is not None or include_archived)
+            and self.archive.reaches_archive("belief_history", since)
+        ):
+            equals: dict[str, Any] = {"employee_id": self.employee_id}
+            if subject:
+                equals["belief_subject"] = subject
+            if predicate:
+                equals["belief_predicate"] = predicate
+            rows = await self.archive.read(
+                "belief_history",
+                since=since,
+                until=self.archive.hot_start("belief_history"),
+                equals=equals,
+                include_deleted=True,
+                limit=limit - len(history),
+            )
+            # Transient, read-only records; drop the denormalized belief columns.
+            history.extend(
+                BeliefHistory(
+                    **{
+                        k: v
+                        for k, v in row.items()
+                        if k not in ("belief_subject", "belief_predicate")
+                    }
+                )
+                for row in rows
+            )
 
-        return list(result.scalars().all())
+        return history
 
     async def _map_structured_to_beliefs(
         self,
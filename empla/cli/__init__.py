@@ -8,15 +8,23 @@ Usage:
     python -m empla.cli employee stop <employee-id> --tenant-id UUID
     python -m empla.cli employee status <employee-id> --tenant-id UUID
     python -m empla.cli employee list --tenant-id UUID
+    python -m empla.cli memory maintain [--tenant-id UUID] [--interval-seconds N]
+    python -m empla.cli memory retention [--archive-dir PATH] [--hot-months N]
+    python -m empla.cli webhooks reindex-tokens
+    python -m empla.cli metrics rollup [--interval-seconds N]
+    python -m empla.cli export activities|memories|metrics --tenant-id UUID [--output PATH]
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
 import json
 import logging
 import sys
+from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -169,6 +177,177 @@ async def _list_employees(args: argparse.Namespace) -> None:
         await engine.dispose()
 
 
+async def _maintain_memory(args: argparse.Namespace) -> None:
+    """Run set-based memory maintenance out of band.
+
+    Runs once by default. With --interval-seconds it keeps running as a
+    maintenance worker until interrupted; pair it with
+    LoopConfig.memory_maintenance_in_loop=False so employees skip the
+    work during deep reflection.
+    """
+    from empla.core.memory.maintenance import MemoryMaintenanceEngine
+
+    session_factory, engine = _get_session_factory()
+    maintenance = MemoryMaintenanceEngine(
+        session_factory,
+        tenant_id=args.tenant_id,
+        employee_id=args.employee_id,
+        chunk_size=args.chunk_size,
+        pause_seconds=args.pause_seconds,
+    )
+
+    try:
+        while True:
+            try:
+                report = await maintenance.run(only=args.job or None)
+            except ValueError as e:
+                print(json.dumps({"error": str(e)}, indent=2))
+                sys.exit(1)
+            print(json.dumps(report.to_dict(), indent=2))
+            if args.interval_seconds is None:
+                return
+            await asyncio.sleep(args.interval_seconds)
+    finally:
+        await engine.dispose()
+
+
+async def _retain_history(args: argparse.Namespace) -> None:
+    """Pre-create history partitions and archive expired months to Parquet.
+
+    Idempotent; schedule it daily or monthly.
+    """
+    from empla.core.memory.archive import HistoryArchive
+    from empla.core.memory.partitions import HistoryRetention
+    from empla.settings import get_settings
+
+    settings = get_settings()
+    archive_dir = args.archive_dir or settings.history_archive_dir
+    if not archive_dir:
+        print(
+            json.dumps(
+                {
+                    "error": "No archive directory: pass --archive-dir or set EMPLA_HISTORY_ARCHIVE_DIR"
+                },
+                indent=2,
+            )
+        )
+        sys.exit(1)
+
+    archive = HistoryArchive(archive_dir)
+    if not archive.available:
+        print(json.dumps({"error": "pyarrow not installed: pip install empla[archive]"}, indent=2))
+        sys.exit(1)
+
+    session_factory, engine = _get_session_factory()
+    try:
+        retention = HistoryRetention(
+            session_factory,
+            archive,
+            hot_months=args.hot_months or settings.history_hot_months,
+            months_ahead=args.months_ahead,
+        )
+        report = await retention.run()
+        print(json.dumps(report.to_dict(), indent=2))
+        if report.failed:
+            sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+async def _reindex_webhook_tokens(args: argparse.Namespace) -> None:  # noqa: ARG001
+    """Build the webhook token hash index (after upgrading or changing its key)."""
+    from empla.services.webhook_routing import reindex_webhook_tokens
+
+    session_factory, engine = _get_session_factory()
+    try:
+        async with session_factory() as session:
+            changed = await reindex_webhook_tokens(session)
+        print(json.dumps({"integrations_reindexed": changed}, indent=2))
+    finally:
+        await engine.dispose()
+
+
+async def _rollup_metrics(args: argparse.Namespace) -> None:
+    """Aggregate raw metrics into minute/hour rollups and apply retention.
+
+    Runs once by default; with --interval-seconds it keeps running as the
+    rollup worker until interrupted.
+    """
+    from empla.services.metric_rollups import MetricRollupJob
+    from empla.settings import get_settings
+
+    settings = get_settings()
+    session_factory, engine = _get_session_factory()
+    job = MetricRollupJob(
+        session_factory,
+        raw_retention_days=settings.metrics_raw_retention_days,
+        minute_retention_days=settings.metrics_minute_rollup_retention_days,
+        reprocess_minutes=args.reprocess_minutes,
+    )
+
+    try:
+        while True:
+            report = await job.run()
+            print(json.dumps(report.to_dict(), indent=2))
+            if args.interval_seconds is None:
+                return
+            await asyncio.sleep(args.interval_seconds)
+    finally:
+        await engine.dispose()
+
+
+async def _export(args: argparse.Namespace) -> None:
+    """Stream a dataset to a file (or stdout) as NDJSON or CSV.
+
+    Progress goes to stderr as JSON. If the export fails part way, the
+    file holds every row up to the reported ``after_time``/``after_id``;
+    rerun with those to write the rest to a new file.
+    """
+    from empla.services.export import EXPORTS, ExportProgress, ExportQuery, export_chunks
+    from empla.settings import get_settings
+
+    try:
+        export = ExportQuery(
+            EXPORTS[args.dataset],
+            args.tenant_id,
+            employee_id=args.employee_id,
+            since=args.since,
+            until=args.until,
+            after_time=args.after_time,
+            after_id=args.after_id,
+        )
+    except ValueError as e:
+        print(json.dumps({"error": str(e)}, indent=2))
+        sys.exit(1)
+
+    session_factory, engine = _get_session_factory()
+    progress = ExportProgress()
+    try:
+        with contextlib.ExitStack() as stack:
+            # Blocking writes are fine here: the CLI process does nothing else.
+            out = (
+                sys.stdout.buffer
+                if args.output == "-"
+                else stack.enter_context(Path(args.output).open("wb"))  # noqa: ASYNC230
+            )
+            async for chunk in export_chunks(
+                session_factory,
+                export,
+                fmt=args.format,
+                compress=args.gzip,
+                batch_size=args.batch_size or get_settings().export_batch_size,
+                progress=progress,
+            ):
+                out.write(chunk)
+            out.flush()
+    except Exception as e:
+        print(json.dumps({"error": str(e), **progress.to_dict()}, indent=2), file=sys.stderr)
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+    print(json.dumps(progress.to_dict(), indent=2), file=sys.stderr)
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
@@ -204,6 +383,113 @@ def build_parser() -> argparse.ArgumentParser:
     list_p.add_argument("--tenant-id", type=UUID, required=True, help="Tenant UUID")
     list_p.set_defaults(func=_list_employees)
 
+    # ── memory command group ──
+    mem_parser = subparsers.add_parser("memory", help="Memory maintenance")
+    mem_sub = mem_parser.add_subparsers(dest="action", help="Memory actions")
+
+    maintain_p = mem_sub.add_parser(
+        "maintain", help="Reinforce/decay/archive memories in chunked transactions"
+    )
+    maintain_p.add_argument("--tenant-id", type=UUID, default=None, help="Tenant UUID")
+    maintain_p.add_argument("--employee-id", type=UUID, default=None, help="Employee UUID")
+    maintain_p.add_argument(
+        "--job", action="append", default=None, help="Run only this job (repeatable)"
+    )
+    maintain_p.add_argument("--chunk-size", type=int, default=500, help="Rows per UPDATE")
+    maintain_p.add_argument("--pause-seconds", type=float, default=0.0, help="Sleep between chunks")
+    maintain_p.add_argument(
+        "--interval-seconds",
+        type=float,
+        default=None,
+        help="Repeat every N seconds (worker mode); default runs once",
+    )
+    maintain_p.set_defaults(func=_maintain_memory)
+
+    retention_p = mem_sub.add_parser(
+        "retention", help="Create future history partitions and archive expired ones"
+    )
+    retention_p.add_argument(
+        "--archive-dir", default=None, help="Archive root (default: EMPLA_HISTORY_ARCHIVE_DIR)"
+    )
+    retention_p.add_argument(
+        "--hot-months",
+        type=int,
+        default=None,
+        help="Months kept in Postgres (default: EMPLA_HISTORY_HOT_MONTHS)",
+    )
+    retention_p.add_argument(
+        "--months-ahead", type=int, default=3, help="Future partitions to pre-create"
+    )
+    retention_p.set_defaults(func=_retain_history)
+
+    # ── webhooks command group ──
+    wh_parser = subparsers.add_parser("webhooks", help="Inbound webhook maintenance")
+    wh_sub = wh_parser.add_subparsers(dest="action", help="Webhook actions")
+
+    reindex_p = wh_sub.add_parser(
+        "reindex-tokens",
+        help="Recompute webhook token hashes (after upgrading or changing the hash key)",
+    )
+    reindex_p.set_defaults(func=_reindex_webhook_tokens)
+
+    # ── metrics command group ──
+    metrics_parser = subparsers.add_parser("metrics", help="Metric maintenance")
+    metrics_sub = metrics_parser.add_subparsers(dest="action", help="Metric actions")
+
+    rollup_p = metrics_sub.add_parser(
+        "rollup", help="Aggregate metrics into minute/hour rollups and prune raw rows"
+    )
+    rollup_p.add_argument(
+        "--reprocess-minutes",
+        type=int,
+        default=5,
+        help="Re-aggregate this many minutes before the last pass (late rows)",
+    )
+    rollup_p.add_argument(
+        "--interval-seconds",
+        type=float,
+        default=None,
+        help="Repeat every N seconds (worker mode); default runs once",
+    )
+    rollup_p.set_defaults(func=_rollup_metrics)
+
+    # ── export command ──
+    from empla.services.export import EXPORTS
+
+    export_p = subparsers.add_parser(
+        "export", help="Stream activities, memories or metrics to NDJSON/CSV"
+    )
+    export_p.add_argument("dataset", choices=sorted(EXPORTS), help="Dataset to export")
+    export_p.add_argument("--tenant-id", type=UUID, required=True, help="Tenant UUID")
+    export_p.add_argument("--employee-id", type=UUID, default=None, help="Employee UUID")
+    export_p.add_argument(
+        "--format", choices=["ndjson", "csv"], default="ndjson", help="Output format"
+    )
+    export_p.add_argument("--gzip", action="store_true", help="Gzip the output")
+    export_p.add_argument("--output", default="-", help="Output file (default: stdout)")
+    export_p.add_argument(
+        "--since", type=datetime.fromisoformat, default=None, help="Rows at or after (ISO 8601)"
+    )
+    export_p.add_argument(
+        "--until", type=datetime.fromisoformat, default=None, help="Rows before (ISO 8601)"
+    )
+    export_p.add_argument(
+        "--after-time",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Resume after the row with this time (from a previous run's progress)",
+    )
+    export_p.add_argument(
+        "--after-id", type=UUID, default=None, help="Resume after the row with this id"
+    )
+    export_p.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Rows per cursor fetch (default: EMPLA_EXPORT_BATCH_SIZE)",
+    )
+    export_p.set_defaults(func=_export)
+
     return parser
 
 
@@ -0,0 +1,105 @@
+"""
+empla.core.deadline - Cycle Deadline Propagation
+
+The BDI loop gives each cycle a time budget (LoopConfig.max_cycle_duration_seconds).
+The budget is carried in a context variable rather than threaded through every
+call signature, so the layers that actually block — ToolRouter and LLMService —
+can cap their own waits by the time left without the phases in between knowing
+about it. asyncio copies the context into tasks it spawns, so concurrent tool
+calls inherit the same deadline.
+
+Example:
+    >>> with deadline_scope(600):
+    ...     # Each tool call gets min(its own timeout, time left in the cycle)
+    ...     await tool_router.execute_tool_call(employee_id, "crm.get_deals", {})
+    ...     async with enforce_deadline("LLM call"):
+    ...         await provider.generate(request)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+class DeadlineExceededError(TimeoutError):
+    """The enclosing deadline ran out before or during an operation.
+
+    Subclasses TimeoutError so existing ``except TimeoutError`` handling
+    keeps working; callers that care can tell the two apart.
+    """
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """An absolute expiry on the monotonic clock."""
+
+    expires_at: float
+    label: str = "cycle"
+
+    def remaining(self) -> float:
+        """Seconds left, clamped at 0."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+_deadline: ContextVar[Deadline | None] = ContextVar("empla_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """Return the innermost active deadline, if any."""
+    return _deadline.get()
+
+
+@contextlib.contextmanager
+def deadline_scope(seconds: float, *, label: str = "cycle") -> Iterator[Deadline]:
+    """Run the enclosed code under a deadline ``seconds`` from now.
+
+    Nested scopes can only shorten the budget: the effective deadline is
+    the earlier of this one and any already active.
+    """
+    deadline = Deadline(expires_at=time.monotonic() + seconds, label=label)
+    outer = _deadline.get()
+    if outer is not None and outer.expires_at <= deadline.expires_at:
+        deadline = outer
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+@contextlib.asynccontextmanager
+async def enforce_deadline(operation: str) -> AsyncIterator[None]:
+    """Cancel the enclosed awaits when the active deadline passes.
+
+    A no-op without an active deadline. Raises DeadlineExceededError up front
+    when the deadline has already passed, and converts the timeout into
+    DeadlineExceededError when it fires mid-operation. TimeoutErrors raised by
+    the operation itself (its own, shorter timeouts) pass through unchanged.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        yield
+        return
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceededError(f"{deadline.label} deadline exceeded before {operation}")
+    try:
+        async with asyncio.timeout(remaining):
+            yield
+    except DeadlineExceededError:
+        raise
+    except TimeoutError as e:
+        if deadline.expired:
+            raise DeadlineExceededError(
+                f"{deadline.label} deadline exceeded during {operation}"
+            ) from e
+        raise
@@ -0,0 +1,64 @@
+"""
+empla.core.loop.context - Per-Cycle Prompt Context
+
+Mixin that assembles the budgeted prompt context (beliefs, entity facts,
+recent episodes, playbooks) at most once per loop cycle, so perception,
+strategic planning and goal evaluation share one concurrent fetch instead
+of each re-querying the same rows sequentially.
+
+Phases that run before belief updates (perception) and after them
+(planning, goal evaluation) see the same snapshot. That is intentional:
+beliefs changed this cycle still reach planning and goal evaluation
+through their explicit ``beliefs`` / ``changed_beliefs`` arguments; the
+cached context only carries the slower-moving background.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from empla.core.memory.context import AssembledContext, ContextAssembler
+
+logger = logging.getLogger(__name__)
+
+
+class CycleContextMixin:
+    """Mixin caching one :class:`AssembledContext` per loop cycle.
+
+    Expects the host class to provide:
+        self.employee - Employee instance
+        self.memory   - MemorySystem (``memory.context`` is the assembler)
+        self.config   - LoopConfig (``context_token_budget``)
+
+    Without an assembler (no sessionmaker, or a bare memory stub) every
+    accessor returns None and callers fall back to their direct queries.
+    """
+
+    _cycle_context: AssembledContext | None = None
+
+    def _reset_cycle_context(self) -> None:
+        """Drop the cached context; called at the start of every cycle."""
+        self._cycle_context = None
+
+    async def _get_cycle_context(self) -> AssembledContext | None:
+        """Assemble (once per cycle) and return the shared prompt context."""
+        if self._cycle_context is not None:
+            return self._cycle_context
+
+        # Not every host carries memory (goal management is used standalone).
+        assembler = getattr(getattr(self, "memory", None), "context", None)
+        if not isinstance(assembler, ContextAssembler):
+            return None
+
+        try:
+            self._cycle_context = await assembler.assemble(
+                token_budget=self.config.context_token_budget
+            )
+        except Exception:
+            logger.warning(
+                "Context assembly failed; phases fall back to direct queries",
+                exc_info=True,
+                extra={"employee_id": str(self.employee.id)},
+            )
+            return None
+        return self._cycle_context
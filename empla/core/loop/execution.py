@@ -20,6 +20,10 @@ Architecture:
 Each mixin provides a phase of the BDI cycle. The orchestrator
 wires them together via _execute_bdi_phases() and manages the
 continuous loop, lifecycle hooks, and shared state.
+
+Every cycle runs inside a deadline_scope(max_cycle_duration_seconds)
+(empla.core.deadline): tool and LLM calls are capped by the time left
+in the cycle instead of each getting its full timeout.
 """
 
 from __future__ import annotations
@@ -30,12 +34,13 @@ import logging
 import time
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import func
 from sqlalchemy import select as sa_select
 from sqlalchemy import update as sa_update
 
+from empla.core.deadline import deadline_scope
 from empla.core.hooks import (
     HOOK_AFTER_BELIEF_UPDATE,
     HOOK_AFTER_INTENTION_EXECUTION,
@@ -78,6 +83,7 @@ if TYPE_CHECKING:
     from empla.employees.identity import EmployeeIdentity
     from empla.llm import LLMService
     from empla.runner.health import HealthServer
+    from empla.services.metrics_sink import MetricsSink
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +103,65 @@ __all__ = [
 ]
 
 
+# Most recent changes listed in a batched event observation
+_MAX_BATCH_EVENT_ITEMS = 25
+
+
+def _event_observation(event: dict[str, Any]) -> dict[str, Any]:
+    """Working-memory content for one (possibly merged) external event."""
+    provider = event.get("provider", "unknown")
+    event_type = event.get("event_type", "unknown")
+    summary = event.get("summary", "")
+    description = f"EVENT: {provider} {event_type}"
+    if summary:
+        description += f" — {summary}"
+    count = int(event.get("count", 1))
+    if count > 1:
+        description += f" ({count} changes)"
+    return {
+        "description": description,
+        "subtype": "external_event",
+        "provider": provider,
+        "event_type": event_type,
+        "payload": event.get("payload", {}),
+        "received_at": event.get("received_at", ""),
+        "count": count,
+    }
+
+
+def _batch_observation(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """Working-memory content summarizing a burst of external events."""
+    counts: dict[str, int] = {}
+    for event in events:
+        key = f"{event.get('provider', 'unknown')} {event.get('event_type', 'unknown')}"
+        counts[key] = counts.get(key, 0) + int(event.get("count", 1))
+    total = sum(counts.values())
+    breakdown = ", ".join(
+        f"{key} x{n}" for key, n in sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
+    )
+    # Drained oldest-first: keep the most recent changes
+    recent = events[-_MAX_BATCH_EVENT_ITEMS:]
+    return {
+        "description": f"EVENT BATCH: {total} external changes across {len(events)} items — {breakdown}",
+        "subtype": "external_event_batch",
+        "event_count": total,
+        "item_count": len(events),
+        "counts": counts,
+        "events": [
+            {
+                "provider": e.get("provider", "unknown"),
+                "event_type": e.get("event_type", "unknown"),
+                "summary": e.get("summary", ""),
+                "count": int(e.get("count", 1)),
+                "received_at": e.get("received_at", ""),
+            }
+            for e in recent
+        ],
+        "omitted_items": len(events) - len(recent),
+        "received_at": recent[-1].get("received_at", ""),
+    }
+
+
 class ProactiveExecutionLoop(
     PerceptionMixin,
     PlanningMixin,
@@ -148,6 +213,7 @@ class ProactiveExecutionLoop(
         identity: EmployeeIdentity | None = None,
         sessionmaker: async_sessionmaker[AsyncSession] | None = None,
         cost_hard_stop_usd: float | None = None,
+        metrics_sink: MetricsSink | None = None,
     ) -> None:
         """
         Create and initialize a ProactiveExecutionLoop.
@@ -180,6 +246,10 @@ class ProactiveExecutionLoop(
                 (via ``Tenant.settings.cost.hard_stop_budget``) per the
                 runner-restart settings-reload pattern; not re-read mid-cycle.
                 ``None`` disables the hard stop.
+            metrics_sink: Optional buffered writer for cycle metrics. When
+                given, each cycle hands its rows to the sink (no SQL on the
+                cycle path) instead of committing them on a fresh session.
+                The owner starts and stops it.
         """
         self.employee = employee
         self.beliefs = beliefs
@@ -192,6 +262,7 @@ class ProactiveExecutionLoop(
         self._hooks = hooks or HookRegistry()
         self._identity = identity
         self._sessionmaker = sessionmaker
+        self._metrics_sink = metrics_sink
         # Cost hard-stop config is captured at init and never re-read —
         # settings-change triggers a full runner restart (PR #83), so
         # mid-process the value is guaranteed stable.
@@ -384,7 +455,8 @@ class ProactiveExecutionLoop(
                 # Drain external events from health server → inject as observations
                 await self._check_pending_events()
 
-                await self._execute_bdi_phases()
+                with deadline_scope(self.config.max_cycle_duration_seconds):
+                    await self._execute_bdi_phases()
 
                 # ============ DEEP REFLECTION ============
                 # Periodic deep reflection (less frequent)
@@ -525,7 +597,8 @@ class ProactiveExecutionLoop(
                 cycle_count=self.cycle_count,
             )
 
-            result = await self._execute_bdi_phases()
+            with deadline_scope(self.config.max_cycle_duration_seconds):
+                result = await self._execute_bdi_phases()
 
             cycle_duration = time.time() - cycle_start
             logger.debug(
@@ -588,6 +661,9 @@ class ProactiveExecutionLoop(
         if self.llm_service:
             self.llm_service.reset_cycle_budget()
 
+        # Prompt context is assembled lazily, at most once per cycle
+        self._reset_cycle_context()
+
         employee_id = self.employee.id
 
         # ============ TRUST BOUNDARY RESET ============
@@ -878,8 +954,11 @@ class ProactiveExecutionLoop(
 
         Events arrive via POST /wake from the API server when external
         webhooks fire (HubSpot deal update, calendar change, email received,
-        etc.). Each event becomes a high-priority working memory observation
-        so the LLM can decide how to respond.
+        etc.). The HealthServer has already merged them per object, so a
+        single pending change becomes one high-priority observation as
+        before, while a burst becomes ONE batch observation with counts
+        per event type and the most recent changes itemized — rather than
+        hundreds of near-duplicate observations crowding perception.
         """
         if self._health_server is None:
             return
@@ -899,53 +978,33 @@ class ProactiveExecutionLoop(
         if not events:
             return
 
-        injected = 0
-        for event in events:
-            try:
-                provider = event.get("provider", "unknown")
-                event_type = event.get("event_type", "unknown")
-                summary = event.get("summary", "")
-                description = f"EVENT: {provider} {event_type}"
-                if summary:
-                    description += f" — {summary}"
-
-                await self.memory.working.add_item(
-                    item_type="observation",
-                    content={
-                        "description": description,
-                        "subtype": "external_event",
-                        "provider": provider,
-                        "event_type": event_type,
-                        "payload": event.get("payload", {}),
-                        "received_at": event.get("received_at", ""),
-                    },
-                    importance=0.9,
-                )
-                injected += 1
-            except Exception:
-                logger.error(
-                    "Failed to inject external event, event lost",
-                    exc_info=True,
-                    extra={
-                        "employee_id": str(self.employee.id),
-                        "provider": event.get("provider", "unknown"),
-                        "event_type": event.get("event_type", "unknown"),
-                    },
-                )
-
-        if injected == 0 and events:
-            logger.error(
-                "ALL %d external events failed injection — events lost",
-                len(events),
-                extra={"employee_id": str(self.employee.id)},
+        content = _event_observation(events[0]) if len(events) == 1 else _batch_observation(events)
+        try:
+            await self.memory.working.add_item(
+                item_type="observation",
+                content=content,
+                importance=0.9,
             )
-        elif injected:
-            logger.info(
-                "Injected %d/%d external events into perception",
-                injected,
+        except Exception:
+            logger.error(
+                "Failed to inject %d external events, events lost",
                 len(events),
-                extra={"employee_id": str(self.employee.id)},
+                exc_info=True,
+                extra={
+                    "employee_id": str(self.employee.id),
+                    "providers": sorted({str(e.get("provider", "unknown")) for e in events}),
+                },
             )
+            return
+
+        logger.info(
+            "Injected %d external events into perception",
+            len(events),
+            extra={
+                "employee_id": str(self.employee.id),
+                "changes": sum(int(e.get("count", 1)) for e in events),
+            },
+        )
 
     def wake(self) -> None:
         """Wake the loop from sleep immediately.
@@ -973,13 +1032,16 @@ class ProactiveExecutionLoop(
             return  # Stop was called during sleep
 
     async def _record_cycle_metrics(self, duration_seconds: float, *, success: bool) -> None:
-        """Persist cycle metrics to DB using a short-lived independent session.
+        """Persist cycle metrics through the metrics sink or a short-lived session.
 
-        Uses a separate session so metrics writes don't pollute the BDI
-        loop's long-lived session. Cache update deferred until after commit.
+        With a metrics sink the rows are buffered and written in bulk by the
+        sink's flusher. Without one they are committed on a separate session
+        so metrics writes don't pollute the BDI loop's long-lived session.
+        Either way the tool-stats cache only advances once the rows are
+        accepted, so dropped rows fold into the next cycle's deltas.
         """
         sessionmaker = self._sessionmaker
-        if sessionmaker is None:
+        if sessionmaker is None and self._metrics_sink is None:
             # WARNING (not debug) — the whole point of PR #77 was to stop silent
             # no-op metrics. Logging this at debug would re-hide the same class
             # of failure: operators checking "why is my cost panel empty?" in
@@ -997,16 +1059,20 @@ class ProactiveExecutionLoop(
             # may not be available at module load time in all contexts (e.g. tests).
             from empla.services.metrics import (
                 _previous_tool_stats,
+                build_cycle_metrics,
                 record_cycle_metrics,
             )
 
             # Collect tool stats — isolated so failure doesn't lose base metrics
             tool_stats = None
+            tool_latency = None
             try:
                 if self.tool_router and hasattr(self.tool_router, "health_monitor"):
                     monitor = self.tool_router.health_monitor
                     if hasattr(monitor, "get_all_status"):
                         tool_stats = monitor.get_all_status()
+                    if hasattr(monitor, "get_all_tool_status"):
+                        tool_latency = monitor.get_all_tool_status()
             except Exception:
                 logger.debug("Health monitor query failed, recording without tool stats")
 
@@ -1033,19 +1099,37 @@ class ProactiveExecutionLoop(
             except Exception:
                 logger.debug("LLM cost summary query failed, recording without cost")
 
+            http_stats = None
+            try:
+                from empla.integrations.http import collect_request_stats
+
+                http_stats = collect_request_stats()
+            except Exception:
+                logger.debug("Integration request stats unavailable, recording without them")
+
+            payload: dict[str, Any] = {
+                "tenant_id": self.employee.tenant_id,
+                "employee_id": self.employee.id,
+                "cycle_count": self.cycle_count,
+                "duration_seconds": duration_seconds,
+                "success": success,
+                "tool_stats": tool_stats,
+                "llm_cost_usd": llm_cost_usd,
+                "llm_input_tokens": llm_input_tokens,
+                "llm_output_tokens": llm_output_tokens,
+                "http_stats": http_stats,
+                "tool_latency": tool_latency,
+            }
+
+            if self._metrics_sink is not None:
+                rows, snapshot = build_cycle_metrics(**payload)
+                if await self._metrics_sink.submit(rows) and snapshot is not None:
+                    _previous_tool_stats[self.employee.id] = snapshot
+                return
+
+            assert sessionmaker is not None
             async with sessionmaker() as metrics_session:
-                snapshot = await record_cycle_metrics(
-                    metrics_session,
-                    tenant_id=self.employee.tenant_id,
-                    employee_id=self.employee.id,
-                    cycle_count=self.cycle_count,
-                    duration_seconds=duration_seconds,
-                    success=success,
-                    tool_stats=tool_stats,
-                    llm_cost_usd=llm_cost_usd,
-                    llm_input_tokens=llm_input_tokens,
-                    llm_output_tokens=llm_output_tokens,
-                )
+                snapshot = await record_cycle_metrics(metrics_session, **payload)
                 await metrics_session.commit()
                 # Only advance cache AFTER commit succeeds
                 if snapshot is not None:
@@ -1113,10 +1197,28 @@ class ProactiveExecutionLoop(
                     )
                 )
                 daily_cost = float(total_result.scalar() or 0.0)
+                # Include this process's rows still waiting in the sink, so
+                # buffering never lets a cycle slip past the cap.
+                if self._metrics_sink is not None:
+                    daily_cost += self._metrics_sink.pending_sum(
+                        tenant_id, "llm.cost_usd", day_start
+                    )
 
                 if daily_cost < self._cost_hard_stop_usd:
                     return  # under budget, nothing to do
 
+                # Rare path: write the buffer so the breakdown below lists
+                # the cycles that crossed the cap.
+                if self._metrics_sink is not None:
+                    try:
+                        await self._metrics_sink.flush()
+                    except Exception:
+                        logger.warning(
+                            "Metrics flush before cost breakdown failed",
+                            exc_info=True,
+                            extra={"employee_id": str(self.employee.id)},
+                        )
+
                 logger.warning(
                     "Cost hard-stop triggered: tenant=%s daily=$%.4f cap=$%.2f",
                     tenant_id,
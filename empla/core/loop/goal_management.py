@@ -13,13 +13,14 @@ from datetime import UTC, datetime
 from typing import Any, cast
 
 from empla.core.hooks import HOOK_GOAL_ACHIEVED
+from empla.core.loop.context import CycleContextMixin
 from empla.core.loop.models import GoalProgressEvaluation, NonNumericGoalBatchEvaluation
 from empla.core.loop.protocols import BeliefChange
 
 logger = logging.getLogger(__name__)
 
 
-class GoalManagementMixin:
+class GoalManagementMixin(CycleContextMixin):
     """Mixin for goal progress evaluation and achievement management.
 
     Expects the host class to provide:
@@ -267,10 +268,20 @@ Only include goals where you can determine a numeric value."""
             )
         goals_text = "\n".join(goal_lines)
 
+        # Background entity knowledge from the shared cycle context (already
+        # fetched by perception/planning, so this is free).
+        background = ""
+        cycle_context = await self._get_cycle_context()
+        if cycle_context is not None:
+            facts = cycle_context.render(["facts"])
+            if facts:
+                background = f"{facts}\n\n"
+
         try:
             _, evaluation = await self.llm_service.generate_structured(
                 prompt=(
                     f"Recent belief changes:\n{beliefs_text}\n\n"
+                    f"{background}"
                     f"Goals to evaluate for completion:\n{goals_text}\n\n"
                     "For each goal, determine whether it has been effectively "
                     "addressed or resolved based on the belief changes. "
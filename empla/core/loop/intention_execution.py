@@ -15,6 +15,7 @@ import time
 from datetime import UTC, datetime
 from typing import Any
 
+from empla.core.deadline import DeadlineExceededError, current_deadline
 from empla.core.loop.models import IntentionResult
 
 logger = logging.getLogger(__name__)
@@ -136,6 +137,7 @@ class IntentionExecutionMixin:
                 success=execution_result["success"],
                 outcome=execution_result,
                 duration_ms=duration_ms,
+                deadline_exceeded=execution_result.get("deadline_exceeded", False),
             )
 
             if result.success:
@@ -178,11 +180,16 @@ class IntentionExecutionMixin:
 
             await self.intentions.fail_intention(intention.id, error=str(e))
 
+            deadline_exceeded = isinstance(e, DeadlineExceededError)
+            outcome: dict[str, Any] = {"error": str(e)}
+            if deadline_exceeded:
+                outcome["deadline_exceeded"] = True
             return IntentionResult(
                 intention_id=intention.id,
                 success=False,
-                outcome={"error": str(e)},
+                outcome=outcome,
                 duration_ms=max(0.01, (time.time() - start_time) * 1000),
+                deadline_exceeded=deadline_exceeded,
             )
 
     async def _execute_intention_plan(self, intention: Any) -> dict[str, Any]:
@@ -266,7 +273,31 @@ class IntentionExecutionMixin:
         max_iterations = 10
         tool_calls_made: list[dict[str, Any]] = []
 
+        def deadline_outcome(error: str) -> dict[str, Any]:
+            # Structured so reflection and IntentionResult can tell "ran out
+            # of cycle time" apart from a failing tool or model.
+            logger.warning(
+                "Agentic execution stopped at the cycle deadline",
+                extra={
+                    "employee_id": str(self.employee.id),
+                    "intention_id": str(intention.id),
+                    "tool_calls_made": len(tool_calls_made),
+                },
+            )
+            return {
+                "success": False,
+                "error": error,
+                "deadline_exceeded": True,
+                "tool_calls_made": len(tool_calls_made),
+                "tools_used": [tc["tool"] for tc in tool_calls_made],
+                "tool_results": tool_calls_made,
+                "agentic": True,
+            }
+
         for iteration in range(max_iterations):
+            deadline = current_deadline()
+            if deadline is not None and deadline.expired:
+                return deadline_outcome("Cycle deadline exceeded before the next LLM call")
             try:
                 response = await self.llm_service.generate_with_tools(
                     messages=messages,
@@ -274,6 +305,8 @@ class IntentionExecutionMixin:
                     tool_choice="auto",
                     temperature=0.2,
                 )
+            except DeadlineExceededError as e:
+                return deadline_outcome(str(e))
             except Exception as e:
                 logger.error(
                     f"LLM generate_with_tools failed during agentic execution: {e}",
@@ -334,6 +367,7 @@ class IntentionExecutionMixin:
                     "tool_results": [],
                     "agentic": True,
                 }
+            out_of_time = False
             for tool_call in response.tool_calls:
                 try:
                     result = await self.tool_router.execute_tool_call(
@@ -361,18 +395,23 @@ class IntentionExecutionMixin:
                     continue
 
                 tool_calls_made.append({"tool": tool_call.name, "success": result.success})
+                metadata = getattr(result, "metadata", None)
+                if isinstance(metadata, dict) and metadata.get("deadline_exceeded"):
+                    out_of_time = True
 
                 # Handle scheduled action tool results — persist to working memory
                 await self._handle_scheduling_result(result)
 
-                result_content = json.dumps(
-                    {
-                        "success": result.success,
-                        "output": result.output,
-                        "error": result.error,
-                    },
-                    default=str,
-                )
+                tool_payload: dict[str, Any] = {
+                    "success": result.success,
+                    "output": result.output,
+                    "error": result.error,
+                }
+                # Let the model know it is looking at a cached read.
+                if isinstance(metadata, dict) and metadata.get("cached"):
+                    tool_payload["cached"] = True
+                    tool_payload["age_ms"] = metadata.get("age_ms")
+                result_content = json.dumps(tool_payload, default=str)
                 messages.append(
                     Message(role="tool", content=result_content, tool_call_id=tool_call.id)
                 )
@@ -386,6 +425,12 @@ class IntentionExecutionMixin:
                         "iteration": iteration,
                     },
                 )
+                if out_of_time:
+                    # Don't start the remaining calls this turn asked for
+                    break
+
+            if out_of_time:
+                return deadline_outcome("Cycle deadline exceeded during tool execution")
 
         # Max iterations reached — incomplete execution
         logger.warning(
@@ -127,6 +127,13 @@ class IntentionResult(BaseModel):
     outcome: dict[str, Any] = Field(default_factory=dict)
     error: str | None = Field(default=None)
     duration_ms: float | None = Field(default=None, gt=0)
+    deadline_exceeded: bool = Field(
+        default=False,
+        description=(
+            "Execution stopped because the cycle's time budget ran out rather than "
+            "because the intention itself failed (it is failed with retry=True)"
+        ),
+    )
 
 
 class LoopConfig(BaseModel):
@@ -175,7 +182,12 @@ class LoopConfig(BaseModel):
         default=1, ge=1, description="How many intentions to execute per cycle"
     )
     max_cycle_duration_seconds: int = Field(
-        default=600, gt=0, description="Maximum time per cycle (default: 10 minutes)"
+        default=600,
+        gt=0,
+        description=(
+            "Maximum time per cycle (default: 10 minutes). Tool and LLM calls are "
+            "capped by the time left in the cycle"
+        ),
     )
 
     # Learning
@@ -185,6 +197,22 @@ class LoopConfig(BaseModel):
     enable_cross_employee_learning: bool = Field(
         default=True, description="Enable learning from other employees"
     )
+    memory_maintenance_in_loop: bool = Field(
+        default=True,
+        description=(
+            "Run memory reinforce/decay/archive during deep reflection. Disable when "
+            "`empla memory maintain` runs out of band so the loop never does the work"
+        ),
+    )
+    context_token_budget: int = Field(
+        default=1500,
+        gt=0,
+        description=(
+            "Approximate token budget for the per-cycle prompt context (beliefs, "
+            "entity facts, recent episodes, playbooks) shared by perception, "
+            "planning and goal evaluation"
+        ),
+    )
 
     class Config:
         json_schema_extra = {
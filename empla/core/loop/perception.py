@@ -15,7 +15,9 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from empla.core.loop.context import CycleContextMixin
 from empla.core.loop.models import Observation, PerceptionResult
+from empla.integrations.http import Priority, request_priority
 
 if TYPE_CHECKING:
     pass
@@ -23,7 +25,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class PerceptionMixin:
+class PerceptionMixin(CycleContextMixin):
     """Mixin providing perception capabilities for the proactive execution loop.
 
     Expects the host class to provide:
@@ -177,13 +179,16 @@ class PerceptionMixin:
                 sources_checked.add(source)
 
                 try:
-                    result = await self.tool_router.execute_tool_call(
-                        self.employee.id,
-                        tc.name,
-                        tc.arguments,
-                        employee_role=getattr(self.employee, "role", None),
-                        tenant_id=getattr(self.employee, "tenant_id", None),
-                    )
+                    # Polling: let intention execution overtake us in the
+                    # integrations' outbound request queues.
+                    with request_priority(Priority.BACKGROUND):
+                        result = await self.tool_router.execute_tool_call(
+                            self.employee.id,
+                            tc.name,
+                            tc.arguments,
+                            employee_role=getattr(self.employee, "role", None),
+                            tenant_id=getattr(self.employee, "tenant_id", None),
+                        )
                     result_output = result.output if hasattr(result, "output") else result
                     result_error = getattr(result, "error", None)
                     result_success = getattr(result, "success", True)
@@ -213,6 +218,10 @@ class PerceptionMixin:
                     }
                     if result_error:
                         result_payload["error"] = result_error
+                    metadata = getattr(result, "metadata", None)
+                    if isinstance(metadata, dict) and metadata.get("cached"):
+                        result_payload["cached"] = True
+                        result_payload["age_ms"] = metadata.get("age_ms")
                     result_content = json.dumps(result_payload, default=str)
                 except Exception as e:
                     logger.exception(
@@ -308,6 +317,10 @@ class PerceptionMixin:
 
     async def _format_recent_beliefs_for_perception(self) -> str:
         """Format recent beliefs for context in perception prompt."""
+        cycle_context = await self._get_cycle_context()
+        if cycle_context is not None:
+            return cycle_context.render(["beliefs"], headers=False) or "No current beliefs."
+
         try:
             beliefs = await self.beliefs.get_all_beliefs(min_confidence=0.5)
             if not beliefs:
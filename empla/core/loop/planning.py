@@ -13,13 +13,14 @@ import time
 from datetime import UTC, datetime
 from typing import Any, cast
 
+from empla.core.loop.context import CycleContextMixin
 from empla.core.loop.protocols import GoalRecommendation, SituationAnalysis
 from empla.llm.models import TaskContext, TaskType
 
 logger = logging.getLogger(__name__)
 
 
-class PlanningMixin:
+class PlanningMixin(CycleContextMixin):
     """Mixin providing strategic planning methods for ProactiveExecutionLoop.
 
     Expects the host class to provide:
@@ -261,9 +262,20 @@ Be specific and actionable in your analysis."""
             else f"You are a digital employee.\n\n{base_prompt}"
         )
 
-        # Inject semantic memory (long-term entity knowledge)
+        # Shared per-cycle context: entity facts, recent experience (with the
+        # latest deep reflection pinned) and playbooks, already budgeted and
+        # deduped.
+        cycle_context = await self._get_cycle_context()
         entity_context = ""
-        if hasattr(self.memory, "semantic"):
+        reflection_context = ""
+        if cycle_context is not None:
+            memory_context = cycle_context.render(["facts", "episodes", "playbooks"])
+            if memory_context:
+                entity_context = f"\n\n{memory_context}"
+
+        # Without an assembler, query semantic memory (long-term entity knowledge)
+        # and the latest reflection directly.
+        elif hasattr(self.memory, "semantic"):
             try:
                 subjects = {getattr(b, "subject", "") for b in beliefs[:20]}
                 entity_lines = []
@@ -282,9 +294,8 @@ Be specific and actionable in your analysis."""
                     extra={"employee_id": str(self.employee.id)},
                 )
 
-        # Inject latest deep reflection insight
-        reflection_context = ""
-        if hasattr(self.memory, "episodic"):
+        # Inject latest deep reflection insight (the cycle context pins it)
+        if cycle_context is None and hasattr(self.memory, "episodic"):
             try:
                 reflections = await self.memory.episodic.recall_recent(
                     episode_type="deep_reflection", limit=1
@@ -642,7 +642,19 @@ Analyze the patterns and provide brief recommendations."""
             )
 
     async def _maintain_memory_health(self) -> None:
-        """Perform memory maintenance: reinforce and decay."""
+        """Perform memory maintenance: reinforce and decay.
+
+        Each call below is a single set-based UPDATE on the loop's session.
+        When a maintenance worker (``empla memory maintain``) owns this work,
+        ``config.memory_maintenance_in_loop`` is False and this is a no-op.
+        """
+        if not self.config.memory_maintenance_in_loop:
+            logger.debug(
+                "Memory maintenance delegated to out-of-band worker",
+                extra={"employee_id": str(self.employee.id)},
+            )
+            return
+
         if hasattr(self.memory, "episodic"):
             try:
                 reinforced = await self.memory.episodic.reinforce_frequently_recalled(
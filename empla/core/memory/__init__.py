@@ -23,6 +23,26 @@ Multi-layered memory architecture for autonomous digital employees:
   - Temporary storage for active tasks/goals
   - Fast access, automatic expiration
 
+- **Hybrid Retrieval**: Lexical + vector search across episodic/semantic
+  - Postgres full-text and pgvector legs run concurrently
+  - Reciprocal-rank fusion into one scored list, per-leg timings
+
+- **Access Tracking**: Buffered read counters
+  - Reads append to an in-process buffer instead of writing rows
+  - Periodic bulk UPDATE ... FROM (VALUES ...) merges the counts
+
+- **Maintenance**: Set-based reinforce/decay/archive
+  - One UPDATE ... RETURNING per rule instead of per-row ORM mutation
+  - Chunked, out-of-band engine for a maintenance worker
+
+- **Context Assembly**: Budgeted prompt context for the BDI loop
+  - Beliefs, facts, episodes, playbooks fetched concurrently
+  - Salience-ranked, deduplicated, packed into a token budget
+
+- **History Retention**: Monthly partitions + Parquet cold tier
+  - memory_episodes / belief_history range-partitioned by month
+  - Expired months detached, exported to Parquet, read back on demand
+
 Design Philosophy:
 - Inspired by human memory systems
 - Optimized for autonomous operation
@@ -78,14 +98,36 @@ Example:
     ... )
 """
 
+from empla.core.memory.access import MemoryAccessTracker
+from empla.core.memory.archive import HistoryArchive
+from empla.core.memory.context import AssembledContext, ContextAssembler
 from empla.core.memory.episodic import EpisodicMemorySystem
+from empla.core.memory.hybrid import HybridHit, HybridMemoryRetriever, HybridSearchResult
+from empla.core.memory.maintenance import (
+    MaintenancePolicy,
+    MaintenanceReport,
+    MemoryMaintenanceEngine,
+)
+from empla.core.memory.partitions import HistoryRetention, RetentionReport
 from empla.core.memory.procedural import ProceduralMemorySystem
 from empla.core.memory.semantic import SemanticMemorySystem
 from empla.core.memory.working import WorkingMemory
 
 __all__ = [
+    "AssembledContext",
+    "ContextAssembler",
     "EpisodicMemorySystem",
+    "HistoryArchive",
+    "HistoryRetention",
+    "HybridHit",
+    "HybridMemoryRetriever",
+    "HybridSearchResult",
+    "MaintenancePolicy",
+    "MaintenanceReport",
+    "MemoryAccessTracker",
+    "MemoryMaintenanceEngine",
     "ProceduralMemorySystem",
+    "RetentionReport",
     "SemanticMemorySystem",
     "WorkingMemory",
 ]
@@ -0,0 +1,329 @@
+"""
+empla.core.memory.access - Batched Memory Access Tracking
+
+Read paths used to bump ``access_count`` / ``recall_count`` and the
+matching ``last_*_at`` column on every returned row and flush inside the
+read. That turned every recall into a write transaction: row locks, WAL
+traffic, and contention between concurrent readers of the same hot facts.
+
+The tracker decouples the two:
+
+- Reads call :meth:`MemoryAccessTracker.record` — a dict update in
+  process memory, no SQL.
+- A background task (or an explicit :meth:`flush`) merges the buffered
+  counts into the tables with ONE ``UPDATE ... FROM (VALUES ...)`` per
+  memory kind per chunk.
+- Reinforcement jobs (``reinforce_frequently_accessed``,
+  ``reinforce_frequently_recalled``) flush first on their own session so
+  the thresholds they compare against include buffered reads.
+
+Counts are best-effort telemetry feeding reinforcement heuristics, not
+accounting: a crash loses at most one flush interval of increments, and a
+failed flush re-queues its batch (bounded by ``max_pending``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal
+from uuid import UUID
+
+from sqlalchemy import DateTime, Integer, column, func, update, values
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from empla.models.memory import EpisodicMemory, SemanticMemory
+from empla.models.memory import WorkingMemory as WorkingMemoryModel
+
+logger = logging.getLogger(__name__)
+
+AccessKind = Literal["episodic", "semantic", "working"]
+
+# Rows per UPDATE statement. Keeps each statement's lock footprint and
+# bind-parameter count bounded (3 params/row, asyncpg caps at 32767).
+FLUSH_CHUNK_SIZE = 1000
+
+
+@dataclass
+class _PendingAccess:
+    """Buffered accesses for one memory row."""
+
+    count: int
+    last_at: datetime
+
+
+class MemoryAccessTracker:
+    """
+    In-process buffer of memory reads, flushed in bulk.
+
+    One tracker is shared by an employee's memory systems. It is not
+    thread-safe; all calls must come from the owning event loop (which is
+    the case for the BDI loop and runner).
+
+    Example:
+        >>> tracker = MemoryAccessTracker(sessionmaker, flush_interval_seconds=30)
+        >>> semantic = SemanticMemorySystem(session, employee_id, tenant_id, tracker)
+        >>> tracker.start()
+        >>> facts = await semantic.query_facts(subject="Acme Corp")  # no write
+        >>> await tracker.stop()  # final flush
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession] | None = None,
+        flush_interval_seconds: float = 30.0,
+        max_pending: int = 50_000,
+    ) -> None:
+        """
+        Initialize MemoryAccessTracker.
+
+        Args:
+            sessionmaker: Session factory for background flushes. Without one,
+                the tracker only flushes when handed a session explicitly.
+            flush_interval_seconds: Seconds between background flushes
+            max_pending: Maximum distinct rows buffered. New rows beyond this
+                are dropped (and counted) rather than growing without bound
+                while the database is unreachable.
+        """
+        self._sessionmaker = sessionmaker
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self._pending: dict[AccessKind, dict[UUID, _PendingAccess]] = {
+            "episodic": {},
+            "semantic": {},
+            "working": {},
+        }
+        self._task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+
+        # Counters for observability
+        self.recorded = 0
+        self.flushed_rows = 0
+        self.dropped = 0
+        self.flush_failures = 0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @property
+    def pending_count(self) -> int:
+        """Number of distinct rows with unflushed accesses."""
+        return sum(len(rows) for rows in self._pending.values())
+
+    def record(
+        self,
+        kind: AccessKind,
+        memory_id: UUID,
+        accessed_at: datetime | None = None,
+    ) -> None:
+        """Record a single read of a memory row. Never touches the database."""
+        self.record_many(kind, [memory_id], accessed_at)
+
+    def record_many(
+        self,
+        kind: AccessKind,
+        memory_ids: list[UUID],
+        accessed_at: datetime | None = None,
+    ) -> None:
+        """Record reads of several memory rows at the same timestamp."""
+        if not memory_ids:
+            return
+        now = accessed_at or datetime.now(UTC)
+        bucket = self._pending[kind]
+        for memory_id in memory_ids:
+            entry = bucket.get(memory_id)
+            if entry is not None:
+                entry.count += 1
+                entry.last_at = max(entry.last_at, now)
+            elif self.pending_count >= self.max_pending:
+                self.dropped += 1
+                continue
+            else:
+                bucket[memory_id] = _PendingAccess(count=1, last_at=now)
+            self.recorded += 1
+
+    def pending_for(self, kind: AccessKind, memory_id: UUID) -> int:
+        """Unflushed access count for a row (0 if none)."""
+        entry = self._pending[kind].get(memory_id)
+        return entry.count if entry else 0
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    async def flush(self, session: AsyncSession | None = None) -> int:
+        """
+        Merge buffered accesses into the database.
+
+        Args:
+            session: Session to write on. The caller owns the transaction
+                (commit/rollback). When None, a short-lived session is
+                opened from the sessionmaker and committed here.
+
+        Returns:
+            Number of rows updated (0 when nothing was pending)
+
+        Raises:
+            Exception: Database errors propagate after the batch is re-queued.
+        """
+        async with self._flush_lock:
+            batch = self._swap()
+            if not any(batch.values()):
+                return 0
+
+            try:
+                if session is not None:
+                    updated = await self._apply(session, batch)
+                elif self._sessionmaker is not None:
+                    async with self._sessionmaker() as own_session:
+                        updated = await self._apply(own_session, batch)
+                        await own_session.commit()
+                else:
+                    # Nowhere to write — keep buffering.
+                    self._requeue(batch)
+                    return 0
+            except Exception:
+                self.flush_failures += 1
+                self._requeue(batch)
+                raise
+
+            self.flushed_rows += updated
+            return updated
+
+    def _swap(self) -> dict[AccessKind, dict[UUID, _PendingAccess]]:
+        """Detach the current buffer so reads during a flush land in a fresh one."""
+        batch = self._pending
+        self._pending = {"episodic": {}, "semantic": {}, "working": {}}
+        return batch
+
+    def _requeue(self, batch: dict[AccessKind, dict[UUID, _PendingAccess]]) -> None:
+        """Merge a failed batch back into the live buffer."""
+        for kind, rows in batch.items():
+            for memory_id, entry in rows.items():
+                live = self._pending[kind].get(memory_id)
+                if live is not None:
+                    live.count += entry.count
+                    live.last_at = max(live.last_at, entry.last_at)
+                elif self.pending_count >= self.max_pending:
+                    self.dropped += entry.count
+                else:
+                    self._pending[kind][memory_id] = entry
+
+    async def _apply(
+        self,
+        session: AsyncSession,
+        batch: dict[AccessKind, dict[UUID, _PendingAccess]],
+    ) -> int:
+        updated = 0
+        for kind, rows in batch.items():
+            items = list(rows.items())
+            for start in range(0, len(items), FLUSH_CHUNK_SIZE):
+                stmt = build_access_update(kind, items[start : start + FLUSH_CHUNK_SIZE])
+                result = await session.execute(stmt)
+                updated += result.rowcount or 0
+        return updated
+
+    # ------------------------------------------------------------------
+    # Background flush
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the periodic background flush task (idempotent)."""
+        if self._task is not None and not self._task.done():
+            return
+        if self._sessionmaker is None:
+            logger.warning("Memory access tracker has no sessionmaker; background flush disabled")
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and flush whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.warning(
+                "Final memory access flush failed; %d rows of access counts lost",
+                self.pending_count,
+                exc_info=True,
+            )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                updated = await self.flush()
+                if updated:
+                    logger.debug("Flushed access counts for %d memory rows", updated)
+            except Exception:
+                logger.warning(
+                    "Memory access flush failed; %d rows re-queued",
+                    self.pending_count,
+                    exc_info=True,
+                )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Counters for health endpoints and tests."""
+        return {
+            "pending": self.pending_count,
+            "recorded": self.recorded,
+            "flushed_rows": self.flushed_rows,
+            "dropped": self.dropped,
+            "flush_failures": self.flush_failures,
+        }
+
+
+def build_access_update(
+    kind: AccessKind,
+    rows: list[tuple[UUID, _PendingAccess]],
+) -> Any:
+    """
+    Build one ``UPDATE ... FROM (VALUES ...)`` merging buffered counts.
+
+    ``last_*_at`` only moves forward — GREATEST guards against an older
+    buffered timestamp overwriting a newer one written by another process.
+    """
+    data = [(memory_id, entry.count, entry.last_at) for memory_id, entry in rows]
+    batch = values(
+        column("id", PGUUID(as_uuid=True)),
+        column("n", Integer),
+        column("ts", DateTime(timezone=True)),
+        name="access_batch",
+    ).data(data)
+
+    if kind == "episodic":
+        return (
+            update(EpisodicMemory)
+            .where(EpisodicMemory.id == batch.c.id)
+            .values(
+                recall_count=EpisodicMemory.recall_count + batch.c.n,
+                last_recalled_at=func.greatest(
+                    func.coalesce(EpisodicMemory.last_recalled_at, batch.c.ts), batch.c.ts
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    model: type[SemanticMemory] | type[WorkingMemoryModel] = (
+        SemanticMemory if kind == "semantic" else WorkingMemoryModel
+    )
+    return (
+        update(model)
+        .where(model.id == batch.c.id)
+        .values(
+            access_count=model.access_count + batch.c.n,
+            last_accessed_at=func.greatest(
+                func.coalesce(model.last_accessed_at, batch.c.ts), batch.c.ts
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
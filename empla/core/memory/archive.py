@@ -0,0 +1,453 @@
+"""
+empla.core.memory.archive - Cold-Tier History Archive
+
+``memory_episodes`` and ``belief_history`` are range-partitioned by month
+(see ``empla.core.memory.partitions``). Once a month falls out of the hot
+window, its partition is detached, exported here as a zstd-compressed
+Parquet file, and dropped from Postgres. Vacuum and index maintenance
+then only pay for the hot months.
+
+Layout on local disk::
+
+    <root>/manifest.json
+    <root>/memory_episodes/2026-01.parquet
+    <root>/belief_history/2026-01.parquet
+
+The manifest is the source of truth for what is archived; a Parquet file
+without a manifest entry (e.g. an interrupted export) is ignored.
+
+Read path: ``EpisodicMemorySystem.recall_recent`` and
+``BeliefSystem.get_belief_history`` consult :meth:`HistoryArchive.read`
+only when the request reaches past the hot window and the hot tables did
+not already satisfy the limit, so the common case never touches disk.
+
+Requires the optional ``pyarrow`` dependency (``pip install empla[archive]``)
+for export and reads. Without it, :attr:`HistoryArchive.available` is
+False and the read path is skipped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+ColumnKind = Literal["uuid", "str", "json", "float", "int", "ts", "str_list", "vector"]
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass(frozen=True)
+class ArchivedTable:
+    """
+    Column layout of a partitioned history table, for export and reads.
+
+    Attributes:
+        name: Postgres table name (also the archive subdirectory)
+        time_column: Partition key column
+        columns: (name, kind) pairs in export order
+        extra_columns: Denormalized columns written at export time that
+            are not on the ORM model
+    """
+
+    name: str
+    time_column: str
+    columns: tuple[tuple[str, ColumnKind], ...]
+    extra_columns: tuple[str, ...] = ()
+
+    @property
+    def column_names(self) -> list[str]:
+        return [name for name, _ in self.columns]
+
+    @property
+    def model_columns(self) -> list[str]:
+        return [name for name, _ in self.columns if name not in self.extra_columns]
+
+
+_BASE_COLUMNS: tuple[tuple[str, ColumnKind], ...] = (
+    ("id", "uuid"),
+    ("tenant_id", "uuid"),
+    ("employee_id", "uuid"),
+)
+
+_TIMESTAMP_COLUMNS: tuple[tuple[str, ColumnKind], ...] = (
+    ("created_at", "ts"),
+    ("updated_at", "ts"),
+    ("deleted_at", "ts"),
+)
+
+EPISODES_TABLE = ArchivedTable(
+    name="memory_episodes",
+    time_column="occurred_at",
+    columns=(
+        *_BASE_COLUMNS,
+        ("episode_type", "str"),
+        ("description", "str"),
+        ("content", "json"),
+        ("participants", "str_list"),
+        ("location", "str"),
+        ("embedding", "vector"),
+        ("importance", "float"),
+        ("recall_count", "int"),
+        ("last_recalled_at", "ts"),
+        ("occurred_at", "ts"),
+        *_TIMESTAMP_COLUMNS,
+    ),
+)
+
+# belief_history rows only carry belief_id. get_belief_history filters by
+# the belief's subject/predicate, and the beliefs row may be gone by the
+# time anyone reads the archive — so both are denormalized at export.
+BELIEF_HISTORY_TABLE = ArchivedTable(
+    name="belief_history",
+    time_column="changed_at",
+    columns=(
+        *_BASE_COLUMNS,
+        ("belief_id", "uuid"),
+        ("change_type", "str"),
+        ("old_value", "json"),
+        ("new_value", "json"),
+        ("old_confidence", "float"),
+        ("new_confidence", "float"),
+        ("reason", "str"),
+        ("changed_at", "ts"),
+        *_TIMESTAMP_COLUMNS,
+        ("belief_subject", "str"),
+        ("belief_predicate", "str"),
+    ),
+    extra_columns=("belief_subject", "belief_predicate"),
+)
+
+ARCHIVED_TABLES: dict[str, ArchivedTable] = {
+    t.name: t for t in (EPISODES_TABLE, BELIEF_HISTORY_TABLE)
+}
+
+
+def month_key(month: datetime) -> str:
+    """``YYYY-MM`` key used for file names and the manifest."""
+    return f"{month.year:04d}-{month.month:02d}"
+
+
+def _parse_month_key(key: str) -> datetime:
+    year, month = key.split("-")
+    return datetime(int(year), int(month), 1, tzinfo=UTC)
+
+
+def _next_month(month: datetime) -> datetime:
+    if month.month == 12:
+        return month.replace(year=month.year + 1, month=1)
+    return month.replace(month=month.month + 1)
+
+
+def _import_pyarrow() -> tuple[Any, Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError(
+            "History archive requires pyarrow. Install with: pip install empla[archive]"
+        ) from e
+    return pa, pc, pq
+
+
+def _arrow_schema(table: ArchivedTable) -> Any:
+    pa, _, _ = _import_pyarrow()
+    types = {
+        "uuid": pa.string(),
+        "str": pa.string(),
+        "json": pa.string(),
+        "float": pa.float64(),
+        "int": pa.int64(),
+        "ts": pa.timestamp("us", tz="UTC"),
+        "str_list": pa.list_(pa.string()),
+        "vector": pa.list_(pa.float32()),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in table.columns])
+
+
+def _encode(kind: ColumnKind, value: Any) -> Any:
+    """Python/DB value -> Arrow-friendly value."""
+    if value is None:
+        return None
+    if kind == "uuid":
+        return str(value)
+    if kind == "json":
+        # Export casts JSONB to text; accept already-decoded values too.
+        return value if isinstance(value, str) else json.dumps(value, default=str)
+    if kind == "vector":
+        # Export casts vector to text ('[0.1,0.2,...]'), which is valid JSON.
+        return json.loads(value) if isinstance(value, str) else [float(v) for v in value]
+    if kind == "ts" and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def _decode(kind: ColumnKind, value: Any) -> Any:
+    """Arrow value -> the Python value the ORM column would hold."""
+    if value is None:
+        return None
+    if kind == "uuid":
+        return UUID(value)
+    if kind == "json":
+        return json.loads(value)
+    return value
+
+
+@dataclass
+class ArchivedMonth:
+    """Manifest entry for one exported partition."""
+
+    table: str
+    month: datetime
+    path: Path
+    rows: int
+    archived_at: datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "table": self.table,
+            "month": month_key(self.month),
+            "path": str(self.path),
+            "rows": self.rows,
+            "archived_at": self.archived_at.isoformat(),
+        }
+
+
+class ArchiveWriter:
+    """
+    Streams one partition into a Parquet file.
+
+    Rows go to a temp file; :meth:`commit` renames it into place and only
+    then records the month in the manifest, so a crash mid-export leaves no
+    visible archive entry.
+    """
+
+    def __init__(self, archive: HistoryArchive, table: ArchivedTable, month: datetime) -> None:
+        pa, _, pq = _import_pyarrow()
+        self._pa = pa
+        self._archive = archive
+        self._table = table
+        self._month = month
+        self._schema = _arrow_schema(table)
+        self.path = archive.path_for(table.name, month)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = self.path.with_suffix(".parquet.tmp")
+        self._writer = pq.ParquetWriter(self._tmp_path, self._schema, compression="zstd")
+        self.rows = 0
+
+    def write_batch(self, rows: list[dict[str, Any]]) -> None:
+        """Append a batch of DB rows (column name -> value)."""
+        if not rows:
+            return
+        columns = {
+            name: [_encode(kind, row.get(name)) for row in rows]
+            for name, kind in self._table.columns
+        }
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+        self.rows += len(rows)
+
+    def commit(self) -> ArchivedMonth:
+        """Finalize the file and publish it in the manifest."""
+        self._writer.close()
+        self._tmp_path.replace(self.path)
+        entry = ArchivedMonth(
+            table=self._table.name,
+            month=self._month,
+            path=self.path,
+            rows=self.rows,
+            archived_at=datetime.now(UTC),
+        )
+        self._archive._record(entry)
+        return entry
+
+    def abort(self) -> None:
+        """Discard the partial file."""
+        try:
+            self._writer.close()
+        finally:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+class HistoryArchive:
+    """
+    Local-disk Parquet archive of detached history partitions.
+
+    Example:
+        >>> archive = HistoryArchive("/var/lib/empla/history")
+        >>> archive.hot_start("memory_episodes")
+        datetime.datetime(2026, 5, 1, 0, 0, tzinfo=datetime.timezone.utc)
+        >>> rows = await archive.read(
+        ...     "memory_episodes",
+        ...     since=datetime(2026, 1, 1, tzinfo=UTC),
+        ...     equals={"employee_id": employee_id},
+        ...     limit=50,
+        ... )
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._manifest_path = self.root / MANIFEST_NAME
+
+    @property
+    def available(self) -> bool:
+        """True when pyarrow is importable (reads and exports can run)."""
+        try:
+            _import_pyarrow()
+        except RuntimeError:
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self) -> dict[str, dict[str, dict[str, Any]]]:
+        try:
+            data = json.loads(self._manifest_path.read_text())
+        except FileNotFoundError:
+            return {}
+        return data.get("tables", {})
+
+    def _record(self, entry: ArchivedMonth) -> None:
+        tables = self._load_manifest()
+        tables.setdefault(entry.table, {})[month_key(entry.month)] = {
+            "file": str(entry.path.relative_to(self.root)),
+            "rows": entry.rows,
+            "archived_at": entry.archived_at.isoformat(),
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self._manifest_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"tables": tables}, indent=2, sort_keys=True))
+        tmp.replace(self._manifest_path)
+
+    def path_for(self, table: str, month: datetime) -> Path:
+        return self.root / table / f"{month_key(month)}.parquet"
+
+    def archived_months(self, table: str) -> list[datetime]:
+        """Archived month starts for a table, oldest first."""
+        return sorted(_parse_month_key(key) for key in self._load_manifest().get(table, {}))
+
+    def hot_start(self, table: str) -> datetime | None:
+        """
+        Start of the hot window: the month after the newest archived month.
+
+        None when nothing is archived (all history is still in Postgres).
+        """
+        months = self.archived_months(table)
+        return _next_month(months[-1]) if months else None
+
+    def reaches_archive(self, table: str, since: datetime | None) -> bool:
+        """Whether a query for rows at/after ``since`` (None = all time) needs the archive."""
+        hot_start = self.hot_start(table)
+        if hot_start is None or not self.available:
+            return False
+        return since is None or since < hot_start
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def writer(self, table: str, month: datetime) -> ArchiveWriter:
+        """Open a writer for one month of ``table``."""
+        return ArchiveWriter(self, ARCHIVED_TABLES[table], month)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def read(
+        self,
+        table: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        equals: dict[str, Any] | None = None,
+        include_deleted: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Read archived rows, newest first.
+
+        Months are scanned newest to oldest and scanning stops once
+        ``limit`` rows are collected. Filters are pushed down into the
+        Parquet reader.
+
+        Args:
+            table: Archived table name
+            since: Inclusive lower bound on the partition column
+            until: Exclusive upper bound on the partition column
+            equals: Column -> value equality filters
+            include_deleted: Include soft-deleted rows
+            limit: Maximum rows to return
+
+        Returns:
+            Rows as dicts with UUID/JSON columns decoded
+        """
+        return await asyncio.to_thread(
+            self._read_sync,
+            table,
+            since=since,
+            until=until,
+            equals=equals or {},
+            include_deleted=include_deleted,
+            limit=limit,
+        )
+
+    def _read_sync(
+        self,
+        table_name: str,
+        *,
+        since: datetime | None,
+        until: datetime | None,
+        equals: dict[str, Any],
+        include_deleted: bool,
+        limit: int | None,
+    ) -> list[dict[str, Any]]:
+        pa, pc, pq = _import_pyarrow()
+        table = ARCHIVED_TABLES[table_name]
+        kinds = dict(table.columns)
+        ts_type = pa.timestamp("us", tz="UTC")
+
+        expr = None
+
+        def _and(e: Any) -> None:
+            nonlocal expr
+            expr = e if expr is None else expr & e
+
+        for column, value in equals.items():
+            _and(pc.field(column) == (str(value) if kinds[column] == "uuid" else value))
+        if since is not None:
+            _and(pc.field(table.time_column) >= pa.scalar(since, type=ts_type))
+        if until is not None:
+            _and(pc.field(table.time_column) < pa.scalar(until, type=ts_type))
+        if not include_deleted:
+            _and(pc.field("deleted_at").is_null())
+
+        rows: list[dict[str, Any]] = []
+        for month in reversed(self.archived_months(table_name)):
+            if until is not None and month >= until:
+                continue
+            if since is not None and _next_month(month) <= since:
+                break
+            path = self.path_for(table_name, month)
+            if not path.exists():
+                logger.warning("Archived partition missing on disk: %s", path)
+                continue
+
+            arrow = pq.read_table(path, filters=expr)
+            if arrow.num_rows == 0:
+                continue
+            arrow = arrow.sort_by([(table.time_column, "descending")])
+            for row in arrow.to_pylist():
+                rows.append({name: _decode(kinds[name], row[name]) for name in row})
+                if limit is not None and len(rows) >= limit:
+                    return rows
+        return rows
@@ -0,0 +1,475 @@
+"""
+empla.core.memory.context - Budgeted Prompt Context Assembly
+
+Perception, strategic planning and goal evaluation each used to build
+their own prompt context with sequential awaits on the shared loop
+session: ``get_all_beliefs``, then one ``query_facts(subject=...)`` per
+belief subject, then ``recall_recent`` for the latest reflection. None of
+it was bounded by size, and the same rows were re-read by every phase.
+
+:class:`ContextAssembler` replaces that with one pass per cycle:
+
+- **Concurrent sources**: beliefs, entity facts, recent episodes and
+  playbooks are fetched in parallel, each on its own short-lived session
+  (an ``AsyncSession`` cannot multiplex queries). Facts depend on the
+  belief subjects, so they start as soon as beliefs land while episodes
+  and playbooks are still in flight.
+- **One fact query**: per-subject lookups become a single
+  ``subject = ANY(:subjects)`` query with a per-subject ``row_number()``
+  cap.
+- **Salience + budget**: every item gets a salience score; items are
+  deduplicated (a belief and its promoted semantic fact share a
+  subject/predicate) and packed greedily by salience into a token budget.
+- **Pinned reflection**: the latest deep reflection is fetched on its
+  own, outside the recent-episode cut, and packed ahead of everything
+  else. Reflections are rare and every cycle writes several episodes, so
+  otherwise it would drop out of the prompt within a few cycles.
+
+The result is an :class:`AssembledContext` that callers render by
+section. The loop caches it for the cycle (see
+``empla.core.loop.context.CycleContextMixin``).
+
+Token counts are an estimate (~4 characters per token), which is what
+the budget needs: a stable, provider-independent bound on prompt growth.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Literal
+from uuid import UUID
+
+from sqlalchemy import String, any_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from empla.models.belief import Belief
+from empla.models.memory import EpisodicMemory, ProceduralMemory, SemanticMemory
+
+logger = logging.getLogger(__name__)
+
+ContextKind = Literal["beliefs", "facts", "episodes", "playbooks"]
+
+# Render order and section headers.
+SECTION_TITLES: dict[ContextKind, str] = {
+    "beliefs": "Current beliefs",
+    "facts": "Known entity facts",
+    "episodes": "Recent experience",
+    "playbooks": "Proven playbooks",
+}
+
+# Relative weight of each source when ranking against the others. Beliefs
+# are the live world model; facts are background; playbooks only matter
+# when planning, so they yield to everything else under a tight budget.
+KIND_WEIGHTS: dict[ContextKind, float] = {
+    "beliefs": 1.0,
+    "facts": 0.8,
+    "episodes": 0.9,
+    "playbooks": 0.6,
+}
+
+DEFAULT_TOKEN_BUDGET = 1500
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token, minimum 1)."""
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+@dataclass
+class ContextItem:
+    """One line of assembled context."""
+
+    kind: ContextKind
+    key: tuple[str, ...]
+    text: str
+    salience: float
+    tokens: int = 0
+    pinned: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.tokens:
+            self.tokens = estimate_tokens(self.text)
+
+
+@dataclass
+class AssembledContext:
+    """Deduplicated, budgeted context items plus assembly diagnostics."""
+
+    items: list[ContextItem] = field(default_factory=list)
+    token_budget: int = DEFAULT_TOKEN_BUDGET
+    dropped: int = 0
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    failed_sources: list[str] = field(default_factory=list)
+    assembled_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def used_tokens(self) -> int:
+        return sum(item.tokens for item in self.items)
+
+    def section(self, kind: ContextKind) -> list[ContextItem]:
+        """Items of one kind, most salient first."""
+        return [item for item in self.items if item.kind == kind]
+
+    def render(self, kinds: Iterable[ContextKind] | None = None, *, headers: bool = True) -> str:
+        """
+        Render selected sections as prompt text.
+
+        Args:
+            kinds: Sections to include (default: all, in canonical order)
+            headers: Prefix each non-empty section with its title
+
+        Returns:
+            Section text joined by blank lines; empty string if nothing fits
+        """
+        wanted = set(kinds) if kinds is not None else set(SECTION_TITLES)
+        blocks = []
+        for kind, title in SECTION_TITLES.items():
+            if kind not in wanted:
+                continue
+            lines = [item.text for item in self.section(kind)]
+            if not lines:
+                continue
+            body = "\n".join(lines)
+            blocks.append(f"{title}:\n{body}" if headers else body)
+        return "\n\n".join(blocks)
+
+    def to_dict(self) -> dict[str, Any]:
+        counts: dict[str, int] = {}
+        for item in self.items:
+            counts[item.kind] = counts.get(item.kind, 0) + 1
+        return {
+            "items": counts,
+            "used_tokens": self.used_tokens,
+            "token_budget": self.token_budget,
+            "dropped": self.dropped,
+            "timings_ms": {k: round(v, 2) for k, v in self.timings_ms.items()},
+            "failed_sources": self.failed_sources,
+        }
+
+
+def pack(items: list[ContextItem], token_budget: int) -> tuple[list[ContextItem], int]:
+    """
+    Deduplicate by key and greedily pack the most salient items into the budget.
+
+    An item that doesn't fit is skipped rather than ending the pass, so a
+    long low-value line can't starve shorter ones behind it. Pinned items
+    win their duplicates, go first and are always kept; their tokens still
+    count against the budget.
+
+    Returns:
+        (kept items, pinned first, then by salience; number of items dropped)
+    """
+    best: dict[tuple[str, ...], ContextItem] = {}
+    for item in items:
+        current = best.get(item.key)
+        if current is None or (item.pinned, item.salience) > (current.pinned, current.salience):
+            best[item.key] = item
+
+    kept: list[ContextItem] = []
+    used = 0
+    for item in sorted(best.values(), key=lambda i: (i.pinned, i.salience), reverse=True):
+        if not item.pinned and used + item.tokens > token_budget:
+            continue
+        kept.append(item)
+        used += item.tokens
+    return kept, len(items) - len(kept)
+
+
+def _spo_key(subject: str, predicate: str) -> tuple[str, ...]:
+    return ("spo", subject.strip().lower(), predicate.strip().lower())
+
+
+class ContextAssembler:
+    """
+    Builds a budgeted prompt context from beliefs and memory in one pass.
+
+    Like :class:`~empla.core.memory.hybrid.HybridMemoryRetriever`, it takes a
+    sessionmaker rather than a session so each source can run on its own
+    connection, and it is read-only (no access or recall counters).
+
+    Example:
+        >>> assembler = ContextAssembler(sessionmaker, employee_id, tenant_id)
+        >>> context = await assembler.assemble(token_budget=1200)
+        >>> print(context.render(["facts", "episodes"]))
+        >>> context.to_dict()
+        {"items": {"beliefs": 18, "facts": 9, ...}, "used_tokens": 1184, ...}
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        employee_id: UUID,
+        tenant_id: UUID,
+        *,
+        min_belief_confidence: float = 0.5,
+        max_beliefs: int = 30,
+        max_subjects: int = 10,
+        facts_per_subject: int = 3,
+        episode_days: int = 7,
+        max_episodes: int = 10,
+        episode_half_life_days: float = 3.0,
+        max_playbooks: int = 5,
+    ) -> None:
+        """
+        Initialize ContextAssembler.
+
+        Args:
+            sessionmaker: Async session factory; one session is opened per source
+            employee_id: Employee whose context is assembled
+            tenant_id: Tenant ID for multi-tenancy
+            min_belief_confidence: Beliefs below this confidence are ignored
+            max_beliefs: Most-confident beliefs considered
+            max_subjects: Distinct belief subjects to look up facts for
+            facts_per_subject: Facts kept per subject (highest confidence)
+            episode_days: How far back to consider episodes
+            max_episodes: Most recent episodes considered (the latest deep
+                reflection in the window is always added, pinned)
+            episode_half_life_days: Recency half-life for episode salience
+            max_playbooks: Highest-success playbooks considered
+        """
+        self._sessionmaker = sessionmaker
+        self.employee_id = employee_id
+        self.tenant_id = tenant_id
+        self.min_belief_confidence = min_belief_confidence
+        self.max_beliefs = max_beliefs
+        self.max_subjects = max_subjects
+        self.facts_per_subject = facts_per_subject
+        self.episode_days = episode_days
+        self.max_episodes = max_episodes
+        self.episode_half_life_days = episode_half_life_days
+        self.max_playbooks = max_playbooks
+
+    async def assemble(self, token_budget: int = DEFAULT_TOKEN_BUDGET) -> AssembledContext:
+        """
+        Fetch all sources concurrently and pack them into ``token_budget``.
+
+        A failing source is logged and reported in ``failed_sources``; the
+        rest of the context is still returned.
+        """
+        context = AssembledContext(token_budget=token_budget)
+        start = time.perf_counter()
+        now = datetime.now(UTC)
+
+        async def beliefs_then_facts() -> list[ContextItem]:
+            belief_items, subjects = await self._timed(
+                "beliefs", context, self._fetch_beliefs, default=([], [])
+            )
+            fact_items: list[ContextItem] = []
+            if subjects:
+                fact_items = await self._timed(
+                    "facts", context, lambda: self._fetch_facts(subjects), default=[]
+                )
+            return belief_items + fact_items
+
+        results = await asyncio.gather(
+            beliefs_then_facts(),
+            self._timed("episodes", context, lambda: self._fetch_episodes(now), default=[]),
+            self._timed("playbooks", context, self._fetch_playbooks, default=[]),
+        )
+
+        candidates = [item for batch in results for item in batch]
+        context.items, context.dropped = pack(candidates, token_budget)
+        context.timings_ms["total"] = (time.perf_counter() - start) * 1000
+
+        logger.debug(
+            "Context assembled",
+            extra={"employee_id": str(self.employee_id), **context.to_dict()},
+        )
+        return context
+
+    async def _timed(
+        self,
+        name: str,
+        context: AssembledContext,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        default: Any,
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return await fetch()
+        except Exception:
+            context.failed_sources.append(name)
+            logger.warning(
+                "Context source %s failed",
+                name,
+                exc_info=True,
+                extra={"employee_id": str(self.employee_id)},
+            )
+            return default
+        finally:
+            context.timings_ms[name] = (time.perf_counter() - start) * 1000
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    async def _fetch_beliefs(self) -> tuple[list[ContextItem], list[str]]:
+        """Most-confident beliefs, plus the distinct subjects to look up facts for."""
+        stmt = (
+            select(Belief.subject, Belief.predicate, Belief.object, Belief.confidence)
+            .where(
+                Belief.employee_id == self.employee_id,
+                Belief.tenant_id == self.tenant_id,
+                Belief.confidence >= self.min_belief_confidence,
+                Belief.deleted_at.is_(None),
+            )
+            .order_by(Belief.confidence.desc(), Belief.last_updated_at.desc())
+            .limit(self.max_beliefs)
+        )
+        async with self._sessionmaker() as session:
+            rows = (await session.execute(stmt)).all()
+
+        items = []
+        subjects: list[str] = []
+        for row in rows:
+            items.append(
+                ContextItem(
+                    kind="beliefs",
+                    key=_spo_key(row.subject, row.predicate),
+                    text=(
+                        f"- {row.subject} → {row.predicate}: {row.object} "
+                        f"(confidence: {row.confidence:.2f})"
+                    ),
+                    salience=KIND_WEIGHTS["beliefs"] * row.confidence,
+                )
+            )
+            if row.subject and row.subject not in subjects and len(subjects) < self.max_subjects:
+                subjects.append(row.subject)
+        return items, subjects
+
+    def facts_statement(self, subjects: list[str]) -> Any:
+        """Top ``facts_per_subject`` facts for every subject in one query."""
+        ranked = (
+            select(
+                SemanticMemory.subject,
+                SemanticMemory.predicate,
+                SemanticMemory.object,
+                SemanticMemory.confidence,
+                func.row_number()
+                .over(
+                    partition_by=SemanticMemory.subject,
+                    order_by=SemanticMemory.confidence.desc(),
+                )
+                .label("subject_rank"),
+            )
+            .where(
+                SemanticMemory.employee_id == self.employee_id,
+                SemanticMemory.tenant_id == self.tenant_id,
+                SemanticMemory.deleted_at.is_(None),
+                SemanticMemory.subject
+                == any_(bindparam("subjects", subjects, type_=ARRAY(String))),
+            )
+            .subquery("ranked_facts")
+        )
+        return (
+            select(ranked.c.subject, ranked.c.predicate, ranked.c.object, ranked.c.confidence)
+            .where(ranked.c.subject_rank <= self.facts_per_subject)
+            .order_by(ranked.c.confidence.desc())
+        )
+
+    async def _fetch_facts(self, subjects: list[str]) -> list[ContextItem]:
+        async with self._sessionmaker() as session:
+            rows = (await session.execute(self.facts_statement(subjects))).all()
+        return [
+            ContextItem(
+                kind="facts",
+                key=_spo_key(row.subject, row.predicate),
+                text=f"- {row.subject} → {row.predicate}: {row.object}",
+                salience=KIND_WEIGHTS["facts"] * row.confidence,
+            )
+            for row in rows
+        ]
+
+    async def _fetch_episodes(self, now: datetime) -> list[ContextItem]:
+        stmt = (
+            select(
+                EpisodicMemory.episode_type,
+                EpisodicMemory.description,
+                EpisodicMemory.importance,
+                EpisodicMemory.occurred_at,
+            )
+            .where(
+                EpisodicMemory.employee_id == self.employee_id,
+                EpisodicMemory.tenant_id == self.tenant_id,
+                EpisodicMemory.occurred_at >= now - timedelta(days=self.episode_days),
+                EpisodicMemory.deleted_at.is_(None),
+            )
+            .order_by(EpisodicMemory.occurred_at.desc())
+        )
+        # The latest deep reflection is read separately: a handful of
+        # cycles' episodes would push it out of the recent ones.
+        reflection_stmt = stmt.where(EpisodicMemory.episode_type == "deep_reflection").limit(1)
+        async with self._sessionmaker() as session:
+            rows = (await session.execute(stmt.limit(self.max_episodes))).all()
+            reflections = (await session.execute(reflection_stmt)).all()
+
+        items = [self._episode_item(row, now) for row in rows]
+        items.extend(self._episode_item(row, now, pinned=True) for row in reflections)
+        return items
+
+    def _episode_item(self, row: Any, now: datetime, *, pinned: bool = False) -> ContextItem:
+        age_days = max(0.0, (now - row.occurred_at).total_seconds() / 86400)
+        recency = 0.5 ** (age_days / self.episode_half_life_days)
+        importance = row.importance
+        # Deep reflections are the employee's own synthesis of recent
+        # work — always worth more than any single raw episode.
+        if row.episode_type == "deep_reflection":
+            importance = max(importance, 1.0)
+        description = " ".join(row.description.split())[:300]
+        return ContextItem(
+            kind="episodes",
+            key=("episode", description.lower()),
+            text=f"- [{row.episode_type}] {description}",
+            salience=KIND_WEIGHTS["episodes"] * importance * recency,
+            pinned=pinned,
+        )
+
+    async def _fetch_playbooks(self) -> list[ContextItem]:
+        stmt = (
+            select(
+                ProceduralMemory.name,
+                ProceduralMemory.steps,
+                ProceduralMemory.success_rate,
+                ProceduralMemory.execution_count,
+            )
+            .where(
+                ProceduralMemory.employee_id == self.employee_id,
+                ProceduralMemory.tenant_id == self.tenant_id,
+                ProceduralMemory.is_playbook.is_(True),
+                ProceduralMemory.enabled.is_(True),
+                ProceduralMemory.deleted_at.is_(None),
+            )
+            .order_by(ProceduralMemory.success_rate.desc())
+            .limit(self.max_playbooks)
+        )
+        async with self._sessionmaker() as session:
+            rows = (await session.execute(stmt)).all()
+
+        items = []
+        for row in rows:
+            steps = ", ".join(
+                str(s.get("action", s.get("step", "?"))) if isinstance(s, dict) else str(s)
+                for s in (row.steps or [])
+            )
+            rate = row.success_rate or 0.0
+            items.append(
+                ContextItem(
+                    kind="playbooks",
+                    key=("playbook", row.name.lower()),
+                    text=(
+                        f"- {row.name}: [{steps}] "
+                        f"(success_rate={rate:.0%}, used {row.execution_count or 0} times)"
+                    ),
+                    salience=KIND_WEIGHTS["playbooks"] * rate,
+                )
+            )
+        return items
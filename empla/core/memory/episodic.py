@@ -15,15 +15,22 @@ Key characteristics:
 - Decay over time (unless reinforced by recall)
 """
 
+from __future__ import annotations
+
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from empla.core.memory import maintenance
 from empla.models.memory import EpisodicMemory
 
+if TYPE_CHECKING:
+    from empla.core.memory.access import MemoryAccessTracker
+    from empla.core.memory.archive import HistoryArchive
+
 
 class EpisodicMemorySystem:
     """
@@ -48,6 +55,8 @@ class EpisodicMemorySystem:
         session: AsyncSession,
         employee_id: UUID,
         tenant_id: UUID,
+        access_tracker: MemoryAccessTracker | None = None,
+        archive: HistoryArchive | None = None,
     ) -> None:
         """
         Initialize EpisodicMemorySystem.
@@ -56,10 +65,17 @@ class EpisodicMemorySystem:
             session: SQLAlchemy async session
             employee_id: Employee this memory belongs to
             tenant_id: Tenant ID for multi-tenancy
+            access_tracker: Optional batched access tracker. When set, recalls
+                record accesses in memory instead of updating rows inline.
+            archive: Optional cold-tier archive. When set, ``recall_recent``
+                windows that reach past the hot partitions also read
+                archived months.
         """
         self.session = session
         self.employee_id = employee_id
         self.tenant_id = tenant_id
+        self.access_tracker = access_tracker
+        self.archive = archive
 
     async def record_episode(
         self,
@@ -176,8 +192,13 @@ class EpisodicMemorySystem:
 
         memories = list(result.scalars().all())
 
-        # Update recall counts (for memory reinforcement)
+        # Update recall counts (for memory reinforcement). With a tracker
+        # the recall stays read-only; counts are merged by a bulk flush.
         now = datetime.now(UTC)
+        if self.access_tracker is not None:
+            self.access_tracker.record_many("episodic", [m.id for m in memories], now)
+            return memories
+
         for memory in memories:
             memory.recall_count += 1
             memory.last_recalled_at = now
@@ -224,8 +245,32 @@ class EpisodicMemorySystem:
         result = await self.session.execute(
             query.order_by(EpisodicMemory.occurred_at.desc()).limit(limit)
         )
+        memories = list(result.scalars().all())
 
-        return list(result.scalars().all())
+        # Archived months are all older than any hot row, so they only
+        # matter when the hot partitions didn't fill the limit.
+        if (
+            len(memories) < limit
+            and self.archive is not None
+            and self.archive.reaches_archive("memory_episodes", cutoff)
+        ):
+            equals: dict[str, Any] = {
+                "employee_id": self.employee_id,
+                "tenant_id": self.tenant_id,
+            }
+            if episode_type:
+                equals["episode_type"] = episode_type
+            rows = await self.archive.read(
+                "memory_episodes",
+                since=cutoff,
+                until=self.archive.hot_start("memory_episodes"),
+                equals=equals,
+                limit=limit - len(memories),
+            )
+            # Transient (never added to the session): archived rows are read-only.
+            memories.extend(EpisodicMemory(**row) for row in rows)
+
+        return memories
 
     async def recall_with_participant(
         self,
@@ -408,25 +453,17 @@ class EpisodicMemorySystem:
         Returns:
             Number of memories reinforced
         """
-        result = await self.session.execute(
-            select(EpisodicMemory).where(
-                EpisodicMemory.employee_id == self.employee_id,
-                EpisodicMemory.tenant_id == self.tenant_id,
-                EpisodicMemory.recall_count >= min_recall_count,
-                EpisodicMemory.deleted_at.is_(None),
-            )
+        # Fold buffered recalls into recall_count first so the threshold
+        # compares against the aggregated counter. The tracker commits on
+        # its own session: the counts must not ride on (or be lost with)
+        # this session's transaction.
+        if self.access_tracker is not None:
+            await self.access_tracker.flush()
+
+        job = maintenance.episodic_reinforce(
+            min_recall_count=min_recall_count, importance_boost=importance_boost
         )
-
-        memories = list(result.scalars().all())
-        count = 0
-
-        for memory in memories:
-            # Boost importance but cap at 1.0
-            memory.importance = min(1.0, memory.importance * importance_boost)
-            count += 1
-
-        await self.session.flush()
-        return count
+        return await self._run_maintenance(job)
 
     async def decay_rarely_recalled(
         self,
@@ -445,27 +482,10 @@ class EpisodicMemorySystem:
         Returns:
             Number of memories decayed
         """
-        cutoff = datetime.now(UTC) - timedelta(days=min_days_old)
-
-        result = await self.session.execute(
-            select(EpisodicMemory).where(
-                EpisodicMemory.employee_id == self.employee_id,
-                EpisodicMemory.tenant_id == self.tenant_id,
-                EpisodicMemory.occurred_at < cutoff,
-                EpisodicMemory.recall_count == 0,
-                EpisodicMemory.deleted_at.is_(None),
-            )
+        job = maintenance.episodic_decay(
+            min_days_old=min_days_old, importance_decay=importance_decay
         )
-
-        memories = list(result.scalars().all())
-        count = 0
-
-        for memory in memories:
-            memory.importance *= importance_decay
-            count += 1
-
-        await self.session.flush()
-        return count
+        return await self._run_maintenance(job)
 
     async def archive_low_importance(
         self,
@@ -485,25 +505,15 @@ class EpisodicMemorySystem:
         Returns:
             Number of memories archived
         """
-        cutoff = datetime.now(UTC) - timedelta(days=min_days_old)
-        now = datetime.now(UTC)
+        job = maintenance.episodic_archive(min_days_old=min_days_old, max_importance=max_importance)
+        return await self._run_maintenance(job)
 
+    async def _run_maintenance(self, job: maintenance.MaintenanceJob) -> int:
+        """Run a set-based maintenance job over this employee's episodes."""
         result = await self.session.execute(
-            select(EpisodicMemory).where(
+            job.statement(
                 EpisodicMemory.employee_id == self.employee_id,
                 EpisodicMemory.tenant_id == self.tenant_id,
-                EpisodicMemory.occurred_at < cutoff,
-                EpisodicMemory.importance < max_importance,
-                EpisodicMemory.deleted_at.is_(None),
             )
         )
-
-        memories = list(result.scalars().all())
-        count = 0
-
-        for memory in memories:
-            memory.deleted_at = now
-            count += 1
-
-        await self.session.flush()
-        return count
+        return len(result.scalars().all())
@@ -0,0 +1,330 @@
+"""
+empla.core.memory.hybrid - Hybrid Lexical + Vector Memory Retrieval
+
+Pure vector recall (``recall_similar``, ``search_similar_facts``) misses
+exact identifiers — deal IDs, email addresses, ticket numbers embed
+poorly — and can never find rows that have no embedding yet. Exact-field
+recall (``recall_with_participant``, ``query_facts(subject=...)``) only
+works when the caller already knows the exact value.
+
+The hybrid retriever runs both kinds of search and fuses them:
+
+- **Lexical leg**: Postgres full-text search (``tsvector`` GIN index)
+  over episode descriptions and fact SPO text, plus an exact participant
+  match for episodes.
+- **Vector leg**: pgvector cosine search (IVFFlat index), only when a
+  query embedding is supplied.
+
+Results are merged with reciprocal-rank fusion (RRF), which only needs
+ranks — so ``ts_rank_cd`` scores and cosine similarities never have to be
+normalized against each other.
+
+Every leg runs concurrently on its own short-lived session (an
+``AsyncSession`` cannot multiplex queries), and per-leg wall-clock time
+is returned alongside the hits so the weights can be tuned against real
+latency and recall.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+from uuid import UUID
+
+from sqlalchemy import String, bindparam, case, func, literal_column, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from empla.models.memory import EpisodicMemory, SemanticMemory
+
+logger = logging.getLogger(__name__)
+
+MemoryKind = Literal["episodic", "semantic"]
+
+# Index expressions — must match the GIN indexes declared on the models
+# (idx_episodes_fts / idx_semantic_fts) character for character, or the
+# planner falls back to a sequential scan.
+EPISODIC_TSVECTOR = "to_tsvector('english', description)"
+SEMANTIC_TSVECTOR = "to_tsvector('english', subject || ' ' || predicate || ' ' || object)"
+
+# Standard RRF damping constant (Cormack et al.). Large enough that the
+# top few ranks of one leg don't drown out agreement between legs.
+DEFAULT_RRF_K = 60
+
+
+@dataclass
+class HybridHit:
+    """A single fused retrieval result."""
+
+    kind: MemoryKind
+    memory_id: UUID
+    score: float
+    record: EpisodicMemory | SemanticMemory
+    lexical_rank: int | None = None
+    vector_rank: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "memory_id": str(self.memory_id),
+            "score": round(self.score, 6),
+            "lexical_rank": self.lexical_rank,
+            "vector_rank": self.vector_rank,
+        }
+
+
+@dataclass
+class HybridSearchResult:
+    """Fused hits plus per-leg timing (milliseconds)."""
+
+    hits: list[HybridHit] = field(default_factory=list)
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    failed_legs: list[str] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return self.timings_ms.get("total", 0.0)
+
+
+class HybridMemoryRetriever:
+    """
+    Hybrid lexical + vector retrieval over episodic and semantic memory.
+
+    Unlike the per-type memory systems, the retriever takes a sessionmaker
+    rather than a session: each leg opens its own short-lived session so
+    the legs can run concurrently. It is read-only — it never mutates
+    recall or access counters.
+
+    Example:
+        >>> retriever = HybridMemoryRetriever(sessionmaker, employee_id, tenant_id)
+        >>> result = await retriever.search(
+        ...     "deal 48213 pricing",
+        ...     query_embedding=embedding,
+        ...     limit=10,
+        ... )
+        >>> for hit in result.hits:
+        ...     print(hit.kind, hit.score, hit.lexical_rank, hit.vector_rank)
+        >>> result.timings_ms
+        {"episodic_lexical": 4.1, "episodic_vector": 9.8, ..., "total": 10.3}
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        employee_id: UUID,
+        tenant_id: UUID,
+        rrf_k: int = DEFAULT_RRF_K,
+    ) -> None:
+        """
+        Initialize HybridMemoryRetriever.
+
+        Args:
+            sessionmaker: Async session factory; one session is opened per leg
+            employee_id: Employee whose memories are searched
+            tenant_id: Tenant ID for multi-tenancy
+            rrf_k: Reciprocal-rank-fusion damping constant
+        """
+        self._sessionmaker = sessionmaker
+        self.employee_id = employee_id
+        self.tenant_id = tenant_id
+        self.rrf_k = rrf_k
+
+    async def search(
+        self,
+        query_text: str,
+        query_embedding: list[float] | None = None,
+        *,
+        limit: int = 10,
+        kinds: tuple[MemoryKind, ...] = ("episodic", "semantic"),
+        lexical_weight: float = 1.0,
+        vector_weight: float = 1.0,
+        similarity_threshold: float = 0.0,
+        candidates_per_leg: int | None = None,
+    ) -> HybridSearchResult:
+        """
+        Search memories with lexical and vector legs fused by RRF.
+
+        Args:
+            query_text: Free-text query (websearch syntax: quotes, OR, -term)
+            query_embedding: Optional query embedding; vector legs are skipped
+                when None
+            limit: Maximum number of fused hits to return
+            kinds: Which memory types to search
+            lexical_weight: RRF weight for the full-text legs
+            vector_weight: RRF weight for the vector legs
+            similarity_threshold: Minimum cosine similarity for vector candidates
+            candidates_per_leg: Candidates fetched per leg before fusion
+                (defaults to ``limit * 4``)
+
+        Returns:
+            HybridSearchResult with hits sorted by fused score (highest first)
+            and per-leg timings. A failed leg is logged, listed in
+            ``failed_legs``, and contributes no candidates — the other legs
+            still return results.
+        """
+        candidates = candidates_per_leg or max(limit * 4, limit)
+        query_text = query_text.strip()
+
+        legs: dict[str, tuple[MemoryKind, str, Callable[[AsyncSession], Awaitable[Any]]]] = {}
+        for kind in kinds:
+            if query_text:
+                legs[f"{kind}_lexical"] = (
+                    kind,
+                    "lexical",
+                    self._lexical_leg(kind, query_text, candidates),
+                )
+            if query_embedding is not None:
+                legs[f"{kind}_vector"] = (
+                    kind,
+                    "vector",
+                    self._vector_leg(kind, query_embedding, candidates, similarity_threshold),
+                )
+
+        result = HybridSearchResult()
+        if not legs:
+            result.timings_ms["total"] = 0.0
+            return result
+
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(
+            *(self._run_leg(name, runner) for name, (_, _, runner) in legs.items())
+        )
+        result.timings_ms["total"] = round((time.perf_counter() - start) * 1000, 2)
+
+        weights = {"lexical": lexical_weight, "vector": vector_weight}
+        fused: dict[tuple[MemoryKind, UUID], HybridHit] = {}
+
+        for (name, (kind, source, _)), (records, elapsed_ms, ok) in zip(
+            legs.items(), outcomes, strict=True
+        ):
+            result.timings_ms[name] = elapsed_ms
+            if not ok:
+                result.failed_legs.append(name)
+                continue
+            weight = weights[source]
+            for rank, record in enumerate(records, start=1):
+                key = (kind, record.id)
+                hit = fused.get(key)
+                if hit is None:
+                    hit = HybridHit(kind=kind, memory_id=record.id, score=0.0, record=record)
+                    fused[key] = hit
+                hit.score += weight / (self.rrf_k + rank)
+                if source == "lexical":
+                    hit.lexical_rank = rank
+                else:
+                    hit.vector_rank = rank
+
+        # Tie-break on memory_id so equal-score results are stable across calls
+        result.hits = sorted(fused.values(), key=lambda h: (-h.score, str(h.memory_id)))[:limit]
+
+        logger.debug(
+            "Hybrid memory search complete",
+            extra={
+                "employee_id": str(self.employee_id),
+                "hits": len(result.hits),
+                "timings_ms": result.timings_ms,
+                "failed_legs": result.failed_legs,
+            },
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # Legs
+    # ------------------------------------------------------------------
+
+    async def _run_leg(
+        self,
+        name: str,
+        runner: Callable[[AsyncSession], Awaitable[Any]],
+    ) -> tuple[list[Any], float, bool]:
+        """Run one leg on its own session. Returns (records, elapsed_ms, ok)."""
+        start = time.perf_counter()
+        try:
+            async with self._sessionmaker() as session:
+                records = await runner(session)
+        except Exception:
+            logger.warning(
+                "Hybrid memory search leg '%s' failed",
+                name,
+                exc_info=True,
+                extra={"employee_id": str(self.employee_id)},
+            )
+            return [], round((time.perf_counter() - start) * 1000, 2), False
+        return list(records), round((time.perf_counter() - start) * 1000, 2), True
+
+    def _lexical_leg(
+        self,
+        kind: MemoryKind,
+        query_text: str,
+        candidates: int,
+    ) -> Callable[[AsyncSession], Awaitable[list[Any]]]:
+        async def run(session: AsyncSession) -> list[Any]:
+            # Only the query text is bound; the index expressions stay
+            # literal so they match the GIN indexes.
+            q = bindparam("q", query_text, type_=String)
+            tsquery = func.websearch_to_tsquery(literal_column("'english'"), q)
+            if kind == "episodic":
+                tsvector = literal_column(EPISODIC_TSVECTOR)
+                participant = EpisodicMemory.participants.any(q)
+                # Participant exact match ranks above any text match: an email
+                # address the caller typed verbatim is the strongest signal.
+                rank = func.ts_rank_cd(tsvector, tsquery) + case((participant, 1.0), else_=0.0)
+                query = (
+                    select(EpisodicMemory)
+                    .where(
+                        EpisodicMemory.employee_id == self.employee_id,
+                        EpisodicMemory.tenant_id == self.tenant_id,
+                        EpisodicMemory.deleted_at.is_(None),
+                        or_(tsvector.bool_op("@@")(tsquery), participant),
+                    )
+                    .order_by(rank.desc(), EpisodicMemory.occurred_at.desc())
+                )
+            else:
+                tsvector = literal_column(SEMANTIC_TSVECTOR)
+                rank = func.ts_rank_cd(tsvector, tsquery)
+                query = (
+                    select(SemanticMemory)
+                    .where(
+                        SemanticMemory.employee_id == self.employee_id,
+                        SemanticMemory.tenant_id == self.tenant_id,
+                        SemanticMemory.deleted_at.is_(None),
+                        tsvector.bool_op("@@")(tsquery),
+                    )
+                    .order_by(rank.desc(), SemanticMemory.confidence.desc())
+                )
+
+            result = await session.execute(query.limit(candidates))
+            return list(result.scalars().all())
+
+        return run
+
+    def _vector_leg(
+        self,
+        kind: MemoryKind,
+        query_embedding: list[float],
+        candidates: int,
+        similarity_threshold: float,
+    ) -> Callable[[AsyncSession], Awaitable[list[Any]]]:
+        async def run(session: AsyncSession) -> list[Any]:
+            model: type[EpisodicMemory] | type[SemanticMemory] = (
+                EpisodicMemory if kind == "episodic" else SemanticMemory
+            )
+            result = await session.execute(
+                select(model)
+                .where(
+                    model.employee_id == self.employee_id,
+                    model.tenant_id == self.tenant_id,
+                    model.deleted_at.is_(None),
+                    model.embedding.is_not(None),
+                    text("1 - (embedding <=> :query_emb) >= :threshold"),
+                )
+                .params(query_emb=str(query_embedding), threshold=similarity_threshold)
+                .order_by(text("embedding <=> :query_emb"))
+                .limit(candidates)
+            )
+            return list(result.scalars().all())
+
+        return run
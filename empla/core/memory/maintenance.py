@@ -0,0 +1,473 @@
+"""
+empla.core.memory.maintenance - Set-Based Memory Maintenance
+
+Memory maintenance (reinforce, decay, archive) used to SELECT every
+qualifying row into the ORM and mutate it one object at a time in Python.
+On a mature employee that is thousands of rows hydrated, dirtied, and
+flushed inside deep reflection, stalling the BDI loop for seconds.
+
+Each maintenance rule is now a :class:`MaintenanceJob`: a set of
+predicates plus a SET clause, executed as ``UPDATE ... RETURNING id``.
+Two execution modes share the same job definitions:
+
+- **Inline** — the per-system methods (``reinforce_frequently_recalled``,
+  ``decay_old_facts``, ``archive_poor_procedures``, ...) run one unchunked
+  UPDATE on the caller's session. Used by ``_maintain_memory_health``.
+- **Out of band** — :class:`MemoryMaintenanceEngine` walks the table in
+  primary-key order, one chunk per short transaction, skipping rows locked
+  by a live loop. Run it from ``python -m empla.cli memory maintain`` (or
+  any scheduler) and set ``LoopConfig.memory_maintenance_in_loop=False``
+  so deep reflection no longer does the work at all.
+
+Example:
+    >>> engine = MemoryMaintenanceEngine(sessionmaker, tenant_id=tenant_id)
+    >>> report = await engine.run()
+    >>> report.total_rows
+    412
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from empla.models.memory import EpisodicMemory, ProceduralMemory, SemanticMemory
+
+logger = logging.getLogger(__name__)
+
+# Rows per UPDATE in out-of-band mode. Small enough that each transaction
+# holds its row locks for milliseconds, large enough that round-trips
+# don't dominate.
+DEFAULT_CHUNK_SIZE = 500
+
+MaintainedModel = type[EpisodicMemory] | type[SemanticMemory] | type[ProceduralMemory]
+
+
+@dataclass(frozen=True)
+class MaintenanceJob:
+    """
+    One set-based maintenance rule.
+
+    Attributes:
+        name: Stable job name (used for selection, logs, and reports)
+        model: Memory model the rule updates
+        conditions: Predicates selecting qualifying rows (soft-deleted rows
+            are always excluded)
+        values: SET clause, as column name -> SQL expression
+    """
+
+    name: str
+    model: MaintainedModel
+    conditions: tuple[ColumnElement[bool], ...]
+    values: dict[str, Any]
+
+    def _where(self, scope: Iterable[ColumnElement[bool]]) -> list[ColumnElement[bool]]:
+        return [*scope, *self.conditions, self.model.deleted_at.is_(None)]
+
+    def statement(self, *scope: ColumnElement[bool]) -> Any:
+        """Unchunked ``UPDATE ... RETURNING id`` over every qualifying row."""
+        return (
+            update(self.model)
+            .where(*self._where(scope))
+            .values(**self.values)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    def chunk_statement(
+        self,
+        *scope: ColumnElement[bool],
+        after: UUID | None,
+        chunk_size: int,
+    ) -> Any:
+        """
+        ``UPDATE ... RETURNING id`` over the next ``chunk_size`` qualifying rows.
+
+        Rows are taken in primary-key order after ``after`` (keyset), so a
+        run visits each row at most once even when the SET clause doesn't
+        change whether a row qualifies. ``SKIP LOCKED`` lets the worker
+        step around rows a running employee is writing instead of queueing
+        behind its transaction; those rows are picked up on the next run.
+        """
+        where = self._where(scope)
+        if after is not None:
+            where.append(self.model.id > after)
+        batch = (
+            select(self.model.id)
+            .where(*where)
+            .order_by(self.model.id)
+            .limit(chunk_size)
+            .with_for_update(skip_locked=True)
+            .cte("maintenance_batch")
+        )
+        return (
+            update(self.model)
+            .where(self.model.id == batch.c.id)
+            .values(**self.values)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+
+
+# ============================================================================
+# Job definitions
+# ============================================================================
+
+
+def episodic_reinforce(*, min_recall_count: int, importance_boost: float) -> MaintenanceJob:
+    """Boost importance of frequently-recalled episodes (capped at 1.0)."""
+    return MaintenanceJob(
+        name="episodic_reinforce",
+        model=EpisodicMemory,
+        conditions=(EpisodicMemory.recall_count >= min_recall_count,),
+        values={"importance": func.least(1.0, EpisodicMemory.importance * importance_boost)},
+    )
+
+
+def episodic_decay(
+    *, min_days_old: int, importance_decay: float, now: datetime | None = None
+) -> MaintenanceJob:
+    """Decay importance of old episodes that were never recalled."""
+    cutoff = (now or datetime.now(UTC)) - timedelta(days=min_days_old)
+    return MaintenanceJob(
+        name="episodic_decay",
+        model=EpisodicMemory,
+        conditions=(EpisodicMemory.occurred_at < cutoff, EpisodicMemory.recall_count == 0),
+        values={"importance": EpisodicMemory.importance * importance_decay},
+    )
+
+
+def episodic_archive(
+    *, min_days_old: int, max_importance: float, now: datetime | None = None
+) -> MaintenanceJob:
+    """Soft-delete very old, low-importance episodes."""
+    now = now or datetime.now(UTC)
+    return MaintenanceJob(
+        name="episodic_archive",
+        model=EpisodicMemory,
+        conditions=(
+            EpisodicMemory.occurred_at < now - timedelta(days=min_days_old),
+            EpisodicMemory.importance < max_importance,
+        ),
+        values={"deleted_at": now},
+    )
+
+
+def semantic_reinforce(*, min_access_count: int, confidence_boost: float) -> MaintenanceJob:
+    """Boost confidence of frequently-accessed facts (capped at 1.0)."""
+    return MaintenanceJob(
+        name="semantic_reinforce",
+        model=SemanticMemory,
+        conditions=(SemanticMemory.access_count >= min_access_count,),
+        values={"confidence": func.least(1.0, SemanticMemory.confidence * confidence_boost)},
+    )
+
+
+def semantic_decay(
+    *,
+    min_days_old: int,
+    confidence_decay: float,
+    max_access_count: int = 5,
+    now: datetime | None = None,
+) -> MaintenanceJob:
+    """Decay confidence of old, rarely-accessed facts."""
+    cutoff = (now or datetime.now(UTC)) - timedelta(days=min_days_old)
+    return MaintenanceJob(
+        name="semantic_decay",
+        model=SemanticMemory,
+        conditions=(
+            SemanticMemory.created_at < cutoff,
+            SemanticMemory.access_count < max_access_count,
+        ),
+        values={"confidence": SemanticMemory.confidence * confidence_decay},
+    )
+
+
+def semantic_archive(
+    *, max_confidence: float, min_days_old: int, now: datetime | None = None
+) -> MaintenanceJob:
+    """Soft-delete old, low-confidence facts."""
+    now = now or datetime.now(UTC)
+    return MaintenanceJob(
+        name="semantic_archive",
+        model=SemanticMemory,
+        conditions=(
+            SemanticMemory.confidence < max_confidence,
+            SemanticMemory.created_at < now - timedelta(days=min_days_old),
+        ),
+        values={"deleted_at": now},
+    )
+
+
+def procedural_reinforce(
+    *, min_success_rate: float, min_executions: int, now: datetime | None = None
+) -> MaintenanceJob:
+    """Mark proven procedures via a JSONB merge into ``context``."""
+    marker = {"proven": True, "reinforced_at": (now or datetime.now(UTC)).isoformat()}
+    return MaintenanceJob(
+        name="procedural_reinforce",
+        model=ProceduralMemory,
+        conditions=(
+            ProceduralMemory.success_rate >= min_success_rate,
+            ProceduralMemory.execution_count >= min_executions,
+        ),
+        values={
+            "context": func.coalesce(ProceduralMemory.context, literal({}, JSONB)).op(
+                "||", return_type=JSONB
+            )(literal(marker, JSONB))
+        },
+    )
+
+
+def procedural_archive(
+    *, max_success_rate: float, min_executions: int, now: datetime | None = None
+) -> MaintenanceJob:
+    """Soft-delete procedures with a statistically meaningful poor success rate."""
+    return MaintenanceJob(
+        name="procedural_archive",
+        model=ProceduralMemory,
+        conditions=(
+            ProceduralMemory.success_rate < max_success_rate,
+            ProceduralMemory.execution_count >= min_executions,
+        ),
+        values={"deleted_at": now or datetime.now(UTC)},
+    )
+
+
+# ============================================================================
+# Out-of-band engine
+# ============================================================================
+
+
+@dataclass
+class MaintenancePolicy:
+    """
+    Thresholds for a full maintenance pass.
+
+    Defaults mirror what deep reflection has always used inline, plus the
+    semantic decay/archive rules that previously had no caller.
+    """
+
+    episodic_min_recall_count: int = 3
+    episodic_importance_boost: float = 1.05
+    episodic_decay_min_days_old: int = 30
+    episodic_importance_decay: float = 0.95
+    semantic_min_access_count: int = 10
+    semantic_confidence_boost: float = 1.1
+    semantic_decay_min_days_old: int = 180
+    semantic_confidence_decay: float = 0.9
+    semantic_archive_max_confidence: float = 0.3
+    semantic_archive_min_days_old: int = 90
+    procedural_min_success_rate: float = 0.8
+    procedural_archive_max_success_rate: float = 0.2
+    procedural_min_executions: int = 3
+
+    def jobs(self, now: datetime | None = None) -> list[MaintenanceJob]:
+        """Build the job list, in execution order (reinforce before decay/archive)."""
+        now = now or datetime.now(UTC)
+        return [
+            episodic_reinforce(
+                min_recall_count=self.episodic_min_recall_count,
+                importance_boost=self.episodic_importance_boost,
+            ),
+            episodic_decay(
+                min_days_old=self.episodic_decay_min_days_old,
+                importance_decay=self.episodic_importance_decay,
+                now=now,
+            ),
+            semantic_reinforce(
+                min_access_count=self.semantic_min_access_count,
+                confidence_boost=self.semantic_confidence_boost,
+            ),
+            semantic_decay(
+                min_days_old=self.semantic_decay_min_days_old,
+                confidence_decay=self.semantic_confidence_decay,
+                now=now,
+            ),
+            semantic_archive(
+                max_confidence=self.semantic_archive_max_confidence,
+                min_days_old=self.semantic_archive_min_days_old,
+                now=now,
+            ),
+            procedural_reinforce(
+                min_success_rate=self.procedural_min_success_rate,
+                min_executions=self.procedural_min_executions,
+                now=now,
+            ),
+            procedural_archive(
+                max_success_rate=self.procedural_archive_max_success_rate,
+                min_executions=self.procedural_min_executions,
+                now=now,
+            ),
+        ]
+
+
+@dataclass
+class MaintenanceJobResult:
+    """Outcome of one job in a maintenance pass."""
+
+    name: str
+    rows: int = 0
+    chunks: int = 0
+    duration_ms: float = 0.0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "duration_ms": round(self.duration_ms, 2),
+            "error": self.error,
+        }
+
+
+@dataclass
+class MaintenanceReport:
+    """Outcome of a full maintenance pass."""
+
+    results: list[MaintenanceJobResult] = field(default_factory=list)
+
+    @property
+    def total_rows(self) -> int:
+        return sum(r.rows for r in self.results)
+
+    @property
+    def failed_jobs(self) -> list[str]:
+        return [r.name for r in self.results if r.error is not None]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_rows": self.total_rows,
+            "failed_jobs": self.failed_jobs,
+            "jobs": [r.to_dict() for r in self.results],
+        }
+
+
+class MemoryMaintenanceEngine:
+    """
+    Runs maintenance jobs out of band in short, chunked transactions.
+
+    Each chunk is its own session and commit, so no lock outlives a
+    single ``UPDATE`` of at most ``chunk_size`` rows. A failing job is
+    logged and reported; the remaining jobs still run.
+
+    Scope is optional: pass ``employee_id`` to maintain one employee,
+    ``tenant_id`` for one tenant, or neither for a fleet-wide sweep (the
+    thresholds are per row, so a single pass serves every employee).
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        *,
+        tenant_id: UUID | None = None,
+        employee_id: UUID | None = None,
+        policy: MaintenancePolicy | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        pause_seconds: float = 0.0,
+    ) -> None:
+        """
+        Initialize MemoryMaintenanceEngine.
+
+        Args:
+            sessionmaker: Session factory; one session per chunk
+            tenant_id: Restrict to one tenant (None = all tenants)
+            employee_id: Restrict to one employee (None = all employees)
+            policy: Thresholds (default: MaintenancePolicy())
+            chunk_size: Rows per UPDATE
+            pause_seconds: Sleep between chunks to cap write throughput
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        self._sessionmaker = sessionmaker
+        self.tenant_id = tenant_id
+        self.employee_id = employee_id
+        self.policy = policy or MaintenancePolicy()
+        self.chunk_size = chunk_size
+        self.pause_seconds = pause_seconds
+
+    def _scope(self, model: MaintainedModel) -> list[ColumnElement[bool]]:
+        scope: list[ColumnElement[bool]] = []
+        if self.tenant_id is not None:
+            scope.append(model.tenant_id == self.tenant_id)
+        if self.employee_id is not None:
+            scope.append(model.employee_id == self.employee_id)
+        return scope
+
+    async def run(self, only: Iterable[str] | None = None) -> MaintenanceReport:
+        """
+        Run a full maintenance pass.
+
+        Args:
+            only: Job names to run (default: every job in the policy)
+
+        Returns:
+            MaintenanceReport with per-job row counts and timings
+        """
+        jobs = self.policy.jobs()
+        if only is not None:
+            wanted = set(only)
+            unknown = wanted - {job.name for job in jobs}
+            if unknown:
+                raise ValueError(f"Unknown maintenance jobs: {sorted(unknown)}")
+            jobs = [job for job in jobs if job.name in wanted]
+
+        report = MaintenanceReport()
+        for job in jobs:
+            report.results.append(await self.run_job(job))
+
+        logger.info(
+            "Memory maintenance pass complete: %d rows updated",
+            report.total_rows,
+            extra={
+                "tenant_id": str(self.tenant_id) if self.tenant_id else None,
+                "employee_id": str(self.employee_id) if self.employee_id else None,
+                "failed_jobs": report.failed_jobs,
+            },
+        )
+        return report
+
+    async def run_job(self, job: MaintenanceJob) -> MaintenanceJobResult:
+        """Run one job to completion, chunk by chunk. Never raises."""
+        result = MaintenanceJobResult(name=job.name)
+        scope = self._scope(job.model)
+        after: UUID | None = None
+        start = time.perf_counter()
+
+        try:
+            while True:
+                stmt = job.chunk_statement(*scope, after=after, chunk_size=self.chunk_size)
+                async with self._sessionmaker() as session:
+                    ids = list((await session.execute(stmt)).scalars().all())
+                    await session.commit()
+
+                result.chunks += 1
+                result.rows += len(ids)
+                if len(ids) < self.chunk_size:
+                    break
+                after = max(ids)
+                if self.pause_seconds:
+                    await asyncio.sleep(self.pause_seconds)
+        except Exception as e:
+            result.error = str(e)
+            logger.warning(
+                "Memory maintenance job %s failed after %d rows",
+                job.name,
+                result.rows,
+                exc_info=True,
+                extra={"employee_id": str(self.employee_id) if self.employee_id else None},
+            )
+
+        result.duration_ms = (time.perf_counter() - start) * 1000
+        return result
@@ -0,0 +1,312 @@
+"""
+empla.core.memory.partitions - Monthly Partitions and Retention
+
+``memory_episodes`` (by ``occurred_at``) and ``belief_history`` (by
+``changed_at``) are declaratively range-partitioned by calendar month
+(migration ``n9i0j1k2l3m4``). Partitions are named ``<table>_pYYYYMM``;
+each table also has a ``<table>_default`` catch-all so an insert never
+fails for lack of a partition.
+
+:class:`HistoryRetention` keeps that layout healthy:
+
+1. **Pre-create** partitions ``months_ahead`` months into the future, so
+   new rows land in a monthly partition rather than the default one
+   (a month cannot be split out of the default partition once it holds
+   rows for that range).
+2. **Archive** every monthly partition older than the hot window:
+   DETACH it, stream its rows into a Parquet file via
+   :class:`~empla.core.memory.archive.HistoryArchive`, verify the row
+   count, then DROP the detached table.
+
+Run it monthly (or daily — it is idempotent) via
+``python -m empla.cli memory retention``.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from empla.core.memory.archive import (
+    ARCHIVED_TABLES,
+    ArchivedTable,
+    HistoryArchive,
+    month_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round-trip while exporting a partition.
+EXPORT_BATCH_SIZE = 5000
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant (UTC) of the month containing ``moment``."""
+    moment = moment.astimezone(UTC)
+    return datetime(moment.year, moment.month, 1, tzinfo=UTC)
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    """Shift a month start by ``count`` months (may be negative)."""
+    index = month.year * 12 + (month.month - 1) + count
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """``memory_episodes`` + 2026-01 -> ``memory_episodes_p202601``."""
+    return f"{table}_p{month.year:04d}{month.month:02d}"
+
+
+def _parse_partition_name(table: str, name: str) -> datetime | None:
+    match = re.fullmatch(rf"{re.escape(table)}_p(\d{{4}})(\d{{2}})", name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=UTC)
+
+
+def create_partition_sql(table: str, month: datetime) -> str:
+    """DDL for one monthly partition (bounds are half-open: [start, next))."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+        f"PARTITION OF {table} FOR VALUES FROM ('{month.isoformat()}') "
+        f"TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def _export_sql(table: ArchivedTable, source: str) -> str:
+    """SELECT for exporting a detached partition.
+
+    JSONB and vector columns are cast to text so the driver hands back
+    plain strings regardless of codec setup; the archive encoder parses
+    them. belief_history also picks up the belief's subject/predicate.
+    """
+    select_list = []
+    for name, kind in table.columns:
+        if name in table.extra_columns:
+            continue
+        if kind in ("json", "vector"):
+            select_list.append(f"h.{name}::text AS {name}")
+        else:
+            select_list.append(f"h.{name}")
+
+    if table.name == "belief_history":
+        select_list += ["b.subject AS belief_subject", "b.predicate AS belief_predicate"]
+        return (
+            f"SELECT {', '.join(select_list)} FROM {source} h "
+            "LEFT JOIN beliefs b ON b.id = h.belief_id"
+        )
+    return f"SELECT {', '.join(select_list)} FROM {source} h"
+
+
+async def list_partitions(session: AsyncSession, table: str) -> list[datetime]:
+    """Month starts of the monthly partitions currently attached to ``table``."""
+    result = await session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table},
+    )
+    months = [_parse_partition_name(table, name) for name in result.scalars().all()]
+    return sorted(m for m in months if m is not None)
+
+
+@dataclass
+class PartitionArchiveResult:
+    """Outcome of archiving one partition."""
+
+    table: str
+    month: datetime
+    rows: int = 0
+    path: str | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "table": self.table,
+            "month": month_key(self.month),
+            "rows": self.rows,
+            "path": self.path,
+            "error": self.error,
+        }
+
+
+@dataclass
+class RetentionReport:
+    """Outcome of a retention run."""
+
+    created: list[str] = field(default_factory=list)
+    archived: list[PartitionArchiveResult] = field(default_factory=list)
+
+    @property
+    def failed(self) -> list[PartitionArchiveResult]:
+        return [r for r in self.archived if r.error is not None]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "created_partitions": self.created,
+            "archived": [r.to_dict() for r in self.archived],
+            "failed": len(self.failed),
+        }
+
+
+class HistoryRetention:
+    """
+    Pre-creates monthly partitions and moves expired ones to the archive.
+
+    Example:
+        >>> retention = HistoryRetention(sessionmaker, HistoryArchive(path), hot_months=6)
+        >>> report = await retention.run()
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        archive: HistoryArchive,
+        *,
+        hot_months: int = 6,
+        months_ahead: int = 3,
+        tables: tuple[str, ...] = tuple(ARCHIVED_TABLES),
+    ) -> None:
+        """
+        Initialize HistoryRetention.
+
+        Args:
+            sessionmaker: Session factory (DDL runs in short transactions)
+            archive: Destination for exported partitions
+            hot_months: Months kept in Postgres, including the current one
+            months_ahead: Future months to pre-create partitions for
+            tables: Partitioned tables to manage
+        """
+        if hot_months < 1:
+            raise ValueError(f"hot_months must be >= 1, got {hot_months}")
+        unknown = set(tables) - set(ARCHIVED_TABLES)
+        if unknown:
+            raise ValueError(f"Not partitioned history tables: {sorted(unknown)}")
+        self._sessionmaker = sessionmaker
+        self.archive = archive
+        self.hot_months = hot_months
+        self.months_ahead = months_ahead
+        self.tables = tables
+
+    def hot_cutoff(self, now: datetime | None = None) -> datetime:
+        """Partitions starting before this month are archived."""
+        return add_months(month_start(now or datetime.now(UTC)), -(self.hot_months - 1))
+
+    async def run(self, now: datetime | None = None) -> RetentionReport:
+        """Pre-create future partitions and archive expired ones for every table."""
+        now = now or datetime.now(UTC)
+        report = RetentionReport()
+        for table in self.tables:
+            report.created += await self.ensure_partitions(table, now=now)
+            async with self._sessionmaker() as session:
+                months = await list_partitions(session, table)
+            for month in months:
+                if month < self.hot_cutoff(now):
+                    report.archived.append(
+                        await self.archive_partition(ARCHIVED_TABLES[table], month)
+                    )
+
+        logger.info(
+            "History retention complete: %d partitions created, %d archived, %d failed",
+            len(report.created),
+            len(report.archived) - len(report.failed),
+            len(report.failed),
+        )
+        return report
+
+    async def ensure_partitions(self, table: str, *, now: datetime | None = None) -> list[str]:
+        """Create partitions for the current month through ``months_ahead``."""
+        current = month_start(now or datetime.now(UTC))
+        async with self._sessionmaker() as session:
+            existing = set(await list_partitions(session, table))
+            created = []
+            for offset in range(self.months_ahead + 1):
+                month = add_months(current, offset)
+                if month in existing:
+                    continue
+                await session.execute(text(create_partition_sql(table, month)))
+                created.append(partition_name(table, month))
+            await session.commit()
+        return created
+
+    async def archive_partition(
+        self, table: ArchivedTable, month: datetime
+    ) -> PartitionArchiveResult:
+        """
+        Detach, export, verify and drop one monthly partition. Never raises.
+
+        If the export fails or its row count doesn't match the table, the
+        temp file is discarded and the partition re-attached so the rows
+        stay queryable; nothing is dropped until the archive is published.
+        """
+        result = PartitionArchiveResult(table=table.name, month=month)
+        name = partition_name(table.name, month)
+
+        try:
+            async with self._sessionmaker() as session:
+                await session.execute(text(f"ALTER TABLE {table.name} DETACH PARTITION {name}"))
+                await session.commit()
+        except Exception as e:
+            result.error = f"detach failed: {e}"
+            logger.warning("Failed to detach %s", name, exc_info=True)
+            return result
+
+        writer = self.archive.writer(table.name, month)
+        try:
+            async with self._sessionmaker() as session:
+                stream = await session.stream(text(_export_sql(table, name)))
+                async for batch in stream.mappings().partitions(EXPORT_BATCH_SIZE):
+                    writer.write_batch([dict(row) for row in batch])
+                expected = (
+                    await session.execute(text(f"SELECT count(*) FROM {name}"))
+                ).scalar_one()
+            if expected != writer.rows:
+                raise RuntimeError(f"row count mismatch: table {expected}, exported {writer.rows}")
+        except Exception as e:
+            writer.abort()
+            result.error = f"export failed: {e}"
+            logger.error("Failed to export %s; re-attaching", name, exc_info=True)
+            await self._reattach(table.name, month)
+            return result
+
+        entry = writer.commit()
+        result.rows = entry.rows
+        result.path = str(entry.path)
+
+        try:
+            async with self._sessionmaker() as session:
+                await session.execute(text(f"DROP TABLE {name}"))
+                await session.commit()
+        except Exception as e:
+            # Archived and published; the detached table is just dead weight.
+            result.error = f"drop failed: {e}"
+            logger.warning("Archived %s but failed to drop it", name, exc_info=True)
+
+        logger.info("Archived %s (%d rows) to %s", name, result.rows, result.path)
+        return result
+
+    async def _reattach(self, table: str, month: datetime) -> None:
+        name = partition_name(table, month)
+        try:
+            async with self._sessionmaker() as session:
+                await session.execute(
+                    text(
+                        f"ALTER TABLE {table} ATTACH PARTITION {name} "
+                        f"FOR VALUES FROM ('{month.isoformat()}') "
+                        f"TO ('{add_months(month, 1).isoformat()}')"
+                    )
+                )
+                await session.commit()
+        except Exception:
+            logger.error(
+                "Failed to re-attach %s; rows remain in the detached table", name, exc_info=True
+            )
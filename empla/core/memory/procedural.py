@@ -25,6 +25,7 @@ from uuid import UUID
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from empla.core.memory import maintenance
 from empla.models.memory import ProceduralMemory
 
 logger = logging.getLogger(__name__)
@@ -523,27 +524,10 @@ class ProceduralMemorySystem:
             ...     min_executions=5
             ... )
         """
-        now = datetime.now(UTC)
-
-        result = await self.session.execute(
-            select(ProceduralMemory).where(
-                ProceduralMemory.employee_id == self.employee_id,
-                ProceduralMemory.tenant_id == self.tenant_id,
-                ProceduralMemory.success_rate < max_success_rate,
-                ProceduralMemory.execution_count >= min_executions,
-                ProceduralMemory.deleted_at.is_(None),
-            )
+        job = maintenance.procedural_archive(
+            max_success_rate=max_success_rate, min_executions=min_executions
         )
-
-        procedures = list(result.scalars().all())
-        count = 0
-
-        for procedure in procedures:
-            procedure.deleted_at = now
-            count += 1
-
-        await self.session.flush()
-        return count
+        return await self._run_maintenance(job)
 
     async def reinforce_successful_procedures(
         self,
@@ -570,28 +554,20 @@ class ProceduralMemorySystem:
             ...     min_executions=10
             ... )
         """
+        job = maintenance.procedural_reinforce(
+            min_success_rate=min_success_rate, min_executions=min_executions
+        )
+        return await self._run_maintenance(job)
+
+    async def _run_maintenance(self, job: maintenance.MaintenanceJob) -> int:
+        """Run a set-based maintenance job over this employee's procedures."""
         result = await self.session.execute(
-            select(ProceduralMemory).where(
+            job.statement(
                 ProceduralMemory.employee_id == self.employee_id,
                 ProceduralMemory.tenant_id == self.tenant_id,
-                ProceduralMemory.success_rate >= min_success_rate,
-                ProceduralMemory.execution_count >= min_executions,
-                ProceduralMemory.deleted_at.is_(None),
             )
         )
-
-        procedures = list(result.scalars().all())
-        count = 0
-
-        for procedure in procedures:
-            updated_context = dict(procedure.context or {})
-            updated_context["proven"] = True
-            updated_context["reinforced_at"] = datetime.now(UTC).isoformat()
-            procedure.context = updated_context
-            count += 1
-
-        await self.session.flush()
-        return count
+        return len(result.scalars().all())
 
     async def get_procedure(self, procedure_id: UUID) -> ProceduralMemory | None:
         """
@@ -15,16 +15,22 @@ Key characteristics:
 - Confidence-weighted (facts have certainty scores)
 """
 
+from __future__ import annotations
+
 import json
-from datetime import UTC, datetime, timedelta
-from typing import Any
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from empla.core.memory import maintenance
 from empla.models.memory import SemanticMemory
 
+if TYPE_CHECKING:
+    from empla.core.memory.access import MemoryAccessTracker
+
 
 class SemanticMemorySystem:
     """
@@ -51,6 +57,7 @@ class SemanticMemorySystem:
         session: AsyncSession,
         employee_id: UUID,
         tenant_id: UUID,
+        access_tracker: MemoryAccessTracker | None = None,
     ) -> None:
         """
         Initialize SemanticMemorySystem.
@@ -59,10 +66,30 @@ class SemanticMemorySystem:
             session: SQLAlchemy async session
             employee_id: Employee this knowledge belongs to
             tenant_id: Tenant ID for multi-tenancy
+            access_tracker: Optional batched access tracker. When set, reads
+                record accesses in memory instead of updating rows inline.
         """
         self.session = session
         self.employee_id = employee_id
         self.tenant_id = tenant_id
+        self.access_tracker = access_tracker
+
+    async def _track_access(self, facts: list[SemanticMemory]) -> None:
+        """Record that facts were read.
+
+        With a tracker this is an in-memory append and the read stays
+        read-only. Without one, fall back to updating rows inline.
+        """
+        if not facts:
+            return
+        now = datetime.now(UTC)
+        if self.access_tracker is not None:
+            self.access_tracker.record_many("semantic", [fact.id for fact in facts], now)
+            return
+        for fact in facts:
+            fact.access_count += 1
+            fact.last_accessed_at = now
+        await self.session.flush()
 
     async def store_fact(
         self,
@@ -197,10 +224,7 @@ class SemanticMemorySystem:
         fact = result.scalar_one_or_none()
 
         if fact:
-            # Update access tracking
-            fact.access_count += 1
-            fact.last_accessed_at = datetime.now(UTC)
-            await self.session.flush()
+            await self._track_access([fact])
 
         return fact
 
@@ -252,13 +276,7 @@ class SemanticMemorySystem:
 
         facts = list(result.scalars().all())
 
-        # Update access tracking
-        now = datetime.now(UTC)
-        for fact in facts:
-            fact.access_count += 1
-            fact.last_accessed_at = now
-
-        await self.session.flush()
+        await self._track_access(facts)
 
         return facts
 
@@ -325,13 +343,7 @@ class SemanticMemorySystem:
 
         facts = list(result.scalars().all())
 
-        # Update access tracking
-        now = datetime.now(UTC)
-        for fact in facts:
-            fact.access_count += 1
-            fact.last_accessed_at = now
-
-        await self.session.flush()
+        await self._track_access(facts)
 
         return facts
 
@@ -471,27 +483,10 @@ class SemanticMemorySystem:
             ...     confidence_decay=0.85
             ... )
         """
-        cutoff = datetime.now(UTC) - timedelta(days=min_days_old)
-
-        result = await self.session.execute(
-            select(SemanticMemory).where(
-                SemanticMemory.employee_id == self.employee_id,
-                SemanticMemory.tenant_id == self.tenant_id,
-                SemanticMemory.created_at < cutoff,
-                SemanticMemory.access_count < 5,  # Rarely accessed
-                SemanticMemory.deleted_at.is_(None),
-            )
+        job = maintenance.semantic_decay(
+            min_days_old=min_days_old, confidence_decay=confidence_decay
         )
-
-        facts = list(result.scalars().all())
-        count = 0
-
-        for fact in facts:
-            fact.confidence *= confidence_decay
-            count += 1
-
-        await self.session.flush()
-        return count
+        return await self._run_maintenance(job)
 
     async def archive_low_confidence_facts(
         self,
@@ -517,28 +512,8 @@ class SemanticMemorySystem:
             ...     min_days_old=90
             ... )
         """
-        cutoff = datetime.now(UTC) - timedelta(days=min_days_old)
-        now = datetime.now(UTC)
-
-        result = await self.session.execute(
-            select(SemanticMemory).where(
-                SemanticMemory.employee_id == self.employee_id,
-                SemanticMemory.tenant_id == self.tenant_id,
-                SemanticMemory.confidence < max_confidence,
-                SemanticMemory.created_at < cutoff,
-                SemanticMemory.deleted_at.is_(None),
-            )
-        )
-
-        facts = list(result.scalars().all())
-        count = 0
-
-        for fact in facts:
-            fact.deleted_at = now
-            count += 1
-
-        await self.session.flush()
-        return count
+        job = maintenance.semantic_archive(max_confidence=max_confidence, min_days_old=min_days_old)
+        return await self._run_maintenance(job)
 
     async def reinforce_frequently_accessed(
         self,
@@ -564,25 +539,26 @@ class SemanticMemorySystem:
             ...     confidence_boost=1.15
             ... )
         """
+        # Fold buffered reads into access_count first so the threshold
+        # compares against the aggregated counter, not a stale one. The
+        # tracker commits on its own session, outside this transaction.
+        if self.access_tracker is not None:
+            await self.access_tracker.flush()
+
+        job = maintenance.semantic_reinforce(
+            min_access_count=min_access_count, confidence_boost=confidence_boost
+        )
+        return await self._run_maintenance(job)
+
+    async def _run_maintenance(self, job: maintenance.MaintenanceJob) -> int:
+        """Run a set-based maintenance job over this employee's facts."""
         result = await self.session.execute(
-            select(SemanticMemory).where(
+            job.statement(
                 SemanticMemory.employee_id == self.employee_id,
                 SemanticMemory.tenant_id == self.tenant_id,
-                SemanticMemory.access_count >= min_access_count,
-                SemanticMemory.deleted_at.is_(None),
             )
         )
-
-        facts = list(result.scalars().all())
-        count = 0
-
-        for fact in facts:
-            # Boost confidence but cap at 1.0
-            fact.confidence = min(1.0, fact.confidence * confidence_boost)
-            count += 1
-
-        await self.session.flush()
-        return count
+        return len(result.scalars().all())
 
     async def get_entity_summary(
         self,
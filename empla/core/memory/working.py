@@ -20,8 +20,10 @@ working memory is primarily in-memory with optional persistence
 for continuity across employee restarts.
 """
 
+from __future__ import annotations
+
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from sqlalchemy import select
@@ -29,6 +31,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from empla.models.memory import WorkingMemory as WorkingMemoryModel
 
+if TYPE_CHECKING:
+    from empla.core.memory.access import MemoryAccessTracker
+
 
 class WorkingMemory:
     """
@@ -67,6 +72,7 @@ class WorkingMemory:
         employee_id: UUID,
         tenant_id: UUID,
         capacity: int = DEFAULT_CAPACITY,
+        access_tracker: MemoryAccessTracker | None = None,
     ) -> None:
         """
         Initialize WorkingMemory.
@@ -76,11 +82,27 @@ class WorkingMemory:
             employee_id: Employee this working memory belongs to
             tenant_id: Tenant ID for multi-tenancy
             capacity: Maximum number of items (default 7)
+            access_tracker: Optional batched access tracker. When set, reads
+                record accesses in memory instead of updating rows inline.
         """
         self.session = session
         self.employee_id = employee_id
         self.tenant_id = tenant_id
         self.capacity = capacity
+        self.access_tracker = access_tracker
+
+    async def _track_access(self, items: list[WorkingMemoryModel]) -> None:
+        """Record that items were read (buffered with a tracker, inline otherwise)."""
+        if not items:
+            return
+        now = datetime.now(UTC)
+        if self.access_tracker is not None:
+            self.access_tracker.record_many("working", [item.id for item in items], now)
+            return
+        for item in items:
+            item.access_count += 1
+            item.last_accessed_at = now
+        await self.session.flush()
 
     async def add_item(
         self,
@@ -176,13 +198,7 @@ class WorkingMemory:
 
         items = list(result.scalars().all())
 
-        # Update access tracking
-        access_time = datetime.now(UTC)
-        for item in items:
-            item.access_count += 1
-            item.last_accessed_at = access_time
-
-        await self.session.flush()
+        await self._track_access(items)
 
         return items
 
@@ -211,10 +227,7 @@ class WorkingMemory:
         item = result.scalar_one_or_none()
 
         if item:
-            # Update access tracking
-            item.access_count += 1
-            item.last_accessed_at = datetime.now(UTC)
-            await self.session.flush()
+            await self._track_access([item])
 
         return item
 
@@ -48,14 +48,19 @@ from .health import IntegrationHealthMonitor
 from .mcp_bridge import MCPBridge, MCPServerConfig
 from .registry import ToolRegistry
 from .router import ToolRouter
+from .schema import CompiledSchema, ToolArgumentError, compile_schema
+from .timeouts import TimeoutPolicy
 from .trust import TrustBoundary, TrustDecision
 
 __all__ = [
     "ActionResult",
+    "CompiledSchema",
     "IntegrationHealthMonitor",
     "MCPBridge",
     "MCPServerConfig",
+    "TimeoutPolicy",
     "Tool",
+    "ToolArgumentError",
     "ToolCapability",
     "ToolExecutionEngine",
     "ToolExecutor",
@@ -66,5 +71,6 @@ __all__ = [
     "TrustBoundary",
     "TrustDecision",
     "collect_tools",
+    "compile_schema",
     "tool",
 ]
@@ -7,7 +7,9 @@ Core interfaces and data models for tool execution system.
 from typing import Any, Protocol
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .schema import CompiledSchema, compile_schema
 
 
 class Tool(BaseModel):
@@ -50,6 +52,42 @@ class Tool(BaseModel):
     )
     tags: list[str] = Field(default_factory=list, description="Tags for discovery")
 
+    # Caching
+    cache_ttl_seconds: float | None = Field(
+        default=None,
+        description=(
+            "Seconds a successful result may be served from the ToolRouter cache. "
+            "Only set for read-only tools; None disables caching."
+        ),
+    )
+
+    # Timeout ceiling
+    timeout_seconds: float | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Longest the ToolRouter waits for this tool. None uses the router "
+            "default; observed latency can shorten but never extend it."
+        ),
+    )
+
+    # Compiled once from parameters_schema (see schema.py)
+    _validator: CompiledSchema | None = PrivateAttr(default=None)
+
+    def compile_validator(self) -> CompiledSchema:
+        """Compile ``parameters_schema`` into a validator, once per tool."""
+        if self._validator is None:
+            self._validator = compile_schema(self.parameters_schema)
+        return self._validator
+
+    def validate_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Validate and coerce call arguments against the compiled schema.
+
+        Raises:
+            ToolArgumentError: If the arguments do not match, with exact paths.
+        """
+        return self.compile_validator()(arguments)
+
     class Config:
         json_schema_extra = {
             "example": {
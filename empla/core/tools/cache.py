@@ -0,0 +1,211 @@
+"""
+empla.core.tools.cache - Tool Result Cache
+
+Read-only tools (CRM lookups, calendar availability) are called with the
+same arguments many times per cycle: perception polls them, then intention
+execution asks again while planning. ``ToolResultCache`` lets ToolRouter
+answer those repeats from memory.
+
+Design:
+  - Only tools with ``Tool.cache_ttl_seconds`` set are cached, and only
+    successful results are stored.
+  - Keys are (tool name, canonical JSON arguments, credential fingerprint,
+    employee), so two credentials never share a result.
+  - Memory is bounded by entry count and approximate byte size; the least
+    recently used entries are evicted first.
+  - Entries are grouped by integration so an inbound webhook for a provider
+    (or a successful write through one of its tools) drops everything that
+    provider could have changed.
+
+Example:
+    >>> cache = ToolResultCache()
+    >>> key = cache.make_key("hubspot.get_deals", {"limit": 5}, credential="ab12")
+    >>> cache.put(key, "hubspot", result, ttl=60)
+    >>> cache.get(key).metadata
+    {'cached': True, 'age_ms': 0.4}
+    >>> cache.invalidate_provider("hubspot")
+    1
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from .base import ActionResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+# Webhook providers that fan out to several integrations. A Google
+# Workspace push can concern either the calendar or the mailbox.
+PROVIDER_ALIASES: dict[str, tuple[str, ...]] = {
+    "google_workspace": ("google_calendar", "email", "gmail"),
+}
+
+CacheKey = tuple[str, str, str, str]
+
+
+def canonical_arguments(arguments: dict[str, Any]) -> str:
+    """Serialize arguments so equivalent calls produce the same string."""
+    return json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def credential_fingerprint(config: dict[str, Any] | None) -> str:
+    """Short, non-reversible fingerprint of an integration config.
+
+    The config carries the access token, so hashing it separates results
+    per credential without keeping the secret in cache keys.
+    """
+    if not config:
+        return "-"
+    raw = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+@dataclass
+class _Entry:
+    integration: str
+    output: Any
+    metadata: dict[str, Any]
+    stored_at: float
+    expires_at: float
+    size: int
+
+
+class ToolResultCache:
+    """Bounded LRU cache of successful read-only tool results."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        tool_name: str,
+        arguments: dict[str, Any],
+        *,
+        credential: str | None = None,
+        employee_id: UUID | None = None,
+    ) -> CacheKey:
+        """Build the cache key for one tool call."""
+        return (
+            tool_name,
+            canonical_arguments(arguments),
+            credential or "-",
+            str(employee_id) if employee_id else "-",
+        )
+
+    def get(self, key: CacheKey) -> ActionResult | None:
+        """Return a copy of the cached result, or None on miss/expiry."""
+        entry = self._entries.get(key)
+        now = self._clock()
+        if entry is None or entry.expires_at <= now:
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        metadata = dict(entry.metadata)
+        metadata["cached"] = True
+        metadata["age_ms"] = round((now - entry.stored_at) * 1000, 1)
+        # Callers may mutate outputs (tool loops annotate them), so never
+        # hand out the stored object itself.
+        return ActionResult(success=True, output=copy.deepcopy(entry.output), metadata=metadata)
+
+    def put(self, key: CacheKey, integration: str, result: ActionResult, *, ttl: float) -> None:
+        """Store a successful result for ``ttl`` seconds."""
+        if not result.success or ttl <= 0:
+            return
+        try:
+            size = len(json.dumps(result.output, default=str))
+        except (TypeError, ValueError):
+            # Circular or otherwise unserializable output — not worth caching.
+            return
+        if size > self._max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        now = self._clock()
+        metadata = {k: v for k, v in result.metadata.items() if k not in ("cached", "age_ms")}
+        self._entries[key] = _Entry(
+            integration=integration,
+            output=copy.deepcopy(result.output),
+            metadata=metadata,
+            stored_at=now,
+            expires_at=now + ttl,
+            size=size,
+        )
+        self._bytes += size
+
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def invalidate(self, integration: str) -> int:
+        """Drop every entry produced by ``integration``. Returns the count."""
+        stale = [k for k, e in self._entries.items() if e.integration == integration]
+        for key in stale:
+            self._remove(key)
+        if stale:
+            self._invalidations += 1
+            logger.debug(
+                "Invalidated %d cached tool results",
+                len(stale),
+                extra={"integration": integration},
+            )
+        return len(stale)
+
+    def invalidate_provider(self, provider: str) -> int:
+        """Invalidate for a webhook provider, following provider aliases."""
+        integrations = PROVIDER_ALIASES.get(provider, (provider,))
+        return sum(self.invalidate(name) for name in integrations)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for observability."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+        }
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
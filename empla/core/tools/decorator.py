@@ -133,6 +133,9 @@ def tool(
     category: str | None = None,
     tags: list[str] | None = None,
     required_capabilities: list[str] | None = None,
+    *,
+    cache_ttl: float | None = None,
+    timeout: float | None = None,
 ) -> Callable[..., Any]:
     """Decorator that turns an async function into a registered tool.
 
@@ -142,6 +145,8 @@ def tool(
         category: Optional category for grouping
         tags: Optional tags for discovery
         required_capabilities: Capabilities needed (usually empty for standalone tools)
+        cache_ttl: Seconds a successful result may be reused (read-only tools only)
+        timeout: Longest a call may take, for tools slower than the router default
 
     Returns:
         Decorator that attaches _tool_meta to the function
@@ -168,7 +173,10 @@ def tool(
             required_capabilities=required_capabilities or [],
             category=category,
             tags=tags or [],
+            cache_ttl_seconds=cache_ttl,
+            timeout_seconds=timeout,
         )
+        tool_model.compile_validator()
 
         impl = _FuncToolImplementation(func)
 
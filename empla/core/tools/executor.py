@@ -10,6 +10,7 @@ from time import time
 from typing import Any
 
 from .base import Tool, ToolImplementation, ToolResult
+from .schema import ToolArgumentError
 
 logger = logging.getLogger(__name__)
 
@@ -100,8 +101,12 @@ class ToolExecutionEngine:
         start_time = time()
         retries = 0
 
-        # Validate parameters (basic validation - detailed validation in implementation)
-        validation_error = self._validate_params(tool, params)
+        # Validate and coerce parameters with the tool's compiled validator
+        validation_error = None
+        try:
+            params = tool.validate_arguments(params)
+        except ToolArgumentError as e:
+            validation_error = str(e)
         if validation_error:
             logger.warning(
                 f"Parameter validation failed for {tool.name}: {validation_error}",
@@ -206,11 +211,10 @@ class ToolExecutionEngine:
         """
         Validate parameters against tool schema.
 
-        This is basic validation - detailed validation happens in tool implementation.
-        We check:
-        - Required parameters are present
-        - No unexpected parameters
-        - Types match (basic type checking)
+        Uses the validator compiled from ``tool.parameters_schema`` at
+        registration time (see schema.py), so this is a single call rather
+        than a walk over the schema dict. Checks required and unexpected
+        parameters, types, enums, bounds and nested objects/arrays.
 
         Args:
             tool: Tool with parameters_schema
@@ -226,61 +230,12 @@ class ToolExecutionEngine:
             ... )
             >>> assert error is None  # Valid
         """
-        schema = tool.parameters_schema
-
-        # Check for required parameters
-        for param_name, param_spec in schema.items():
-            if (
-                isinstance(param_spec, dict)
-                and param_spec.get("required", False)
-                and param_name not in params
-            ):
-                return f"Missing required parameter: {param_name}"
-
-        # Check for unexpected parameters
-        for param_name in params:
-            if param_name not in schema:
-                return f"Unexpected parameter: {param_name}"
-
-        # Basic type checking (detailed validation in implementation)
-        for param_name, param_value in params.items():
-            if param_name in schema:
-                param_spec = schema[param_name]
-                if isinstance(param_spec, dict) and "type" in param_spec:
-                    expected_type = param_spec["type"]
-                    # Basic type validation (string, number, boolean, array, object)
-                    if not self._check_type(param_value, expected_type):
-                        return f"Parameter {param_name} has wrong type (expected {expected_type})"
-
+        try:
+            tool.validate_arguments(params)
+        except ToolArgumentError as e:
+            return str(e)
         return None
 
-    def _check_type(self, value: Any, expected_type: str) -> bool:
-        """
-        Check if value matches expected JSON schema type.
-
-        Args:
-            value: Value to check
-            expected_type: JSON schema type (string, number, boolean, array, object, null)
-
-        Returns:
-            True if type matches, False otherwise
-        """
-        type_mapping: dict[str, type | tuple[type, ...]] = {
-            "string": str,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-            "null": type(None),
-        }
-
-        if expected_type not in type_mapping:
-            # Unknown type - allow it (detailed validation in implementation)
-            return True
-
-        expected_python_type = type_mapping[expected_type]
-        return isinstance(value, expected_python_type)
-
     def _should_retry(self, error: Exception) -> bool:
         """
         Determine if error is retryable.
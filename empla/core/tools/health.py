@@ -14,17 +14,184 @@ Architecture:
        ▼
   Per-integration stats: success_count, failure_count, avg_latency,
   last_error, last_success, status (healthy/degraded/down)
+  Per-integration and per-tool sliding windows: p50/p95/p99, error rate
+
+The lifetime counters answer "how has this integration behaved since the
+runner started"; they cannot show that HubSpot got slow five minutes ago.
+Each integration and each tool therefore also keeps a SlidingLatencyWindow:
+a ring of one-minute LatencyHistograms (log-linear, HDR-style buckets, ~6%
+relative error) that are merged on read. Histograms merge by summing
+bucket counts, so the integration window, a fleet-wide rollup, or a longer
+window can all be built from the same slots without keeping raw samples.
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import time
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Linear sub-buckets per power of two. 8 bounds the relative error of a
+# bucket midpoint at 1/16 (~6%) and of its bounds at 1/8, while 10 minutes
+# of latency still fits in ~140 buckets.
+_SUB_BUCKETS = 8
+_SUB_BUCKET_BITS = 3
+
+DEFAULT_WINDOW_SECONDS = 300.0
+DEFAULT_SLOT_SECONDS = 60.0
+
+
+def _bucket_index(value_ms: float) -> int:
+    """Map a latency to its log-linear bucket.
+
+    Values below ``_SUB_BUCKETS`` ms get 1ms-wide buckets; above that each
+    power of two ``[2^k, 2^(k+1))`` is split into ``_SUB_BUCKETS`` equal parts.
+    """
+    if value_ms < _SUB_BUCKETS:
+        return max(int(value_ms), 0)
+    mantissa, exponent = math.frexp(value_ms)
+    return (exponent - _SUB_BUCKET_BITS - 1) * _SUB_BUCKETS + int(mantissa * 2 * _SUB_BUCKETS)
+
+
+def _bucket_bounds(index: int) -> tuple[float, float]:
+    """Return the ``[lower, upper)`` latency range of a bucket."""
+    if index < _SUB_BUCKETS:
+        return float(index), float(index + 1)
+    width = 2.0 ** (index // _SUB_BUCKETS - 1)
+    lower = (_SUB_BUCKETS + index % _SUB_BUCKETS) * width
+    return lower, lower + width
+
+
+@dataclass
+class LatencyHistogram:
+    """Mergeable latency distribution with call outcomes.
+
+    Stores bucket counts rather than samples, so memory is bounded by the
+    latency range rather than the call volume and two histograms combine
+    with :meth:`merge`.
+    """
+
+    buckets: dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    sum_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, duration_ms: float, *, error: bool = False, timeout: bool = False) -> None:
+        index = _bucket_index(duration_ms)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        if timeout:
+            self.timeouts += 1
+        elif error:
+            self.errors += 1
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        self.count += other.count
+        self.errors += other.errors
+        self.timeouts += other.timeouts
+        self.sum_ms += other.sum_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    @classmethod
+    def merged(cls, histograms: Iterable[LatencyHistogram]) -> LatencyHistogram:
+        result = cls()
+        for histogram in histograms:
+            result.merge(histogram)
+        return result
+
+    @property
+    def error_rate(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return (self.errors + self.timeouts) / self.count
+
+    @property
+    def timeout_rate(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self.timeouts / self.count
+
+    def percentile(self, q: float) -> float:
+        """Latency at quantile ``q`` (0-1), as the midpoint of its bucket.
+
+        Capped at the observed maximum so a single slow call never reports
+        a p99 above the slowest latency actually seen.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                lower, upper = _bucket_bounds(index)
+                return min((lower + upper) / 2, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.count,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "error_rate": round(self.error_rate, 3),
+            "p50_ms": round(self.percentile(0.50), 1),
+            "p95_ms": round(self.percentile(0.95), 1),
+            "p99_ms": round(self.percentile(0.99), 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class SlidingLatencyWindow:
+    """Latency histogram over the last ``window_seconds``.
+
+    Calls land in the histogram for the current ``slot_seconds`` slot;
+    slots older than the window are dropped on write and skipped on read,
+    so the window slides in slot-sized steps without per-call bookkeeping.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        slot_seconds: float = DEFAULT_SLOT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self._slot_seconds = slot_seconds
+        self._slot_count = max(math.ceil(window_seconds / slot_seconds), 1)
+        self._clock = clock
+        self._slots: deque[tuple[int, LatencyHistogram]] = deque()
+
+    def _current_slot(self) -> int:
+        return int(self._clock() // self._slot_seconds)
+
+    def record(self, duration_ms: float, *, error: bool = False, timeout: bool = False) -> None:
+        slot = self._current_slot()
+        if not self._slots or self._slots[-1][0] != slot:
+            self._slots.append((slot, LatencyHistogram()))
+            while self._slots[0][0] <= slot - self._slot_count:
+                self._slots.popleft()
+        self._slots[-1][1].record(duration_ms, error=error, timeout=timeout)
+
+    def snapshot(self) -> LatencyHistogram:
+        """Merge the slots still inside the window into one histogram."""
+        oldest = self._current_slot() - self._slot_count
+        return LatencyHistogram.merged(h for slot, h in self._slots if slot > oldest)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"seconds": self.window_seconds, **self.snapshot().to_dict()}
+
 
 @dataclass
 class IntegrationHealth:
@@ -38,6 +205,7 @@ class IntegrationHealth:
     last_success_at: float | None = None
     last_failure_at: float | None = None
     last_error: str | None = None
+    window: SlidingLatencyWindow = field(default_factory=SlidingLatencyWindow, repr=False)
 
     @property
     def total_calls(self) -> int:
@@ -63,20 +231,26 @@ class IntegrationHealth:
 
     @property
     def status(self) -> str:
-        """Derive health status from cumulative call outcomes.
+        """Derive health status from recent call outcomes.
 
         - "healthy": error rate < 20%
         - "degraded": error rate 20-50% or timeout rate > 5%
         - "down": error rate > 50%
 
-        Note: Uses all-time counters. Call reset() at cycle boundaries
-        to get fresh per-cycle status if needed.
+        Rates come from the sliding window, so a provider that recovered
+        (or broke) in the last few minutes is reported as such. With no
+        calls in the window the all-time counters are the only evidence.
         """
-        if self.total_calls == 0:
+        recent = self.window.snapshot()
+        if recent.count:
+            error_rate, timeout_rate = recent.error_rate, recent.timeout_rate
+        elif self.total_calls:
+            error_rate, timeout_rate = self.error_rate, self.timeout_rate
+        else:
             return "unknown"
-        if self.error_rate > 0.5:
+        if error_rate > 0.5:
             return "down"
-        if self.error_rate >= 0.2 or self.timeout_rate > 0.05:
+        if error_rate >= 0.2 or timeout_rate > 0.05:
             return "degraded"
         return "healthy"
 
@@ -91,6 +265,7 @@ class IntegrationHealth:
             "avg_latency_ms": round(self.avg_latency_ms, 1),
             "error_rate": round(self.error_rate, 3),
             "last_error": self.last_error,
+            "window": self.window.to_dict(),
         }
 
 
@@ -110,8 +285,20 @@ class IntegrationHealthMonitor:
         {"name": "hubspot", "status": "degraded", ...}
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        slot_seconds: float = DEFAULT_SLOT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._integrations: dict[str, IntegrationHealth] = {}
+        self._tools: dict[str, SlidingLatencyWindow] = {}
+        self._window_seconds = window_seconds
+        self._slot_seconds = slot_seconds
+        self._clock = clock
+
+    def _new_window(self) -> SlidingLatencyWindow:
+        return SlidingLatencyWindow(self._window_seconds, self._slot_seconds, self._clock)
 
     def record(
         self,
@@ -120,13 +307,22 @@ class IntegrationHealthMonitor:
         duration_ms: float,
         error: str | None = None,
         is_timeout: bool = False,
+        *,
+        tool: str | None = None,
     ) -> None:
-        """Record a tool call outcome for an integration."""
+        """Record a tool call outcome for an integration (and the tool, if given)."""
         if integration not in self._integrations:
-            self._integrations[integration] = IntegrationHealth(name=integration)
+            self._integrations[integration] = IntegrationHealth(
+                name=integration, window=self._new_window()
+            )
 
         health = self._integrations[integration]
         health.total_duration_ms += duration_ms
+        health.window.record(duration_ms, error=not success, timeout=is_timeout)
+        if tool is not None:
+            if tool not in self._tools:
+                self._tools[tool] = self._new_window()
+            self._tools[tool].record(duration_ms, error=not success, timeout=is_timeout)
         now = time.time()
 
         if success:
@@ -152,6 +348,28 @@ class IntegrationHealthMonitor:
         """Get health status for all tracked integrations."""
         return [h.to_dict() for h in self._integrations.values()]
 
+    def get_tool_status(self, tool: str) -> dict[str, Any]:
+        """Get the sliding-window latency and error rate for one tool."""
+        window = self._tools.get(tool) or self._new_window()
+        return {"name": tool, "window": window.to_dict()}
+
+    def get_tool_window(self, tool: str) -> LatencyHistogram | None:
+        """Merged sliding-window histogram for one tool, or None if never called."""
+        window = self._tools.get(tool)
+        return window.snapshot() if window is not None else None
+
+    def get_all_tool_status(self) -> list[dict[str, Any]]:
+        """Get sliding-window stats for every tool that has been called."""
+        return [self.get_tool_status(tool) for tool in self._tools]
+
+    def _failing_tools(self, integration: str) -> list[str]:
+        prefix = f"{integration}."
+        return sorted(
+            tool
+            for tool, window in self._tools.items()
+            if tool.startswith(prefix) and window.snapshot().error_rate > 0.5
+        )
+
     def get_beliefs(self) -> list[dict[str, Any]]:
         """Generate BDI-compatible belief updates from health status.
 
@@ -160,6 +378,12 @@ class IntegrationHealthMonitor:
         """
         beliefs = []
         for health in self._integrations.values():
+            recent = health.window.snapshot()
+            latency = {
+                "p50_ms": round(recent.percentile(0.50), 1),
+                "p95_ms": round(recent.percentile(0.95), 1),
+                "p99_ms": round(recent.percentile(0.99), 1),
+            }
             if health.status == "down":
                 beliefs.append(
                     {
@@ -169,6 +393,9 @@ class IntegrationHealthMonitor:
                             "status": "down",
                             "error": health.last_error,
                             "error_rate": health.error_rate,
+                            "recent_error_rate": round(recent.error_rate, 3),
+                            "latency_ms": latency,
+                            "failing_tools": self._failing_tools(health.name),
                         },
                         "confidence": 0.95,
                         "source": "health_monitor",
@@ -183,6 +410,9 @@ class IntegrationHealthMonitor:
                             "status": "degraded",
                             "error": health.last_error,
                             "avg_latency_ms": health.avg_latency_ms,
+                            "recent_error_rate": round(recent.error_rate, 3),
+                            "latency_ms": latency,
+                            "failing_tools": self._failing_tools(health.name),
                         },
                         "confidence": 0.8,
                         "source": "health_monitor",
@@ -193,3 +423,4 @@ class IntegrationHealthMonitor:
     def reset(self) -> None:
         """Reset all health stats."""
         self._integrations.clear()
+        self._tools.clear()
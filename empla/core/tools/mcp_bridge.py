@@ -7,6 +7,10 @@ discovers their tools, and registers them into the ToolRegistry.
 MCP tools appear as "{server_name}.{tool_name}" in the registry,
 avoiding name collisions between servers.
 
+With a ``pool`` (see mcp_pool.py), connections are leased from the
+process-wide MCPServerPool instead: sessions are shared per (tenant,
+server config) and tool catalogs are discovered once.
+
 Requires the `mcp` optional dependency: pip install empla[mcp]
 
 Example:
@@ -23,15 +27,25 @@ Example:
 from __future__ import annotations
 
 import logging
-from typing import Any, Literal
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, Field, model_validator
 
 from .base import Tool
+from .mcp_pool import DiscoveredTool
 from .registry import ToolRegistry
 
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from .mcp_pool import MCPServerPool
+
 logger = logging.getLogger(__name__)
 
+# Result cache TTL for MCP tools annotated with ``readOnlyHint``
+MCP_READ_ONLY_CACHE_TTL = 30.0
+
 
 class MCPServerConfig(BaseModel):
     """Configuration for connecting to an MCP server."""
@@ -68,7 +82,10 @@ class MCPServerConfig(BaseModel):
 
 
 class _MCPToolImplementation:
-    """Wraps an MCP session.call_tool() as a ToolImplementation."""
+    """Wraps an MCP session.call_tool() as a ToolImplementation.
+
+    ``session`` is a ClientSession or a pooled MCPServerHandle.
+    """
 
     def __init__(self, session: Any, tool_name: str) -> None:
         self._session = session
@@ -106,9 +123,17 @@ class MCPBridge:
         >>> await bridge.disconnect_all()
     """
 
-    def __init__(self, tool_registry: ToolRegistry) -> None:
+    def __init__(
+        self,
+        tool_registry: ToolRegistry,
+        pool: MCPServerPool | None = None,
+        tenant_id: UUID | None = None,
+    ) -> None:
         self._tool_registry = tool_registry
+        self._pool = pool
+        self._tenant_id = tenant_id
         # server_name -> (session, context_manager, registered_tool_names)
+        # or, when pooled, (handle, registered_tool_names)
         self._connections: dict[str, dict[str, Any]] = {}
 
     @property
@@ -134,6 +159,8 @@ class MCPBridge:
             logger.warning(f"Already connected to MCP server: {config.name}")
             return list(self._connections[config.name].get("tool_names", []))
 
+        if self._pool is not None:
+            return await self._connect_pooled(config)
         if config.transport == "stdio":
             return await self._connect_stdio(config)
         return await self._connect_http(config)
@@ -275,12 +302,37 @@ class MCPBridge:
 
         return tool_names
 
+    async def _connect_pooled(self, config: MCPServerConfig) -> list[str]:
+        """Lease the server from the shared pool and register its tools."""
+        assert self._pool is not None
+        handle = await self._pool.acquire(config, tenant_id=self._tenant_id)
+        try:
+            tools = await handle.list_tools()
+            tool_names = self._register_tools(config.name, tools, handle)
+        except BaseException:
+            await handle.release()
+            raise
+
+        self._connections[config.name] = {
+            "handle": handle,
+            "tool_names": tool_names,
+            "config": config,
+        }
+
+        logger.info(
+            f"Attached to pooled MCP server '{config.name}', registered {len(tool_names)} tools",
+            extra={
+                "server_name": config.name,
+                "tool_count": len(tool_names),
+                "tools": tool_names,
+            },
+        )
+
+        return tool_names
+
     async def _register_server_tools(self, server_name: str, session: Any) -> list[str]:
         """Discover tools from MCP server and register them.
 
-        Registration is atomic: if any unexpected error occurs mid-loop,
-        all tools registered so far are rolled back.
-
         Args:
             server_name: Name prefix for tools
             session: MCP ClientSession
@@ -289,28 +341,35 @@ class MCPBridge:
             List of registered tool names
         """
         tools_result = await session.list_tools()
+        tools = (DiscoveredTool.from_mcp(t) for t in tools_result.tools)
+        return self._register_tools(server_name, tools, session)
+
+    def _register_tools(
+        self, server_name: str, tools: Iterable[DiscoveredTool], session: Any
+    ) -> list[str]:
+        """Register discovered tools, calling them through ``session``.
+
+        Registration is atomic: if any unexpected error occurs mid-loop,
+        all tools registered so far are rolled back.
+        """
         registered_names: list[str] = []
 
         try:
-            for mcp_tool in tools_result.tools:
-                prefixed_name = f"{server_name}.{mcp_tool.name}"
-
-                # Build Tool model from MCP tool definition
-                input_schema = {}
-                if hasattr(mcp_tool, "inputSchema") and mcp_tool.inputSchema:
-                    input_schema = mcp_tool.inputSchema
-                elif hasattr(mcp_tool, "input_schema") and mcp_tool.input_schema:
-                    input_schema = mcp_tool.input_schema
+            for discovered in tools:
+                prefixed_name = f"{server_name}.{discovered.name}"
 
+                # Servers that mark a tool read-only let ToolRouter serve
+                # repeat calls from its result cache for a short while.
                 tool = Tool(
                     name=prefixed_name,
-                    description=mcp_tool.description or f"MCP tool: {mcp_tool.name}",
-                    parameters_schema=input_schema,
+                    description=discovered.description or f"MCP tool: {discovered.name}",
+                    parameters_schema=discovered.input_schema,
                     category="mcp",
                     tags=["mcp", server_name],
+                    cache_ttl_seconds=MCP_READ_ONLY_CACHE_TTL if discovered.read_only else None,
                 )
 
-                impl = _MCPToolImplementation(session, mcp_tool.name)
+                impl = _MCPToolImplementation(session, discovered.name)
 
                 try:
                     self._tool_registry.register_tool(tool, impl)
@@ -318,7 +377,7 @@ class MCPBridge:
                 except ValueError:
                     logger.warning(
                         f"Tool '{prefixed_name}' already registered, skipping",
-                        extra={"server_name": server_name, "tool_name": mcp_tool.name},
+                        extra={"server_name": server_name, "tool_name": discovered.name},
                     )
         except Exception:
             # Rollback: remove any tools we already registered
@@ -343,6 +402,17 @@ class MCPBridge:
         for tool_name in conn.get("tool_names", []):
             self._tool_registry.unregister_tool(tool_name)
 
+        # Pooled: hand the lease back; the pool owns the sessions
+        handle = conn.get("handle")
+        if handle is not None:
+            try:
+                await handle.release()
+            except Exception:
+                logger.warning(
+                    f"Error releasing pooled MCP server {server_name}",
+                    exc_info=True,
+                )
+
         # Close session CM, then transport CM (reverse order of creation)
         session_cm = conn.get("session_cm")
         if session_cm:
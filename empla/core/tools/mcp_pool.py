@@ -0,0 +1,585 @@
+"""
+empla.core.tools.mcp_pool - Shared MCP Server Pool
+
+Every MCPBridge used to open its own stdio subprocess or HTTP session per
+server, discover tools with ``list_tools`` and then push every call through
+that one session. ``MCPServerPool`` replaces that with process-wide
+sessions shared per (tenant, server config):
+
+  - One session per server by default; MCP multiplexes concurrent calls
+    over it. ``sessions_per_server`` > 1 lets a call open another session
+    when all are busy, at the cost of one more subprocess each for stdio
+    servers.
+  - Sessions open lazily on the first tool call, so a runner whose tool
+    catalog is already known starts without spawning anything.
+  - Tool catalogs are cached in memory and, through a ``ToolCatalogStore``,
+    persisted for other runner processes of the tenant under a
+    credential-free ``catalog_key``, so employees with their own tokens
+    (and refreshed tokens) reuse one catalog.
+  - Idle sessions are pinged periodically; dead ones are dropped and the
+    next call reconnects. A call that fails because its session died is
+    retried once on a fresh session.
+
+Sessions are entered and exited inside a dedicated owner task because the
+MCP transports use anyio cancel scopes, which must be exited by the task
+that entered them.
+
+Example:
+    >>> pool = get_mcp_pool()
+    >>> handle = await pool.acquire(config, tenant_id=tenant_id)
+    >>> tools = await handle.list_tools()        # cached after first runner
+    >>> await handle.call_tool("query", arguments={"q": "open deals"})
+    >>> await handle.release()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID
+
+import anyio
+
+if TYPE_CHECKING:
+    from .mcp_bridge import MCPServerConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSIONS_PER_SERVER = 1
+DEFAULT_HEALTH_CHECK_INTERVAL = 60.0
+DEFAULT_CATALOG_TTL = 86400.0
+DEFAULT_CONNECT_TIMEOUT = 30.0
+
+# mcp.types.CONNECTION_CLOSED — the error code McpError carries when the
+# transport went away underneath an in-flight request.
+_CONNECTION_CLOSED = -32000
+
+SessionOpener = Callable[[AsyncExitStack, "MCPServerConfig"], Awaitable[Any]]
+
+
+@dataclass
+class DiscoveredTool:
+    """Transport-independent description of one MCP tool."""
+
+    name: str
+    description: str | None = None
+    input_schema: dict[str, Any] = field(default_factory=dict)
+    read_only: bool = False
+
+    @classmethod
+    def from_mcp(cls, mcp_tool: Any) -> DiscoveredTool:
+        """Normalize an ``mcp.types.Tool`` (or a look-alike)."""
+        input_schema: dict[str, Any] = {}
+        if getattr(mcp_tool, "inputSchema", None):
+            input_schema = mcp_tool.inputSchema
+        elif getattr(mcp_tool, "input_schema", None):
+            input_schema = mcp_tool.input_schema
+        annotations = getattr(mcp_tool, "annotations", None)
+        return cls(
+            name=mcp_tool.name,
+            description=mcp_tool.description,
+            input_schema=input_schema,
+            read_only=bool(getattr(annotations, "readOnlyHint", False)),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": self.input_schema,
+            "read_only": self.read_only,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DiscoveredTool:
+        return cls(
+            name=data["name"],
+            description=data.get("description"),
+            input_schema=data.get("input_schema") or {},
+            read_only=bool(data.get("read_only", False)),
+        )
+
+
+class ToolCatalogStore(Protocol):
+    """Persists discovered tool catalogs across runner processes."""
+
+    async def load(
+        self, *, tenant_id: UUID | None, config: MCPServerConfig, key: str, max_age: float
+    ) -> list[DiscoveredTool] | None:
+        """Return the stored catalog if it matches ``key`` (a :func:`catalog_key`) and is fresh."""
+        ...
+
+    async def save(
+        self,
+        *,
+        tenant_id: UUID | None,
+        config: MCPServerConfig,
+        key: str,
+        tools: list[DiscoveredTool],
+    ) -> None:
+        """Store the catalog discovered for ``key``."""
+        ...
+
+
+def server_key(config: MCPServerConfig, tenant_id: UUID | None = None) -> str:
+    """Fingerprint of everything that determines which server a session talks to.
+
+    The display name is excluded (two names for one server share sessions);
+    credentials in ``env``/``headers`` are included, so employees with their
+    own OAuth tokens never share a session. Only a hash is kept.
+    """
+    material = {
+        "tenant": str(tenant_id) if tenant_id else None,
+        "transport": config.transport,
+        "command": config.command,
+        "url": config.url,
+        "env": config.env,
+        "headers": config.headers,
+    }
+    return _fingerprint(material)
+
+
+def catalog_key(config: MCPServerConfig, tenant_id: UUID | None = None) -> str:
+    """Fingerprint of what determines a server's tool catalog.
+
+    Unlike :func:`server_key` it leaves out ``env`` and ``headers``: those
+    carry per-employee OAuth tokens that change on every refresh, and the
+    catalog must be shared across the tenant's runners.
+    """
+    material = {
+        "tenant": str(tenant_id) if tenant_id else None,
+        "transport": config.transport,
+        "command": config.command,
+        "url": config.url,
+    }
+    return _fingerprint(material)
+
+
+def _fingerprint(material: dict[str, Any]) -> str:
+    raw = json.dumps(material, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:24]
+
+
+async def open_mcp_session(stack: AsyncExitStack, config: MCPServerConfig) -> Any:
+    """Open and initialize a ClientSession whose cleanup is registered on ``stack``."""
+    try:
+        from mcp import ClientSession
+    except ImportError as e:
+        raise ImportError("MCP support requires the 'mcp' package: pip install empla[mcp]") from e
+
+    if config.transport == "stdio":
+        from mcp import StdioServerParameters
+        from mcp.client.stdio import stdio_client
+
+        assert config.command  # Guaranteed by model_validator
+        params = StdioServerParameters(
+            command=config.command[0],
+            args=config.command[1:],
+            env=config.env or None,
+        )
+        read_stream, write_stream = await stack.enter_async_context(stdio_client(params))
+    else:
+        from mcp.client.streamable_http import streamablehttp_client
+
+        assert config.url  # Guaranteed by model_validator
+        transport_kwargs: dict[str, Any] = {}
+        if config.headers:
+            import httpx
+
+            http_client = httpx.AsyncClient(headers=config.headers)
+            stack.push_async_callback(http_client.aclose)
+            transport_kwargs["http_client"] = http_client
+        read_stream, write_stream, _ = await stack.enter_async_context(
+            streamablehttp_client(config.url, **transport_kwargs)
+        )
+
+    session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+    await session.initialize()
+    return session
+
+
+def _is_connection_error(exc: BaseException) -> bool:
+    if isinstance(
+        exc,
+        (
+            ConnectionError,
+            EOFError,
+            anyio.ClosedResourceError,
+            anyio.BrokenResourceError,
+            anyio.EndOfStream,
+        ),
+    ):
+        return True
+    return getattr(getattr(exc, "error", None), "code", None) == _CONNECTION_CLOSED
+
+
+class _PooledSession:
+    """One MCP session, owned by a background task for its whole lifetime."""
+
+    def __init__(self, config: MCPServerConfig, opener: SessionOpener) -> None:
+        self._config = config
+        self._opener = opener
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self.session: Any = None
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and not self._closing.is_set()
+
+    async def start(self, connect_timeout: float) -> None:
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        try:
+            async with asyncio.timeout(connect_timeout):
+                await asyncio.shield(ready)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def _run(self, ready: asyncio.Future[None]) -> None:
+        try:
+            async with AsyncExitStack() as stack:
+                self.session = await self._opener(stack, self._config)
+                ready.set_result(None)
+                await self._closing.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(
+                    "MCP session for '%s' ended with an error",
+                    self._config.name,
+                    exc_info=True,
+                    extra={"server_name": self._config.name},
+                )
+        finally:
+            self.session = None
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None and not self._task.done():
+            try:
+                await asyncio.wait_for(self._task, timeout=5.0)
+            except TimeoutError:
+                self._task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._task
+
+
+@dataclass
+class _ServerEntry:
+    key: str
+    catalog_key: str
+    config: MCPServerConfig
+    tenant_id: UUID | None
+    sessions: list[_PooledSession] = field(default_factory=list)
+    tools: list[DiscoveredTool] | None = None
+    refs: int = 0
+    open_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    discovery_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class MCPServerHandle:
+    """A bridge's lease on a pooled server. Quacks like a ClientSession for tools."""
+
+    def __init__(self, pool: MCPServerPool, entry: _ServerEntry) -> None:
+        self._pool = pool
+        self._entry = entry
+        self._released = False
+
+    @property
+    def key(self) -> str:
+        return self._entry.key
+
+    async def list_tools(self) -> list[DiscoveredTool]:
+        return await self._pool._list_tools(self._entry)
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> Any:
+        return await self._pool._call_tool(self._entry, name, arguments or {})
+
+    async def release(self) -> None:
+        if not self._released:
+            self._released = True
+            await self._pool._release(self._entry)
+
+
+class MCPServerPool:
+    """Process-wide MCP sessions shared per (tenant, server config)."""
+
+    def __init__(
+        self,
+        *,
+        sessions_per_server: int = DEFAULT_SESSIONS_PER_SERVER,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        catalog_ttl: float = DEFAULT_CATALOG_TTL,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        catalog_store: ToolCatalogStore | None = None,
+        opener: SessionOpener = open_mcp_session,
+    ) -> None:
+        self._sessions_per_server = sessions_per_server
+        self._health_check_interval = health_check_interval
+        self._catalog_ttl = catalog_ttl
+        self._connect_timeout = connect_timeout
+        self._catalog_store = catalog_store
+        self._opener = opener
+        self._entries: dict[str, _ServerEntry] = {}
+        self._health_task: asyncio.Task[None] | None = None
+
+    def set_catalog_store(self, store: ToolCatalogStore | None) -> None:
+        """Attach the store used to share tool catalogs across processes."""
+        self._catalog_store = store
+
+    async def acquire(
+        self, config: MCPServerConfig, *, tenant_id: UUID | None = None
+    ) -> MCPServerHandle:
+        """Lease the pooled server for ``config``. No session is opened yet."""
+        key = server_key(config, tenant_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _ServerEntry(
+                key=key,
+                catalog_key=catalog_key(config, tenant_id),
+                config=config,
+                tenant_id=tenant_id,
+            )
+            self._entries[key] = entry
+        entry.refs += 1
+        self._ensure_health_task()
+        return MCPServerHandle(self, entry)
+
+    async def _release(self, entry: _ServerEntry) -> None:
+        entry.refs -= 1
+        if entry.refs <= 0:
+            # Keep the entry (and its catalog); only the sessions go.
+            entry.refs = 0
+            sessions, entry.sessions = entry.sessions, []
+            for pooled in sessions:
+                await pooled.close()
+
+    # ------------------------------------------------------------------
+    # Discovery
+    # ------------------------------------------------------------------
+
+    async def _list_tools(self, entry: _ServerEntry) -> list[DiscoveredTool]:
+        if entry.tools is not None:
+            return entry.tools
+        async with entry.discovery_lock:
+            if entry.tools is not None:
+                return entry.tools
+
+            tools = await self._load_catalog(entry)
+            if tools is None:
+                pooled = await self._session_for(entry)
+                result = await pooled.session.list_tools()
+                tools = [DiscoveredTool.from_mcp(t) for t in result.tools]
+                await self._save_catalog(entry, tools)
+            entry.tools = tools
+            return tools
+
+    async def _load_catalog(self, entry: _ServerEntry) -> list[DiscoveredTool] | None:
+        if self._catalog_store is None or self._catalog_ttl <= 0:
+            return None
+        try:
+            return await self._catalog_store.load(
+                tenant_id=entry.tenant_id,
+                config=entry.config,
+                key=entry.catalog_key,
+                max_age=self._catalog_ttl,
+            )
+        except Exception:
+            logger.warning(
+                "Failed to load cached MCP tool catalog, discovering instead",
+                exc_info=True,
+                extra={"server_name": entry.config.name},
+            )
+            return None
+
+    async def _save_catalog(self, entry: _ServerEntry, tools: list[DiscoveredTool]) -> None:
+        if self._catalog_store is None:
+            return
+        try:
+            await self._catalog_store.save(
+                tenant_id=entry.tenant_id,
+                config=entry.config,
+                key=entry.catalog_key,
+                tools=tools,
+            )
+        except Exception:
+            logger.warning(
+                "Failed to store MCP tool catalog",
+                exc_info=True,
+                extra={"server_name": entry.config.name},
+            )
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+
+    async def _session_for(self, entry: _ServerEntry) -> _PooledSession:
+        """Least busy live session, opening another while all are busy."""
+
+        def pick() -> _PooledSession | None:
+            entry.sessions = [s for s in entry.sessions if s.alive]
+            best = min(entry.sessions, key=lambda s: s.in_flight, default=None)
+            if best is not None and (
+                best.in_flight == 0 or len(entry.sessions) >= self._sessions_per_server
+            ):
+                return best
+            return None
+
+        pooled = pick()
+        if pooled is not None:
+            return pooled
+        async with entry.open_lock:
+            pooled = pick()
+            if pooled is not None:
+                return pooled
+            fresh = _PooledSession(entry.config, self._opener)
+            try:
+                await fresh.start(self._connect_timeout)
+            except Exception:
+                fallback = min(entry.sessions, key=lambda s: s.in_flight, default=None)
+                if fallback is None:
+                    raise
+                logger.warning(
+                    "Could not open an extra MCP session for '%s', sharing an existing one",
+                    entry.config.name,
+                    exc_info=True,
+                    extra={"server_name": entry.config.name},
+                )
+                return fallback
+            entry.sessions.append(fresh)
+            logger.info(
+                "Opened MCP session for '%s' (%d/%d)",
+                entry.config.name,
+                len(entry.sessions),
+                self._sessions_per_server,
+                extra={"server_name": entry.config.name},
+            )
+            return fresh
+
+    async def _call_tool(self, entry: _ServerEntry, name: str, arguments: dict[str, Any]) -> Any:
+        for attempt in range(2):
+            pooled = await self._session_for(entry)
+            pooled.in_flight += 1
+            try:
+                session = pooled.session
+                if session is None:
+                    raise ConnectionError("MCP session closed")
+                return await session.call_tool(name, arguments=arguments)
+            except Exception as e:
+                if attempt or not _is_connection_error(e):
+                    raise
+                logger.warning(
+                    "MCP session for '%s' lost, reconnecting",
+                    entry.config.name,
+                    extra={"server_name": entry.config.name, "tool_name": name},
+                )
+                await self._discard(entry, pooled)
+            finally:
+                pooled.in_flight -= 1
+                pooled.last_used = time.monotonic()
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _discard(self, entry: _ServerEntry, pooled: _PooledSession) -> None:
+        if pooled in entry.sessions:
+            entry.sessions.remove(pooled)
+        await pooled.close()
+
+    # ------------------------------------------------------------------
+    # Health
+    # ------------------------------------------------------------------
+
+    def _ensure_health_task(self) -> None:
+        task = self._health_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_check_interval)
+            await self.check_health()
+
+    async def check_health(self) -> None:
+        """Ping idle sessions and drop the ones that do not answer."""
+        for entry in list(self._entries.values()):
+            for pooled in list(entry.sessions):
+                if pooled.in_flight or not pooled.alive:
+                    continue
+                try:
+                    async with asyncio.timeout(10.0):
+                        await pooled.session.send_ping()
+                except Exception:
+                    logger.warning(
+                        "MCP session for '%s' failed health check, dropping it",
+                        entry.config.name,
+                        exc_info=True,
+                        extra={"server_name": entry.config.name},
+                    )
+                    await self._discard(entry, pooled)
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Per-server pool state for observability."""
+        return [
+            {
+                "server_name": entry.config.name,
+                "refs": entry.refs,
+                "sessions": len(entry.sessions),
+                "in_flight": sum(s.in_flight for s in entry.sessions),
+                "tools_cached": entry.tools is not None,
+            }
+            for entry in self._entries.values()
+        ]
+
+    async def aclose(self) -> None:
+        """Close every session and stop health checks."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._health_task
+            self._health_task = None
+        for entry in self._entries.values():
+            sessions, entry.sessions = entry.sessions, []
+            for pooled in sessions:
+                await pooled.close()
+        self._entries.clear()
+
+
+_pool: MCPServerPool | None = None
+
+
+def get_mcp_pool() -> MCPServerPool:
+    """Process-wide pool configured from ``EmplaSettings``."""
+    global _pool  # noqa: PLW0603
+    if _pool is None:
+        from empla.settings import get_settings
+
+        settings = get_settings()
+        _pool = MCPServerPool(
+            sessions_per_server=settings.mcp_pool_sessions_per_server,
+            health_check_interval=settings.mcp_pool_health_check_interval,
+            catalog_ttl=settings.mcp_tool_catalog_ttl,
+        )
+    return _pool
+
+
+async def close_mcp_pool() -> None:
+    """Close the process pool if one was created."""
+    global _pool  # noqa: PLW0603
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
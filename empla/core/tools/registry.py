@@ -72,6 +72,9 @@ class ToolRegistry:
                     f"Tool with name '{tool.name}' already registered with different ID"
                 )
 
+        # Compile the argument validator now so calls never parse the schema
+        tool.compile_validator()
+
         # Store tool and implementation
         self._tools[tool.tool_id] = tool
         self._implementations[tool.tool_id] = implementation
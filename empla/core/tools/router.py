@@ -9,10 +9,23 @@ Combines ToolRegistry + IntegrationRouters behind a single interface:
 All tool calls pass through a trust boundary (validate allowlist,
 audit log, rate limit) and a timeout wrapper before execution.
 
+Each tool's timeout comes from TimeoutPolicy: its recent p99 latency with
+headroom, clamped between a floor and the tool's ``timeout_seconds`` (or the
+router default). Inside a BDI cycle the remaining cycle budget
+(empla.core.deadline) caps it further; a call cut short by the cycle
+deadline is reported as ``deadline_exceeded`` and not held against the
+integration's health.
+
+Tools that declare ``cache_ttl_seconds`` have successful results served
+from a ToolResultCache until the TTL expires, a webhook arrives for the
+integration, or a write through the same integration succeeds.
+
 Architecture:
   LLM → execute_tool_call()
          ├── TrustBoundary.validate() → DENY? return error
-         ├── asyncio.timeout(30s)
+         ├── Tool.validate_arguments() → INVALID? return error with paths
+         ├── ToolResultCache.get() → HIT? return cached copy
+         ├── asyncio.timeout(min(tool timeout, cycle time left))
          └── _execute_standalone_tool() → ActionResult
 """
 
@@ -24,11 +37,15 @@ import time
 from typing import Any
 from uuid import UUID
 
+from empla.core.deadline import current_deadline
 from empla.core.tools.base import ActionResult
 
-from .base import ToolImplementation
+from .base import Tool, ToolImplementation
+from .cache import ToolResultCache, credential_fingerprint
 from .health import IntegrationHealthMonitor
 from .registry import ToolRegistry
+from .schema import ToolArgumentError
+from .timeouts import TimeoutPolicy
 from .trust import TrustBoundary
 
 logger = logging.getLogger(__name__)
@@ -70,12 +87,18 @@ class ToolRouter:
         tool_registry: ToolRegistry | None = None,
         trust_boundary: TrustBoundary | None = None,
         tool_timeout: float = DEFAULT_TOOL_TIMEOUT,
+        result_cache: ToolResultCache | None = None,
+        timeout_policy: TimeoutPolicy | None = None,
     ) -> None:
         self._tool_registry = tool_registry if tool_registry is not None else ToolRegistry()
         self._integrations: dict[str, Any] = {}
         self._trust = trust_boundary if trust_boundary is not None else TrustBoundary()
         self._tool_timeout = tool_timeout
+        self._timeout_policy = timeout_policy if timeout_policy is not None else TimeoutPolicy()
         self._health = IntegrationHealthMonitor()
+        self._result_cache = result_cache if result_cache is not None else ToolResultCache()
+        # Per-integration credential fingerprints, part of every cache key
+        self._credential_keys: dict[str, str] = {}
 
     def register_integration(self, router: Any) -> None:
         """Register all tools from an IntegrationRouter.
@@ -93,6 +116,8 @@ class ToolRouter:
                 name=tool_info["name"],
                 description=tool_info["description"],
                 parameters_schema=tool_info["schema"],
+                cache_ttl_seconds=tool_info.get("cache_ttl"),
+                timeout_seconds=tool_info.get("timeout"),
             )
             impl = _IntegrationToolImpl(router, tool_info["name"])
             self._tool_registry.register_tool(tool, impl)
@@ -112,6 +137,9 @@ class ToolRouter:
         """
         for name, router in self._integrations.items():
             if name in configs:
+                # New credentials: results fetched with the old ones are moot.
+                self._credential_keys[name] = credential_fingerprint(configs[name])
+                self._result_cache.invalidate(name)
                 try:
                     await router.initialize(configs[name])
                     logger.info(f"Initialized integration: {name}")
@@ -160,8 +188,14 @@ class ToolRouter:
 
         All tool calls pass through:
         1. Trust boundary validation (allowlist + rate limit + audit)
-        2. Timeout wrapper (default 30s, configurable)
-        3. Actual tool execution
+        2. Argument validation/coercion with the tool's compiled schema
+        3. Result cache lookup for tools with ``cache_ttl_seconds``
+        4. Timeout wrapper (adaptive per tool, capped by the cycle deadline)
+        5. Actual tool execution
+
+        Results of cacheable tools carry ``metadata["cached"]``; cache hits
+        also carry ``metadata["age_ms"]`` and are flagged on the trust
+        decision so the audit log shows no call reached the provider.
 
         Args:
             employee_id: Employee executing the tool call
@@ -208,26 +242,87 @@ class ToolRouter:
                 error=f"Tool '{tool_name}' has no implementation",
             )
 
-        # ---- Execute with timeout ----
+        # ---- Validate arguments (compiled at registration) ----
+        try:
+            arguments = tool.validate_arguments(arguments)
+        except ToolArgumentError as e:
+            return ActionResult(
+                success=False,
+                error=f"Invalid arguments for '{tool_name}': {e}",
+                metadata={"invalid_arguments": True, "paths": e.paths},
+            )
+
+        # ---- Result cache ----
         integration = self._parse_integration(tool_name)
+        cache_key = None
+        if tool.cache_ttl_seconds:
+            cache_key = self._result_cache.make_key(
+                tool_name,
+                arguments,
+                credential=self._credential_keys.get(integration),
+                employee_id=employee_id,
+            )
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                decision.cached = True
+                return cached
+
+        # ---- Execute with timeout ----
+        timeout = self.get_tool_timeout(tool)
+        deadline = current_deadline()
+        deadline_capped = False
+        if deadline is not None:
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                return ActionResult(
+                    success=False,
+                    error=f"Cycle deadline exceeded; '{tool_name}' was not called",
+                    metadata={"deadline_exceeded": True},
+                )
+            if remaining < timeout:
+                timeout, deadline_capped = remaining, True
+
         start = time.monotonic()
         try:
-            async with asyncio.timeout(self._tool_timeout):
+            async with asyncio.timeout(timeout):
                 result = await self._execute_standalone_tool(tool_name, impl, arguments)
         except TimeoutError:
             duration_ms = (time.monotonic() - start) * 1000
+            if deadline_capped:
+                # The cycle ran out of time, not the tool — keep it out of
+                # the health window so it doesn't skew status or timeouts.
+                logger.warning(
+                    "Tool '%s' cut off by the cycle deadline after %.1fs",
+                    tool_name,
+                    timeout,
+                    extra={
+                        "employee_id": str(employee_id),
+                        "tool_name": tool_name,
+                        "timeout_seconds": timeout,
+                    },
+                )
+                return ActionResult(
+                    success=False,
+                    error=f"Cycle deadline exceeded while '{tool_name}' was running",
+                    metadata={
+                        "timeout": True,
+                        "deadline_exceeded": True,
+                        "duration_ms": duration_ms,
+                    },
+                )
             logger.warning(
                 "Tool '%s' timed out after %.1fs",
                 tool_name,
-                self._tool_timeout,
+                timeout,
                 extra={
                     "employee_id": str(employee_id),
                     "tool_name": tool_name,
-                    "timeout_seconds": self._tool_timeout,
+                    "timeout_seconds": timeout,
                 },
             )
             self._health.record(
                 integration=integration,
+                tool=tool_name,
                 success=False,
                 duration_ms=duration_ms,
                 error="timeout",
@@ -235,7 +330,7 @@ class ToolRouter:
             )
             return ActionResult(
                 success=False,
-                error=f"Tool '{tool_name}' timed out after {self._tool_timeout}s",
+                error=f"Tool '{tool_name}' timed out after {timeout:g}s",
                 metadata={"timeout": True, "duration_ms": duration_ms},
             )
         except Exception:
@@ -243,6 +338,7 @@ class ToolRouter:
             duration_ms = (time.monotonic() - start) * 1000
             self._health.record(
                 integration=integration,
+                tool=tool_name,
                 success=False,
                 duration_ms=duration_ms,
                 error="unexpected_error",
@@ -254,10 +350,19 @@ class ToolRouter:
         result.metadata["duration_ms"] = duration_ms
         self._health.record(
             integration=integration,
+            tool=tool_name,
             success=result.success,
             duration_ms=duration_ms,
             error=result.error,
         )
+
+        if cache_key is not None:
+            result.metadata["cached"] = False
+            self._result_cache.put(cache_key, integration, result, ttl=tool.cache_ttl_seconds)
+        elif result.success:
+            # A successful non-cacheable call may have been a write; drop
+            # this integration's cached reads rather than serve stale data.
+            self._result_cache.invalidate(integration)
         return result
 
     async def _execute_standalone_tool(
@@ -278,6 +383,18 @@ class ToolRouter:
                 error=f"{type(e).__name__}: {e}",
             )
 
+    def invalidate_cached_results(self, provider: str) -> int:
+        """Drop cached results for a provider. Called on inbound webhooks.
+
+        Returns:
+            Number of cache entries removed.
+        """
+        return self._result_cache.invalidate_provider(provider)
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Return result cache counters for observability."""
+        return self._result_cache.stats()
+
     def get_enabled_capabilities(self, employee_id: UUID) -> list[str]:
         """Return registered integration names."""
         return list(self._integrations.keys())
@@ -290,10 +407,26 @@ class ToolRouter:
         """Return trust boundary stats for observability."""
         return self._trust.get_cycle_stats()
 
+    @property
+    def health_monitor(self) -> IntegrationHealthMonitor:
+        """The monitor fed by every tool call (read by cycle metrics)."""
+        return self._health
+
     def get_integration_health(self, integration: str) -> dict[str, Any]:
         """Get health status for a specific integration."""
         return self._health.get_status(integration)
 
+    def get_tool_timeout(self, tool: Tool) -> float:
+        """Current timeout for ``tool``, before any cycle-deadline cap."""
+        return self._timeout_policy.resolve(
+            ceiling=tool.timeout_seconds or self._tool_timeout,
+            window=self._health.get_tool_window(tool.name),
+        )
+
+    def get_tool_health(self, tool_name: str) -> dict[str, Any]:
+        """Get sliding-window latency percentiles and error rate for one tool."""
+        return self._health.get_tool_status(tool_name)
+
     def get_all_integration_health(self) -> list[dict[str, Any]]:
         """Get health status for all tracked integrations."""
         return self._health.get_all_status()
@@ -0,0 +1,523 @@
+"""
+empla.core.tools.schema - Compiled Tool Argument Validators
+
+Turns a tool's ``parameters_schema`` into a validator-and-coercer once, at
+registration time, instead of interpreting the schema dict on every call.
+
+``compile_schema`` walks the schema a single time and builds a tree of
+closures; calling the result does only the checks that schema needs.
+Supported JSON Schema: ``type`` (single or list), ``enum``, ``const``,
+``properties``, ``required``, ``additionalProperties``, ``items``,
+``min/maxItems``, ``min/maxLength``, ``pattern``, ``minimum``/``maximum``
+(and exclusive forms), ``anyOf``/``oneOf``/``allOf``, ``nullable`` and
+local ``$ref`` (``#/$defs/...``, ``#/definitions/...``). Unknown keywords
+are ignored. The legacy flat format used by older tools,
+``{"param": {"type": "string", "required": True}}``, is converted first.
+
+Coercion is deliberately narrow and aimed at what LLMs get wrong:
+numeric/boolean strings ("5", "true"), integral floats for integers, and
+numbers where a string ID is expected. Optional properties also accept
+``null``, matching how ``@tool`` collapses ``X | None`` to ``X``.
+
+Errors carry exact paths (``filters[2].stage``) so the model can fix the
+call instead of guessing.
+
+Example:
+    >>> validate = compile_schema({
+    ...     "type": "object",
+    ...     "properties": {"limit": {"type": "integer", "minimum": 1}},
+    ...     "required": ["limit"],
+    ... })
+    >>> validate({"limit": "5"})
+    {'limit': 5}
+    >>> validate({"limit": 0})
+    Traceback (most recent call last):
+    ToolArgumentError: Parameter limit must be >= 1
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# (value, path, errors) -> coerced value. Errors are (path, message) pairs.
+Path = tuple[str | int, ...]
+Errors = list[tuple[str, str]]
+_Check = Callable[[Any, Path, Errors], Any]
+
+# Keywords that mark a schema as JSON Schema rather than the flat format
+_JSON_SCHEMA_KEYS = ("properties", "$ref", "anyOf", "oneOf", "allOf", "$defs")
+_INT_RE = re.compile(r"^[+-]?\d+$")
+
+
+class ToolArgumentError(ValueError):
+    """Arguments do not match the tool's parameters schema."""
+
+    def __init__(self, errors: Errors) -> None:
+        self.errors = errors
+        super().__init__("; ".join(message for _, message in errors))
+
+    @property
+    def paths(self) -> list[str]:
+        return [path for path, _ in self.errors]
+
+
+def format_path(path: Path) -> str:
+    """``("filters", 2, "stage")`` -> ``"filters[2].stage"``."""
+    if not path:
+        return "arguments"
+    parts: list[str] = []
+    for segment in path:
+        if isinstance(segment, int):
+            parts.append(f"[{segment}]")
+        else:
+            parts.append(f".{segment}" if parts else segment)
+    return "".join(parts)
+
+
+def _fail(errors: Errors, path: Path, template: str) -> None:
+    # Plain replace, not str.format: templates embed schema values (enums,
+    # regex patterns) that may contain braces.
+    where = format_path(path)
+    errors.append((where, template.replace("{path}", where)))
+
+
+def _identity(value: Any, _path: Path, _errors: Errors) -> Any:
+    return value
+
+
+# ----------------------------------------------------------------------------
+# Type coercion
+# ----------------------------------------------------------------------------
+
+_MISSING = object()
+
+
+def _as_string(value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return _MISSING
+
+
+def _as_integer(value: Any) -> Any:
+    if isinstance(value, bool):
+        return _MISSING
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and _INT_RE.match(value.strip()):
+        return int(value)
+    return _MISSING
+
+
+def _as_number(value: Any) -> Any:
+    if isinstance(value, bool):
+        return _MISSING
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        if _INT_RE.match(text):
+            return int(text)
+        try:
+            number = float(text)
+        except ValueError:
+            return _MISSING
+        return number if math.isfinite(number) else _MISSING
+    return _MISSING
+
+
+def _as_boolean(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+        return value.strip().lower() == "true"
+    return _MISSING
+
+
+def _as_array(value: Any) -> Any:
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    return _MISSING
+
+
+_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "string": _as_string,
+    "integer": _as_integer,
+    "number": _as_number,
+    "boolean": _as_boolean,
+    "array": _as_array,
+    "object": lambda v: v if isinstance(v, dict) else _MISSING,
+    "null": lambda v: v if v is None else _MISSING,
+}
+
+
+# ----------------------------------------------------------------------------
+# Compiler
+# ----------------------------------------------------------------------------
+
+
+def _from_flat(schema: dict[str, Any]) -> dict[str, Any]:
+    """Convert ``{"p": {"type": ..., "required": True}}`` to JSON Schema."""
+    properties: dict[str, Any] = {}
+    required: list[str] = []
+    for name, raw in schema.items():
+        spec = dict(raw) if isinstance(raw, dict) else {}
+        if spec.pop("required", False) is True:
+            required.append(name)
+        properties[name] = spec
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": required,
+        "additionalProperties": False,
+    }
+
+
+class _Compiler:
+    def __init__(self, root: dict[str, Any]) -> None:
+        self._root = root
+        self._refs: dict[str, _Check] = {}
+
+    def compile(self, schema: Any) -> _Check:
+        if schema is True or schema == {} or not isinstance(schema, dict):
+            return _identity if schema is not False else self._never
+        if "$ref" in schema:
+            return self._ref(schema["$ref"])
+
+        nullable = schema.get("nullable") is True
+        stages: list[_Check] = []
+        typed = self._type(schema.get("type"))
+        if typed is not None:
+            stages.append(typed)
+        stages.extend(self._value_checks(schema))
+        stages.extend(self.compile(sub) for sub in schema.get("allOf") or [])
+        for key in ("anyOf", "oneOf"):
+            if schema.get(key):
+                stages.append(self._any_of(schema[key]))
+
+        if not stages:
+            return _identity
+
+        def check(value: Any, path: Path, errors: Errors) -> Any:
+            if value is None and nullable:
+                return None
+            before = len(errors)
+            for stage in stages:
+                value = stage(value, path, errors)
+                if len(errors) > before:
+                    # Later checks would only repeat the same complaint.
+                    break
+            return value
+
+        return check
+
+    @staticmethod
+    def _never(value: Any, path: Path, errors: Errors) -> Any:
+        _fail(errors, path, "Parameter {path} is not allowed")
+        return value
+
+    def _ref(self, ref: str) -> _Check:
+        if ref in self._refs:
+            return self._refs[ref]
+        if not ref.startswith("#"):
+            logger.debug("Ignoring non-local $ref in tool schema", extra={"ref": ref})
+            return _identity
+
+        # Placeholder first so recursive schemas (trees, nested filters)
+        # resolve to the same compiled node instead of recursing forever.
+        cell: list[_Check] = [_identity]
+
+        def deferred(value: Any, path: Path, errors: Errors) -> Any:
+            return cell[0](value, path, errors)
+
+        self._refs[ref] = deferred
+        target: Any = self._root
+        for raw in ref.lstrip("#").strip("/").split("/"):
+            if not raw:
+                continue
+            part = raw.replace("~1", "/").replace("~0", "~")
+            if not isinstance(target, dict) or part not in target:
+                logger.debug("Unresolvable $ref in tool schema", extra={"ref": ref})
+                return self._refs[ref]
+            target = target[part]
+        cell[0] = self.compile(target)
+        return self._refs[ref]
+
+    def _type(self, declared: Any) -> _Check | None:
+        if declared is None:
+            return None
+        names = [declared] if isinstance(declared, str) else list(declared)
+        coercers = [(name, _COERCERS[name]) for name in names if name in _COERCERS]
+        if not coercers:
+            return None
+        label = " or ".join(names)
+        template = f"Parameter {{path}} has wrong type (expected {label})"
+        # Exact matches win over coercions: ["integer", "string"] keeps "5" a string.
+        exact = tuple(_EXACT[name] for name, _ in coercers)
+
+        def check(value: Any, path: Path, errors: Errors) -> Any:
+            if any(test(value) for test in exact):
+                return value
+            for _, coerce in coercers:
+                coerced = coerce(value)
+                if coerced is not _MISSING:
+                    return coerced
+            _fail(errors, path, template)
+            return value
+
+        return check
+
+    def _value_checks(self, schema: dict[str, Any]) -> list[_Check]:
+        checks: list[_Check] = []
+
+        if "enum" in schema:
+            allowed = list(schema["enum"])
+            template = f"Parameter {{path}} must be one of {allowed!r}"
+
+            def check_enum(value: Any, path: Path, errors: Errors) -> Any:
+                if value not in allowed:
+                    _fail(errors, path, template)
+                return value
+
+            checks.append(check_enum)
+
+        if "const" in schema:
+            expected = schema["const"]
+            template = f"Parameter {{path}} must equal {expected!r}"
+
+            def check_const(value: Any, path: Path, errors: Errors) -> Any:
+                if value != expected:
+                    _fail(errors, path, template)
+                return value
+
+            checks.append(check_const)
+
+        checks.extend(self._string_checks(schema))
+        checks.extend(self._number_checks(schema))
+        checks.extend(self._array_checks(schema))
+        if "properties" in schema or "required" in schema or "additionalProperties" in schema:
+            checks.append(self._object(schema))
+        return checks
+
+    @staticmethod
+    def _string_checks(schema: dict[str, Any]) -> list[_Check]:
+        checks: list[_Check] = []
+        min_length = schema.get("minLength")
+        max_length = schema.get("maxLength")
+        if min_length is not None or max_length is not None:
+
+            def check_length(value: Any, path: Path, errors: Errors) -> Any:
+                if isinstance(value, str):
+                    if min_length is not None and len(value) < min_length:
+                        _fail(
+                            errors,
+                            path,
+                            f"Parameter {{path}} must be at least {min_length} characters",
+                        )
+                    elif max_length is not None and len(value) > max_length:
+                        _fail(
+                            errors,
+                            path,
+                            f"Parameter {{path}} must be at most {max_length} characters",
+                        )
+                return value
+
+            checks.append(check_length)
+
+        pattern = schema.get("pattern")
+        if pattern:
+            try:
+                compiled = re.compile(pattern)
+            except re.error:
+                logger.warning(
+                    "Ignoring invalid pattern in tool schema", extra={"pattern": pattern}
+                )
+            else:
+                template = f"Parameter {{path}} must match pattern {pattern!r}"
+
+                def check_pattern(value: Any, path: Path, errors: Errors) -> Any:
+                    if isinstance(value, str) and not compiled.search(value):
+                        _fail(errors, path, template)
+                    return value
+
+                checks.append(check_pattern)
+        return checks
+
+    @staticmethod
+    def _number_checks(schema: dict[str, Any]) -> list[_Check]:
+        bounds: list[tuple[Callable[[float], bool], str]] = []
+        if schema.get("minimum") is not None:
+            low = schema["minimum"]
+            bounds.append((lambda v, low=low: v >= low, f">= {low}"))
+        if schema.get("maximum") is not None:
+            high = schema["maximum"]
+            bounds.append((lambda v, high=high: v <= high, f"<= {high}"))
+        # Draft 6+ numeric form only; the boolean draft-4 form is ignored.
+        low_x = schema.get("exclusiveMinimum")
+        if isinstance(low_x, (int, float)) and not isinstance(low_x, bool):
+            bounds.append((lambda v, low=low_x: v > low, f"> {low_x}"))
+        high_x = schema.get("exclusiveMaximum")
+        if isinstance(high_x, (int, float)) and not isinstance(high_x, bool):
+            bounds.append((lambda v, high=high_x: v < high, f"< {high_x}"))
+        if not bounds:
+            return []
+
+        def check_bounds(value: Any, path: Path, errors: Errors) -> Any:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                for ok, label in bounds:
+                    if not ok(value):
+                        _fail(errors, path, f"Parameter {{path}} must be {label}")
+                        break
+            return value
+
+        return [check_bounds]
+
+    def _array_checks(self, schema: dict[str, Any]) -> list[_Check]:
+        checks: list[_Check] = []
+        min_items = schema.get("minItems")
+        max_items = schema.get("maxItems")
+        if min_items is not None or max_items is not None:
+
+            def check_count(value: Any, path: Path, errors: Errors) -> Any:
+                if isinstance(value, list):
+                    if min_items is not None and len(value) < min_items:
+                        _fail(
+                            errors, path, f"Parameter {{path}} must have at least {min_items} items"
+                        )
+                    elif max_items is not None and len(value) > max_items:
+                        _fail(
+                            errors, path, f"Parameter {{path}} must have at most {max_items} items"
+                        )
+                return value
+
+            checks.append(check_count)
+
+        items = schema.get("items")
+        if isinstance(items, dict) and items:
+            item_check = self.compile(items)
+
+            def check_items(value: Any, path: Path, errors: Errors) -> Any:
+                if not isinstance(value, list):
+                    return value
+                out = value
+                for index, item in enumerate(value):
+                    coerced = item_check(item, (*path, index), errors)
+                    if coerced is not item:
+                        if out is value:
+                            out = list(value)
+                        out[index] = coerced
+                return out
+
+            checks.append(check_items)
+        return checks
+
+    def _object(self, schema: dict[str, Any]) -> _Check:
+        properties = {
+            name: self.compile(sub) for name, sub in (schema.get("properties") or {}).items()
+        }
+        required = [name for name in schema.get("required") or [] if isinstance(name, str)]
+        required_set = frozenset(required)
+        additional = schema.get("additionalProperties", True)
+        extra_check = self.compile(additional) if isinstance(additional, dict) else None
+        closed = additional is False
+
+        def check_object(value: Any, path: Path, errors: Errors) -> Any:
+            if not isinstance(value, dict):
+                return value
+            for name in required:
+                if name not in value:
+                    _fail(errors, (*path, name), "Missing required parameter: {path}")
+            out = value
+            for name, item in value.items():
+                sub = properties.get(name)
+                if sub is None:
+                    if closed:
+                        _fail(errors, (*path, name), "Unexpected parameter: {path}")
+                        continue
+                    if extra_check is None:
+                        continue
+                    sub = extra_check
+                elif item is None and name not in required_set:
+                    continue
+                coerced = sub(item, (*path, name), errors)
+                if coerced is not item:
+                    if out is value:
+                        out = dict(value)
+                    out[name] = coerced
+            return out
+
+        return check_object
+
+    def _any_of(self, options: list[Any]) -> _Check:
+        compiled = [self.compile(option) for option in options]
+
+        def check(value: Any, path: Path, errors: Errors) -> Any:
+            for option in compiled:
+                trial: Errors = []
+                coerced = option(value, path, trial)
+                if not trial:
+                    return coerced
+            _fail(errors, path, "Parameter {path} does not match any allowed schema")
+            return value
+
+        return check
+
+
+_EXACT: dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+
+class CompiledSchema:
+    """Precompiled validator for one tool's arguments."""
+
+    __slots__ = ("_check", "schema")
+
+    def __init__(self, schema: dict[str, Any], check: _Check) -> None:
+        self.schema = schema
+        self._check = check
+
+    def __call__(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Validate and coerce ``arguments``.
+
+        Returns:
+            The arguments, with coercions applied (a copy only if changed).
+
+        Raises:
+            ToolArgumentError: With every problem found and its path.
+        """
+        errors: Errors = []
+        result = self._check(arguments, (), errors)
+        if errors:
+            raise ToolArgumentError(errors)
+        return result
+
+
+def compile_schema(schema: dict[str, Any] | None) -> CompiledSchema:
+    """Compile a tool ``parameters_schema`` (JSON Schema or legacy flat form)."""
+    schema = schema or {}
+    if not schema:
+        # No schema: anything goes, but it must still be an argument object.
+        normalized: dict[str, Any] = {"type": "object"}
+    elif isinstance(schema.get("type"), (str, list)) or any(k in schema for k in _JSON_SCHEMA_KEYS):
+        normalized = schema
+    else:
+        normalized = _from_flat(schema)
+    return CompiledSchema(schema, _Compiler(normalized).compile(normalized))
@@ -0,0 +1,60 @@
+"""
+empla.core.tools.timeouts - Adaptive Per-Tool Timeouts
+
+A single 30s timeout is wrong in both directions: a hung call to a tool
+that normally answers in 300ms burns 30s of cycle time, while a report tool
+that legitimately takes a minute is always cut off. TimeoutPolicy derives
+each tool's timeout from its recent latency (the health monitor's sliding
+window) and clamps it between a floor and the tool's ceiling.
+
+The ceiling is the tool's declared ``timeout_seconds`` (set on slow tools
+via ``@tool(timeout=...)`` / ``IntegrationRouter.tool(timeout=...)``), or
+the router-wide default. Observed latency only ever *shortens* the timeout:
+a tool that keeps timing out never gets the evidence to justify more time,
+so raising a limit stays an explicit per-tool decision.
+
+Example:
+    >>> policy = TimeoutPolicy(floor=2.0, multiplier=4.0)
+    >>> policy.resolve(ceiling=30.0, window=monitor.get_tool_window("hubspot.get_deals"))
+    2.0  # p99 of 350ms x 4 = 1.4s, raised to the floor
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .health import LatencyHistogram
+
+
+@dataclass(frozen=True)
+class TimeoutPolicy:
+    """How per-tool timeouts are derived from observed latency.
+
+    Attributes:
+        floor: Never time a tool out sooner than this (seconds), however
+            fast it usually is, so ordinary jitter does not fail calls.
+        multiplier: Headroom over the observed percentile.
+        percentile: Latency quantile the timeout is based on.
+        min_samples: Calls needed in the window before latency is trusted;
+            below that the ceiling applies.
+        enabled: False pins every tool to its ceiling.
+    """
+
+    floor: float = 2.0
+    multiplier: float = 4.0
+    percentile: float = 0.99
+    min_samples: int = 20
+    enabled: bool = True
+
+    def resolve(self, *, ceiling: float, window: LatencyHistogram | None) -> float:
+        """Timeout in seconds for a tool with ``ceiling`` and recent ``window``.
+
+        Falls back to the ceiling when adaptation is disabled, the window
+        is too small, or the window contains timeouts (its latency is then
+        censored at the old timeout and says nothing about how long the
+        tool really needs).
+        """
+        if not self.enabled or window is None or window.count < self.min_samples or window.timeouts:
+            return ceiling
+        observed = window.percentile(self.percentile) / 1000 * self.multiplier
+        return min(max(observed, self.floor), ceiling)
@@ -124,6 +124,8 @@ class TrustDecision:
     employee_role: str | None = None
     arguments: dict[str, Any] | None = None
     timestamp: float = field(default_factory=time.time)
+    cached: bool = False
+    """Set by ToolRouter when the call was answered from its result cache."""
 
     def __str__(self) -> str:
         status = "ALLOW" if self.allowed else "DENY"
@@ -367,10 +369,12 @@ class TrustBoundary:
         """Return stats for the current cycle."""
         allowed = sum(1 for d in self._audit_log if d.allowed)
         denied = sum(1 for d in self._audit_log if not d.allowed)
+        cached = sum(1 for d in self._audit_log if d.cached)
         return {
             "total_decisions": len(self._audit_log),
             "allowed": allowed,
             "denied": denied,
+            "cached": cached,
             "tainted": self._tainted,
             "cycle_calls": self._cycle_call_count,
             "max_calls_per_cycle": self._max_calls_per_cycle,
@@ -33,14 +33,20 @@ from empla.bdi import BeliefSystem, GoalSystem, IntentionStack
 from empla.core.hooks import HOOK_EMPLOYEE_START, HOOK_EMPLOYEE_STOP, HookRegistry
 from empla.core.loop import LoopConfig, ProactiveExecutionLoop
 from empla.core.memory import (
+    ContextAssembler,
     EpisodicMemorySystem,
+    HistoryArchive,
+    HybridMemoryRetriever,
+    MemoryAccessTracker,
     ProceduralMemorySystem,
     SemanticMemorySystem,
     WorkingMemory,
 )
 from empla.core.tools import ToolRegistry
 from empla.core.tools.mcp_bridge import MCPBridge, MCPServerConfig
+from empla.core.tools.mcp_pool import get_mcp_pool
 from empla.core.tools.router import ToolRouter
+from empla.core.tools.timeouts import TimeoutPolicy
 from empla.employees.config import EmployeeConfig, GoalConfig
 from empla.employees.exceptions import (
     EmployeeConfigError,
@@ -53,6 +59,7 @@ from empla.llm import LLMService
 from empla.models.database import get_engine, get_sessionmaker
 from empla.models.employee import Employee as EmployeeModel
 from empla.services.activity_recorder import ActivityRecorder
+from empla.services.metrics_sink import MetricsSink
 
 logger = logging.getLogger(__name__)
 
@@ -70,10 +77,24 @@ class MemorySystem:
     This is a convenience wrapper that ensures all memory systems
     share the same database session and employee context.
 
+    The hybrid retriever and the context assembler are the exception: they
+    open their own short-lived sessions (one per search leg / context
+    source) so queries can run concurrently. Both are None when no
+    sessionmaker is provided.
+
+    With a sessionmaker, reads are also tracked through a shared
+    MemoryAccessTracker: access/recall counters are buffered in process
+    and merged by a periodic bulk flush instead of turning every recall
+    into a row update. The owner must call ``access_tracker.start()`` /
+    ``stop()``.
+
     Args:
         session: Database session for all memory operations
         employee_id: ID of the employee who owns these memories
         tenant_id: Tenant ID for multi-tenancy isolation
+        sessionmaker: Optional session factory for the hybrid retriever
+        archive: Optional cold-tier archive for episodes older than the
+            hot partitions
     """
 
     def __init__(
@@ -81,11 +102,32 @@ class MemorySystem:
         session: AsyncSession,
         employee_id: UUID,
         tenant_id: UUID,
+        sessionmaker: async_sessionmaker[AsyncSession] | None = None,
+        archive: HistoryArchive | None = None,
     ) -> None:
-        self.episodic = EpisodicMemorySystem(session, employee_id, tenant_id)
-        self.semantic = SemanticMemorySystem(session, employee_id, tenant_id)
+        self.access_tracker: MemoryAccessTracker | None = (
+            MemoryAccessTracker(sessionmaker) if sessionmaker is not None else None
+        )
+        self.episodic = EpisodicMemorySystem(
+            session, employee_id, tenant_id, access_tracker=self.access_tracker, archive=archive
+        )
+        self.semantic = SemanticMemorySystem(
+            session, employee_id, tenant_id, access_tracker=self.access_tracker
+        )
         self.procedural = ProceduralMemorySystem(session, employee_id, tenant_id)
-        self.working = WorkingMemory(session, employee_id, tenant_id)
+        self.working = WorkingMemory(
+            session, employee_id, tenant_id, access_tracker=self.access_tracker
+        )
+        self.hybrid: HybridMemoryRetriever | None = (
+            HybridMemoryRetriever(sessionmaker, employee_id, tenant_id)
+            if sessionmaker is not None
+            else None
+        )
+        self.context: ContextAssembler | None = (
+            ContextAssembler(sessionmaker, employee_id, tenant_id)
+            if sessionmaker is not None
+            else None
+        )
 
 
 class DigitalEmployee(ABC):
@@ -149,6 +191,7 @@ class DigitalEmployee(ABC):
         self._tool_router: ToolRouter | None = None
         self._mcp_bridge: MCPBridge | None = None
         self._loop: ProactiveExecutionLoop | None = None
+        self._metrics_sink: MetricsSink | None = None
         self._activity_recorder: ActivityRecorder | None = None
         self._db_employee: EmployeeModel | None = None
 
@@ -483,6 +526,23 @@ class DigitalEmployee(ABC):
                 shutdown_errors.append(("llm", e))
             self._llm = None
 
+        # Write buffered cycle metrics before the engine goes away
+        if self._metrics_sink is not None:
+            try:
+                await self._metrics_sink.stop()
+            except Exception as e:
+                logger.error(f"Error flushing cycle metrics: {e}", exc_info=True)
+                shutdown_errors.append(("metrics_sink", e))
+            self._metrics_sink = None
+
+        # Flush buffered memory access counts before the engine goes away
+        if self._memory is not None and self._memory.access_tracker is not None:
+            try:
+                await self._memory.access_tracker.stop()
+            except Exception as e:
+                logger.error(f"Error flushing memory access counts: {e}", exc_info=True)
+                shutdown_errors.append(("memory_access_tracker", e))
+
         # Close database session and dispose engine
         if self._session:
             try:
@@ -675,6 +735,21 @@ class DigitalEmployee(ABC):
         self._tool_registry = None
         self._tool_router = None
 
+        # Stop the metrics flusher (its final flush is best-effort here)
+        if self._metrics_sink is not None:
+            try:
+                await self._metrics_sink.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping metrics sink during cleanup: {e}")
+            self._metrics_sink = None
+
+        # Cancel the access-count flusher (a final flush is best-effort here)
+        if self._memory is not None and self._memory.access_tracker is not None:
+            try:
+                await self._memory.access_tracker.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping memory access tracker during cleanup: {e}")
+
         # Close database session and dispose engine
         if self._session:
             try:
@@ -783,6 +858,7 @@ class DigitalEmployee(ABC):
             employee_id=self.employee_id,
             tenant_id=self.tenant_id,
             llm_service=self._llm,
+            archive=self._history_archive(),
         )
         self._goals = GoalSystem(
             session=session,
@@ -797,13 +873,24 @@ class DigitalEmployee(ABC):
 
         logger.debug("Initialized BDI components")
 
+    def _history_archive(self) -> HistoryArchive | None:
+        """Cold-tier history archive, if ``EMPLA_HISTORY_ARCHIVE_DIR`` is set."""
+        from empla.settings import get_settings
+
+        archive_dir = get_settings().history_archive_dir
+        return HistoryArchive(archive_dir) if archive_dir else None
+
     async def _init_memory(self, session: AsyncSession) -> None:
         """Initialize memory systems."""
         self._memory = MemorySystem(
             session=session,
             employee_id=self.employee_id,
             tenant_id=self.tenant_id,
+            sessionmaker=self._sessionmaker,
+            archive=self._history_archive(),
         )
+        if self._memory.access_tracker is not None:
+            self._memory.access_tracker.start()
 
         logger.debug("Initialized memory systems")
 
@@ -819,7 +906,11 @@ class DigitalEmployee(ABC):
         if self._tool_registry is None:
             self._tool_registry = ToolRegistry()
 
-        self._mcp_bridge = MCPBridge(self._tool_registry)
+        # Leased from the process-wide pool: sessions open on first use and
+        # tool catalogs discovered by another runner are reused.
+        self._mcp_bridge = MCPBridge(
+            self._tool_registry, pool=get_mcp_pool(), tenant_id=self.config.tenant_id
+        )
 
         async def connect_one(cfg: MCPServerConfig) -> str | None:
             """Connect a single MCP server. Returns name on failure, None on success."""
@@ -898,7 +989,28 @@ class DigitalEmployee(ABC):
         # Reuse existing registry if MCP servers already initialized it
         if self._tool_registry is None:
             self._tool_registry = ToolRegistry()
-        self._tool_router = ToolRouter(self._tool_registry)
+        from empla.settings import get_settings
+
+        settings = get_settings()
+        self._tool_router = ToolRouter(
+            self._tool_registry,
+            tool_timeout=settings.tool_timeout_seconds,
+            timeout_policy=TimeoutPolicy(
+                floor=settings.tool_timeout_floor_seconds,
+                multiplier=settings.tool_timeout_latency_multiplier,
+                enabled=settings.adaptive_tool_timeouts,
+            ),
+        )
+
+        # Cycle metrics are buffered and written in bulk off the cycle path
+        if self._sessionmaker is not None and self._metrics_sink is None:
+            self._metrics_sink = MetricsSink(
+                self._sessionmaker,
+                flush_interval_seconds=settings.metrics_flush_interval_seconds,
+                flush_rows=settings.metrics_flush_rows,
+                max_pending=settings.metrics_buffer_size,
+            )
+            self._metrics_sink.start()
 
         loop_config = LoopConfig(
             cycle_interval_seconds=self.config.loop.cycle_interval_seconds,
@@ -931,6 +1043,7 @@ class DigitalEmployee(ABC):
             identity=identity,
             # See ProactiveExecutionLoop.__init__ docstring for why this is explicit.
             sessionmaker=self._sessionmaker,
+            metrics_sink=self._metrics_sink,
             # Cost hard-stop comes from Tenant.settings, loaded by the
             # runner at process start (PR #83 runner-restart pattern).
             # None = feature disabled for this tenant.
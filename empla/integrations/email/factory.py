@@ -3,16 +3,30 @@ Email adapter factory.
 """
 
 from typing import Any
+from uuid import UUID
 
 from empla.integrations.email.base import EmailAdapter
 from empla.integrations.email.gmail import GmailEmailAdapter
 from empla.integrations.email.types import EmailProvider
+from empla.integrations.sync_cursors import CursorStore, DatabaseCursorStore
 
 
 class UnknownEmailProviderError(Exception):
     """Raised when an unrecognized email provider is requested."""
 
 
+def _cursor_store(kwargs: dict[str, Any]) -> CursorStore | None:
+    """Build the sync cursor store from factory kwargs, if configured."""
+    if kwargs.get("cursor_store") is not None:
+        return kwargs["cursor_store"]
+    sessionmaker = kwargs.get("sessionmaker")
+    tenant_id = kwargs.get("tenant_id")
+    employee_id = kwargs.get("employee_id")
+    if sessionmaker is None or not tenant_id or not employee_id:
+        return None
+    return DatabaseCursorStore(sessionmaker, UUID(str(tenant_id)), UUID(str(employee_id)))
+
+
 def create_email_adapter(provider: str, email_address: str, **kwargs: Any) -> EmailAdapter:
     """Create an email adapter for the given provider.
 
@@ -20,6 +34,9 @@ def create_email_adapter(provider: str, email_address: str, **kwargs: Any) -> Em
         provider: Provider identifier (e.g. "gmail", "microsoft_graph", "test").
         email_address: Sender email address for the From header.
         **kwargs: Additional provider-specific kwargs (e.g. base_url for test).
+            For Gmail, ``sessionmaker`` + ``tenant_id`` + ``employee_id``
+            persist the incremental-sync cursor per employee; an explicit
+            ``cursor_store`` takes precedence.
 
     Returns:
         EmailAdapter instance.
@@ -40,7 +57,7 @@ def create_email_adapter(provider: str, email_address: str, **kwargs: Any) -> Em
             base_url=kwargs.get("base_url", "http://localhost:9100"),
         )
     if provider == EmailProvider.GMAIL:
-        return GmailEmailAdapter(email_address=email_address)
+        return GmailEmailAdapter(email_address=email_address, cursor_store=_cursor_store(kwargs))
     if provider == EmailProvider.MICROSOFT_GRAPH:
         raise NotImplementedError("Outlook adapter not yet implemented")
     raise UnknownEmailProviderError(f"Unknown email provider: {provider}")
@@ -2,11 +2,19 @@
 Gmail email adapter.
 
 Implements EmailAdapter using the Gmail API (google-api-python-client).
+
+Unread perception is incremental when a cursor store is configured: the
+adapter keeps an unread-message index primed by one listing, then advances
+it with History API deltas from the persisted ``historyId``. Message bodies
+are fetched concurrently (bounded by ``max_concurrency``) and parsed
+``Email`` objects are cached by message ID, so a perception pass over an
+unchanged inbox costs a single ``history.list`` call.
 """
 
 import asyncio
 import base64
 import logging
+import threading
 from datetime import UTC, datetime
 from email.mime.text import MIMEText
 from email.utils import getaddresses
@@ -14,7 +22,9 @@ from typing import Any
 
 from empla.integrations.base import AdapterResult
 from empla.integrations.email.base import EmailAdapter
+from empla.integrations.email.sync import EmailCache, MailboxIndex
 from empla.integrations.email.types import Email
+from empla.integrations.sync_cursors import CursorStore
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +33,25 @@ logger = logging.getLogger(__name__)
 # may still complete, but the caller is unblocked.
 _API_TIMEOUT_SECONDS = 30
 
+# Parallel message fetches per adapter. Gmail's per-user quota is 250
+# units/s and messages.get costs 5, so 8 in flight stays well under it.
+_DEFAULT_MAX_CONCURRENCY = 8
+
+_DEFAULT_CACHE_SIZE = 1000
+
+# Unread IDs kept in the persisted index; beyond this the index is marked
+# incomplete and re-primed when it runs short.
+_MAX_TRACKED_UNREAD = 500
+
+_HISTORY_TYPES = ["messageAdded", "messageDeleted", "labelAdded", "labelRemoved"]
+
+_CURSOR_PROVIDER = "gmail"
+
+
+def _is_not_found(exc: BaseException) -> bool:
+    """Whether *exc* is a Gmail 404 (e.g. a ``startHistoryId`` too old to replay)."""
+    return getattr(getattr(exc, "resp", None), "status", None) == 404
+
 
 def _pad_base64url(data: str) -> str:
     """Add padding to base64url-encoded string if missing.
@@ -38,11 +67,36 @@ class GmailEmailAdapter(EmailAdapter):
     """Gmail API adapter.
 
     Wraps synchronous Google API calls with asyncio.to_thread.
+
+    Args:
+        email_address: Mailbox address (From header, cursor key).
+        cursor_store: Where to persist the ``historyId`` cursor. Without
+            one, unread fetches list the mailbox every call (still cached
+            and concurrent).
+        max_concurrency: Maximum message fetches in flight.
+        cache_size: Parsed emails kept in the LRU cache.
     """
 
-    def __init__(self, email_address: str) -> None:
+    def __init__(
+        self,
+        email_address: str,
+        *,
+        cursor_store: CursorStore | None = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        cache_size: int = _DEFAULT_CACHE_SIZE,
+    ) -> None:
         self._email_address = email_address
         self._client: Any = None
+        self._credentials: Any = None
+        self._cursor_store = cursor_store
+        self._cache = EmailCache(cache_size)
+        self._fetch_slots = asyncio.Semaphore(max_concurrency)
+        self._mailbox: MailboxIndex | None = None
+        self._mailbox_loaded = False
+        self._sync_lock = asyncio.Lock()
+        # httplib2.Http is not thread-safe; concurrent fetches each get a
+        # connection bound to their worker thread.
+        self._thread_local = threading.local()
 
     async def _run_in_thread(self, func: Any) -> Any:
         """Run *func* in a thread with a timeout guard."""
@@ -51,6 +105,19 @@ class GmailEmailAdapter(EmailAdapter):
             timeout=_API_TIMEOUT_SECONDS,
         )
 
+    def _execute(self, request: Any) -> Any:
+        """Execute a Google API request on this thread's HTTP connection."""
+        if self._credentials is None:
+            return request.execute()
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            import google_auth_httplib2
+            import httplib2
+
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return request.execute(http=http)
+
     async def initialize(self, credentials: dict[str, Any]) -> None:
         """Initialize Gmail API service from OAuth credentials."""
         if not isinstance(credentials, dict):
@@ -76,6 +143,7 @@ class GmailEmailAdapter(EmailAdapter):
                 return build("gmail", "v1", credentials=creds, cache_discovery=False)
 
             self._client = await self._run_in_thread(_build_service)
+            self._credentials = creds
 
         except ImportError as e:
             raise RuntimeError(
@@ -103,6 +171,9 @@ class GmailEmailAdapter(EmailAdapter):
             logger.warning("fetch_emails called before client initialized")
             return []
 
+        if unread_only and since is None and self._cursor_store is not None:
+            return await self._fetch_many(await self._unread_ids(max_results))
+
         # Build Gmail search query from structured params
         query_parts: list[str] = []
         if unread_only:
@@ -112,7 +183,16 @@ class GmailEmailAdapter(EmailAdapter):
             query_parts.append(f"after:{epoch}")
         q = " ".join(query_parts) if query_parts else None
 
-        def _list_messages() -> dict[str, Any]:
+        result = await self._list_messages(q, max_results)
+        messages = result.get("messages", [])
+
+        if not messages:
+            return []
+
+        return await self._fetch_many([m["id"] for m in messages])
+
+    async def _list_messages(self, q: str | None, max_results: int) -> dict[str, Any]:
+        def _list() -> dict[str, Any]:
             kwargs: dict[str, Any] = {
                 "userId": "me",
                 "maxResults": max_results,
@@ -121,43 +201,148 @@ class GmailEmailAdapter(EmailAdapter):
                 kwargs["q"] = q
             return self._client.users().messages().list(**kwargs).execute()
 
-        result = await self._run_in_thread(_list_messages)
-        messages = result.get("messages", [])
+        return await self._run_in_thread(_list)
 
-        if not messages:
-            return []
+    async def _fetch_many(self, message_ids: list[str]) -> list[Email]:
+        """Fetch messages concurrently (cache first), preserving order.
 
+        Individual failures are logged and skipped.
+        """
+        results = await asyncio.gather(
+            *(self.fetch_message(message_id) for message_id in message_ids),
+            return_exceptions=True,
+        )
         emails: list[Email] = []
-        for msg_info in messages:
-            try:
-                email = await self.fetch_message(msg_info["id"])
-                if email:
-                    emails.append(email)
-            except Exception:
-                logger.warning(
-                    "Failed to fetch message %s",
-                    msg_info["id"],
-                    exc_info=True,
+        for message_id, result in zip(message_ids, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("Failed to fetch message %s", message_id, exc_info=result)
+            elif isinstance(result, BaseException):
+                raise result
+            elif result:
+                emails.append(result)
+        return emails
+
+    # ------------------------------------------------------------------
+    # Incremental sync (History API)
+    # ------------------------------------------------------------------
+
+    async def _unread_ids(self, max_results: int) -> list[str]:
+        """Bring the unread index up to date and return its newest IDs."""
+        assert self._cursor_store is not None
+        async with self._sync_lock:
+            if not self._mailbox_loaded:
+                state = await self._cursor_store.load(_CURSOR_PROVIDER, self._email_address)
+                self._mailbox = MailboxIndex.from_state(state)
+                self._mailbox_loaded = True
+
+            mailbox = self._mailbox
+            before = mailbox.to_state() if mailbox else None
+            if mailbox is not None:
+                try:
+                    await self._apply_history(mailbox)
+                except Exception as e:
+                    if not _is_not_found(e):
+                        raise
+                    logger.info(
+                        "Gmail historyId %s expired; re-listing unread messages",
+                        mailbox.cursor,
+                    )
+                    mailbox = None
+            if mailbox is None or (not mailbox.complete and len(mailbox.unread) < max_results):
+                mailbox = await self._prime_mailbox(max_results)
+
+            if len(mailbox.unread) > _MAX_TRACKED_UNREAD:
+                del mailbox.unread[_MAX_TRACKED_UNREAD:]
+                mailbox.complete = False
+            self._mailbox = mailbox
+            if mailbox.to_state() != before:
+                await self._cursor_store.save(
+                    _CURSOR_PROVIDER, self._email_address, mailbox.to_state()
                 )
+            return mailbox.unread[:max_results]
 
-        return emails
+    async def _prime_mailbox(self, max_results: int) -> MailboxIndex:
+        """Start a fresh index: snapshot ``historyId``, then list unread.
+
+        The profile is read first so any change racing the listing is
+        replayed (idempotently) by the next history sync.
+        """
+
+        def _get_profile() -> dict[str, Any]:
+            return self._client.users().getProfile(userId="me").execute()
+
+        profile = await self._run_in_thread(_get_profile)
+        result = await self._list_messages("is:unread", max_results)
+        return MailboxIndex(
+            cursor=str(profile["historyId"]),
+            unread=[m["id"] for m in result.get("messages", [])],
+            complete=not result.get("nextPageToken"),
+        )
+
+    async def _apply_history(self, mailbox: MailboxIndex) -> None:
+        """Replay History API records since ``mailbox.cursor`` into the index and cache."""
+        page_token: str | None = None
+        latest = mailbox.cursor
+        while True:
+
+            def _list_history(token: str | None = page_token) -> dict[str, Any]:
+                kwargs: dict[str, Any] = {
+                    "userId": "me",
+                    "startHistoryId": mailbox.cursor,
+                    "historyTypes": _HISTORY_TYPES,
+                    "maxResults": 500,
+                }
+                if token:
+                    kwargs["pageToken"] = token
+                return self._client.users().history().list(**kwargs).execute()
+
+            resp = await self._run_in_thread(_list_history)
+            for record in resp.get("history", []):
+                for item in record.get("messagesDeleted", []):
+                    message_id = item.get("message", {}).get("id")
+                    if message_id:
+                        mailbox.discard(message_id)
+                        self._cache.discard(message_id)
+                for key in ("messagesAdded", "labelsAdded", "labelsRemoved"):
+                    for item in record.get(key, []):
+                        message = item.get("message", {})
+                        message_id = message.get("id")
+                        if not message_id:
+                            continue
+                        labels = message.get("labelIds", [])
+                        mailbox.observe(message_id, labels)
+                        self._cache.update_labels(message_id, labels)
+            latest = resp.get("historyId", latest)
+            page_token = resp.get("nextPageToken")
+            if not page_token:
+                break
+        mailbox.cursor = str(latest)
 
     async def fetch_message(self, message_id: str) -> Email | None:
-        """Fetch a single Gmail message by ID."""
+        """Fetch a single Gmail message by ID (served from cache when seen before)."""
         if not self._client:
             logger.warning("fetch_message called before client initialized")
             return None
 
+        cached = self._cache.get(message_id)
+        if cached is not None:
+            return cached
+
         def _get_message() -> dict[str, Any]:
-            return (
-                self._client.users()
-                .messages()
-                .get(userId="me", id=message_id, format="full")
-                .execute()
+            return self._execute(
+                self._client.users().messages().get(userId="me", id=message_id, format="full")
             )
 
-        msg = await self._run_in_thread(_get_message)
+        async with self._fetch_slots:
+            msg = await self._run_in_thread(_get_message)
 
+        email = self._parse_message(message_id, msg)
+        self._cache.put(email)
+        return email
+
+    @staticmethod
+    def _parse_message(message_id: str, msg: dict[str, Any]) -> Email:
+        """Parse a ``format=full`` Gmail message into an Email."""
         headers = {h["name"].lower(): h["value"] for h in msg.get("payload", {}).get("headers", [])}
 
         body = ""
@@ -365,6 +550,7 @@ class GmailEmailAdapter(EmailAdapter):
                 )
 
             await self._run_in_thread(_modify)
+            self._forget_label(message_id, "UNREAD")
             return AdapterResult(success=True)
 
         except Exception as e:
@@ -391,11 +577,22 @@ class GmailEmailAdapter(EmailAdapter):
                 )
 
             await self._run_in_thread(_modify)
+            self._forget_label(message_id, "INBOX")
             return AdapterResult(success=True)
 
         except Exception as e:
             return AdapterResult(success=False, error=f"Gmail archive failed: {e}")
 
+    def _forget_label(self, message_id: str, label: str) -> None:
+        """Reflect our own label removal locally ahead of the history delta."""
+        cached = self._cache.get(message_id)
+        if cached is not None:
+            labels = [lb for lb in cached.labels if lb != label]
+            self._cache.update_labels(message_id, labels)
+        if label == "UNREAD" and self._mailbox is not None:
+            self._mailbox.discard(message_id)
+
     async def shutdown(self) -> None:
         """Clean up Gmail client resources."""
         self._client = None
+        self._credentials = None
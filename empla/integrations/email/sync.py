@@ -0,0 +1,109 @@
+"""
+Incremental mailbox sync state shared by email adapters.
+
+- ``EmailCache``: bounded LRU of parsed ``Email`` objects by message ID, so
+  repeated perception passes over the same unread messages cost nothing.
+- ``MailboxIndex``: the unread-message index an adapter maintains from
+  provider deltas (Gmail History API), plus the cursor to resume from.
+  Serialises to the JSON state stored in ``integration_sync_cursors``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from empla.integrations.email.types import Email
+
+# Labels that take a message out of Gmail's ``is:unread`` results.
+_HIDDEN_LABELS = frozenset({"SPAM", "TRASH"})
+
+
+def is_unread(labels: Iterable[str]) -> bool:
+    """Whether a message with these labels matches ``is:unread``."""
+    label_set = set(labels)
+    return "UNREAD" in label_set and not (label_set & _HIDDEN_LABELS)
+
+
+class EmailCache:
+    """Bounded LRU cache of parsed emails keyed by provider message ID."""
+
+    def __init__(self, max_size: int = 1000) -> None:
+        self.max_size = max_size
+        self._items: OrderedDict[str, Email] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, message_id: object) -> bool:
+        return message_id in self._items
+
+    def get(self, message_id: str) -> Email | None:
+        email = self._items.get(message_id)
+        if email is not None:
+            self._items.move_to_end(message_id)
+        return email
+
+    def put(self, email: Email) -> None:
+        self._items[email.id] = email
+        self._items.move_to_end(email.id)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def update_labels(self, message_id: str, labels: list[str]) -> None:
+        """Refresh label-derived fields of a cached email in place."""
+        email = self._items.get(message_id)
+        if email is not None:
+            self._items[message_id] = email.model_copy(
+                update={"labels": list(labels), "is_read": "UNREAD" not in labels}
+            )
+
+    def discard(self, message_id: str) -> None:
+        self._items.pop(message_id, None)
+
+
+@dataclass
+class MailboxIndex:
+    """Unread message IDs tracked from deltas, and the cursor after them.
+
+    Attributes:
+        cursor: Provider sync position (Gmail ``historyId``).
+        unread: Unread message IDs, newest first as last listed/added.
+        complete: False when the priming listing was truncated, i.e. older
+            unread messages exist that the index has never seen.
+    """
+
+    cursor: str | None = None
+    unread: list[str] = field(default_factory=list)
+    complete: bool = True
+
+    def observe(self, message_id: str, labels: Iterable[str]) -> None:
+        """Apply a message's current labels to the index."""
+        if is_unread(labels):
+            if message_id not in self.unread:
+                self.unread.insert(0, message_id)
+        else:
+            self.discard(message_id)
+
+    def discard(self, message_id: str) -> None:
+        if message_id in self.unread:
+            self.unread.remove(message_id)
+
+    def to_state(self) -> dict[str, Any]:
+        return {"history_id": self.cursor, "unread": list(self.unread), "complete": self.complete}
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any] | None) -> MailboxIndex | None:
+        """Rebuild from stored state; None if it is missing or unusable."""
+        if not state or not state.get("history_id"):
+            return None
+        unread = state.get("unread")
+        if not isinstance(unread, list):
+            return None
+        return cls(
+            cursor=str(state["history_id"]),
+            unread=[str(m) for m in unread],
+            complete=bool(state.get("complete", False)),
+        )
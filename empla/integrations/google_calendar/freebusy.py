@@ -0,0 +1,98 @@
+"""
+empla.integrations.google_calendar.freebusy - Local Free/Busy Index
+
+``IntervalTree`` answers "which events overlap [start, end)?" in
+O(log n + k) for the calendar mirror, so checking any number of candidate
+slots costs memory lookups instead of one ``freeBusy`` API call each.
+
+The tree is static: intervals are sorted by start and laid out as an
+implicit balanced BST over that array, with every node holding the max end
+of its subtree. Calendars change rarely compared with how often they are
+queried, so the mirror rebuilds the tree (O(n log n)) after a sync that
+changed something rather than maintaining a self-balancing structure.
+
+Example:
+    >>> tree = IntervalTree([(start, end, "ev1"), (start2, end2, "ev2")])
+    >>> tree.overlapping(slot_start, slot_end)
+    [(start, end, "ev1")]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+Interval = tuple[datetime, datetime, T]
+
+
+class IntervalTree(Generic[T]):
+    """Immutable index of half-open ``[start, end)`` intervals."""
+
+    def __init__(self, intervals: Iterable[Interval[T]] = ()) -> None:
+        items = sorted((i for i in intervals if i[1] > i[0]), key=lambda i: (i[0], i[1]))
+        self._starts = [i[0] for i in items]
+        self._ends = [i[1] for i in items]
+        self._values = [i[2] for i in items]
+        self._max_end: list[datetime] = list(self._ends)
+        if items:
+            self._build(0, len(items))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _build(self, lo: int, hi: int) -> datetime:
+        # Node for [lo, hi) is the midpoint; children are the two halves.
+        # Depth is log2(n), so recursion is safe for any realistic calendar.
+        mid = (lo + hi) // 2
+        max_end = self._ends[mid]
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: datetime, end: datetime) -> list[Interval[T]]:
+        """Intervals overlapping ``[start, end)``, ordered by start."""
+        found: list[Interval[T]] = []
+        if self._starts and end > start:
+            self._query(0, len(self._starts), start, end, found)
+        return found
+
+    def _query(self, lo: int, hi: int, start: datetime, end: datetime, found: list) -> None:
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        # Nothing in this subtree ends after the query starts.
+        if self._max_end[mid] <= start:
+            return
+        self._query(lo, mid, start, end, found)
+        # Everything right of mid starts at or after starts[mid].
+        if self._starts[mid] >= end:
+            return
+        if self._ends[mid] > start:
+            found.append((self._starts[mid], self._ends[mid], self._values[mid]))
+        self._query(mid + 1, hi, start, end, found)
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        """Whether no interval overlaps ``[start, end)``."""
+        return not self.overlapping(start, end)
+
+
+def merge_periods(intervals: Iterable[Interval[T]]) -> list[tuple[datetime, datetime]]:
+    """Collapse overlapping or touching intervals into busy periods.
+
+    Mirrors the ``freeBusy`` API, which reports merged busy blocks rather
+    than individual events.
+    """
+    merged: list[tuple[datetime, datetime]] = []
+    for start, end, _ in sorted(intervals, key=lambda i: i[0]):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
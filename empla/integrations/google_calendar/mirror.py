@@ -0,0 +1,410 @@
+"""
+empla.integrations.google_calendar.mirror - Calendar Sync-Token Mirror
+
+Keeps an in-process copy of one calendar's events, maintained with the
+Calendar API's incremental sync (``events.list`` + ``syncToken``), and a
+free/busy ``IntervalTree`` over the busy ones. ``get_upcoming_events`` and
+availability checks read from memory; the API is only touched to pull
+deltas.
+
+Freshness comes from three paths:
+- Full sync on first use (or when Google expires the sync token with
+  ``410 Gone``): pages through every event and keeps ``nextSyncToken``.
+- Delta sync when the mirror is older than ``max_staleness_seconds``,
+  after one of our own writes, or after a push notification. A delta on
+  an unchanged calendar is a single request returning no items.
+- ``apply_webhook_events()``: called by the webhook endpoint for the
+  calendar push channel. Google push bodies carry no event data, so it
+  just stamps ``invalidated_at`` on the tenant's calendar cursors; the
+  mirror sees the stamp on its next read and pulls the delta.
+
+With a ``CursorStore`` the sync token and event snapshot are persisted
+per employee in ``integration_sync_cursors``, so a restarted employee
+resumes with a delta instead of a full listing. Events that ended more
+than ``retention`` ago are pruned to keep the snapshot small.
+
+Example:
+    >>> mirror = CalendarMirror(_call, calendar_id="primary", cursor_store=store)
+    >>> freshness = await mirror.ensure_fresh()
+    >>> mirror.busy_periods(slot_start, slot_end)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from datetime import time as dt_time
+from typing import Any
+from urllib.parse import quote
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import httpx
+from sqlalchemy import func, literal, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from empla.integrations.google_calendar.freebusy import IntervalTree, merge_periods
+from empla.integrations.sync_cursors import CursorStore, Freshness
+from empla.models.integration import IntegrationSyncCursor
+
+logger = logging.getLogger(__name__)
+
+PROVIDER = "google_calendar"
+
+DEFAULT_MAX_STALENESS_SECONDS = 300.0
+
+DEFAULT_RETENTION = timedelta(days=1)
+
+_PAGE_SIZE = 2500  # events.list maximum
+
+# Minimum gap between cursor-store reads looking for webhook stamps.
+_PROBE_INTERVAL_SECONDS = 5.0
+
+Call = Callable[..., Awaitable[dict[str, Any]]]
+
+
+# ============================================================================
+# Event mapping
+# ============================================================================
+
+
+def format_event(event: dict[str, Any]) -> dict[str, Any]:
+    """Shape an API event the way ``get_upcoming_events`` returns it."""
+    start = event.get("start", {})
+    end = event.get("end", {})
+    return {
+        "id": event["id"],
+        "title": event.get("summary", "(no title)"),
+        "start_time": start.get("dateTime") or start.get("date", ""),
+        "end_time": end.get("dateTime") or end.get("date", ""),
+        "description": event.get("description"),
+        "location": event.get("location"),
+        "attendees": [a.get("email", "") for a in event.get("attendees", [])],
+    }
+
+
+def is_busy(event: dict[str, Any]) -> bool:
+    """Whether an event blocks time, following ``freeBusy`` semantics.
+
+    Cancelled events, events marked "free" (transparent) and invitations
+    the calendar owner declined do not count as busy.
+    """
+    if event.get("status") == "cancelled" or event.get("transparency") == "transparent":
+        return False
+    return not any(
+        a.get("self") and a.get("responseStatus") == "declined" for a in event.get("attendees", [])
+    )
+
+
+def parse_event_time(value: str, tz: ZoneInfo) -> datetime:
+    """Parse an RFC 3339 dateTime, or an all-day date in the calendar's zone."""
+    if len(value) == 10:
+        return datetime.combine(date.fromisoformat(value), dt_time.min, tzinfo=tz).astimezone(UTC)
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=tz)
+    return parsed.astimezone(UTC)
+
+
+def _zone(name: str | None) -> ZoneInfo:
+    try:
+        return ZoneInfo(name) if name else ZoneInfo("UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+
+def _iso(value: datetime) -> str:
+    return value.astimezone(UTC).isoformat().replace("+00:00", "Z")
+
+
+class SyncTokenExpiredError(Exception):
+    """Google rejected the stored sync token (410 Gone)."""
+
+
+# ============================================================================
+# Mirror
+# ============================================================================
+
+
+class CalendarMirror:
+    """Incrementally synced, in-memory view of one calendar."""
+
+    def __init__(
+        self,
+        call: Call,
+        *,
+        calendar_id: str = "primary",
+        cursor_store: CursorStore | None = None,
+        max_staleness_seconds: float = DEFAULT_MAX_STALENESS_SECONDS,
+        retention: timedelta = DEFAULT_RETENTION,
+    ) -> None:
+        self._call = call
+        self.calendar_id = calendar_id
+        self.cursor_store = cursor_store
+        self.max_staleness_seconds = max_staleness_seconds
+        self.retention = retention
+
+        # Formatted events keyed by ID, each with an extra "busy" flag.
+        self._events: dict[str, dict[str, Any]] = {}
+        self._time_zone: str | None = None
+        self._sync_token: str | None = None
+        self._synced_at: datetime | None = None
+        self._dirty = False
+        self._loaded = False
+        self._applied = 0  # items applied by the sync in progress
+        self._probed_at = 0.0
+        self._lock = asyncio.Lock()
+
+        # Rebuilt lazily after a sync changed something.
+        self._spans: dict[str, tuple[datetime, datetime]] = {}
+        self._events_tree: IntervalTree[str] | None = None
+        self._busy_tree: IntervalTree[str] | None = None
+
+    @property
+    def synced_at(self) -> datetime | None:
+        return self._synced_at
+
+    @property
+    def horizon(self) -> datetime:
+        """Earliest instant the mirror still answers for (older events are pruned)."""
+        return (self._synced_at or datetime.now(UTC)) - self.retention
+
+    def invalidate(self) -> None:
+        """Force a delta sync on the next read (e.g. after our own write)."""
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Freshness
+    # ------------------------------------------------------------------
+
+    async def ensure_fresh(self) -> Freshness:
+        """Bring the mirror up to date if needed and report its freshness.
+
+        A failed delta sync serves the previous state (its staleness is in
+        the returned ``Freshness``); a failed first sync raises so callers
+        can fall back to the live API.
+        """
+        async with self._lock:
+            invalidated_at = await self._load()
+            if self._needs_sync(invalidated_at):
+                try:
+                    await self._sync()
+                except Exception:
+                    if self._synced_at is None:
+                        raise
+                    logger.warning(
+                        "Calendar delta sync failed; serving mirror as of last sync",
+                        exc_info=True,
+                        extra={"operation": "calendar_sync", "calendar_id": self.calendar_id},
+                    )
+            return Freshness("mirror", self._synced_at)
+
+    async def _load(self) -> datetime | None:
+        """Hydrate from the cursor store once; return its invalidation stamp.
+
+        After the first load the store is only re-read for webhook stamps,
+        at most every ``_PROBE_INTERVAL_SECONDS``, so a burst of
+        availability checks costs one small query rather than one each.
+        """
+        if self.cursor_store is None:
+            return None
+        now = time.monotonic()
+        if self._loaded and now - self._probed_at < _PROBE_INTERVAL_SECONDS:
+            return None
+        self._probed_at = now
+        state = await self.cursor_store.load(PROVIDER, self.calendar_id) or {}
+        if not self._loaded:
+            self._restore(state)
+            self._loaded = True
+        stamp = state.get("invalidated_at")
+        return datetime.fromisoformat(stamp) if stamp else None
+
+    def _needs_sync(self, invalidated_at: datetime | None) -> bool:
+        if self._synced_at is None or self._sync_token is None or self._dirty:
+            return True
+        if invalidated_at is not None and invalidated_at >= self._synced_at:
+            return True
+        age = (datetime.now(UTC) - self._synced_at).total_seconds()
+        return age >= self.max_staleness_seconds
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    async def _sync(self) -> None:
+        started = datetime.now(UTC)
+        token = self._sync_token
+        self._dirty = False
+        self._applied = 0
+        if token is None:
+            await self._full_sync()
+        else:
+            try:
+                self._sync_token = await self._list(sync_token=token)
+            except SyncTokenExpiredError:
+                logger.info(
+                    "Calendar sync token expired; running full sync",
+                    extra={"operation": "calendar_sync", "calendar_id": self.calendar_id},
+                )
+                await self._full_sync()
+
+        pruned = self._prune(started)
+        self._synced_at = started
+        # An unchanged calendar only moves synced_at; skip rewriting the
+        # snapshot (a restart then just runs one extra, empty delta).
+        changed = self._applied or pruned or self._sync_token != token
+        if self.cursor_store is not None and changed:
+            await self.cursor_store.save(PROVIDER, self.calendar_id, self._state())
+
+    async def _full_sync(self) -> None:
+        # Keep serving the old snapshot if the listing fails part-way.
+        previous = self._events, self._spans
+        self._events, self._spans = {}, {}
+        self._events_tree = self._busy_tree = None
+        try:
+            self._sync_token = await self._list()
+        except Exception:
+            self._events, self._spans = previous
+            self._events_tree = self._busy_tree = None
+            raise
+
+    async def _list(self, *, sync_token: str | None = None) -> str:
+        """Page ``events.list`` into the mirror; return the next sync token."""
+        params: dict[str, Any] = {"singleEvents": "true", "maxResults": _PAGE_SIZE}
+        if sync_token is not None:
+            params["syncToken"] = sync_token
+        path = f"/calendars/{quote(self.calendar_id, safe='')}/events"
+        while True:
+            try:
+                data = await self._call("get", path, "sync_events", params=params)
+            except httpx.HTTPStatusError as e:
+                if sync_token is not None and e.response.status_code == 410:
+                    raise SyncTokenExpiredError from e
+                raise
+            self._time_zone = data.get("timeZone") or self._time_zone
+            for item in data.get("items", []):
+                self._apply(item)
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                return data["nextSyncToken"]
+            params = {**params, "pageToken": page_token}
+
+    def _apply(self, item: dict[str, Any]) -> None:
+        self._applied += 1
+        self._spans.pop(item["id"], None)
+        self._events_tree = self._busy_tree = None
+        if item.get("status") == "cancelled":
+            self._events.pop(item["id"], None)
+        else:
+            self._events[item["id"]] = {**format_event(item), "busy": is_busy(item)}
+
+    def _prune(self, now: datetime) -> bool:
+        cutoff = now - self.retention
+        expired = [event_id for event_id in self._events if self._span(event_id)[1] < cutoff]
+        for event_id in expired:
+            del self._events[event_id]
+            self._spans.pop(event_id, None)
+        if expired:
+            self._events_tree = self._busy_tree = None
+        return bool(expired)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _state(self) -> dict[str, Any]:
+        return {
+            "sync_token": self._sync_token,
+            "time_zone": self._time_zone,
+            "synced_at": self._synced_at.isoformat() if self._synced_at else None,
+            "events": list(self._events.values()),
+        }
+
+    def _restore(self, state: dict[str, Any]) -> None:
+        events = state.get("events")
+        if (
+            not state.get("sync_token")
+            or not state.get("synced_at")
+            or not isinstance(events, list)
+        ):
+            return
+        try:
+            self._events = {e["id"]: e for e in events}
+            self._synced_at = datetime.fromisoformat(state["synced_at"])
+        except (KeyError, TypeError, ValueError):
+            self._events, self._synced_at = {}, None
+            return
+        self._sync_token = state["sync_token"]
+        self._time_zone = state.get("time_zone")
+        self._spans, self._events_tree, self._busy_tree = {}, None, None
+
+    # ------------------------------------------------------------------
+    # Reads (memory only; call ensure_fresh() first)
+    # ------------------------------------------------------------------
+
+    def _span(self, event_id: str) -> tuple[datetime, datetime]:
+        span = self._spans.get(event_id)
+        if span is None:
+            event = self._events[event_id]
+            tz = _zone(self._time_zone)
+            start = parse_event_time(event["start_time"], tz)
+            end = parse_event_time(event["end_time"], tz) if event["end_time"] else start
+            span = self._spans[event_id] = (start, end)
+        return span
+
+    def _tree(self, *, busy_only: bool) -> IntervalTree[str]:
+        if self._events_tree is None or self._busy_tree is None:
+            spans = [(*self._span(event_id), event_id) for event_id in self._events]
+            self._events_tree = IntervalTree(spans)
+            self._busy_tree = IntervalTree(s for s in spans if self._events[s[2]]["busy"])
+        return self._busy_tree if busy_only else self._events_tree
+
+    def events_between(self, start: datetime, end: datetime, limit: int) -> list[dict[str, Any]]:
+        """Events overlapping ``[start, end)``, earliest first."""
+        hits = self._tree(busy_only=False).overlapping(start, end)[:limit]
+        return [
+            {k: v for k, v in self._events[event_id].items() if k != "busy"}
+            for _, _, event_id in hits
+        ]
+
+    def busy_periods(self, start: datetime, end: datetime) -> list[dict[str, str]]:
+        """Merged busy blocks within ``[start, end)``, shaped like ``freeBusy``."""
+        periods = merge_periods(self._tree(busy_only=True).overlapping(start, end))
+        return [{"start": _iso(max(s, start)), "end": _iso(min(e, end))} for s, e in periods]
+
+
+# ============================================================================
+# Webhook
+# ============================================================================
+
+
+async def apply_webhook_events(
+    session: AsyncSession, tenant_id: UUID, payload: dict[str, Any] | list[Any]
+) -> None:
+    """Mark the tenant's calendar mirrors stale after a push notification.
+
+    Push bodies identify neither the event nor (reliably) the calendar, so
+    every calendar cursor in the tenant is stamped; each employee's mirror
+    pulls a delta on its next read, which is a no-op if its calendar did
+    not change.
+    """
+    # The channel-creation handshake announces the channel, not a change.
+    if isinstance(payload, dict) and payload.get("resourceState") == "sync":
+        return
+    stamp = {"invalidated_at": datetime.now(UTC).isoformat()}
+    await session.execute(
+        update(IntegrationSyncCursor)
+        .where(
+            IntegrationSyncCursor.tenant_id == tenant_id,
+            IntegrationSyncCursor.provider == PROVIDER,
+            IntegrationSyncCursor.deleted_at.is_(None),
+        )
+        .values(
+            state=IntegrationSyncCursor.state.op("||")(literal(stamp, JSONB)),
+            updated_at=func.now(),
+        )
+    )
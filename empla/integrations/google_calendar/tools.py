@@ -3,6 +3,13 @@ empla.integrations.google_calendar.tools - Google Calendar Tools
 
 Direct Google Calendar API v3 integration via httpx. OAuth token from config.
 
+When the init config carries ``sessionmaker``, ``tenant_id`` and
+``employee_id`` (or ``mirror: True`` for a process-local mirror), event
+listings and availability checks are answered from the sync-token mirror
+(``empla/integrations/google_calendar/mirror.py``) and availability results
+report their freshness (``source`` / ``as_of`` / ``stale_seconds``). If the
+mirror cannot sync, tools fall back to the live API.
+
 API docs: https://developers.google.com/calendar/api/v3/reference
 
 Example:
@@ -12,13 +19,24 @@ Example:
 """
 
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from urllib.parse import quote
+from uuid import UUID
 
 import httpx
 
+from empla.integrations.google_calendar.freebusy import IntervalTree
+from empla.integrations.google_calendar.mirror import (
+    DEFAULT_MAX_STALENESS_SECONDS,
+    CalendarMirror,
+    format_event,
+    parse_event_time,
+)
+from empla.integrations.http import get_request_scheduler
 from empla.integrations.router import IntegrationRouter
+from empla.integrations.sync_cursors import DatabaseCursorStore, Freshness
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +47,9 @@ GCAL_API = "https://www.googleapis.com/calendar/v3"
 _client: httpx.AsyncClient | None = None
 _calendar_id: str = "primary"
 
+# Sync-token mirror; None unless enabled by the init config.
+_mirror: CalendarMirror | None = None
+
 
 def _api() -> httpx.AsyncClient:
     if _client is None:
@@ -76,7 +97,7 @@ async def _call(method: str, path: str, operation: str, **kwargs: Any) -> dict[s
 
 
 async def _gcal_init(**config: Any) -> None:
-    global _client, _calendar_id  # noqa: PLW0603
+    global _client, _calendar_id, _mirror  # noqa: PLW0603
     # Close previous client if re-initializing (e.g., token refresh)
     if _client is not None:
         try:
@@ -87,16 +108,43 @@ async def _gcal_init(**config: Any) -> None:
     if not token:
         raise ValueError("Google Calendar requires 'access_token' in config")
     _calendar_id = config.get("calendar_id", "primary")
-    _client = httpx.AsyncClient(
+    _client = get_request_scheduler().client(
+        "google_calendar",
+        credential=token,
         base_url=GCAL_API,
         headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
         timeout=30.0,
     )
-    logger.info("Google Calendar connector initialized (calendar: %s)", _calendar_id)
+
+    sessionmaker = config.get("sessionmaker")
+    tenant_id = config.get("tenant_id")
+    employee_id = config.get("employee_id")
+    store = (
+        DatabaseCursorStore(sessionmaker, UUID(str(tenant_id)), UUID(str(employee_id)))
+        if sessionmaker is not None and tenant_id and employee_id
+        else None
+    )
+    if config.get("mirror", store is not None):
+        _mirror = CalendarMirror(
+            _call,
+            calendar_id=_calendar_id,
+            cursor_store=store,
+            max_staleness_seconds=float(
+                config.get("mirror_max_staleness_seconds", DEFAULT_MAX_STALENESS_SECONDS)
+            ),
+        )
+    else:
+        _mirror = None
+    logger.info(
+        "Google Calendar connector initialized (calendar: %s, mirror=%s)",
+        _calendar_id,
+        _mirror is not None,
+    )
 
 
 async def _gcal_shutdown() -> None:
-    global _client  # noqa: PLW0603
+    global _client, _mirror  # noqa: PLW0603
+    _mirror = None
     if _client:
         try:
             await _client.aclose()
@@ -110,15 +158,45 @@ async def _gcal_shutdown() -> None:
 router = IntegrationRouter("google_calendar", on_init=_gcal_init, on_shutdown=_gcal_shutdown)
 
 
+async def _fresh_mirror(since: datetime) -> tuple[CalendarMirror, Freshness] | None:
+    """The synced mirror if it covers ``since``, or None to use the live API."""
+    if _mirror is None:
+        return None
+    try:
+        freshness = await _mirror.ensure_fresh()
+    except Exception:
+        logger.warning(
+            "Google Calendar mirror sync failed; falling back to live API",
+            exc_info=True,
+            extra={"operation": "calendar_mirror", "calendar_id": _calendar_id},
+        )
+        return None
+    if since < _mirror.horizon:
+        return None
+    return _mirror, freshness
+
+
+def _invalidate_mirror() -> None:
+    if _mirror is not None:
+        _mirror.invalidate()
+
+
+def _parse_time(value: str) -> datetime:
+    return parse_event_time(value, UTC)
+
+
 # ============================================================================
 # Events
 # ============================================================================
 
 
-@router.tool()
+@router.tool(cache_ttl=30)
 async def get_upcoming_events(days: int = 7, limit: int = 20) -> list[dict]:
     """Get upcoming calendar events within the next N days."""
     now = datetime.now(UTC)
+    mirrored = await _fresh_mirror(now)
+    if mirrored is not None:
+        return mirrored[0].events_between(now, now + timedelta(days=days), min(limit, 250))
     data = await _call(
         "get",
         _cal_path("/events"),
@@ -131,18 +209,7 @@ async def get_upcoming_events(days: int = 7, limit: int = 20) -> list[dict]:
             "orderBy": "startTime",
         },
     )
-    return [
-        {
-            "id": e["id"],
-            "title": e.get("summary", "(no title)"),
-            "start_time": e.get("start", {}).get("dateTime") or e.get("start", {}).get("date", ""),
-            "end_time": e.get("end", {}).get("dateTime") or e.get("end", {}).get("date", ""),
-            "description": e.get("description"),
-            "location": e.get("location"),
-            "attendees": [a.get("email", "") for a in e.get("attendees", [])],
-        }
-        for e in data.get("items", [])
-    ]
+    return [format_event(e) for e in data.get("items", [])]
 
 
 @router.tool()
@@ -168,6 +235,7 @@ async def create_event(
         body["attendees"] = [{"email": a} for a in attendees]
 
     data = await _call("post", _cal_path("/events"), "create_event", json=body)
+    _invalidate_mirror()
     return {
         "id": data["id"],
         "title": title,
@@ -200,6 +268,7 @@ async def update_event(
 
     safe_id = quote(event_id, safe="")
     await _call("patch", _cal_path(f"/events/{safe_id}"), "update_event", json=body)
+    _invalidate_mirror()
     return {"id": event_id, "updated": list(body.keys())}
 
 
@@ -208,24 +277,69 @@ async def delete_event(event_id: str) -> dict[str, Any]:
     """Delete a calendar event."""
     safe_id = quote(event_id, safe="")
     await _call("delete", _cal_path(f"/events/{safe_id}"), "delete_event")
+    _invalidate_mirror()
     return {"success": True, "deleted_id": event_id}
 
 
-@router.tool()
-async def check_availability(start_time: str, end_time: str) -> dict[str, Any]:
-    """Check if a time slot is free (no conflicting events)."""
+async def _busy_lookup(start: datetime, end: datetime) -> tuple[Callable, Freshness]:
+    """A ``(start, end) -> busy periods`` lookup covering ``[start, end)``.
+
+    Served from the mirror when possible; otherwise one ``freeBusy`` call
+    for the whole range, indexed locally so every slot inside it is a
+    memory lookup either way.
+    """
+    mirrored = await _fresh_mirror(start)
+    if mirrored is not None:
+        return mirrored[0].busy_periods, mirrored[1]
+
     data = await _call(
         "post",
         "/freeBusy",
         "check_availability",
         json={
-            "timeMin": start_time,
-            "timeMax": end_time,
+            "timeMin": start.isoformat(),
+            "timeMax": end.isoformat(),
             "items": [{"id": _calendar_id}],
         },
     )
-    busy_periods = data.get("calendars", {}).get(_calendar_id, {}).get("busy", [])
-    return {
-        "available": len(busy_periods) == 0,
-        "conflicts": busy_periods,
-    }
+    busy = data.get("calendars", {}).get(_calendar_id, {}).get("busy", [])
+    tree = IntervalTree((_parse_time(b["start"]), _parse_time(b["end"]), b) for b in busy)
+
+    def lookup(slot_start: datetime, slot_end: datetime) -> list[dict[str, Any]]:
+        return [b for _, _, b in tree.overlapping(slot_start, slot_end)]
+
+    return lookup, Freshness("live", datetime.now(UTC))
+
+
+@router.tool(cache_ttl=30)
+async def check_availability(start_time: str, end_time: str) -> dict[str, Any]:
+    """Check if a time slot is free (no conflicting events)."""
+    start, end = _parse_time(start_time), _parse_time(end_time)
+    lookup, freshness = await _busy_lookup(start, end)
+    conflicts = lookup(start, end)
+    return {"available": not conflicts, "conflicts": conflicts, **freshness.to_dict()}
+
+
+@router.tool(cache_ttl=30)
+async def check_slots(slots: list[dict[str, str]]) -> dict[str, Any]:
+    """Check several candidate slots at once.
+
+    Each slot is ``{"start_time": ..., "end_time": ...}`` in ISO 8601.
+    Costs at most one API call regardless of the number of slots.
+    """
+    if not slots:
+        raise ValueError("No slots to check")
+    spans = [(_parse_time(s["start_time"]), _parse_time(s["end_time"])) for s in slots]
+    lookup, freshness = await _busy_lookup(min(s for s, _ in spans), max(e for _, e in spans))
+    results = []
+    for slot, (start, end) in zip(slots, spans, strict=True):
+        conflicts = lookup(start, end)
+        results.append(
+            {
+                "start_time": slot["start_time"],
+                "end_time": slot["end_time"],
+                "available": not conflicts,
+                "conflicts": conflicts,
+            }
+        )
+    return {"slots": results, **freshness.to_dict()}
@@ -8,6 +8,9 @@ Note: Google Calendar push notifications send most metadata via HTTP headers
 This parser handles what's available in the body; header-based enrichment
 can be added when the webhook endpoint passes headers through.
 
+Every notification also invalidates the tenant's calendar mirrors (see
+``mirror.apply_webhook_events``) so the next read pulls a sync-token delta.
+
 Ref: https://developers.google.com/calendar/api/guides/push
 """
 
@@ -15,7 +18,8 @@ from __future__ import annotations
 
 from typing import Any
 
-from empla.integrations.webhooks import register_webhook_parser
+from empla.integrations.google_calendar.mirror import apply_webhook_events
+from empla.integrations.webhooks import register_webhook_handler, register_webhook_parser
 
 
 def parse_google_webhook(payload: dict[str, Any]) -> tuple[str, str]:
@@ -26,3 +30,5 @@ def parse_google_webhook(payload: dict[str, Any]) -> tuple[str, str]:
 
 
 register_webhook_parser("google_calendar", parse_google_webhook, aliases=["google_workspace"])
+register_webhook_handler("google_calendar", apply_webhook_events)
+register_webhook_handler("google_workspace", apply_webhook_events)
@@ -0,0 +1,469 @@
+"""
+empla.integrations.http - Rate-Limit-Aware Outbound Request Scheduler
+
+Shared pacing layer for the httpx-based connectors (HubSpot, Google
+Calendar). Connectors build their client with ``scheduler.client(...)``;
+every request made through it then:
+
+1. Waits its turn in a per-provider priority queue. A request is released
+   when both the provider's token bucket and its credential's token bucket
+   have a token, so one busy credential cannot starve the others and the
+   process as a whole stays under the provider's app-level quota.
+2. On ``429`` (or ``503`` with ``Retry-After``), pauses that credential's
+   lane for the server-requested time plus jitter and retries, up to
+   ``max_retries``. Queued requests for the same credential wait out the
+   pause too instead of hammering the API into further 429s.
+
+Priority comes from the ``request_priority()`` context: the perception pass
+marks its tool calls ``BACKGROUND`` so intention execution (``NORMAL``) and
+explicitly user-requested work (``INTERACTIVE``) overtake polling.
+
+All clients for a provider share one keep-alive connection pool (optionally
+HTTP/2), which survives connector re-initialisation on token refresh.
+
+``collect_stats()`` reports queue depth and queue-wait time per provider
+since the previous call; the loop records them as ``integration.http.*``
+metrics each cycle.
+
+Example:
+    >>> scheduler = get_request_scheduler()
+    >>> client = scheduler.client("hubspot", credential=token, base_url=HUBSPOT_API)
+    >>> with request_priority(Priority.BACKGROUND):
+    ...     resp = await client.get("/crm/v3/objects/deals")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import hashlib
+import itertools
+import logging
+import random
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Queue priority for outbound requests (lower is served first)."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    "integration_request_priority", default=Priority.NORMAL
+)
+
+
+@contextlib.contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed integration requests at ``priority``."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token-bucket parameters: sustained ``rate`` per second, up to ``burst`` at once."""
+
+    rate: float
+    burst: int
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Quota shape of one provider.
+
+    Attributes:
+        provider: Limit shared by every credential in this process
+            (app-level quota), or None for no app-level pacing.
+        credential: Limit per access token (account / user quota).
+    """
+
+    provider: RateLimit | None = None
+    credential: RateLimit | None = None
+
+
+# Published quotas, with some headroom. A cold bucket spends its whole
+# burst and then refills at ``rate``, so a window of N seconds admits up to
+# ``burst + N * rate`` requests; size both against the quota window.
+# - HubSpot: 110 requests / 10 s per account for OAuth apps, so at most
+#   100-105 per 10 s here, burst included.
+# - Google Calendar: 600 queries / minute per user; per-project quota is
+#   much higher and rarely the constraint from a single process.
+DEFAULT_LIMITS: dict[str, ProviderLimits] = {
+    "hubspot": ProviderLimits(
+        provider=RateLimit(rate=9.0, burst=15),
+        credential=RateLimit(rate=9.0, burst=10),
+    ),
+    "google_calendar": ProviderLimits(
+        provider=RateLimit(rate=100.0, burst=200),
+        credential=RateLimit(rate=9.0, burst=20),
+    ),
+}
+
+_RETRY_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max((when - (now or datetime.now(UTC))).total_seconds(), 0.0)
+
+
+def credential_key(credential: str | None) -> str:
+    """Stable, non-reversible lane key for an access token."""
+    if not credential:
+        return "-"
+    return hashlib.sha256(credential.encode()).hexdigest()[:16]
+
+
+# ============================================================================
+# Pacing
+# ============================================================================
+
+
+class _Bucket:
+    """Token bucket that can also be paused until a deadline (Retry-After)."""
+
+    def __init__(self, limit: RateLimit | None) -> None:
+        self.limit = limit
+        self.tokens = float(limit.burst) if limit else 0.0
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        wait = max(self.paused_until - now, 0.0)
+        if self.limit is not None:
+            self.tokens = min(
+                float(self.limit.burst), self.tokens + (now - self.updated) * self.limit.rate
+            )
+            self.updated = now
+            if self.tokens < 1.0:
+                wait = max(wait, (1.0 - self.tokens) / self.limit.rate)
+        return wait
+
+    def take(self) -> None:
+        if self.limit is not None:
+            self.tokens -= 1.0
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    credential: str = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+
+
+@dataclass
+class _LaneStats:
+    requests: int = 0
+    throttled: int = 0
+    retries: int = 0
+    wait_count: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+
+class _ProviderLane:
+    """Priority queue and buckets for one provider."""
+
+    def __init__(self, limits: ProviderLimits) -> None:
+        self.limits = limits
+        self.bucket = _Bucket(limits.provider)
+        self.credentials: dict[str, _Bucket] = {}
+        self.waiters: list[_Waiter] = []
+        self.timer: asyncio.TimerHandle | None = None
+        self.stats = _LaneStats()
+
+    def credential_bucket(self, key: str) -> _Bucket:
+        bucket = self.credentials.get(key)
+        if bucket is None:
+            bucket = self.credentials[key] = _Bucket(self.limits.credential)
+        return bucket
+
+
+# ============================================================================
+# Scheduler
+# ============================================================================
+
+
+class RequestScheduler:
+    """Paces, prioritises and retries outbound integration requests."""
+
+    def __init__(
+        self,
+        *,
+        limits: dict[str, ProviderLimits] | None = None,
+        max_retries: int = 3,
+        max_retry_after: float = 60.0,
+        http2: bool = False,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+    ) -> None:
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self.http2 = http2
+        self.pool_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._lanes: dict[str, _ProviderLane] = {}
+        self._transports: dict[str, httpx.AsyncBaseTransport] = {}
+        self._seq = itertools.count()
+
+    # ------------------------------------------------------------------
+    # Clients
+    # ------------------------------------------------------------------
+
+    def client(
+        self, provider: str, *, credential: str | None = None, **kwargs: Any
+    ) -> httpx.AsyncClient:
+        """An ``httpx.AsyncClient`` whose requests go through this scheduler.
+
+        Args:
+            provider: Provider name; selects the quota and connection pool.
+            credential: Access token the client authenticates with. Only a
+                hash of it is kept, as the per-credential lane key.
+            **kwargs: Passed to ``httpx.AsyncClient`` (base_url, headers,
+                timeout, ...).
+        """
+        transport = _ScheduledTransport(self, provider, credential_key(credential))
+        return httpx.AsyncClient(transport=transport, **kwargs)
+
+    def _transport(self, provider: str) -> httpx.AsyncBaseTransport:
+        transport = self._transports.get(provider)
+        if transport is None:
+            if self.http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError as e:
+                    raise RuntimeError(
+                        "HTTP/2 for integrations requires h2. "
+                        "Install with: pip install 'httpx[http2]'"
+                    ) from e
+            transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self.pool_limits)
+            self._transports[provider] = transport
+        return transport
+
+    async def aclose(self) -> None:
+        """Close the shared connection pools."""
+        transports, self._transports = list(self._transports.values()), {}
+        for transport in transports:
+            with contextlib.suppress(Exception):
+                await transport.aclose()
+
+    # ------------------------------------------------------------------
+    # Queueing
+    # ------------------------------------------------------------------
+
+    def _lane(self, provider: str) -> _ProviderLane:
+        lane = self._lanes.get(provider)
+        if lane is None:
+            lane = self._lanes[provider] = _ProviderLane(
+                self.limits.get(provider, ProviderLimits())
+            )
+        return lane
+
+    async def acquire(
+        self, provider: str, credential: str, priority: Priority | None = None
+    ) -> float:
+        """Wait for a request slot; return the time spent queued (seconds)."""
+        lane = self._lane(provider)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(
+            int(_priority.get() if priority is None else priority),
+            next(self._seq),
+            credential,
+            future,
+        )
+        bisect.insort(lane.waiters, waiter)
+        enqueued = time.monotonic()
+        self._dispatch(lane)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if waiter in lane.waiters:
+                lane.waiters.remove(waiter)
+                self._dispatch(lane)
+            raise
+        waited = time.monotonic() - enqueued
+        stats = lane.stats
+        stats.requests += 1
+        stats.wait_count += 1
+        stats.wait_total += waited
+        stats.wait_max = max(stats.wait_max, waited)
+        return waited
+
+    def _dispatch(self, lane: _ProviderLane) -> None:
+        """Release every waiter that can go now; re-arm a timer for the rest."""
+        if lane.timer is not None:
+            lane.timer.cancel()
+            lane.timer = None
+        now = time.monotonic()
+        while lane.waiters:
+            retry_in = lane.bucket.delay(now)
+            if retry_in == 0.0:
+                # Highest-priority waiter whose credential has a token; a
+                # paused credential must not hold up the others.
+                retry_in = float("inf")
+                for index, waiter in enumerate(lane.waiters):
+                    credential_wait = lane.credential_bucket(waiter.credential).delay(now)
+                    if credential_wait == 0.0:
+                        del lane.waiters[index]
+                        lane.bucket.take()
+                        lane.credential_bucket(waiter.credential).take()
+                        if not waiter.future.done():
+                            waiter.future.set_result(None)
+                        retry_in = 0.0
+                        break
+                    retry_in = min(retry_in, credential_wait)
+                if retry_in == 0.0:
+                    continue
+            loop = asyncio.get_running_loop()
+            lane.timer = loop.call_later(retry_in, self._dispatch, lane)
+            return
+
+    def _pause(self, provider: str, credential: str, seconds: float) -> None:
+        """Hold a credential's lane for ``seconds`` (plus jitter)."""
+        lane = self._lane(provider)
+        bucket = lane.credential_bucket(credential)
+        # Up to 20% jitter so lanes paused together do not resume in lockstep.
+        until = time.monotonic() + seconds * (1.0 + random.uniform(0.0, 0.2))
+        bucket.paused_until = max(bucket.paused_until, until)
+        self._dispatch(lane)
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter when the server gave no Retry-After.
+        return random.uniform(0.0, min(2.0**attempt, self.max_retry_after))
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def collect_stats(self) -> dict[str, dict[str, float]]:
+        """Per-provider queue metrics since the previous call.
+
+        ``queue_depth`` is the current number of queued requests; the
+        other values cover the interval since the last collection.
+        """
+        collected: dict[str, dict[str, float]] = {}
+        for provider, lane in self._lanes.items():
+            stats = lane.stats
+            collected[provider] = {
+                "queue_depth": float(len(lane.waiters)),
+                "requests": float(stats.requests),
+                "throttled": float(stats.throttled),
+                "retries": float(stats.retries),
+                "wait_ms_avg": round(stats.wait_total / stats.wait_count * 1000, 1)
+                if stats.wait_count
+                else 0.0,
+                "wait_ms_max": round(stats.wait_max * 1000, 1),
+            }
+            lane.stats = _LaneStats()
+        return collected
+
+
+class _ScheduledTransport(httpx.AsyncBaseTransport):
+    """Transport that queues, paces and retries through a ``RequestScheduler``."""
+
+    def __init__(self, scheduler: RequestScheduler, provider: str, credential: str) -> None:
+        self._scheduler = scheduler
+        self._provider = provider
+        self._credential = credential
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        scheduler = self._scheduler
+        transport = scheduler._transport(self._provider)
+        attempt = 0
+        while True:
+            await scheduler.acquire(self._provider, self._credential)
+            response = await transport.handle_async_request(request)
+            if response.status_code not in _RETRY_STATUSES:
+                return response
+
+            lane = scheduler._lane(self._provider)
+            lane.stats.throttled += 1
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                if response.status_code != 429:
+                    return response  # a bare 503 is an outage, not pacing
+                delay = scheduler._backoff(attempt)
+            scheduler._pause(
+                self._provider, self._credential, min(delay, scheduler.max_retry_after)
+            )
+            if attempt >= scheduler.max_retries or delay > scheduler.max_retry_after:
+                return response
+
+            logger.info(
+                "%s throttled (%s); retrying in %.1fs",
+                self._provider,
+                response.status_code,
+                delay,
+                extra={"provider": self._provider, "attempt": attempt + 1},
+            )
+            await response.aclose()
+            lane.stats.retries += 1
+            attempt += 1
+
+    async def aclose(self) -> None:
+        # The connection pool is shared per provider and owned by the
+        # scheduler; a connector closing its client must not tear it down.
+        return None
+
+
+_scheduler: RequestScheduler | None = None
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """Process-wide scheduler configured from ``EmplaSettings``."""
+    global _scheduler  # noqa: PLW0603
+    if _scheduler is None:
+        from empla.settings import get_settings
+
+        settings = get_settings()
+        _scheduler = RequestScheduler(
+            max_retries=settings.integration_http_max_retries,
+            http2=settings.integration_http2,
+            max_connections=settings.integration_http_max_connections,
+            max_keepalive_connections=settings.integration_http_max_keepalive,
+        )
+    return _scheduler
+
+
+def collect_request_stats() -> dict[str, dict[str, float]]:
+    """``collect_stats()`` of the process scheduler, or {} if none was created."""
+    return _scheduler.collect_stats() if _scheduler is not None else {}
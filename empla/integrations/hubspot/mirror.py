@@ -0,0 +1,673 @@
+"""
+empla.integrations.hubspot.mirror - Local HubSpot CRM Mirror
+
+Keeps tenant-scoped copies of HubSpot deals and contacts in Postgres
+(``crm_deals`` / ``crm_contacts``) so the HubSpot tools can answer from
+indexed local tables instead of paging the API on every call.
+
+Freshness comes from three paths:
+- ``seed()``: one full listing per object type, on first use.
+- ``sync_delta()``: a search on the last-modified property from the
+  stored watermark, run when the mirror is older than
+  ``max_staleness_seconds`` or a webhook invalidated it.
+- ``apply_webhook_events()``: called by the webhook endpoint; property
+  changes and deletions are applied in place, anything else (creations,
+  merges, restores) marks the object type dirty for the next delta sync.
+
+Every write is guarded by ``remote_updated_at`` so an older search page
+can never overwrite a newer webhook value (and vice versa). ``synced_at``
+records when a sync last saw the object and is bumped either way.
+
+Example:
+    >>> mirror = HubSpotMirror(sessionmaker, tenant_id, call=_call)
+    >>> freshness = await mirror.ensure_fresh("deals")
+    >>> metrics = await mirror.pipeline_metrics(ACTIVE_STAGES)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, case, delete, func, literal_column, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from empla.integrations.sync_cursors import Freshness
+from empla.models.crm import CONTACT_TSVECTOR, CRMContact, CRMDeal, CRMSyncState
+
+logger = logging.getLogger(__name__)
+
+PROVIDER = "hubspot"
+
+DEFAULT_MAX_STALENESS_SECONDS = 300.0
+
+ACTIVE_STAGES = frozenset(
+    {
+        "appointmentscheduled",
+        "qualifiedtobuy",
+        "presentationscheduled",
+        "decisionmakerboughtin",
+        "contractsent",
+    }
+)
+
+_PAGE_SIZE = 100
+
+# The search API refuses to page past 10,000 results for one query; delta
+# syncs restart from the advanced watermark before reaching it.
+_SEARCH_RESULT_CAP = 10_000
+
+# (method, path, operation, **kwargs) -> JSON; ``tools._call`` in production.
+ApiCall = Callable[..., Awaitable[dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class _ObjectSpec:
+    """How one HubSpot object type maps onto its mirror table."""
+
+    object_type: str
+    model: type[CRMDeal] | type[CRMContact]
+    modified_property: str
+    columns: dict[str, str]  # HubSpot property -> mirror column
+
+    @property
+    def properties(self) -> list[str]:
+        return [*self.columns, self.modified_property]
+
+
+DEALS = _ObjectSpec(
+    object_type="deals",
+    model=CRMDeal,
+    modified_property="hs_lastmodifieddate",
+    columns={
+        "dealname": "name",
+        "dealstage": "stage",
+        "pipeline": "pipeline",
+        "amount": "amount",
+        "closedate": "close_date",
+    },
+)
+
+CONTACTS = _ObjectSpec(
+    object_type="contacts",
+    model=CRMContact,
+    modified_property="lastmodifieddate",
+    columns={
+        "firstname": "first_name",
+        "lastname": "last_name",
+        "email": "email",
+        "company": "company",
+    },
+)
+
+_SPECS = {spec.object_type: spec for spec in (DEALS, CONTACTS)}
+
+# Legacy subscriptions are "deal.propertyChange"; generic ones are
+# "object.propertyChange" with an objectTypeId.
+_WEBHOOK_PREFIXES = {"deal": "deals", "contact": "contacts"}
+_OBJECT_TYPE_IDS = {"0-1": "contacts", "0-3": "deals"}
+
+
+# ============================================================================
+# Row mapping
+# ============================================================================
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    """Parse a HubSpot timestamp (ISO-8601 or epoch milliseconds)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, int | float) or (isinstance(value, str) and value.isdigit()):
+        return datetime.fromtimestamp(int(value) / 1000, tz=UTC)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _coerce(column: str, value: Any) -> Any:
+    """Convert a raw HubSpot property string to the mirror column type."""
+    if column == "amount":
+        try:
+            return float(value) if value not in (None, "") else None
+        except (TypeError, ValueError):
+            return None
+    if column == "close_date":
+        return parse_timestamp(value)
+    if column == "name":
+        return value or ""
+    return value or None
+
+
+def object_row(
+    spec: _ObjectSpec, obj: dict[str, Any], tenant_id: UUID, synced_at: datetime
+) -> dict[str, Any]:
+    """Map one API object onto a mirror-table row."""
+    props = obj.get("properties") or {}
+    row: dict[str, Any] = {
+        "id": uuid4(),
+        "tenant_id": tenant_id,
+        "provider": PROVIDER,
+        "external_id": str(obj["id"]),
+        "properties": props,
+        "remote_updated_at": parse_timestamp(
+            obj.get("updatedAt") or props.get(spec.modified_property)
+        ),
+        "synced_at": synced_at,
+        "deleted_at": None,
+    }
+    for prop, column in spec.columns.items():
+        row[column] = _coerce(column, props.get(prop))
+    return row
+
+
+def upsert_statement(spec: _ObjectSpec, rows: list[dict[str, Any]]) -> Any:
+    """INSERT ... ON CONFLICT that never lets older data win.
+
+    ``synced_at`` is bumped even when the data is kept: a webhook can stamp
+    a row with an event time later than the object's last-modified date,
+    and the seed's sweep must still see that the listing returned it.
+    """
+    table = spec.model.__table__
+    stmt = pg_insert(table).values(rows)
+    excluded = stmt.excluded
+    newer = or_(
+        table.c.remote_updated_at.is_(None),
+        excluded.remote_updated_at.is_(None),
+        table.c.remote_updated_at <= excluded.remote_updated_at,
+    )
+    columns = [*spec.columns.values(), "properties", "remote_updated_at", "deleted_at"]
+    updates: dict[str, Any] = {c: case((newer, excluded[c]), else_=table.c[c]) for c in columns}
+    updates["synced_at"] = func.greatest(table.c.synced_at, excluded.synced_at)
+    updates["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(
+        constraint=f"uq_crm_{spec.object_type}_external",
+        set_=updates,
+    )
+
+
+def contact_tsquery(query: str) -> str:
+    """Prefix-match every word, e.g. "jane acme" -> "jane:* & acme:*"."""
+    words = re.findall(r"\w+", query.lower())
+    return " & ".join(f"{w}:*" for w in words)
+
+
+def _format_deal(row: Any) -> dict[str, Any]:
+    return {
+        "id": row.external_id,
+        "name": row.name,
+        "stage": row.stage or "",
+        "amount": float(row.amount or 0),
+        "close_date": row.close_date.isoformat() if row.close_date else None,
+    }
+
+
+def _format_contact(row: Any) -> dict[str, Any]:
+    return {
+        "id": row.external_id,
+        "name": f"{row.first_name or ''} {row.last_name or ''}".strip(),
+        "email": row.email or "",
+        "company": row.company or "",
+    }
+
+
+# ============================================================================
+# Webhooks
+# ============================================================================
+
+
+def _classify(event: dict[str, Any]) -> tuple[_ObjectSpec | None, str]:
+    """Map a webhook event to (object spec, action)."""
+    prefix, _, action = str(event.get("subscriptionType", "")).partition(".")
+    if prefix == "object":
+        object_type = _OBJECT_TYPE_IDS.get(str(event.get("objectTypeId", "")))
+    else:
+        object_type = _WEBHOOK_PREFIXES.get(prefix)
+    return (_SPECS[object_type] if object_type else None), action
+
+
+def _row_filter(spec: _ObjectSpec, tenant_id: UUID, external_id: str) -> Any:
+    model = spec.model
+    return and_(
+        model.tenant_id == tenant_id,
+        model.provider == PROVIDER,
+        model.external_id == external_id,
+    )
+
+
+def _not_newer_than(spec: _ObjectSpec, occurred_at: datetime) -> Any:
+    column = spec.model.remote_updated_at
+    return or_(column.is_(None), column <= occurred_at)
+
+
+async def _apply_property_change(
+    session: AsyncSession,
+    spec: _ObjectSpec,
+    tenant_id: UUID,
+    external_id: str,
+    *,
+    event: dict[str, Any],
+    occurred_at: datetime,
+) -> bool:
+    name = event.get("propertyName")
+    if not name:
+        return False
+    value = event.get("propertyValue")
+    model = spec.model
+    values: dict[str, Any] = {
+        "properties": model.properties.op("||")(func.jsonb_build_object(name, value)),
+        "remote_updated_at": occurred_at,
+        "synced_at": func.now(),
+    }
+    if name in spec.columns:
+        values[spec.columns[name]] = _coerce(spec.columns[name], value)
+    result = await session.execute(
+        update(model)
+        .where(
+            _row_filter(spec, tenant_id, external_id),
+            model.deleted_at.is_(None),
+            _not_newer_than(spec, occurred_at),
+        )
+        .values(**values)
+    )
+    # Zero rows: unknown object (created before the seed finished) or a
+    # newer write already landed — either way let the delta sync decide.
+    return bool(result.rowcount)
+
+
+async def _apply_deletion(
+    session: AsyncSession,
+    spec: _ObjectSpec,
+    tenant_id: UUID,
+    external_id: str,
+    occurred_at: datetime,
+) -> bool:
+    model = spec.model
+    await session.execute(
+        update(model)
+        .where(
+            _row_filter(spec, tenant_id, external_id),
+            model.deleted_at.is_(None),
+            _not_newer_than(spec, occurred_at),
+        )
+        .values(deleted_at=occurred_at, remote_updated_at=occurred_at, synced_at=func.now())
+    )
+    # Search results never include deleted objects, so nothing to re-sync.
+    return True
+
+
+async def apply_webhook_events(session: AsyncSession, tenant_id: UUID, payload: Any) -> None:
+    """Apply a HubSpot webhook delivery to the tenant's mirror.
+
+    Registered as the HubSpot webhook handler; the endpoint commits.
+    Property changes and deletions are applied in place. Creations,
+    restores, merges and association changes carry no object data, so
+    they mark the object type invalidated and the next read delta-syncs.
+    GDPR privacy deletions remove the contact row outright.
+    """
+    events = payload if isinstance(payload, list) else [payload]
+    invalidated: set[str] = set()
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        spec, action = _classify(event)
+        external_id = str(event.get("objectId") or "")
+        if spec is None or not external_id:
+            continue
+        occurred_at = parse_timestamp(event.get("occurredAt")) or datetime.now(UTC)
+
+        if action == "propertyChange":
+            applied = await _apply_property_change(
+                session, spec, tenant_id, external_id, event=event, occurred_at=occurred_at
+            )
+        elif action == "deletion":
+            applied = await _apply_deletion(session, spec, tenant_id, external_id, occurred_at)
+        elif action == "privacyDeletion":
+            await session.execute(
+                delete(spec.model).where(_row_filter(spec, tenant_id, external_id))
+            )
+            applied = True
+        else:
+            applied = False
+
+        if not applied:
+            invalidated.add(spec.object_type)
+
+    if invalidated:
+        await session.execute(
+            update(CRMSyncState)
+            .where(
+                CRMSyncState.tenant_id == tenant_id,
+                CRMSyncState.provider == PROVIDER,
+                CRMSyncState.object_type.in_(sorted(invalidated)),
+            )
+            .values(invalidated_at=func.now())
+        )
+
+
+# ============================================================================
+# Mirror
+# ============================================================================
+
+
+class HubSpotMirror:
+    """Seeds, delta-syncs and queries one tenant's local HubSpot mirror.
+
+    Args:
+        sessionmaker: Async session factory for the mirror tables.
+        tenant_id: Tenant whose HubSpot portal is mirrored.
+        call: API call helper ``(method, path, operation, **kwargs) -> JSON``.
+        max_staleness_seconds: Reads older than this trigger a delta sync.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        tenant_id: UUID,
+        call: ApiCall,
+        *,
+        max_staleness_seconds: float = DEFAULT_MAX_STALENESS_SECONDS,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self.tenant_id = tenant_id
+        self._call = call
+        self.max_staleness_seconds = max_staleness_seconds
+        # One sync at a time per object type; concurrent readers wait and
+        # then see the fresh state instead of issuing duplicate searches.
+        self._locks = {object_type: asyncio.Lock() for object_type in _SPECS}
+
+    # ------------------------------------------------------------------
+    # Sync state
+    # ------------------------------------------------------------------
+
+    async def _load_state(self, spec: _ObjectSpec) -> Any:
+        async with self._sessionmaker() as session:
+            result = await session.execute(
+                select(
+                    CRMSyncState.seeded_at,
+                    CRMSyncState.synced_at,
+                    CRMSyncState.watermark,
+                    CRMSyncState.invalidated_at,
+                ).where(
+                    CRMSyncState.tenant_id == self.tenant_id,
+                    CRMSyncState.provider == PROVIDER,
+                    CRMSyncState.object_type == spec.object_type,
+                )
+            )
+            return result.one_or_none()
+
+    async def _save_state(self, session: AsyncSession, spec: _ObjectSpec, **values: Any) -> None:
+        stmt = pg_insert(CRMSyncState).values(
+            id=uuid4(),
+            tenant_id=self.tenant_id,
+            provider=PROVIDER,
+            object_type=spec.object_type,
+            **values,
+        )
+        await session.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_crm_sync_state_object",
+                set_={**values, "updated_at": func.now()},
+            )
+        )
+
+    def needs_sync(self, state: Any, now: datetime | None = None) -> bool:
+        """Whether a seeded mirror is past its staleness bound or invalidated."""
+        if state.synced_at is None:
+            return True
+        now = now or datetime.now(UTC)
+        if (now - state.synced_at).total_seconds() > self.max_staleness_seconds:
+            return True
+        return state.invalidated_at is not None and state.invalidated_at >= state.synced_at
+
+    async def ensure_fresh(self, object_type: str) -> Freshness:
+        """Seed or delta-sync ``object_type`` if needed; return its freshness.
+
+        A failed delta sync on an already-seeded mirror is logged and the
+        stale data is served — the returned ``as_of`` says how stale. A
+        failed seed raises (there is nothing to serve).
+        """
+        spec = _SPECS[object_type]
+        async with self._locks[object_type]:
+            state = await self._load_state(spec)
+            if state is None or state.seeded_at is None:
+                await self.seed(object_type)
+            elif self.needs_sync(state):
+                try:
+                    await self.sync_delta(object_type)
+                except Exception:
+                    logger.warning(
+                        "HubSpot %s delta sync failed; serving mirror as of %s",
+                        object_type,
+                        state.synced_at,
+                        exc_info=True,
+                        extra={"tenant_id": str(self.tenant_id)},
+                    )
+                    return Freshness("mirror", state.synced_at)
+            state = await self._load_state(spec)
+        return Freshness("mirror", state.synced_at if state else None)
+
+    # ------------------------------------------------------------------
+    # Seeding and delta sync
+    # ------------------------------------------------------------------
+
+    async def _upsert(
+        self,
+        session: AsyncSession,
+        spec: _ObjectSpec,
+        objects: Iterable[dict[str, Any]],
+        synced_at: datetime,
+    ) -> datetime | None:
+        """Upsert one page; return its highest remote_updated_at."""
+        rows = [object_row(spec, obj, self.tenant_id, synced_at) for obj in objects]
+        if not rows:
+            return None
+        await session.execute(upsert_statement(spec, rows))
+        stamps = [r["remote_updated_at"] for r in rows if r["remote_updated_at"]]
+        return max(stamps) if stamps else None
+
+    async def seed(self, object_type: str) -> int:
+        """Mirror every ``object_type`` object; returns the number fetched.
+
+        Rows the listing no longer returns (deleted while no webhook was
+        delivered) are soft-deleted once the listing completes. Every row
+        the listing returned has ``synced_at >= started``, even where a
+        newer webhook write kept its data, so only unseen rows are swept.
+        """
+        spec = _SPECS[object_type]
+        started = datetime.now(UTC)
+        watermark: datetime | None = None
+        fetched = 0
+        after: str | None = None
+        async with self._sessionmaker() as session:
+            while True:
+                params: dict[str, Any] = {
+                    "limit": _PAGE_SIZE,
+                    "properties": ",".join(spec.properties),
+                }
+                if after:
+                    params["after"] = after
+                data = await self._call(
+                    "get",
+                    f"/crm/v3/objects/{object_type}",
+                    f"mirror_seed_{object_type}",
+                    params=params,
+                )
+                results = data.get("results", [])
+                fetched += len(results)
+                page_max = await self._upsert(session, spec, results, started)
+                watermark = max(filter(None, (watermark, page_max)), default=None)
+                await session.commit()
+                after = data.get("paging", {}).get("next", {}).get("after")
+                if not after:
+                    break
+
+            model = spec.model
+            await session.execute(
+                update(model)
+                .where(
+                    model.tenant_id == self.tenant_id,
+                    model.provider == PROVIDER,
+                    model.deleted_at.is_(None),
+                    model.synced_at < started,
+                )
+                .values(deleted_at=func.now())
+            )
+            await self._save_state(
+                session,
+                spec,
+                seeded_at=datetime.now(UTC),
+                synced_at=started,
+                watermark=watermark or started,
+            )
+            await session.commit()
+
+        logger.info(
+            "Seeded HubSpot %s mirror (%d objects)",
+            object_type,
+            fetched,
+            extra={"tenant_id": str(self.tenant_id)},
+        )
+        return fetched
+
+    async def sync_delta(self, object_type: str) -> int:
+        """Fetch objects modified since the watermark; returns the number fetched."""
+        spec = _SPECS[object_type]
+        state = await self._load_state(spec)
+        if state is None or state.seeded_at is None:
+            return await self.seed(object_type)
+
+        started = datetime.now(UTC)
+        watermark: datetime = state.watermark or state.seeded_at
+        fetched = 0
+        async with self._sessionmaker() as session:
+            since = watermark
+            after: str | None = None
+            while True:
+                body: dict[str, Any] = {
+                    "filterGroups": [
+                        {
+                            "filters": [
+                                {
+                                    "propertyName": spec.modified_property,
+                                    "operator": "GTE",
+                                    "value": str(int(since.timestamp() * 1000)),
+                                }
+                            ]
+                        }
+                    ],
+                    "sorts": [{"propertyName": spec.modified_property, "direction": "ASCENDING"}],
+                    "properties": spec.properties,
+                    "limit": _PAGE_SIZE,
+                }
+                if after:
+                    body["after"] = after
+                data = await self._call(
+                    "post",
+                    f"/crm/v3/objects/{object_type}/search",
+                    f"mirror_delta_{object_type}",
+                    json=body,
+                )
+                results = data.get("results", [])
+                fetched += len(results)
+                page_max = await self._upsert(session, spec, results, started)
+                if page_max and page_max > watermark:
+                    watermark = page_max
+                await session.commit()
+
+                after = data.get("paging", {}).get("next", {}).get("after")
+                if not after:
+                    break
+                if int(after) + _PAGE_SIZE > _SEARCH_RESULT_CAP:
+                    if watermark <= since:
+                        logger.warning(
+                            "HubSpot %s delta exceeds the search cap at one timestamp; "
+                            "re-seed to catch up",
+                            object_type,
+                            extra={"tenant_id": str(self.tenant_id)},
+                        )
+                        break
+                    since, after = watermark, None
+
+            await self._save_state(session, spec, synced_at=started, watermark=watermark)
+            await session.commit()
+        return fetched
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _live(self, model: type[CRMDeal] | type[CRMContact]) -> Any:
+        return and_(
+            model.tenant_id == self.tenant_id,
+            model.provider == PROVIDER,
+            model.deleted_at.is_(None),
+        )
+
+    async def pipeline_metrics(self, active_stages: Iterable[str]) -> dict[str, Any]:
+        """Open-pipeline value and counts, aggregated in SQL."""
+        is_active = CRMDeal.stage.in_(sorted(active_stages))
+        stmt = select(
+            func.count().label("total_deals"),
+            func.count().filter(is_active).label("deal_count"),
+            func.coalesce(func.sum(CRMDeal.amount).filter(is_active), 0.0).label("total_value"),
+        ).where(self._live(CRMDeal))
+        async with self._sessionmaker() as session:
+            row = (await session.execute(stmt)).one()
+        return {
+            "total_value": float(row.total_value),
+            "deal_count": int(row.deal_count),
+            "total_deals": int(row.total_deals),
+        }
+
+    async def stage_counts(self) -> dict[str, dict[str, Any]]:
+        """Deal count and value per stage."""
+        stmt = (
+            select(
+                CRMDeal.stage,
+                func.count().label("count"),
+                func.coalesce(func.sum(CRMDeal.amount), 0.0).label("value"),
+            )
+            .where(self._live(CRMDeal))
+            .group_by(CRMDeal.stage)
+        )
+        async with self._sessionmaker() as session:
+            rows = (await session.execute(stmt)).all()
+        return {
+            row.stage or "": {"count": int(row.count), "value": float(row.value)} for row in rows
+        }
+
+    async def deals(self, stage: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
+        """Most recently modified deals, optionally in one stage."""
+        stmt = select(CRMDeal).where(self._live(CRMDeal))
+        if stage:
+            stmt = stmt.where(CRMDeal.stage == stage)
+        stmt = stmt.order_by(CRMDeal.remote_updated_at.desc().nulls_last()).limit(limit)
+        async with self._sessionmaker() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+        return [_format_deal(row) for row in rows]
+
+    async def search_contacts(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Prefix full-text search over name, company and email."""
+        tsquery = contact_tsquery(query)
+        if not tsquery:
+            return []
+        document = literal_column(CONTACT_TSVECTOR)
+        match = func.to_tsquery("simple", tsquery)
+        stmt = (
+            select(CRMContact)
+            .where(self._live(CRMContact), document.op("@@")(match))
+            .order_by(func.ts_rank(document, match).desc(), CRMContact.external_id)
+            .limit(limit)
+        )
+        async with self._sessionmaker() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+        return [_format_contact(row) for row in rows]
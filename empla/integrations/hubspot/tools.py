@@ -3,6 +3,12 @@ empla.integrations.hubspot.tools - HubSpot CRM Tools
 
 Direct HubSpot API v3 integration via httpx. OAuth token from config at init.
 
+When the init config also carries ``sessionmaker`` and ``tenant_id``, deal
+and contact reads are served from the local CRM mirror
+(``empla/integrations/hubspot/mirror.py``) and report their freshness
+(``source`` / ``as_of`` / ``stale_seconds``). Without them, or if the
+mirror's database is unavailable, tools fall back to the live API.
+
 API docs: https://developers.hubspot.com/docs/api/crm
 
 Example:
@@ -12,12 +18,22 @@ Example:
 """
 
 import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import quote
+from uuid import UUID
 
 import httpx
 
+from empla.integrations.http import get_request_scheduler
+from empla.integrations.hubspot.mirror import (
+    ACTIVE_STAGES,
+    DEFAULT_MAX_STALENESS_SECONDS,
+    HubSpotMirror,
+)
 from empla.integrations.router import IntegrationRouter
+from empla.integrations.sync_cursors import Freshness
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +57,9 @@ _client: httpx.AsyncClient | None = None
 # retired here.
 _quarterly_target: float = 100_000.0
 
+# Local CRM mirror; None when init config has no sessionmaker / tenant_id.
+_mirror: HubSpotMirror | None = None
+
 
 def _api() -> httpx.AsyncClient:
     """Get the initialized HTTP client. Raises if not initialized."""
@@ -84,7 +103,7 @@ async def _call(method: str, path: str, operation: str, **kwargs: Any) -> dict[s
 
 
 async def _hubspot_init(**config: Any) -> None:
-    global _client, _quarterly_target  # noqa: PLW0603
+    global _client, _quarterly_target, _mirror  # noqa: PLW0603
     # Close previous client if re-initializing (e.g., token refresh)
     if _client is not None:
         try:
@@ -94,7 +113,9 @@ async def _hubspot_init(**config: Any) -> None:
     token = config.get("access_token")
     if not token:
         raise ValueError("HubSpot requires 'access_token' in config")
-    _client = httpx.AsyncClient(
+    _client = get_request_scheduler().client(
+        "hubspot",
+        credential=token,
         base_url=HUBSPOT_API,
         headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
         timeout=30.0,
@@ -112,11 +133,30 @@ async def _hubspot_init(**config: Any) -> None:
         _quarterly_target = float(candidate)
     else:
         _quarterly_target = 100_000.0
-    logger.info("HubSpot connector initialized (quarterly_target=%.0f)", _quarterly_target)
+
+    sessionmaker = config.get("sessionmaker")
+    tenant_id = config.get("tenant_id")
+    if sessionmaker is not None and tenant_id:
+        _mirror = HubSpotMirror(
+            sessionmaker,
+            UUID(str(tenant_id)),
+            _call,
+            max_staleness_seconds=float(
+                config.get("mirror_max_staleness_seconds", DEFAULT_MAX_STALENESS_SECONDS)
+            ),
+        )
+    else:
+        _mirror = None
+    logger.info(
+        "HubSpot connector initialized (quarterly_target=%.0f, mirror=%s)",
+        _quarterly_target,
+        _mirror is not None,
+    )
 
 
 async def _hubspot_shutdown() -> None:
-    global _client  # noqa: PLW0603
+    global _client, _mirror  # noqa: PLW0603
+    _mirror = None
     if _client:
         try:
             await _client.aclose()
@@ -141,18 +181,67 @@ def _format_contact(c: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+async def _read_mirror(
+    object_type: str, read: Callable[[HubSpotMirror], Awaitable[Any]]
+) -> tuple[Any, Freshness] | None:
+    """Serve a read from the local mirror, or None to fall back to the API."""
+    if _mirror is None:
+        return None
+    try:
+        freshness = await _mirror.ensure_fresh(object_type)
+        return await read(_mirror), freshness
+    except Exception:
+        logger.warning(
+            "HubSpot mirror read failed; falling back to live API",
+            exc_info=True,
+            extra={"operation": f"mirror_{object_type}", "tenant_id": str(_mirror.tenant_id)},
+        )
+        return None
+
+
+def _live() -> Freshness:
+    return Freshness("live", datetime.now(UTC))
+
+
+def _pipeline_payload(
+    metrics: dict[str, Any], by_stage: dict[str, dict[str, Any]], freshness: Freshness
+) -> dict[str, Any]:
+    # Read from module-level state set by _hubspot_init from tenant settings.
+    quarterly_target = _quarterly_target
+    total_value = metrics["total_value"]
+    return {
+        "coverage": round(total_value / quarterly_target, 2) if quarterly_target else 0.0,
+        "total_value": total_value,
+        "deal_count": metrics["deal_count"],
+        "total_deals": metrics["total_deals"],
+        "quarterly_target": quarterly_target,
+        "by_stage": by_stage,
+        **freshness.to_dict(),
+    }
+
+
 # ============================================================================
 # Deals
 # ============================================================================
 
 
-@router.tool()
+@router.tool(cache_ttl=60)
 async def get_pipeline_metrics() -> dict[str, Any]:
-    """Get pipeline metrics: total deals, total value, coverage ratio.
+    """Get pipeline metrics: total deals, total value, coverage ratio, per-stage counts.
 
-    Paginates through all deals (up to 1000) to ensure accurate metrics.
+    Aggregated from the local CRM mirror when available; otherwise
+    paginates through all deals (up to 1000) via the API.
     """
-    deals: list[dict] = []
+
+    async def aggregate(mirror: HubSpotMirror) -> tuple[dict[str, Any], dict[str, Any]]:
+        return await mirror.pipeline_metrics(ACTIVE_STAGES), await mirror.stage_counts()
+
+    mirrored = await _read_mirror("deals", aggregate)
+    if mirrored is not None:
+        (metrics, by_stage), freshness = mirrored
+        return _pipeline_payload(metrics, by_stage, freshness)
+
+    deals: list[dict[str, Any]] = []
     after: str | None = None
     for _ in range(10):  # Max 10 pages x 100 = 1000 deals
         params: dict[str, Any] = {"limit": 100}
@@ -164,30 +253,35 @@ async def get_pipeline_metrics() -> dict[str, Any]:
         if not after:
             break
 
-    active_stages = {
-        "appointmentscheduled",
-        "qualifiedtobuy",
-        "presentationscheduled",
-        "decisionmakerboughtin",
-        "contractsent",
-    }
-    active = [d for d in deals if d.get("properties", {}).get("dealstage") in active_stages]
-    total_value = sum(float(d.get("properties", {}).get("amount") or 0) for d in active)
-    # Read from module-level state set by _hubspot_init from tenant settings.
-    quarterly_target = _quarterly_target
-
-    return {
-        "coverage": round(total_value / quarterly_target, 2) if quarterly_target else 0.0,
-        "total_value": total_value,
-        "deal_count": len(active),
-        "total_deals": len(deals),
-        "quarterly_target": quarterly_target,
-    }
-
+    stage_totals: dict[str, dict[str, Any]] = {}
+    total_value = 0.0
+    deal_count = 0
+    for d in deals:
+        props = d.get("properties", {})
+        stage = props.get("dealstage") or ""
+        amount = float(props.get("amount") or 0)
+        bucket = stage_totals.setdefault(stage, {"count": 0, "value": 0.0})
+        bucket["count"] += 1
+        bucket["value"] += amount
+        if stage in ACTIVE_STAGES:
+            deal_count += 1
+            total_value += amount
+
+    metrics = {"total_value": total_value, "deal_count": deal_count, "total_deals": len(deals)}
+    return _pipeline_payload(metrics, stage_totals, _live())
+
+
+@router.tool(cache_ttl=60)
+async def get_deals(stage: str | None = None, limit: int = 50) -> dict[str, Any]:
+    """Get deals from HubSpot, optionally filtered by stage.
+
+    Returns ``{"deals": [...], "source", "as_of", "stale_seconds"}``.
+    """
+    mirrored = await _read_mirror("deals", lambda mirror: mirror.deals(stage, min(limit, 100)))
+    if mirrored is not None:
+        deals, freshness = mirrored
+        return {"deals": deals, **freshness.to_dict()}
 
-@router.tool()
-async def get_deals(stage: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
-    """Get deals from HubSpot, optionally filtered by stage."""
     if stage:
         body = {
             "filterGroups": [
@@ -201,7 +295,7 @@ async def get_deals(stage: str | None = None, limit: int = 50) -> list[dict[str,
             "get", "/crm/v3/objects/deals", "get_deals", params={"limit": min(limit, 100)}
         )
 
-    return [
+    deals = [
         {
             "id": d["id"],
             "name": d.get("properties", {}).get("dealname", ""),
@@ -211,6 +305,7 @@ async def get_deals(stage: str | None = None, limit: int = 50) -> list[dict[str,
         }
         for d in data.get("results", [])
     ]
+    return {"deals": deals, **_live().to_dict()}
 
 
 @router.tool()
@@ -255,7 +350,7 @@ async def update_deal(
 # ============================================================================
 
 
-@router.tool()
+@router.tool(cache_ttl=60)
 async def get_contacts(limit: int = 50) -> list[dict[str, Any]]:
     """Get contacts from HubSpot."""
     data = await _call(
@@ -283,13 +378,24 @@ async def create_contact(
     return {"id": data["id"], "email": email}
 
 
-@router.tool()
-async def search_contacts(query: str, limit: int = 10) -> list[dict[str, Any]]:
-    """Search contacts by name, email, or company."""
+@router.tool(cache_ttl=60)
+async def search_contacts(query: str, limit: int = 10) -> dict[str, Any]:
+    """Search contacts by name, email, or company.
+
+    Returns ``{"contacts": [...], "source", "as_of", "stale_seconds"}``.
+    """
+    mirrored = await _read_mirror(
+        "contacts", lambda mirror: mirror.search_contacts(query, min(limit, 100))
+    )
+    if mirrored is not None:
+        contacts, freshness = mirrored
+        return {"contacts": contacts, **freshness.to_dict()}
+
     data = await _call(
         "post",
         "/crm/v3/objects/contacts/search",
         "search_contacts",
         json={"query": query, "limit": min(limit, 100)},
     )
-    return [_format_contact(c) for c in data.get("results", [])]
+    contacts = [_format_contact(c) for c in data.get("results", [])]
+    return {"contacts": contacts, **_live().to_dict()}
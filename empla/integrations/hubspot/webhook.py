@@ -4,6 +4,12 @@ empla.integrations.hubspot.webhook - HubSpot Webhook Parser
 Parses HubSpot webhook payloads into normalized (event_type, summary) tuples.
 HubSpot sends an array of subscription events; we extract the first.
 
+The object extractor lists every (object type, id) in a delivery so the
+runner can merge bulk-import bursts per object.
+
+Also registers the CRM mirror handler so every delivery is applied to the
+tenant's local deal/contact mirror (see ``mirror.apply_webhook_events``).
+
 Ref: https://developers.hubspot.com/docs/api/webhooks
 """
 
@@ -11,7 +17,12 @@ from __future__ import annotations
 
 from typing import Any
 
-from empla.integrations.webhooks import register_webhook_parser
+from empla.integrations.hubspot.mirror import apply_webhook_events
+from empla.integrations.webhooks import (
+    register_webhook_handler,
+    register_webhook_object_extractor,
+    register_webhook_parser,
+)
 
 
 def parse_hubspot_webhook(payload: dict[str, Any] | list[Any]) -> tuple[str, str]:
@@ -29,4 +40,29 @@ def parse_hubspot_webhook(payload: dict[str, Any] | list[Any]) -> tuple[str, str
     return sub_type, f"objectId={object_id}" if object_id else ""
 
 
+def extract_hubspot_objects(payload: dict[str, Any] | list[Any]) -> list[dict[str, Any]]:
+    """List the objects changed by each subscription event in a delivery.
+
+    ``deal.propertyChange`` on objectId 42 becomes object_type ``deal``,
+    object_id ``"42"``; property changes carry ``{propertyName: value}``.
+    """
+    events = payload if isinstance(payload, list) else [payload]
+    objects = []
+    for event in events:
+        if not isinstance(event, dict) or event.get("objectId") is None:
+            continue
+        sub_type = str(event.get("subscriptionType", "unknown"))
+        ref: dict[str, Any] = {
+            "object_type": sub_type.split(".", 1)[0],
+            "object_id": str(event["objectId"]),
+            "event_type": sub_type,
+        }
+        if event.get("propertyName"):
+            ref["detail"] = {event["propertyName"]: event.get("propertyValue")}
+        objects.append(ref)
+    return objects
+
+
 register_webhook_parser("hubspot", parse_hubspot_webhook)
+register_webhook_object_extractor("hubspot", extract_hubspot_objects)
+register_webhook_handler("hubspot", apply_webhook_events)
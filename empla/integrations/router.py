@@ -159,7 +159,14 @@ class IntegrationRouter:
             except Exception:
                 logger.exception("Error shutting down adapter for %s", self.name)
 
-    def tool(self, name: str | None = None, description: str = "") -> Callable[..., Any]:
+    def tool(
+        self,
+        name: str | None = None,
+        description: str = "",
+        cache_ttl: float | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Callable[..., Any]:
         """Decorator that registers a tool on this integration.
 
         Auto-generates JSON schema from type hints.
@@ -168,6 +175,11 @@ class IntegrationRouter:
         Args:
             name: Override tool name (default: function name).
             description: Override description (default: function docstring).
+            cache_ttl: Seconds ToolRouter may reuse a successful result for
+                identical arguments. Only for read-only tools; webhooks for
+                this integration invalidate cached results early.
+            timeout: Longest ToolRouter waits for this tool, for tools that
+                legitimately take longer than the router default.
 
         Returns:
             Decorator function.
@@ -193,6 +205,8 @@ class IntegrationRouter:
                     "schema": schema,
                     "func": func,
                     "impl": None,
+                    "cache_ttl": cache_ttl,
+                    "timeout": timeout,
                 }
             )
             return func
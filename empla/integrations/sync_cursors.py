@@ -0,0 +1,114 @@
+"""
+empla.integrations.sync_cursors - Incremental Sync Cursor Storage
+
+Delta-syncing adapters (Gmail History API, Calendar sync tokens) keep a
+cursor per employee and resource. ``DatabaseCursorStore`` persists it in
+``integration_sync_cursors`` so a restarted employee resumes from its last
+position; ``InMemoryCursorStore`` keeps it for the life of the process
+(tests, ad-hoc scripts).
+
+Cursor state is adapter-defined JSON. A missing state always means
+"do a full sync".
+
+``Freshness`` is how mirror-backed tools report where a result came from
+(local mirror or live API) and how old it may be.
+
+Example:
+    >>> store = DatabaseCursorStore(sessionmaker, tenant_id, employee_id)
+    >>> state = await store.load("gmail", "me@acme.com")
+    >>> await store.save("gmail", "me@acme.com", {"history_id": "48213"})
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Protocol
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from empla.models.integration import IntegrationSyncCursor
+
+
+@dataclass(frozen=True)
+class Freshness:
+    """Where a tool result came from and how old it may be."""
+
+    source: str  # "mirror" or "live"
+    as_of: datetime | None
+
+    def to_dict(self, now: datetime | None = None) -> dict[str, Any]:
+        now = now or datetime.now(UTC)
+        stale = (now - self.as_of).total_seconds() if self.as_of else None
+        return {
+            "source": self.source,
+            "as_of": self.as_of.isoformat() if self.as_of else None,
+            "stale_seconds": round(max(stale, 0.0), 1) if stale is not None else None,
+        }
+
+
+class CursorStore(Protocol):
+    """Load/save an adapter's sync cursor for one (provider, resource)."""
+
+    async def load(self, provider: str, resource: str) -> dict[str, Any] | None: ...
+
+    async def save(self, provider: str, resource: str, state: dict[str, Any]) -> None: ...
+
+
+class InMemoryCursorStore:
+    """Process-local cursor store."""
+
+    def __init__(self) -> None:
+        self._states: dict[tuple[str, str], dict[str, Any]] = {}
+
+    async def load(self, provider: str, resource: str) -> dict[str, Any] | None:
+        state = self._states.get((provider, resource))
+        return dict(state) if state is not None else None
+
+    async def save(self, provider: str, resource: str, state: dict[str, Any]) -> None:
+        self._states[(provider, resource)] = dict(state)
+
+
+class DatabaseCursorStore:
+    """Cursor store backed by ``integration_sync_cursors`` (one row per employee/resource)."""
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        tenant_id: UUID,
+        employee_id: UUID,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self.tenant_id = tenant_id
+        self.employee_id = employee_id
+
+    async def load(self, provider: str, resource: str) -> dict[str, Any] | None:
+        async with self._sessionmaker() as session:
+            result = await session.execute(
+                select(IntegrationSyncCursor.state).where(
+                    IntegrationSyncCursor.employee_id == self.employee_id,
+                    IntegrationSyncCursor.provider == provider,
+                    IntegrationSyncCursor.resource == resource,
+                    IntegrationSyncCursor.deleted_at.is_(None),
+                )
+            )
+            return result.scalar_one_or_none()
+
+    async def save(self, provider: str, resource: str, state: dict[str, Any]) -> None:
+        stmt = pg_insert(IntegrationSyncCursor).values(
+            tenant_id=self.tenant_id,
+            employee_id=self.employee_id,
+            provider=provider,
+            resource=resource,
+            state=state,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["employee_id", "provider", "resource"],
+            set_={"state": stmt.excluded.state, "updated_at": func.now(), "deleted_at": None},
+        )
+        async with self._sessionmaker() as session:
+            await session.execute(stmt)
+            await session.commit()
@@ -17,6 +17,25 @@ Usage — create ``empla/integrations/<name>/webhook.py``:
 
 That's it. ``autodiscover_parsers()`` scans ``empla/integrations/*/webhook.py``
 automatically — no changes needed outside the integration directory.
+
+Integrations that keep server-side state in sync with the provider (e.g.
+the HubSpot CRM mirror) can also register a handler. Handlers run inside
+the webhook request after token validation, with the request's DB
+session and the authenticated tenant:
+
+    async def apply_my_webhook(session, tenant_id, payload):
+        ...
+
+    register_webhook_handler("my_provider", apply_my_webhook)
+
+Providers whose deliveries identify the objects they changed can register
+an object extractor. The refs travel with the wake event so the runner can
+merge a burst per object (see empla.runner.coalesce):
+
+    def my_objects(payload):
+        return [{"object_type": "deal", "object_id": "42", "event_type": "deal.updated"}]
+
+    register_webhook_object_extractor("my_provider", my_objects)
 """
 
 from __future__ import annotations
@@ -24,16 +43,29 @@ from __future__ import annotations
 import importlib
 import logging
 import pkgutil
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
 # Type: (payload: dict | list) -> (event_type: str, summary: str)
 WebhookParser = Callable[[Any], tuple[str, str]]
 
+# Type: (session, tenant_id, payload) -> None
+WebhookHandler = Callable[["AsyncSession", "UUID", Any], Awaitable[None]]
+
+# Type: (payload) -> [{"object_type", "object_id", "event_type", "detail"?}]
+WebhookObjectExtractor = Callable[[Any], list[dict[str, Any]]]
+
 _registry: dict[str, WebhookParser] = {}
+_handlers: dict[str, list[WebhookHandler]] = {}
+_object_extractors: dict[str, WebhookObjectExtractor] = {}
 
 
 def register_webhook_parser(
@@ -65,21 +97,65 @@ def register_webhook_parser(
         _registry[alias] = parser
 
 
-_discovered = False
+def register_webhook_handler(provider: str, handler: WebhookHandler) -> None:
+    """Register a state-sync handler for a provider's webhooks.
 
+    Handlers are best-effort: the endpoint logs and rolls back a failing
+    handler without rejecting the delivery, so they must never be the only
+    path that keeps their state correct.
 
-def get_webhook_parser(provider: str) -> WebhookParser:
-    """Get the parser for a provider, falling back to the generic parser.
+    Args:
+        provider: Provider name (e.g. "hubspot").
+        handler: Async callable taking (session, tenant_id, payload).
+    """
+    handlers = _handlers.setdefault(provider, [])
+    if handler not in handlers:
+        handlers.append(handler)
 
-    Triggers autodiscovery on first call (lazy, not at import time).
+
+def register_webhook_object_extractor(provider: str, extractor: WebhookObjectExtractor) -> None:
+    """Register a function listing the objects a provider's delivery changed.
+
+    Args:
+        provider: Provider name (e.g. "hubspot").
+        extractor: Callable taking the raw payload and returning one dict
+            per changed object with ``object_type``, ``object_id``,
+            ``event_type`` and an optional small ``detail`` dict.
     """
+    _object_extractors[provider] = extractor
+
+
+_discovered = False
+
+
+def _ensure_discovered() -> None:
     global _discovered  # noqa: PLW0603
     if not _discovered:
         autodiscover_parsers()
         _discovered = True
+
+
+def get_webhook_parser(provider: str) -> WebhookParser:
+    """Get the parser for a provider, falling back to the generic parser.
+
+    Triggers autodiscovery on first call (lazy, not at import time).
+    """
+    _ensure_discovered()
     return _registry.get(provider, _parse_generic)
 
 
+def get_webhook_handlers(provider: str) -> list[WebhookHandler]:
+    """Get the state-sync handlers registered for a provider (may be empty)."""
+    _ensure_discovered()
+    return list(_handlers.get(provider, []))
+
+
+def get_webhook_object_extractor(provider: str) -> WebhookObjectExtractor | None:
+    """Get the provider's object extractor, if it registered one."""
+    _ensure_discovered()
+    return _object_extractors.get(provider)
+
+
 def _parse_generic(payload: Any) -> tuple[str, str]:
     """Fallback parser for providers without a registered parser."""
     if isinstance(payload, dict):
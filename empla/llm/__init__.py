@@ -5,6 +5,11 @@ This package provides a unified interface for working with multiple LLM provider
 (Anthropic, OpenAI, Google Vertex AI) with automatic fallback, cost tracking,
 and optional rule-based routing.
 
+generate / generate_structured / generate_with_tools honour the active
+``empla.core.deadline`` scope: inside a BDI cycle they raise
+DeadlineExceededError instead of outliving the cycle's time budget, and no
+fallback provider is tried once that budget is spent.
+
 Example:
     >>> from empla.llm import LLMService
     >>> from empla.llm.config import LLMConfig, RoutingPolicy
@@ -39,6 +44,7 @@ from typing import Any, Literal, cast
 
 from pydantic import BaseModel
 
+from empla.core.deadline import enforce_deadline
 from empla.llm.config import MODELS, LLMConfig
 from empla.llm.models import (
     LLMRequest,
@@ -323,33 +329,34 @@ class LLMService:
 
         request = LLMRequest(messages=messages, max_tokens=max_tokens, temperature=temperature)
 
-        provider, model_key = self._get_provider_for_context(task_context)
-        try:
-            response = await provider.generate(request)
-            self._track_cost_for_model(response, model_key)
-            if task_context is not None and self._router:
-                self._router.record_success(model_key)
-                self._router.record_cost(model_key, response.usage, self._owner_id)
-            return response
-
-        except Exception as e:
-            logger.error(f"Provider {model_key} failed: {e}")
-            fallback = self._get_fallback_provider(model_key, task_context)
-            if fallback:
-                fb_provider, fb_key = fallback
-                logger.info(f"Falling back to {fb_key}")
-                try:
-                    response = await fb_provider.generate(request)
-                    self._track_cost_for_model(response, fb_key)
-                    if task_context is not None and self._router:
-                        self._router.record_success(fb_key)
-                        self._router.record_cost(fb_key, response.usage, self._owner_id)
-                    return response
-                except Exception:
-                    if task_context is not None and self._router:
-                        self._router.record_failure(fb_key)
-                    raise
-            raise
+        async with enforce_deadline("LLM generate"):
+            provider, model_key = self._get_provider_for_context(task_context)
+            try:
+                response = await provider.generate(request)
+                self._track_cost_for_model(response, model_key)
+                if task_context is not None and self._router:
+                    self._router.record_success(model_key)
+                    self._router.record_cost(model_key, response.usage, self._owner_id)
+                return response
+
+            except Exception as e:
+                logger.error(f"Provider {model_key} failed: {e}")
+                fallback = self._get_fallback_provider(model_key, task_context)
+                if fallback:
+                    fb_provider, fb_key = fallback
+                    logger.info(f"Falling back to {fb_key}")
+                    try:
+                        response = await fb_provider.generate(request)
+                        self._track_cost_for_model(response, fb_key)
+                        if task_context is not None and self._router:
+                            self._router.record_success(fb_key)
+                            self._router.record_cost(fb_key, response.usage, self._owner_id)
+                        return response
+                    except Exception:
+                        if task_context is not None and self._router:
+                            self._router.record_failure(fb_key)
+                        raise
+                raise
 
     async def generate_structured(
         self,
@@ -381,35 +388,36 @@ class LLMService:
 
         request = LLMRequest(messages=messages, max_tokens=max_tokens, temperature=temperature)
 
-        provider, model_key = self._get_provider_for_context(task_context)
-        try:
-            response, parsed = await provider.generate_structured(request, response_format)
-            self._track_cost_for_model(response, model_key)
-            if task_context is not None and self._router:
-                self._router.record_success(model_key)
-                self._router.record_cost(model_key, response.usage, self._owner_id)
-            return response, parsed
-
-        except Exception as e:
-            logger.error(f"Provider {model_key} failed: {e}")
-            fallback = self._get_fallback_provider(model_key, task_context)
-            if fallback:
-                fb_provider, fb_key = fallback
-                logger.info(f"Falling back to {fb_key}")
-                try:
-                    response, parsed = await fb_provider.generate_structured(
-                        request, response_format
-                    )
-                    self._track_cost_for_model(response, fb_key)
-                    if task_context is not None and self._router:
-                        self._router.record_success(fb_key)
-                        self._router.record_cost(fb_key, response.usage, self._owner_id)
-                    return response, parsed
-                except Exception:
-                    if task_context is not None and self._router:
-                        self._router.record_failure(fb_key)
-                    raise
-            raise
+        async with enforce_deadline("LLM generate_structured"):
+            provider, model_key = self._get_provider_for_context(task_context)
+            try:
+                response, parsed = await provider.generate_structured(request, response_format)
+                self._track_cost_for_model(response, model_key)
+                if task_context is not None and self._router:
+                    self._router.record_success(model_key)
+                    self._router.record_cost(model_key, response.usage, self._owner_id)
+                return response, parsed
+
+            except Exception as e:
+                logger.error(f"Provider {model_key} failed: {e}")
+                fallback = self._get_fallback_provider(model_key, task_context)
+                if fallback:
+                    fb_provider, fb_key = fallback
+                    logger.info(f"Falling back to {fb_key}")
+                    try:
+                        response, parsed = await fb_provider.generate_structured(
+                            request, response_format
+                        )
+                        self._track_cost_for_model(response, fb_key)
+                        if task_context is not None and self._router:
+                            self._router.record_success(fb_key)
+                            self._router.record_cost(fb_key, response.usage, self._owner_id)
+                        return response, parsed
+                    except Exception:
+                        if task_context is not None and self._router:
+                            self._router.record_failure(fb_key)
+                        raise
+                raise
 
     async def generate_with_tools(
         self,
@@ -442,36 +450,37 @@ class LLMService:
             temperature=temperature,
         )
 
-        provider, model_key = self._get_provider_for_context(task_context)
-        try:
-            response = await provider.generate_with_tools(request)
-            self._track_cost_for_model(response, model_key)
-            if task_context is not None and self._router:
-                self._router.record_success(model_key)
-                self._router.record_cost(model_key, response.usage, self._owner_id)
-            return response
-
-        except NotImplementedError:
-            raise
+        async with enforce_deadline("LLM generate_with_tools"):
+            provider, model_key = self._get_provider_for_context(task_context)
+            try:
+                response = await provider.generate_with_tools(request)
+                self._track_cost_for_model(response, model_key)
+                if task_context is not None and self._router:
+                    self._router.record_success(model_key)
+                    self._router.record_cost(model_key, response.usage, self._owner_id)
+                return response
 
-        except Exception:
-            logger.error(f"Provider {model_key} failed for generate_with_tools", exc_info=True)
-            fallback = self._get_fallback_provider(model_key, task_context)
-            if fallback:
-                fb_provider, fb_key = fallback
-                logger.info(f"Falling back to {fb_key} for generate_with_tools")
-                try:
-                    response = await fb_provider.generate_with_tools(request)
-                    self._track_cost_for_model(response, fb_key)
-                    if task_context is not None and self._router:
-                        self._router.record_success(fb_key)
-                        self._router.record_cost(fb_key, response.usage, self._owner_id)
-                    return response
-                except Exception:
-                    if task_context is not None and self._router:
-                        self._router.record_failure(fb_key)
-                    raise
-            raise
+            except NotImplementedError:
+                raise
+
+            except Exception:
+                logger.error(f"Provider {model_key} failed for generate_with_tools", exc_info=True)
+                fallback = self._get_fallback_provider(model_key, task_context)
+                if fallback:
+                    fb_provider, fb_key = fallback
+                    logger.info(f"Falling back to {fb_key} for generate_with_tools")
+                    try:
+                        response = await fb_provider.generate_with_tools(request)
+                        self._track_cost_for_model(response, fb_key)
+                        if task_context is not None and self._router:
+                            self._router.record_success(fb_key)
+                            self._router.record_cost(fb_key, response.usage, self._owner_id)
+                        return response
+                    except Exception:
+                        if task_context is not None and self._router:
+                            self._router.record_failure(fb_key)
+                        raise
+                raise
 
     async def stream(
         self,
@@ -9,7 +9,10 @@ Models are organized by domain:
 - employee: Digital employees (Employee, EmployeeGoal, EmployeeIntention)
 - belief: BDI beliefs (Belief, BeliefHistory)
 - memory: Memory systems (EpisodicMemory, SemanticMemory, ProceduralMemory, WorkingMemory)
-- audit: Observability (AuditLog, Metric)
+- crm: Local CRM mirror (CRMDeal, CRMContact, CRMSyncState)
+- audit: Observability (AuditLog, Metric, MetricRollup)
+- ratelimit: Shared API rate limit state (RateLimitBucket)
+- heartbeat: Runner liveness reports (EmployeeHeartbeat)
 
 Usage:
     >>> from empla.models import Employee, EmployeeGoal
@@ -20,10 +23,12 @@ Usage:
 """
 
 from empla.models.activity import ActivityEventType, EmployeeActivity
-from empla.models.audit import AuditLog, Metric
+from empla.models.audit import AuditLog, Metric, MetricRollup
 from empla.models.base import Base
 from empla.models.belief import Belief, BeliefHistory
+from empla.models.crm import CRMContact, CRMDeal, CRMSyncState
 from empla.models.employee import Employee, EmployeeGoal, EmployeeIntention
+from empla.models.heartbeat import EmployeeHeartbeat
 from empla.models.inbox import InboxMessage
 from empla.models.integration import (
     CredentialStatus,
@@ -34,6 +39,7 @@ from empla.models.integration import (
     IntegrationOAuthState,
     IntegrationProvider,
     IntegrationStatus,
+    IntegrationSyncCursor,
     IntegrationType,
     PlatformOAuthApp,
 )
@@ -43,6 +49,7 @@ from empla.models.memory import (
     SemanticMemory,
     WorkingMemory,
 )
+from empla.models.ratelimit import RateLimitBucket
 from empla.models.tenant import Tenant, User
 
 __all__ = [
@@ -51,11 +58,15 @@ __all__ = [
     "Base",
     "Belief",
     "BeliefHistory",
+    "CRMContact",
+    "CRMDeal",
+    "CRMSyncState",
     "CredentialStatus",
     "CredentialType",
     "Employee",
     "EmployeeActivity",
     "EmployeeGoal",
+    "EmployeeHeartbeat",
     "EmployeeIntention",
     "EpisodicMemory",
     "InboxMessage",
@@ -65,10 +76,13 @@ __all__ = [
     "IntegrationOAuthState",
     "IntegrationProvider",
     "IntegrationStatus",
+    "IntegrationSyncCursor",
     "IntegrationType",
     "Metric",
+    "MetricRollup",
     "PlatformOAuthApp",
     "ProceduralMemory",
+    "RateLimitBucket",
     "SemanticMemory",
     "Tenant",
     "User",
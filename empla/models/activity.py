@@ -150,17 +150,20 @@ class EmployeeActivity(TimestampedModel, Base):
 
     # Indexes for efficient querying
     __table_args__ = (
-        # Query activities by employee, most recent first
+        # Query activities by employee, most recent first. id completes the
+        # keyset order so cursor pages are a single index range scan.
         Index(
-            "idx_activities_employee_time",
+            "idx_activities_employee_keyset",
             "employee_id",
             "occurred_at",
+            "id",
         ),
         # Query activities by tenant, most recent first
         Index(
-            "idx_activities_tenant_time",
+            "idx_activities_tenant_keyset",
             "tenant_id",
             "occurred_at",
+            "id",
         ),
         # Filter by event type
         Index(
@@ -174,6 +177,12 @@ class EmployeeActivity(TimestampedModel, Base):
             "employee_id",
             "importance",
         ),
+        # Insert-order tail for the live SSE feed
+        Index(
+            "idx_activities_created",
+            "created_at",
+            "id",
+        ),
     )
 
     def __repr__(self) -> str:
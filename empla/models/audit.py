@@ -4,13 +4,24 @@ empla.models.audit - Audit and Observability Models
 Observability models:
 - AuditLog: Immutable audit log of all significant actions
 - Metric: Time-series performance metrics
+- MetricRollup: Per-minute and per-hour aggregates of Metric rows
 """
 
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID as PyUUID
 
-from sqlalchemy import CheckConstraint, DateTime, Float, ForeignKey, Index, String, text
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -110,6 +121,16 @@ class AuditLog(TenantScopedModel):
         Index("idx_audit_actor", "actor_type", "actor_id", "occurred_at"),
         Index("idx_audit_resource", "resource_type", "resource_id", "occurred_at"),
         Index("idx_audit_action", "action_type", "occurred_at"),
+        # Webhook event feed (keyset-paginated, newest first)
+        Index(
+            "idx_audit_webhook_keyset",
+            "tenant_id",
+            "occurred_at",
+            "id",
+            postgresql_where=text("actor_type = 'webhook' AND deleted_at IS NULL"),
+        ),
+        # Insert-order tail for the live webhook event feed
+        Index("idx_audit_created", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -188,7 +209,104 @@ class Metric(TenantScopedModel):
             postgresql_where=text("employee_id IS NOT NULL"),
         ),
         Index("idx_metrics_name", "metric_name", "timestamp"),
+        # Time-range scans of the rollup job and raw retention
+        Index("idx_metrics_timestamp", "timestamp"),
     )
 
     def __repr__(self) -> str:
         return f"<Metric(id={self.id}, name={self.metric_name})>"
+
+
+class MetricRollup(TenantScopedModel):
+    """
+    Aggregate of one employee's metric over a time bucket.
+
+    Written by the rollup job (empla.services.metric_rollups) from raw
+    Metric rows (1-minute buckets) and from the minute rollups (1-hour
+    buckets); read by the metrics endpoints instead of the raw rows.
+
+    Example:
+        >>> rollup = MetricRollup(
+        ...     tenant_id=tenant.id,
+        ...     employee_id=employee.id,
+        ...     metric_name="cycle.duration_seconds",
+        ...     metric_type="histogram",
+        ...     resolution_seconds=60,
+        ...     bucket_start=datetime(2026, 10, 18, 12, 0, tzinfo=UTC),
+        ...     sample_count=3,
+        ...     value_sum=4.5,
+        ...     value_min=1.0,
+        ...     value_max=2.0,
+        ...     histogram={"0": 1, "11": 2},
+        ... )
+    """
+
+    __tablename__ = "metric_rollups"
+
+    employee_id: Mapped[PyUUID] = mapped_column(
+        ForeignKey("employees.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Employee the aggregated metrics relate to",
+    )
+
+    metric_name: Mapped[str] = mapped_column(
+        String(200),
+        nullable=False,
+        comment="Metric name (dotted notation: cycle.duration_seconds)",
+    )
+
+    metric_type: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="Type of the aggregated metric (counter, gauge, histogram)",
+    )
+
+    resolution_seconds: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Bucket width: 60 (minute) or 3600 (hour)",
+    )
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Start of the bucket (UTC), aligned to the resolution",
+    )
+
+    sample_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Raw metric rows in the bucket"
+    )
+    value_sum: Mapped[float] = mapped_column(Float, nullable=False, comment="Sum of values")
+    value_min: Mapped[float] = mapped_column(Float, nullable=False, comment="Smallest value")
+    value_max: Mapped[float] = mapped_column(Float, nullable=False, comment="Largest value")
+
+    histogram: Mapped[dict[str, int] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Log-bucketed value counts (histogram metrics only)",
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "resolution_seconds IN (60, 3600)",
+            name="ck_metric_rollups_resolution",
+        ),
+        # Upsert target of the rollup job; also serves the per-employee
+        # range reads of the metrics endpoints.
+        UniqueConstraint(
+            "employee_id",
+            "resolution_seconds",
+            "metric_name",
+            "bucket_start",
+            "tenant_id",
+            name="uq_metric_rollups_bucket",
+        ),
+        # Rollup watermark (latest minute bucket) and retention sweeps
+        Index("idx_metric_rollups_resolution", "resolution_seconds", "bucket_start"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MetricRollup(name={self.metric_name}, "
+            f"resolution={self.resolution_seconds}, bucket={self.bucket_start})>"
+        )
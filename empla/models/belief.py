@@ -6,17 +6,20 @@ BDI belief models:
 - BeliefHistory: Historical belief changes (for learning)
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from sqlalchemy import (
+    DDL,
     CheckConstraint,
     DateTime,
     Float,
     ForeignKey,
     Index,
+    PrimaryKeyConstraint,
     String,
+    event,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -248,10 +251,12 @@ class BeliefHistory(TenantScopedModel):
         String(500), nullable=True, comment="Why belief changed"
     )
 
-    # Temporal
+    # Temporal (partition key, so part of the primary key)
     changed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
+        default=lambda: datetime.now(UTC),
         server_default=text("now()"),
         comment="When change occurred (UTC)",
     )
@@ -269,7 +274,23 @@ class BeliefHistory(TenantScopedModel):
         Index("idx_belief_history_belief", "belief_id", "changed_at"),
         Index("idx_belief_history_employee", "employee_id", "changed_at"),
         Index("idx_belief_history_tenant", "tenant_id"),
+        # Postgres requires the partition key in every unique constraint.
+        PrimaryKeyConstraint("id", "changed_at", name="belief_history_pkey"),
+        # Monthly range partitions (migration n9i0j1k2l3m4). Old months are
+        # detached and archived to Parquet by HistoryRetention.
+        {"postgresql_partition_by": "RANGE (changed_at)"},
     )
 
     def __repr__(self) -> str:
         return f"<BeliefHistory(id={self.id}, change_type={self.change_type})>"
+
+
+# create_all() (dev/tests) has no migration to lay out monthly partitions;
+# a DEFAULT partition keeps inserts working there.
+event.listen(
+    BeliefHistory.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS belief_history_default PARTITION OF belief_history DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,236 @@
+"""
+empla.models.crm - Local CRM Mirror Models
+
+Tenant-scoped copies of CRM deals and contacts, kept fresh by provider
+webhooks and periodic ``lastmodifieddate`` delta searches (see
+``empla/integrations/hubspot/mirror.py``). Tools read and aggregate from
+these indexed tables instead of paging the provider API on every call.
+
+``CRMSyncState`` records, per tenant / provider / object type, when the
+mirror was seeded, when the last delta sync completed, the modification
+watermark to resume from, and whether a webhook has since reported a
+change it could not apply in place.
+
+The mirror is a cache, not the source of truth: rows can always be
+rebuilt by re-seeding from the provider.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Float, Index, String, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from empla.models.base import TenantScopedModel
+
+# Full-text document for contact search. Email is split on '@' / '.' so a
+# query for "acme" matches "jane@acme.com". Must stay byte-identical to the
+# ``idx_crm_contacts_fts`` expression in migration o0j1k2l3m4n5.
+CONTACT_TSVECTOR = (
+    "to_tsvector('simple', "
+    "coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+    "coalesce(company, '') || ' ' || translate(coalesce(email, ''), '@.', '  '))"
+)
+
+
+class CRMDeal(TenantScopedModel):
+    """Mirrored CRM deal."""
+
+    __tablename__ = "crm_deals"
+
+    provider: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="CRM provider (e.g., 'hubspot')",
+    )
+
+    external_id: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="Object ID in the provider",
+    )
+
+    name: Mapped[str] = mapped_column(
+        String(500),
+        nullable=False,
+        server_default=text("''"),
+        comment="Deal name",
+    )
+
+    stage: Mapped[str | None] = mapped_column(
+        String(100),
+        nullable=True,
+        comment="Pipeline stage ID (e.g., 'qualifiedtobuy')",
+    )
+
+    pipeline: Mapped[str | None] = mapped_column(
+        String(100),
+        nullable=True,
+        comment="Pipeline ID",
+    )
+
+    amount: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Deal amount in the portal currency",
+    )
+
+    close_date: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Expected or actual close date",
+    )
+
+    properties: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        server_default=text("'{}'::jsonb"),
+        comment="Raw provider properties as last seen",
+    )
+
+    remote_updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Provider last-modified time; guards against out-of-order writes",
+    )
+
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        comment="When this row was last written from the provider",
+    )
+
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "provider", "external_id", name="uq_crm_deals_external"),
+        # Pipeline aggregates and stage-filtered listings.
+        Index(
+            "idx_crm_deals_stage",
+            "tenant_id",
+            "provider",
+            "stage",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Default listing (most recently modified first).
+        Index(
+            "idx_crm_deals_updated",
+            "tenant_id",
+            "provider",
+            text("remote_updated_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CRMDeal(provider={self.provider}, external_id={self.external_id})>"
+
+
+class CRMContact(TenantScopedModel):
+    """Mirrored CRM contact."""
+
+    __tablename__ = "crm_contacts"
+
+    provider: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="CRM provider (e.g., 'hubspot')",
+    )
+
+    external_id: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="Object ID in the provider",
+    )
+
+    email: Mapped[str | None] = mapped_column(
+        String(320),
+        nullable=True,
+        comment="Primary email address",
+    )
+
+    first_name: Mapped[str | None] = mapped_column(String(200), nullable=True)
+
+    last_name: Mapped[str | None] = mapped_column(String(200), nullable=True)
+
+    company: Mapped[str | None] = mapped_column(String(500), nullable=True)
+
+    properties: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        server_default=text("'{}'::jsonb"),
+        comment="Raw provider properties as last seen",
+    )
+
+    remote_updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Provider last-modified time; guards against out-of-order writes",
+    )
+
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        comment="When this row was last written from the provider",
+    )
+
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "provider", "external_id", name="uq_crm_contacts_external"),
+        Index(
+            "idx_crm_contacts_fts",
+            text(CONTACT_TSVECTOR),
+            postgresql_using="gin",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CRMContact(provider={self.provider}, external_id={self.external_id})>"
+
+
+class CRMSyncState(TenantScopedModel):
+    """Seed / delta-sync bookkeeping for one mirrored object type."""
+
+    __tablename__ = "crm_sync_state"
+
+    provider: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    object_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Mirrored object type ('deals' or 'contacts')",
+    )
+
+    seeded_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the last full seed completed",
+    )
+
+    synced_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Start time of the last completed seed or delta sync",
+    )
+
+    watermark: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Highest provider last-modified time mirrored so far",
+    )
+
+    invalidated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Latest webhook that could not be applied in place",
+    )
+
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "provider", "object_type", name="uq_crm_sync_state_object"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CRMSyncState(provider={self.provider}, object_type={self.object_type})>"
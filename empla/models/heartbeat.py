@@ -0,0 +1,148 @@
+"""
+empla.models.heartbeat - Runner Heartbeats
+
+One row per employee runner, upserted by the runner every few seconds
+(empla.services.heartbeat). Fleet and per-employee status endpoints read
+this table instead of polling each runner's health server over HTTP.
+"""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID as PyUUID
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from empla.models.base import Base
+
+
+class EmployeeHeartbeat(Base):
+    """
+    Latest liveness report of one employee runner.
+
+    The table is UNLOGGED: it holds only the most recent report per
+    runner, so after a database crash an empty table is correct within
+    one heartbeat interval, and skipping WAL keeps the upserts cheap.
+    Only ``tenant_id`` is indexed, which leaves every column the runner
+    rewrites unindexed, and pages keep 30% free space (fillfactor 70), so
+    upserts can be HOT updates that touch neither the indexes nor a new
+    page.
+
+    A row is stale when ``reported_at`` is older than
+    ``EMPLA_HEARTBEAT_STALE_SECONDS``; readers treat a stale runner as
+    unhealthy unless its last report was a clean shutdown. A runner that
+    exits on an unhandled error reports ``state='crashed'`` with the error
+    and is unhealthy right away.
+    """
+
+    __tablename__ = "employee_heartbeats"
+
+    employee_id: Mapped[PyUUID] = mapped_column(
+        ForeignKey("employees.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Employee the runner executes",
+    )
+
+    tenant_id: Mapped[PyUUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Tenant the employee belongs to",
+    )
+
+    state: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="Runner state: running, stopped after a clean shutdown, or crashed",
+    )
+
+    error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Why the runner crashed (redacted), set with state 'crashed'",
+    )
+
+    phase: Mapped[str | None] = mapped_column(
+        String(50),
+        nullable=True,
+        comment="BDI phase the loop was in at report time (idle between cycles)",
+    )
+
+    cycle_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+        comment="Cycles started since the runner started",
+    )
+
+    last_cycle_duration_seconds: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Duration of the last completed cycle",
+    )
+
+    last_cycle_success: Mapped[bool | None] = mapped_column(
+        Boolean,
+        nullable=True,
+        comment="Whether the last completed cycle succeeded",
+    )
+
+    cost_usd: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        server_default=text("0"),
+        comment="LLM cost since the runner started (USD)",
+    )
+
+    tool_health: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        server_default=text("'{}'::jsonb"),
+        comment="Per-integration status, call count, error rate and p95 latency",
+    )
+
+    pid: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="Runner process id on its host"
+    )
+
+    host: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, comment="Host the runner process runs on"
+    )
+
+    health_port: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="Runner health server port on its host"
+    )
+
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="When the runner started (UTC)",
+    )
+
+    reported_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        comment="When the runner last reported (UTC, database clock)",
+    )
+
+    __table_args__ = (
+        Index("idx_employee_heartbeats_tenant", "tenant_id"),
+        {"prefixes": ["UNLOGGED"], "postgresql_with": {"fillfactor": 70}},
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmployeeHeartbeat(employee_id={self.employee_id}, state={self.state}, "
+            f"cycle_count={self.cycle_count}, reported_at={self.reported_at})>"
+        )
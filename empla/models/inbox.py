@@ -80,11 +80,13 @@ class InboxMessage(TenantScopedModel):
             "priority IN ('urgent', 'normal', 'off')",
             name="ck_inbox_messages_priority",
         ),
-        # Primary list view (tenant scope, newest first).
+        # Primary list view (tenant scope, newest first; id completes the
+        # keyset pagination order).
         Index(
-            "idx_inbox_tenant_created",
+            "idx_inbox_tenant_keyset",
             "tenant_id",
             text("created_at DESC"),
+            text("id DESC"),
             postgresql_where=text("deleted_at IS NULL"),
         ),
         # Unread count — hit frequently by sidebar badge polling.
@@ -106,6 +108,13 @@ class InboxMessage(TenantScopedModel):
             "tenant_id",
             postgresql_where=text("priority = 'urgent' AND read_at IS NULL AND deleted_at IS NULL"),
         ),
+        # Insert-order tail for the live SSE feed
+        Index(
+            "idx_inbox_created",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
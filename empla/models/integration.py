@@ -5,6 +5,7 @@ Models for managing third-party integrations and OAuth credentials:
 - Integration: Tenant-level provider configuration (Google, Microsoft, MCP servers)
 - IntegrationCredential: Employee-level or tenant-level encrypted tokens
 - IntegrationOAuthState: Temporary OAuth state for CSRF protection
+- IntegrationSyncCursor: Per-employee incremental sync position (Gmail historyId, ...)
 
 These models support User OAuth (consent flow), Service Account, and
 MCP server authentication, with application-level encryption for sensitive data.
@@ -26,7 +27,7 @@ from sqlalchemy import (
     String,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -160,6 +161,15 @@ class Integration(TenantScopedModel):
         comment="Configuration JSONB (OAuth: client_id/scopes; MCP: transport/url/tools) - NO secrets",
     )
 
+    # Keyed hashes of oauth_config["webhook_token"] / ["webhook_token_prev"]
+    # (empla/services/webhook_routing.py), so the public webhook receiver
+    # finds the integration through an index instead of comparing every token.
+    webhook_token_hashes: Mapped[list[str] | None] = mapped_column(
+        ARRAY(String(64)),
+        nullable=True,
+        comment="HMAC-SHA256 (hex) of the current and previous webhook token",
+    )
+
     # Platform credential delegation
     use_platform_credentials: Mapped[bool] = mapped_column(
         Boolean,
@@ -242,6 +252,12 @@ class Integration(TenantScopedModel):
             "status",
             postgresql_where=text("deleted_at IS NULL"),
         ),
+        Index(
+            "idx_integrations_webhook_token_hashes",
+            "webhook_token_hashes",
+            postgresql_using="gin",
+            postgresql_where=text("deleted_at IS NULL AND webhook_token_hashes IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -506,6 +522,67 @@ class IntegrationOAuthState(TenantScopedModel):
         return f"<IntegrationOAuthState(id={self.id}, state={self.state[:8]}...)>"
 
 
+class IntegrationSyncCursor(TenantScopedModel):
+    """
+    Incremental sync position for one employee's provider resource.
+
+    Adapters that sync deltas (Gmail ``historyId``, Calendar ``syncToken``)
+    persist their cursor here so a restarted employee resumes from where it
+    left off instead of re-listing the whole mailbox or calendar. ``state``
+    is adapter-defined JSON; the adapter owns its shape and must treat an
+    unknown or missing state as "full resync".
+
+    Example:
+        >>> IntegrationSyncCursor(
+        ...     tenant_id=tenant.id,
+        ...     employee_id=employee.id,
+        ...     provider="gmail",
+        ...     resource="me@acme.com",
+        ...     state={"history_id": "48213", "unread": ["18c1..."]},
+        ... )
+    """
+
+    __tablename__ = "integration_sync_cursors"
+
+    employee_id: Mapped[UUID] = mapped_column(
+        ForeignKey("employees.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Employee whose mailbox/calendar this cursor tracks",
+    )
+
+    provider: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Adapter provider (e.g., 'gmail', 'google_calendar')",
+    )
+
+    resource: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Synced resource within the provider (mailbox address, calendar ID)",
+    )
+
+    state: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        server_default=text("'{}'::jsonb"),
+        comment="Adapter-defined cursor state (historyId, syncToken, ...)",
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_sync_cursor_employee_resource",
+            "employee_id",
+            "provider",
+            "resource",
+            unique=True,
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<IntegrationSyncCursor(employee_id={self.employee_id}, provider={self.provider})>"
+
+
 class PlatformOAuthApp(TimestampedModel, Base):
     """
     Platform-level OAuth app registration.
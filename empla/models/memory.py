@@ -8,13 +8,14 @@ Multi-layered memory models:
 - WorkingMemory: Current context
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
     ARRAY,
+    DDL,
     Boolean,
     CheckConstraint,
     DateTime,
@@ -22,7 +23,9 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    PrimaryKeyConstraint,
     String,
+    event,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -114,10 +117,12 @@ class EpisodicMemory(TenantScopedModel):
         comment="When this memory was last recalled (UTC)",
     )
 
-    # Temporal
+    # Temporal (partition key, so part of the primary key)
     occurred_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
+        default=lambda: datetime.now(UTC),
         server_default=text("now()"),
         comment="When episode occurred (UTC)",
     )
@@ -164,6 +169,13 @@ class EpisodicMemory(TenantScopedModel):
             "tenant_id",
             postgresql_where=text("deleted_at IS NULL"),
         ),
+        # Full-text search (lexical leg of HybridMemoryRetriever)
+        Index(
+            "idx_episodes_fts",
+            text("to_tsvector('english', description)"),
+            postgresql_using="gin",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
         # Vector similarity index (IVFFlat)
         Index(
             "idx_episodes_embedding",
@@ -173,12 +185,28 @@ class EpisodicMemory(TenantScopedModel):
             postgresql_ops={"embedding": "vector_cosine_ops"},
             postgresql_where=text("deleted_at IS NULL"),
         ),
+        # Postgres requires the partition key in every unique constraint.
+        PrimaryKeyConstraint("id", "occurred_at", name="memory_episodes_pkey"),
+        # Monthly range partitions (migration n9i0j1k2l3m4). Old months are
+        # detached and archived to Parquet by HistoryRetention.
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
     )
 
     def __repr__(self) -> str:
         return f"<EpisodicMemory(id={self.id}, type={self.episode_type})>"
 
 
+# create_all() (dev/tests) has no migration to lay out monthly partitions;
+# a DEFAULT partition keeps inserts working there.
+event.listen(
+    EpisodicMemory.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS memory_episodes_default PARTITION OF memory_episodes DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class SemanticMemory(TenantScopedModel):
     """
     Semantic memory (facts, knowledge).
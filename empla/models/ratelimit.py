@@ -0,0 +1,41 @@
+"""
+empla.models.ratelimit - Shared Rate Limit State
+
+One row per rate-limited key when API replicas share limiter state
+(``EMPLA_RATE_LIMIT_BACKEND=postgres``). See empla.api.ratelimit.
+"""
+
+from sqlalchemy import Float, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from empla.models.base import Base
+
+
+class RateLimitBucket(Base):
+    """
+    GCRA state for one rate-limited key.
+
+    NOT tenant-scoped — keys are limiter-qualified client identifiers
+    (``oauth_callback:203.0.113.7``). The whole state is the key's
+    theoretical arrival time; a row whose ``tat`` has passed is
+    equivalent to no row and is deleted by the periodic sweep.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    key: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="Limiter name and client identifier",
+    )
+
+    tat: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        comment="Theoretical arrival time (Unix epoch seconds, database clock)",
+    )
+
+    __table_args__ = (Index("idx_rate_limit_buckets_tat", "tat"),)
+
+    def __repr__(self) -> str:
+        return f"<RateLimitBucket(key={self.key}, tat={self.tat})>"
@@ -0,0 +1,123 @@
+"""
+empla.runner.coalesce - Webhook Event Coalescing
+
+Providers deliver changes in bursts: a HubSpot bulk import of 500 deals
+arrives as hundreds of webhook deliveries within seconds, many of them
+repeated updates to the same objects. Queued one-per-delivery, that became
+hundreds of observations, most of them near-duplicates.
+
+EventCoalescer sits between the runner's /wake endpoint and the execution
+loop. It merges pending events per (provider, object type, object id),
+keeping the latest change and a ``count`` of merged changes (absent when
+there was only one). Deliveries that name the objects they touch
+(``event["objects"]``, filled by the provider's object extractor) are
+split into one entry per object; deliveries without object refs merge per
+(provider, event type).
+
+The number of distinct entries is bounded. Past the bound, further objects
+are not itemized but still counted, per (provider, event type), and
+delivered as an aggregate entry, so a burst never silently loses events.
+
+Example:
+    >>> coalescer = EventCoalescer(max_entries=100)
+    >>> coalescer.add({"provider": "hubspot", "event_type": "deal.propertyChange",
+    ...                "objects": [{"object_type": "deal", "object_id": "1", ...}]})
+    >>> coalescer.drain()
+    [{"provider": "hubspot", "object_type": "deal", "object_id": "1", ...}]
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _object_entries(event: dict[str, Any]) -> list[tuple[tuple[str, str, str], dict[str, Any]]]:
+    """Split a wake event into (merge key, entry) pairs."""
+    provider = str(event.get("provider", "unknown"))
+    event_type = str(event.get("event_type", "unknown"))
+    objects = [o for o in event.get("objects") or [] if isinstance(o, dict)]
+    if not objects:
+        return [((provider, event_type, ""), event)]
+
+    entries = []
+    for ref in objects:
+        object_type = str(ref.get("object_type") or "object")
+        object_id = str(ref.get("object_id") or "")
+        detail = ref.get("detail") or {}
+        summary = f"{object_type} {object_id}".strip()
+        if detail:
+            summary += " (" + ", ".join(f"{k}={v}" for k, v in detail.items()) + ")"
+        entries.append(
+            (
+                (provider, object_type, object_id),
+                {
+                    "provider": provider,
+                    "event_type": str(ref.get("event_type") or event_type),
+                    "object_type": object_type,
+                    "object_id": object_id,
+                    "summary": summary,
+                    "payload": detail,
+                    "received_at": event.get("received_at", ""),
+                },
+            )
+        )
+    return entries
+
+
+class EventCoalescer:
+    """Merges pending webhook events until the loop drains them.
+
+    Args:
+        max_entries: Distinct (provider, object) entries itemized before
+            further objects are only counted.
+    """
+
+    def __init__(self, max_entries: int = 100) -> None:
+        self.max_entries = max_entries
+        # Insertion-ordered; an updated entry moves to the end so drain()
+        # lists the most recently changed objects last.
+        self._entries: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._overflow: dict[tuple[str, str], dict[str, Any]] = {}
+        self.received = 0
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Merge one wake event into the pending set."""
+        self.received += 1
+        for key, entry in _object_entries(event):
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._entries[key] = {**entry, "count": previous.get("count", 1) + 1}
+            elif len(self._entries) < self.max_entries:
+                self._entries[key] = entry
+            else:
+                self._count_overflow(entry)
+
+    def _count_overflow(self, entry: dict[str, Any]) -> None:
+        provider = str(entry.get("provider", "unknown"))
+        event_type = str(entry.get("event_type", "unknown"))
+        if not self._overflow:
+            logger.warning(
+                "Pending events at capacity; further objects are counted, not itemized",
+                extra={"provider": provider, "max_entries": self.max_entries},
+            )
+        aggregate = self._overflow.setdefault(
+            (provider, event_type),
+            {"provider": provider, "event_type": event_type, "count": 0, "overflow": True},
+        )
+        aggregate["count"] += 1
+        aggregate["received_at"] = entry.get("received_at", "")
+        aggregate["summary"] = f"{aggregate['count']} more changes not itemized"
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Return and clear the merged events, overflow aggregates last."""
+        events = [*self._entries.values(), *self._overflow.values()]
+        self._entries.clear()
+        self._overflow.clear()
+        self.received = 0
+        return events
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._overflow)
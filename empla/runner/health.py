@@ -7,6 +7,11 @@ No external dependencies — uses asyncio.start_server with manual HTTP parsing.
 Endpoints:
   GET  /health  — health check (used by EmployeeManager.get_health)
   POST /wake    — wake the employee loop with an event payload
+
+Wake events are coalesced (see empla.runner.coalesce) and the loop wake is
+debounced: a burst of deliveries wakes the loop once, after the burst has
+been quiet for ``debounce_seconds`` (or at most ``max_debounce_seconds``
+after its first event), and the loop drains one merged batch.
 """
 
 import asyncio
@@ -16,14 +21,15 @@ import json
 import logging
 import os
 import time
-from collections import deque
 from collections.abc import Callable
 from typing import Any
 from uuid import UUID
 
+from empla.runner.coalesce import EventCoalescer
+
 logger = logging.getLogger(__name__)
 
-_MAX_PENDING_EVENTS = 100
+_MAX_PENDING_EVENTS = 100  # distinct objects itemized; further ones are counted
 _MAX_WAKE_BODY_BYTES = 65_536
 _MAX_DESCRIPTION_CHARS = 500  # cap on MCP-supplied tool descriptions
 _AUTH_HEADER = "x-runner-token"
@@ -74,8 +80,10 @@ class HealthServer:
     """Minimal HTTP server for health checks and wake triggers.
 
     The wake endpoint accepts event payloads from the API server
-    (proxied via EmployeeManager) and stores them until the execution
-    loop drains them at the start of the next cycle.
+    (proxied via EmployeeManager) and merges them until the execution
+    loop drains them at the start of the next cycle. With
+    ``debounce_seconds`` > 0 the wake callback is deferred until
+    deliveries pause, so a burst costs one wake instead of one per event.
     """
 
     def __init__(
@@ -85,6 +93,9 @@ class HealthServer:
         wake_callback: Callable[[], None] | None = None,
         tool_router: Any = None,
         auth_token: str | None = None,
+        *,
+        debounce_seconds: float = 0.0,
+        max_debounce_seconds: float = 10.0,
     ) -> None:
         self.employee_id = employee_id
         self.port = port
@@ -92,7 +103,11 @@ class HealthServer:
         self._server: asyncio.Server | None = None
         self.cycle_count = 0  # TODO: wire to ProactiveExecutionLoop.cycle_count
         self._wake_callback = wake_callback
-        self._pending_events: deque[dict[str, Any]] = deque(maxlen=_MAX_PENDING_EVENTS)
+        self._pending_events = EventCoalescer(max_entries=_MAX_PENDING_EVENTS)
+        self._debounce_seconds = debounce_seconds
+        self._max_debounce_seconds = max(max_debounce_seconds, debounce_seconds)
+        self._wake_handle: asyncio.TimerHandle | None = None
+        self._wake_deadline: float | None = None
         # Optional: ToolRouter reference for /tools introspection (PR #80).
         # When None, the /tools endpoints return 503 (employee runner not
         # wired to expose tools).
@@ -120,6 +135,9 @@ class HealthServer:
 
     async def stop(self) -> None:
         """Stop the health server."""
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+            self._wake_handle = None
         if self._server:
             self._server.close()
             await self._server.wait_closed()
@@ -129,16 +147,50 @@ class HealthServer:
                 extra={"employee_id": str(self.employee_id)},
             )
 
+    def enqueue_event(self, event: dict[str, Any]) -> None:
+        """Merge an event into the pending set (no wake)."""
+        self._pending_events.add(event)
+
     def drain_events(self) -> list[dict[str, Any]]:
-        """Return and clear all pending events.
+        """Return and clear all pending (coalesced) events.
 
         Called by the execution loop early in each cycle to collect
-        events that arrived since the last drain. Safe in single-threaded
-        asyncio (no preemption between the swap and reassignment).
+        events that arrived since the last drain. Merged entries carry a
+        ``count``. Safe in single-threaded asyncio (no preemption between
+        the read and the clear).
         """
-        events = list(self._pending_events)
-        self._pending_events.clear()
-        return events
+        return self._pending_events.drain()
+
+    def _schedule_wake(self) -> None:
+        """Wake the loop now, or once the current burst goes quiet."""
+        if self._wake_callback is None:
+            return
+        if self._debounce_seconds <= 0:
+            self._fire_wake()
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._wake_deadline is None:
+            self._wake_deadline = now + self._max_debounce_seconds
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+        self._wake_handle = loop.call_at(
+            min(now + self._debounce_seconds, self._wake_deadline), self._fire_wake
+        )
+
+    def _fire_wake(self) -> None:
+        self._wake_handle = None
+        self._wake_deadline = None
+        if self._wake_callback is None:
+            return
+        try:
+            self._wake_callback()
+        except Exception:
+            logger.warning(
+                "Wake callback failed, event stored but loop may not wake immediately",
+                exc_info=True,
+                extra={"employee_id": str(self.employee_id)},
+            )
 
     async def _handle_request(
         self,
@@ -252,6 +304,7 @@ class HealthServer:
                 "uptime_seconds": round(time.monotonic() - self._start_time, 1),
                 "cycle_count": self.cycle_count,
                 "pending_events": len(self._pending_events),
+                "pending_deliveries": self._pending_events.received,
             }
         )
 
@@ -274,30 +327,22 @@ class HealthServer:
         if not isinstance(event, dict):
             return '{"error": "payload must be a JSON object"}', 400
 
-        if len(self._pending_events) >= _MAX_PENDING_EVENTS:
-            dropped = self._pending_events.popleft()
-            logger.warning(
-                "Pending events queue full, dropping oldest event",
-                extra={
-                    "employee_id": str(self.employee_id),
-                    "dropped_provider": dropped.get("provider", "unknown"),
-                    "dropped_event_type": dropped.get("event_type", "unknown"),
-                    "queue_size": _MAX_PENDING_EVENTS,
-                },
-            )
-
-        self._pending_events.append(event)
+        self._pending_events.add(event)
 
-        if self._wake_callback:
+        # The provider reported a change: cached reads from it are stale.
+        provider = event.get("provider")
+        if provider and self._tool_router is not None:
             try:
-                self._wake_callback()
+                self._tool_router.invalidate_cached_results(provider)
             except Exception:
                 logger.warning(
-                    "Wake callback failed, event stored but loop may not wake immediately",
+                    "Failed to invalidate cached tool results",
                     exc_info=True,
-                    extra={"employee_id": str(self.employee_id)},
+                    extra={"employee_id": str(self.employee_id), "provider": provider},
                 )
 
+        self._schedule_wake()
+
         logger.info(
             "Wake event received",
             extra={
@@ -382,12 +427,15 @@ class HealthServer:
         name = path[len("/tools/") : -len("/health")]
         if not name:
             return '{"error": "missing tool name"}', 400
-        # Tool names are namespaced as "integration.tool" — health is per-integration.
+        # Tool names are namespaced as "integration.tool" — lifetime counters
+        # are per-integration; the sliding window is also kept per tool.
         integration = name.split(".", 1)[0] if "." in name else name
         try:
             health = self._tool_router.get_integration_health(integration)
             if isinstance(health, dict) and "last_error" in health:
                 health = {**health, "last_error": _redact(health.get("last_error"))}
+            if "." in name and hasattr(self._tool_router, "get_tool_health"):
+                health = {**health, "tool": self._tool_router.get_tool_health(name)}
             return json.dumps(health), 200
         except Exception:
             logger.warning(
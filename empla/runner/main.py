@@ -33,7 +33,8 @@ from empla.integrations.email.tools import router as email_router_template
 from empla.models.database import get_engine, get_sessionmaker
 from empla.models.employee import Employee as EmployeeModel
 from empla.models.tenant import Tenant
-from empla.runner.health import HealthServer
+from empla.runner.health import HealthServer, _redact
+from empla.services.heartbeat import HeartbeatReporter
 
 logger = logging.getLogger(__name__)
 
@@ -296,6 +297,13 @@ async def run_employee(
             extra={"employee_id": str(employee_id)},
         )
 
+    # Share discovered MCP tool catalogs with the tenant's other runners.
+    if mcp_configs:
+        from empla.core.tools.mcp_pool import get_mcp_pool
+        from empla.services.integrations.mcp_service import MCPToolCatalogStore
+
+        get_mcp_pool().set_catalog_store(MCPToolCatalogStore(session_factory))
+
     # Resolve OAuth credentials and inject into MCP server configs.
     # stdio servers get OAUTH_ACCESS_TOKEN in env; HTTP servers get Authorization header.
     try:
@@ -332,9 +340,39 @@ async def run_employee(
         )
 
     # Start health server
-    health = HealthServer(employee_id=employee_id, port=health_port)
+    from empla.settings import get_settings
+
+    settings = get_settings()
+    health = HealthServer(
+        employee_id=employee_id,
+        port=health_port,
+        debounce_seconds=settings.webhook_debounce_seconds,
+        max_debounce_seconds=settings.webhook_debounce_max_seconds,
+    )
     await health.start()
 
+    # Push liveness to employee_heartbeats so status endpoints read one
+    # table instead of polling this process. The sources are read lazily:
+    # the LLM service and tool router only exist once employee.start() ran.
+    def _llm_cost() -> float | None:
+        return employee._llm.total_cost if employee._llm is not None else None
+
+    def _tool_health() -> list[dict[str, Any]] | None:
+        router = employee._tool_router
+        return router.health_monitor.get_all_status() if router is not None else None
+
+    heartbeat = HeartbeatReporter(
+        session_factory,
+        employee_id,
+        tenant_id,
+        interval_seconds=settings.heartbeat_interval_seconds,
+        health_port=health.port,
+        cost_source=_llm_cost,
+        tool_health_source=_tool_health,
+    )
+    heartbeat.register(employee.hooks)
+    heartbeat.start()
+
     # Build status checker callback (refreshes employee.status from DB).
     # Passed to employee.start() → ProactiveExecutionLoop so the loop can
     # react to external status changes (pause-via-DB pattern).
@@ -370,6 +408,9 @@ async def run_employee(
     for sig in (signal.SIGTERM, signal.SIGINT):
         loop.add_signal_handler(sig, _signal_handler)
 
+    # Reported with the final heartbeat. Cleared only on the signal path
+    # or a normal finish, so anything else reads as a crash.
+    exit_error: str | None = "Runner exited without a clean shutdown"
     try:
         # Start employee in a task so we can cancel on signal
         async def _run() -> None:
@@ -420,13 +461,28 @@ async def run_employee(
             signal_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await signal_task
+            employee_task.result()  # re-raise if the employee crashed
+        exit_error = None
 
-    except Exception:
+    except Exception as e:
         logger.error("Employee runner crashed", exc_info=True)
+        exit_error = _redact(f"{type(e).__name__}: {e}")
     finally:
+        # Final heartbeat: 'stopped' after a clean shutdown, 'crashed'
+        # with the error otherwise
+        await heartbeat.stop(error=exit_error)
+
         # Stop health server
         await health.stop()
 
+        # Close pooled MCP sessions (subprocesses, HTTP streams)
+        try:
+            from empla.core.tools.mcp_pool import close_mcp_pool
+
+            await close_mcp_pool()
+        except Exception:
+            logger.warning("Failed to close MCP server pool", exc_info=True)
+
         # Update DB status to "stopped" — but ONLY if we're currently
         # running. The cost hard-stop (and future restart/terminate
         # flows) set status='paused'/'restarting'/'terminated' inside
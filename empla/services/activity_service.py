@@ -14,9 +14,13 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from empla.models.activity import ActivityEventType, EmployeeActivity
+from empla.services.pagination import Page, SortKey, TotalMode, paginate
 
 logger = logging.getLogger(__name__)
 
+# Newest first; backed by idx_activities_{employee,tenant}_keyset.
+_ACTIVITY_ORDER = (SortKey(EmployeeActivity.occurred_at), SortKey(EmployeeActivity.id))
+
 
 class ActivityService:
     """
@@ -92,9 +96,12 @@ class ActivityService:
         until: datetime | None = None,
         page: int = 1,
         page_size: int = 50,
-    ) -> tuple[list[EmployeeActivity], int]:
+        *,
+        cursor: str | None = None,
+        total: TotalMode = "estimate",
+    ) -> Page[EmployeeActivity]:
         """
-        Query activities with filtering and pagination.
+        Query activities with filtering and pagination, newest first.
 
         Args:
             tenant_id: Tenant ID (required for multi-tenant isolation)
@@ -103,11 +110,16 @@ class ActivityService:
             min_importance: Minimum importance score
             since: Activities after this time
             until: Activities before this time
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), for offset pagination
             page_size: Items per page
+            cursor: ``next_cursor`` of the previous page; overrides ``page``
+            total: How to compute the total (see empla.services.pagination)
 
         Returns:
-            Tuple of (activities, total_count)
+            The page of activities with its total and next cursor
+
+        Raises:
+            InvalidCursorError: If ``cursor`` is malformed
         """
         # Base query
         query = select(EmployeeActivity).where(EmployeeActivity.tenant_id == tenant_id)
@@ -128,20 +140,15 @@ class ActivityService:
         if until:
             query = query.where(EmployeeActivity.occurred_at <= until)
 
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination and ordering
-        offset = (page - 1) * page_size
-        query = query.order_by(EmployeeActivity.occurred_at.desc()).offset(offset).limit(page_size)
-
-        # Execute
-        result = await self.session.execute(query)
-        activities = list(result.scalars().all())
-
-        return activities, total
+        return await paginate(
+            self.session,
+            query,
+            _ACTIVITY_ORDER,
+            page_size=page_size,
+            cursor=cursor,
+            page=page,
+            total=total,
+        )
 
     async def get_recent(
         self,
@@ -160,13 +167,14 @@ class ActivityService:
         Returns:
             List of recent activities
         """
-        activities, _ = await self.get_activities(
+        result = await self.get_activities(
             tenant_id=tenant_id,
             employee_id=employee_id,
             page=1,
             page_size=limit,
+            total="none",
         )
-        return activities
+        return result.items
 
     async def get_summary(
         self,
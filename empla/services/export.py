@@ -0,0 +1,346 @@
+"""
+empla.services.export - Streaming Bulk Export
+
+The list endpoints page 50-100 rows at a time, so pulling a tenant's
+whole activity history, episodic memory or raw metrics meant thousands
+of requests. An export streams one dataset in a single pass instead:
+
+- Rows are read through a server-side cursor (``AsyncSession.stream``
+  with ``yield_per``) as plain column tuples, not ORM objects, so neither
+  the driver nor the identity map holds more than one batch.
+- Each batch is encoded (NDJSON or CSV, optionally gzip) and handed to
+  the caller as one bytes chunk before the next batch is fetched. Memory
+  use is bounded by the batch size, not the export size.
+- Rows come in ascending ``(time, id)`` order. An interrupted export
+  resumes exactly with ``after_time``/``after_id`` set to the last row it
+  received: both values are fields of every exported row, so clients do
+  not need an opaque cursor to pick up where they stopped.
+
+Used by ``GET /api/v1/export/{dataset}`` and ``python -m empla.cli export``.
+
+Example:
+    >>> export = ExportQuery(EXPORTS["activities"], tenant_id, after_time=t, after_id=i)
+    >>> async for chunk in export_chunks(sessionmaker, export, fmt="ndjson", compress=True):
+    ...     out.write(chunk)
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Literal
+from uuid import UUID
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute
+
+from empla.models.activity import EmployeeActivity
+from empla.models.audit import Metric
+from empla.models.memory import EpisodicMemory
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """One exportable dataset.
+
+    Attributes:
+        name: Dataset name in URLs and on the command line.
+        model: ORM model read.
+        time_column: Column ordered on and filtered by since/until; the
+            export resumes after ``(time, id)``.
+        columns: Exported column names, in output order. Must include
+            ``time_column`` and ``id``.
+        soft_deleted: Whether the model has ``deleted_at`` (deleted rows
+            are skipped).
+    """
+
+    name: str
+    model: Any
+    time_column: str
+    columns: tuple[str, ...]
+    soft_deleted: bool = True
+
+    def column(self, name: str) -> InstrumentedAttribute[Any]:
+        return getattr(self.model, name)
+
+
+# Embeddings are left out of memory exports: 1024 floats per row would be
+# most of the file, and they are recomputed from the text on import.
+EXPORTS: dict[str, ExportSpec] = {
+    spec.name: spec
+    for spec in (
+        ExportSpec(
+            name="activities",
+            model=EmployeeActivity,
+            time_column="occurred_at",
+            columns=(
+                "id",
+                "employee_id",
+                "occurred_at",
+                "event_type",
+                "description",
+                "importance",
+                "data",
+                "created_at",
+            ),
+            soft_deleted=False,
+        ),
+        ExportSpec(
+            name="memories",
+            model=EpisodicMemory,
+            time_column="occurred_at",
+            columns=(
+                "id",
+                "employee_id",
+                "occurred_at",
+                "episode_type",
+                "description",
+                "importance",
+                "recall_count",
+                "last_recalled_at",
+                "location",
+                "participants",
+                "content",
+                "created_at",
+                "updated_at",
+            ),
+        ),
+        ExportSpec(
+            name="metrics",
+            model=Metric,
+            time_column="timestamp",
+            columns=(
+                "id",
+                "employee_id",
+                "timestamp",
+                "metric_name",
+                "metric_type",
+                "value",
+                "tags",
+            ),
+        ),
+    )
+}
+
+
+@dataclass(frozen=True)
+class ExportQuery:
+    """Which rows of a dataset to export.
+
+    Attributes:
+        spec: Dataset.
+        tenant_id: Tenant whose rows are exported.
+        employee_id: Only this employee's rows.
+        since: Rows at or after this time.
+        until: Rows before this time.
+        after_time: Resume after the row with this time and ``after_id``.
+        after_id: Resume after the row with ``after_time`` and this id.
+    """
+
+    spec: ExportSpec
+    tenant_id: UUID
+    employee_id: UUID | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    after_time: datetime | None = None
+    after_id: UUID | None = None
+
+    def __post_init__(self) -> None:
+        if (self.after_time is None) != (self.after_id is None):
+            msg = "after_time and after_id must be given together"
+            raise ValueError(msg)
+
+    def select(self) -> Select[Any]:
+        """Column select in resume order, without LIMIT."""
+        spec = self.spec
+        time_col = spec.column(spec.time_column)
+        id_col = spec.column("id")
+        query = select(*(spec.column(c) for c in spec.columns)).where(
+            spec.column("tenant_id") == self.tenant_id
+        )
+        if spec.soft_deleted:
+            query = query.where(spec.column("deleted_at").is_(None))
+        if self.employee_id is not None:
+            query = query.where(spec.column("employee_id") == self.employee_id)
+        if self.since is not None:
+            query = query.where(time_col >= self.since)
+        if self.until is not None:
+            query = query.where(time_col < self.until)
+        if self.after_time is not None:
+            query = query.where(tuple_(time_col, id_col) > tuple_(self.after_time, self.after_id))
+        return query.order_by(time_col, id_col)
+
+
+@dataclass
+class ExportProgress:
+    """Rows written so far and the position to resume after.
+
+    Attributes:
+        rows: Rows the consumer has taken so far.
+        after_time: Time of the last row taken.
+        after_id: Id of the last row taken.
+    """
+
+    rows: int = 0
+    after_time: datetime | None = None
+    after_id: UUID | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "after_time": self.after_time.isoformat() if self.after_time else None,
+            "after_id": str(self.after_id) if self.after_id else None,
+        }
+
+
+# =========================================================================
+# Encoding
+# =========================================================================
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    msg = f"Cannot export {type(value).__name__}"
+    raise TypeError(msg)
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=_json_default, separators=(",", ":"))
+    return value
+
+
+class _Encoder:
+    """Encodes batches of rows, incrementally gzipped when asked."""
+
+    def __init__(self, columns: Sequence[str], fmt: ExportFormat, *, compress: bool) -> None:
+        if fmt not in MEDIA_TYPES:
+            msg = f"Unknown export format: {fmt}"
+            raise ValueError(msg)
+        self.columns = tuple(columns)
+        self.fmt = fmt
+        # wbits=31 writes a gzip (not zlib) container.
+        self._gzip = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+    def _compress(self, data: bytes) -> bytes:
+        # Sync-flush every batch so each chunk decompresses on its own: a
+        # consumer that stops mid-export still has every row it counted.
+        if self._gzip is None:
+            return data
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def header(self) -> bytes:
+        if self.fmt != "csv":
+            return b""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(self.columns)
+        return self._compress(buffer.getvalue().encode())
+
+    def batch(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        if self.fmt == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows([_csv_cell(v) for v in row] for row in rows)
+            text = buffer.getvalue()
+        else:
+            text = "".join(
+                json.dumps(
+                    dict(zip(self.columns, row, strict=True)),
+                    default=_json_default,
+                    separators=(",", ":"),
+                )
+                + "\n"
+                for row in rows
+            )
+        return self._compress(text.encode())
+
+    def finish(self) -> bytes:
+        return self._gzip.flush() if self._gzip else b""
+
+
+def file_extension(fmt: ExportFormat, *, compress: bool) -> str:
+    """File extension for an export, e.g. ``ndjson.gz``."""
+    return f"{fmt}.gz" if compress else fmt
+
+
+# =========================================================================
+# Streaming
+# =========================================================================
+
+
+async def _stream_rows(
+    session: AsyncSession, export: ExportQuery, batch_size: int
+) -> AsyncIterator[Sequence[Sequence[Any]]]:
+    query = export.select().execution_options(yield_per=batch_size)
+    result = await session.stream(query)
+    try:
+        async for partition in result.partitions():
+            yield partition
+    finally:
+        await result.close()
+
+
+async def export_chunks(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    export: ExportQuery,
+    *,
+    fmt: ExportFormat = "ndjson",
+    compress: bool = False,
+    batch_size: int = 1000,
+    progress: ExportProgress | None = None,
+) -> AsyncIterator[bytes]:
+    """Stream an export as encoded chunks, one per batch of rows.
+
+    Opens its own session, so it can outlive the request that started it,
+    and holds its connection only while the generator runs.
+
+    Args:
+        sessionmaker: Session factory.
+        export: Rows to export.
+        fmt: ``ndjson`` (one JSON object per line) or ``csv`` (header row;
+            JSON-valued columns as JSON text).
+        compress: Gzip the output.
+        batch_size: Rows fetched from the server-side cursor at a time.
+        progress: Updated after each chunk with the rows written and the
+            resume position.
+
+    Yields:
+        Encoded (and possibly compressed) bytes. ``progress`` counts a
+        batch once the consumer asks for the next chunk, i.e. after it
+        has written this one.
+    """
+    encoder = _Encoder(export.spec.columns, fmt, compress=compress)
+    progress = progress if progress is not None else ExportProgress()
+    time_index = export.spec.columns.index(export.spec.time_column)
+    id_index = export.spec.columns.index("id")
+
+    header = encoder.header()
+    if header:
+        yield header
+    async with sessionmaker() as session:
+        async for rows in _stream_rows(session, export, batch_size):
+            yield encoder.batch(rows)
+            last = rows[-1]
+            progress.rows += len(rows)
+            progress.after_time = last[time_index]
+            progress.after_id = last[id_index]
+    yield encoder.finish()
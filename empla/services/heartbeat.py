@@ -0,0 +1,367 @@
+"""
+empla.services.heartbeat - Runner Heartbeats
+
+Runner liveness used to be pulled: the API polled each runner's health
+server over localhost HTTP, so a fleet overview cost one request per
+employee and only worked on the host (and in the API process) that
+spawned the runners.
+
+Heartbeats push it instead:
+
+- Each runner owns a :class:`HeartbeatReporter`. It follows the loop
+  through lifecycle hooks (cycle count, current phase, last cycle
+  duration and outcome) and upserts one ``employee_heartbeats`` row every
+  ``EMPLA_HEARTBEAT_INTERVAL_SECONDS``, together with the runner's LLM
+  cost so far and a compact per-integration health summary.
+- A clean shutdown writes a final report with ``state='stopped'``; a
+  runner that exits on an unhandled error writes ``state='crashed'`` with
+  the error instead, so it is unhealthy without waiting to go stale.
+- Readers select employees joined to their heartbeat in one indexed
+  query (:func:`runtime_status_query`). Staleness is computed against the
+  database clock, so runners and API replicas on different hosts need no
+  clock agreement: a running runner that has not reported for
+  ``EMPLA_HEARTBEAT_STALE_SECONDS`` is unhealthy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any, Literal
+from uuid import UUID
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from empla.core.hooks import (
+    HOOK_AFTER_BELIEF_UPDATE,
+    HOOK_AFTER_INTENTION_EXECUTION,
+    HOOK_AFTER_STRATEGIC_PLANNING,
+    HOOK_BEFORE_BELIEF_UPDATE,
+    HOOK_BEFORE_INTENTION_EXECUTION,
+    HOOK_BEFORE_PERCEPTION,
+    HOOK_BEFORE_STRATEGIC_PLANNING,
+    HOOK_CYCLE_END,
+    HOOK_CYCLE_START,
+    HookHandler,
+    HookRegistry,
+)
+from empla.models.employee import Employee
+from empla.models.heartbeat import EmployeeHeartbeat
+
+logger = logging.getLogger(__name__)
+
+RunnerHealth = Literal["healthy", "stale", "crashed", "stopped", "unknown"]
+
+# Health values that count as unhealthy in status and fleet responses
+UNHEALTHY: frozenset[RunnerHealth] = frozenset({"stale", "crashed"})
+
+PHASE_STARTING = "starting"
+PHASE_IDLE = "idle"
+
+# Phase the loop enters at each hook. Reflection has no "before" hook, so
+# it starts when intention execution ends.
+_PHASES = {
+    HOOK_BEFORE_PERCEPTION: "perception",
+    HOOK_BEFORE_BELIEF_UPDATE: "belief_update",
+    HOOK_AFTER_BELIEF_UPDATE: "goal_management",
+    HOOK_BEFORE_STRATEGIC_PLANNING: "strategic_planning",
+    HOOK_AFTER_STRATEGIC_PLANNING: "goal_management",
+    HOOK_BEFORE_INTENTION_EXECUTION: "intention_execution",
+    HOOK_AFTER_INTENTION_EXECUTION: "reflection",
+}
+
+
+def summarize_tool_health(statuses: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """
+    Reduce IntegrationHealthMonitor.get_all_status() to what a heartbeat carries.
+
+    Drops error strings (they may hold credentials; the runner's /tools
+    endpoints redact and serve them on demand) and the full latency
+    histogram, keeping one small object per integration.
+    """
+    return {
+        s["name"]: {
+            "status": s.get("status"),
+            "calls": s.get("total_calls", 0),
+            "error_rate": s.get("error_rate", 0.0),
+            "p95_ms": (s.get("window") or {}).get("p95_ms"),
+        }
+        for s in statuses
+        if "name" in s
+    }
+
+
+class HeartbeatReporter:
+    """
+    Periodically upserts one runner's heartbeat row.
+
+    Not thread-safe; all calls must come from the owning event loop.
+
+    Example:
+        >>> reporter = HeartbeatReporter(sessionmaker, employee_id, tenant_id)
+        >>> reporter.register(employee.hooks)
+        >>> reporter.start()  # reports now, then every interval
+        >>> await reporter.stop()  # final report with state='stopped'
+        >>> await reporter.stop(error="RuntimeError: ...")  # state='crashed'
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        employee_id: UUID,
+        tenant_id: UUID,
+        *,
+        interval_seconds: float = 10.0,
+        health_port: int | None = None,
+        cost_source: Callable[[], float | None] | None = None,
+        tool_health_source: Callable[[], list[dict[str, Any]] | None] | None = None,
+    ) -> None:
+        """
+        Initialize HeartbeatReporter.
+
+        Args:
+            sessionmaker: Session factory for the upserts.
+            employee_id: Employee the runner executes.
+            tenant_id: Tenant the employee belongs to.
+            interval_seconds: Time between reports.
+            health_port: Runner health server port, reported for operators.
+            cost_source: Returns the runner's LLM cost so far (USD).
+            tool_health_source: Returns IntegrationHealthMonitor.get_all_status().
+        """
+        self._sessionmaker = sessionmaker
+        self.employee_id = employee_id
+        self.tenant_id = tenant_id
+        self.interval_seconds = interval_seconds
+        self.health_port = health_port
+        self._cost_source = cost_source
+        self._tool_health_source = tool_health_source
+        self.pid = os.getpid()
+        self.host = socket.gethostname()
+        self.started_at = datetime.now(UTC)
+        self._task: asyncio.Task[None] | None = None
+        self._handlers: list[tuple[str, HookHandler]] = []
+
+        # Loop state, updated by hooks
+        self.phase = PHASE_STARTING
+        self.cycle_count = 0
+        self.last_cycle_duration_seconds: float | None = None
+        self.last_cycle_success: bool | None = None
+        self.cost_usd = 0.0
+        self.tool_health: dict[str, dict[str, Any]] = {}
+
+        # Counters for observability
+        self.reports = 0
+        self.report_failures = 0
+
+    # ------------------------------------------------------------------
+    # Loop state
+    # ------------------------------------------------------------------
+
+    def register(self, hooks: HookRegistry) -> None:
+        """Follow the loop through its lifecycle hooks."""
+
+        async def on_cycle_start(cycle_count: int, **_: Any) -> None:
+            self.cycle_count = cycle_count
+            self.phase = PHASE_STARTING
+
+        async def on_cycle_end(duration_seconds: float, success: bool, **_: Any) -> None:
+            self.last_cycle_duration_seconds = round(duration_seconds, 3)
+            self.last_cycle_success = success
+            self.phase = PHASE_IDLE
+
+        def enter(phase: str) -> HookHandler:
+            async def on_phase(**_: Any) -> None:
+                self.phase = phase
+
+            return on_phase
+
+        self._handlers = [
+            (HOOK_CYCLE_START, on_cycle_start),
+            (HOOK_CYCLE_END, on_cycle_end),
+            *((event, enter(phase)) for event, phase in _PHASES.items()),
+        ]
+        for event, handler in self._handlers:
+            hooks.register(event, handler)
+
+    def unregister(self, hooks: HookRegistry) -> None:
+        """Stop following the loop."""
+        for event, handler in self._handlers:
+            hooks.unregister(event, handler)
+        self._handlers = []
+
+    def snapshot(self, state: str = "running", error: str | None = None) -> dict[str, Any]:
+        """
+        Column values for the next report (``reported_at`` is set by the database).
+
+        A source that returns None or fails keeps the last value it gave,
+        so the final report after the employee released its LLM service
+        and tool router still carries them.
+        """
+        if self._cost_source is not None:
+            try:
+                cost = self._cost_source()
+                if cost is not None:
+                    self.cost_usd = round(cost, 6)
+            except Exception:
+                logger.debug("Heartbeat cost source failed", exc_info=True)
+        if self._tool_health_source is not None:
+            try:
+                statuses = self._tool_health_source()
+                if statuses is not None:
+                    self.tool_health = summarize_tool_health(statuses)
+            except Exception:
+                logger.debug("Heartbeat tool health source failed", exc_info=True)
+        return {
+            "employee_id": self.employee_id,
+            "tenant_id": self.tenant_id,
+            "state": state,
+            "error": error,
+            "phase": self.phase,
+            "cycle_count": self.cycle_count,
+            "last_cycle_duration_seconds": self.last_cycle_duration_seconds,
+            "last_cycle_success": self.last_cycle_success,
+            "cost_usd": self.cost_usd,
+            "tool_health": self.tool_health,
+            "pid": self.pid,
+            "host": self.host,
+            "health_port": self.health_port,
+            "started_at": self.started_at,
+        }
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    async def report(self, state: str = "running", error: str | None = None) -> None:
+        """
+        Upsert this runner's heartbeat row.
+
+        Raises:
+            Exception: Database errors propagate; the background task
+                logs them and retries on the next interval.
+        """
+        values = self.snapshot(state, error)
+        stmt = pg_insert(EmployeeHeartbeat).values(**values, reported_at=func.now())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EmployeeHeartbeat.employee_id],
+            set_={
+                **{k: stmt.excluded[k] for k in values if k != "employee_id"},
+                "reported_at": func.now(),
+            },
+        )
+        try:
+            async with self._sessionmaker() as session:
+                await session.execute(stmt)
+                await session.commit()
+        except Exception:
+            self.report_failures += 1
+            raise
+        self.reports += 1
+
+    def start(self) -> None:
+        """Start reporting in the background (idempotent)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, error: str | None = None) -> None:
+        """
+        Cancel the background task and write the final report.
+
+        Args:
+            error: Why the runner is exiting if it crashed. Reported as
+                ``state='crashed'``; without it the report is a clean
+                ``state='stopped'``. Must already be redacted.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        try:
+            await self.report(state="crashed" if error else "stopped", error=error)
+        except Exception:
+            logger.warning(
+                "Final heartbeat failed; runner will show as stale",
+                exc_info=True,
+                extra={"employee_id": str(self.employee_id)},
+            )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.report()
+            except Exception:
+                logger.warning(
+                    "Heartbeat report failed",
+                    exc_info=True,
+                    extra={"employee_id": str(self.employee_id)},
+                )
+            await asyncio.sleep(self.interval_seconds)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Counters for health endpoints and tests."""
+        return {
+            "reports": self.reports,
+            "report_failures": self.report_failures,
+            "phase": self.phase,
+            "cycle_count": self.cycle_count,
+        }
+
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+
+def runtime_status_query(
+    tenant_id: UUID,
+    *,
+    stale_after_seconds: float,
+    employee_id: UUID | None = None,
+) -> Select[Employee, EmployeeHeartbeat, bool]:
+    """
+    Select a tenant's live employees with their heartbeat and staleness.
+
+    One query for the whole fleet (or one employee): the heartbeat is an
+    outer join on its primary key, and ``stale`` compares ``reported_at``
+    with the database clock. Rows come back as
+    ``(Employee, EmployeeHeartbeat | None, stale | None)``.
+    """
+    stale = EmployeeHeartbeat.reported_at < func.now() - timedelta(seconds=stale_after_seconds)
+    query = (
+        select(Employee, EmployeeHeartbeat, stale.label("stale"))
+        .outerjoin(EmployeeHeartbeat, EmployeeHeartbeat.employee_id == Employee.id)
+        .where(Employee.tenant_id == tenant_id, Employee.deleted_at.is_(None))
+    )
+    if employee_id is not None:
+        query = query.where(Employee.id == employee_id)
+    return query.order_by(Employee.name)
+
+
+def runner_health(heartbeat: EmployeeHeartbeat | None, stale: bool | None) -> RunnerHealth:
+    """
+    Classify a runner from its heartbeat.
+
+    ``unknown`` means the runner never reported and ``stopped`` that it
+    shut down cleanly. ``crashed`` means it exited on an unhandled error
+    (see ``heartbeat.error``) and ``stale`` that it stopped reporting
+    without a final report (killed, hung, or cut off from the database);
+    both are unhealthy (:data:`UNHEALTHY`).
+    """
+    if heartbeat is None:
+        return "unknown"
+    if heartbeat.state == "crashed":
+        return "crashed"
+    if heartbeat.state == "stopped":
+        return "stopped"
+    if stale:
+        return "stale"
+    return "healthy"
@@ -12,7 +12,8 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, text, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from empla.models.integration import (
@@ -464,3 +465,87 @@ class MCPIntegrationService:
             configs.append(entry)
 
         return configs
+
+
+class MCPToolCatalogStore:
+    """Stores discovered MCP tool catalogs on their Integration rows.
+
+    Implements ``ToolCatalogStore`` for the shared MCP pool so that once
+    one runner has called ``list_tools`` for a server, the tenant's other
+    runners register the same tools without opening a session at startup.
+    The catalog lives in ``oauth_config["tool_catalog"]`` next to the
+    UI-facing ``discovered_tools`` and is tied to the pool's catalog key
+    (tenant, transport, command, URL; no credentials), so every runner of
+    the tenant reads and writes the same entry and a changed command or
+    URL forces rediscovery.
+
+    ``oauth_config`` is admin-owned, so runners never write it back
+    whole: save() replaces only the ``tool_catalog`` member with one
+    ``jsonb_set`` UPDATE, leaving concurrent edits to other keys intact.
+    """
+
+    def __init__(self, session_factory: Any) -> None:
+        self._session_factory = session_factory
+
+    async def _find(self, session: AsyncSession, tenant_id: UUID, name: str) -> Integration | None:
+        result = await session.execute(
+            select(Integration).where(
+                Integration.tenant_id == tenant_id,
+                Integration.integration_type == IntegrationType.MCP,
+                Integration.deleted_at.is_(None),
+            )
+        )
+        for server in result.scalars().all():
+            if (server.oauth_config or {}).get("name", server.provider) == name:
+                return server
+        return None
+
+    async def load(
+        self, *, tenant_id: UUID | None, config: Any, key: str, max_age: float
+    ) -> list[Any] | None:
+        from empla.core.tools.mcp_pool import DiscoveredTool
+
+        if tenant_id is None:
+            return None
+        async with self._session_factory() as session:
+            server = await self._find(session, tenant_id, config.name)
+        if server is None:
+            return None
+        catalog = (server.oauth_config or {}).get("tool_catalog") or {}
+        if catalog.get("key") != key:
+            return None
+        try:
+            discovered_at = datetime.fromisoformat(catalog["discovered_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if (datetime.now(UTC) - discovered_at).total_seconds() > max_age:
+            return None
+        return [DiscoveredTool.from_dict(t) for t in catalog.get("tools", [])]
+
+    async def save(
+        self, *, tenant_id: UUID | None, config: Any, key: str, tools: list[Any]
+    ) -> None:
+        if tenant_id is None:
+            return
+        async with self._session_factory() as session:
+            server = await self._find(session, tenant_id, config.name)
+            if server is None:
+                return
+            catalog = {
+                "key": key,
+                "discovered_at": datetime.now(UTC).isoformat(),
+                "tools": [t.to_dict() for t in tools],
+            }
+            await session.execute(
+                update(Integration)
+                .where(Integration.id == server.id)
+                .values(
+                    oauth_config=func.jsonb_set(
+                        func.coalesce(Integration.oauth_config, text("'{}'::jsonb")),
+                        text("'{tool_catalog}'::text[]"),
+                        bindparam("catalog", catalog, type_=JSONB),
+                    )
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
@@ -0,0 +1,325 @@
+"""
+empla.services.live_feed - Live Row Feeds for SSE Streams
+
+The dashboard used to poll the activity feed, inbox and webhook event
+list every 15-30 seconds, re-running the list queries for every open
+browser tab even when nothing had changed. The SSE stream endpoints
+instead push new rows as they appear.
+
+LiveFeedHub does the database side once per API process, not once per
+client:
+
+- One tail per feed (table) tracks a high-water mark on ``created_at``
+  and polls for newer rows every ``poll_interval`` seconds, but only
+  while someone is subscribed. Each poll re-scans the last
+  ``overlap_seconds`` (ids only, through the ``(created_at, id)`` index)
+  and skips ids it already published, so rows from transactions that
+  committed after a later-stamped row are not lost.
+- New rows are loaded and serialized once, then offered to every
+  subscription whose tenant (and optional row predicate) matches.
+- Each subscription has a bounded queue. A client that falls that far
+  behind is flagged ``overflowed`` rather than slowing everyone else;
+  the stream tells it to resync.
+
+Every event carries a cursor over ``(created_at, id)``. A reconnecting
+client sends it back (``Last-Event-ID``) and backfill() replays the
+tenant's rows after it before live events resume. Rows whose transaction
+commits more than the overlap after they were stamped can still be missed
+by a resume; the list endpoints remain the source of truth.
+
+Example:
+    >>> hub = LiveFeedHub(sessionmaker)
+    >>> subscription = hub.subscribe(ACTIVITY_FEED, tenant_id)
+    >>> event = await subscription.queue.get()
+    >>> hub.unsubscribe(subscription)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql.elements import ColumnElement
+
+from empla.services.pagination import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+_MIN_UUID = UUID(int=0)
+
+RowPredicate = Callable[[Any], bool]
+
+
+@dataclass(frozen=True)
+class FeedSpec:
+    """A table streamed to clients.
+
+    Attributes:
+        name: Feed name; also the SSE event type and the cursor's sort name.
+        model: ORM model with ``id``, ``tenant_id`` and ``created_at``.
+        serialize: Renders one row as the event's JSON payload.
+        filters: Feed-wide WHERE clauses (e.g. not deleted).
+    """
+
+    name: str
+    model: Any
+    serialize: Callable[[Any], str]
+    filters: tuple[ColumnElement[bool], ...] = ()
+
+
+@dataclass(frozen=True)
+class FeedEvent:
+    """One serialized row, ready to send."""
+
+    id: UUID
+    cursor: str
+    data: str
+
+
+@dataclass(eq=False)
+class Subscription:
+    """One client's view of a feed.
+
+    Attributes:
+        feed: Feed name.
+        tenant_id: Only this tenant's rows are delivered.
+        match: Optional further row filter (e.g. one employee).
+        queue: Pending events, bounded.
+        overflowed: Set once an event was dropped because ``queue`` was
+            full; the client must resync.
+    """
+
+    feed: str
+    tenant_id: UUID
+    match: RowPredicate | None
+    queue: asyncio.Queue[FeedEvent]
+    overflowed: bool = False
+
+    def wants(self, row: Any) -> bool:
+        return row.tenant_id == self.tenant_id and (self.match is None or self.match(row))
+
+    def offer(self, event: FeedEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+def feed_cursor(spec: FeedSpec, row: Any) -> str:
+    """The resume cursor for a feed row."""
+    return encode_cursor(spec.name, [row.created_at, row.id])
+
+
+@dataclass
+class _FeedTail:
+    spec: FeedSpec
+    subscribers: set[Subscription] = field(default_factory=set)
+    task: asyncio.Task[None] | None = None
+    high_water: datetime | None = None
+    # Ids seen within the overlap window, with their created_at for pruning.
+    seen: dict[UUID, datetime] = field(default_factory=dict)
+
+
+class LiveFeedHub:
+    """Tails feed tables and fans new rows out to subscriptions.
+
+    Args:
+        sessionmaker: Session factory; each poll uses a short-lived session.
+        poll_interval: Seconds between polls while a feed has subscribers.
+        overlap_seconds: How far behind the high-water mark each poll
+            re-scans for late-committing rows.
+        queue_size: Events a subscription may have pending.
+        batch_size: Rows scanned per query within one poll.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        *,
+        poll_interval: float = 2.0,
+        overlap_seconds: float = 5.0,
+        queue_size: int = 1000,
+        batch_size: int = 500,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self.poll_interval = poll_interval
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self._tails: dict[str, _FeedTail] = {}
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def subscribe(
+        self, spec: FeedSpec, tenant_id: UUID, match: RowPredicate | None = None
+    ) -> Subscription:
+        """Start receiving a tenant's new rows; starts the feed's tail if idle."""
+        tail = self._tails.setdefault(spec.name, _FeedTail(spec))
+        subscription = Subscription(
+            feed=spec.name,
+            tenant_id=tenant_id,
+            match=match,
+            queue=asyncio.Queue(maxsize=self.queue_size),
+        )
+        tail.subscribers.add(subscription)
+        if tail.task is None:
+            tail.task = asyncio.create_task(self._run(tail), name=f"live-feed-{spec.name}")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering to a subscription. The tail idles once none remain."""
+        tail = self._tails.get(subscription.feed)
+        if tail is not None:
+            tail.subscribers.discard(subscription)
+
+    def subscriber_count(self, feed: str) -> int:
+        tail = self._tails.get(feed)
+        return len(tail.subscribers) if tail else 0
+
+    async def backfill(
+        self,
+        spec: FeedSpec,
+        tenant_id: UUID,
+        cursor: str,
+        *,
+        match: RowPredicate | None = None,
+        limit: int = 500,
+    ) -> tuple[list[FeedEvent], bool]:
+        """A tenant's rows after ``cursor``, oldest first.
+
+        Args:
+            spec: Feed the cursor belongs to.
+            tenant_id: Tenant to replay.
+            cursor: Cursor of the last event the client received.
+            match: Same row filter as the subscription.
+            limit: Most rows replayed.
+
+        Returns:
+            (events, truncated): ``truncated`` means more than ``limit``
+            rows followed the cursor and the client should resync instead.
+
+        Raises:
+            InvalidCursorError: ``cursor`` is malformed or from another feed.
+        """
+        created_at, row_id = decode_cursor(cursor, spec.name, 2)
+        model = spec.model
+        async with self._sessionmaker() as session:
+            result = await session.execute(
+                select(model)
+                .where(
+                    model.tenant_id == tenant_id,
+                    *spec.filters,
+                    tuple_(model.created_at, model.id) > tuple_(created_at, row_id),
+                )
+                .order_by(model.created_at, model.id)
+                .limit(limit + 1)
+            )
+            rows = list(result.scalars().all())
+        truncated = len(rows) > limit
+        events = [
+            FeedEvent(id=row.id, cursor=feed_cursor(spec, row), data=spec.serialize(row))
+            for row in rows[:limit]
+            if match is None or match(row)
+        ]
+        return events, truncated
+
+    async def close(self) -> None:
+        """Stop all tails (API shutdown)."""
+        tasks = [t.task for t in self._tails.values() if t.task is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tails.clear()
+
+    # ------------------------------------------------------------------
+    # Tailing
+    # ------------------------------------------------------------------
+
+    async def _run(self, tail: _FeedTail) -> None:
+        try:
+            # Start from the database clock, and mark the rows already in the
+            # overlap window as seen so new subscribers only get new rows.
+            async with self._sessionmaker() as session:
+                tail.high_water = (await session.execute(select(func.now()))).scalar_one()
+            tail.seen.clear()
+            await self._poll(tail, publish=False)
+            while tail.subscribers:
+                await asyncio.sleep(self.poll_interval)
+                try:
+                    await self._poll(tail)
+                except Exception:
+                    logger.warning(
+                        "Live feed poll failed",
+                        exc_info=True,
+                        extra={"feed": tail.spec.name},
+                    )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Live feed tail stopped", exc_info=True, extra={"feed": tail.spec.name})
+        finally:
+            tail.task = None
+
+    async def _poll(self, tail: _FeedTail, *, publish: bool = True) -> None:
+        """Scan the overlap window onward and publish rows not seen before."""
+        if tail.high_water is None:
+            return
+        model = tail.spec.model
+        position: tuple[datetime, UUID] = (tail.high_water - self.overlap, _MIN_UUID)
+        async with self._sessionmaker() as session:
+            while True:
+                # Ids only: the re-scanned window is mostly rows already sent.
+                refs = (
+                    await session.execute(
+                        select(model.id, model.created_at)
+                        .where(
+                            *tail.spec.filters,
+                            tuple_(model.created_at, model.id) > tuple_(*position),
+                        )
+                        .order_by(model.created_at, model.id)
+                        .limit(self.batch_size)
+                    )
+                ).all()
+                new_ids = [ref.id for ref in refs if ref.id not in tail.seen]
+                for ref in refs:
+                    tail.seen[ref.id] = ref.created_at
+                    tail.high_water = max(tail.high_water, ref.created_at)
+                if new_ids and publish:
+                    rows = await self._load(session, tail.spec, new_ids)
+                    self._publish(tail, rows)
+                if len(refs) < self.batch_size:
+                    break
+                position = (refs[-1].created_at, refs[-1].id)
+
+        horizon = tail.high_water - self.overlap
+        tail.seen = {i: t for i, t in tail.seen.items() if t >= horizon}
+
+    async def _load(self, session: AsyncSession, spec: FeedSpec, ids: Sequence[UUID]) -> list[Any]:
+        model = spec.model
+        result = await session.execute(
+            select(model).where(model.id.in_(ids)).order_by(model.created_at, model.id)
+        )
+        return list(result.scalars().all())
+
+    def _publish(self, tail: _FeedTail, rows: Sequence[Any]) -> None:
+        for row in rows:
+            targets = [s for s in tail.subscribers if s.wants(row)]
+            if not targets:
+                continue
+            event = FeedEvent(
+                id=row.id, cursor=feed_cursor(tail.spec, row), data=tail.spec.serialize(row)
+            )
+            for subscription in targets:
+                subscription.offer(event)
@@ -0,0 +1,508 @@
+"""
+empla.services.metric_rollups - Metric Rollups
+
+Every BDI cycle writes several Metric rows per employee, and the metrics
+endpoints used to aggregate those raw rows on every request (five
+aggregate queries for one summary; up to a week of rows for a chart).
+
+MetricRollupJob pre-aggregates them into MetricRollup rows per (tenant,
+employee, metric_name):
+
+- **1-minute buckets** from raw rows: count, sum, min, max and, for
+  histogram metrics, a log-bucketed sketch (see sketch_key()).
+- **1-hour buckets** from the minute buckets (sketches merge by adding
+  counts).
+
+Each pass re-aggregates everything after the previous pass's last minute
+(minus ``reprocess_minutes`` for rows that committed late) up to the last
+completed minute, so buckets are upserted idempotently and a job that was
+down catches up in ``chunk_hours`` steps. It then applies retention: raw
+rows older than ``raw_retention_days`` (never rows not yet rolled up) and
+minute rollups older than ``minute_retention_days``. Hour rollups are kept.
+
+Readers combine rollups up to the job's watermark with raw rows after it
+(metric_points()), so results stay current between passes and are exact
+when the job has never run. A window's start is rounded down to the
+bucket width.
+
+Run it as a worker via ``python -m empla.cli metrics rollup
+--interval-seconds 60``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Subquery, cast, delete, func, literal, null, select, text, union_all
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql.elements import ColumnElement
+
+from empla.models.audit import Metric, MetricRollup
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 3600
+
+# Relative accuracy of sketch quantiles: every value in bucket k lies in
+# (gamma^(k-1), gamma^k], and the bucket is reported as the point within
+# 2% of both ends.
+SKETCH_ACCURACY = 0.02
+SKETCH_GAMMA = (1 + SKETCH_ACCURACY) / (1 - SKETCH_ACCURACY)
+# Bucket for values <= 0 (log buckets only cover positive values).
+SKETCH_ZERO_KEY = "z"
+
+
+# ============================================================================
+# Sketches
+# ============================================================================
+
+
+def sketch_key(value: float) -> str:
+    """The sketch bucket of one value. Must match the SQL in _MINUTE_ROLLUP_SQL."""
+    if value <= 0:
+        return SKETCH_ZERO_KEY
+    return str(math.ceil(math.log(value) / math.log(SKETCH_GAMMA)))
+
+
+def merge_sketches(sketches: Iterable[Mapping[str, int] | None]) -> dict[str, int]:
+    """Combine sketches (bucket counts add up)."""
+    merged: dict[str, int] = {}
+    for sketch in sketches:
+        for key, count in (sketch or {}).items():
+            merged[key] = merged.get(key, 0) + int(count)
+    return merged
+
+
+def sketch_quantile(sketch: Mapping[str, int], q: float) -> float | None:
+    """Estimate the ``q`` quantile (0..1) of the values in a sketch.
+
+    Returns:
+        A value within SKETCH_ACCURACY of the true quantile (0.0 for the
+        non-positive bucket), or None for an empty sketch.
+    """
+    total = sum(sketch.values())
+    if total == 0:
+        return None
+    rank = q * (total - 1)
+    keys = sorted(sketch, key=lambda k: -math.inf if k == SKETCH_ZERO_KEY else int(k))
+    seen = 0
+    for key in keys:
+        seen += sketch[key]
+        if seen > rank:
+            break
+    if key == SKETCH_ZERO_KEY:
+        return 0.0
+    return 2 * SKETCH_GAMMA ** int(key) / (SKETCH_GAMMA + 1)
+
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+
+def summary_resolution(hours: int) -> int:
+    """Coarsest bucket for a summary window: hours once the window spans a day."""
+    return HOUR if hours >= 24 else MINUTE
+
+
+def history_resolution(hours: int) -> int:
+    """Chart buckets: minutes up to 6 hours (<= 360 points), hours beyond."""
+    return MINUTE if hours <= 6 else HOUR
+
+
+def bucket_floor(moment: datetime, resolution: int) -> datetime:
+    """Start of the ``resolution``-second bucket containing ``moment``."""
+    epoch = int(moment.timestamp()) // resolution * resolution
+    return datetime.fromtimestamp(epoch, UTC)
+
+
+def rolled_up_until() -> ColumnElement[Any]:
+    """End of the last minute the rollup job has aggregated (NULL if none).
+
+    Raw rows before it are covered by the rollups; rows at or after it are
+    not yet.
+    """
+    return (
+        select(func.max(MetricRollup.bucket_start) + timedelta(seconds=MINUTE))
+        .where(MetricRollup.resolution_seconds == MINUTE)
+        .scalar_subquery()
+    )
+
+
+def metric_points(
+    tenant_id: UUID,
+    employee_id: UUID,
+    metric_names: Sequence[str],
+    since: datetime,
+    resolution: int,
+    *,
+    with_histogram: bool = False,
+) -> Subquery:
+    """Rollup buckets up to the watermark plus raw rows after it.
+
+    Columns: ``metric_name``, ``metric_type``, ``at`` (bucket start or raw
+    timestamp), ``n``, ``total``, ``lo``, ``hi`` and, with
+    ``with_histogram``, ``histogram`` (NULL for raw rows). A raw row is a
+    point with n=1 and total=lo=hi=value, so callers aggregate both kinds
+    the same way.
+    """
+    watermark = rolled_up_until()
+    rolled_cols = [
+        MetricRollup.metric_name,
+        MetricRollup.metric_type,
+        MetricRollup.bucket_start.label("at"),
+        MetricRollup.sample_count.label("n"),
+        MetricRollup.value_sum.label("total"),
+        MetricRollup.value_min.label("lo"),
+        MetricRollup.value_max.label("hi"),
+    ]
+    raw_cols = [
+        Metric.metric_name,
+        Metric.metric_type,
+        Metric.timestamp.label("at"),
+        literal(1).label("n"),
+        Metric.value.label("total"),
+        Metric.value.label("lo"),
+        Metric.value.label("hi"),
+    ]
+    if with_histogram:
+        rolled_cols.append(MetricRollup.histogram)
+        raw_cols.append(cast(null(), JSONB).label("histogram"))
+
+    rolled = select(*rolled_cols).where(
+        MetricRollup.tenant_id == tenant_id,
+        MetricRollup.employee_id == employee_id,
+        MetricRollup.resolution_seconds == resolution,
+        MetricRollup.metric_name.in_(metric_names),
+        MetricRollup.bucket_start >= bucket_floor(since, resolution),
+        MetricRollup.bucket_start < watermark,
+    )
+    raw = select(*raw_cols).where(
+        Metric.tenant_id == tenant_id,
+        Metric.employee_id == employee_id,
+        Metric.metric_name.in_(metric_names),
+        Metric.timestamp >= since,
+        Metric.timestamp >= func.coalesce(watermark, since),
+        Metric.deleted_at.is_(None),
+    )
+    return union_all(rolled, raw).subquery("points")
+
+
+@dataclass
+class Bucket:
+    """One merged chart bucket."""
+
+    start: datetime
+    metric_type: str
+    count: int = 0
+    total: float = 0.0
+    low: float = math.inf
+    high: float = -math.inf
+    sketch: dict[str, int] | None = None
+
+    @property
+    def value(self) -> float:
+        """Sum for counters, mean otherwise."""
+        if self.metric_type == "counter":
+            return self.total
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float | None:
+        return sketch_quantile(self.sketch, q) if self.sketch else None
+
+
+def merge_points(rows: Iterable[Any], resolution: int) -> list[Bucket]:
+    """Fold metric_points(with_histogram=True) rows into buckets, newest first.
+
+    Raw rows after the watermark share a bucket with the (partial) rollup
+    for the same period and are merged into it, sketch included.
+    """
+    buckets: dict[datetime, Bucket] = {}
+    for row in rows:
+        start = bucket_floor(row.at, resolution)
+        bucket = buckets.get(start)
+        if bucket is None:
+            bucket = buckets[start] = Bucket(start=start, metric_type=row.metric_type)
+        bucket.count += row.n
+        bucket.total += row.total
+        bucket.low = min(bucket.low, row.lo)
+        bucket.high = max(bucket.high, row.hi)
+        if row.metric_type == "histogram":
+            sketch = row.histogram if row.histogram is not None else {sketch_key(row.total): 1}
+            bucket.sketch = merge_sketches([bucket.sketch, sketch])
+    return sorted(buckets.values(), key=lambda b: b.start, reverse=True)
+
+
+# ============================================================================
+# Rollup job
+# ============================================================================
+
+_UPSERT = """
+ON CONFLICT (employee_id, resolution_seconds, metric_name, bucket_start, tenant_id)
+DO UPDATE SET metric_type = EXCLUDED.metric_type,
+              sample_count = EXCLUDED.sample_count,
+              value_sum = EXCLUDED.value_sum,
+              value_min = EXCLUDED.value_min,
+              value_max = EXCLUDED.value_max,
+              histogram = EXCLUDED.histogram,
+              updated_at = now()
+"""
+
+_INSERT = """
+INSERT INTO metric_rollups
+    (id, tenant_id, employee_id, metric_name, metric_type, resolution_seconds,
+     bucket_start, sample_count, value_sum, value_min, value_max, histogram)
+"""
+
+# Raw rows -> minute buckets. The sketch key expression must match
+# sketch_key().
+_MINUTE_ROLLUP_SQL = (
+    """
+WITH raw AS (
+    SELECT tenant_id, employee_id, metric_name, metric_type, value,
+           date_trunc('minute', "timestamp") AS bucket_start,
+           CASE WHEN value > 0 THEN CEIL(LN(value) / :ln_gamma)::int::text
+                ELSE 'z' END AS sketch_key
+    FROM metrics
+    WHERE "timestamp" >= :start AND "timestamp" < :end
+      AND employee_id IS NOT NULL AND deleted_at IS NULL
+),
+sketches AS (
+    SELECT tenant_id, employee_id, metric_name, bucket_start,
+           jsonb_object_agg(sketch_key, n) AS histogram
+    FROM (
+        SELECT tenant_id, employee_id, metric_name, bucket_start, sketch_key,
+               count(*) AS n
+        FROM raw WHERE metric_type = 'histogram'
+        GROUP BY tenant_id, employee_id, metric_name, bucket_start, sketch_key
+    ) AS keyed
+    GROUP BY tenant_id, employee_id, metric_name, bucket_start
+)
+"""
+    + _INSERT
+    + """
+SELECT gen_random_uuid(), a.tenant_id, a.employee_id, a.metric_name, a.metric_type,
+       60, a.bucket_start, a.n, a.total, a.lo, a.hi, s.histogram
+FROM (
+    SELECT tenant_id, employee_id, metric_name, max(metric_type) AS metric_type,
+           bucket_start, count(*) AS n, sum(value) AS total, min(value) AS lo,
+           max(value) AS hi
+    FROM raw
+    GROUP BY tenant_id, employee_id, metric_name, bucket_start
+) AS a
+LEFT JOIN sketches AS s USING (tenant_id, employee_id, metric_name, bucket_start)
+"""
+    + _UPSERT
+)
+
+# Minute buckets -> hour buckets, for every hour touched by [:start, :end).
+_HOUR_ROLLUP_SQL = (
+    """
+WITH minutes AS (
+    SELECT tenant_id, employee_id, metric_name, metric_type, sample_count,
+           value_sum, value_min, value_max, histogram,
+           date_trunc('hour', bucket_start) AS bucket_start
+    FROM metric_rollups
+    WHERE resolution_seconds = 60
+      AND bucket_start >= date_trunc('hour', CAST(:start AS timestamptz))
+      AND bucket_start < :end
+),
+sketches AS (
+    SELECT tenant_id, employee_id, metric_name, bucket_start,
+           jsonb_object_agg(sketch_key, n) AS histogram
+    FROM (
+        SELECT m.tenant_id, m.employee_id, m.metric_name, m.bucket_start,
+               h.key AS sketch_key, sum(h.value::bigint) AS n
+        FROM minutes AS m CROSS JOIN LATERAL jsonb_each_text(m.histogram) AS h
+        GROUP BY m.tenant_id, m.employee_id, m.metric_name, m.bucket_start, h.key
+    ) AS keyed
+    GROUP BY tenant_id, employee_id, metric_name, bucket_start
+)
+"""
+    + _INSERT
+    + """
+SELECT gen_random_uuid(), a.tenant_id, a.employee_id, a.metric_name, a.metric_type,
+       3600, a.bucket_start, a.n, a.total, a.lo, a.hi, s.histogram
+FROM (
+    SELECT tenant_id, employee_id, metric_name, max(metric_type) AS metric_type,
+           bucket_start, sum(sample_count) AS n, sum(value_sum) AS total,
+           min(value_min) AS lo, max(value_max) AS hi
+    FROM minutes
+    GROUP BY tenant_id, employee_id, metric_name, bucket_start
+) AS a
+LEFT JOIN sketches AS s USING (tenant_id, employee_id, metric_name, bucket_start)
+"""
+    + _UPSERT
+)
+
+
+@dataclass
+class RollupReport:
+    """Outcome of one rollup pass."""
+
+    start: datetime | None = None
+    end: datetime | None = None
+    chunks: int = 0
+    minute_buckets: int = 0
+    hour_buckets: int = 0
+    raw_rows_deleted: int = 0
+    minute_rollups_deleted: int = 0
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "chunks": self.chunks,
+            "minute_buckets": self.minute_buckets,
+            "hour_buckets": self.hour_buckets,
+            "raw_rows_deleted": self.raw_rows_deleted,
+            "minute_rollups_deleted": self.minute_rollups_deleted,
+            "duration_ms": round(self.duration_ms, 2),
+        }
+
+
+class MetricRollupJob:
+    """Aggregates raw metrics into minute and hour rollups, then prunes.
+
+    Each chunk (minute upsert + hour upsert) and each retention batch is
+    its own session and commit. Safe to run concurrently with itself (the
+    upserts are idempotent), though one worker is enough.
+
+    Args:
+        sessionmaker: Session factory; one session per chunk.
+        raw_retention_days: Delete raw metric rows older than this
+            (0 keeps them forever).
+        minute_retention_days: Delete minute rollups older than this.
+        reprocess_minutes: How far before the last aggregated minute each
+            pass starts again, for rows that committed late.
+        chunk_hours: Time span aggregated per transaction while catching up.
+        delete_batch_size: Rows deleted per retention statement.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        *,
+        raw_retention_days: int = 30,
+        minute_retention_days: int = 30,
+        reprocess_minutes: int = 5,
+        chunk_hours: int = 6,
+        delete_batch_size: int = 5000,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self.raw_retention = timedelta(days=raw_retention_days) if raw_retention_days else None
+        self.minute_retention = timedelta(days=minute_retention_days)
+        self.reprocess = timedelta(minutes=reprocess_minutes)
+        self.chunk = timedelta(hours=chunk_hours)
+        self.delete_batch_size = delete_batch_size
+
+    async def run(self) -> RollupReport:
+        """Run one pass: aggregate up to the last completed minute, then prune."""
+        report = RollupReport()
+        started = time.perf_counter()
+
+        async with self._sessionmaker() as session:
+            now = (await session.execute(select(func.now()))).scalar_one()
+            last_minute = (
+                await session.execute(
+                    select(func.max(MetricRollup.bucket_start)).where(
+                        MetricRollup.resolution_seconds == MINUTE
+                    )
+                )
+            ).scalar()
+            if last_minute is None:
+                first_raw = (
+                    await session.execute(
+                        select(func.min(Metric.timestamp)).where(
+                            Metric.employee_id.is_not(None), Metric.deleted_at.is_(None)
+                        )
+                    )
+                ).scalar()
+            else:
+                first_raw = None
+
+        end = bucket_floor(now, MINUTE)
+        if last_minute is not None:
+            start = last_minute + timedelta(seconds=MINUTE) - self.reprocess
+        elif first_raw is not None:
+            start = bucket_floor(first_raw, MINUTE)
+        else:
+            start = end
+        report.start, report.end = start, end
+
+        chunk_start = start
+        while chunk_start < end:
+            chunk_end = min(chunk_start + self.chunk, end)
+            params = {
+                "start": chunk_start,
+                "end": chunk_end,
+                "ln_gamma": math.log(SKETCH_GAMMA),
+            }
+            async with self._sessionmaker() as session:
+                minutes = await session.execute(text(_MINUTE_ROLLUP_SQL), params)
+                hours = await session.execute(
+                    text(_HOUR_ROLLUP_SQL), {"start": chunk_start, "end": chunk_end}
+                )
+                await session.commit()
+            report.chunks += 1
+            report.minute_buckets += minutes.rowcount or 0
+            report.hour_buckets += hours.rowcount or 0
+            chunk_start = chunk_end
+
+        await self._apply_retention(now, end, report)
+        report.duration_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            "Metric rollup pass complete",
+            extra={k: v for k, v in report.to_dict().items() if k not in ("start", "end")},
+        )
+        return report
+
+    async def _apply_retention(
+        self, now: datetime, rolled_to: datetime, report: RollupReport
+    ) -> None:
+        if self.raw_retention is not None:
+            # Never delete raw rows the rollups do not cover yet.
+            cutoff = min(now - self.raw_retention, rolled_to)
+            report.raw_rows_deleted = await self._delete_batches(
+                select(Metric.id).where(Metric.timestamp < cutoff), Metric
+            )
+
+        # Whole hours only, and always below the watermark row, so the
+        # latest minute bucket (the watermark) survives idle periods.
+        cutoff = min(bucket_floor(now - self.minute_retention, HOUR), bucket_floor(rolled_to, HOUR))
+        report.minute_rollups_deleted = await self._delete_batches(
+            select(MetricRollup.id).where(
+                MetricRollup.resolution_seconds == MINUTE,
+                MetricRollup.bucket_start < cutoff,
+                MetricRollup.bucket_start
+                < select(func.max(MetricRollup.bucket_start))
+                .where(MetricRollup.resolution_seconds == MINUTE)
+                .scalar_subquery(),
+            ),
+            MetricRollup,
+        )
+
+    async def _delete_batches(self, ids: Any, model: Any) -> int:
+        deleted = 0
+        while True:
+            async with self._sessionmaker() as session:
+                result = await session.execute(
+                    delete(model).where(
+                        model.id.in_(ids.limit(self.delete_batch_size).scalar_subquery())
+                    )
+                )
+                await session.commit()
+            count = result.rowcount or 0
+            deleted += count
+            if count < self.delete_batch_size:
+                return deleted
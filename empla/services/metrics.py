@@ -2,7 +2,9 @@
 empla.services.metrics - Cycle Metrics Recording
 
 Records per-cycle performance metrics to the Metric table for dashboard
-visibility. Wired into the BDI loop via _record_cycle_metrics().
+visibility. Wired into the BDI loop via _record_cycle_metrics(), which
+hands the rows from build_cycle_metrics() to a buffered MetricsSink
+(empla.services.metrics_sink) when the employee has one.
 
 Metrics recorded per cycle:
   cycle.duration_seconds    — histogram — wall-clock time for the cycle
@@ -10,6 +12,12 @@ Metrics recorded per cycle:
   tool.calls_total          — counter   — tool calls this cycle (delta, not cumulative)
   tool.calls_failed         — counter   — failed tool calls this cycle (delta)
   tool.latency_sum_ms       — counter   — total tool latency this cycle (for weighted avg)
+
+Per integration provider with outbound HTTP activity (tags: provider):
+  integration.http.queue_depth  — gauge   — requests queued in the scheduler at cycle end
+  integration.http.wait_ms_avg  — gauge   — mean queue wait this cycle
+  integration.http.wait_ms_max  — gauge   — worst queue wait this cycle
+  integration.http.throttled    — counter — 429/503 responses this cycle
 """
 
 from __future__ import annotations
@@ -73,6 +81,102 @@ def _compute_tool_deltas(
     return deltas, new_snapshot
 
 
+def build_cycle_metrics(
+    *,
+    tenant_id: UUID,
+    employee_id: UUID,
+    cycle_count: int,
+    duration_seconds: float,
+    success: bool,
+    tool_stats: list[dict[str, Any]] | None = None,
+    llm_cost_usd: float | None = None,
+    llm_input_tokens: int | None = None,
+    llm_output_tokens: int | None = None,
+    http_stats: dict[str, dict[str, float]] | None = None,
+    tool_latency: list[dict[str, Any]] | None = None,
+) -> tuple[list[dict[str, Any]], dict[str, float] | None]:
+    """Build the Metric column values for a completed BDI cycle.
+
+    One row per metric name, so the dashboard can query and aggregate by
+    metric_name + time range. Pure: nothing is written, which lets the
+    loop hand the rows to a MetricsSink instead of an ORM session.
+
+    Args: see record_cycle_metrics().
+
+    Returns:
+        (rows, snapshot): column dicts for ``Metric(**row)`` or a bulk
+        insert, and the new tool stats snapshot (None without tool stats)
+        to persist in _previous_tool_stats once the rows are accepted.
+    """
+    rows: list[dict[str, Any]] = []
+
+    def add(name: str, metric_type: str, value: float, **tags: Any) -> None:
+        rows.append(
+            {
+                "tenant_id": tenant_id,
+                "employee_id": employee_id,
+                "metric_name": name,
+                "metric_type": metric_type,
+                "value": value,
+                "tags": {"cycle": cycle_count, **tags},
+            }
+        )
+
+    add("cycle.duration_seconds", "histogram", round(duration_seconds, 3))
+    add("cycle.success", "gauge", 1.0 if success else 0.0)
+
+    # Tool call stats — compute per-cycle deltas from cumulative counters
+    new_snapshot = None
+    if tool_stats:
+        deltas, new_snapshot = _compute_tool_deltas(employee_id, tool_stats)
+        add("tool.calls_total", "counter", deltas["total"])
+        add("tool.calls_failed", "counter", deltas["failed"])
+        add("tool.latency_sum_ms", "counter", deltas["latency_sum"])
+
+    # Recent latency percentiles and error rate — gauges over the monitor's
+    # sliding window, per integration and per tool. Idle entries are skipped.
+    windows = [("integration", s.get("name"), s.get("window")) for s in tool_stats or []]
+    windows += [("tool", s.get("name"), s.get("window")) for s in tool_latency or []]
+    for tag, name, window in windows:
+        if not window or not window.get("calls"):
+            continue
+        for metric, key in (
+            ("latency_p50_ms", "p50_ms"),
+            ("latency_p95_ms", "p95_ms"),
+            ("latency_p99_ms", "p99_ms"),
+            ("error_rate", "error_rate"),
+        ):
+            add(f"tool.{metric}", "gauge", float(window.get(key, 0.0)), **{tag: name})
+
+    # LLM cost metrics
+    if llm_cost_usd is not None and llm_cost_usd > 0:
+        add("llm.cost_usd", "counter", round(llm_cost_usd, 6))
+    if llm_input_tokens is not None and llm_input_tokens > 0:
+        add("llm.input_tokens", "counter", float(llm_input_tokens))
+    if llm_output_tokens is not None and llm_output_tokens > 0:
+        add("llm.output_tokens", "counter", float(llm_output_tokens))
+
+    # Outbound integration request queue — providers with no traffic and
+    # nothing queued are skipped to keep the table quiet.
+    for provider, stats in (http_stats or {}).items():
+        if not stats.get("requests") and not stats.get("queue_depth"):
+            continue
+        for name, metric_type in (
+            ("queue_depth", "gauge"),
+            ("wait_ms_avg", "gauge"),
+            ("wait_ms_max", "gauge"),
+            ("throttled", "counter"),
+        ):
+            add(
+                f"integration.http.{name}",
+                metric_type,
+                float(stats.get(name, 0.0)),
+                provider=provider,
+            )
+
+    return rows, new_snapshot
+
+
 async def record_cycle_metrics(
     db: AsyncSession,
     *,
@@ -85,11 +189,14 @@ async def record_cycle_metrics(
     llm_cost_usd: float | None = None,
     llm_input_tokens: int | None = None,
     llm_output_tokens: int | None = None,
+    http_stats: dict[str, dict[str, float]] | None = None,
+    tool_latency: list[dict[str, Any]] | None = None,
 ) -> dict[str, float] | None:
-    """Record metrics for a completed BDI cycle.
+    """Record metrics for a completed BDI cycle on a session.
 
-    Creates multiple Metric rows — one per metric name — so the dashboard
-    can query and aggregate by metric_name + time range.
+    Adds the rows from build_cycle_metrics() as Metric objects and
+    flushes. The loop normally buffers through a MetricsSink instead;
+    this is the direct path for callers without one.
 
     Args:
         db: Async database session (caller commits).
@@ -102,100 +209,31 @@ async def record_cycle_metrics(
         llm_cost_usd: LLM cost for this cycle in USD (from LLMRouter budget tracking).
         llm_input_tokens: Total input tokens consumed this cycle.
         llm_output_tokens: Total output tokens consumed this cycle.
+        http_stats: Per-provider outbound request stats from
+            ``empla.integrations.http.collect_request_stats()``.
+        tool_latency: Optional per-tool sliding-window stats from
+            IntegrationHealthMonitor.get_all_tool_status().
 
     Returns:
         New tool stats snapshot to persist in _previous_tool_stats (caller
         should assign only after successful commit), or None if no tool stats.
     """
-    metrics = [
-        Metric(
-            tenant_id=tenant_id,
-            employee_id=employee_id,
-            metric_name="cycle.duration_seconds",
-            metric_type="histogram",
-            value=round(duration_seconds, 3),
-            tags={"cycle": cycle_count},
-        ),
-        Metric(
-            tenant_id=tenant_id,
-            employee_id=employee_id,
-            metric_name="cycle.success",
-            metric_type="gauge",
-            value=1.0 if success else 0.0,
-            tags={"cycle": cycle_count},
-        ),
-    ]
-
-    # Tool call stats — compute per-cycle deltas from cumulative counters
-    new_snapshot = None
-    if tool_stats:
-        deltas, new_snapshot = _compute_tool_deltas(employee_id, tool_stats)
-        metrics.extend(
-            [
-                Metric(
-                    tenant_id=tenant_id,
-                    employee_id=employee_id,
-                    metric_name="tool.calls_total",
-                    metric_type="counter",
-                    value=deltas["total"],
-                    tags={"cycle": cycle_count},
-                ),
-                Metric(
-                    tenant_id=tenant_id,
-                    employee_id=employee_id,
-                    metric_name="tool.calls_failed",
-                    metric_type="counter",
-                    value=deltas["failed"],
-                    tags={"cycle": cycle_count},
-                ),
-                Metric(
-                    tenant_id=tenant_id,
-                    employee_id=employee_id,
-                    metric_name="tool.latency_sum_ms",
-                    metric_type="counter",
-                    value=deltas["latency_sum"],
-                    tags={"cycle": cycle_count},
-                ),
-            ]
-        )
-
-    # LLM cost metrics
-    if llm_cost_usd is not None and llm_cost_usd > 0:
-        metrics.append(
-            Metric(
-                tenant_id=tenant_id,
-                employee_id=employee_id,
-                metric_name="llm.cost_usd",
-                metric_type="counter",
-                value=round(llm_cost_usd, 6),
-                tags={"cycle": cycle_count},
-            )
-        )
-    if llm_input_tokens is not None and llm_input_tokens > 0:
-        metrics.append(
-            Metric(
-                tenant_id=tenant_id,
-                employee_id=employee_id,
-                metric_name="llm.input_tokens",
-                metric_type="counter",
-                value=float(llm_input_tokens),
-                tags={"cycle": cycle_count},
-            )
-        )
-    if llm_output_tokens is not None and llm_output_tokens > 0:
-        metrics.append(
-            Metric(
-                tenant_id=tenant_id,
-                employee_id=employee_id,
-                metric_name="llm.output_tokens",
-                metric_type="counter",
-                value=float(llm_output_tokens),
-                tags={"cycle": cycle_count},
-            )
-        )
+    rows, new_snapshot = build_cycle_metrics(
+        tenant_id=tenant_id,
+        employee_id=employee_id,
+        cycle_count=cycle_count,
+        duration_seconds=duration_seconds,
+        success=success,
+        tool_stats=tool_stats,
+        llm_cost_usd=llm_cost_usd,
+        llm_input_tokens=llm_input_tokens,
+        llm_output_tokens=llm_output_tokens,
+        http_stats=http_stats,
+        tool_latency=tool_latency,
+    )
 
-    for m in metrics:
-        db.add(m)
+    for row in rows:
+        db.add(Metric(**row))
 
     try:
         await db.flush()
@@ -0,0 +1,322 @@
+"""
+empla.services.metrics_sink - Buffered Metric Writes
+
+Each BDI cycle used to open a session, add its metric rows as ORM objects
+and commit before the loop could sleep: one small transaction per cycle
+per employee, with unit-of-work overhead on the cycle's critical path.
+
+MetricsSink decouples the two:
+
+- The loop calls :meth:`MetricsSink.submit` with plain column dicts
+  (``build_cycle_metrics``). Rows are stamped with their id and timestamp
+  on submit, so buffering does not shift them in time.
+- A background task writes the buffer when it reaches ``flush_rows`` or
+  every ``flush_interval_seconds``, whichever comes first: one ``COPY``
+  through asyncpg, or a multi-row INSERT on other drivers.
+- The buffer is bounded. When it is full, submit waits up to
+  ``backpressure_timeout_seconds`` for a flush to make room, then drops
+  the rows and counts them. A failed flush re-queues its batch, dropping
+  (and counting) the oldest rows beyond the bound.
+- :meth:`stop` lets a flush already in progress finish (it is never
+  cancelled mid-write), then flushes the rest synchronously, so shutdown
+  loses nothing the database will accept.
+
+Rows are not tied to one employee or tenant, so a single sink can serve
+every employee in a process. Readers that must not lag the buffer (the
+cost hard-stop) add :meth:`pending_sum` to what they read from the table.
+The flush interval must stay well below the rollup job's re-process
+window (``empla metrics rollup --reprocess-minutes``), or late rows would
+miss their minute bucket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from empla.models.audit import Metric
+
+logger = logging.getLogger(__name__)
+
+# Columns written by a flush, in COPY order. deleted_at keeps its default.
+COLUMNS = (
+    "id",
+    "tenant_id",
+    "employee_id",
+    "metric_name",
+    "metric_type",
+    "value",
+    "tags",
+    "timestamp",
+    "created_at",
+    "updated_at",
+)
+
+
+class MetricsSink:
+    """
+    In-process buffer of Metric rows, written in bulk.
+
+    Not thread-safe; all calls must come from the owning event loop.
+
+    Example:
+        >>> sink = MetricsSink(sessionmaker, flush_interval_seconds=5)
+        >>> sink.start()
+        >>> rows, _ = build_cycle_metrics(tenant_id=..., employee_id=..., ...)
+        >>> await sink.submit(rows)  # no SQL
+        >>> await sink.stop()  # final flush
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        flush_interval_seconds: float = 5.0,
+        flush_rows: int = 500,
+        max_pending: int = 20_000,
+        backpressure_timeout_seconds: float = 1.0,
+    ) -> None:
+        """
+        Initialize MetricsSink.
+
+        Args:
+            sessionmaker: Session factory for flushes.
+            flush_interval_seconds: Longest a row waits in the buffer.
+            flush_rows: Buffered rows that trigger an early flush.
+            max_pending: Most rows buffered before submit applies
+                backpressure and then drops.
+            backpressure_timeout_seconds: How long submit waits for room
+                in a full buffer before dropping.
+        """
+        self._sessionmaker = sessionmaker
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_rows = flush_rows
+        self.max_pending = max_pending
+        self.backpressure_timeout_seconds = backpressure_timeout_seconds
+        self._pending: list[dict[str, Any]] = []
+        # Batch being written; still counted by pending_sum().
+        self._inflight: list[dict[str, Any]] = []
+        self._task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._room = asyncio.Event()
+        self._stopping = False
+
+        # Counters for observability
+        self.submitted = 0
+        self.flushed_rows = 0
+        self.flushes = 0
+        self.dropped = 0
+        self.flush_failures = 0
+
+    # ------------------------------------------------------------------
+    # Submitting
+    # ------------------------------------------------------------------
+
+    @property
+    def pending_count(self) -> int:
+        """Rows buffered and not yet written."""
+        return len(self._pending)
+
+    async def submit(self, rows: Iterable[dict[str, Any]]) -> bool:
+        """Buffer metric rows for the next flush.
+
+        Args:
+            rows: Metric column values (``tenant_id``, ``employee_id``,
+                ``metric_name``, ``metric_type``, ``value``, ``tags``).
+
+        Returns:
+            True if the rows were buffered; False if they were dropped
+            because the buffer stayed full for the backpressure timeout.
+        """
+        now = datetime.now(UTC)
+        batch = [
+            {
+                "id": uuid4(),
+                "timestamp": now,
+                "created_at": now,
+                "updated_at": now,
+                **row,
+                "tags": row.get("tags") or {},
+            }
+            for row in rows
+        ]
+        if not batch:
+            return True
+
+        if not self._has_room(len(batch)) and self._task is not None:
+            # Backpressure: the flusher is behind, so give it a bounded
+            # chance to drain before giving up on these rows.
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._wait_for_room(len(batch)), self.backpressure_timeout_seconds
+                )
+        if not self._has_room(len(batch)):
+            self.dropped += len(batch)
+            logger.warning(
+                "Metrics buffer full; dropped %d rows",
+                len(batch),
+                extra={"pending": self.pending_count, "dropped_total": self.dropped},
+            )
+            return False
+
+        self._pending.extend(batch)
+        self.submitted += len(batch)
+        if len(self._pending) >= self.flush_rows:
+            self._wake.set()
+        return True
+
+    def pending_sum(self, tenant_id: UUID, metric_name: str, since: datetime) -> float:
+        """Sum of a tenant's unwritten values of one metric since ``since``."""
+        return sum(
+            row["value"]
+            for row in (*self._inflight, *self._pending)
+            if row["tenant_id"] == tenant_id
+            and row["metric_name"] == metric_name
+            and row["timestamp"] >= since
+        )
+
+    def _has_room(self, n: int) -> bool:
+        return len(self._pending) + n <= self.max_pending
+
+    async def _wait_for_room(self, n: int) -> None:
+        while not self._has_room(n):
+            self._room.clear()
+            self._wake.set()
+            await self._room.wait()
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    async def flush(self) -> int:
+        """
+        Write all buffered rows.
+
+        Returns:
+            Number of rows written (0 when nothing was pending)
+
+        Raises:
+            Exception: Database errors propagate after the batch is re-queued.
+            asyncio.CancelledError: Also re-queues the batch first, so a
+                cancelled caller does not lose the rows being written.
+        """
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            self._room.set()
+            if not batch:
+                return 0
+
+            self._inflight = batch
+            try:
+                async with self._sessionmaker() as session:
+                    await write_metrics(session, batch)
+                    await session.commit()
+            except Exception:
+                self.flush_failures += 1
+                self._requeue(batch)
+                raise
+            except BaseException:
+                self._requeue(batch)
+                raise
+            finally:
+                self._inflight = []
+
+            self.flushes += 1
+            self.flushed_rows += len(batch)
+            return len(batch)
+
+    def _requeue(self, batch: list[dict[str, Any]]) -> None:
+        """Put a failed batch back in front of rows submitted meanwhile."""
+        merged = batch + self._pending
+        overflow = len(merged) - self.max_pending
+        if overflow > 0:
+            # Oldest first: they are the least useful on a live dashboard.
+            self.dropped += overflow
+            merged = merged[overflow:]
+        self._pending = merged
+
+    # ------------------------------------------------------------------
+    # Background flush
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background flush task (idempotent)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and write whatever is still buffered."""
+        if self._task is not None:
+            # Ask the loop to exit instead of cancelling it: cancellation
+            # could land mid-COPY and the final flush would not see the batch.
+            self._stopping = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.warning(
+                "Final metrics flush failed; %d metric rows lost",
+                self.pending_count,
+                exc_info=True,
+            )
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval_seconds)
+            self._wake.clear()
+            if self._stopping:
+                return  # stop() runs the final flush
+            try:
+                await self.flush()
+            except Exception:
+                logger.warning(
+                    "Metrics flush failed; %d rows re-queued",
+                    self.pending_count,
+                    exc_info=True,
+                )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Counters for health endpoints and tests."""
+        return {
+            "pending": self.pending_count,
+            "submitted": self.submitted,
+            "flushed_rows": self.flushed_rows,
+            "flushes": self.flushes,
+            "dropped": self.dropped,
+            "flush_failures": self.flush_failures,
+        }
+
+
+async def write_metrics(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """
+    Bulk-write metric rows on a session (the caller commits).
+
+    Uses asyncpg's binary ``COPY`` when the session runs on asyncpg, and a
+    multi-row INSERT otherwise. Rows must carry every column in COLUMNS.
+    """
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    copy_records = getattr(raw.driver_connection, "copy_records_to_table", None)
+    if copy_records is None:
+        await session.execute(insert(Metric), rows)
+        return
+
+    # SQLAlchemy's asyncpg codec takes JSONB as already-encoded text.
+    records = [
+        tuple(json.dumps(row[c]) if c == "tags" else row[c] for c in COLUMNS) for row in rows
+    ]
+    await copy_records(Metric.__tablename__, records=records, columns=list(COLUMNS))
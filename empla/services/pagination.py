@@ -0,0 +1,390 @@
+"""
+empla.services.pagination - Keyset Pagination & Approximate Totals
+
+The list endpoints (activity feed, memory, inbox, playbooks, webhook
+events) used to run ``SELECT count(*)`` over the filtered set plus an
+OFFSET/LIMIT page on every request. For an employee with millions of
+activity rows the count dominated latency, and OFFSET made deep pages
+degrade linearly with depth.
+
+paginate() replaces both:
+
+Keyset cursors:
+  Each list orders by a fixed set of sort keys ending in the primary key
+  (e.g. ``occurred_at DESC, id DESC``). The response carries an opaque
+  ``next_cursor`` holding the last row's sort values; passing it back
+  fetches the rows strictly after that position with an index range scan,
+  so page 1,000 costs the same as page 1. ``page`` still works (OFFSET)
+  for old clients, and is ignored when a cursor is given.
+
+Totals:
+  The page is fetched first with one extra row. When that shows the first
+  page is also the last, the total is known without counting. Otherwise:
+
+  - ``total="exact"``: ``count(*)``, always.
+  - ``total="estimate"`` (default): a count cached in-process within
+    ``EMPLA_PAGINATION_COUNT_CACHE_TTL``, else the Postgres planner's row
+    estimate for the filtered query. Only when the planner expects fewer
+    than ``EMPLA_PAGINATION_EXACT_COUNT_THRESHOLD`` rows is it cheap
+    enough to count exactly (and cache) instead.
+
+  ``Page.total_is_estimate`` tells the client which one it got.
+
+Cursors are not signed: they only position a query that is already
+tenant-scoped, so a forged cursor can at worst skip rows the caller may
+read anyway. Malformed cursors raise InvalidCursorError (HTTP 400).
+
+Example:
+    >>> keys = (SortKey(EmployeeActivity.occurred_at), SortKey(EmployeeActivity.id))
+    >>> page = await paginate(session, query, keys, page_size=50, cursor=cursor)
+    >>> page.items, page.next_cursor, page.total, page.total_is_estimate
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, Literal, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, and_, func, or_, select, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import QueryableAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TotalMode = Literal["estimate", "exact", "none"]
+
+# Compiles count cache keys; any dialect works as long as it is fixed.
+_KEY_DIALECT = postgresql.dialect()
+
+
+class InvalidCursorError(ValueError):
+    """A pagination cursor could not be decoded for this list."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One ORDER BY term of a keyset-paginated list.
+
+    Attributes:
+        column: Model attribute or expression ordered on.
+        descending: Sort direction.
+        attr: Row attribute holding the value for the cursor; defaults to
+            the column's key (required for unnamed expressions).
+        null_value: Stand-in for NULL when ``column`` wraps a nullable
+            attribute in ``coalesce(attr, null_value)``.
+    """
+
+    column: QueryableAttribute[Any] | ColumnElement[Any]
+    descending: bool = True
+    attr: str | None = None
+    null_value: Any = None
+
+    def value(self, row: Any) -> Any:
+        name = self.attr or self.column.key
+        if name is None:
+            msg = "SortKey on an unnamed expression needs attr"
+            raise ValueError(msg)
+        value = getattr(row, name)
+        return self.null_value if value is None else value
+
+    def order_by(self) -> ColumnElement[Any]:
+        return self.column.desc() if self.descending else self.column.asc()
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a list.
+
+    Attributes:
+        items: Rows on this page.
+        total: Rows in the whole filtered list (None with ``total="none"``
+            when it was not already known).
+        total_is_estimate: Whether ``total`` is a planner estimate or a
+            cached count rather than a fresh one.
+        next_cursor: Cursor for the following page, None on the last page.
+    """
+
+    items: list[T]
+    total: int | None
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
+
+
+# =========================================================================
+# Cursors
+# =========================================================================
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    msg = f"Cannot encode {type(value).__name__} in a pagination cursor"
+    raise TypeError(msg)
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+        msg = "Unknown cursor value"
+        raise ValueError(msg)
+    return value
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """Build the opaque cursor for a position in a list sorted by ``sort``."""
+    payload = json.dumps(
+        {"s": sort, "v": [_encode_value(v) for v in values]}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, n_keys: int) -> list[Any]:
+    """Decode a cursor issued by encode_cursor for the same sort.
+
+    Raises:
+        InvalidCursorError: Garbled, or issued for a different sort order.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [_decode_value(v) for v in payload["v"]]
+        cursor_sort = payload["s"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+        msg = "Invalid pagination cursor"
+        raise InvalidCursorError(msg) from e
+    if cursor_sort != sort or len(values) != n_keys:
+        msg = "Pagination cursor does not match this list's sort order"
+        raise InvalidCursorError(msg)
+    return values
+
+
+def _after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """WHERE clause selecting rows strictly after ``values`` in key order."""
+    if len({k.descending for k in keys}) == 1:
+        # Uniform direction: a row-value comparison the planner turns into
+        # a single index range condition.
+        lhs = tuple_(*(k.column for k in keys))
+        rhs = tuple_(*values)
+        return lhs < rhs if keys[0].descending else lhs > rhs
+    clauses = []
+    for i, key in enumerate(keys):
+        ties = [k.column == v for k, v in zip(keys[:i], values[:i], strict=True)]
+        step = key.column < values[i] if key.descending else key.column > values[i]
+        clauses.append(and_(*ties, step))
+    return or_(*clauses)
+
+
+# =========================================================================
+# Totals
+# =========================================================================
+
+
+class CountCache:
+    """TTL cache of list totals, keyed by the compiled filtered query.
+
+    Args:
+        ttl_seconds: How long a count is reused (0 disables caching).
+        max_entries: Oldest entries are evicted beyond this.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[Any, tuple[float, int]] = {}
+
+    def get(self, key: Any) -> int | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, total = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        return total
+
+    def put(self, key: Any, total: int) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self._entries.pop(key, None)
+        self._entries[key] = (self._clock() + self.ttl_seconds, total)
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_count_cache: CountCache | None = None
+
+
+def get_count_cache() -> CountCache:
+    """Return the process-wide count cache."""
+    global _count_cache  # noqa: PLW0603
+    if _count_cache is None:
+        from empla.settings import get_settings
+
+        _count_cache = CountCache(ttl_seconds=get_settings().pagination_count_cache_ttl)
+    return _count_cache
+
+
+def _cache_key(query: Select[Any]) -> tuple[str, tuple[tuple[str, str], ...]]:
+    compiled = query.compile(dialect=_KEY_DIALECT)
+    return str(compiled), tuple(sorted((k, repr(v)) for k, v in compiled.params.items()))
+
+
+def _is_postgres(session: AsyncSession) -> bool:
+    dialect = getattr(session.bind, "dialect", None)
+    return getattr(dialect, "name", None) == "postgresql"
+
+
+async def _planner_estimate(session: AsyncSession, query: Select[Any]) -> int | None:
+    """The planner's row estimate for ``query``, or None if unavailable."""
+    if not _is_postgres(session):
+        return None
+    try:
+        # Savepoint: a failed EXPLAIN must not poison the request's transaction.
+        async with session.begin_nested():
+            conn = await session.connection()
+            # Compiled for the live driver and sent as driver SQL, so the
+            # parameters stay bound rather than rendered into the text.
+            compiled = query.compile(
+                dialect=conn.dialect, compile_kwargs={"render_postcompile": True}
+            )
+            params = compiled.construct_params()
+            args = (
+                tuple(params[name] for name in compiled.positiontup)
+                if compiled.positiontup
+                else params
+            )
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", args)
+            plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception:
+        logger.warning("Planner row estimate failed; counting exactly", exc_info=True)
+        return None
+
+
+async def count_rows(
+    session: AsyncSession, query: Select[Any], *, exact: bool = False
+) -> tuple[int, bool]:
+    """Total rows ``query`` returns.
+
+    Args:
+        session: Database session.
+        query: The filtered list query (no ORDER BY/LIMIT needed).
+        exact: Always run ``count(*)`` (and refresh the cache).
+
+    Returns:
+        (total, is_estimate)
+    """
+    from empla.settings import get_settings
+
+    cache = get_count_cache()
+    key = _cache_key(query)
+    if not exact:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached, True
+        estimate = await _planner_estimate(session, query)
+        if estimate is not None and estimate >= get_settings().pagination_exact_count_threshold:
+            return estimate, True
+
+    result = await session.execute(
+        select(func.count()).select_from(query.order_by(None).subquery())
+    )
+    total = int(result.scalar() or 0)
+    cache.put(key, total)
+    return total, False
+
+
+# =========================================================================
+# Pagination
+# =========================================================================
+
+
+async def paginate(
+    session: AsyncSession,
+    query: Select[Any],
+    keys: Sequence[SortKey],
+    *,
+    page_size: int,
+    cursor: str | None = None,
+    page: int = 1,
+    total: TotalMode = "estimate",
+    sort: str = "default",
+) -> Page[Any]:
+    """Fetch one page of ``query`` (a single-entity select) in key order.
+
+    Args:
+        session: Database session.
+        query: Filtered select of one ORM entity, without ORDER BY/LIMIT.
+        keys: Sort keys; the last must make the order total (the id).
+        page_size: Rows per page.
+        cursor: ``next_cursor`` from the previous page; overrides ``page``.
+        page: 1-indexed OFFSET page, for clients without cursors.
+        total: How to compute ``Page.total`` when it isn't already known.
+        sort: Name of this sort order, so a cursor from one sort is
+            rejected by another.
+
+    Returns:
+        The page, with ``next_cursor`` set unless it is the last.
+
+    Raises:
+        InvalidCursorError: ``cursor`` is malformed or from another sort.
+    """
+    offset = 0
+    page_query = query
+    if cursor:
+        page_query = page_query.where(_after(keys, decode_cursor(cursor, sort, len(keys))))
+    else:
+        offset = (page - 1) * page_size
+        page_query = page_query.offset(offset)
+    page_query = page_query.order_by(*(k.order_by() for k in keys)).limit(page_size + 1)
+
+    result = await session.execute(page_query)
+    rows = list(result.scalars().all())
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = encode_cursor(sort, [k.value(rows[-1]) for k in keys]) if has_more else None
+
+    if not cursor and not has_more and (offset == 0 or rows):
+        # Fetched through the end from a known offset: the total is exact.
+        known = offset + len(rows)
+        get_count_cache().put(_cache_key(query), known)
+        return Page(items=rows, total=known, next_cursor=next_cursor)
+    if total == "none":
+        return Page(items=rows, total=None, next_cursor=next_cursor)
+
+    count, is_estimate = await count_rows(session, query, exact=total == "exact")
+    return Page(items=rows, total=count, total_is_estimate=is_estimate, next_cursor=next_cursor)
@@ -0,0 +1,192 @@
+"""
+empla.services.principal_cache - Authenticated Principal Cache
+
+get_current_user loaded the User and then the Tenant for every
+authenticated request. A dashboard page load fires a dozen API calls, so
+the same two rows were read two dozen times a page.
+
+PrincipalCache keeps the resolved (user, tenant) column values per token,
+keyed by ``(user id, tenant id, iat)``, in a bounded LRU with a short
+TTL. The JWT signature and expiry are still checked on every request; the
+cache only replaces the row lookups. Only principals that passed every
+check (user not deleted, tenant not deleted and active) are cached.
+
+Invalidation mirrors the webhook routing cache: ORM session hooks drop a
+user's entries when a commit touches that user, and a tenant's entries
+when a commit touches the tenant, so disabling, deleting or re-roling
+through this process applies to the next request. The TTL bounds
+staleness for changes made elsewhere (other API replicas, bulk UPDATEs,
+SQL run by hand).
+
+Hits return fresh transient User/Tenant objects built from the cached
+values: never shared between requests and never attached to a session.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from empla.models.tenant import Tenant, User
+
+PrincipalKey = tuple[UUID, UUID, int]
+
+
+def _columns(obj: Any, model: type) -> dict[str, Any]:
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(model).column_attrs}
+
+
+class PrincipalCache:
+    """Bounded LRU of resolved (user, tenant) per token, with a TTL.
+
+    Args:
+        ttl_seconds: How long a resolution is reused (0 disables caching).
+        max_entries: Least recently used entries are evicted beyond this.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[PrincipalKey, tuple[float, dict[str, Any], dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: PrincipalKey) -> tuple[User, Tenant] | None:
+        """Return fresh copies of the cached user and tenant, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None or self._clock() >= entry[0]:
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        _, user_values, tenant_values = entry
+        return User(**user_values), Tenant(**tenant_values)
+
+    def put(self, key: PrincipalKey, user: User, tenant: Tenant) -> None:
+        """Cache a fully validated principal."""
+        if self.ttl_seconds <= 0:
+            return
+        self._entries.pop(key, None)
+        self._entries[key] = (
+            self._clock() + self.ttl_seconds,
+            _columns(user, User),
+            _columns(tenant, Tenant),
+        )
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: UUID) -> int:
+        """Drop every cached token of one user. Returns the count."""
+        return self._drop(lambda key: key[0] == user_id)
+
+    def invalidate_tenant(self, tenant_id: UUID) -> int:
+        """Drop every cached token of one tenant's users. Returns the count."""
+        return self._drop(lambda key: key[1] == tenant_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for observability."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self._invalidations,
+        }
+
+    def _drop(self, predicate: Callable[[PrincipalKey], bool]) -> int:
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._invalidations += 1
+        return len(stale)
+
+
+_principal_cache: PrincipalCache | None = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Return the process-wide principal cache."""
+    global _principal_cache  # noqa: PLW0603
+    if _principal_cache is None:
+        from empla.settings import get_settings
+
+        settings = get_settings()
+        _principal_cache = PrincipalCache(
+            ttl_seconds=settings.auth_principal_cache_ttl,
+            max_entries=settings.auth_principal_cache_size,
+        )
+    return _principal_cache
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """Drop a user's cached principals (e.g. after a role change)."""
+    if _principal_cache is not None:
+        _principal_cache.invalidate_user(user_id)
+
+
+def invalidate_tenant(tenant_id: UUID) -> None:
+    """Drop all cached principals of a tenant (e.g. after suspending it)."""
+    if _principal_cache is not None:
+        _principal_cache.invalidate_tenant(tenant_id)
+
+
+# =========================================================================
+# Invalidation hooks
+# =========================================================================
+
+_PENDING_KEY = "empla_principal_changes"
+
+
+def _collect_principal_changes(session: Session, flush_context: Any) -> None:  # noqa: ARG001
+    """Remember users and tenants this flush touched."""
+    users, tenants = session.info.setdefault(_PENDING_KEY, (set(), set()))
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            users.add(obj.id)
+        elif isinstance(obj, Tenant) and obj.id is not None:
+            tenants.add(obj.id)
+
+
+def _invalidate_committed(session: Session) -> None:
+    # Only after commit, so a concurrent request cannot re-cache the
+    # pre-commit rows.
+    users, tenants = session.info.pop(_PENDING_KEY, ((), ()))
+    for user_id in users:
+        invalidate_user(user_id)
+    for tenant_id in tenants:
+        invalidate_tenant(tenant_id)
+
+
+def _discard_pending(session: Session, previous_transaction: Any = None) -> None:  # noqa: ARG001
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_principal_changes)
+event.listen(Session, "after_commit", _invalidate_committed)
+event.listen(Session, "after_soft_rollback", _discard_pending)
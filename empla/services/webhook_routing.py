@@ -0,0 +1,223 @@
+"""
+empla.services.webhook_routing - Webhook Token Index & Routing Cache
+
+Two things keep the public webhook receiver O(1) per delivery:
+
+Token index:
+  ``Integration.webhook_token_hashes`` holds an HMAC-SHA256 of the current
+  webhook token and, after a rotation, of the previous one. The receiver
+  hashes the presented token and finds its integration through the GIN
+  index instead of loading every integration for the provider and
+  comparing each token. The final constant-time comparison against the
+  plaintext in ``oauth_config`` (and the rotation grace check) still
+  happens, on the one matching row.
+
+  The hash is keyed so the index column alone is useless for guessing
+  tokens. The key is ``EMPLA_WEBHOOK_TOKEN_HASH_KEY`` (default: the JWT
+  secret); after adding the column (the migration is schema-only) or
+  changing the key, build the index with
+  ``python -m empla.cli webhooks reindex-tokens``. Until then the receiver
+  falls back to comparing tokens of rows whose hashes are NULL.
+
+Routing cache:
+  Which employees a (tenant, provider) webhook wakes changes only when
+  credentials or employee status change, but was re-queried on every
+  delivery. WebhookRoutingCache keeps the answer in-process for a short
+  TTL. ORM session hooks drop a tenant's entries when a commit touches its
+  employees, integrations or credentials, so changes made through this
+  process apply immediately; the TTL bounds staleness for changes made
+  elsewhere (runner subprocesses, bulk UPDATEs, other API replicas).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from empla.models.employee import Employee
+from empla.models.integration import Integration, IntegrationCredential
+
+# =========================================================================
+# Token hashing
+# =========================================================================
+
+
+def _hash_key() -> bytes:
+    from empla.settings import get_settings
+
+    settings = get_settings()
+    return (settings.webhook_token_hash_key or settings.jwt_secret).encode()
+
+
+def webhook_token_digest(token: str) -> str:
+    """Keyed SHA-256 of a webhook token, hex-encoded (64 chars)."""
+    return hmac.new(_hash_key(), token.encode(), hashlib.sha256).hexdigest()
+
+
+def webhook_token_hashes(oauth_config: dict[str, Any] | None) -> list[str] | None:
+    """Index entries for an integration's current and previous token.
+
+    The previous token stays indexed after its grace window; the receiver
+    rejects it by ``rotated_at``, and the next rotation replaces it.
+
+    Returns:
+        Digests to store in ``Integration.webhook_token_hashes``, or None
+        when the integration has no webhook token.
+    """
+    cfg = oauth_config or {}
+    tokens = (cfg.get("webhook_token"), cfg.get("webhook_token_prev"))
+    hashes = [webhook_token_digest(str(t)) for t in tokens if t]
+    return hashes or None
+
+
+async def reindex_webhook_tokens(session: AsyncSession) -> int:
+    """Recompute ``webhook_token_hashes`` for every integration with a token.
+
+    Needed once after the column is added (the migration does not backfill)
+    and after the hash key changes; otherwise create/rotate/delete keep the
+    index current. Commits once at the end.
+
+    Returns:
+        Number of integrations whose index entries changed.
+    """
+    result = await session.execute(
+        select(Integration).where(
+            or_(
+                Integration.oauth_config["webhook_token"].astext.is_not(None),
+                Integration.oauth_config["webhook_token_prev"].astext.is_not(None),
+                Integration.webhook_token_hashes.is_not(None),
+            )
+        )
+    )
+    changed = 0
+    for integration in result.scalars().all():
+        hashes = webhook_token_hashes(integration.oauth_config)
+        if hashes != integration.webhook_token_hashes:
+            integration.webhook_token_hashes = hashes
+            changed += 1
+    await session.commit()
+    return changed
+
+
+# =========================================================================
+# Routing cache
+# =========================================================================
+
+
+class WebhookRoutingCache:
+    """TTL cache of (tenant, provider) -> employee ids to wake.
+
+    Empty answers are cached too: a provider that keeps sending webhooks
+    to a tenant with no connected employees should not cost queries either.
+
+    Args:
+        ttl_seconds: How long an answer is reused (0 disables caching).
+        max_entries: Oldest entries are evicted beyond this.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[tuple[UUID, str], tuple[float, tuple[UUID, ...]]] = {}
+
+    def get(self, tenant_id: UUID, provider: str) -> list[UUID] | None:
+        """Return the cached employee ids, or None on a miss."""
+        key = (tenant_id, provider)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, employee_ids = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        return list(employee_ids)
+
+    def put(self, tenant_id: UUID, provider: str, employee_ids: Iterable[UUID]) -> None:
+        """Cache the employees a (tenant, provider) webhook should wake."""
+        if self.ttl_seconds <= 0:
+            return
+        key = (tenant_id, provider)
+        self._entries.pop(key, None)
+        self._entries[key] = (self._clock() + self.ttl_seconds, tuple(employee_ids))
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, tenant_id: UUID, provider: str | None = None) -> None:
+        """Drop one (tenant, provider) answer, or all of a tenant's."""
+        if provider is not None:
+            self._entries.pop((tenant_id, provider), None)
+            return
+        for key in [k for k in self._entries if k[0] == tenant_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_routing_cache: WebhookRoutingCache | None = None
+
+
+def get_webhook_routing_cache() -> WebhookRoutingCache:
+    """Return the process-wide routing cache."""
+    global _routing_cache  # noqa: PLW0603
+    if _routing_cache is None:
+        from empla.settings import get_settings
+
+        _routing_cache = WebhookRoutingCache(ttl_seconds=get_settings().webhook_routing_cache_ttl)
+    return _routing_cache
+
+
+def invalidate_webhook_routing(tenant_id: UUID, provider: str | None = None) -> None:
+    """Drop cached routing for a tenant (optionally one provider)."""
+    if _routing_cache is not None:
+        _routing_cache.invalidate(tenant_id, provider)
+
+
+# =========================================================================
+# Invalidation hooks
+# =========================================================================
+
+_ROUTING_MODELS = (Employee, Integration, IntegrationCredential)
+_PENDING_KEY = "empla_webhook_routing_tenants"
+
+
+def _collect_routing_changes(session: Session, flush_context: Any) -> None:  # noqa: ARG001
+    """Remember tenants whose routing inputs this flush touched."""
+    tenants: set[UUID] = session.info.setdefault(_PENDING_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _ROUTING_MODELS) and obj.tenant_id is not None:
+            tenants.add(obj.tenant_id)
+
+
+def _invalidate_committed(session: Session) -> None:
+    # Only after commit: invalidating at flush time would let a concurrent
+    # delivery re-cache the pre-commit answer.
+    for tenant_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_webhook_routing(tenant_id)
+
+
+def _discard_pending(session: Session, previous_transaction: Any = None) -> None:  # noqa: ARG001
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_routing_changes)
+event.listen(Session, "after_commit", _invalidate_committed)
+event.listen(Session, "after_soft_rollback", _discard_pending)
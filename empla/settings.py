@@ -101,6 +101,16 @@ class EmplaSettings(BaseSettings):
     jwt_secret: str = JWT_DEV_SECRET
     jwt_expiry_hours: int = Field(default=24, ge=1, le=168)  # 1h to 7d
     jwt_algorithm: str = "HS256"
+    # A token's resolved user and tenant are reused for this long
+    # (empla/services/principal_cache.py); commits that change the user or
+    # tenant in this process drop them at once. 0 disables the cache.
+    auth_principal_cache_ttl: float = Field(default=30.0, ge=0)
+    auth_principal_cache_size: int = Field(default=10_000, ge=1)
+
+    # API rate limits (empla/api/ratelimit.py): "memory" keeps limiter state
+    # per API process; "postgres" shares it between replicas through the
+    # rate_limit_buckets table (one upsert per limited request).
+    rate_limit_backend: str = "memory"
 
     @field_validator("jwt_algorithm")
     @classmethod
@@ -112,6 +122,15 @@ class EmplaSettings(BaseSettings):
             raise ValueError(msg)
         return v
 
+    @field_validator("rate_limit_backend")
+    @classmethod
+    def _validate_rate_limit_backend(cls, v: str) -> str:
+        allowed = {"memory", "postgres"}
+        if v not in allowed:
+            msg = f"rate_limit_backend must be one of {allowed}, got {v!r}"
+            raise ValueError(msg)
+        return v
+
     @model_validator(mode="after")
     def _validate_jwt_secret_in_production(self) -> EmplaSettings:
         """Reject the default dev secret in non-development environments."""
@@ -127,6 +146,92 @@ class EmplaSettings(BaseSettings):
             raise ValueError(msg)
         return self
 
+    # -- History Archive -------------------------------------------------------
+    # memory_episodes / belief_history partitions older than the hot window
+    # are exported to Parquet under this directory (``empla memory retention``).
+    # When set, employees also read archived months on the history read paths.
+    history_archive_dir: str | None = None
+    history_hot_months: int = Field(default=6, ge=1)
+
+    # -- Integration HTTP ------------------------------------------------------
+    # Shared outbound request scheduler for the httpx connectors
+    # (empla/integrations/http.py). Per-provider quotas live in code.
+    integration_http2: bool = False
+    integration_http_max_connections: int = Field(default=20, ge=1)
+    integration_http_max_keepalive: int = Field(default=10, ge=0)
+    integration_http_max_retries: int = Field(default=3, ge=0)
+
+    # Shared MCP server pool (empla/core/tools/mcp_pool.py): sessions per
+    # (tenant, server config), ping interval, and how long a discovered
+    # tool catalog may be reused before list_tools is called again. Each
+    # extra session is another subprocess per stdio server per runner.
+    mcp_pool_sessions_per_server: int = Field(default=1, ge=1)
+    mcp_pool_health_check_interval: float = Field(default=60.0, gt=0)
+    mcp_tool_catalog_ttl: float = Field(default=86400.0, ge=0)
+
+    # Tool call timeouts (empla/core/tools/timeouts.py): the default ceiling,
+    # and how a tool's recent p99 latency shortens it — p99 x multiplier,
+    # never below the floor. Tools can declare a higher ceiling themselves.
+    tool_timeout_seconds: float = Field(default=30.0, gt=0)
+    adaptive_tool_timeouts: bool = True
+    tool_timeout_floor_seconds: float = Field(default=2.0, gt=0)
+    tool_timeout_latency_multiplier: float = Field(default=4.0, ge=1)
+
+    # Inbound webhooks (empla/services/webhook_routing.py): the HMAC key for
+    # the indexed token hashes (defaults to jwt_secret; after changing the
+    # effective key run `python -m empla.cli webhooks reindex-tokens`), and
+    # how long the API may reuse a (tenant, provider) -> employees answer.
+    webhook_token_hash_key: str | None = None
+    webhook_routing_cache_ttl: float = Field(default=60.0, ge=0)
+
+    # Runner-side webhook coalescing (empla/runner/coalesce.py): the loop is
+    # woken once a burst has been quiet this long, or at most max seconds
+    # after its first event. 0 wakes on every delivery.
+    webhook_debounce_seconds: float = Field(default=2.0, ge=0)
+    webhook_debounce_max_seconds: float = Field(default=10.0, ge=0)
+
+    # List pagination (empla/services/pagination.py): totals are counted
+    # exactly only when the planner expects fewer rows than the threshold
+    # (or the client asks for total=exact); counts are reused for the TTL.
+    pagination_exact_count_threshold: int = Field(default=10_000, ge=0)
+    pagination_count_cache_ttl: float = Field(default=30.0, ge=0)
+
+    # Buffered metric writes (empla/services/metrics_sink.py): cycle
+    # metrics are written in bulk every flush_interval seconds or once
+    # flush_rows are buffered; at most buffer_size rows wait in memory
+    # before new ones are dropped.
+    metrics_flush_interval_seconds: float = Field(default=5.0, gt=0)
+    metrics_flush_rows: int = Field(default=500, ge=1)
+    metrics_buffer_size: int = Field(default=20_000, ge=1)
+
+    # Metric rollups (empla/services/metric_rollups.py, run by
+    # `python -m empla.cli metrics rollup`): raw metric rows are deleted
+    # after raw_retention_days (0 keeps them), minute rollups after
+    # minute_rollup_retention_days; hour rollups are kept.
+    metrics_raw_retention_days: int = Field(default=30, ge=0)
+    metrics_minute_rollup_retention_days: int = Field(default=30, ge=1)
+
+    # Live SSE feeds (empla/services/live_feed.py): how often the API tails
+    # each feed table for new rows, how far back each poll re-scans to catch
+    # late-committing transactions, the keepalive interval, and how many
+    # events a slow client may lag before it is told to resync.
+    live_feed_poll_interval: float = Field(default=2.0, gt=0)
+    live_feed_overlap_seconds: float = Field(default=5.0, ge=0)
+    live_feed_heartbeat_seconds: float = Field(default=15.0, gt=0)
+    live_feed_queue_size: int = Field(default=1000, ge=1)
+
+    # Runner heartbeats (empla/services/heartbeat.py): each runner upserts
+    # its employee_heartbeats row every interval; status endpoints treat a
+    # runner that has not reported for stale_seconds as unhealthy. Keep
+    # stale_seconds at several intervals so one slow write is not an outage.
+    heartbeat_interval_seconds: float = Field(default=10.0, gt=0)
+    heartbeat_stale_seconds: float = Field(default=45.0, gt=0)
+
+    # Bulk exports (empla/services/export.py): rows fetched from the
+    # server-side cursor and encoded per chunk. Bounds export memory; larger
+    # batches mean fewer round trips.
+    export_batch_size: int = Field(default=1000, ge=1, le=50_000)
+
     # -- Logging ---------------------------------------------------------------
     log_level: str = "INFO"
 
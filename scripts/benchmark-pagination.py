@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Benchmark activity feed pagination on a large seeded table.
+
+Seeds one benchmark employee with N activity rows (default 5,000,000,
+generated server-side), then times page fetches at increasing depths
+three ways:
+
+    offset  - the previous path: count(*) + OFFSET/LIMIT
+    keyset  - ActivityService.get_activities with a cursor, estimated total
+    exact   - the same with total="exact"
+
+Each depth is timed ``--repeat`` times and the median is reported. The
+seeded rows live under their own tenant (slug ``empla-bench``); re-runs
+reuse them unless ``--reseed`` is given, and ``--cleanup`` deletes them.
+
+Usage:
+    uv run alembic upgrade head
+    uv run python scripts/benchmark-pagination.py --rows 5000000
+    uv run python scripts/benchmark-pagination.py --cleanup
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from empla.models.activity import EmployeeActivity
+from empla.models.database import get_db
+from empla.models.employee import Employee
+from empla.models.tenant import Tenant
+from empla.services.activity_service import ActivityService
+from empla.services.pagination import encode_cursor
+
+logger = logging.getLogger(__name__)
+
+BENCH_SLUG = "empla-bench"
+PAGE_SIZE = 50
+DEPTHS = (1, 10, 100, 1_000, 10_000, 50_000)
+
+
+async def _bench_employee(db: AsyncSession) -> tuple[UUID, UUID]:
+    tenant = (
+        await db.execute(select(Tenant).where(Tenant.slug == BENCH_SLUG))
+    ).scalar_one_or_none()
+    if tenant is None:
+        tenant = Tenant(name="empla Benchmark", slug=BENCH_SLUG, status="active", settings={})
+        db.add(tenant)
+        await db.flush()
+    employee = (
+        await db.execute(select(Employee).where(Employee.tenant_id == tenant.id))
+    ).scalar_one_or_none()
+    if employee is None:
+        employee = Employee(
+            tenant_id=tenant.id,
+            name="Bench Mark",
+            role="sales_ae",
+            email="bench@empla.dev",
+            status="active",
+            lifecycle_stage="autonomous",
+            config={},
+            capabilities=[],
+            performance_metrics={},
+        )
+        db.add(employee)
+        await db.flush()
+    await db.commit()
+    return tenant.id, employee.id
+
+
+async def _seed(db: AsyncSession, tenant_id: UUID, employee_id: UUID, rows: int) -> None:
+    existing = (
+        await db.execute(select(func.count()).where(EmployeeActivity.employee_id == employee_id))
+    ).scalar() or 0
+    if existing >= rows:
+        logger.info(f"Reusing {existing:,} seeded activity rows")
+        return
+
+    logger.info(f"Seeding {rows - existing:,} activity rows ...")
+    start = time.perf_counter()
+    batch = 500_000
+    for offset in range(existing, rows, batch):
+        n = min(batch, rows - offset)
+        await db.execute(
+            text(
+                """
+                INSERT INTO employee_activities
+                    (id, tenant_id, employee_id, event_type, description, data,
+                     importance, occurred_at)
+                SELECT gen_random_uuid(), :tenant_id, :employee_id,
+                       (ARRAY['email_sent', 'email_received', 'goal_progress',
+                              'intention_completed'])[1 + i % 4],
+                       'Benchmark activity ' || i, '{}'::jsonb,
+                       (i % 100) / 100.0,
+                       now() - make_interval(secs => i)
+                FROM generate_series(:lo, :hi) AS i
+                """
+            ),
+            {
+                "tenant_id": tenant_id,
+                "employee_id": employee_id,
+                "lo": offset,
+                "hi": offset + n - 1,
+            },
+        )
+        await db.commit()
+        logger.info(f"  {offset + n:,} / {rows:,}")
+    await db.execute(text("ANALYZE employee_activities"))
+    await db.commit()
+    logger.info(f"Seeded in {time.perf_counter() - start:.1f}s")
+
+
+async def _median_ms(fn: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+async def _offset_page(db: AsyncSession, tenant_id: UUID, employee_id: UUID, page: int) -> None:
+    query = select(EmployeeActivity).where(
+        EmployeeActivity.tenant_id == tenant_id, EmployeeActivity.employee_id == employee_id
+    )
+    await db.execute(select(func.count()).select_from(query.subquery()))
+    await db.execute(
+        query.order_by(EmployeeActivity.occurred_at.desc())
+        .offset((page - 1) * PAGE_SIZE)
+        .limit(PAGE_SIZE)
+    )
+
+
+async def _cursor_at(db: AsyncSession, employee_id: UUID, page: int) -> str | None:
+    """The cursor a client would hold after walking to ``page``."""
+    if page == 1:
+        return None
+    row = (
+        await db.execute(
+            select(EmployeeActivity.occurred_at, EmployeeActivity.id)
+            .where(EmployeeActivity.employee_id == employee_id)
+            .order_by(EmployeeActivity.occurred_at.desc(), EmployeeActivity.id.desc())
+            .offset((page - 1) * PAGE_SIZE - 1)
+            .limit(1)
+        )
+    ).one_or_none()
+    return encode_cursor("default", [row.occurred_at, row.id]) if row else None
+
+
+async def run(rows: int, repeat: int, reseed: bool) -> None:
+    async with get_db() as db:
+        tenant_id, employee_id = await _bench_employee(db)
+        if reseed:
+            await db.execute(
+                delete(EmployeeActivity).where(EmployeeActivity.employee_id == employee_id)
+            )
+            await db.commit()
+        await _seed(db, tenant_id, employee_id, rows)
+
+        service = ActivityService(db)
+        print()
+        print(f"{'page':>8} {'offset+count ms':>16} {'keyset ms':>10} {'exact ms':>9}  total")
+        for page in DEPTHS:
+            if (page - 1) * PAGE_SIZE >= rows:
+                break
+            cursor = await _cursor_at(db, employee_id, page)
+
+            async def keyset(cursor: str | None = cursor, total: str = "estimate") -> Any:
+                return await service.get_activities(
+                    tenant_id=tenant_id,
+                    employee_id=employee_id,
+                    page_size=PAGE_SIZE,
+                    cursor=cursor,
+                    total=total,  # type: ignore[arg-type]
+                )
+
+            offset_ms = await _median_ms(
+                lambda page=page: _offset_page(db, tenant_id, employee_id, page), repeat
+            )
+            keyset_ms = await _median_ms(keyset, repeat)
+            exact_ms = await _median_ms(lambda keyset=keyset: keyset(total="exact"), repeat)
+            result = await keyset()
+            label = f"~{result.total:,}" if result.total_is_estimate else f"{result.total:,}"
+            print(f"{page:>8} {offset_ms:>16.1f} {keyset_ms:>10.1f} {exact_ms:>9.1f}  {label}")
+
+
+async def cleanup() -> None:
+    async with get_db() as db:
+        tenant = (
+            await db.execute(select(Tenant).where(Tenant.slug == BENCH_SLUG))
+        ).scalar_one_or_none()
+        if tenant is None:
+            return
+        await db.execute(delete(EmployeeActivity).where(EmployeeActivity.tenant_id == tenant.id))
+        await db.execute(delete(Employee).where(Employee.tenant_id == tenant.id))
+        await db.execute(delete(Tenant).where(Tenant.id == tenant.id))
+        await db.commit()
+        logger.info("Removed benchmark tenant and its activity rows")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reseed", action="store_true", help="Delete and re-seed the rows")
+    parser.add_argument("--cleanup", action="store_true", help="Delete the benchmark data")
+    args = parser.parse_args()
+    if args.cleanup:
+        asyncio.run(cleanup())
+    else:
+        asyncio.run(run(args.rows, args.repeat, args.reseed))
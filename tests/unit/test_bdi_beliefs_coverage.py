@@ -611,6 +611,68 @@ class TestGetBeliefHistory:
         await bs.get_belief_history(subject="Acme Corp", predicate="deal_stage")
         session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_falls_back_to_archive(self) -> None:
+        """Archived rows fill the remainder, minus the denormalized belief columns."""
+        archive = MagicMock()
+        archive.reaches_archive.return_value = True
+        archive.hot_start.return_value = datetime(2026, 5, 1, tzinfo=UTC)
+        archive.read = AsyncMock(
+            return_value=[
+                {
+                    "id": uuid4(),
+                    "belief_id": uuid4(),
+                    "change_type": "updated",
+                    "changed_at": datetime(2026, 2, 1, tzinfo=UTC),
+                    "belief_subject": "Acme Corp",
+                    "belief_predicate": "deal_stage",
+                }
+            ]
+        )
+        bs = BeliefSystem(
+            session=make_session(),
+            employee_id=uuid4(),
+            tenant_id=uuid4(),
+            llm_service=AsyncMock(),
+            archive=archive,
+        )
+
+        result = await bs.get_belief_history(subject="Acme Corp", limit=10, include_archived=True)
+
+        assert len(result) == 1
+        assert isinstance(result[0], BeliefHistory)
+        assert result[0].change_type == "updated"
+        kwargs = archive.read.await_args.kwargs
+        assert kwargs["equals"] == {"employee_id": bs.employee_id, "belief_subject": "Acme Corp"}
+        assert kwargs["limit"] == 10
+
+    @pytest.mark.asyncio
+    async def test_archive_only_when_window_reaches_it(self) -> None:
+        """Short reads stay on the hot partitions unless ``since`` predates them."""
+        hot_start = datetime(2026, 5, 1, tzinfo=UTC)
+        archive = MagicMock()
+        archive.reaches_archive.side_effect = lambda _table, since: (
+            since is None or since < hot_start
+        )
+        archive.hot_start.return_value = hot_start
+        archive.read = AsyncMock(return_value=[])
+        bs = BeliefSystem(
+            session=make_session(),
+            employee_id=uuid4(),
+            tenant_id=uuid4(),
+            llm_service=AsyncMock(),
+            archive=archive,
+        )
+
+        await bs.get_belief_history(limit=10)
+        await bs.get_belief_history(limit=10, since=datetime(2026, 6, 1, tzinfo=UTC))
+        archive.read.assert_not_called()
+
+        since = datetime(2026, 3, 1, tzinfo=UTC)
+        await bs.get_belief_history(limit=10, since=since)
+        archive.read.assert_awaited_once()
+        assert archive.read.await_args.kwargs["since"] == since
+
 
 # ============================================================================
 # Test: BeliefSystem._format_observation_content
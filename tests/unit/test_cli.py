@@ -98,6 +98,41 @@ def test_parser_status_requires_tenant_id():
         parser.parse_args(["employee", "status", str(uuid4())])
 
 
+def test_parser_memory_maintain_defaults():
+    """Test memory maintain runs once, fleet-wide, by default."""
+    parser = build_parser()
+    args = parser.parse_args(["memory", "maintain"])
+    assert args.command == "memory"
+    assert args.action == "maintain"
+    assert args.tenant_id is None
+    assert args.employee_id is None
+    assert args.interval_seconds is None
+    assert args.chunk_size == 500
+
+
+def test_parser_memory_maintain_worker_mode():
+    """Test memory maintain accepts scope, job selection, and an interval."""
+    tid = str(uuid4())
+    parser = build_parser()
+    args = parser.parse_args(
+        [
+            "memory",
+            "maintain",
+            "--tenant-id",
+            tid,
+            "--job",
+            "episodic_decay",
+            "--job",
+            "semantic_archive",
+            "--interval-seconds",
+            "3600",
+        ]
+    )
+    assert str(args.tenant_id) == tid
+    assert args.job == ["episodic_decay", "semantic_archive"]
+    assert args.interval_seconds == 3600.0
+
+
 def test_cli_module_importable():
     """Test CLI modules can be imported."""
     import empla.cli
@@ -105,3 +140,81 @@ def test_cli_module_importable():
 
     assert empla.cli is not None
     assert empla.cli.__main__ is not None
+
+
+def test_parser_memory_retention_defaults():
+    """Test memory retention falls back to settings for archive dir and hot window."""
+    parser = build_parser()
+    args = parser.parse_args(["memory", "retention"])
+    assert args.action == "retention"
+    assert args.archive_dir is None
+    assert args.hot_months is None
+    assert args.months_ahead == 3
+
+
+def test_parser_memory_retention_overrides():
+    """Test memory retention accepts an explicit archive dir and windows."""
+    parser = build_parser()
+    args = parser.parse_args(
+        ["memory", "retention", "--archive-dir", "/tmp/a", "--hot-months", "12"]
+    )
+    assert args.archive_dir == "/tmp/a"
+    assert args.hot_months == 12
+
+
+def test_parser_webhooks_reindex_tokens():
+    """Test the webhook token index rebuild command parses."""
+    parser = build_parser()
+    args = parser.parse_args(["webhooks", "reindex-tokens"])
+    assert args.command == "webhooks"
+    assert args.action == "reindex-tokens"
+
+
+def test_parser_metrics_rollup():
+    """Test the metrics rollup command runs once by default."""
+    parser = build_parser()
+    args = parser.parse_args(["metrics", "rollup"])
+    assert args.command == "metrics"
+    assert args.action == "rollup"
+    assert args.interval_seconds is None
+    assert args.reprocess_minutes == 5
+
+    args = parser.parse_args(["metrics", "rollup", "--interval-seconds", "60"])
+    assert args.interval_seconds == 60.0
+
+
+def test_parser_export():
+    """Test the export command parses resume parameters."""
+    tid = str(uuid4())
+    aid = str(uuid4())
+    parser = build_parser()
+    args = parser.parse_args(["export", "activities", "--tenant-id", tid])
+    assert args.command == "export"
+    assert args.format == "ndjson"
+    assert args.output == "-"
+    assert not args.gzip
+
+    args = parser.parse_args(
+        [
+            "export",
+            "memories",
+            "--tenant-id",
+            tid,
+            "--format",
+            "csv",
+            "--gzip",
+            "--after-time",
+            "2026-10-19T12:00:00+00:00",
+            "--after-id",
+            aid,
+        ]
+    )
+    assert args.after_time.year == 2026
+    assert str(args.after_id) == aid
+
+
+def test_parser_export_rejects_unknown_dataset():
+    """Test export only accepts known datasets."""
+    parser = build_parser()
+    with pytest.raises(SystemExit):
+        parser.parse_args(["export", "users", "--tenant-id", str(uuid4())])
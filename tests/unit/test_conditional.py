@@ -0,0 +1,190 @@
+"""
+Unit tests for conditional GET (empla.api.conditional) and the dashboard
+read endpoints that use it.
+
+Covers the version aggregate, ETag scoping, If-None-Match matching, the
+one-pass JSON response, and, through a FastAPI app, that a matching poll
+gets a 304 without the list query running.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from empla.api.conditional import (
+    UNCONDITIONAL,
+    ConditionalGet,
+    not_modified,
+    version_query,
+)
+from empla.api.deps import get_current_user, get_db
+from empla.api.v1.endpoints import bdi
+from empla.api.v1.endpoints import settings as settings_ep
+from empla.api.v1.schemas.settings import TenantSettings
+from empla.models.belief import Belief
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+_UPDATED = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+
+def _db(version=(3, _UPDATED, Decimal("5388249600.5"))):
+    """Session whose every result answers the endpoints' calls."""
+    result = Mock()
+    result.one.return_value = version
+    result.scalar_one_or_none.return_value = uuid4()
+    result.scalar.return_value = 0
+    result.scalars.return_value.all.return_value = []
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def _app(db) -> FastAPI:
+    app = FastAPI()
+    app.include_router(bdi.router, prefix="/employees")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(
+        user_id=uuid4(), tenant_id=uuid4(), role="member"
+    )
+    return app
+
+
+# ============================================================================
+# Building blocks
+# ============================================================================
+
+
+def test_version_query_aggregates_updated_at():
+    employee_id = uuid4()
+    query = version_query(Belief, Belief.employee_id == employee_id)
+
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "count(*)" in sql
+    assert "max(beliefs.updated_at)" in sql
+    assert "sum(EXTRACT(epoch FROM beliefs.updated_at))" in sql
+    assert "ORDER BY" not in sql
+    assert "LIMIT" not in sql
+
+
+def test_etag_is_weak_and_scoped_to_path_and_query():
+    page1 = ConditionalGet(scope="/employees/x/beliefs?page=1")
+    page2 = ConditionalGet(scope="/employees/x/beliefs?page=2")
+
+    tag = page1.make_etag(3, _UPDATED)
+    assert tag.startswith('W/"')
+    assert tag == page1.make_etag(3, _UPDATED)
+    assert tag != page2.make_etag(3, _UPDATED)
+    assert tag != page1.make_etag(4, _UPDATED)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ('W/"abc"', True),
+        ('"abc"', True),  # weak comparison ignores W/
+        ('"zzz", W/"abc"', True),
+        ('"zzz"', False),
+        ("*", False),
+    ],
+)
+def test_matches(header, expected):
+    assert ConditionalGet(if_none_match=header).matches('W/"abc"') is expected
+
+
+def test_respond_serializes_in_one_pass_with_validators():
+    model = TenantSettings()
+
+    response = ConditionalGet().respond(model, 'W/"abc"')
+
+    assert isinstance(response, Response)
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert json.loads(response.body) == json.loads(model.model_dump_json())
+
+
+@pytest.mark.asyncio
+async def test_unconditional_skips_version_query_and_returns_model():
+    db = _db()
+    model = TenantSettings()
+
+    assert await UNCONDITIONAL.etag(db, version_query(Belief)) is None
+    assert UNCONDITIONAL.respond(model, None) is model
+    db.execute.assert_not_called()
+
+
+def test_not_modified_has_no_body():
+    response = not_modified('W/"abc"')
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == 'W/"abc"'
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+
+def test_matching_poll_skips_list_query():
+    db = _db()
+    client = TestClient(_app(db))
+    url = f"/employees/{uuid4()}/beliefs?page=1"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.json()["total"] == 0
+    etag = first.headers["etag"]
+    assert db.execute.await_count == 4  # verify, version, count, page
+
+    db.execute.reset_mock()
+    second = client.get(url, headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert db.execute.await_count == 2  # verify, version
+
+
+def test_changed_version_returns_full_response():
+    db = _db()
+    client = TestClient(_app(db))
+    url = f"/employees/{uuid4()}/goals"
+    etag = client.get(url).headers["etag"]
+
+    # One goal updated by a transaction that started before the newest row:
+    # max(updated_at) is unchanged, the epoch sum is not.
+    db.execute.return_value.one.return_value = (3, _UPDATED, Decimal("5388249599.25"))
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_settings_not_modified_skips_tenant_load():
+    db = _db()
+    conditional = ConditionalGet(scope="/settings?")
+    etag = conditional.make_etag(*db.execute.return_value.one.return_value)
+    auth = SimpleNamespace(user_id=uuid4(), tenant_id=uuid4(), role="member")
+
+    response = await settings_ep.get_settings(
+        db=db,
+        auth=auth,
+        conditional=ConditionalGet(if_none_match=etag, scope="/settings?"),
+    )
+
+    assert response.status_code == 304
+    db.execute.assert_awaited_once()
@@ -0,0 +1,279 @@
+"""
+Unit tests for cycle deadline propagation and adaptive tool timeouts.
+
+Covers deadline scopes and enforcement, TimeoutPolicy, ToolRouter's
+per-tool timeouts and deadline cap, and the structured deadline outcome
+of agentic intention execution.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from empla.core.deadline import (
+    DeadlineExceededError,
+    current_deadline,
+    deadline_scope,
+    enforce_deadline,
+)
+from empla.core.loop.execution import ProactiveExecutionLoop
+from empla.core.tools.base import ActionResult, Tool
+from empla.core.tools.health import LatencyHistogram
+from empla.core.tools.registry import ToolRegistry
+from empla.core.tools.router import ToolRouter
+from empla.core.tools.timeouts import TimeoutPolicy
+from empla.integrations.router import IntegrationRouter
+from empla.llm.models import LLMResponse, TokenUsage, ToolCall
+from empla.models.employee import Employee
+
+# ============================================================================
+# Deadline scopes
+# ============================================================================
+
+
+def test_nested_scope_only_shortens():
+    with deadline_scope(10) as outer:
+        with deadline_scope(60) as inner:
+            assert inner is outer
+        with deadline_scope(1) as inner:
+            assert inner.expires_at < outer.expires_at
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_enforce_converts_timeout():
+    with deadline_scope(0.02), pytest.raises(DeadlineExceededError, match="during probe"):
+        async with enforce_deadline("probe"):
+            await asyncio.sleep(1)
+
+
+@pytest.mark.asyncio
+async def test_enforce_without_deadline_is_noop():
+    async with enforce_deadline("probe"):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_operation_timeouts_pass_through():
+    with deadline_scope(10), pytest.raises(TimeoutError) as exc:
+        async with enforce_deadline("probe"), asyncio.timeout(0.01):
+            await asyncio.sleep(1)
+    assert not isinstance(exc.value, DeadlineExceededError)
+
+
+# ============================================================================
+# TimeoutPolicy
+# ============================================================================
+
+
+def _window(latencies_ms: list[float], timeouts: int = 0) -> LatencyHistogram:
+    window = LatencyHistogram()
+    for ms in latencies_ms:
+        window.record(ms)
+    for _ in range(timeouts):
+        window.record(30000.0, timeout=True)
+    return window
+
+
+def test_policy_uses_ceiling_until_enough_samples():
+    policy = TimeoutPolicy(min_samples=20)
+    assert policy.resolve(ceiling=30.0, window=None) == 30.0
+    assert policy.resolve(ceiling=30.0, window=_window([100.0] * 5)) == 30.0
+
+
+def test_policy_shrinks_to_observed_latency():
+    policy = TimeoutPolicy(floor=0.5, multiplier=4.0, min_samples=20)
+    timeout = policy.resolve(ceiling=30.0, window=_window([1000.0] * 50))
+    assert timeout == pytest.approx(4.0, rel=0.07)
+
+
+def test_policy_respects_floor_and_ceiling():
+    policy = TimeoutPolicy(floor=2.0, min_samples=1)
+    assert policy.resolve(ceiling=30.0, window=_window([50.0] * 5)) == 2.0
+    assert policy.resolve(ceiling=5.0, window=_window([20000.0] * 5)) == 5.0
+
+
+def test_policy_ignores_windows_with_timeouts():
+    policy = TimeoutPolicy(floor=0.5, min_samples=1)
+    assert policy.resolve(ceiling=30.0, window=_window([100.0] * 50, timeouts=1)) == 30.0
+
+
+def test_disabled_policy_pins_ceiling():
+    policy = TimeoutPolicy(enabled=False, min_samples=1)
+    assert policy.resolve(ceiling=30.0, window=_window([100.0] * 50)) == 30.0
+
+
+# ============================================================================
+# ToolRouter
+# ============================================================================
+
+
+class ControlledTool:
+    """Answers instantly until ``hang`` is set."""
+
+    def __init__(self) -> None:
+        self.hang = False
+        self.calls = 0
+
+    async def _execute(self, params: dict[str, Any]) -> dict[str, Any]:
+        self.calls += 1
+        if self.hang:
+            await asyncio.sleep(10)
+        return {"ok": True}
+
+
+def _router(tool: ControlledTool, **kwargs: Any) -> ToolRouter:
+    registry = ToolRegistry()
+    registry.register_tool(Tool(name="crm.get_deals", description="", parameters_schema={}), tool)
+    return ToolRouter(tool_registry=registry, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_hung_call_is_cut_at_adaptive_timeout():
+    tool = ControlledTool()
+    router = _router(tool, timeout_policy=TimeoutPolicy(floor=0.05, min_samples=5))
+    for _ in range(5):
+        await router.execute_tool_call(uuid4(), "crm.get_deals", {})
+
+    tool.hang = True
+    start = asyncio.get_running_loop().time()
+    result = await router.execute_tool_call(uuid4(), "crm.get_deals", {})
+
+    assert result.metadata["timeout"] is True
+    assert asyncio.get_running_loop().time() - start < 1.0
+    assert router.get_integration_health("crm")["timeout_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_timeout_ceiling_from_integration():
+    integration = IntegrationRouter("reports")
+
+    @integration.tool(timeout=120)
+    async def build_report() -> dict:
+        return {}
+
+    router = ToolRouter(tool_registry=ToolRegistry())
+    router.register_integration(integration)
+    tool = router._tool_registry.get_tool_by_name("reports.build_report")
+
+    assert tool.timeout_seconds == 120
+    assert router.get_tool_timeout(tool) == 120
+
+
+@pytest.mark.asyncio
+async def test_cycle_deadline_caps_tool_call_without_marking_tool_unhealthy():
+    tool = ControlledTool()
+    tool.hang = True
+    router = _router(tool)
+
+    with deadline_scope(0.05):
+        result = await router.execute_tool_call(uuid4(), "crm.get_deals", {})
+
+    assert not result.success
+    assert result.metadata["deadline_exceeded"] is True
+    assert router.get_integration_health("crm")["total_calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_skips_tool():
+    tool = ControlledTool()
+    router = _router(tool)
+
+    with deadline_scope(0):
+        result = await router.execute_tool_call(uuid4(), "crm.get_deals", {})
+
+    assert result.metadata == {"deadline_exceeded": True}
+    assert tool.calls == 0
+
+
+# ============================================================================
+# Agentic execution
+# ============================================================================
+
+
+def _loop(llm_service: Any, tool_router: Any) -> ProactiveExecutionLoop:
+    employee = Mock(spec=Employee)
+    employee.id = uuid4()
+    employee.tenant_id = uuid4()
+    employee.role = "sales_ae"
+    intentions = MagicMock()
+    intentions.get_next_intention = AsyncMock(return_value=_intention())
+    intentions.dependencies_satisfied = AsyncMock(return_value=True)
+    intentions.start_intention = AsyncMock()
+    intentions.fail_intention = AsyncMock()
+    return ProactiveExecutionLoop(
+        employee=employee,
+        beliefs=MagicMock(),
+        goals=MagicMock(),
+        intentions=intentions,
+        memory=SimpleNamespace(),
+        llm_service=llm_service,
+        tool_router=tool_router,
+    )
+
+
+def _intention() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        goal_id=None,
+        description="Update the pipeline report",
+        intention_type="action",
+        priority=5,
+        plan={"steps": []},
+        context={},
+    )
+
+
+def _tool_call_response() -> LLMResponse:
+    return LLMResponse(
+        content="",
+        model="test-model",
+        usage=TokenUsage(input_tokens=10, output_tokens=10, total_tokens=20),
+        finish_reason="tool_use",
+        tool_calls=[
+            ToolCall(id="1", name="crm.get_deals", arguments={}),
+            ToolCall(id="2", name="crm.get_deals", arguments={}),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_deadline_during_tools_yields_structured_result():
+    llm = MagicMock()
+    llm.generate_with_tools = AsyncMock(return_value=_tool_call_response())
+    router = MagicMock(spec=ToolRouter)
+    router.get_all_tool_schemas = MagicMock(return_value=[{"name": "crm.get_deals"}])
+    router.execute_tool_call = AsyncMock(
+        return_value=ActionResult(success=False, metadata={"deadline_exceeded": True})
+    )
+    loop = _loop(llm, router)
+
+    result = await loop.execute_intentions()
+
+    assert result.deadline_exceeded is True
+    assert result.outcome["deadline_exceeded"] is True
+    # Remaining calls from the same turn are not started, no further LLM turn
+    assert router.execute_tool_call.await_count == 1
+    assert llm.generate_with_tools.await_count == 1
+    loop.intentions.fail_intention.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_llm_deadline_yields_structured_result():
+    llm = MagicMock()
+    llm.generate_with_tools = AsyncMock(
+        side_effect=DeadlineExceededError("cycle deadline exceeded during LLM")
+    )
+    router = MagicMock(spec=ToolRouter)
+    router.get_all_tool_schemas = MagicMock(return_value=[{"name": "crm.get_deals"}])
+    loop = _loop(llm, router)
+
+    result = await loop.execute_intentions()
+
+    assert result.deadline_exceeded is True
+    assert not result.success
@@ -8,7 +8,7 @@ doesn't cover.
 
 import asyncio
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -145,15 +145,31 @@ class TestMemorySystemInit:
         ):
             mem = MemorySystem(session, employee_id, tenant_id)
 
-            ep_mock.assert_called_once_with(session, employee_id, tenant_id)
-            sem_mock.assert_called_once_with(session, employee_id, tenant_id)
+            ep_mock.assert_called_once_with(
+                session, employee_id, tenant_id, access_tracker=None, archive=None
+            )
+            sem_mock.assert_called_once_with(session, employee_id, tenant_id, access_tracker=None)
             proc_mock.assert_called_once_with(session, employee_id, tenant_id)
-            wm_mock.assert_called_once_with(session, employee_id, tenant_id)
+            wm_mock.assert_called_once_with(session, employee_id, tenant_id, access_tracker=None)
 
             assert mem.episodic == ep_mock.return_value
             assert mem.semantic == sem_mock.return_value
             assert mem.procedural == proc_mock.return_value
             assert mem.working == wm_mock.return_value
+            assert mem.access_tracker is None
+            assert mem.hybrid is None
+            assert mem.context is None
+
+    def test_memory_system_with_sessionmaker_shares_tracker(self):
+        """With a sessionmaker, read paths share one MemoryAccessTracker."""
+        mem = MemorySystem(AsyncMock(), uuid4(), uuid4(), sessionmaker=MagicMock())
+
+        assert mem.access_tracker is not None
+        assert mem.episodic.access_tracker is mem.access_tracker
+        assert mem.semantic.access_tracker is mem.access_tracker
+        assert mem.working.access_tracker is mem.access_tracker
+        assert mem.hybrid is not None
+        assert mem.context is not None
 
 
 # ============================================================================
@@ -451,6 +467,7 @@ class TestInitBDI:
                 employee_id=employee.employee_id,
                 tenant_id=employee.tenant_id,
                 llm_service=employee._llm,
+                archive=None,
             )
             goal_cls.assert_called_once_with(
                 session=session,
@@ -488,9 +505,26 @@ class TestInitMemory:
                 session=session,
                 employee_id=employee.employee_id,
                 tenant_id=employee.tenant_id,
+                sessionmaker=employee._sessionmaker,
+                archive=None,
             )
             assert employee._memory == mem_cls.return_value
 
+    @pytest.mark.asyncio
+    async def test_init_memory_passes_history_archive(self, employee, tmp_path):
+        """With EMPLA_HISTORY_ARCHIVE_DIR set, episodic recall gets the archive."""
+        employee._employee_id = uuid4()
+        settings = Mock(history_archive_dir=str(tmp_path))
+
+        with (
+            patch("empla.settings.get_settings", return_value=settings),
+            patch("empla.employees.base.MemorySystem") as mem_cls,
+        ):
+            await employee._init_memory(AsyncMock())
+
+        archive = mem_cls.call_args.kwargs["archive"]
+        assert archive.root == tmp_path
+
 
 # ============================================================================
 # Test: _create_default_goals
@@ -602,7 +636,9 @@ class TestInitLoop:
             await employee._init_loop()
 
             tr_cls.assert_called_once()
-            router_cls.assert_called_once_with(tr_cls.return_value)
+            router_cls.assert_called_once_with(
+                tr_cls.return_value, tool_timeout=30.0, timeout_policy=ANY
+            )
             loop_cls.assert_called_once()
             # Verify sessionmaker was explicitly forwarded (regression guard for #77).
             assert loop_cls.call_args.kwargs.get("sessionmaker") is sentinel_sessionmaker, (
@@ -698,7 +734,9 @@ class TestInitMCPServers:
 
             await employee._init_mcp_servers([mock_config])
 
-            bridge_cls.assert_called_once_with(tr_cls.return_value)
+            bridge_cls.assert_called_once_with(
+                tr_cls.return_value, pool=ANY, tenant_id=employee.config.tenant_id
+            )
             mock_bridge.connect.assert_awaited_once_with(mock_config)
             assert employee._mcp_bridge is mock_bridge
 
@@ -739,7 +777,9 @@ class TestInitMCPServers:
 
             # Should NOT create a new ToolRegistry
             tr_cls.assert_not_called()
-            bridge_cls.assert_called_once_with(existing_registry)
+            bridge_cls.assert_called_once_with(
+                existing_registry, pool=ANY, tenant_id=employee.config.tenant_id
+            )
 
 
 # ============================================================================
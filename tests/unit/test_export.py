@@ -0,0 +1,270 @@
+"""
+Unit tests for streaming exports (empla.services.export) and the export
+endpoint.
+
+Covers the keyset-resumable select, NDJSON/CSV encoding, per-chunk gzip
+that stays decompressible when cut off, batch-at-a-time streaming with
+progress, and the endpoint's validation and response headers.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import zlib
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.dialects import postgresql
+
+from empla.api.v1.endpoints import export as export_ep
+from empla.services.export import (
+    EXPORTS,
+    ExportProgress,
+    ExportQuery,
+    export_chunks,
+    file_extension,
+)
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+_T0 = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+
+def _metric_rows(n, start=0):
+    return [
+        (
+            uuid4(),
+            None,
+            _T0 + timedelta(seconds=start + i),
+            "bdi.cycle.duration",
+            "histogram",
+            1.5,
+            {"outcome": "success"},
+        )
+        for i in range(n)
+    ]
+
+
+class _Stream:
+    """AsyncResult stand-in: partitions of rows, records close()."""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.pulled = 0
+        self.closed = False
+
+    async def partitions(self):
+        for batch in self.batches:
+            self.pulled += 1
+            yield batch
+
+    async def close(self):
+        self.closed = True
+
+
+def _sessionmaker(stream):
+    session = AsyncMock()
+    session.stream = AsyncMock(return_value=stream)
+    ctx = AsyncMock()
+    ctx.__aenter__.return_value = session
+    ctx.__aexit__.return_value = False
+    return MagicMock(return_value=ctx), session
+
+
+def _export(**kwargs):
+    return ExportQuery(EXPORTS["metrics"], uuid4(), **kwargs)
+
+
+async def _collect(stream, **kwargs):
+    sessionmaker, _ = _sessionmaker(stream)
+    return [chunk async for chunk in export_chunks(sessionmaker, _export(), **kwargs)]
+
+
+# ============================================================================
+# Query
+# ============================================================================
+
+
+def test_select_orders_by_time_and_id_and_resumes_after_row():
+    employee_id, after_id = uuid4(), uuid4()
+    query = ExportQuery(
+        EXPORTS["activities"],
+        uuid4(),
+        employee_id=employee_id,
+        since=_T0,
+        after_time=_T0,
+        after_id=after_id,
+    ).select()
+
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "(employee_activities.occurred_at, employee_activities.id) >" in sql
+    assert sql.endswith("ORDER BY employee_activities.occurred_at, employee_activities.id")
+    assert "LIMIT" not in sql
+    assert "deleted_at" not in sql  # activities are not soft-deleted
+    assert employee_id in query.compile().params.values()
+
+
+def test_memory_export_skips_embeddings_and_deleted_rows():
+    sql = str(
+        ExportQuery(EXPORTS["memories"], uuid4()).select().compile(dialect=postgresql.dialect())
+    )
+
+    assert "embedding" not in sql
+    assert "memory_episodes.deleted_at IS NULL" in sql
+
+
+def test_resume_parameters_must_be_paired():
+    with pytest.raises(ValueError, match="together"):
+        _export(after_time=_T0)
+
+
+def test_file_extension():
+    assert file_extension("csv", compress=False) == "csv"
+    assert file_extension("ndjson", compress=True) == "ndjson.gz"
+
+
+# ============================================================================
+# Streaming
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_ndjson_streams_one_chunk_per_batch():
+    rows = _metric_rows(5)
+    stream = _Stream([rows[:3], rows[3:]])
+    sessionmaker, session = _sessionmaker(stream)
+
+    chunks = [
+        chunk async for chunk in export_chunks(sessionmaker, _export(), fmt="ndjson", batch_size=3)
+    ]
+
+    query = session.stream.await_args.args[0]
+    assert query.get_execution_options()["yield_per"] == 3
+    assert stream.closed
+    lines = [json.loads(line) for chunk in chunks for line in chunk.decode().splitlines()]
+    assert [line["id"] for line in lines] == [str(r[0]) for r in rows]
+    assert lines[0]["timestamp"] == _T0.isoformat()
+    assert lines[0]["tags"] == {"outcome": "success"}
+    assert lines[0]["employee_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_csv_has_header_and_json_cells():
+    rows = _metric_rows(2)
+
+    data = b"".join(await _collect(_Stream([rows]), fmt="csv"))
+
+    header, first, _ = list(csv.reader(io.StringIO(data.decode())))
+    assert header == list(EXPORTS["metrics"].columns)
+    assert first[0] == str(rows[0][0])
+    assert first[1] == ""
+    assert json.loads(first[6]) == {"outcome": "success"}
+
+
+@pytest.mark.asyncio
+async def test_gzip_chunks_decompress_without_the_rest():
+    rows = _metric_rows(4)
+
+    chunks = await _collect(_Stream([rows[:2], rows[2:]]), compress=True)
+
+    # A download cut after the first batch still yields those rows.
+    partial = zlib.decompressobj(31).decompress(chunks[0])
+    assert len(partial.decode().splitlines()) == 2
+    assert len(gzip.decompress(b"".join(chunks)).decode().splitlines()) == 4
+
+
+@pytest.mark.asyncio
+async def test_progress_counts_batches_the_consumer_took():
+    rows = _metric_rows(4)
+    stream = _Stream([rows[:2], rows[2:]])
+    sessionmaker, _ = _sessionmaker(stream)
+    progress = ExportProgress()
+
+    chunks = export_chunks(sessionmaker, _export(), progress=progress)
+    await anext(chunks)
+    assert progress.rows == 0  # handed out, not yet confirmed written
+    await anext(chunks)
+    assert progress.rows == 2
+    assert progress.after_id == rows[1][0]
+    assert stream.pulled == 2
+    await chunks.aclose()
+
+    assert progress.to_dict()["after_time"] == rows[1][2].isoformat()
+
+
+# ============================================================================
+# Endpoint
+# ============================================================================
+
+
+def _request():
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(sessionmaker=MagicMock())))
+
+
+def _db(employee_found=True):
+    result = Mock()
+    result.scalar_one_or_none.return_value = uuid4() if employee_found else None
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def _auth():
+    return SimpleNamespace(user_id=uuid4(), tenant_id=uuid4(), role="admin")
+
+
+def _call(db, **kwargs):
+    params = {
+        "dataset": "activities",
+        "fmt": "ndjson",
+        "gzip": False,
+        "employee_id": None,
+        "since": None,
+        "until": None,
+        "after_time": None,
+        "after_id": None,
+        **kwargs,
+    }
+    return export_ep.export_dataset(_request(), db, _auth(), **params)
+
+
+@pytest.mark.asyncio
+async def test_endpoint_streams_download_and_releases_session():
+    db = _db()
+
+    response = await _call(db, dataset="metrics", fmt="csv", gzip=True)
+
+    assert isinstance(response, StreamingResponse)
+    assert response.media_type == "application/gzip"
+    assert 'filename="metrics.csv.gz"' in response.headers["content-disposition"]
+    db.execute.assert_not_called()
+    db.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("kwargs", "employee_found", "status_code"),
+    [
+        ({"dataset": "users"}, True, 404),
+        ({"after_id": uuid4()}, True, 400),
+        ({"employee_id": uuid4()}, False, 404),
+    ],
+)
+async def test_endpoint_rejects_before_streaming(kwargs, employee_found, status_code):
+    db = _db(employee_found)
+
+    with pytest.raises(HTTPException) as exc:
+        await _call(db, **kwargs)
+
+    assert exc.value.status_code == status_code
+    db.close.assert_not_called()
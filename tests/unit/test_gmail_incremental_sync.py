@@ -0,0 +1,341 @@
+"""
+Unit tests for Gmail incremental sync.
+
+Covers priming the unread index, History API deltas (adds, label changes,
+deletions), the expired-historyId fallback, resuming from a persisted
+cursor, bounded concurrent fetches, and the parsed-email cache.
+"""
+
+import base64
+import threading
+import time
+from collections import Counter
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from empla.integrations.email.gmail import GmailEmailAdapter
+from empla.integrations.email.sync import EmailCache, MailboxIndex, is_unread
+from empla.integrations.email.types import Email
+from empla.integrations.sync_cursors import DatabaseCursorStore, InMemoryCursorStore
+
+# ---------------------------------------------------------------------------
+# Fake Gmail service
+# ---------------------------------------------------------------------------
+
+
+class _Request:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self, http=None):
+        return self._fn()
+
+
+class _FakeGmail:
+    """Minimal in-memory Gmail service recording calls per endpoint."""
+
+    def __init__(self, unread_ids, *, history_id="100", delay=0.0):
+        self.unread_ids = list(unread_ids)
+        self.history_id = history_id
+        self.history_pages = []
+        self.history_error = None
+        self.delay = delay
+        self.calls = Counter()
+        self.history_starts = []
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    # users() / messages() / history() all resolve to this object
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def history(self):
+        return SimpleNamespace(list=self._history_list)
+
+    def getProfile(self, userId):  # noqa: N802, N803 - mirrors the Google API
+        self.calls["getProfile"] += 1
+        return _Request(lambda: {"historyId": self.history_id})
+
+    def list(self, **kwargs):
+        self.calls["list"] += 1
+        ids = self.unread_ids[: kwargs["maxResults"]]
+        more = len(self.unread_ids) > kwargs["maxResults"]
+        return _Request(
+            lambda: {
+                "messages": [{"id": i} for i in ids],
+                **({"nextPageToken": "p"} if more else {}),
+            }
+        )
+
+    def get(self, userId, id, format):  # noqa: N803
+        self.calls["get"] += 1
+
+        def run():
+            with self._lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(self.delay)
+            with self._lock:
+                self.in_flight -= 1
+            return _message(id)
+
+        return _Request(run)
+
+    def modify(self, userId, id, body):  # noqa: N803
+        self.calls["modify"] += 1
+        return _Request(dict)
+
+    def _history_list(self, **kwargs):
+        self.calls["history"] += 1
+        self.history_starts.append(kwargs["startHistoryId"])
+        if self.history_error is not None:
+            error = self.history_error
+            return _Request(lambda: (_ for _ in ()).throw(error))
+        page = self.history_pages.pop(0) if self.history_pages else {"historyId": self.history_id}
+        return _Request(lambda: page)
+
+
+def _message(message_id, labels=("INBOX", "UNREAD")):
+    return {
+        "id": message_id,
+        "threadId": f"t-{message_id}",
+        "labelIds": list(labels),
+        "internalDate": str(int(datetime(2026, 10, 1, tzinfo=UTC).timestamp() * 1000)),
+        "payload": {
+            "headers": [{"name": "Subject", "value": f"Subject {message_id}"}],
+            "body": {"data": base64.urlsafe_b64encode(b"hello").decode()},
+        },
+    }
+
+
+def _not_found():
+    error = Exception("Requested entity was not found")
+    error.resp = SimpleNamespace(status=404)
+    return error
+
+
+def _adapter(service, store=None, **kwargs):
+    adapter = GmailEmailAdapter(
+        "me@acme.com", cursor_store=store or InMemoryCursorStore(), **kwargs
+    )
+    adapter._client = service
+    return adapter
+
+
+# ---------------------------------------------------------------------------
+# Sync state helpers
+# ---------------------------------------------------------------------------
+
+
+def test_is_unread():
+    assert is_unread(["INBOX", "UNREAD"])
+    assert not is_unread(["INBOX"])
+    assert not is_unread(["UNREAD", "SPAM"])
+
+
+def test_email_cache_evicts_least_recently_used():
+    cache = EmailCache(max_size=2)
+    for i in range(3):
+        cache.put(_email(f"m{i}"))
+    assert "m0" not in cache
+    cache.update_labels("m1", ["INBOX"])
+    assert cache.get("m1").is_read
+
+
+def test_mailbox_index_round_trip():
+    index = MailboxIndex(cursor="9", unread=["b", "a"], complete=False)
+    assert MailboxIndex.from_state(index.to_state()) == index
+    assert MailboxIndex.from_state({}) is None
+    assert MailboxIndex.from_state({"history_id": "9", "unread": "oops"}) is None
+
+
+def _email(message_id):
+    return Email(
+        id=message_id,
+        thread_id=None,
+        from_addr="",
+        to_addrs=[],
+        cc_addrs=[],
+        subject="",
+        body="",
+        html_body=None,
+        timestamp=datetime.now(UTC),
+        labels=["UNREAD"],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Incremental fetch
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_first_fetch_primes_and_persists_cursor():
+    service = _FakeGmail(["m2", "m1"], history_id="100")
+    store = InMemoryCursorStore()
+    adapter = _adapter(service, store)
+
+    emails = await adapter.fetch_emails(max_results=10)
+
+    assert [e.id for e in emails] == ["m2", "m1"]
+    assert service.calls == Counter(getProfile=1, list=1, get=2)
+    assert await store.load("gmail", "me@acme.com") == {
+        "history_id": "100",
+        "unread": ["m2", "m1"],
+        "complete": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_unchanged_mailbox_costs_one_history_call():
+    service = _FakeGmail(["m1"])
+    adapter = _adapter(service)
+    await adapter.fetch_emails(max_results=10)
+    service.calls.clear()
+
+    emails = await adapter.fetch_emails(max_results=10)
+
+    assert [e.id for e in emails] == ["m1"]
+    assert service.calls == Counter(history=1)
+
+
+@pytest.mark.asyncio
+async def test_history_deltas_update_index_and_cache():
+    service = _FakeGmail(["m2", "m1"], history_id="100")
+    adapter = _adapter(service)
+    await adapter.fetch_emails(max_results=10)
+    service.calls.clear()
+    service.history_pages = [
+        {
+            "history": [
+                {"messagesAdded": [{"message": {"id": "m3", "labelIds": ["INBOX", "UNREAD"]}}]},
+                {"labelsRemoved": [{"message": {"id": "m1", "labelIds": ["INBOX"]}}]},
+            ],
+            "nextPageToken": "next",
+        },
+        {"history": [{"messagesDeleted": [{"message": {"id": "m2"}}]}], "historyId": "140"},
+    ]
+
+    emails = await adapter.fetch_emails(max_results=10)
+
+    assert [e.id for e in emails] == ["m3"]
+    assert service.calls == Counter(history=2, get=1)
+    assert adapter._mailbox.cursor == "140"
+    assert adapter._cache.get("m1").is_read
+
+
+@pytest.mark.asyncio
+async def test_expired_history_id_reprimes():
+    service = _FakeGmail(["m1"], history_id="100")
+    adapter = _adapter(service)
+    await adapter.fetch_emails(max_results=10)
+    service.history_error = _not_found()
+    service.history_id = "500"
+    service.calls.clear()
+
+    emails = await adapter.fetch_emails(max_results=10)
+
+    assert [e.id for e in emails] == ["m1"]
+    assert service.calls == Counter(history=1, getProfile=1, list=1)  # m1 body cached
+    assert adapter._mailbox.cursor == "500"
+
+
+@pytest.mark.asyncio
+async def test_other_history_errors_propagate():
+    service = _FakeGmail(["m1"])
+    adapter = _adapter(service)
+    await adapter.fetch_emails(max_results=10)
+    service.history_error = RuntimeError("quota exceeded")
+
+    with pytest.raises(RuntimeError, match="quota"):
+        await adapter.fetch_emails(max_results=10)
+
+
+@pytest.mark.asyncio
+async def test_restart_resumes_from_persisted_cursor():
+    store = InMemoryCursorStore()
+    await store.save(
+        "gmail", "me@acme.com", {"history_id": "77", "unread": ["m1"], "complete": True}
+    )
+    service = _FakeGmail(["ignored"])
+
+    emails = await _adapter(service, store).fetch_emails(max_results=10)
+
+    assert [e.id for e in emails] == ["m1"]
+    assert service.history_starts == ["77"]
+    assert service.calls["list"] == 0
+
+
+@pytest.mark.asyncio
+async def test_truncated_index_reprimes_when_short():
+    service = _FakeGmail(["m3", "m2", "m1"])
+    adapter = _adapter(service)
+    await adapter.fetch_emails(max_results=2)
+    assert adapter._mailbox.complete is False
+    await adapter.mark_read("m3")
+    service.calls.clear()
+
+    emails = await adapter.fetch_emails(max_results=2)
+
+    assert service.calls["list"] == 1
+    assert [e.id for e in emails] == ["m3", "m2"]  # fake still lists m3 as unread
+
+
+@pytest.mark.asyncio
+async def test_mark_read_drops_message_locally():
+    service = _FakeGmail(["m2", "m1"])
+    adapter = _adapter(service)
+    await adapter.fetch_emails(max_results=10)
+
+    await adapter.mark_read("m2")
+    emails = await adapter.fetch_emails(max_results=10)
+
+    assert [e.id for e in emails] == ["m1"]
+
+
+@pytest.mark.asyncio
+async def test_fetches_are_concurrent_and_bounded():
+    ids = [f"m{i}" for i in range(12)]
+    service = _FakeGmail(ids, delay=0.02)
+    adapter = _adapter(service, max_concurrency=4)
+
+    emails = await adapter.fetch_emails(max_results=20)
+
+    assert [e.id for e in emails] == ids
+    assert 1 < service.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_without_cursor_store_lists_but_caches():
+    service = _FakeGmail(["m1"])
+    adapter = GmailEmailAdapter("me@acme.com")
+    adapter._client = service
+
+    await adapter.fetch_emails(max_results=10)
+    await adapter.fetch_emails(max_results=10)
+
+    assert service.calls == Counter(list=2, get=1)
+
+
+@pytest.mark.asyncio
+async def test_database_cursor_store_upserts_per_employee():
+    session = AsyncMock()
+    ctx = AsyncMock()
+    ctx.__aenter__.return_value = session
+    store = DatabaseCursorStore(Mock(return_value=ctx), uuid4(), uuid4())
+
+    await store.save("gmail", "me@acme.com", {"history_id": "1"})
+
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO integration_sync_cursors" in sql
+    assert "ON CONFLICT (employee_id, provider, resource) DO UPDATE" in sql
+    session.commit.assert_awaited_once()
@@ -35,8 +35,10 @@ async def _init_gcal() -> AsyncIterator[None]:
     mock_client = AsyncMock()
     gcal_mod._client = mock_client
     gcal_mod._calendar_id = "primary"
+    gcal_mod._mirror = None
     yield
     gcal_mod._client = None
+    gcal_mod._mirror = None
 
 
 @pytest.fixture
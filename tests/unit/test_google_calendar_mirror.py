@@ -0,0 +1,358 @@
+"""
+Unit tests for the Google Calendar sync-token mirror.
+
+Covers the interval tree (against a brute-force scan), full and delta
+sync, sync-token expiry, free/busy semantics, persistence across restarts,
+webhook invalidation, and the tools' mirror / live paths.
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from empla.integrations.google_calendar import tools as gcal_mod
+from empla.integrations.google_calendar.freebusy import IntervalTree, merge_periods
+from empla.integrations.google_calendar.mirror import (
+    CalendarMirror,
+    apply_webhook_events,
+    is_busy,
+    parse_event_time,
+)
+from empla.integrations.sync_cursors import InMemoryCursorStore
+
+T0 = datetime.now(UTC).replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+
+def _at(hours: float) -> datetime:
+    return T0 + timedelta(hours=hours)
+
+
+def _event(event_id, start_h, end_h, **extra):
+    return {
+        "id": event_id,
+        "summary": f"Event {event_id}",
+        "start": {"dateTime": _at(start_h).isoformat()},
+        "end": {"dateTime": _at(end_h).isoformat()},
+        **extra,
+    }
+
+
+class _FakeCalendarAPI:
+    """Serves events.list pages and records the params of each call."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    async def __call__(self, method, path, operation, **kwargs):
+        self.calls.append(kwargs.get("params", {}))
+        page = self.pages.pop(0)
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+
+def _gone():
+    response = MagicMock(status_code=410)
+    return httpx.HTTPStatusError("Gone", request=MagicMock(), response=response)
+
+
+# ---------------------------------------------------------------------------
+# Interval tree
+# ---------------------------------------------------------------------------
+
+
+def test_interval_tree_matches_brute_force():
+    rng = random.Random(7)
+    intervals = []
+    for i in range(300):
+        start = rng.uniform(0, 500)
+        intervals.append((_at(start), _at(start + rng.uniform(0.1, 20)), i))
+    tree = IntervalTree(intervals)
+
+    for _ in range(200):
+        q = rng.uniform(-10, 520)
+        start, end = _at(q), _at(q + rng.uniform(0.1, 10))
+        expected = {v for s, e, v in intervals if s < end and e > start}
+        assert {v for _, _, v in tree.overlapping(start, end)} == expected
+
+
+def test_interval_tree_is_half_open():
+    tree = IntervalTree([(_at(1), _at(2), "a")])
+    assert tree.is_free(_at(2), _at(3))
+    assert tree.is_free(_at(0), _at(1))
+    assert not tree.is_free(_at(1.5), _at(1.6))
+    assert IntervalTree([]).is_free(_at(0), _at(1))
+
+
+def test_merge_periods_collapses_overlaps():
+    periods = merge_periods([(_at(1), _at(2), "a"), (_at(1.5), _at(3), "b"), (_at(4), _at(5), "c")])
+    assert periods == [(_at(1), _at(3)), (_at(4), _at(5))]
+
+
+def test_is_busy_follows_freebusy_rules():
+    assert is_busy(_event("a", 0, 1))
+    assert not is_busy(_event("a", 0, 1, transparency="transparent"))
+    assert not is_busy(
+        _event(
+            "a", 0, 1, attendees=[{"email": "me@x.com", "self": True, "responseStatus": "declined"}]
+        )
+    )
+
+
+def test_all_day_event_uses_calendar_time_zone():
+    start = parse_event_time("2026-10-20", ZoneInfo("America/New_York"))
+    assert start == datetime(2026, 10, 20, 4, tzinfo=UTC)
+
+
+# ---------------------------------------------------------------------------
+# Sync
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_full_sync_then_availability_is_local():
+    api = _FakeCalendarAPI(
+        [
+            {"items": [_event("a", 1, 2)], "nextPageToken": "p2"},
+            {"items": [_event("b", 3, 4, transparency="transparent")], "nextSyncToken": "s1"},
+        ]
+    )
+    mirror = CalendarMirror(api)
+
+    freshness = await mirror.ensure_fresh()
+    await mirror.ensure_fresh()
+
+    assert freshness.source == "mirror"
+    assert len(api.calls) == 2  # two pages, then nothing until stale
+    assert api.calls[1]["pageToken"] == "p2"
+    assert mirror.busy_periods(_at(0), _at(5)) == [
+        {
+            "start": _at(1).isoformat().replace("+00:00", "Z"),
+            "end": _at(2).isoformat().replace("+00:00", "Z"),
+        }
+    ]
+    assert [e["id"] for e in mirror.events_between(_at(0), _at(5), 10)] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_delta_sync_applies_changes_and_cancellations():
+    api = _FakeCalendarAPI(
+        [
+            {"items": [_event("a", 1, 2), _event("b", 3, 4)], "nextSyncToken": "s1"},
+            {
+                "items": [{"id": "a", "status": "cancelled"}, _event("c", 5, 6)],
+                "nextSyncToken": "s2",
+            },
+        ]
+    )
+    mirror = CalendarMirror(api)
+    await mirror.ensure_fresh()
+    mirror.invalidate()
+
+    await mirror.ensure_fresh()
+
+    assert api.calls[1]["syncToken"] == "s1"
+    assert [e["id"] for e in mirror.events_between(_at(0), _at(10), 10)] == ["b", "c"]
+    assert mirror.busy_periods(_at(1), _at(2)) == []
+
+
+@pytest.mark.asyncio
+async def test_expired_sync_token_falls_back_to_full_sync():
+    api = _FakeCalendarAPI(
+        [
+            {"items": [_event("a", 1, 2)], "nextSyncToken": "s1"},
+            _gone(),
+            {"items": [_event("z", 1, 2)], "nextSyncToken": "s9"},
+        ]
+    )
+    mirror = CalendarMirror(api)
+    await mirror.ensure_fresh()
+    mirror.invalidate()
+
+    await mirror.ensure_fresh()
+
+    assert "syncToken" not in api.calls[2]
+    assert [e["id"] for e in mirror.events_between(_at(0), _at(10), 10)] == ["z"]
+
+
+@pytest.mark.asyncio
+async def test_failed_delta_serves_previous_state():
+    api = _FakeCalendarAPI(
+        [{"items": [_event("a", 1, 2)], "nextSyncToken": "s1"}, RuntimeError("boom")]
+    )
+    mirror = CalendarMirror(api)
+    first = await mirror.ensure_fresh()
+    mirror.invalidate()
+
+    second = await mirror.ensure_fresh()
+
+    assert second.as_of == first.as_of
+    assert mirror.busy_periods(_at(1), _at(2)) != []
+
+
+@pytest.mark.asyncio
+async def test_failed_first_sync_raises():
+    mirror = CalendarMirror(_FakeCalendarAPI([RuntimeError("down")]))
+    with pytest.raises(RuntimeError):
+        await mirror.ensure_fresh()
+
+
+@pytest.mark.asyncio
+async def test_past_events_are_pruned():
+    past = {
+        "id": "old",
+        "start": {"dateTime": (T0 - timedelta(days=5)).isoformat()},
+        "end": {"dateTime": (T0 - timedelta(days=5, hours=-1)).isoformat()},
+    }
+    mirror = CalendarMirror(
+        _FakeCalendarAPI([{"items": [past, _event("a", 1, 2)], "nextSyncToken": "s1"}])
+    )
+    await mirror.ensure_fresh()
+    assert [e["id"] for e in mirror.events_between(T0 - timedelta(days=9), _at(5), 10)] == ["a"]
+
+
+# ---------------------------------------------------------------------------
+# Persistence and webhooks
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_restart_resumes_with_delta():
+    store = InMemoryCursorStore()
+    first = CalendarMirror(
+        _FakeCalendarAPI([{"items": [_event("a", 1, 2)], "nextSyncToken": "s1"}]),
+        cursor_store=store,
+    )
+    await first.ensure_fresh()
+
+    api = _FakeCalendarAPI([{"items": [], "nextSyncToken": "s1"}])
+    restarted = CalendarMirror(api, cursor_store=store, max_staleness_seconds=0)
+    await restarted.ensure_fresh()
+
+    assert api.calls == [{"singleEvents": "true", "maxResults": 2500, "syncToken": "s1"}]
+    assert restarted.busy_periods(_at(1), _at(2)) != []
+
+
+@pytest.mark.asyncio
+async def test_webhook_stamp_triggers_delta():
+    store = InMemoryCursorStore()
+    api = _FakeCalendarAPI(
+        [
+            {"items": [], "nextSyncToken": "s1"},
+            {"items": [_event("new", 1, 2)], "nextSyncToken": "s2"},
+        ]
+    )
+    mirror = CalendarMirror(api, cursor_store=store)
+    await mirror.ensure_fresh()
+    state = await store.load("google_calendar", "primary")
+    await store.save(
+        "google_calendar",
+        "primary",
+        {**state, "invalidated_at": datetime.now(UTC).isoformat()},
+    )
+    mirror._probed_at = 0.0
+
+    await mirror.ensure_fresh()
+
+    assert len(api.calls) == 2
+    assert mirror.busy_periods(_at(1), _at(2))
+
+
+@pytest.mark.asyncio
+async def test_apply_webhook_events_stamps_tenant_cursors():
+    session = AsyncMock()
+    await apply_webhook_events(session, uuid4(), {"resourceType": "event"})
+
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "UPDATE integration_sync_cursors" in sql
+    assert "state || " in sql
+
+
+@pytest.mark.asyncio
+async def test_apply_webhook_events_ignores_sync_handshake():
+    session = AsyncMock()
+    await apply_webhook_events(session, uuid4(), {"resourceState": "sync"})
+    session.execute.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# Tools
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def mirrored_tools():
+    api = _FakeCalendarAPI([{"items": [_event("a", 1, 2)], "nextSyncToken": "s1"}])
+    gcal_mod._client = AsyncMock()
+    gcal_mod._calendar_id = "primary"
+    gcal_mod._mirror = CalendarMirror(api)
+    yield api
+    gcal_mod._client = None
+    gcal_mod._mirror = None
+
+
+@pytest.mark.asyncio
+async def test_check_slots_answers_from_mirror(mirrored_tools):
+    slots = [
+        {"start_time": _at(h).isoformat(), "end_time": _at(h + 1).isoformat()} for h in range(4)
+    ]
+
+    result = await gcal_mod.router.execute_tool("google_calendar.check_slots", {"slots": slots})
+
+    assert [s["available"] for s in result["slots"]] == [True, False, True, True]
+    assert result["source"] == "mirror"
+    assert len(mirrored_tools.calls) == 1
+    gcal_mod._client.post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_mirror(mirrored_tools):
+    await gcal_mod.router.execute_tool(
+        "google_calendar.check_availability",
+        {"start_time": _at(0).isoformat(), "end_time": _at(1).isoformat()},
+    )
+    response = MagicMock(status_code=204)
+    gcal_mod._client.delete.return_value = response
+    mirrored_tools.pages.append(
+        {"items": [{"id": "a", "status": "cancelled"}], "nextSyncToken": "s2"}
+    )
+
+    await gcal_mod.router.execute_tool("google_calendar.delete_event", {"event_id": "a"})
+    result = await gcal_mod.router.execute_tool(
+        "google_calendar.check_availability",
+        {"start_time": _at(1).isoformat(), "end_time": _at(2).isoformat()},
+    )
+
+    assert result["available"] is True
+    assert mirrored_tools.calls[-1]["syncToken"] == "s1"
+
+
+@pytest.mark.asyncio
+async def test_check_slots_live_uses_one_freebusy_call():
+    client = AsyncMock()
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        "calendars": {
+            "primary": {"busy": [{"start": _at(1).isoformat(), "end": _at(2).isoformat()}]}
+        }
+    }
+    client.post.return_value = response
+    gcal_mod._client, gcal_mod._calendar_id, gcal_mod._mirror = client, "primary", None
+    try:
+        slots = [
+            {"start_time": _at(h).isoformat(), "end_time": _at(h + 1).isoformat()} for h in range(3)
+        ]
+        result = await gcal_mod.router.execute_tool("google_calendar.check_slots", {"slots": slots})
+    finally:
+        gcal_mod._client = None
+
+    assert [s["available"] for s in result["slots"]] == [True, False, True]
+    assert result["source"] == "live"
+    client.post.assert_awaited_once()
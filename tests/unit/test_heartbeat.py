@@ -0,0 +1,344 @@
+"""
+Unit tests for runner heartbeats (empla.services.heartbeat) and the
+employee status/health/fleet endpoints that read them.
+
+Covers hook-driven loop state, snapshot sources (including keeping the
+last value once the employee released its services), the upsert
+statement, final report on stop, the single-query status select,
+health classification, and the endpoint responses for fresh, stale,
+crashed, stopped and missing heartbeats.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from empla.api.v1.endpoints import employee_control
+from empla.core.hooks import (
+    HOOK_AFTER_INTENTION_EXECUTION,
+    HOOK_BEFORE_PERCEPTION,
+    HOOK_CYCLE_END,
+    HOOK_CYCLE_START,
+    HookRegistry,
+)
+from empla.models.heartbeat import EmployeeHeartbeat
+from empla.services.heartbeat import (
+    HeartbeatReporter,
+    runner_health,
+    runtime_status_query,
+    summarize_tool_health,
+)
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _sessionmaker(session):
+    ctx = AsyncMock()
+    ctx.__aenter__.return_value = session
+    ctx.__aexit__.return_value = False
+    return MagicMock(return_value=ctx)
+
+
+def _reporter(session=None, **kwargs) -> HeartbeatReporter:
+    return HeartbeatReporter(_sessionmaker(session or AsyncMock()), uuid4(), uuid4(), **kwargs)
+
+
+def _tool_status(name="hubspot", status="degraded"):
+    return {
+        "name": name,
+        "status": status,
+        "total_calls": 12,
+        "error_rate": 0.25,
+        "last_error": "401 token=abc",
+        "window": {"seconds": 300, "p95_ms": 840.0, "p50_ms": 120.0},
+    }
+
+
+def _heartbeat(state="running", cycle_count=7, error=None) -> EmployeeHeartbeat:
+    now = datetime.now(UTC)
+    return EmployeeHeartbeat(
+        employee_id=uuid4(),
+        tenant_id=uuid4(),
+        state=state,
+        error=error,
+        phase="idle",
+        cycle_count=cycle_count,
+        last_cycle_duration_seconds=1.5,
+        last_cycle_success=True,
+        cost_usd=0.42,
+        tool_health={},
+        pid=1234,
+        host="runner-1",
+        health_port=9100,
+        started_at=now,
+        reported_at=now,
+    )
+
+
+def _employee(status="active"):
+    return SimpleNamespace(
+        id=uuid4(),
+        name="Jordan",
+        status=status,
+        lifecycle_stage="autonomous",
+    )
+
+
+def _db(rows):
+    result = Mock()
+    result.all.return_value = rows
+    result.first.return_value = rows[0] if rows else None
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def _auth():
+    return SimpleNamespace(user_id=uuid4(), tenant_id=uuid4(), role="member")
+
+
+# ============================================================================
+# Reporter
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_hooks_track_cycle_and_phase():
+    hooks = HookRegistry()
+    reporter = _reporter()
+    reporter.register(hooks)
+
+    await hooks.emit(HOOK_CYCLE_START, employee_id=reporter.employee_id, cycle_count=3)
+    await hooks.emit(HOOK_BEFORE_PERCEPTION, employee_id=reporter.employee_id, cycle_count=3)
+    assert reporter.phase == "perception"
+    await hooks.emit(HOOK_AFTER_INTENTION_EXECUTION, employee_id=reporter.employee_id, result=None)
+    assert reporter.phase == "reflection"
+    await hooks.emit(
+        HOOK_CYCLE_END,
+        employee_id=reporter.employee_id,
+        cycle_count=3,
+        duration_seconds=2.34567,
+        success=False,
+    )
+
+    snapshot = reporter.snapshot()
+    assert snapshot["cycle_count"] == 3
+    assert snapshot["phase"] == "idle"
+    assert snapshot["last_cycle_duration_seconds"] == 2.346
+    assert snapshot["last_cycle_success"] is False
+
+    reporter.unregister(hooks)
+    await hooks.emit(HOOK_CYCLE_START, employee_id=reporter.employee_id, cycle_count=4)
+    assert reporter.cycle_count == 3
+
+
+def test_summarize_tool_health_drops_errors_and_histograms():
+    summary = summarize_tool_health([_tool_status()])
+
+    assert summary == {
+        "hubspot": {"status": "degraded", "calls": 12, "error_rate": 0.25, "p95_ms": 840.0}
+    }
+
+
+def test_snapshot_keeps_last_source_values():
+    sources = {"cost": 0.1234567, "tools": [_tool_status()]}
+    reporter = _reporter(
+        cost_source=lambda: sources["cost"],
+        tool_health_source=lambda: sources["tools"],
+    )
+
+    first = reporter.snapshot()
+    assert first["cost_usd"] == 0.123457
+    assert "hubspot" in first["tool_health"]
+
+    # After employee.stop() the LLM service and tool router are gone.
+    sources.update(cost=None, tools=None)
+    final = reporter.snapshot("stopped")
+
+    assert final["state"] == "stopped"
+    assert final["cost_usd"] == 0.123457
+    assert final["tool_health"] == first["tool_health"]
+
+
+@pytest.mark.asyncio
+async def test_report_upserts_on_employee_id():
+    session = AsyncMock()
+    reporter = _reporter(session, health_port=9100)
+
+    await reporter.report()
+
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO employee_heartbeats")
+    assert "ON CONFLICT (employee_id) DO UPDATE" in sql
+    assert "reported_at = now()" in sql
+    session.commit.assert_awaited_once()
+    assert reporter.reports == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_reports_clean_shutdown_and_survives_failures():
+    session = AsyncMock()
+    reporter = _reporter(session, interval_seconds=60)
+    reporter.start()
+    await asyncio.sleep(0)  # first report runs immediately
+
+    await reporter.stop()
+
+    states = [c.args[0].compile().params["state"] for c in session.execute.await_args_list]
+    assert states == ["running", "stopped"]
+    assert reporter._task is None
+
+    session.commit.side_effect = RuntimeError("db down")
+    await reporter.stop()  # logged, not raised
+    assert reporter.report_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_with_error_reports_crash():
+    session = AsyncMock()
+    reporter = _reporter(session)
+
+    await reporter.stop(error="RuntimeError: loop died")
+
+    params = session.execute.await_args.args[0].compile().params
+    assert params["state"] == "crashed"
+    assert params["error"] == "RuntimeError: loop died"
+
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+
+def test_runtime_status_query_is_one_outer_join():
+    tenant_id, employee_id = uuid4(), uuid4()
+    query = runtime_status_query(tenant_id, stale_after_seconds=45, employee_id=employee_id)
+
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "LEFT OUTER JOIN employee_heartbeats" in sql
+    assert "employee_heartbeats.reported_at < now() - " in sql
+    params = query.compile().params
+    assert tenant_id in params.values()
+    assert employee_id in params.values()
+
+
+@pytest.mark.parametrize(
+    ("heartbeat", "stale", "expected"),
+    [
+        (None, None, "unknown"),
+        (_heartbeat(), False, "healthy"),
+        (_heartbeat(), True, "stale"),
+        (_heartbeat(state="stopped"), True, "stopped"),
+        (_heartbeat(state="crashed"), False, "crashed"),
+        (_heartbeat(state="crashed"), True, "crashed"),
+    ],
+)
+def test_runner_health(heartbeat, stale, expected):
+    assert runner_health(heartbeat, stale) == expected
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_fleet_status_counts_stale_runners():
+    rows = [
+        (_employee(), _heartbeat(), False),
+        (_employee(), _heartbeat(), True),
+        (_employee(status="stopped"), None, None),
+    ]
+    db = _db(rows)
+
+    fleet = await employee_control.get_fleet_status(db, _auth())
+
+    db.execute.assert_awaited_once()
+    assert fleet.total == 3
+    assert fleet.healthy == 1
+    assert fleet.unhealthy == 1
+    healthy, stale, unknown = fleet.items
+    assert healthy.is_running
+    assert healthy.cycle_count == 7
+    assert healthy.heartbeat.host == "runner-1"
+    assert not stale.is_running
+    assert stale.has_error
+    assert stale.last_error.startswith("No heartbeat since")
+    assert unknown.health == "unknown"
+    assert unknown.heartbeat is None
+
+
+@pytest.mark.asyncio
+async def test_fleet_status_counts_crashed_runners_as_unhealthy():
+    crashed = _heartbeat(state="crashed", error="RuntimeError: loop died")
+    db = _db([(_employee(), crashed, False), (_employee(), _heartbeat(state="stopped"), True)])
+
+    fleet = await employee_control.get_fleet_status(db, _auth())
+
+    assert fleet.unhealthy == 1
+    item, stopped = fleet.items
+    assert item.health == "crashed"
+    assert not item.is_running
+    assert item.has_error
+    assert item.last_error == "RuntimeError: loop died"
+    assert item.heartbeat.error == "RuntimeError: loop died"
+    assert not stopped.has_error
+
+
+@pytest.mark.asyncio
+async def test_employee_status_404_when_missing():
+    with pytest.raises(HTTPException) as exc:
+        await employee_control.get_employee_status(_db([]), _auth(), uuid4())
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_employee_status_reports_paused_runner():
+    db = _db([(_employee(status="paused"), _heartbeat(), False)])
+
+    result = await employee_control.get_employee_status(db, _auth(), uuid4())
+
+    assert result.is_running
+    assert result.is_paused
+    assert result.health == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_employee_health_returns_fresh_heartbeat():
+    employee_id = uuid4()
+    db = _db([(_employee(), _heartbeat(), False)])
+
+    result = await employee_control.get_employee_health(db, _auth(), employee_id)
+
+    assert result.employee_id == employee_id
+    assert result.health == "healthy"
+    assert result.heartbeat.cost_usd == 0.42
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("heartbeat", "stale"),
+    [
+        (None, None),
+        (_heartbeat(), True),
+        (_heartbeat(state="stopped"), False),
+        (_heartbeat(state="crashed"), False),
+    ],
+)
+async def test_employee_health_503_unless_healthy(heartbeat, stale):
+    db = _db([(_employee(), heartbeat, stale)])
+
+    with pytest.raises(HTTPException) as exc:
+        await employee_control.get_employee_health(db, _auth(), uuid4())
+    assert exc.value.status_code == 503
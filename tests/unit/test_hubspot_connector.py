@@ -71,6 +71,7 @@ class TestDeals:
         result = await router.execute_tool("hubspot.get_pipeline_metrics", {})
         assert result["deal_count"] == 1
         assert result["total_value"] == 50000.0
+        assert result["by_stage"]["closedwon"] == {"count": 1, "value": 30000.0}
 
     @pytest.mark.asyncio
     async def test_get_pipeline_metrics_paginates(self, client: AsyncMock) -> None:
@@ -114,9 +115,10 @@ class TestDeals:
                 ]
             }
         )
-        deals = await router.execute_tool("hubspot.get_deals", {})
-        assert len(deals) == 1
-        assert deals[0]["name"] == "Acme"
+        result = await router.execute_tool("hubspot.get_deals", {})
+        assert len(result["deals"]) == 1
+        assert result["deals"][0]["name"] == "Acme"
+        assert result["source"] == "live"
 
     @pytest.mark.asyncio
     async def test_get_deals_filtered_uses_search_api(self, client: AsyncMock) -> None:
@@ -214,6 +216,6 @@ class TestContacts:
                 ]
             }
         )
-        results = await router.execute_tool("hubspot.search_contacts", {"query": "acme"})
-        assert len(results) == 1
-        assert results[0]["name"] == "Alice Smith"
+        result = await router.execute_tool("hubspot.search_contacts", {"query": "acme"})
+        assert len(result["contacts"]) == 1
+        assert result["contacts"][0]["name"] == "Alice Smith"
@@ -0,0 +1,360 @@
+"""
+Unit tests for the local HubSpot CRM mirror.
+
+Covers row mapping and the out-of-order upsert guard, webhook application
+(in-place updates, deletions, invalidation), the seed / delta-sync
+freshness policy, and the tools' mirror-first reads with live fallback.
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from empla.integrations.hubspot import tools as hubspot_mod
+from empla.integrations.hubspot.mirror import (
+    DEALS,
+    Freshness,
+    HubSpotMirror,
+    apply_webhook_events,
+    contact_tsquery,
+    object_row,
+    parse_timestamp,
+    upsert_statement,
+)
+from empla.integrations.hubspot.tools import router
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class _RecordingSession:
+    """Captures compiled statements; every UPDATE reports ``rowcount`` rows."""
+
+    def __init__(self, rowcount=1):
+        self.rowcount = rowcount
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(_sql(stmt))
+        return SimpleNamespace(rowcount=self.rowcount)
+
+
+def _sessionmaker(session=None):
+    session = session or AsyncMock()
+    ctx = AsyncMock()
+    ctx.__aenter__.return_value = session
+    ctx.__aexit__.return_value = False
+    return Mock(return_value=ctx), session
+
+
+def _state(*, seeded=True, synced_ago=10.0, invalidated_ago=None):
+    synced_at = datetime.now(UTC) - timedelta(seconds=synced_ago)
+    return SimpleNamespace(
+        seeded_at=synced_at if seeded else None,
+        synced_at=synced_at,
+        watermark=synced_at,
+        invalidated_at=(
+            datetime.now(UTC) - timedelta(seconds=invalidated_ago)
+            if invalidated_ago is not None
+            else None
+        ),
+    )
+
+
+# ============================================================================
+# Row mapping
+# ============================================================================
+
+
+def test_parse_timestamp_formats():
+    assert parse_timestamp("2026-10-18T12:00:00Z") == NOW
+    assert parse_timestamp(str(int(NOW.timestamp() * 1000))) == NOW
+    assert parse_timestamp(int(NOW.timestamp() * 1000)) == NOW
+    assert parse_timestamp("") is None
+    assert parse_timestamp("not a date") is None
+
+
+def test_object_row_maps_properties():
+    tenant_id = uuid4()
+    row = object_row(
+        DEALS,
+        {
+            "id": "42",
+            "updatedAt": "2026-10-18T12:00:00Z",
+            "properties": {"dealname": "Acme", "dealstage": "contractsent", "amount": "1500.5"},
+        },
+        tenant_id,
+        NOW,
+    )
+    assert row["external_id"] == "42"
+    assert row["stage"] == "contractsent"
+    assert row["amount"] == 1500.5
+    assert row["close_date"] is None
+    assert row["remote_updated_at"] == NOW
+    assert row["deleted_at"] is None
+
+
+def test_upsert_never_lets_older_data_win():
+    row = object_row(DEALS, {"id": "1", "properties": {}}, uuid4(), NOW)
+    sql = _sql(upsert_statement(DEALS, [row]))
+    assert "ON CONFLICT ON CONSTRAINT uq_crm_deals_external DO UPDATE" in sql
+    assert "crm_deals.remote_updated_at <= excluded.remote_updated_at" in sql
+    assert "THEN excluded.stage ELSE crm_deals.stage END" in sql
+
+
+@pytest.mark.asyncio
+async def test_seed_marks_listed_rows_seen_even_when_a_webhook_was_newer():
+    # A webhook stamped the deal with an event time later than the listing's
+    # hs_lastmodifieddate: the data is kept, but the row must not be swept.
+    sessionmaker, session = _sessionmaker()
+    listing = {"results": [{"id": "1", "updatedAt": "2026-10-18T11:00:00Z", "properties": {}}]}
+    mirror = HubSpotMirror(sessionmaker, uuid4(), AsyncMock(return_value=listing))
+    mirror._save_state = AsyncMock()
+
+    await mirror.seed("deals")
+
+    upsert, sweep = (_sql(c.args[0]) for c in session.execute.await_args_list)
+    assert "synced_at = greatest(crm_deals.synced_at, excluded.synced_at)" in upsert
+    assert "DO UPDATE SET" in upsert
+    assert "WHERE" not in upsert.split("DO UPDATE SET")[1]
+    assert "crm_deals.synced_at < " in sweep
+
+
+def test_contact_tsquery_prefix_matches_words():
+    assert contact_tsquery("Jane  acme.com") == "jane:* & acme:* & com:*"
+    assert contact_tsquery("'; drop") == "drop:*"
+    assert contact_tsquery("  ") == ""
+
+
+def test_freshness_to_dict():
+    data = Freshness("mirror", NOW - timedelta(seconds=90)).to_dict(now=NOW)
+    assert data == {"source": "mirror", "as_of": "2026-10-18T11:58:30+00:00", "stale_seconds": 90.0}
+    assert Freshness("mirror", None).to_dict()["stale_seconds"] is None
+
+
+# ============================================================================
+# Webhooks
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_property_change_updates_column_in_place():
+    session = _RecordingSession()
+    await apply_webhook_events(
+        session,
+        uuid4(),
+        [
+            {
+                "subscriptionType": "deal.propertyChange",
+                "objectId": 7,
+                "propertyName": "dealstage",
+                "propertyValue": "closedwon",
+                "occurredAt": int(NOW.timestamp() * 1000),
+            }
+        ],
+    )
+    [sql] = session.statements
+    assert sql.startswith("UPDATE crm_deals SET stage=")
+    assert "crm_deals.remote_updated_at <= " in sql
+    assert "jsonb_build_object" in sql
+
+
+@pytest.mark.asyncio
+async def test_unapplied_events_invalidate_object_type():
+    session = _RecordingSession(rowcount=0)
+    await apply_webhook_events(
+        session,
+        uuid4(),
+        [
+            {"subscriptionType": "deal.creation", "objectId": 1},
+            {
+                "subscriptionType": "object.propertyChange",
+                "objectTypeId": "0-1",
+                "objectId": 2,
+                "propertyName": "email",
+                "propertyValue": "a@b.com",
+            },
+        ],
+    )
+    invalidation = session.statements[-1]
+    assert invalidation.startswith("UPDATE crm_sync_state SET invalidated_at=now()")
+    assert "crm_sync_state.object_type IN" in invalidation
+
+
+@pytest.mark.asyncio
+async def test_deletions_apply_without_invalidating():
+    session = _RecordingSession()
+    await apply_webhook_events(
+        session,
+        uuid4(),
+        [
+            {"subscriptionType": "deal.deletion", "objectId": 1},
+            {"subscriptionType": "contact.privacyDeletion", "objectId": 2},
+            {"subscriptionType": "company.creation", "objectId": 3},  # not mirrored
+        ],
+    )
+    assert len(session.statements) == 2
+    assert session.statements[0].startswith("UPDATE crm_deals SET")
+    assert "deleted_at=" in session.statements[0]
+    assert session.statements[1].startswith("DELETE FROM crm_contacts")
+
+
+def test_handler_registered_for_hubspot():
+    from empla.integrations.webhooks import get_webhook_handlers
+
+    assert apply_webhook_events in get_webhook_handlers("hubspot")
+    assert get_webhook_handlers("unknown_provider") == []
+
+
+# ============================================================================
+# Freshness policy
+# ============================================================================
+
+
+def test_needs_sync():
+    mirror = HubSpotMirror(Mock(), uuid4(), AsyncMock(), max_staleness_seconds=60)
+    assert not mirror.needs_sync(_state(synced_ago=10))
+    assert mirror.needs_sync(_state(synced_ago=120))
+    assert mirror.needs_sync(_state(synced_ago=10, invalidated_ago=5))
+    assert not mirror.needs_sync(_state(synced_ago=10, invalidated_ago=30))
+
+
+@pytest.mark.asyncio
+async def test_ensure_fresh_seeds_once():
+    mirror = HubSpotMirror(Mock(), uuid4(), AsyncMock())
+    seeded = _state()
+    mirror._load_state = AsyncMock(side_effect=[None, seeded, seeded, seeded])
+    mirror.seed = AsyncMock(return_value=3)
+    mirror.sync_delta = AsyncMock()
+
+    first = await mirror.ensure_fresh("deals")
+    second = await mirror.ensure_fresh("deals")
+
+    mirror.seed.assert_awaited_once_with("deals")
+    mirror.sync_delta.assert_not_awaited()
+    assert first.source == second.source == "mirror"
+    assert first.as_of == seeded.synced_at
+
+
+@pytest.mark.asyncio
+async def test_ensure_fresh_serves_stale_mirror_when_delta_fails():
+    mirror = HubSpotMirror(Mock(), uuid4(), AsyncMock(), max_staleness_seconds=60)
+    stale = _state(synced_ago=600)
+    mirror._load_state = AsyncMock(return_value=stale)
+    mirror.sync_delta = AsyncMock(side_effect=RuntimeError("429"))
+
+    freshness = await mirror.ensure_fresh("contacts")
+
+    assert freshness.as_of == stale.synced_at
+    assert freshness.to_dict()["stale_seconds"] >= 600
+
+
+@pytest.mark.asyncio
+async def test_sync_delta_searches_from_watermark():
+    sessionmaker, session = _sessionmaker()
+    call = AsyncMock(
+        side_effect=[
+            {
+                "results": [{"id": "1", "updatedAt": "2026-10-18T12:00:00Z", "properties": {}}],
+                "paging": {"next": {"after": "100"}},
+            },
+            {"results": []},
+        ]
+    )
+    mirror = HubSpotMirror(sessionmaker, uuid4(), call)
+    state = _state()
+    state.watermark = NOW - timedelta(hours=1)
+    mirror._load_state = AsyncMock(return_value=state)
+
+    fetched = await mirror.sync_delta("deals")
+
+    assert fetched == 1
+    method, path, _operation = call.call_args_list[0].args
+    body = call.call_args_list[0].kwargs["json"]
+    assert (method, path) == ("post", "/crm/v3/objects/deals/search")
+    [flt] = body["filterGroups"][0]["filters"]
+    assert flt["propertyName"] == "hs_lastmodifieddate"
+    assert flt["value"] == str(int(state.watermark.timestamp() * 1000))
+    assert call.call_args_list[1].kwargs["json"]["after"] == "100"
+    # Page upserts + final sync-state upsert
+    assert session.execute.await_count == 2
+    assert "crm_sync_state" in _sql(session.execute.await_args_list[-1].args[0])
+
+
+# ============================================================================
+# Tools
+# ============================================================================
+
+
+@pytest.fixture
+def mirror():
+    mirror = MagicMock(spec=HubSpotMirror)
+    mirror.tenant_id = uuid4()
+    mirror.ensure_fresh = AsyncMock(return_value=Freshness("mirror", datetime.now(UTC)))
+    hubspot_mod._client = AsyncMock()
+    hubspot_mod._mirror = mirror
+    yield mirror
+    hubspot_mod._mirror = None
+    hubspot_mod._client = None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_metrics_from_mirror(mirror):
+    mirror.pipeline_metrics = AsyncMock(
+        return_value={"total_value": 50_000.0, "deal_count": 2, "total_deals": 5}
+    )
+    mirror.stage_counts = AsyncMock(return_value={"closedwon": {"count": 3, "value": 9.0}})
+
+    result = await router.execute_tool("hubspot.get_pipeline_metrics", {})
+
+    assert result["coverage"] == 0.5
+    assert result["by_stage"]["closedwon"]["count"] == 3
+    assert result["source"] == "mirror"
+    assert result["stale_seconds"] is not None
+    hubspot_mod._client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_deals_and_contacts_from_mirror(mirror):
+    mirror.deals = AsyncMock(return_value=[{"id": "1", "name": "Acme"}])
+    mirror.search_contacts = AsyncMock(return_value=[{"id": "2", "name": "Jane"}])
+
+    deals = await router.execute_tool("hubspot.get_deals", {"stage": "contractsent"})
+    contacts = await router.execute_tool("hubspot.search_contacts", {"query": "jane"})
+
+    mirror.deals.assert_awaited_once_with("contractsent", 50)
+    assert deals["deals"] == [{"id": "1", "name": "Acme"}]
+    assert contacts["contacts"][0]["name"] == "Jane"
+    assert contacts["source"] == "mirror"
+
+
+@pytest.mark.asyncio
+async def test_mirror_failure_falls_back_to_live(mirror):
+    mirror.ensure_fresh.side_effect = RuntimeError("database unavailable")
+    resp = MagicMock(status_code=200)
+    resp.json.return_value = {"results": []}
+    hubspot_mod._client.get.return_value = resp
+
+    result = await router.execute_tool("hubspot.get_deals", {})
+
+    assert result["deals"] == []
+    assert result["source"] == "live"
+    hubspot_mod._client.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_init_builds_mirror_only_with_sessionmaker():
+    try:
+        await router.initialize({"access_token": "t", "sessionmaker": Mock(), "tenant_id": uuid4()})
+        assert isinstance(hubspot_mod._mirror, HubSpotMirror)
+        await router.initialize({"access_token": "t"})
+        assert hubspot_mod._mirror is None
+    finally:
+        await router.shutdown()
@@ -295,17 +295,15 @@ class TestInboxEndpoints:
 
         async def _execute(stmt):
             nonlocal count_call
-            # List endpoint runs 3 queries in order: filtered count,
-            # unread count, page select. We return sensible scalars
-            # for each by call index.
+            # List endpoint runs the page select, then the tenant-wide
+            # unread count. The short first page is its own total, so the
+            # filtered count is skipped.
             count_call += 1
             result = Mock()
-            if count_call == 1:  # filtered total
-                result.scalar = Mock(return_value=2)
-            elif count_call == 2:  # tenant-wide unread
+            if count_call == 1:  # page select
+                result.scalars = Mock(return_value=Mock(all=Mock(return_value=rows)))
+            else:  # tenant-wide unread
                 result.scalar = Mock(return_value=1)
-            else:  # page select
-                result.scalars = Mock(return_value=iter(rows))
             return result
 
         db.execute = _execute
@@ -451,7 +449,7 @@ async def test_list_is_scoped_to_auth_tenant():
         captured.append(stmt)
         result = Mock()
         result.scalar = Mock(return_value=0)
-        result.scalars = Mock(return_value=iter([]))
+        result.scalars = Mock(return_value=Mock(all=Mock(return_value=[])))
         return result
 
     db.execute = _execute
@@ -532,12 +530,14 @@ async def test_list_excludes_priority_off_from_all_counts():
     tenant = uuid4()
     db = AsyncMock()
     captured = []
+    # A full page plus one, so the filtered total has to be counted
+    rows = [_fake_message(tenant=tenant) for _ in range(51)]
 
     async def _execute(stmt):
         captured.append(stmt)
         r = Mock()
         r.scalar = Mock(return_value=0)
-        r.scalars = Mock(return_value=iter([]))
+        r.scalars = Mock(return_value=Mock(all=Mock(return_value=rows)))
         return r
 
     db.execute = _execute
@@ -7,7 +7,12 @@ from uuid import UUID, uuid4
 import pytest
 
 from empla.core.tools.base import Tool
-from empla.core.tools.health import IntegrationHealth, IntegrationHealthMonitor
+from empla.core.tools.health import (
+    IntegrationHealth,
+    IntegrationHealthMonitor,
+    LatencyHistogram,
+    SlidingLatencyWindow,
+)
 from empla.core.tools.registry import ToolRegistry
 from empla.core.tools.router import ToolRouter
 
@@ -235,3 +240,106 @@ class TestToolRouterHealthIntegration:
     def test_get_all_integration_health(self, router_with_tools: ToolRouter) -> None:
         all_health = router_with_tools.get_all_integration_health()
         assert isinstance(all_health, list)
+
+
+# ============================================================================
+# Sliding-window latency histograms
+# ============================================================================
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_bucket_error(self) -> None:
+        h = LatencyHistogram()
+        for ms in range(1, 1001):
+            h.record(float(ms))
+        assert h.percentile(0.50) == pytest.approx(500, rel=0.07)
+        assert h.percentile(0.95) == pytest.approx(950, rel=0.07)
+        assert h.percentile(0.99) == pytest.approx(990, rel=0.07)
+
+    def test_percentile_never_exceeds_max(self) -> None:
+        h = LatencyHistogram()
+        h.record(100.0)
+        assert h.percentile(0.99) <= 100.0
+
+    def test_merge_equals_combined_recording(self) -> None:
+        a, b, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for ms in (5.0, 50.0, 500.0):
+            a.record(ms)
+            combined.record(ms)
+        for ms in (20.0, 2000.0):
+            b.record(ms, error=True)
+            combined.record(ms, error=True)
+
+        merged = LatencyHistogram.merged([a, b])
+
+        assert merged.buckets == combined.buckets
+        assert merged.to_dict() == combined.to_dict()
+        assert merged.error_rate == 0.4
+
+
+class TestSlidingWindow:
+    def test_old_slots_leave_the_window(self) -> None:
+        clock = _Clock()
+        window = SlidingLatencyWindow(window_seconds=120, slot_seconds=60, clock=clock)
+        window.record(5000.0, error=True)
+        clock.now += 60
+        window.record(10.0)
+
+        assert window.snapshot().count == 2
+        clock.now += 60
+        assert window.snapshot().count == 1
+        assert window.snapshot().error_rate == 0.0
+
+    def test_recovered_integration_reports_healthy(self) -> None:
+        """Lifetime error rate stays high, but status follows the window."""
+        clock = _Clock()
+        monitor = IntegrationHealthMonitor(window_seconds=60, slot_seconds=60, clock=clock)
+        for _ in range(10):
+            monitor.record("hubspot", success=False, duration_ms=30000.0, error="HTTP 503")
+        assert monitor.get_status("hubspot")["status"] == "down"
+
+        clock.now += 60
+        monitor.record("hubspot", success=True, duration_ms=120.0)
+        status = monitor.get_status("hubspot")
+
+        assert status["error_rate"] > 0.5
+        assert status["status"] == "healthy"
+        assert status["window"]["p95_ms"] == pytest.approx(120.0, rel=0.07)
+
+
+class TestPerToolLatency:
+    def test_tool_windows_are_tracked_separately(self) -> None:
+        monitor = IntegrationHealthMonitor()
+        for _ in range(5):
+            monitor.record("hubspot", success=True, duration_ms=50.0, tool="hubspot.get_deals")
+            monitor.record(
+                "hubspot", success=False, duration_ms=900.0, error="500", tool="hubspot.search"
+            )
+
+        deals = monitor.get_tool_status("hubspot.get_deals")["window"]
+        search = monitor.get_tool_status("hubspot.search")["window"]
+
+        assert deals["calls"] == 5
+        assert deals["error_rate"] == 0.0
+        assert search["error_rate"] == 1.0
+        assert monitor.get_status("hubspot")["window"]["calls"] == 10
+        assert monitor.get_beliefs()[0]["belief_object"]["failing_tools"] == ["hubspot.search"]
+
+    @pytest.mark.asyncio
+    async def test_router_records_per_tool_window(
+        self, router_with_tools: ToolRouter, employee_id: UUID
+    ) -> None:
+        await router_with_tools.execute_tool_call(employee_id, "hubspot.get_deals", {})
+        await router_with_tools.execute_tool_call(employee_id, "hubspot.broken", {})
+
+        assert router_with_tools.get_tool_health("hubspot.get_deals")["window"]["calls"] == 1
+        assert router_with_tools.get_tool_health("hubspot.broken")["window"]["error_rate"] == 1.0
+        assert router_with_tools.health_monitor.get_all_tool_status()
@@ -0,0 +1,253 @@
+"""
+Unit tests for the outbound integration request scheduler.
+
+Covers Retry-After parsing, 429 retry with lane pausing, token-bucket
+pacing per provider and per credential, priority ordering, the shared
+connection pool, and per-provider stats.
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from empla.integrations.http import (
+    DEFAULT_LIMITS,
+    Priority,
+    ProviderLimits,
+    RateLimit,
+    RequestScheduler,
+    _Bucket,
+    credential_key,
+    parse_retry_after,
+    request_priority,
+)
+
+
+def _scheduler(handler, *, limits=None, **kwargs):
+    scheduler = RequestScheduler(limits=limits or {}, **kwargs)
+    scheduler._transports["crm"] = httpx.MockTransport(handler)
+    return scheduler
+
+
+def _responses(*statuses, retry_after="0"):
+    """Handler returning the given statuses in order (then 200s)."""
+    queue = list(statuses)
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        status = queue.pop(0) if queue else 200
+        headers = {"Retry-After": retry_after} if status == 429 and retry_after else {}
+        return httpx.Response(status, headers=headers, json={"ok": status == 200})
+
+    return handler, seen
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    now = datetime(2026, 10, 18, 12, 0, 0, tzinfo=UTC)
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Sun, 18 Oct 2026 12:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_credential_key_does_not_leak_token():
+    key = credential_key("pat-secret-token")
+    assert "secret" not in key
+    assert key == credential_key("pat-secret-token")
+    assert credential_key(None) == "-"
+
+
+# ---------------------------------------------------------------------------
+# Retries
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_429_with_retry_after_is_retried():
+    handler, seen = _responses(429, 429)
+    scheduler = _scheduler(handler)
+    async with scheduler.client("crm", credential="t", base_url="https://api.test") as client:
+        response = await client.get("/deals")
+
+    assert response.status_code == 200
+    assert len(seen) == 3
+    stats = scheduler.collect_stats()["crm"]
+    assert stats["throttled"] == 2
+    assert stats["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_cap_returns_429():
+    handler, seen = _responses(429, retry_after="3600")
+    scheduler = _scheduler(handler, max_retry_after=5.0)
+    async with scheduler.client("crm", credential="t", base_url="https://api.test") as client:
+        response = await client.get("/deals")
+
+    assert response.status_code == 429
+    assert len(seen) == 1
+    # The credential's lane stays paused so queued calls do not pile on.
+    assert scheduler._lane("crm").credential_bucket(credential_key("t")).paused_until > 0
+
+
+@pytest.mark.asyncio
+async def test_bare_503_is_not_retried():
+    handler, seen = _responses(503)
+    scheduler = _scheduler(handler)
+    async with scheduler.client("crm", credential="t", base_url="https://api.test") as client:
+        response = await client.get("/deals")
+
+    assert response.status_code == 503
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded():
+    handler, seen = _responses(429, 429, 429, 429, 429)
+    scheduler = _scheduler(handler, max_retries=2)
+    async with scheduler.client("crm", credential="t", base_url="https://api.test") as client:
+        response = await client.get("/deals")
+
+    assert response.status_code == 429
+    assert len(seen) == 3
+
+
+# ---------------------------------------------------------------------------
+# Pacing and priority
+# ---------------------------------------------------------------------------
+
+
+def _admitted(limit, window):
+    """Requests a cold bucket lets through in ``window`` seconds, sent as fast as allowed."""
+    bucket = _Bucket(limit)
+    bucket.updated = now = 0.0
+    admitted = 0
+    while True:
+        wait = bucket.delay(now)
+        if wait > 0:
+            now += wait + 1e-9  # step past float rounding at the refill point
+            if now >= window:
+                return admitted
+            continue
+        bucket.take()
+        admitted += 1
+
+
+@pytest.mark.parametrize("bucket", ["provider", "credential"])
+def test_hubspot_buckets_stay_under_the_ten_second_quota(bucket):
+    limit = getattr(DEFAULT_LIMITS["hubspot"], bucket)
+
+    # HubSpot allows 110 requests per 10 s per account; keep some headroom.
+    assert _admitted(limit, 10.0) <= 105
+
+
+@pytest.mark.asyncio
+async def test_credential_bucket_paces_requests():
+    handler, seen = _responses()
+    limits = {"crm": ProviderLimits(credential=RateLimit(rate=50.0, burst=2))}
+    scheduler = _scheduler(handler, limits=limits)
+    async with scheduler.client("crm", credential="t", base_url="https://api.test") as client:
+        started = time.monotonic()
+        await asyncio.gather(*(client.get("/deals") for _ in range(6)))
+        elapsed = time.monotonic() - started
+
+    # Burst of 2, then 4 more at 50/s.
+    assert elapsed >= 0.07
+    assert len(seen) == 6
+
+
+@pytest.mark.asyncio
+async def test_paused_credential_does_not_block_others():
+    scheduler = RequestScheduler(limits={})
+    scheduler._pause("crm", "slow", 30.0)
+
+    waited = await asyncio.wait_for(scheduler.acquire("crm", "fast"), timeout=1.0)
+
+    assert waited < 0.5
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_overtake_background():
+    limits = {"crm": ProviderLimits(provider=RateLimit(rate=100.0, burst=1))}
+    scheduler = RequestScheduler(limits=limits)
+    await scheduler.acquire("crm", "t")  # drain the burst
+    order = []
+
+    async def call(name, priority):
+        with request_priority(priority):
+            await scheduler.acquire("crm", "t")
+        order.append(name)
+
+    tasks = [asyncio.create_task(call(f"bg{i}", Priority.BACKGROUND)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(call("user", Priority.INTERACTIVE)))
+    await asyncio.gather(*tasks)
+
+    assert order[0] == "user"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    limits = {"crm": ProviderLimits(provider=RateLimit(rate=1.0, burst=1))}
+    scheduler = RequestScheduler(limits=limits)
+    await scheduler.acquire("crm", "t")
+    task = asyncio.create_task(scheduler.acquire("crm", "t"))
+    await asyncio.sleep(0)
+    assert scheduler.collect_stats()["crm"]["queue_depth"] == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert scheduler.collect_stats()["crm"]["queue_depth"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Pool and stats
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_closing_a_client_keeps_the_shared_pool():
+    handler, _ = _responses()
+    scheduler = _scheduler(handler)
+    first = scheduler.client("crm", credential="old", base_url="https://api.test")
+    await first.aclose()
+
+    async with scheduler.client("crm", credential="new", base_url="https://api.test") as client:
+        response = await client.get("/deals")
+
+    assert response.status_code == 200
+
+
+def test_http2_without_h2_raises_runtime_error():
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        with pytest.raises(RuntimeError, match="httpx\\[http2\\]"):
+            RequestScheduler(http2=True)._transport("crm")
+    else:
+        pytest.skip("h2 installed")
+
+
+@pytest.mark.asyncio
+async def test_collect_stats_resets_interval_counters():
+    handler, _ = _responses()
+    scheduler = _scheduler(handler)
+    async with scheduler.client("crm", credential="t", base_url="https://api.test") as client:
+        await client.get("/deals")
+
+    first = scheduler.collect_stats()["crm"]
+    second = scheduler.collect_stats()["crm"]
+
+    assert first["requests"] == 1
+    assert second["requests"] == 0
+    assert second["wait_ms_max"] == 0.0
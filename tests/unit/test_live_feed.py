@@ -0,0 +1,345 @@
+"""
+Unit tests for the live SSE feeds.
+
+Covers subscription filtering and overflow, the tail's poll (overlap
+re-scan, dedupe, fan-out), cursor backfill, and the stream generator's
+replay, reset and keepalive frames.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from empla.api.sse import _event_stream, format_event
+from empla.models.activity import EmployeeActivity
+from empla.services.live_feed import (
+    FeedEvent,
+    FeedSpec,
+    LiveFeedHub,
+    Subscription,
+    _FeedTail,
+    feed_cursor,
+)
+from empla.services.pagination import InvalidCursorError, decode_cursor
+
+BASE = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+
+SPEC = FeedSpec(
+    name="activity",
+    model=EmployeeActivity,
+    serialize=lambda row: json.dumps({"id": str(row.id)}),
+)
+
+
+def _row(tenant_id, seconds: float = 0, **extra) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(), tenant_id=tenant_id, created_at=BASE + timedelta(seconds=seconds), **extra
+    )
+
+
+def _result(rows: list) -> Mock:
+    result = Mock()
+    result.all.return_value = rows
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+def _sessionmaker(*results) -> tuple[Mock, AsyncMock]:
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=[_result(r) for r in results])
+
+    @asynccontextmanager
+    async def _session():
+        yield session
+
+    return Mock(side_effect=_session), session
+
+
+def _subscription(tenant_id, match=None, maxsize: int = 10) -> Subscription:
+    return Subscription(
+        feed=SPEC.name, tenant_id=tenant_id, match=match, queue=asyncio.Queue(maxsize=maxsize)
+    )
+
+
+# ============================================================================
+# Subscription
+# ============================================================================
+
+
+def test_subscription_filters_by_tenant_and_match():
+    tenant = uuid4()
+    sub = _subscription(tenant, match=lambda row: row.employee_id == "e1")
+
+    assert sub.wants(_row(tenant, employee_id="e1"))
+    assert not sub.wants(_row(tenant, employee_id="e2"))
+    assert not sub.wants(_row(uuid4(), employee_id="e1"))
+
+
+def test_full_queue_marks_overflow():
+    sub = _subscription(uuid4(), maxsize=1)
+    event = FeedEvent(id=uuid4(), cursor="c", data="{}")
+
+    sub.offer(event)
+    assert not sub.overflowed
+    sub.offer(event)
+    assert sub.overflowed
+    assert sub.queue.qsize() == 1
+
+
+# ============================================================================
+# Tail
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_poll_publishes_only_unseen_rows_to_matching_subscribers():
+    tenant = uuid4()
+    old = _row(tenant, -1)
+    new = _row(tenant, 1)
+    other = _row(uuid4(), 2)
+    sessionmaker, session = _sessionmaker([old, new, other], [new, other])
+    hub = LiveFeedHub(sessionmaker, overlap_seconds=5)
+    tail = _FeedTail(SPEC, high_water=BASE, seen={old.id: old.created_at})
+    sub = _subscription(tenant)
+    tail.subscribers.add(sub)
+
+    await hub._poll(tail)
+
+    assert sub.queue.qsize() == 1
+    event = sub.queue.get_nowait()
+    assert event.id == new.id
+    assert decode_cursor(event.cursor, "activity", 2) == [new.created_at, new.id]
+    assert tail.high_water == other.created_at
+    assert set(tail.seen) == {old.id, new.id, other.id}
+    load = session.execute.await_args_list[1].args[0]
+    assert "IN" in str(load)  # only the unseen ids are loaded
+
+
+@pytest.mark.asyncio
+async def test_poll_prunes_seen_ids_behind_the_overlap():
+    tenant = uuid4()
+    stale = _row(tenant, -60)
+    sessionmaker, _ = _sessionmaker([])
+    hub = LiveFeedHub(sessionmaker, overlap_seconds=5)
+    tail = _FeedTail(SPEC, high_water=BASE, seen={stale.id: stale.created_at})
+
+    await hub._poll(tail)
+
+    assert tail.seen == {}
+
+
+@pytest.mark.asyncio
+async def test_poll_pages_through_large_bursts():
+    tenant = uuid4()
+    burst = [_row(tenant, i) for i in range(3)]
+    sessionmaker, session = _sessionmaker(burst[:2], burst[:2], burst[2:], burst[2:])
+    hub = LiveFeedHub(sessionmaker, batch_size=2)
+    tail = _FeedTail(SPEC, high_water=BASE)
+    sub = _subscription(tenant)
+    tail.subscribers.add(sub)
+
+    await hub._poll(tail)
+
+    assert [sub.queue.get_nowait().id for _ in range(3)] == [r.id for r in burst]
+    assert session.execute.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_priming_poll_publishes_nothing():
+    tenant = uuid4()
+    row = _row(tenant)
+    sessionmaker, session = _sessionmaker([row])
+    hub = LiveFeedHub(sessionmaker)
+    tail = _FeedTail(SPEC, high_water=BASE)
+    sub = _subscription(tenant)
+    tail.subscribers.add(sub)
+
+    await hub._poll(tail, publish=False)
+
+    assert sub.queue.empty()
+    assert row.id in tail.seen
+    assert session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_stops_the_tail():
+    session = AsyncMock()
+    now = Mock()
+    now.scalar_one.return_value = BASE
+    session.execute = AsyncMock(side_effect=[now, _result([])])
+
+    @asynccontextmanager
+    async def _session():
+        yield session
+
+    hub = LiveFeedHub(Mock(side_effect=_session), poll_interval=0.01)
+    sub = hub.subscribe(SPEC, uuid4())
+    task = hub._tails["activity"].task
+    assert hub.subscriber_count("activity") == 1
+
+    hub.unsubscribe(sub)
+    await asyncio.wait_for(task, timeout=1)
+
+    assert hub._tails["activity"].task is None
+    await hub.close()
+
+
+# ============================================================================
+# Backfill
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_backfill_replays_rows_after_cursor():
+    tenant = uuid4()
+    rows = [_row(tenant, i) for i in range(3)]
+    sessionmaker, _ = _sessionmaker(rows)
+    hub = LiveFeedHub(sessionmaker)
+
+    events, truncated = await hub.backfill(SPEC, tenant, feed_cursor(SPEC, _row(tenant, -1)))
+
+    assert [e.id for e in events] == [r.id for r in rows]
+    assert not truncated
+
+
+@pytest.mark.asyncio
+async def test_backfill_flags_truncation():
+    tenant = uuid4()
+    sessionmaker, _ = _sessionmaker([_row(tenant, i) for i in range(3)])
+    hub = LiveFeedHub(sessionmaker)
+
+    events, truncated = await hub.backfill(SPEC, tenant, feed_cursor(SPEC, _row(tenant)), limit=2)
+
+    assert len(events) == 2
+    assert truncated
+
+
+@pytest.mark.asyncio
+async def test_backfill_rejects_cursor_from_another_feed():
+    hub = LiveFeedHub(Mock())
+    other = FeedSpec(name="inbox", model=EmployeeActivity, serialize=str)
+    with pytest.raises(InvalidCursorError):
+        await hub.backfill(SPEC, uuid4(), feed_cursor(other, _row(uuid4())))
+
+
+# ============================================================================
+# Stream
+# ============================================================================
+
+
+def test_format_event_frame():
+    event = FeedEvent(id=uuid4(), cursor="abc", data='{"x": 1}')
+    assert format_event(event, "activity") == 'id: abc\nevent: activity\ndata: {"x": 1}\n\n'
+
+
+class FakeHub:
+    def __init__(self, backfill=((), False), queue_size: int = 10) -> None:
+        self.queue_size = queue_size
+        self.subscription = _subscription(uuid4(), maxsize=queue_size)
+        self._backfill = backfill
+        self.unsubscribed = False
+
+    def subscribe(self, spec, tenant_id, match=None):
+        return self.subscription
+
+    def unsubscribe(self, subscription):
+        self.unsubscribed = True
+
+    async def backfill(self, spec, tenant_id, cursor, *, match=None, limit=500):
+        return list(self._backfill[0]), self._backfill[1]
+
+
+def _event(data: str = "{}") -> FeedEvent:
+    return FeedEvent(id=uuid4(), cursor=f"c-{data}", data=data)
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_then_skips_duplicate_live_events():
+    replayed = _event("1")
+    live = _event("2")
+    hub = FakeHub(backfill=([replayed], False))
+    hub.subscription.queue.put_nowait(replayed)
+    hub.subscription.queue.put_nowait(live)
+
+    stream = _event_stream(hub, SPEC, uuid4(), None, "cursor", 60)
+    frames = [await anext(stream) for _ in range(3)]
+    await stream.aclose()
+
+    assert frames[0] == "retry: 3000\n\n"
+    assert frames[1] == format_event(replayed, "activity")
+    assert frames[2] == format_event(live, "activity")
+    assert hub.unsubscribed
+
+
+@pytest.mark.asyncio
+async def test_stream_resets_when_backfill_is_truncated():
+    hub = FakeHub(backfill=([], True))
+
+    frames = [f async for f in _event_stream(hub, SPEC, uuid4(), None, "cursor", 60)]
+
+    assert frames[-1].startswith("event: reset\n")
+    assert hub.unsubscribed
+
+
+@pytest.mark.asyncio
+async def test_stream_resets_slow_clients():
+    hub = FakeHub()
+    hub.subscription.overflowed = True
+
+    frames = [f async for f in _event_stream(hub, SPEC, uuid4(), None, None, 60)]
+
+    assert json.loads(frames[-1].split("data: ")[1]) == {"reason": "client fell behind"}
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_keepalive_when_idle():
+    stream = _event_stream(FakeHub(), SPEC, uuid4(), None, None, 0.01)
+    assert await anext(stream) == "retry: 3000\n\n"
+    assert await anext(stream) == ": keepalive\n\n"
+    await stream.aclose()
+
+
+# ============================================================================
+# API
+# ============================================================================
+
+
+async def _get(path: str, *, hub=None, headers=None):
+    from httpx import ASGITransport, AsyncClient
+
+    from empla.api.deps import get_current_user, get_db
+    from empla.api.main import create_app
+
+    app = create_app()
+
+    async def mock_get_db():
+        yield AsyncMock()
+
+    app.dependency_overrides[get_db] = mock_get_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(tenant_id=uuid4())
+    app.state.live_feeds = hub
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_stream_without_hub_is_a_503():
+    resp = await _get("/api/v1/activity/stream")
+    assert resp.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_stream_with_bad_last_event_id_is_a_400():
+    resp = await _get(
+        "/api/v1/activity/stream", hub=LiveFeedHub(Mock()), headers={"Last-Event-ID": "garbage"}
+    )
+    assert resp.status_code == 400
@@ -14,11 +14,13 @@ Focuses on:
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from pydantic import BaseModel
 
+from empla.core.deadline import DeadlineExceededError, deadline_scope
 from empla.llm.config import LLMConfig
 from empla.llm.models import LLMResponse, Message, TokenUsage
 
@@ -230,6 +232,32 @@ class TestGenerateWithTools:
         service.fallback.generate_with_tools.assert_not_called()
 
 
+# ============================================================================
+# Cycle deadline
+# ============================================================================
+
+
+class TestDeadline:
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_cut_off_without_fallback(self):
+        service = _make_service()
+
+        async def hang(request):
+            await asyncio.sleep(10)
+
+        service.primary.generate_with_tools = AsyncMock(side_effect=hang)
+        with deadline_scope(0.05), pytest.raises(DeadlineExceededError):
+            await service.generate_with_tools([Message(role="user", content="hi")], tools=[])
+        service.fallback.generate_with_tools.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_skips_provider(self):
+        service = _make_service()
+        with deadline_scope(0), pytest.raises(DeadlineExceededError):
+            await service.generate("test prompt")
+        service.primary.generate.assert_not_called()
+
+
 # ============================================================================
 # _track_cost_for_model
 # ============================================================================
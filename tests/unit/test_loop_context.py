@@ -0,0 +1,160 @@
+"""
+Unit tests for the per-cycle prompt context cache.
+
+Covers one assembly per cycle shared across perception, planning and goal
+evaluation, the reset between cycles, and the fallback to direct queries
+when no assembler is available.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from empla.core.loop.models import LoopConfig
+from empla.core.loop.protocols import SituationAnalysis
+from empla.core.memory.context import AssembledContext, ContextAssembler, ContextItem
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _context() -> AssembledContext:
+    return AssembledContext(
+        items=[
+            ContextItem("beliefs", ("b",), "- acme → stage: {} (confidence: 0.90)", 0.9),
+            ContextItem("facts", ("f",), "- acme → industry: retail", 0.8),
+            ContextItem("episodes", ("e",), "- [deep_reflection] focus on renewals", 0.7),
+        ]
+    )
+
+
+def _assembler(context: AssembledContext | None = None) -> Mock:
+    assembler = Mock(spec=ContextAssembler)
+    assembler.assemble = AsyncMock(return_value=context or _context())
+    return assembler
+
+
+def _host(cls, assembler=None, llm=None):
+    host = cls()
+    host.employee = Mock(id=uuid4())
+    host.config = LoopConfig(cycle_interval_seconds=1, context_token_budget=800)
+    host.memory = Mock(spec=["context"])
+    host.memory.context = assembler
+    host.beliefs = Mock()
+    host.beliefs.get_all_beliefs = AsyncMock(return_value=[])
+    host.llm_service = llm
+    host._identity_prompt = None
+    return host
+
+
+def _llm() -> Mock:
+    llm = Mock()
+    llm.generate_structured = AsyncMock(
+        return_value=(
+            Mock(),
+            SituationAnalysis(current_state_summary="ok", recommended_focus="renewals"),
+        )
+    )
+    return llm
+
+
+# ============================================================================
+# CycleContextMixin
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_context_assembled_once_per_cycle():
+    from empla.core.loop.context import CycleContextMixin
+
+    assembler = _assembler()
+    host = _host(CycleContextMixin, assembler)
+
+    first = await host._get_cycle_context()
+    second = await host._get_cycle_context()
+
+    assert first is second
+    assembler.assemble.assert_awaited_once_with(token_budget=800)
+
+    host._reset_cycle_context()
+    await host._get_cycle_context()
+    assert assembler.assemble.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_no_assembler_returns_none():
+    from empla.core.loop.context import CycleContextMixin
+
+    host = _host(CycleContextMixin)
+    host.memory = Mock()  # auto-attributes are not a ContextAssembler
+    assert await host._get_cycle_context() is None
+
+
+@pytest.mark.asyncio
+async def test_assembly_failure_falls_back():
+    from empla.core.loop.context import CycleContextMixin
+
+    assembler = _assembler()
+    assembler.assemble.side_effect = RuntimeError("pool exhausted")
+    host = _host(CycleContextMixin, assembler)
+
+    assert await host._get_cycle_context() is None
+
+
+# ============================================================================
+# Phase integration
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_perception_uses_cached_beliefs():
+    from empla.core.loop.perception import PerceptionMixin
+
+    host = _host(PerceptionMixin, _assembler())
+
+    text = await host._format_recent_beliefs_for_perception()
+
+    assert text == "- acme → stage: {} (confidence: 0.90)"
+    host.beliefs.get_all_beliefs.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_planning_reuses_cycle_context():
+    from empla.core.loop.planning import PlanningMixin
+
+    assembler = _assembler()
+    llm = _llm()
+    host = _host(PlanningMixin, assembler, llm=llm)
+
+    await host._get_cycle_context()  # perception already assembled it
+    await host._analyze_situation_with_llm([], [], [])
+
+    prompt = llm.generate_structured.call_args.kwargs["prompt"]
+    assert "Known entity facts:\n- acme → industry: retail" in prompt
+    assert "Recent experience:\n- [deep_reflection] focus on renewals" in prompt
+    # Beliefs come from the fresh list passed in, not the cached snapshot
+    assert "acme → stage" not in prompt
+    assembler.assemble.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_goal_evaluation_includes_cached_facts():
+    from empla.core.loop.goal_management import GoalManagementMixin
+    from empla.core.loop.models import NonNumericGoalBatchEvaluation
+
+    llm = Mock()
+    llm.generate_structured = AsyncMock(
+        return_value=(Mock(), NonNumericGoalBatchEvaluation(results=[]))
+    )
+    host = _host(GoalManagementMixin, _assembler(), llm=llm)
+    goal = Mock(id=uuid4(), goal_type="opportunity", target={}, description="Upsell acme")
+    change = Mock(subject="acme", predicate="stage", old_confidence=0.5, new_confidence=0.9)
+
+    await host._evaluate_non_numeric_goals([goal], [change])
+
+    prompt = llm.generate_structured.call_args.kwargs["prompt"]
+    assert "Known entity facts:\n- acme → industry: retail" in prompt
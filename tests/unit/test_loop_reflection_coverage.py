@@ -576,3 +576,11 @@ class TestMaintainMemoryHealth:
         mixin.memory.procedural.archive_poor_procedures = AsyncMock(side_effect=RuntimeError("DB"))
         # Should not raise
         await mixin._maintain_memory_health()
+
+    @pytest.mark.asyncio
+    async def test_skipped_when_delegated_to_worker(self):
+        mixin = _make_reflection_mixin(has_episodic=True, has_procedural=True)
+        mixin.config = LoopConfig(memory_maintenance_in_loop=False)
+        await mixin._maintain_memory_health()
+        mixin.memory.episodic.reinforce_frequently_recalled.assert_not_called()
+        mixin.memory.procedural.archive_poor_procedures.assert_not_called()
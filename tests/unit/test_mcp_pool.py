@@ -0,0 +1,284 @@
+"""
+Unit tests for the shared MCP server pool.
+
+Uses a fake session opener, so no MCP subprocess or HTTP server is needed.
+Covers sharing per (tenant, config), lazy sessions with a cached tool
+catalog, concurrency across sessions, transparent reconnect, health checks,
+and lease release.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import anyio
+import pytest
+
+from empla.core.tools.mcp_bridge import MCPBridge, MCPServerConfig
+from empla.core.tools.mcp_pool import DiscoveredTool, MCPServerPool, catalog_key, server_key
+from empla.core.tools.registry import ToolRegistry
+
+
+class FakeSession:
+    def __init__(self, server: "FakeServer") -> None:
+        self.server = server
+        self.broken = False
+        self.closed = False
+
+    async def list_tools(self):
+        self.server.list_calls += 1
+        tool = SimpleNamespace(
+            name="query",
+            description="Query data",
+            inputSchema={"type": "object"},
+            annotations=SimpleNamespace(readOnlyHint=True),
+        )
+        return SimpleNamespace(tools=[tool])
+
+    async def call_tool(self, name, arguments=None):
+        if self.broken:
+            raise anyio.ClosedResourceError
+        self.server.active += 1
+        self.server.peak = max(self.server.peak, self.server.active)
+        try:
+            await asyncio.sleep(self.server.delay)
+        finally:
+            self.server.active -= 1
+        if name == "explode":
+            raise ValueError("bad arguments")
+        return SimpleNamespace(content=[SimpleNamespace(text=f"{name}:{arguments}")])
+
+    async def send_ping(self):
+        if self.broken:
+            raise anyio.BrokenResourceError
+
+
+class FakeServer:
+    """Session opener that records every session it opens."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.sessions: list[FakeSession] = []
+        self.list_calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, stack, config):
+        session = FakeSession(self)
+        self.sessions.append(session)
+
+        async def close() -> None:
+            session.closed = True
+
+        stack.push_async_callback(close)
+        return session
+
+
+class MemoryCatalogStore:
+    def __init__(self) -> None:
+        self.catalogs: dict[str, list[DiscoveredTool]] = {}
+
+    async def load(self, *, tenant_id, config, key, max_age):
+        return self.catalogs.get(key)
+
+    async def save(self, *, tenant_id, config, key, tools):
+        self.catalogs[key] = tools
+
+
+def _config(name: str = "crm", **kwargs) -> MCPServerConfig:
+    return MCPServerConfig(name=name, transport="stdio", command=["crm-server"], **kwargs)
+
+
+@pytest.fixture
+async def pool_and_server():
+    server = FakeServer()
+    pool = MCPServerPool(opener=server)
+    yield pool, server
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_bridges_in_one_tenant_share_sessions_and_discovery(pool_and_server):
+    pool, server = pool_and_server
+    tenant_id = uuid4()
+    first = MCPBridge(ToolRegistry(), pool=pool, tenant_id=tenant_id)
+    second = MCPBridge(ToolRegistry(), pool=pool, tenant_id=tenant_id)
+
+    assert await first.connect(_config()) == ["crm.query"]
+    assert await second.connect(_config()) == ["crm.query"]
+
+    assert server.list_calls == 1
+    assert len(server.sessions) == 1
+
+
+def test_server_key_separates_tenants_and_credentials():
+    tenant_id = uuid4()
+    assert server_key(_config(), tenant_id) == server_key(_config("alias"), tenant_id)
+    assert server_key(_config(), tenant_id) != server_key(_config(), uuid4())
+    assert server_key(_config(), tenant_id) != server_key(
+        _config(env={"OAUTH_ACCESS_TOKEN": "t"}), tenant_id
+    )
+
+
+def test_catalog_key_ignores_credentials():
+    """Employees with their own (refreshed) tokens share one stored catalog."""
+    tenant_id = uuid4()
+    assert catalog_key(_config(env={"OAUTH_ACCESS_TOKEN": "a"}), tenant_id) == catalog_key(
+        _config(env={"OAUTH_ACCESS_TOKEN": "b"}), tenant_id
+    )
+    assert catalog_key(_config(), tenant_id) != catalog_key(_config(), uuid4())
+
+
+@pytest.mark.asyncio
+async def test_read_only_annotation_enables_result_cache(pool_and_server):
+    pool, _ = pool_and_server
+    registry = ToolRegistry()
+    await MCPBridge(registry, pool=pool).connect(_config())
+
+    assert registry.get_tool_by_name("crm.query").cache_ttl_seconds is not None
+
+
+@pytest.mark.asyncio
+async def test_cached_catalog_skips_startup_session():
+    server = FakeServer()
+    store = MemoryCatalogStore()
+    store.catalogs[catalog_key(_config(env={"OAUTH_ACCESS_TOKEN": "other"}))] = [
+        DiscoveredTool(name="query")
+    ]
+    pool = MCPServerPool(opener=server, catalog_store=store)
+    registry = ToolRegistry()
+    try:
+        await MCPBridge(registry, pool=pool).connect(_config())
+        assert server.sessions == []
+
+        tool = registry.get_tool_by_name("crm.query")
+        impl = registry.get_implementation(tool.tool_id)
+        assert await impl._execute({"q": 1}) == "query:{'q': 1}"
+        assert len(server.sessions) == 1
+        assert server.list_calls == 0
+    finally:
+        await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_discovery_is_saved_to_catalog_store():
+    server = FakeServer()
+    store = MemoryCatalogStore()
+    pool = MCPServerPool(opener=server, catalog_store=store)
+    try:
+        await MCPBridge(ToolRegistry(), pool=pool).connect(_config())
+    finally:
+        await pool.aclose()
+
+    assert [t.name for t in store.catalogs[catalog_key(_config())]] == ["query"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_session_by_default():
+    server = FakeServer(delay=0.05)
+    pool = MCPServerPool(opener=server)
+    handle = await pool.acquire(_config())
+    try:
+        await asyncio.gather(*(handle.call_tool("query", {"i": i}) for i in range(4)))
+    finally:
+        await pool.aclose()
+
+    assert len(server.sessions) == 1
+    assert server.peak == 4  # multiplexed on the one session
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_spread_over_sessions():
+    server = FakeServer(delay=0.05)
+    pool = MCPServerPool(opener=server, sessions_per_server=2)
+    handle = await pool.acquire(_config())
+    try:
+        await asyncio.gather(*(handle.call_tool("query", {"i": i}) for i in range(4)))
+    finally:
+        await pool.aclose()
+
+    assert len(server.sessions) == 2
+    assert server.peak >= 2
+
+
+@pytest.mark.asyncio
+async def test_dead_session_is_replaced_transparently(pool_and_server):
+    pool, server = pool_and_server
+    handle = await pool.acquire(_config())
+    await handle.call_tool("query")
+    server.sessions[0].broken = True
+
+    result = await handle.call_tool("query", {"a": 1})
+
+    assert result.content[0].text == "query:{'a': 1}"
+    assert len(server.sessions) == 2
+    assert server.sessions[0].closed
+
+
+@pytest.mark.asyncio
+async def test_tool_errors_are_not_retried(pool_and_server):
+    pool, server = pool_and_server
+    handle = await pool.acquire(_config())
+
+    with pytest.raises(ValueError, match="bad arguments"):
+        await handle.call_tool("explode")
+    assert len(server.sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_health_check_drops_unresponsive_sessions(pool_and_server):
+    pool, server = pool_and_server
+    handle = await pool.acquire(_config())
+    await handle.call_tool("query")
+    server.sessions[0].broken = True
+
+    await pool.check_health()
+
+    assert server.sessions[0].closed
+    assert pool.stats()[0]["sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sessions_close_when_last_lease_is_released(pool_and_server):
+    pool, server = pool_and_server
+    first = MCPBridge(ToolRegistry(), pool=pool)
+    second = MCPBridge(ToolRegistry(), pool=pool)
+    await first.connect(_config())
+    await second.connect(_config())
+
+    await first.disconnect_all()
+    assert not server.sessions[0].closed
+
+    await second.disconnect_all()
+    assert server.sessions[0].closed
+    # Catalog survives for the next bridge
+    assert pool.stats()[0]["tools_cached"] is True
+
+
+@pytest.mark.asyncio
+async def test_catalog_store_save_is_one_atomic_jsonb_set():
+    """Runners replace only oauth_config.tool_catalog, never the admin's whole JSON."""
+    from sqlalchemy.dialects.postgresql import asyncpg
+
+    from empla.services.integrations.mcp_service import MCPToolCatalogStore
+
+    session = AsyncMock()
+    ctx = AsyncMock()
+    ctx.__aenter__.return_value = session
+    ctx.__aexit__.return_value = False
+    store = MCPToolCatalogStore(MagicMock(return_value=ctx))
+    store._find = AsyncMock(return_value=SimpleNamespace(id=uuid4(), oauth_config={"x": 1}))
+
+    await store.save(
+        tenant_id=uuid4(), config=_config(), key="k1", tools=[DiscoveredTool(name="query")]
+    )
+
+    session.execute.assert_awaited_once()
+    compiled = session.execute.await_args.args[0].compile(dialect=asyncpg.dialect())
+    sql = str(compiled)
+    assert sql.startswith("UPDATE integrations SET oauth_config=jsonb_set(")
+    assert "'{tool_catalog}'::text[]" in sql
+    assert compiled.params["catalog"]["key"] == "k1"
+    assert compiled.params["catalog"]["tools"][0]["name"] == "query"
+    session.commit.assert_awaited_once()
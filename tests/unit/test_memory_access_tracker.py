@@ -0,0 +1,333 @@
+"""
+Unit tests for MemoryAccessTracker and its integration with the memory
+read paths.
+
+Covers buffering, bulk UPDATE construction, flush/requeue semantics,
+the background task lifecycle, and that tracked reads stay read-only.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from empla.core.memory.access import MemoryAccessTracker, build_access_update
+from empla.core.memory.episodic import EpisodicMemorySystem
+from empla.core.memory.semantic import SemanticMemorySystem
+from empla.core.memory.working import WorkingMemory
+from empla.models.memory import EpisodicMemory, SemanticMemory
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _session(rowcount=1):
+    s = AsyncMock()
+    result = MagicMock()
+    result.rowcount = rowcount
+    s.execute.return_value = result
+    s.flush = AsyncMock()
+    return s
+
+
+def _sessionmaker(session):
+    ctx = AsyncMock()
+    ctx.__aenter__.return_value = session
+    ctx.__aexit__.return_value = False
+    return MagicMock(return_value=ctx)
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+# ============================================================================
+# Buffering
+# ============================================================================
+
+
+def test_record_coalesces_repeat_reads():
+    tracker = MemoryAccessTracker()
+    mid = uuid4()
+    early = datetime(2026, 1, 1, tzinfo=UTC)
+    late = early + timedelta(minutes=5)
+
+    tracker.record("semantic", mid, late)
+    tracker.record("semantic", mid, early)
+
+    assert tracker.pending_for("semantic", mid) == 2
+    assert tracker.pending_count == 1
+    assert tracker._pending["semantic"][mid].last_at == late
+
+
+def test_kinds_are_buffered_separately():
+    tracker = MemoryAccessTracker()
+    mid = uuid4()
+    tracker.record("semantic", mid)
+    tracker.record("episodic", mid)
+
+    assert tracker.pending_count == 2
+    assert tracker.pending_for("working", mid) == 0
+
+
+def test_max_pending_drops_new_rows_but_keeps_counting_existing():
+    tracker = MemoryAccessTracker(max_pending=2)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    tracker.record_many("semantic", [a, b, c])
+    tracker.record("semantic", a)
+
+    assert tracker.pending_count == 2
+    assert tracker.pending_for("semantic", a) == 2
+    assert tracker.dropped == 1
+
+
+# ============================================================================
+# Bulk UPDATE
+# ============================================================================
+
+
+def test_semantic_update_uses_values_join():
+    tracker = MemoryAccessTracker()
+    tracker.record_many("semantic", [uuid4(), uuid4()])
+    sql = _compile(build_access_update("semantic", list(tracker._pending["semantic"].items())))
+
+    assert sql.startswith("UPDATE memory_semantic")
+    assert "FROM (VALUES" in sql
+    assert "access_count=(memory_semantic.access_count + access_batch.n)" in sql
+    assert "greatest(" in sql
+
+
+def test_episodic_update_targets_recall_columns():
+    tracker = MemoryAccessTracker()
+    tracker.record("episodic", uuid4())
+    sql = _compile(build_access_update("episodic", list(tracker._pending["episodic"].items())))
+
+    assert sql.startswith("UPDATE memory_episodes")
+    assert "recall_count" in sql
+    assert "last_recalled_at" in sql
+
+
+def test_working_update_targets_working_table():
+    tracker = MemoryAccessTracker()
+    tracker.record("working", uuid4())
+    sql = _compile(build_access_update("working", list(tracker._pending["working"].items())))
+
+    assert sql.startswith("UPDATE memory_working")
+
+
+# ============================================================================
+# Flush
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_flush_on_given_session_issues_one_statement_per_kind():
+    tracker = MemoryAccessTracker()
+    tracker.record_many("semantic", [uuid4(), uuid4(), uuid4()])
+    tracker.record("episodic", uuid4())
+    session = _session(rowcount=2)
+
+    updated = await tracker.flush(session)
+
+    assert session.execute.await_count == 2
+    session.commit.assert_not_awaited()  # caller owns the transaction
+    assert updated == 4
+    assert tracker.pending_count == 0
+    assert tracker.flushed_rows == 4
+
+
+@pytest.mark.asyncio
+async def test_flush_chunks_large_batches(monkeypatch):
+    monkeypatch.setattr("empla.core.memory.access.FLUSH_CHUNK_SIZE", 2)
+    tracker = MemoryAccessTracker()
+    tracker.record_many("semantic", [uuid4() for _ in range(5)])
+    session = _session()
+
+    await tracker.flush(session)
+
+    assert session.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_flush_without_session_uses_sessionmaker_and_commits():
+    session = _session()
+    tracker = MemoryAccessTracker(_sessionmaker(session))
+    tracker.record("semantic", uuid4())
+
+    await tracker.flush()
+
+    session.execute.assert_awaited_once()
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_flush_nothing_pending_is_noop():
+    session = _session()
+    tracker = MemoryAccessTracker()
+
+    assert await tracker.flush(session) == 0
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_flush_failure_requeues_batch():
+    tracker = MemoryAccessTracker()
+    mid = uuid4()
+    tracker.record("semantic", mid)
+    session = _session()
+    session.execute.side_effect = RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await tracker.flush(session)
+
+    tracker.record("semantic", mid)
+    assert tracker.pending_for("semantic", mid) == 2
+    assert tracker.flush_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_without_any_sink_keeps_buffer():
+    tracker = MemoryAccessTracker()
+    mid = uuid4()
+    tracker.record("semantic", mid)
+
+    assert await tracker.flush() == 0
+    assert tracker.pending_for("semantic", mid) == 1
+
+
+# ============================================================================
+# Background task
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_background_flush_and_final_flush_on_stop():
+    session = _session()
+    tracker = MemoryAccessTracker(_sessionmaker(session), flush_interval_seconds=0.01)
+    tracker.start()
+    tracker.record("semantic", uuid4())
+
+    await asyncio.sleep(0.05)
+    assert session.execute.await_count >= 1
+
+    tracker.record("episodic", uuid4())
+    await tracker.stop()
+
+    assert tracker.pending_count == 0
+    assert tracker._task is None
+
+
+@pytest.mark.asyncio
+async def test_start_without_sessionmaker_is_disabled():
+    tracker = MemoryAccessTracker()
+    tracker.start()
+    assert tracker._task is None
+    await tracker.stop()
+
+
+def test_get_stats():
+    tracker = MemoryAccessTracker()
+    tracker.record("semantic", uuid4())
+    stats = tracker.get_stats()
+    assert stats["pending"] == 1
+    assert stats["recorded"] == 1
+
+
+# ============================================================================
+# Read paths
+# ============================================================================
+
+
+def _fact():
+    fact = MagicMock(spec=SemanticMemory)
+    fact.id = uuid4()
+    fact.access_count = 0
+    return fact
+
+
+@pytest.mark.asyncio
+async def test_tracked_query_facts_does_not_write():
+    tracker = MemoryAccessTracker()
+    session = _session()
+    facts = [_fact(), _fact()]
+    session.execute.return_value.scalars.return_value.all.return_value = facts
+    semantic = SemanticMemorySystem(session, uuid4(), uuid4(), access_tracker=tracker)
+
+    result = await semantic.query_facts(subject="Acme Corp")
+
+    assert result == facts
+    session.flush.assert_not_awaited()
+    assert all(f.access_count == 0 for f in facts)
+    assert tracker.pending_for("semantic", facts[0].id) == 1
+
+
+@pytest.mark.asyncio
+async def test_tracked_recall_similar_does_not_write():
+    tracker = MemoryAccessTracker()
+    session = _session()
+    mem = MagicMock(spec=EpisodicMemory)
+    mem.id = uuid4()
+    mem.recall_count = 0
+    session.execute.return_value.scalars.return_value.all.return_value = [mem]
+    episodic = EpisodicMemorySystem(session, uuid4(), uuid4(), access_tracker=tracker)
+
+    await episodic.recall_similar([0.1] * 4)
+
+    session.flush.assert_not_awaited()
+    assert mem.recall_count == 0
+    assert tracker.pending_for("episodic", mem.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_tracked_working_get_active_items_does_not_write():
+    tracker = MemoryAccessTracker()
+    session = _session()
+    item = MagicMock()
+    item.id = uuid4()
+    session.execute.return_value.scalars.return_value.all.return_value = [item]
+    working = WorkingMemory(session, uuid4(), uuid4(), access_tracker=tracker)
+
+    await working.get_active_items()
+
+    session.flush.assert_not_awaited()
+    assert tracker.pending_for("working", item.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_reinforce_frequently_accessed_flushes_tracker_first():
+    tracker_session = _session()
+    tracker = MemoryAccessTracker(_sessionmaker(tracker_session))
+    tracker.record("semantic", uuid4())
+    session = _session()
+    session.execute.return_value.scalars.return_value.all.return_value = []
+    semantic = SemanticMemorySystem(session, uuid4(), uuid4(), access_tracker=tracker)
+
+    await semantic.reinforce_frequently_accessed(min_access_count=1)
+
+    # Flushed and committed on the tracker's own session, not the caller's.
+    flush_stmt = tracker_session.execute.await_args.args[0]
+    assert _compile(flush_stmt).startswith("UPDATE memory_semantic")
+    tracker_session.commit.assert_awaited_once()
+    assert "FROM (VALUES" not in _compile(session.execute.await_args_list[0].args[0])
+    assert tracker.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_reinforce_frequently_recalled_flushes_tracker_first():
+    tracker_session = _session()
+    tracker = MemoryAccessTracker(_sessionmaker(tracker_session))
+    tracker.record("episodic", uuid4())
+    session = _session()
+    session.execute.return_value.scalars.return_value.all.return_value = []
+    episodic = EpisodicMemorySystem(session, uuid4(), uuid4(), access_tracker=tracker)
+
+    await episodic.reinforce_frequently_recalled(min_recall_count=1)
+
+    flush_stmt = tracker_session.execute.await_args.args[0]
+    assert _compile(flush_stmt).startswith("UPDATE memory_episodes")
+    tracker_session.commit.assert_awaited_once()
+    assert "FROM (VALUES" not in _compile(session.execute.await_args_list[0].args[0])
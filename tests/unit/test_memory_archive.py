@@ -0,0 +1,198 @@
+"""
+Unit tests for the Parquet history archive.
+
+Covers the write -> commit -> manifest round trip, hot-window bookkeeping,
+filtered/limited reads across months, and abort semantics.
+"""
+
+import json
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from empla.core.memory.archive import HistoryArchive, month_key
+
+pytest.importorskip("pyarrow")
+
+JAN = datetime(2026, 1, 1, tzinfo=UTC)
+FEB = datetime(2026, 2, 1, tzinfo=UTC)
+
+
+def _episode(employee_id, tenant_id, occurred_at, **overrides):
+    row = {
+        "id": uuid4(),
+        "tenant_id": tenant_id,
+        "employee_id": employee_id,
+        "episode_type": "interaction",
+        "description": "met the customer",
+        # Export casts JSONB / vector to text
+        "content": '{"k": 1}',
+        "participants": ["a@example.com"],
+        "location": "email",
+        "embedding": "[0.5,0.25]",
+        "importance": 0.5,
+        "recall_count": 0,
+        "last_recalled_at": None,
+        "occurred_at": occurred_at,
+        "created_at": occurred_at,
+        "updated_at": occurred_at,
+        "deleted_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return HistoryArchive(tmp_path)
+
+
+@pytest.fixture
+def ids():
+    return uuid4(), uuid4()
+
+
+def _write(archive, month, rows, table="memory_episodes"):
+    writer = archive.writer(table, month)
+    writer.write_batch(rows)
+    return writer.commit()
+
+
+def test_month_key():
+    assert month_key(datetime(2026, 3, 15, tzinfo=UTC)) == "2026-03"
+
+
+def test_empty_archive(archive):
+    assert archive.available
+    assert archive.archived_months("memory_episodes") == []
+    assert archive.hot_start("memory_episodes") is None
+    assert not archive.reaches_archive("memory_episodes", None)
+
+
+def test_commit_records_manifest(archive, ids):
+    entry = _write(archive, JAN, [_episode(*ids, datetime(2026, 1, 3, tzinfo=UTC))])
+
+    assert entry.rows == 1
+    assert entry.path.exists()
+    assert not entry.path.with_suffix(".parquet.tmp").exists()
+    manifest = json.loads((archive.root / "manifest.json").read_text())
+    assert manifest["tables"]["memory_episodes"]["2026-01"]["rows"] == 1
+    assert archive.hot_start("memory_episodes") == FEB
+
+
+def test_reaches_archive(archive, ids):
+    _write(archive, JAN, [])
+    assert archive.reaches_archive("memory_episodes", None)
+    assert archive.reaches_archive("memory_episodes", datetime(2026, 1, 20, tzinfo=UTC))
+    assert not archive.reaches_archive("memory_episodes", FEB)
+    assert not archive.reaches_archive("belief_history", None)
+
+
+def test_abort_leaves_nothing(archive, ids):
+    writer = archive.writer("memory_episodes", JAN)
+    writer.write_batch([_episode(*ids, JAN)])
+    writer.abort()
+
+    assert archive.archived_months("memory_episodes") == []
+    assert not any(archive.root.rglob("*.parquet*"))
+
+
+@pytest.mark.asyncio
+async def test_read_round_trip_decodes_values(archive, ids):
+    employee_id, tenant_id = ids
+    row = _episode(employee_id, tenant_id, datetime(2026, 1, 3, tzinfo=UTC))
+    _write(archive, JAN, [row])
+
+    [result] = await archive.read("memory_episodes", equals={"employee_id": employee_id})
+
+    assert result["id"] == row["id"]
+    assert result["employee_id"] == employee_id
+    assert result["content"] == {"k": 1}
+    assert result["embedding"] == [0.5, 0.25]
+    assert result["occurred_at"] == row["occurred_at"]
+
+
+@pytest.mark.asyncio
+async def test_read_filters_and_orders_newest_first(archive, ids):
+    employee_id, tenant_id = ids
+    other = uuid4()
+    _write(
+        archive,
+        JAN,
+        [
+            _episode(employee_id, tenant_id, datetime(2026, 1, 2, tzinfo=UTC)),
+            _episode(employee_id, tenant_id, datetime(2026, 1, 9, tzinfo=UTC)),
+            _episode(other, tenant_id, datetime(2026, 1, 5, tzinfo=UTC)),
+            _episode(
+                employee_id,
+                tenant_id,
+                datetime(2026, 1, 7, tzinfo=UTC),
+                deleted_at=datetime(2026, 1, 8, tzinfo=UTC),
+            ),
+        ],
+    )
+    _write(archive, FEB, [_episode(employee_id, tenant_id, datetime(2026, 2, 4, tzinfo=UTC))])
+
+    rows = await archive.read("memory_episodes", equals={"employee_id": employee_id})
+    assert [r["occurred_at"].day for r in rows] == [4, 9, 2]
+
+    rows = await archive.read(
+        "memory_episodes",
+        since=datetime(2026, 1, 5, tzinfo=UTC),
+        until=FEB,
+        equals={"employee_id": employee_id},
+    )
+    assert [r["occurred_at"].day for r in rows] == [9]
+
+    rows = await archive.read(
+        "memory_episodes", equals={"employee_id": employee_id}, include_deleted=True
+    )
+    assert len(rows) == 4
+
+
+@pytest.mark.asyncio
+async def test_read_stops_at_limit(archive, ids):
+    employee_id, tenant_id = ids
+    _write(archive, JAN, [_episode(employee_id, tenant_id, datetime(2026, 1, 2, tzinfo=UTC))])
+    _write(
+        archive,
+        FEB,
+        [_episode(employee_id, tenant_id, datetime(2026, 2, d, tzinfo=UTC)) for d in (1, 2)],
+    )
+
+    rows = await archive.read("memory_episodes", limit=2)
+
+    assert [r["occurred_at"].month for r in rows] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_read_belief_history_by_denormalized_subject(archive, ids):
+    employee_id, tenant_id = ids
+    base = {
+        "tenant_id": tenant_id,
+        "employee_id": employee_id,
+        "belief_id": uuid4(),
+        "change_type": "updated",
+        "old_value": '{"stage": "lead"}',
+        "new_value": '{"stage": "won"}',
+        "old_confidence": 0.5,
+        "new_confidence": 0.9,
+        "reason": "email",
+        "changed_at": datetime(2026, 1, 3, tzinfo=UTC),
+        "belief_predicate": "deal_stage",
+    }
+    _write(
+        archive,
+        JAN,
+        [
+            {**base, "id": uuid4(), "belief_subject": "Acme"},
+            {**base, "id": uuid4(), "belief_subject": "Globex"},
+        ],
+        table="belief_history",
+    )
+
+    [row] = await archive.read(
+        "belief_history", equals={"employee_id": employee_id, "belief_subject": "Acme"}
+    )
+    assert row["new_value"] == {"stage": "won"}
@@ -0,0 +1,314 @@
+"""
+Unit tests for budgeted context assembly.
+
+Covers salience packing (dedup, budget, skip-not-stop, pinned items),
+section rendering, the single ANY(:subjects) fact query, the pinned latest
+reflection, concurrent source fetching against a fake sessionmaker, and
+per-source failure isolation.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from empla.core.memory.context import (
+    AssembledContext,
+    ContextAssembler,
+    ContextItem,
+    estimate_tokens,
+    pack,
+)
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _item(kind, key, salience, text=None, tokens=0, *, pinned=False):
+    return ContextItem(
+        kind=kind,
+        key=(key,),
+        text=text or f"- {key}",
+        salience=salience,
+        tokens=tokens,
+        pinned=pinned,
+    )
+
+
+class _FakeSessionmaker:
+    """Routes each statement to canned rows by the table it reads.
+
+    The latest-reflection query (filtered on episode_type) gets the
+    ``reflections`` rows instead of the recent episodes.
+    """
+
+    def __init__(self, rows_by_table, fail_on=None, delay=0.0, reflections=()):
+        self.rows_by_table = rows_by_table
+        self.reflections = list(reflections)
+        self.fail_on = fail_on
+        self.delay = delay
+        self.statements = []
+        self.sessions = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self):
+        fake = self
+        fake.sessions += 1
+        session = AsyncMock()
+
+        async def execute(stmt):
+            sql = str(stmt.compile(dialect=postgresql.dialect()))
+            fake.statements.append(sql)
+            fake.in_flight += 1
+            fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+            try:
+                await asyncio.sleep(fake.delay)
+                if "memory_episodes.episode_type = " in sql and fake.fail_on is None:
+                    result = MagicMock()
+                    result.all.return_value = fake.reflections
+                    return result
+                for table, rows in fake.rows_by_table.items():
+                    if f"FROM {table}" in sql:
+                        if fake.fail_on == table:
+                            raise RuntimeError("statement timeout")
+                        result = MagicMock()
+                        result.all.return_value = rows
+                        return result
+                raise AssertionError(f"unexpected statement: {sql}")
+            finally:
+                fake.in_flight -= 1
+
+        session.execute = execute
+        ctx = AsyncMock()
+        ctx.__aenter__.return_value = session
+        ctx.__aexit__.return_value = False
+        return ctx
+
+
+def _belief(subject, predicate, confidence):
+    return SimpleNamespace(
+        subject=subject, predicate=predicate, object={"v": 1}, confidence=confidence
+    )
+
+
+def _fact(subject, predicate, confidence):
+    return SimpleNamespace(subject=subject, predicate=predicate, object="x", confidence=confidence)
+
+
+def _episode(episode_type, description, importance, age_days):
+    return SimpleNamespace(
+        episode_type=episode_type,
+        description=description,
+        importance=importance,
+        occurred_at=datetime.now(UTC) - timedelta(days=age_days),
+    )
+
+
+def _rows(beliefs=(), facts=(), episodes=(), playbooks=()):
+    return {
+        "beliefs": list(beliefs),
+        "memory_semantic": list(facts),
+        "memory_episodes": list(episodes),
+        "memory_procedural": list(playbooks),
+    }
+
+
+# ============================================================================
+# Packing and rendering
+# ============================================================================
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("a" * 40) == 10
+
+
+def test_pack_keeps_most_salient_duplicate():
+    items = [_item("facts", "acme", 0.5), _item("beliefs", "acme", 0.9)]
+    kept, dropped = pack(items, token_budget=100)
+    assert [i.kind for i in kept] == ["beliefs"]
+    assert dropped == 1
+
+
+def test_pack_skips_oversized_item_and_continues():
+    items = [
+        _item("beliefs", "a", 0.9, tokens=8),
+        _item("beliefs", "b", 0.8, tokens=50),
+        _item("beliefs", "c", 0.1, tokens=2),
+    ]
+    kept, dropped = pack(items, token_budget=10)
+    assert [i.key for i in kept] == [("a",), ("c",)]
+    assert dropped == 1
+
+
+def test_pack_keeps_pinned_item_first():
+    items = [
+        _item("beliefs", "a", 0.9, tokens=4),
+        _item("episodes", "reflection", 0.1, tokens=5, pinned=True),
+        _item("episodes", "reflection", 0.5, tokens=5),
+        _item("beliefs", "b", 0.8, tokens=4),
+    ]
+    kept, dropped = pack(items, token_budget=10)
+    assert [i.key for i in kept] == [("reflection",), ("a",)]
+    assert kept[0].pinned
+    assert dropped == 2
+
+
+def test_pack_keeps_pinned_item_over_budget():
+    items = [_item("episodes", "reflection", 0.1, tokens=12, pinned=True)]
+    kept, _dropped = pack(items, token_budget=10)
+    assert [i.key for i in kept] == [("reflection",)]
+
+
+def test_render_sections_in_canonical_order():
+    context = AssembledContext(
+        items=[
+            _item("playbooks", "p", 0.9, text="- playbook"),
+            _item("facts", "f", 0.8, text="- fact"),
+        ]
+    )
+    assert context.render() == "Known entity facts:\n- fact\n\nProven playbooks:\n- playbook"
+    assert context.render(["facts"], headers=False) == "- fact"
+    assert context.render(["episodes"]) == ""
+
+
+# ============================================================================
+# Queries
+# ============================================================================
+
+
+def test_facts_statement_is_single_any_query():
+    assembler = ContextAssembler(MagicMock(), uuid4(), uuid4(), facts_per_subject=3)
+    compiled = assembler.facts_statement(["Acme", "Globex"]).compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert "memory_semantic.subject = ANY (%(subjects)s::VARCHAR[])" in sql
+    assert "row_number() OVER (PARTITION BY memory_semantic.subject" in sql
+    assert compiled.params["subjects"] == ["Acme", "Globex"]
+    assert 3 in compiled.params.values()
+
+
+# ============================================================================
+# Assembly
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_assemble_fetches_sources_concurrently():
+    sm = _FakeSessionmaker(
+        _rows(
+            beliefs=[_belief("Acme", "deal_stage", 0.9), _belief("Globex", "churn_risk", 0.7)],
+            facts=[_fact("Acme", "industry", 0.8)],
+            episodes=[_episode("interaction", "Call with Acme", 0.6, 0)],
+            playbooks=[
+                SimpleNamespace(
+                    name="Renewal", steps=[{"action": "email"}], success_rate=0.9, execution_count=4
+                )
+            ],
+        ),
+        delay=0.01,
+    )
+    assembler = ContextAssembler(sm, uuid4(), uuid4())
+
+    context = await assembler.assemble(token_budget=1000)
+
+    assert sm.sessions == 4  # one short-lived session per source
+    assert sm.max_in_flight >= 2
+    assert {i.kind for i in context.items} == {"beliefs", "facts", "episodes", "playbooks"}
+    # Facts were looked up for the belief subjects in one query
+    [fact_sql] = [s for s in sm.statements if "FROM memory_semantic" in s]
+    assert "ANY" in fact_sql
+    assert context.failed_sources == []
+    assert set(context.timings_ms) >= {"beliefs", "facts", "episodes", "playbooks", "total"}
+    assert "Renewal: [email] (success_rate=90%, used 4 times)" in context.render(["playbooks"])
+
+
+@pytest.mark.asyncio
+async def test_assemble_dedupes_promoted_facts():
+    sm = _FakeSessionmaker(
+        _rows(
+            beliefs=[_belief("Acme", "deal_stage", 0.9)],
+            facts=[_fact("acme", "Deal_Stage", 0.95), _fact("Acme", "industry", 0.8)],
+        )
+    )
+    context = await ContextAssembler(sm, uuid4(), uuid4()).assemble()
+
+    assert len(context.section("beliefs")) == 1
+    assert [i.text for i in context.section("facts")] == ["- Acme → industry: x"]
+    assert context.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_assemble_respects_budget():
+    beliefs = [_belief(f"Subject {n}", "predicate", 0.9 - n / 100) for n in range(20)]
+    sm = _FakeSessionmaker(_rows(beliefs=beliefs))
+
+    context = await ContextAssembler(sm, uuid4(), uuid4()).assemble(token_budget=60)
+
+    assert 0 < context.used_tokens <= 60
+    assert context.dropped > 0
+    # Highest-confidence beliefs win
+    assert context.section("beliefs")[0].text.startswith("- Subject 0 ")
+
+
+@pytest.mark.asyncio
+async def test_reflection_outranks_stale_episode():
+    sm = _FakeSessionmaker(
+        _rows(
+            episodes=[
+                _episode("interaction", "Old but important", 0.9, 6),
+                _episode("deep_reflection", "I should focus on renewals", 0.2, 1),
+            ]
+        )
+    )
+    context = await ContextAssembler(sm, uuid4(), uuid4()).assemble()
+
+    texts = [i.text for i in context.section("episodes")]
+    assert texts[0] == "- [deep_reflection] I should focus on renewals"
+
+
+@pytest.mark.asyncio
+async def test_latest_reflection_is_pinned_outside_recent_cut():
+    # Ten newer cycle episodes fill the recent cut; the reflection is older.
+    recent = [_episode("intention_execution", f"Step {n}", 0.9, 0) for n in range(10)]
+    reflection = _episode("deep_reflection", "Renewals slip when outreach starts late", 0.5, 2)
+    sm = _FakeSessionmaker(_rows(episodes=recent), reflections=[reflection])
+    assembler = ContextAssembler(sm, uuid4(), uuid4(), max_episodes=10)
+
+    context = await assembler.assemble(token_budget=20)
+
+    [episodes_sql, reflection_sql] = [s for s in sm.statements if "FROM memory_episodes" in s]
+    assert "LIMIT" in episodes_sql
+    assert "memory_episodes.episode_type = " in reflection_sql
+    first = context.section("episodes")[0]
+    assert first.pinned
+    assert first.text == "- [deep_reflection] Renewals slip when outreach starts late"
+
+
+@pytest.mark.asyncio
+async def test_failed_source_is_isolated():
+    sm = _FakeSessionmaker(
+        _rows(
+            beliefs=[_belief("Acme", "deal_stage", 0.9)],
+            episodes=[_episode("interaction", "Call", 0.5, 0)],
+        ),
+        fail_on="memory_episodes",
+    )
+    context = await ContextAssembler(sm, uuid4(), uuid4()).assemble()
+
+    assert context.failed_sources == ["episodes"]
+    assert context.section("beliefs")
+    assert context.to_dict()["failed_sources"] == ["episodes"]
+
+
+@pytest.mark.asyncio
+async def test_no_beliefs_skips_fact_query():
+    sm = _FakeSessionmaker(_rows())
+    await ContextAssembler(sm, uuid4(), uuid4()).assemble()
+    assert not any("FROM memory_semantic" in s for s in sm.statements)
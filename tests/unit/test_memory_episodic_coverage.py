@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from empla.core.memory.episodic import EpisodicMemorySystem
 from empla.models.memory import EpisodicMemory
@@ -45,6 +46,10 @@ def _make_episodic_memory(**overrides):
     return mem
 
 
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
 @pytest.fixture
 def session():
     """Mock async session."""
@@ -201,6 +206,65 @@ async def test_recall_recent_empty(episodic, session):
     assert results == []
 
 
+@pytest.mark.asyncio
+async def test_recall_recent_falls_back_to_archive(session, ids):
+    """recall_recent tops up from archived months when hot rows run short."""
+    archive = MagicMock()
+    archive.reaches_archive.return_value = True
+    hot_start = datetime(2026, 5, 1, tzinfo=UTC)
+    archive.hot_start.return_value = hot_start
+    archived_id = uuid4()
+    archive.read = AsyncMock(
+        return_value=[
+            {
+                "id": archived_id,
+                "employee_id": ids["employee_id"],
+                "tenant_id": ids["tenant_id"],
+                "episode_type": "interaction",
+                "description": "old",
+                "content": {},
+                "occurred_at": datetime(2026, 1, 5, tzinfo=UTC),
+            }
+        ]
+    )
+    episodic = EpisodicMemorySystem(session, ids["employee_id"], ids["tenant_id"], archive=archive)
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [_make_episodic_memory()]
+    session.execute.return_value = mock_result
+
+    results = await episodic.recall_recent(days=365, limit=5, episode_type="interaction")
+
+    assert len(results) == 2
+    assert isinstance(results[1], EpisodicMemory)
+    assert results[1].id == archived_id
+    kwargs = archive.read.await_args.kwargs
+    assert kwargs["until"] == hot_start
+    assert kwargs["limit"] == 4
+    assert kwargs["equals"] == {
+        "employee_id": ids["employee_id"],
+        "tenant_id": ids["tenant_id"],
+        "episode_type": "interaction",
+    }
+    session.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_recall_recent_skips_archive_when_limit_met(session, ids):
+    """A full page of hot rows never touches the archive."""
+    archive = MagicMock()
+    archive.read = AsyncMock()
+    episodic = EpisodicMemorySystem(session, ids["employee_id"], ids["tenant_id"], archive=archive)
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [_make_episodic_memory()]
+    session.execute.return_value = mock_result
+
+    results = await episodic.recall_recent(limit=1)
+
+    assert len(results) == 1
+    archive.reaches_archive.assert_not_called()
+    archive.read.assert_not_awaited()
+
+
 # ============================================================================
 # recall_with_participant
 # ============================================================================
@@ -377,33 +441,31 @@ async def test_consolidate_memories_empty(episodic, session):
 
 @pytest.mark.asyncio
 async def test_reinforce_frequently_recalled(episodic, session):
-    """reinforce boosts importance of frequently recalled memories."""
-    mem1 = _make_episodic_memory(importance=0.5, recall_count=10)
-    mem2 = _make_episodic_memory(importance=0.9, recall_count=8)
-
+    """reinforce boosts importance in one UPDATE and counts RETURNING rows."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [mem1, mem2]
+    mock_result.scalars.return_value.all.return_value = [uuid4(), uuid4()]
     session.execute.return_value = mock_result
 
     count = await episodic.reinforce_frequently_recalled(min_recall_count=5, importance_boost=1.1)
 
     assert count == 2
-    assert mem1.importance == pytest.approx(0.55)
-    assert mem2.importance == pytest.approx(0.99)
-    session.flush.assert_awaited()
+    session.execute.assert_awaited_once()
+    sql = _compile(session.execute.await_args.args[0])
+    assert sql.startswith("UPDATE memory_episodes SET importance=")
+    assert "memory_episodes.recall_count >= 5" in sql
+    assert "RETURNING memory_episodes.id" in sql
 
 
 @pytest.mark.asyncio
 async def test_reinforce_caps_at_one(episodic, session):
-    """reinforce caps importance at 1.0."""
-    mem = _make_episodic_memory(importance=0.95, recall_count=10)
-
+    """reinforce caps importance at 1.0 in SQL."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [mem]
+    mock_result.scalars.return_value.all.return_value = []
     session.execute.return_value = mock_result
 
     await episodic.reinforce_frequently_recalled(importance_boost=1.2)
-    assert mem.importance == 1.0
+    sql = _compile(session.execute.await_args.args[0])
+    assert "importance=least(1.0, memory_episodes.importance * 1.2)" in sql
 
 
 @pytest.mark.asyncio
@@ -423,21 +485,19 @@ async def test_reinforce_no_qualifying_memories(episodic, session):
 
 
 @pytest.mark.asyncio
-async def test_decay_rarely_recalled(episodic, session):
-    """decay reduces importance of old unrecalled memories."""
-    mem1 = _make_episodic_memory(importance=0.5, recall_count=0)
-    mem2 = _make_episodic_memory(importance=0.8, recall_count=0)
-
+async def test_decay_rarely_recalled(episodic, session, ids):
+    """decay reduces importance of old unrecalled memories set-based."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [mem1, mem2]
+    mock_result.scalars.return_value.all.return_value = [uuid4(), uuid4()]
     session.execute.return_value = mock_result
 
     count = await episodic.decay_rarely_recalled(min_days_old=90, importance_decay=0.9)
 
     assert count == 2
-    assert mem1.importance == pytest.approx(0.45)
-    assert mem2.importance == pytest.approx(0.72)
-    session.flush.assert_awaited()
+    sql = _compile(session.execute.await_args.args[0])
+    assert "importance=(memory_episodes.importance * 0.9)" in sql
+    assert "memory_episodes.recall_count = 0" in sql
+    assert f"memory_episodes.employee_id = '{ids['employee_id']}'" in sql
 
 
 @pytest.mark.asyncio
@@ -458,20 +518,18 @@ async def test_decay_no_qualifying_memories(episodic, session):
 
 @pytest.mark.asyncio
 async def test_archive_low_importance(episodic, session):
-    """archive soft-deletes old low-importance memories."""
-    mem1 = _make_episodic_memory(importance=0.1, deleted_at=None)
-    mem2 = _make_episodic_memory(importance=0.2, deleted_at=None)
-
+    """archive soft-deletes old low-importance memories set-based."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [mem1, mem2]
+    mock_result.scalars.return_value.all.return_value = [uuid4(), uuid4()]
     session.execute.return_value = mock_result
 
     count = await episodic.archive_low_importance(min_days_old=365, max_importance=0.3)
 
     assert count == 2
-    assert mem1.deleted_at is not None
-    assert mem2.deleted_at is not None
-    session.flush.assert_awaited()
+    sql = _compile(session.execute.await_args.args[0])
+    assert "SET deleted_at=" in sql
+    assert "memory_episodes.importance < 0.3" in sql
+    assert "memory_episodes.deleted_at IS NULL" in sql
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,274 @@
+"""
+Unit tests for HybridMemoryRetriever.
+
+Each leg runs on its own session, so the tests hand the retriever a fake
+sessionmaker whose sessions return canned rows per leg (keyed off the
+compiled SQL) and assert on RRF fusion, leg selection, and failure
+isolation.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from empla.core.memory.hybrid import DEFAULT_RRF_K, HybridMemoryRetriever
+from empla.models.memory import EpisodicMemory, SemanticMemory
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _episode(description="Call with Acme"):
+    mem = MagicMock(spec=EpisodicMemory)
+    mem.id = uuid4()
+    mem.description = description
+    return mem
+
+
+def _fact(subject="Acme Corp"):
+    mem = MagicMock(spec=SemanticMemory)
+    mem.id = uuid4()
+    mem.subject = subject
+    return mem
+
+
+def _leg_key(stmt) -> str:
+    sql = str(stmt)
+    table = "episodic" if "memory_episodes" in sql else "semantic"
+    source = "lexical" if "websearch_to_tsquery" in sql else "vector"
+    return f"{table}_{source}"
+
+
+class _FakeSessionmaker:
+    """Sessionmaker stand-in that routes each query to canned leg results."""
+
+    def __init__(self, rows_by_leg, fail_legs=(), delay=0.0):
+        self.rows_by_leg = rows_by_leg
+        self.fail_legs = set(fail_legs)
+        self.delay = delay
+        self.sessions_opened = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.statements = []
+
+    def __call__(self):
+        self.sessions_opened += 1
+        fake = self
+
+        session = AsyncMock()
+
+        async def execute(stmt):
+            fake.statements.append(stmt)
+            key = _leg_key(stmt)
+            fake.in_flight += 1
+            fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+            try:
+                await asyncio.sleep(fake.delay)
+                if key in fake.fail_legs:
+                    raise RuntimeError(f"{key} exploded")
+            finally:
+                fake.in_flight -= 1
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = fake.rows_by_leg.get(key, [])
+            return result
+
+        session.execute = execute
+
+        ctx = AsyncMock()
+        ctx.__aenter__.return_value = session
+        ctx.__aexit__.return_value = False
+        return ctx
+
+
+@pytest.fixture
+def ids():
+    return {"employee_id": uuid4(), "tenant_id": uuid4()}
+
+
+def _retriever(sessionmaker, ids):
+    return HybridMemoryRetriever(sessionmaker, ids["employee_id"], ids["tenant_id"])
+
+
+# ============================================================================
+# Leg selection
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_lexical_only_without_embedding(ids):
+    """Without an embedding only the full-text legs run."""
+    sm = _FakeSessionmaker({})
+    result = await _retriever(sm, ids).search("deal 48213")
+
+    assert sm.sessions_opened == 2
+    assert {_leg_key(s) for s in sm.statements} == {"episodic_lexical", "semantic_lexical"}
+    assert set(result.timings_ms) == {"episodic_lexical", "semantic_lexical", "total"}
+
+
+@pytest.mark.asyncio
+async def test_all_four_legs_with_embedding(ids):
+    sm = _FakeSessionmaker({})
+    result = await _retriever(sm, ids).search("pricing", query_embedding=[0.1] * 4)
+
+    assert sm.sessions_opened == 4
+    assert {
+        "episodic_lexical",
+        "episodic_vector",
+        "semantic_lexical",
+        "semantic_vector",
+    } <= set(result.timings_ms)
+
+
+@pytest.mark.asyncio
+async def test_kinds_filter(ids):
+    sm = _FakeSessionmaker({})
+    await _retriever(sm, ids).search("pricing", query_embedding=[0.1], kinds=("semantic",))
+
+    assert {_leg_key(s) for s in sm.statements} == {"semantic_lexical", "semantic_vector"}
+
+
+@pytest.mark.asyncio
+async def test_empty_query_and_no_embedding_runs_nothing(ids):
+    sm = _FakeSessionmaker({})
+    result = await _retriever(sm, ids).search("   ")
+
+    assert sm.sessions_opened == 0
+    assert result.hits == []
+    assert result.total_ms == 0.0
+
+
+@pytest.mark.asyncio
+async def test_legs_run_concurrently(ids):
+    sm = _FakeSessionmaker({}, delay=0.02)
+    await _retriever(sm, ids).search("pricing", query_embedding=[0.1])
+
+    assert sm.max_in_flight == 4
+
+
+# ============================================================================
+# Fusion
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_rrf_rewards_agreement_between_legs(ids):
+    """A row ranked by both legs beats rows that top only one leg."""
+    both = _episode("pricing call")
+    lexical_only = _episode("pricing email")
+    vector_only = _episode("budget discussion")
+    sm = _FakeSessionmaker(
+        {
+            "episodic_lexical": [lexical_only, both],
+            "episodic_vector": [vector_only, both],
+        }
+    )
+
+    result = await _retriever(sm, ids).search("pricing", query_embedding=[0.1], kinds=("episodic",))
+
+    assert result.hits[0].record is both
+    top = result.hits[0]
+    assert top.lexical_rank == 2
+    assert top.vector_rank == 2
+    assert top.score == pytest.approx(2 / (DEFAULT_RRF_K + 2))
+
+
+@pytest.mark.asyncio
+async def test_weights_shift_ranking(ids):
+    lexical_top = _fact("Deal 48213")
+    vector_top = _fact("Acme pricing")
+    sm = _FakeSessionmaker({"semantic_lexical": [lexical_top], "semantic_vector": [vector_top]})
+
+    result = await _retriever(sm, ids).search(
+        "48213",
+        query_embedding=[0.1],
+        kinds=("semantic",),
+        lexical_weight=2.0,
+        vector_weight=0.5,
+    )
+
+    assert result.hits[0].record is lexical_top
+    assert result.hits[0].kind == "semantic"
+
+
+@pytest.mark.asyncio
+async def test_mixed_kinds_and_limit(ids):
+    episodes = [_episode() for _ in range(3)]
+    facts = [_fact() for _ in range(3)]
+    sm = _FakeSessionmaker({"episodic_lexical": episodes, "semantic_lexical": facts})
+
+    result = await _retriever(sm, ids).search("acme", limit=4)
+
+    assert len(result.hits) == 4
+    assert {h.kind for h in result.hits} == {"episodic", "semantic"}
+    scores = [h.score for h in result.hits]
+    assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_failed_leg_is_isolated(ids):
+    fact = _fact()
+    sm = _FakeSessionmaker(
+        {"semantic_lexical": [fact]},
+        fail_legs={"episodic_lexical"},
+    )
+
+    result = await _retriever(sm, ids).search("acme")
+
+    assert result.failed_legs == ["episodic_lexical"]
+    assert [h.record for h in result.hits] == [fact]
+    assert "episodic_lexical" in result.timings_ms
+
+
+@pytest.mark.asyncio
+async def test_hit_to_dict(ids):
+    ep = _episode()
+    sm = _FakeSessionmaker({"episodic_lexical": [ep]})
+
+    result = await _retriever(sm, ids).search("acme", kinds=("episodic",))
+    data = result.hits[0].to_dict()
+
+    assert data["kind"] == "episodic"
+    assert data["memory_id"] == str(ep.id)
+    assert data["lexical_rank"] == 1
+    assert data["vector_rank"] is None
+
+
+# ============================================================================
+# SQL shape
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_lexical_sql_uses_indexed_expressions(ids):
+    sm = _FakeSessionmaker({})
+    await _retriever(sm, ids).search("ceo@acme.com")
+
+    sql = {_leg_key(s): str(s) for s in sm.statements}
+    assert "to_tsvector('english', description)" in sql["episodic_lexical"]
+    assert "ANY (memory_episodes.participants)" in sql["episodic_lexical"]
+    assert (
+        "to_tsvector('english', subject || ' ' || predicate || ' ' || object)"
+        in sql["semantic_lexical"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_lexical_sql_binds_query_everywhere_for_asyncpg(ids):
+    """The rank in ORDER BY must bind :q too, or Postgres rejects the leg."""
+    sm = _FakeSessionmaker({})
+    await _retriever(sm, ids).search("ceo@acme.com", query_embedding=[0.1] * 1024)
+
+    dialect = postgresql.asyncpg.dialect()
+    for stmt in sm.statements:
+        compiled = stmt.compile(dialect=dialect)
+        sql = str(compiled)
+        assert ":q" not in sql
+        assert ":query_emb" not in sql
+        if "websearch_to_tsquery" in sql:
+            assert compiled.params["q"] == "ceo@acme.com"
+            order_by = sql.split("ORDER BY", 1)[1]
+            assert "websearch_to_tsquery('english', $" in order_by
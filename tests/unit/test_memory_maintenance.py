@@ -0,0 +1,199 @@
+"""
+Unit tests for set-based memory maintenance.
+
+Covers job SQL shape (single UPDATE ... RETURNING, keyset chunking with
+SKIP LOCKED), the engine's chunk loop and scoping, per-job failure
+isolation, and job selection.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from empla.core.memory.maintenance import (
+    MaintenancePolicy,
+    MemoryMaintenanceEngine,
+    episodic_decay,
+    procedural_reinforce,
+    semantic_archive,
+)
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class _FakeSessionmaker:
+    """Sessionmaker stand-in returning queued id batches per statement."""
+
+    def __init__(self, batches, fail_on=None):
+        self.batches = list(batches)
+        self.fail_on = fail_on
+        self.statements = []
+        self.commits = 0
+
+    def __call__(self):
+        fake = self
+        session = AsyncMock()
+
+        async def execute(stmt):
+            fake.statements.append(stmt)
+            if fake.fail_on and fake.fail_on in _compile(stmt):
+                raise RuntimeError("lock timeout")
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = (
+                fake.batches.pop(0) if fake.batches else []
+            )
+            return result
+
+        async def commit():
+            fake.commits += 1
+
+        session.execute = execute
+        session.commit = commit
+        ctx = AsyncMock()
+        ctx.__aenter__.return_value = session
+        ctx.__aexit__.return_value = False
+        return ctx
+
+
+def _ids(n):
+    return sorted(uuid4() for _ in range(n))
+
+
+# ============================================================================
+# Job SQL
+# ============================================================================
+
+
+def test_statement_is_single_update_returning():
+    sql = _compile(episodic_decay(min_days_old=30, importance_decay=0.95).statement())
+
+    assert sql.startswith("UPDATE memory_episodes SET importance=")
+    assert "memory_episodes.deleted_at IS NULL" in sql
+    assert "RETURNING memory_episodes.id" in sql
+    assert "SELECT" not in sql
+
+
+def test_chunk_statement_uses_keyset_and_skip_locked():
+    job = semantic_archive(max_confidence=0.3, min_days_old=90)
+    sql = _compile(
+        job.chunk_statement(job.model.tenant_id == uuid4(), after=uuid4(), chunk_size=100)
+    )
+
+    assert sql.startswith("WITH maintenance_batch AS")
+    assert "memory_semantic.id > " in sql
+    assert "ORDER BY memory_semantic.id" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "FROM maintenance_batch WHERE memory_semantic.id = maintenance_batch.id" in sql
+
+
+def test_first_chunk_has_no_keyset_bound():
+    job = semantic_archive(max_confidence=0.3, min_days_old=90)
+    sql = _compile(job.chunk_statement(after=None, chunk_size=100))
+    assert "memory_semantic.id >" not in sql
+
+
+def test_procedural_reinforce_merges_context():
+    sql = _compile(procedural_reinforce(min_success_rate=0.8, min_executions=3).statement())
+    assert "context=(coalesce(memory_procedural.context" in sql
+    assert "||" in sql
+
+
+def test_policy_job_order():
+    names = [job.name for job in MaintenancePolicy().jobs()]
+    assert names == [
+        "episodic_reinforce",
+        "episodic_decay",
+        "semantic_reinforce",
+        "semantic_decay",
+        "semantic_archive",
+        "procedural_reinforce",
+        "procedural_archive",
+    ]
+
+
+# ============================================================================
+# Engine
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_engine_chunks_until_short_batch():
+    first, second = _ids(2), _ids(1)
+    sm = _FakeSessionmaker([first, second])
+    engine = MemoryMaintenanceEngine(sm, chunk_size=2)
+
+    report = await engine.run(only=["episodic_decay"])
+
+    [result] = report.results
+    assert result.rows == 3
+    assert result.chunks == 2
+    assert sm.commits == 2  # one short transaction per chunk
+    # Second chunk resumes after the highest id of the first
+    second_sql = sm.statements[1].compile(dialect=postgresql.dialect())
+    assert max(first) in second_sql.params.values()
+
+
+@pytest.mark.asyncio
+async def test_engine_scopes_to_tenant_and_employee():
+    tenant_id, employee_id = uuid4(), uuid4()
+    sm = _FakeSessionmaker([])
+    engine = MemoryMaintenanceEngine(sm, tenant_id=tenant_id, employee_id=employee_id)
+
+    await engine.run(only=["episodic_reinforce"])
+
+    params = sm.statements[0].compile(dialect=postgresql.dialect()).params
+    assert tenant_id in params.values()
+    assert employee_id in params.values()
+
+
+@pytest.mark.asyncio
+async def test_engine_unscoped_sweeps_fleet():
+    sm = _FakeSessionmaker([])
+    await MemoryMaintenanceEngine(sm).run(only=["episodic_reinforce"])
+
+    sql = _compile(sm.statements[0])
+    assert "tenant_id" not in sql
+    assert "employee_id" not in sql
+
+
+@pytest.mark.asyncio
+async def test_failed_job_does_not_stop_others():
+    sm = _FakeSessionmaker([], fail_on="memory_semantic")
+    report = await MemoryMaintenanceEngine(sm).run()
+
+    assert report.failed_jobs == ["semantic_reinforce", "semantic_decay", "semantic_archive"]
+    ran = {r.name for r in report.results if r.error is None}
+    assert {"episodic_reinforce", "procedural_archive"} <= ran
+    assert report.to_dict()["failed_jobs"] == report.failed_jobs
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_rejected():
+    engine = MemoryMaintenanceEngine(_FakeSessionmaker([]))
+    with pytest.raises(ValueError, match="Unknown maintenance jobs"):
+        await engine.run(only=["nope"])
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        MemoryMaintenanceEngine(_FakeSessionmaker([]), chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_report_totals():
+    sm = _FakeSessionmaker([_ids(3)])
+    report = await MemoryMaintenanceEngine(sm, chunk_size=10).run()
+
+    assert report.total_rows == 3
+    data = report.to_dict()
+    assert data["total_rows"] == 3
+    assert len(data["jobs"]) == 7
+    assert all(isinstance(j["duration_ms"], float) for j in data["jobs"])
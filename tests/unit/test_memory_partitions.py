@@ -0,0 +1,220 @@
+"""
+Unit tests for monthly history partitions and retention.
+
+Covers month arithmetic and partition naming, the generated DDL/export
+SQL, and HistoryRetention's create/archive flow against a fake session
+factory (including re-attach on a failed export).
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from empla.core.memory.archive import BELIEF_HISTORY_TABLE, EPISODES_TABLE, HistoryArchive
+from empla.core.memory.partitions import (
+    HistoryRetention,
+    _export_sql,
+    _parse_partition_name,
+    add_months,
+    create_partition_sql,
+    month_start,
+    partition_name,
+)
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+
+
+def _month(year, month):
+    return datetime(year, month, 1, tzinfo=UTC)
+
+
+class _FakeSessionmaker:
+    """Sessionmaker stand-in recording SQL and serving partition listings."""
+
+    def __init__(self, partitions, export_rows=(), count=None, fail_export=False):
+        self.partitions = list(partitions)
+        self.export_rows = list(export_rows)
+        self.count = len(self.export_rows) if count is None else count
+        self.fail_export = fail_export
+        self.sql = []
+
+    def __call__(self):
+        fake = self
+        session = AsyncMock()
+
+        async def execute(stmt, params=None):
+            sql = str(stmt)
+            fake.sql.append(sql)
+            result = MagicMock()
+            if "pg_inherits" in sql:
+                result.scalars.return_value.all.return_value = fake.partitions
+            elif sql.startswith("SELECT count(*)"):
+                result.scalar_one.return_value = fake.count
+            return result
+
+        async def stream(stmt):
+            fake.sql.append(str(stmt))
+            if fake.fail_export:
+                raise RuntimeError("connection reset")
+
+            async def batches(size):
+                yield fake.export_rows
+
+            result = MagicMock()
+            result.mappings.return_value.partitions = batches
+            return result
+
+        session.execute = execute
+        session.stream = stream
+        ctx = AsyncMock()
+        ctx.__aenter__.return_value = session
+        ctx.__aexit__.return_value = False
+        return ctx
+
+
+def _rows(n, occurred_at):
+    employee_id, tenant_id = uuid4(), uuid4()
+    return [
+        {
+            "id": uuid4(),
+            "tenant_id": tenant_id,
+            "employee_id": employee_id,
+            "episode_type": "interaction",
+            "description": "x",
+            "content": "{}",
+            "participants": [],
+            "importance": 0.5,
+            "recall_count": 0,
+            "occurred_at": occurred_at,
+            "created_at": occurred_at,
+            "updated_at": occurred_at,
+        }
+        for _ in range(n)
+    ]
+
+
+# ============================================================================
+# Naming and SQL
+# ============================================================================
+
+
+def test_month_arithmetic():
+    assert month_start(NOW) == _month(2026, 10)
+    assert add_months(_month(2026, 11), 2) == _month(2027, 1)
+    assert add_months(_month(2026, 1), -1) == _month(2025, 12)
+
+
+def test_partition_name_round_trip():
+    name = partition_name("memory_episodes", _month(2026, 1))
+    assert name == "memory_episodes_p202601"
+    assert _parse_partition_name("memory_episodes", name) == _month(2026, 1)
+    assert _parse_partition_name("memory_episodes", "memory_episodes_default") is None
+
+
+def test_create_partition_sql_is_half_open_month():
+    sql = create_partition_sql("belief_history", _month(2026, 12))
+    assert sql.startswith("CREATE TABLE IF NOT EXISTS belief_history_p202612 PARTITION OF")
+    assert "FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')" in sql
+
+
+def test_export_sql_casts_json_and_vector():
+    sql = _export_sql(EPISODES_TABLE, "memory_episodes_p202601")
+    assert "h.content::text AS content" in sql
+    assert "h.embedding::text AS embedding" in sql
+    assert "JOIN" not in sql
+
+
+def test_export_sql_denormalizes_belief_columns():
+    sql = _export_sql(BELIEF_HISTORY_TABLE, "belief_history_p202601")
+    assert "b.subject AS belief_subject" in sql
+    assert "LEFT JOIN beliefs b ON b.id = h.belief_id" in sql
+    assert "h.belief_subject" not in sql
+
+
+# ============================================================================
+# HistoryRetention
+# ============================================================================
+
+
+def test_invalid_configuration(tmp_path):
+    archive = HistoryArchive(tmp_path)
+    with pytest.raises(ValueError):
+        HistoryRetention(_FakeSessionmaker([]), archive, hot_months=0)
+    with pytest.raises(ValueError, match="Not partitioned"):
+        HistoryRetention(_FakeSessionmaker([]), archive, tables=("beliefs",))
+
+
+def test_hot_cutoff_includes_current_month(tmp_path):
+    retention = HistoryRetention(_FakeSessionmaker([]), HistoryArchive(tmp_path), hot_months=6)
+    assert retention.hot_cutoff(NOW) == _month(2026, 5)
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_missing_months(tmp_path):
+    sm = _FakeSessionmaker(["memory_episodes_p202610", "memory_episodes_default"])
+    retention = HistoryRetention(sm, HistoryArchive(tmp_path), months_ahead=2)
+
+    created = await retention.ensure_partitions("memory_episodes", now=NOW)
+
+    assert created == ["memory_episodes_p202611", "memory_episodes_p202612"]
+
+
+@pytest.mark.asyncio
+async def test_run_archives_expired_partitions(tmp_path):
+    pytest.importorskip("pyarrow")
+    sm = _FakeSessionmaker(
+        ["memory_episodes_p202604", "memory_episodes_p202605"],
+        export_rows=_rows(3, datetime(2026, 4, 2, tzinfo=UTC)),
+    )
+    archive = HistoryArchive(tmp_path)
+    retention = HistoryRetention(sm, archive, hot_months=6, tables=("memory_episodes",))
+
+    report = await retention.run(NOW)
+
+    [result] = report.archived
+    assert result.error is None
+    assert result.rows == 3
+    assert archive.archived_months("memory_episodes") == [_month(2026, 4)]
+    assert "ALTER TABLE memory_episodes DETACH PARTITION memory_episodes_p202604" in sm.sql
+    assert "DROP TABLE memory_episodes_p202604" in sm.sql
+    assert not any("p202605" in sql and "DETACH" in sql for sql in sm.sql)
+    assert report.to_dict()["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_export_reattaches_and_keeps_rows(tmp_path):
+    pytest.importorskip("pyarrow")
+    sm = _FakeSessionmaker(["memory_episodes_p202601"], fail_export=True)
+    archive = HistoryArchive(tmp_path)
+    retention = HistoryRetention(sm, archive, tables=("memory_episodes",))
+
+    report = await retention.run(NOW)
+
+    [result] = report.failed
+    assert result.error.startswith("export failed")
+    assert any("ATTACH PARTITION memory_episodes_p202601" in sql for sql in sm.sql)
+    assert not any(sql.startswith("DROP TABLE") for sql in sm.sql)
+    assert archive.archived_months("memory_episodes") == []
+
+
+@pytest.mark.asyncio
+async def test_count_mismatch_is_not_published(tmp_path):
+    pytest.importorskip("pyarrow")
+    sm = _FakeSessionmaker(
+        ["memory_episodes_p202601"],
+        export_rows=_rows(2, datetime(2026, 1, 2, tzinfo=UTC)),
+        count=5,
+    )
+    archive = HistoryArchive(tmp_path)
+    retention = HistoryRetention(sm, archive, tables=("memory_episodes",))
+
+    report = await retention.run(NOW)
+
+    assert "row count mismatch" in report.failed[0].error
+    assert archive.archived_months("memory_episodes") == []
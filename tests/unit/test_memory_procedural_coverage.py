@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from empla.core.memory.procedural import ProceduralMemorySystem
 from empla.models.memory import ProceduralMemory
@@ -48,6 +49,10 @@ def _make_procedural_memory(**overrides):
     return mem
 
 
+def _compile(stmt):
+    return stmt.compile(dialect=postgresql.dialect())
+
+
 @pytest.fixture
 def session():
     s = AsyncMock()
@@ -535,18 +540,18 @@ async def test_update_procedure_embedding_not_found(procedural, session):
 
 @pytest.mark.asyncio
 async def test_archive_poor_procedures(procedural, session):
-    """archive soft-deletes poorly performing procedures."""
-    proc1 = _make_procedural_memory(success_rate=0.1, deleted_at=None)
-    proc2 = _make_procedural_memory(success_rate=0.2, deleted_at=None)
-
+    """archive soft-deletes poorly performing procedures in one UPDATE."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [proc1, proc2]
+    mock_result.scalars.return_value.all.return_value = [uuid4(), uuid4()]
     session.execute.return_value = mock_result
 
     count = await procedural.archive_poor_procedures(max_success_rate=0.3, min_executions=5)
     assert count == 2
-    assert proc1.deleted_at is not None
-    assert proc2.deleted_at is not None
+    session.execute.assert_awaited_once()
+    compiled = _compile(session.execute.await_args.args[0])
+    assert str(compiled).startswith("UPDATE memory_procedural SET deleted_at=")
+    assert compiled.params["success_rate_1"] == 0.3
+    assert compiled.params["execution_count_1"] == 5
 
 
 @pytest.mark.asyncio
@@ -567,34 +572,30 @@ async def test_archive_poor_procedures_empty(procedural, session):
 
 @pytest.mark.asyncio
 async def test_reinforce_successful_procedures(procedural, session):
-    """reinforce marks successful procedures as proven."""
-    proc = _make_procedural_memory(success_rate=0.9, execution_count=10, context={})
-
+    """reinforce marks successful procedures as proven via a JSONB merge."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [proc]
+    mock_result.scalars.return_value.all.return_value = [uuid4()]
     session.execute.return_value = mock_result
 
     count = await procedural.reinforce_successful_procedures(min_success_rate=0.8, min_executions=5)
     assert count == 1
-    assert proc.context["proven"] is True
-    assert "reinforced_at" in proc.context
-    session.flush.assert_awaited()
+    compiled = _compile(session.execute.await_args.args[0])
+    marker = next(v for v in compiled.params.values() if isinstance(v, dict) and v)
+    assert marker["proven"] is True
+    assert "reinforced_at" in marker
 
 
 @pytest.mark.asyncio
 async def test_reinforce_preserves_existing_context(procedural, session):
-    """reinforce preserves existing context keys."""
-    proc = _make_procedural_memory(
-        success_rate=0.9, execution_count=10, context={"existing_key": "value"}
-    )
-
+    """reinforce merges into existing context rather than replacing it."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [proc]
+    mock_result.scalars.return_value.all.return_value = []
     session.execute.return_value = mock_result
 
     await procedural.reinforce_successful_procedures()
-    assert proc.context["existing_key"] == "value"
-    assert proc.context["proven"] is True
+    sql = str(_compile(session.execute.await_args.args[0]))
+    assert "context=(coalesce(memory_procedural.context," in sql
+    assert "||" in sql
 
 
 @pytest.mark.asyncio
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from empla.core.memory.semantic import SemanticMemorySystem
 from empla.models.memory import SemanticMemory
@@ -48,6 +49,10 @@ def _make_semantic_memory(**overrides):
     return mem
 
 
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
 @pytest.fixture
 def session():
     s = AsyncMock()
@@ -469,18 +474,18 @@ async def test_update_fact_confidence_not_found(semantic, session):
 
 @pytest.mark.asyncio
 async def test_decay_old_facts(semantic, session):
-    """decay reduces confidence of old rarely-accessed facts."""
-    fact1 = _make_semantic_memory(confidence=0.8)
-    fact2 = _make_semantic_memory(confidence=0.6)
-
+    """decay reduces confidence of old rarely-accessed facts in one UPDATE."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [fact1, fact2]
+    mock_result.scalars.return_value.all.return_value = [uuid4(), uuid4()]
     session.execute.return_value = mock_result
 
     count = await semantic.decay_old_facts(min_days_old=180, confidence_decay=0.9)
     assert count == 2
-    assert fact1.confidence == pytest.approx(0.72)
-    assert fact2.confidence == pytest.approx(0.54)
+    session.execute.assert_awaited_once()
+    sql = _compile(session.execute.await_args.args[0])
+    assert sql.startswith("UPDATE memory_semantic SET confidence=")
+    assert "(memory_semantic.confidence * 0.9)" in sql
+    assert "memory_semantic.access_count < 5" in sql
 
 
 @pytest.mark.asyncio
@@ -501,18 +506,17 @@ async def test_decay_old_facts_empty(semantic, session):
 
 @pytest.mark.asyncio
 async def test_archive_low_confidence_facts(semantic, session):
-    """archive soft-deletes low-confidence old facts."""
-    fact1 = _make_semantic_memory(confidence=0.1, deleted_at=None)
-    fact2 = _make_semantic_memory(confidence=0.2, deleted_at=None)
-
+    """archive soft-deletes low-confidence old facts in one UPDATE."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [fact1, fact2]
+    mock_result.scalars.return_value.all.return_value = [uuid4(), uuid4()]
     session.execute.return_value = mock_result
 
     count = await semantic.archive_low_confidence_facts(max_confidence=0.3, min_days_old=90)
     assert count == 2
-    assert fact1.deleted_at is not None
-    assert fact2.deleted_at is not None
+    sql = _compile(session.execute.await_args.args[0])
+    assert "SET deleted_at=" in sql
+    assert "memory_semantic.confidence < 0.3" in sql
+    assert "RETURNING memory_semantic.id" in sql
 
 
 @pytest.mark.asyncio
@@ -532,32 +536,29 @@ async def test_archive_low_confidence_empty(semantic, session):
 
 
 @pytest.mark.asyncio
-async def test_reinforce_frequently_accessed(semantic, session):
-    """reinforce boosts confidence of frequently accessed facts."""
-    fact1 = _make_semantic_memory(confidence=0.5, access_count=15)
-    fact2 = _make_semantic_memory(confidence=0.9, access_count=12)
-
+async def test_reinforce_frequently_accessed(semantic, session, ids):
+    """reinforce boosts confidence of frequently accessed facts in one UPDATE."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [fact1, fact2]
+    mock_result.scalars.return_value.all.return_value = [uuid4(), uuid4()]
     session.execute.return_value = mock_result
 
     count = await semantic.reinforce_frequently_accessed(min_access_count=10, confidence_boost=1.1)
     assert count == 2
-    assert fact1.confidence == pytest.approx(0.55)
-    assert fact2.confidence == pytest.approx(0.99)
+    sql = _compile(session.execute.await_args.args[0])
+    assert "memory_semantic.access_count >= 10" in sql
+    assert f"memory_semantic.tenant_id = '{ids['tenant_id']}'" in sql
 
 
 @pytest.mark.asyncio
 async def test_reinforce_caps_at_one(semantic, session):
-    """reinforce caps confidence at 1.0."""
-    fact = _make_semantic_memory(confidence=0.95, access_count=20)
-
+    """reinforce caps confidence at 1.0 in SQL."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [fact]
+    mock_result.scalars.return_value.all.return_value = []
     session.execute.return_value = mock_result
 
     await semantic.reinforce_frequently_accessed(confidence_boost=1.2)
-    assert fact.confidence == 1.0
+    sql = _compile(session.execute.await_args.args[0])
+    assert "confidence=least(1.0, memory_semantic.confidence * 1.2)" in sql
 
 
 @pytest.mark.asyncio
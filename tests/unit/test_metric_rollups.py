@@ -0,0 +1,310 @@
+"""
+Unit tests for metric rollups.
+
+Covers sketch accuracy and merging, resolution choice, the reader query
+(rollups up to the watermark plus the raw tail), bucket merging, the
+rollup job's window and chunking, and the single-pass summary endpoints.
+"""
+
+from __future__ import annotations
+
+import random
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from empla.services.metric_rollups import (
+    HOUR,
+    MINUTE,
+    MetricRollupJob,
+    bucket_floor,
+    history_resolution,
+    merge_points,
+    merge_sketches,
+    metric_points,
+    sketch_key,
+    sketch_quantile,
+    summary_resolution,
+)
+
+NOW = datetime(2026, 10, 18, 12, 34, 56, tzinfo=UTC)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _point(at: datetime, value: float, *, n: int = 1, histogram=None, kind: str = "histogram"):
+    return SimpleNamespace(
+        metric_type=kind, at=at, n=n, total=value, lo=value, hi=value, histogram=histogram
+    )
+
+
+# ============================================================================
+# Sketches
+# ============================================================================
+
+
+def test_sketch_quantiles_are_within_accuracy():
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(0, 1.5) for _ in range(5000))
+    sketch: dict[str, int] = {}
+    for v in values:
+        key = sketch_key(v)
+        sketch[key] = sketch.get(key, 0) + 1
+
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch_quantile(sketch, q) == pytest.approx(exact, rel=0.021)
+
+
+def test_sketch_handles_non_positive_values_and_empty():
+    assert sketch_key(0.0) == "z"
+    assert sketch_quantile({"z": 3, sketch_key(2.0): 1}, 0.5) == 0.0
+    assert sketch_quantile({}, 0.5) is None
+
+
+def test_merge_sketches_adds_counts():
+    assert merge_sketches([{"1": 2, "z": 1}, None, {"1": 3, "4": 1}]) == {"1": 5, "z": 1, "4": 1}
+
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+
+def test_resolution_choice():
+    assert summary_resolution(1) == MINUTE
+    assert summary_resolution(24) == HOUR
+    assert history_resolution(6) == MINUTE
+    assert history_resolution(7) == HOUR
+
+
+def test_bucket_floor():
+    assert bucket_floor(NOW, MINUTE) == datetime(2026, 10, 18, 12, 34, tzinfo=UTC)
+    assert bucket_floor(NOW, HOUR) == datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+
+
+def test_points_union_rollups_before_watermark_with_raw_tail():
+    p = metric_points(uuid4(), uuid4(), ("cycle.success",), NOW, HOUR)
+    sql = _sql(select(p))
+
+    assert "UNION ALL" in sql
+    assert "metric_rollups.bucket_start < (SELECT max(metric_rollups.bucket_start) +" in sql
+    assert "metrics.timestamp >= coalesce((SELECT max(metric_rollups.bucket_start) +" in sql
+    assert "histogram" not in sql
+
+
+def test_merge_points_folds_raw_tail_into_its_bucket():
+    hour = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+    rows = [
+        _point(hour - timedelta(hours=1), 1.0, n=2, histogram={sketch_key(1.0): 2}),
+        _point(hour, 2.0, n=3, histogram={sketch_key(2.0): 3}),
+        _point(hour + timedelta(minutes=40), 8.0),  # raw row after the watermark
+    ]
+
+    newest, oldest = merge_points(rows, HOUR)
+
+    assert (newest.start, newest.count, newest.low, newest.high) == (hour, 4, 2.0, 8.0)
+    assert newest.value == pytest.approx((2.0 + 8.0) / 4)
+    assert newest.quantile(0.5) == pytest.approx(2.0, rel=0.02)
+    assert newest.quantile(1.0) == pytest.approx(8.0, rel=0.02)
+    assert oldest.count == 2
+
+
+def test_counter_buckets_report_sums():
+    rows = [_point(NOW, 3.0, kind="counter"), _point(NOW, 4.0, kind="counter")]
+    (bucket,) = merge_points(rows, MINUTE)
+    assert bucket.value == 7.0
+    assert bucket.quantile(0.5) is None
+
+
+# ============================================================================
+# Rollup job
+# ============================================================================
+
+
+class FakeSessions:
+    """Session factory whose sessions answer queries from a shared script."""
+
+    def __init__(self, *scalars) -> None:
+        self.scalars = list(scalars)
+        self.statements: list[tuple[str, dict | None]] = []
+        self.commits = 0
+
+    def __call__(self):
+        @asynccontextmanager
+        async def _session():
+            session = AsyncMock()
+
+            async def execute(stmt, params=None):
+                self.statements.append((str(stmt), params))
+                result = Mock(rowcount=0)
+                if self.scalars:
+                    value = self.scalars.pop(0)
+                    result.scalar.return_value = value
+                    result.scalar_one.return_value = value
+                return result
+
+            async def commit():
+                self.commits += 1
+
+            session.execute = execute
+            session.commit = commit
+            yield session
+
+        return _session()
+
+
+@pytest.mark.asyncio
+async def test_job_resumes_after_last_minute_minus_reprocess_window():
+    last = datetime(2026, 10, 18, 12, 30, tzinfo=UTC)
+    sessions = FakeSessions(NOW, last)
+    job = MetricRollupJob(sessions, reprocess_minutes=5, raw_retention_days=0)
+
+    report = await job.run()
+
+    assert report.start == last + timedelta(minutes=1) - timedelta(minutes=5)
+    assert report.end == datetime(2026, 10, 18, 12, 34, tzinfo=UTC)
+    assert report.chunks == 1
+    minute_sql, params = sessions.statements[2]
+    assert "INSERT INTO metric_rollups" in minute_sql
+    assert (params["start"], params["end"]) == (report.start, report.end)
+    assert "date_trunc('hour'" in sessions.statements[3][0]
+
+
+@pytest.mark.asyncio
+async def test_first_run_catches_up_in_chunks():
+    first_raw = NOW - timedelta(hours=13)
+    sessions = FakeSessions(NOW, None, first_raw)
+    job = MetricRollupJob(sessions, chunk_hours=6, raw_retention_days=0)
+
+    report = await job.run()
+
+    assert report.start == bucket_floor(first_raw, MINUTE)
+    assert report.chunks == 3
+    inserts = [p for sql, p in sessions.statements if "INSERT INTO metric_rollups" in sql]
+    assert len(inserts) == 6  # minute + hour upsert per chunk
+    assert inserts[-1]["end"] == report.end
+
+
+@pytest.mark.asyncio
+async def test_retention_never_deletes_unrolled_raw_rows():
+    sessions = FakeSessions(NOW, NOW - timedelta(days=2))
+    job = MetricRollupJob(sessions, raw_retention_days=1, minute_retention_days=1)
+
+    report = await job.run()
+
+    deletes = [(sql, p) for sql, p in sessions.statements if sql.startswith("DELETE FROM metrics")]
+    assert len(deletes) == 1
+    assert report.raw_rows_deleted == 0
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+
+def _auth():
+    return SimpleNamespace(tenant_id=uuid4())
+
+
+@pytest.mark.asyncio
+async def test_summary_is_one_filtered_query():
+    from empla.api.v1.endpoints.metrics import get_metric_summary
+
+    result = Mock()
+    result.one.return_value = SimpleNamespace(
+        cycle_count=4,
+        duration_sum=10.0,
+        max_duration=4.0,
+        success_count=4,
+        success_sum=3.0,
+        tool_total=20.0,
+        tool_failed=2.0,
+        latency_sum=1000.0,
+    )
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+
+    summary = await get_metric_summary(uuid4(), db, _auth(), hours=24)
+
+    assert db.execute.await_count == 1
+    sql = _sql(db.execute.await_args.args[0])
+    assert sql.count("FILTER (WHERE") == 8
+    assert "metric_rollups.resolution_seconds = %(resolution_seconds_1)s" in sql
+    assert summary.cycle_count == 4
+    assert summary.avg_duration_seconds == 2.5
+    assert summary.success_rate == 0.75
+    assert summary.tool_failure_rate == 0.1
+    assert summary.avg_tool_latency_ms == 50.0
+
+
+@pytest.mark.asyncio
+async def test_empty_summary_is_zeroes():
+    from empla.api.v1.endpoints.metrics import get_metric_summary
+
+    result = Mock()
+    result.one.return_value = SimpleNamespace(
+        cycle_count=None,
+        duration_sum=None,
+        max_duration=None,
+        success_count=None,
+        success_sum=None,
+        tool_total=None,
+        tool_failed=None,
+        latency_sum=None,
+    )
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+
+    summary = await get_metric_summary(uuid4(), db, _auth(), hours=1)
+
+    assert (summary.cycle_count, summary.success_rate, summary.avg_tool_latency_ms) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_history_returns_bucketed_pages():
+    from empla.api.v1.endpoints.metrics import get_metric_history
+
+    minute = bucket_floor(NOW, MINUTE)
+    rows = [_point(minute - timedelta(minutes=i), float(i + 1)) for i in range(5)]
+    result = Mock()
+    result.all.return_value = rows
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+
+    page = await get_metric_history(uuid4(), db, _auth(), hours=1, page=2, page_size=2)
+
+    assert page.resolution == "1m"
+    assert (page.total, page.pages) == (5, 3)
+    assert [p.value for p in page.items] == [3.0, 4.0]
+    assert page.items[0].count == 1
+    assert page.items[0].p95 == pytest.approx(3.0, rel=0.02)
+
+
+@pytest.mark.asyncio
+async def test_raw_history_still_available():
+    from empla.api.v1.endpoints.metrics import get_metric_history
+
+    metric = SimpleNamespace(
+        metric_name="cycle.duration_seconds", value=1.5, timestamp=NOW, tags={"cycle": 3}
+    )
+    count = Mock()
+    count.scalar.return_value = 1
+    rows = Mock()
+    rows.scalars.return_value = [metric]
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=[count, rows])
+
+    page = await get_metric_history(uuid4(), db, _auth(), resolution="raw")
+
+    assert page.resolution == "raw"
+    assert page.items[0].tags == {"cycle": 3}
+    assert page.items[0].count is None
@@ -139,6 +139,35 @@ class TestRecordCycleMetrics:
         latency_sum = next(m for m in metrics if m.metric_name == "tool.latency_sum_ms")
         assert latency_sum.value == 1900.0
 
+    @pytest.mark.asyncio
+    async def test_records_windowed_latency_gauges(self, mock_db):
+        """Sliding-window percentiles become tagged gauges; idle windows are skipped."""
+        window = {"calls": 4, "error_rate": 0.25, "p50_ms": 90.0, "p95_ms": 400.0, "p99_ms": 480.0}
+        await record_cycle_metrics(
+            mock_db,
+            tenant_id=uuid4(),
+            employee_id=uuid4(),
+            cycle_count=1,
+            duration_seconds=1.0,
+            success=True,
+            tool_stats=[
+                {"name": "hubspot", "total_calls": 4, "window": window},
+                {"name": "calendar", "total_calls": 1, "window": {"calls": 0}},
+            ],
+            tool_latency=[{"name": "hubspot.get_deals", "window": window}],
+        )
+
+        metrics = [c.args[0] for c in mock_db.add.call_args_list]
+        p95 = [m for m in metrics if m.metric_name == "tool.latency_p95_ms"]
+
+        assert [m.tags for m in p95] == [
+            {"cycle": 1, "integration": "hubspot"},
+            {"cycle": 1, "tool": "hubspot.get_deals"},
+        ]
+        assert all(m.metric_type == "gauge" and m.value == 400.0 for m in p95)
+        error_rate = next(m for m in metrics if m.metric_name == "tool.error_rate")
+        assert error_rate.value == 0.25
+
     @pytest.mark.asyncio
     async def test_tool_stats_computes_deltas_across_cycles(self, mock_db):
         """Second cycle should record only the delta from first cycle."""
@@ -277,6 +306,37 @@ class TestRecordCycleMetrics:
         # All tag dicts should be different objects
         assert len(set(tag_ids)) == len(tag_ids)
 
+    @pytest.mark.asyncio
+    async def test_records_http_stats_for_active_providers(self, mock_db):
+        """Providers with traffic get integration.http.* rows; idle ones are skipped."""
+        await record_cycle_metrics(
+            mock_db,
+            tenant_id=uuid4(),
+            employee_id=uuid4(),
+            cycle_count=3,
+            duration_seconds=1.0,
+            success=True,
+            http_stats={
+                "hubspot": {"queue_depth": 2.0, "requests": 9.0, "wait_ms_avg": 40.0},
+                "google_calendar": {"queue_depth": 0.0, "requests": 0.0},
+            },
+        )
+
+        http = [
+            c.args[0]
+            for c in mock_db.add.call_args_list
+            if c.args[0].metric_name.startswith("integration.http.")
+        ]
+        assert {m.metric_name for m in http} == {
+            "integration.http.queue_depth",
+            "integration.http.wait_ms_avg",
+            "integration.http.wait_ms_max",
+            "integration.http.throttled",
+        }
+        assert all(m.tags == {"cycle": 3, "provider": "hubspot"} for m in http)
+        depth = next(m for m in http if m.metric_name == "integration.http.queue_depth")
+        assert depth.value == 2.0
+
 
 # ============================================================================
 # Response Model Tests
@@ -0,0 +1,351 @@
+"""
+Unit tests for MetricsSink and its use by the BDI loop.
+
+Covers buffering, size- and time-triggered flushes, COPY vs multi-row
+INSERT, requeue/drop accounting, backpressure, the final flush on stop,
+and the loop's sink path (tool-stats cache, cost hard-stop pending sum).
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from empla.services.metrics import _previous_tool_stats, build_cycle_metrics
+from empla.services.metrics_sink import COLUMNS, MetricsSink, write_metrics
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _session(copy=None):
+    """Session whose raw connection offers COPY when ``copy`` is given."""
+    driver = SimpleNamespace(copy_records_to_table=copy) if copy else SimpleNamespace()
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(
+        return_value=SimpleNamespace(driver_connection=driver)
+    )
+    s = AsyncMock()
+    s.connection = AsyncMock(return_value=connection)
+    return s
+
+
+def _sessionmaker(session):
+    ctx = AsyncMock()
+    ctx.__aenter__.return_value = session
+    ctx.__aexit__.return_value = False
+    return MagicMock(return_value=ctx)
+
+
+def _rows(n, tenant_id=None, name="cycle.success", value=1.0):
+    tenant_id = tenant_id or uuid4()
+    return [
+        {
+            "tenant_id": tenant_id,
+            "employee_id": uuid4(),
+            "metric_name": name,
+            "metric_type": "gauge",
+            "value": value,
+            "tags": {"cycle": i},
+        }
+        for i in range(n)
+    ]
+
+
+# ============================================================================
+# Buffering and writing
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_submit_buffers_stamped_rows_without_sql():
+    session = _session()
+    sink = MetricsSink(_sessionmaker(session))
+
+    assert await sink.submit(_rows(3))
+
+    session.execute.assert_not_called()
+    assert sink.pending_count == 3
+    row = sink._pending[0]
+    assert set(row) == set(COLUMNS)
+    assert row["timestamp"] == row["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_flush_copies_on_asyncpg():
+    copy = AsyncMock()
+    session = _session(copy=copy)
+    sink = MetricsSink(_sessionmaker(session))
+    await sink.submit(_rows(2))
+
+    assert await sink.flush() == 2
+
+    table = copy.await_args.args[0]
+    records = copy.await_args.kwargs["records"]
+    assert table == "metrics"
+    assert copy.await_args.kwargs["columns"] == list(COLUMNS)
+    assert json.loads(records[1][COLUMNS.index("tags")]) == {"cycle": 1}
+    session.execute.assert_not_called()
+    session.commit.assert_awaited_once()
+    assert sink.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_write_falls_back_to_multi_row_insert():
+    session = _session()
+    rows = [dict.fromkeys(COLUMNS) for _ in range(3)]
+
+    await write_metrics(session, rows)
+
+    stmt, params = session.execute.await_args.args
+    assert stmt.table.name == "metrics"
+    assert params == rows
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_oldest_first_and_counts_overflow():
+    session = _session()
+    session.commit.side_effect = RuntimeError("db down")
+    sink = MetricsSink(_sessionmaker(session), max_pending=4)
+    await sink.submit(_rows(3))
+    first = sink._pending[0]["id"]
+
+    with pytest.raises(RuntimeError):
+        await sink.flush()
+    assert sink.pending_count == 3
+    assert sink._pending[0]["id"] == first
+
+    sink.max_pending = 2
+    with pytest.raises(RuntimeError):
+        await sink.flush()
+    assert sink.pending_count == 2
+    assert sink.get_stats()["dropped"] == 1
+    assert sink.get_stats()["flush_failures"] == 2
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_without_flusher_drops_immediately():
+    sink = MetricsSink(_sessionmaker(_session()), max_pending=2)
+
+    assert await sink.submit(_rows(2))
+    assert not await sink.submit(_rows(1))
+    assert sink.dropped == 1
+    assert sink.pending_count == 2
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_waits_for_flusher_to_make_room():
+    copy = AsyncMock()
+    sink = MetricsSink(
+        _sessionmaker(_session(copy=copy)),
+        flush_interval_seconds=60,
+        flush_rows=100,
+        max_pending=2,
+    )
+    sink.start()
+    try:
+        await sink.submit(_rows(2))
+        assert await sink.submit(_rows(1))  # waits for the flush, then fits
+    finally:
+        await sink.stop()
+
+    assert sink.dropped == 0
+    assert sink.flushed_rows == 3
+
+
+@pytest.mark.asyncio
+async def test_size_threshold_wakes_flusher_early():
+    copy = AsyncMock()
+    sink = MetricsSink(_sessionmaker(_session(copy=copy)), flush_interval_seconds=60, flush_rows=2)
+    sink.start()
+    try:
+        await sink.submit(_rows(2))
+        for _ in range(20):
+            if sink.flushes:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await sink.stop()
+
+    assert sink.flushes == 1
+    assert sink.flushed_rows == 2
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_remaining_rows():
+    copy = AsyncMock()
+    sink = MetricsSink(_sessionmaker(_session(copy=copy)), flush_interval_seconds=60)
+    sink.start()
+    await sink.submit(_rows(5))
+
+    await sink.stop()
+
+    assert sink._task is None
+    assert sink.flushed_rows == 5
+
+
+def _blocking_copy():
+    """COPY that blocks until released, recording the rows it wrote."""
+    entered, release = asyncio.Event(), asyncio.Event()
+    written = []
+
+    async def copy(table, *, records, columns):
+        entered.set()
+        await release.wait()
+        written.extend(records)
+
+    return copy, entered, release, written
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_in_flight_flush():
+    copy, entered, release, written = _blocking_copy()
+    sink = MetricsSink(_sessionmaker(_session(copy=copy)), flush_interval_seconds=60, flush_rows=3)
+    sink.start()
+    await sink.submit(_rows(3))  # wakes the flusher
+    await asyncio.wait_for(entered.wait(), 1)
+    await sink.submit(_rows(2))
+
+    stopping = asyncio.create_task(sink.stop())
+    await asyncio.sleep(0.01)
+    assert not stopping.done()  # waiting on the COPY, not cancelling it
+    release.set()
+    await asyncio.wait_for(stopping, 1)
+
+    assert len(written) == 5
+    assert sink.flushed_rows == 5
+    assert sink.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flush_requeues_rows_being_written():
+    copy, entered, release, written = _blocking_copy()
+    sink = MetricsSink(_sessionmaker(_session(copy=copy)))
+    await sink.submit(_rows(3))
+
+    flush = asyncio.create_task(sink.flush())
+    await asyncio.wait_for(entered.wait(), 1)
+    flush.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await flush
+
+    assert sink.pending_count == 3
+    assert (
+        sink.pending_sum(
+            sink._pending[0]["tenant_id"], "cycle.success", datetime.min.replace(tzinfo=UTC)
+        )
+        == 3
+    )
+    release.set()
+    await sink.stop()
+    assert len(written) == 3
+    assert sink.flushed_rows == 3
+
+
+@pytest.mark.asyncio
+async def test_pending_sum_filters_by_tenant_metric_and_time():
+    tenant = uuid4()
+    sink = MetricsSink(_sessionmaker(_session()))
+    await sink.submit(_rows(2, tenant, "llm.cost_usd", 0.25))
+    await sink.submit(_rows(1, tenant, "cycle.success", 1.0))
+    await sink.submit(_rows(1, uuid4(), "llm.cost_usd", 5.0))
+    now = datetime.now(UTC)
+
+    assert sink.pending_sum(tenant, "llm.cost_usd", now - timedelta(hours=1)) == 0.5
+    assert sink.pending_sum(tenant, "llm.cost_usd", now + timedelta(hours=1)) == 0
+
+
+def test_build_cycle_metrics_matches_recorded_rows():
+    employee_id = uuid4()
+    rows, snapshot = build_cycle_metrics(
+        tenant_id=uuid4(),
+        employee_id=employee_id,
+        cycle_count=4,
+        duration_seconds=1.23456,
+        success=True,
+        llm_cost_usd=0.01,
+        http_stats={"hubspot": {"requests": 2, "queue_depth": 1}},
+    )
+
+    names = [r["metric_name"] for r in rows]
+    assert names[:2] == ["cycle.duration_seconds", "cycle.success"]
+    assert "llm.cost_usd" in names
+    assert rows[0]["value"] == 1.235
+    hubspot = [r for r in rows if r["metric_name"] == "integration.http.queue_depth"]
+    assert hubspot[0]["tags"] == {"cycle": 4, "provider": "hubspot"}
+    assert snapshot is None
+
+
+# ============================================================================
+# Loop integration
+# ============================================================================
+
+
+def _loop(sink, *, cost_cap=None, sessionmaker=None):
+    from empla.core.loop.execution import ProactiveExecutionLoop
+
+    employee = SimpleNamespace(id=uuid4(), tenant_id=uuid4(), name="Test", status="active")
+    monitor = MagicMock()
+    monitor.get_all_status.return_value = [{"total_calls": 4, "failure_count": 1}]
+    monitor.get_all_tool_status.return_value = []
+    return ProactiveExecutionLoop(
+        employee=employee,
+        beliefs=MagicMock(),
+        goals=MagicMock(),
+        intentions=MagicMock(),
+        memory=MagicMock(),
+        tool_router=SimpleNamespace(health_monitor=monitor),
+        sessionmaker=sessionmaker,
+        metrics_sink=sink,
+        cost_hard_stop_usd=cost_cap,
+    )
+
+
+@pytest.mark.asyncio
+async def test_loop_submits_to_sink_and_advances_tool_cache():
+    sink = MetricsSink(_sessionmaker(_session()))
+    loop = _loop(sink)
+
+    await loop._record_cycle_metrics(1.5, success=True)
+
+    assert sink.pending_count >= 5
+    assert _previous_tool_stats.pop(loop.employee.id)["total"] == 4
+
+
+@pytest.mark.asyncio
+async def test_dropped_rows_leave_tool_cache_for_next_cycle():
+    sink = MetricsSink(_sessionmaker(_session()), max_pending=1)
+    loop = _loop(sink)
+
+    await loop._record_cycle_metrics(1.5, success=True)
+
+    assert sink.dropped >= 5
+    assert loop.employee.id not in _previous_tool_stats
+
+
+@pytest.mark.asyncio
+async def test_cost_hard_stop_counts_buffered_cost():
+    total = MagicMock()
+    total.scalar.return_value = 0.5
+    breakdown = MagicMock()
+    breakdown.all.return_value = []
+    paused = MagicMock(rowcount=0)  # another loop already paused the tenant
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=[total, total, breakdown, paused])
+    sink = MetricsSink(_sessionmaker(_session(copy=AsyncMock())))
+    loop = _loop(sink, cost_cap=1.0, sessionmaker=_sessionmaker(session))
+
+    await sink.submit(_rows(1, loop.employee.tenant_id, "llm.cost_usd", 0.25))
+    await loop._check_cost_hard_stop()
+    assert not loop._cost_hard_stop_triggered  # 0.5 + 0.25 is under the cap
+
+    await sink.submit(_rows(1, loop.employee.tenant_id, "llm.cost_usd", 0.5))
+    await loop._check_cost_hard_stop()
+
+    assert loop._cost_hard_stop_triggered  # 0.5 + 0.75 crosses it
+    assert sink.flushed_rows == 2  # written before the breakdown query
@@ -0,0 +1,323 @@
+"""
+Unit tests for keyset pagination and approximate totals.
+
+Covers cursor encoding/validation, the keyset WHERE clause, paginate()'s
+total strategies (inferred, exact, cached, planner estimate), the count
+cache, and the 400 mapping for bad cursors.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from empla.models.activity import EmployeeActivity
+from empla.models.memory import ProceduralMemory
+from empla.services import pagination
+from empla.services.pagination import (
+    CountCache,
+    InvalidCursorError,
+    SortKey,
+    _after,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
+
+_ORDER = (SortKey(EmployeeActivity.occurred_at), SortKey(EmployeeActivity.id))
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def count_cache(monkeypatch):
+    cache = CountCache(ttl_seconds=30)
+    monkeypatch.setattr(pagination, "_count_cache", cache)
+    return cache
+
+
+def _activity(minutes_ago: int) -> SimpleNamespace:
+    base = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+    return SimpleNamespace(id=uuid4(), occurred_at=base - timedelta(minutes=minutes_ago))
+
+
+def _session(*results, dialect: str = "sqlite") -> AsyncMock:
+    """Session whose execute() answers with ``results`` in order.
+
+    A list is a page fetch (``.scalars().all()``), an int a count; a Mock
+    is returned as is.
+    """
+    responses = []
+    for r in results:
+        response = r if isinstance(r, Mock) else Mock()
+        if isinstance(r, list):
+            response.scalars.return_value.all.return_value = r
+        elif isinstance(r, int):
+            response.scalar.return_value = r
+        responses.append(response)
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=responses)
+    session.bind = SimpleNamespace(dialect=SimpleNamespace(name=dialect))
+    return session
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def _query():
+    return select(EmployeeActivity).where(EmployeeActivity.tenant_id == uuid4())
+
+
+# ============================================================================
+# Cursors
+# ============================================================================
+
+
+def test_cursor_round_trips_typed_values():
+    when = datetime(2026, 10, 18, 9, 30, 15, 123456, tzinfo=UTC)
+    row_id = uuid4()
+    cursor = encode_cursor("default", [when, row_id, 0.75, 3, None])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "default", 5) == [when, row_id, 0.75, 3, None]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", encode_cursor("default", [])[:-2] + "@@"])
+def test_garbled_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "default", 2)
+
+
+def test_cursor_from_another_sort_is_rejected():
+    cursor = encode_cursor("name", ["alpha", uuid4()])
+    with pytest.raises(InvalidCursorError, match="sort order"):
+        decode_cursor(cursor, "success_rate", 2)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "name", 3)
+
+
+# ============================================================================
+# Keyset clause
+# ============================================================================
+
+
+def test_uniform_direction_uses_row_comparison():
+    sql = _sql(_after(_ORDER, [datetime.now(UTC), uuid4()]))
+    assert "(employee_activities.occurred_at, employee_activities.id) <" in sql
+
+
+def test_ascending_keys_compare_greater():
+    keys = (
+        SortKey(ProceduralMemory.name, descending=False),
+        SortKey(ProceduralMemory.id, descending=False),
+    )
+    assert ") >" in _sql(_after(keys, ["alpha", uuid4()]))
+
+
+def test_mixed_directions_expand_to_or_chain():
+    keys = (SortKey(ProceduralMemory.name, descending=False), SortKey(ProceduralMemory.id))
+    sql = _sql(_after(keys, ["alpha", uuid4()]))
+    assert "memory_procedural.name >" in sql
+    assert "memory_procedural.name =" in sql
+    assert "memory_procedural.id <" in sql
+    assert " OR " in sql
+
+
+def test_null_value_stands_in_for_missing_sort_values():
+    never = datetime(1970, 1, 1, tzinfo=UTC)
+    key = SortKey(ProceduralMemory.promoted_at, attr="promoted_at", null_value=never)
+    assert key.value(SimpleNamespace(promoted_at=None)) == never
+
+
+# ============================================================================
+# paginate()
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_short_first_page_is_its_own_total():
+    rows = [_activity(i) for i in range(3)]
+    session = _session(rows)
+
+    page = await paginate(session, _query(), _ORDER, page_size=50)
+
+    assert page.items == rows
+    assert page.total == 3
+    assert page.total_is_estimate is False
+    assert page.next_cursor is None
+    assert session.execute.await_count == 1  # no count(*)
+
+
+@pytest.mark.asyncio
+async def test_full_page_returns_cursor_and_counts():
+    rows = [_activity(i) for i in range(3)]
+    session = _session(rows, 120)
+
+    page = await paginate(session, _query(), _ORDER, page_size=2)
+
+    assert page.items == rows[:2]
+    assert page.total == 120
+    assert decode_cursor(page.next_cursor, "default", 2) == [rows[1].occurred_at, rows[1].id]
+    fetch = session.execute.await_args_list[0].args[0]
+    assert fetch._limit_clause.value == 3  # one extra row detects the next page
+
+
+@pytest.mark.asyncio
+async def test_cursor_replaces_offset():
+    cursor = encode_cursor("default", [datetime.now(UTC), uuid4()])
+    session = _session([_activity(0)], 10)
+
+    await paginate(session, _query(), _ORDER, page_size=5, cursor=cursor, page=7)
+
+    sql = _sql(session.execute.await_args_list[0].args[0])
+    assert "OFFSET" not in sql
+    assert "(employee_activities.occurred_at, employee_activities.id) <" in sql
+
+
+@pytest.mark.asyncio
+async def test_bad_cursor_raises_before_querying():
+    session = _session()
+    with pytest.raises(InvalidCursorError):
+        await paginate(session, _query(), _ORDER, page_size=5, cursor="garbage")
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_estimate_reuses_cached_count(count_cache):
+    query = _query()
+    first = await paginate(_session([_activity(0)] * 3, 500), query, _ORDER, page_size=2)
+    assert (first.total, first.total_is_estimate) == (500, False)
+
+    session = _session([_activity(0)] * 3)
+    second = await paginate(session, query, _ORDER, page_size=2)
+
+    assert (second.total, second.total_is_estimate) == (500, True)
+    assert session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_exact_bypasses_cache():
+    query = _query()
+    await paginate(_session([_activity(0)] * 3, 500), query, _ORDER, page_size=2)
+
+    page = await paginate(
+        _session([_activity(0)] * 3, 501), query, _ORDER, page_size=2, total="exact"
+    )
+
+    assert (page.total, page.total_is_estimate) == (501, False)
+
+
+@pytest.mark.asyncio
+async def test_total_none_skips_counting():
+    session = _session([_activity(0)] * 3)
+    page = await paginate(session, _query(), _ORDER, page_size=2, total="none")
+    assert page.total is None
+    assert session.execute.await_count == 1
+
+
+def _postgres_session(plan_rows: int, rows: list, *counts: int) -> AsyncMock:
+    session = _session(rows, *counts, dialect="postgresql")
+    explain = Mock()
+    explain.scalar.return_value = json.dumps([{"Plan": {"Plan Rows": plan_rows}}])
+    conn = SimpleNamespace(
+        dialect=postgresql.dialect(), exec_driver_sql=AsyncMock(return_value=explain)
+    )
+    session.connection = AsyncMock(return_value=conn)
+
+    @asynccontextmanager
+    async def _savepoint():
+        yield
+
+    session.begin_nested = _savepoint
+    return session
+
+
+@pytest.mark.asyncio
+async def test_large_planner_estimate_is_returned_without_counting():
+    session = _postgres_session(4_800_000, [_activity(0)] * 3)
+
+    page = await paginate(session, _query(), _ORDER, page_size=2)
+
+    assert (page.total, page.total_is_estimate) == (4_800_000, True)
+    assert session.execute.await_count == 1  # the page fetch only
+    conn = await session.connection()
+    explain_sql, params = conn.exec_driver_sql.await_args.args
+    assert explain_sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "tenant_id = %(tenant_id_1)s" in explain_sql  # bound, not inlined
+    assert set(params) == {"tenant_id_1"}
+
+
+@pytest.mark.asyncio
+async def test_small_planner_estimate_counts_exactly():
+    session = _postgres_session(40, [_activity(0)] * 3, 37)
+
+    page = await paginate(session, _query(), _ORDER, page_size=2)
+
+    assert (page.total, page.total_is_estimate) == (37, False)
+
+
+# ============================================================================
+# CountCache
+# ============================================================================
+
+
+def test_count_cache_expires_and_evicts():
+    clock = FakeClock()
+    cache = CountCache(ttl_seconds=30, max_entries=2, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+
+    clock.now += 31
+    assert cache.get("c") is None
+    assert len(cache) == 1
+
+
+def test_zero_ttl_disables_count_cache():
+    cache = CountCache(ttl_seconds=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+
+# ============================================================================
+# API
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_a_400():
+    from httpx import ASGITransport, AsyncClient
+
+    from empla.api.deps import get_current_user, get_db
+    from empla.api.main import create_app
+
+    app = create_app()
+
+    async def mock_get_db():
+        yield AsyncMock()
+
+    app.dependency_overrides[get_db] = mock_get_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(tenant_id=uuid4())
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get("/api/v1/activity", params={"cursor": "garbage"})
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Invalid pagination cursor"
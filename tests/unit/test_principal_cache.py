@@ -0,0 +1,216 @@
+"""
+Unit tests for the authenticated principal cache.
+
+Covers LRU/TTL behaviour, hit-rate counters, invalidation (direct and via
+session commit hooks), and get_current_user skipping the user and tenant
+lookups on a hit.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from empla.models.tenant import Tenant, User
+from empla.services import principal_cache
+from empla.services.principal_cache import (
+    PrincipalCache,
+    _collect_principal_changes,
+    _discard_pending,
+    _invalidate_committed,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = PrincipalCache(ttl_seconds=30)
+    monkeypatch.setattr(principal_cache, "_principal_cache", cache)
+    return cache
+
+
+def _principal(role: str = "member") -> tuple[User, Tenant]:
+    tenant = Tenant(id=uuid4(), name="Acme", slug="acme", status="active", settings={})
+    user = User(id=uuid4(), tenant_id=tenant.id, email="a@acme.test", name="Ann", role=role)
+    return user, tenant
+
+
+def _key(user: User, tenant: Tenant, iat: int = 1_700_000_000):
+    return (user.id, tenant.id, iat)
+
+
+# ============================================================================
+# PrincipalCache
+# ============================================================================
+
+
+def test_hit_returns_fresh_copies():
+    cache = PrincipalCache()
+    user, tenant = _principal()
+    cache.put(_key(user, tenant), user, tenant)
+
+    first = cache.get(_key(user, tenant))
+    second = cache.get(_key(user, tenant))
+
+    assert first is not None
+    assert second is not None
+    assert first[0] is not user
+    assert first[0] is not second[0]
+    assert (first[0].id, first[0].role, first[1].name) == (user.id, "member", "Acme")
+
+
+def test_entries_expire_and_evict_least_recently_used():
+    clock = FakeClock()
+    cache = PrincipalCache(ttl_seconds=30, max_entries=2, clock=clock)
+    principals = [_principal() for _ in range(3)]
+    cache.put(_key(*principals[0]), *principals[0])
+    cache.put(_key(*principals[1]), *principals[1])
+    cache.get(_key(*principals[0]))  # now most recently used
+    cache.put(_key(*principals[2]), *principals[2])
+
+    assert cache.get(_key(*principals[1])) is None
+    assert cache.get(_key(*principals[0])) is not None
+
+    clock.now += 31
+    assert cache.get(_key(*principals[0])) is None
+
+
+def test_zero_ttl_disables_cache():
+    cache = PrincipalCache(ttl_seconds=0)
+    user, tenant = _principal()
+    cache.put(_key(user, tenant), user, tenant)
+    assert len(cache) == 0
+
+
+def test_stats_report_hit_rate():
+    cache = PrincipalCache()
+    user, tenant = _principal()
+    cache.get(_key(user, tenant))
+    cache.put(_key(user, tenant), user, tenant)
+    for _ in range(3):
+        cache.get(_key(user, tenant))
+
+    assert cache.stats() == {
+        "entries": 1,
+        "hits": 3,
+        "misses": 1,
+        "hit_rate": 0.75,
+        "invalidations": 0,
+    }
+
+
+def test_invalidate_user_and_tenant():
+    cache = PrincipalCache()
+    user, tenant = _principal()
+    colleague = User(id=uuid4(), tenant_id=tenant.id, email="b@acme.test", name="Bo", role="admin")
+    cache.put(_key(user, tenant, 1), user, tenant)
+    cache.put(_key(user, tenant, 2), user, tenant)
+    cache.put(_key(colleague, tenant), colleague, tenant)
+
+    assert cache.invalidate_user(user.id) == 2
+    assert len(cache) == 1
+    assert cache.invalidate_tenant(tenant.id) == 1
+    assert len(cache) == 0
+
+
+# ============================================================================
+# Session hooks
+# ============================================================================
+
+
+def _session(dirty=(), deleted=()) -> SimpleNamespace:
+    return SimpleNamespace(info={}, new=[], dirty=list(dirty), deleted=list(deleted))
+
+
+def test_commit_touching_user_or_tenant_invalidates(cache):
+    user, tenant = _principal()
+    other_user, other_tenant = _principal()
+    cache.put(_key(user, tenant), user, tenant)
+    cache.put(_key(other_user, other_tenant), other_user, other_tenant)
+
+    session = _session(dirty=[user])
+    _collect_principal_changes(session, None)
+    assert len(cache) == 2  # flushed, not yet committed
+    _invalidate_committed(session)
+    assert cache.get(_key(user, tenant)) is None
+
+    session = _session(deleted=[other_tenant])
+    _collect_principal_changes(session, None)
+    _invalidate_committed(session)
+    assert len(cache) == 0
+
+
+def test_rolled_back_changes_do_not_invalidate(cache):
+    user, tenant = _principal()
+    cache.put(_key(user, tenant), user, tenant)
+
+    session = _session(dirty=[user])
+    _collect_principal_changes(session, None)
+    _discard_pending(session)
+    _invalidate_committed(session)
+
+    assert len(cache) == 1
+
+
+# ============================================================================
+# get_current_user
+# ============================================================================
+
+
+def _credentials(user_id, tenant_id) -> Mock:
+    from empla.api.v1.endpoints.auth import create_access_token
+
+    return Mock(credentials=create_access_token(user_id, tenant_id, "member"))
+
+
+def _db(user, tenant) -> AsyncMock:
+    db = AsyncMock()
+    db.execute = AsyncMock(
+        side_effect=[
+            Mock(scalar_one_or_none=Mock(return_value=user)),
+            Mock(scalar_one_or_none=Mock(return_value=tenant)),
+        ]
+    )
+    return db
+
+
+@pytest.mark.asyncio
+async def test_second_request_with_same_token_skips_lookups(cache):
+    from empla.api.deps import get_current_user
+
+    user, tenant = _principal(role="admin")
+    credentials = _credentials(user.id, tenant.id)
+    await get_current_user(credentials, _db(user, tenant))
+
+    db = AsyncMock()
+    ctx = await get_current_user(credentials, db)
+
+    db.execute.assert_not_awaited()
+    assert (ctx.user_id, ctx.tenant_id, ctx.role) == (user.id, tenant.id, "admin")
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_inactive_tenant_is_not_cached(cache):
+    from fastapi import HTTPException
+
+    from empla.api.deps import get_current_user
+
+    user, tenant = _principal()
+    tenant.status = "suspended"
+    credentials = _credentials(user.id, tenant.id)
+
+    with pytest.raises(HTTPException):
+        await get_current_user(credentials, _db(user, tenant))
+
+    assert len(cache) == 0
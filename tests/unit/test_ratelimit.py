@@ -6,18 +6,39 @@ Tests:
 - Sliding window behavior
 - Reset time calculation
 - Client identifier extraction
+- GCRA refill, decisions and RateLimit-* headers
+- Shared (Postgres) store and fallback to in-process state
+- The RateLimit FastAPI dependency
 """
 
 import time
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
 
 from empla.api.ratelimit import (
+    MemoryRateLimitStore,
+    PostgresRateLimitStore,
+    RateLimit,
     RateLimiter,
     RateLimitExceeded,
+    create_rate_limit_store,
+    gcra_decision,
     get_client_identifier,
 )
 
 
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
 class TestRateLimiter:
     """Tests for RateLimiter class."""
 
@@ -172,3 +193,182 @@ class TestRateLimiterCleanup:
         # (no requests means they're removed)
         assert limiter.get_remaining("key1") == 5
         assert limiter.get_remaining("key2") == 5
+
+
+class TestGCRA:
+    """Tests for the GCRA behaviour behind RateLimiter."""
+
+    def test_allowance_refills_continuously(self):
+        """One request's worth comes back every window / max_requests."""
+        clock = FakeClock()
+        limiter = RateLimiter(max_requests=5, window_seconds=60, clock=clock)
+        for _ in range(5):
+            assert limiter.is_allowed("k")
+        assert not limiter.is_allowed("k")
+
+        clock.now += 11.9
+        assert not limiter.is_allowed("k")
+        clock.now += 0.1
+        assert limiter.is_allowed("k")
+        assert not limiter.is_allowed("k")
+
+    def test_refused_requests_do_not_consume_allowance(self):
+        clock = FakeClock()
+        limiter = RateLimiter(max_requests=2, window_seconds=10, clock=clock)
+        limiter.is_allowed("k")
+        limiter.is_allowed("k")
+        for _ in range(100):
+            limiter.is_allowed("k")
+
+        clock.now += 5
+        assert limiter.is_allowed("k")
+
+    def test_state_is_one_entry_per_key(self):
+        clock = FakeClock()
+        limiter = RateLimiter(max_requests=1000, window_seconds=60, clock=clock)
+        for _ in range(1000):
+            limiter.is_allowed("k")
+        assert len(limiter.local) == 1
+        assert isinstance(limiter.local._tats["k"], float)
+
+    def test_inexact_interval_still_allows_full_burst(self):
+        limiter = RateLimiter(max_requests=7, window_seconds=60, clock=FakeClock())
+        assert all(limiter.is_allowed("k") for _ in range(7))
+
+    def test_refusal_decision_reports_retry_after(self):
+        store = MemoryRateLimitStore(clock=FakeClock())
+        for _ in range(4):
+            store.acquire_now("k", 4, 60)
+
+        decision = store.acquire_now("k", 4, 60)
+
+        assert decision.allowed is False
+        assert decision.remaining == 0
+        assert decision.retry_after == pytest.approx(15)
+        assert decision.reset_after == pytest.approx(60)
+
+    def test_headers(self):
+        decision = gcra_decision(10, 60, now=100.0, tat=None, granted_tat=106.0)
+        assert decision.headers() == {
+            "RateLimit-Limit": "10",
+            "RateLimit-Remaining": "9",
+            "RateLimit-Reset": "6",
+            "RateLimit-Policy": "10;w=60",
+        }
+
+
+def _sessionmaker(session):
+    ctx = AsyncMock()
+    ctx.__aenter__.return_value = session
+    ctx.__aexit__.return_value = False
+    return MagicMock(return_value=ctx)
+
+
+class TestSharedStore:
+    """Tests for PostgresRateLimitStore and the fallback to in-process state."""
+
+    @pytest.mark.asyncio
+    async def test_one_upsert_per_check(self):
+        session = AsyncMock()
+        session.execute.return_value.one = MagicMock(
+            return_value=SimpleNamespace(now=100.0, granted_tat=112.0, tat=None)
+        )
+        store = PostgresRateLimitStore(_sessionmaker(session))
+        limiter = RateLimiter(max_requests=5, window_seconds=60, name="oauth")
+
+        decision = await limiter.check("1.2.3.4", store)
+
+        assert decision.allowed is True
+        assert decision.remaining == 4
+        assert session.execute.await_count == 1
+        sql, params = session.execute.await_args.args
+        assert "ON CONFLICT (key) DO UPDATE" in str(sql)
+        assert params == {"key": "oauth:1.2.3.4", "interval": 12.0, "window": 60}
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refused_by_shared_store(self):
+        session = AsyncMock()
+        session.execute.return_value.one = MagicMock(
+            return_value=SimpleNamespace(now=100.0, granted_tat=None, tat=160.0)
+        )
+        store = PostgresRateLimitStore(_sessionmaker(session))
+
+        decision = await store.acquire("k", 5, 60)
+
+        assert decision.allowed is False
+        assert decision.retry_after == pytest.approx(12)
+
+    @pytest.mark.asyncio
+    async def test_sweeps_expired_rows_periodically(self):
+        clock = FakeClock()
+        session = AsyncMock()
+        session.execute.return_value.one = MagicMock(
+            return_value=SimpleNamespace(now=100.0, granted_tat=112.0, tat=None)
+        )
+        store = PostgresRateLimitStore(_sessionmaker(session), cleanup_interval=60, clock=clock)
+
+        await store.acquire("k", 5, 60)
+        clock.now += 61
+        await store.acquire("k", 5, 60)
+
+        statements = [str(c.args[0]) for c in session.execute.await_args_list]
+        assert sum("DELETE FROM rate_limit_buckets" in s for s in statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_store_falls_back_to_local_state(self):
+        store = MagicMock()
+        store.acquire = AsyncMock(side_effect=ConnectionError("db down"))
+        limiter = RateLimiter(max_requests=1, window_seconds=60)
+
+        assert (await limiter.check("k", store)).allowed is True
+        assert (await limiter.check("k", store)).allowed is False
+
+    def test_backend_selection(self):
+        sessionmaker = MagicMock()
+        assert create_rate_limit_store("memory", sessionmaker) is None
+        assert isinstance(create_rate_limit_store("postgres", sessionmaker), PostgresRateLimitStore)
+
+
+class TestRateLimitDependency:
+    """Tests for the RateLimit FastAPI dependency."""
+
+    @staticmethod
+    def _app(limiter, store=None):
+        app = FastAPI()
+        app.state.rate_limit_store = store
+
+        @app.get("/limited", dependencies=[Depends(RateLimit(limiter, detail="Slow down"))])
+        async def limited():
+            return {"ok": True}
+
+        return app
+
+    @pytest.mark.asyncio
+    async def test_sets_headers_and_returns_429(self):
+        app = self._app(RateLimiter(max_requests=2, window_seconds=60))
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+            first = await client.get("/limited")
+            await client.get("/limited")
+            refused = await client.get("/limited")
+
+        assert first.status_code == 200
+        assert first.headers["RateLimit-Limit"] == "2"
+        assert first.headers["RateLimit-Remaining"] == "1"
+        assert first.headers["RateLimit-Policy"] == "2;w=60"
+        assert refused.status_code == 429
+        assert refused.json()["detail"] == "Slow down"
+        assert refused.headers["Retry-After"] == "30"
+        assert refused.headers["RateLimit-Remaining"] == "0"
+
+    @pytest.mark.asyncio
+    async def test_uses_store_on_app_state(self):
+        store = MemoryRateLimitStore()
+        store.acquire = AsyncMock(wraps=store.acquire)
+        app = self._app(RateLimiter(max_requests=2, window_seconds=60, name="x"), store)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+            await client.get("/limited", headers={"X-Forwarded-For": "9.9.9.9"})
+
+        assert store.acquire.await_args.args[0] == "x:9.9.9.9"
@@ -0,0 +1,251 @@
+"""
+Unit tests for the tool result cache and its ToolRouter integration.
+
+Covers key canonicalization, TTL expiry, LRU and byte bounds, provider
+invalidation (including aliases), cache hits flagged on results and the
+trust audit, and write-through invalidation.
+"""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from empla.core.tools.base import ActionResult, Tool
+from empla.core.tools.cache import (
+    ToolResultCache,
+    canonical_arguments,
+    credential_fingerprint,
+)
+from empla.core.tools.registry import ToolRegistry
+from empla.core.tools.router import ToolRouter
+from empla.integrations.router import IntegrationRouter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingTool:
+    """Returns a fresh payload and counts calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def _execute(self, params: dict[str, Any]) -> dict[str, Any]:
+        self.calls += 1
+        return {"call": self.calls, "params": params}
+
+
+class FailingTool:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def _execute(self, params: dict[str, Any]) -> dict[str, Any]:
+        self.calls += 1
+        raise RuntimeError("provider down")
+
+
+def _ok(output: Any) -> ActionResult:
+    return ActionResult(success=True, output=output)
+
+
+# ---------------------------------------------------------------------------
+# ToolResultCache
+# ---------------------------------------------------------------------------
+
+
+def test_canonical_arguments_ignore_key_order():
+    assert canonical_arguments({"b": 1, "a": [1, 2]}) == canonical_arguments({"a": [1, 2], "b": 1})
+    assert canonical_arguments({"a": 1}) != canonical_arguments({"a": 2})
+
+
+def test_credential_fingerprint_hides_token():
+    fingerprint = credential_fingerprint({"access_token": "secret-token"})
+    assert "secret" not in fingerprint
+    assert fingerprint != credential_fingerprint({"access_token": "other-token"})
+    assert credential_fingerprint(None) == "-"
+
+
+def test_hit_reports_age_and_returns_copy():
+    clock = _Clock()
+    cache = ToolResultCache(clock=clock)
+    key = cache.make_key("crm.get_deals", {"limit": 5}, credential="abc")
+    cache.put(key, "crm", _ok({"deals": [1]}), ttl=60)
+
+    clock.now += 2.5
+    hit = cache.get(key)
+
+    assert hit is not None
+    assert hit.metadata["cached"] is True
+    assert hit.metadata["age_ms"] == 2500.0
+    hit.output["deals"].append(2)
+    assert cache.get(key).output == {"deals": [1]}
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = ToolResultCache(clock=clock)
+    key = cache.make_key("crm.get_deals", {})
+    cache.put(key, "crm", _ok([1]), ttl=10)
+
+    clock.now += 10
+    assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_credentials_do_not_share_entries():
+    cache = ToolResultCache()
+    cache.put(cache.make_key("crm.get_deals", {}, credential="a"), "crm", _ok([1]), ttl=60)
+
+    assert cache.get(cache.make_key("crm.get_deals", {}, credential="b")) is None
+
+
+def test_failed_results_are_not_stored():
+    cache = ToolResultCache()
+    key = cache.make_key("crm.get_deals", {})
+    cache.put(key, "crm", ActionResult(success=False, error="boom"), ttl=60)
+
+    assert len(cache) == 0
+
+
+def test_lru_bound_evicts_least_recently_used():
+    cache = ToolResultCache(max_entries=2)
+    keys = [cache.make_key("crm.get", {"i": i}) for i in range(3)]
+    cache.put(keys[0], "crm", _ok(0), ttl=60)
+    cache.put(keys[1], "crm", _ok(1), ttl=60)
+    cache.get(keys[0])  # touch: keys[1] is now least recently used
+    cache.put(keys[2], "crm", _ok(2), ttl=60)
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_byte_bound_limits_memory():
+    cache = ToolResultCache(max_bytes=100)
+    for i in range(5):
+        cache.put(cache.make_key("crm.get", {"i": i}), "crm", _ok("x" * 40), ttl=60)
+
+    assert cache.stats()["bytes"] <= 100
+    assert len(cache) == 2
+
+    cache.put(cache.make_key("crm.huge", {}), "crm", _ok("x" * 500), ttl=60)
+    assert cache.get(cache.make_key("crm.huge", {})) is None
+
+
+def test_invalidate_provider_follows_aliases():
+    cache = ToolResultCache()
+    cache.put(
+        cache.make_key("google_calendar.get_upcoming_events", {}), "google_calendar", _ok(1), ttl=60
+    )
+    cache.put(cache.make_key("hubspot.get_deals", {}), "hubspot", _ok(2), ttl=60)
+
+    assert cache.invalidate_provider("google_workspace") == 1
+    assert cache.invalidate_provider("hubspot") == 1
+    assert len(cache) == 0
+
+
+# ---------------------------------------------------------------------------
+# ToolRouter integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def tools() -> dict[str, Any]:
+    return {"read": CountingTool(), "write": CountingTool(), "fail": FailingTool()}
+
+
+@pytest.fixture
+def router(tools) -> ToolRouter:
+    registry = ToolRegistry()
+    registry.register_tool(
+        Tool(name="crm.get_deals", description="", parameters_schema={}, cache_ttl_seconds=60),
+        tools["read"],
+    )
+    registry.register_tool(
+        Tool(name="crm.create_deal", description="", parameters_schema={}), tools["write"]
+    )
+    registry.register_tool(
+        Tool(name="crm.get_broken", description="", parameters_schema={}, cache_ttl_seconds=60),
+        tools["fail"],
+    )
+    return ToolRouter(tool_registry=registry)
+
+
+@pytest.mark.asyncio
+async def test_repeat_call_is_served_from_cache(router, tools):
+    employee_id = uuid4()
+    first = await router.execute_tool_call(employee_id, "crm.get_deals", {"a": 1, "b": 2})
+    second = await router.execute_tool_call(employee_id, "crm.get_deals", {"b": 2, "a": 1})
+
+    assert tools["read"].calls == 1
+    assert first.metadata["cached"] is False
+    assert second.metadata["cached"] is True
+    assert "age_ms" in second.metadata
+    assert second.output == first.output
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_are_visible_in_trust_audit(router):
+    employee_id = uuid4()
+    await router.execute_tool_call(employee_id, "crm.get_deals", {})
+    await router.execute_tool_call(employee_id, "crm.get_deals", {})
+
+    audit = router._trust.get_audit_log()
+    assert [d.cached for d in audit] == [False, True]
+    assert router.get_trust_stats()["cached"] == 1
+
+
+@pytest.mark.asyncio
+async def test_webhook_invalidation_forces_refetch(router, tools):
+    employee_id = uuid4()
+    await router.execute_tool_call(employee_id, "crm.get_deals", {})
+
+    assert router.invalidate_cached_results("crm") == 1
+    await router.execute_tool_call(employee_id, "crm.get_deals", {})
+
+    assert tools["read"].calls == 2
+
+
+@pytest.mark.asyncio
+async def test_successful_write_invalidates_integration(router, tools):
+    employee_id = uuid4()
+    await router.execute_tool_call(employee_id, "crm.get_deals", {})
+    await router.execute_tool_call(employee_id, "crm.create_deal", {"name": "x"})
+    await router.execute_tool_call(employee_id, "crm.get_deals", {})
+
+    assert tools["read"].calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached(router, tools):
+    employee_id = uuid4()
+    await router.execute_tool_call(employee_id, "crm.get_broken", {})
+    result = await router.execute_tool_call(employee_id, "crm.get_broken", {})
+
+    assert tools["fail"].calls == 2
+    assert not result.success
+
+
+@pytest.mark.asyncio
+async def test_integration_cache_ttl_reaches_registered_tool():
+    integration = IntegrationRouter("crm")
+
+    @integration.tool(cache_ttl=45)
+    async def get_deals() -> list:
+        return []
+
+    @integration.tool()
+    async def create_deal(name: str) -> dict:
+        return {}
+
+    router = ToolRouter(tool_registry=ToolRegistry())
+    router.register_integration(integration)
+
+    assert router._tool_registry.get_tool_by_name("crm.get_deals").cache_ttl_seconds == 45
+    assert router._tool_registry.get_tool_by_name("crm.create_deal").cache_ttl_seconds is None
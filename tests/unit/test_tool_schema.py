@@ -0,0 +1,189 @@
+"""
+Unit tests for compiled tool argument validators.
+
+Covers JSON Schema and the legacy flat format, coercion of common LLM
+mistakes, nested error paths, $ref resolution, combinators, and the
+compile-once behaviour on Tool / ToolRegistry / ToolRouter.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from empla.core.tools.base import Tool
+from empla.core.tools.registry import ToolRegistry
+from empla.core.tools.router import ToolRouter
+from empla.core.tools.schema import ToolArgumentError, compile_schema, format_path
+
+DEAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "limit": {"type": "integer", "minimum": 1, "maximum": 100},
+        "stage": {"type": "string", "enum": ["open", "won", "lost"]},
+        "include_closed": {"type": "boolean"},
+        "filters": {
+            "type": "array",
+            "maxItems": 3,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "field": {"type": "string", "minLength": 1},
+                    "value": {"type": ["number", "string"]},
+                },
+                "required": ["field"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["limit"],
+}
+
+
+def _errors(schema, arguments) -> list[str]:
+    with pytest.raises(ToolArgumentError) as exc:
+        compile_schema(schema)(arguments)
+    return exc.value.errors
+
+
+def test_valid_arguments_pass_through_unchanged():
+    arguments = {"limit": 5, "stage": "open", "filters": [{"field": "amount", "value": 10}]}
+    assert compile_schema(DEAL_SCHEMA)(arguments) is arguments
+
+
+def test_coerces_llm_style_scalars_without_mutating_input():
+    arguments = {"limit": "5", "include_closed": "true", "filters": [{"field": "x", "value": "7"}]}
+
+    result = compile_schema(DEAL_SCHEMA)(arguments)
+
+    assert result["limit"] == 5
+    assert result["include_closed"] is True
+    # ["number", "string"] keeps an exact string match rather than coercing
+    assert result["filters"][0]["value"] == "7"
+    assert arguments["limit"] == "5"
+
+
+def test_nested_errors_report_exact_paths():
+    errors = _errors(
+        DEAL_SCHEMA,
+        {"limit": 500, "filters": [{"field": "a"}, {"value": 1, "extra": True}]},
+    )
+
+    assert ("limit", "Parameter limit must be <= 100") in errors
+    assert ("filters[1].field", "Missing required parameter: filters[1].field") in errors
+    assert ("filters[1].extra", "Unexpected parameter: filters[1].extra") in errors
+
+
+def test_enum_and_type_errors():
+    errors = _errors(DEAL_SCHEMA, {"limit": "many", "stage": "maybe"})
+    paths = [path for path, _ in errors]
+
+    assert paths == ["limit", "stage"]
+    assert "wrong type (expected integer)" in errors[0][1]
+    assert "must be one of" in errors[1][1]
+
+
+def test_booleans_are_not_numbers():
+    assert _errors(DEAL_SCHEMA, {"limit": True})[0][0] == "limit"
+
+
+def test_optional_properties_accept_null():
+    assert compile_schema(DEAL_SCHEMA)({"limit": 1, "stage": None})["stage"] is None
+
+
+def test_legacy_flat_format():
+    validate = compile_schema({"to": {"type": "string", "required": True}, "cc": {"type": "array"}})
+
+    assert validate({"to": "a@b.c"}) == {"to": "a@b.c"}
+    with pytest.raises(ToolArgumentError, match="Missing required parameter: to"):
+        validate({})
+    with pytest.raises(ToolArgumentError, match="Unexpected parameter: bcc"):
+        validate({"to": "a@b.c", "bcc": []})
+
+
+def test_empty_schema_accepts_any_object():
+    validate = compile_schema({})
+    assert validate({"anything": 1}) == {"anything": 1}
+    with pytest.raises(ToolArgumentError):
+        validate(["not", "an", "object"])
+
+
+def test_recursive_ref():
+    schema = {
+        "type": "object",
+        "properties": {"node": {"$ref": "#/$defs/node"}},
+        "$defs": {
+            "node": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "children": {"type": "array", "items": {"$ref": "#/$defs/node"}},
+                },
+                "required": ["name"],
+            }
+        },
+    }
+    errors = _errors(schema, {"node": {"name": "root", "children": [{"children": []}]}})
+
+    assert errors[0][0] == "node.children[0].name"
+
+
+def test_any_of_picks_first_matching_branch():
+    validate = compile_schema(
+        {
+            "type": "object",
+            "properties": {
+                "when": {
+                    "anyOf": [
+                        {"type": "integer"},
+                        {"type": "string", "pattern": "^\\d{4}-\\d{2}-\\d{2}$"},
+                    ]
+                }
+            },
+        }
+    )
+
+    assert validate({"when": "2026-10-18"}) == {"when": "2026-10-18"}
+    with pytest.raises(ToolArgumentError, match="does not match any allowed schema"):
+        validate({"when": "next tuesday"})
+
+
+def test_format_path():
+    assert format_path(()) == "arguments"
+    assert format_path(("filters", 2, "stage")) == "filters[2].stage"
+
+
+# ---------------------------------------------------------------------------
+# Tool / registry / router integration
+# ---------------------------------------------------------------------------
+
+
+class EchoTool:
+    async def _execute(self, params):
+        return params
+
+
+def test_registry_compiles_once():
+    tool = Tool(name="crm.get_deals", description="", parameters_schema=DEAL_SCHEMA)
+    ToolRegistry().register_tool(tool, EchoTool())
+
+    compiled = tool._validator
+    assert compiled is not None
+    tool.validate_arguments({"limit": 1})
+    assert tool.compile_validator() is compiled
+
+
+@pytest.mark.asyncio
+async def test_router_rejects_invalid_arguments_with_paths():
+    registry = ToolRegistry()
+    registry.register_tool(
+        Tool(name="crm.get_deals", description="", parameters_schema=DEAL_SCHEMA), EchoTool()
+    )
+    router = ToolRouter(tool_registry=registry)
+
+    bad = await router.execute_tool_call(uuid4(), "crm.get_deals", {"limit": 0})
+    good = await router.execute_tool_call(uuid4(), "crm.get_deals", {"limit": "3"})
+
+    assert not bad.success
+    assert bad.metadata["paths"] == ["limit"]
+    assert "must be >= 1" in bad.error
+    assert good.output == {"limit": 3}
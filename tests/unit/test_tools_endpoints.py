@@ -24,6 +24,9 @@ import pytest
 from fastapi import HTTPException
 
 from empla.api.v1.endpoints import tools as tools_ep
+from empla.api.v1.schemas.tools import IntegrationHealthResponse
+from empla.core.tools.registry import ToolRegistry
+from empla.core.tools.router import ToolRouter
 from empla.runner.health import HealthServer
 
 # ---------------------------------------------------------------------------
@@ -393,6 +396,22 @@ class TestHealthServerToolHandlers:
         assert data["name"] == "email"
         assert data["status"] == "healthy"
 
+    def test_tool_health_includes_per_tool_window(self):
+        router = ToolRouter(tool_registry=ToolRegistry())
+        router.health_monitor.record("email", success=True, duration_ms=40.0, tool="email.send")
+        router.health_monitor.record("email", success=False, duration_ms=900.0, tool="email.read")
+
+        body, code = self._server(tool_router=router)._handle_tool_health(
+            "/tools/email.send/health"
+        )
+        data = json.loads(body)
+
+        assert code == 200
+        assert data["window"]["calls"] == 2
+        assert data["tool"]["name"] == "email.send"
+        assert data["tool"]["window"]["error_rate"] == 0.0
+        assert IntegrationHealthResponse.model_validate(data).tool.window.p50_ms == 40.0
+
     def test_tool_health_400_on_empty_name(self):
         srv = self._server(tool_router=_stub_tool_router())
         _, code = srv._handle_tool_health("/tools//health")
@@ -0,0 +1,79 @@
+"""
+Unit tests for runner-side webhook event coalescing.
+
+Covers per-object merging (latest wins, counts), splitting multi-object
+deliveries, merging object-less events per event type, and counted
+overflow past the entry bound.
+"""
+
+from empla.runner.coalesce import EventCoalescer
+
+
+def _delivery(*refs, received_at="t0") -> dict:
+    return {
+        "provider": "hubspot",
+        "event_type": "deal.propertyChange",
+        "received_at": received_at,
+        "objects": [
+            {"object_type": "deal", "object_id": oid, "event_type": "deal.propertyChange", **extra}
+            for oid, extra in refs
+        ],
+    }
+
+
+def test_merges_per_object_keeping_latest():
+    coalescer = EventCoalescer()
+    coalescer.add(_delivery(("1", {"detail": {"dealstage": "qualified"}}), received_at="t0"))
+    coalescer.add(_delivery(("2", {}), received_at="t1"))
+    coalescer.add(_delivery(("1", {"detail": {"dealstage": "closedwon"}}), received_at="t2"))
+
+    events = coalescer.drain()
+
+    assert [e["object_id"] for e in events] == ["2", "1"]  # most recently changed last
+    latest = events[1]
+    assert latest["count"] == 2
+    assert latest["payload"] == {"dealstage": "closedwon"}
+    assert latest["summary"] == "deal 1 (dealstage=closedwon)"
+    assert latest["received_at"] == "t2"
+    assert "count" not in events[0]
+    assert coalescer.drain() == []
+
+
+def test_bulk_import_burst_collapses_to_distinct_objects():
+    coalescer = EventCoalescer(max_entries=1000)
+    for i in range(500):
+        coalescer.add(_delivery((str(i % 50), {})))
+
+    events = coalescer.drain()
+
+    assert len(events) == 50
+    assert sum(e.get("count", 1) for e in events) == 500
+
+
+def test_events_without_objects_merge_per_event_type():
+    coalescer = EventCoalescer()
+    for _ in range(3):
+        coalescer.add({"provider": "google_calendar", "event_type": "calendar.changed"})
+    coalescer.add({"provider": "google_calendar", "event_type": "event.created"})
+
+    events = coalescer.drain()
+
+    assert [(e["event_type"], e.get("count", 1)) for e in events] == [
+        ("calendar.changed", 3),
+        ("event.created", 1),
+    ]
+
+
+def test_overflow_is_counted_not_dropped():
+    coalescer = EventCoalescer(max_entries=2)
+    coalescer.add(_delivery(("1", {}), ("2", {}), ("3", {}), ("4", {})))
+    coalescer.add(_delivery(("1", {})))  # existing entries still merge
+
+    events = coalescer.drain()
+
+    assert [e.get("object_id") for e in events[:2]] == ["2", "1"]
+    overflow = events[2]
+    assert overflow["overflow"] is True
+    assert overflow["count"] == 2
+    assert overflow["summary"] == "2 more changes not itemized"
+    assert len(coalescer) == 0
@@ -4,7 +4,10 @@ Unit tests for PR #81: webhook token management + event feed.
 Covers:
 - `_find_tenant_by_webhook_token` current-token match, previous-token
   grace-window match, expired previous token, unknown token.
-- Token endpoints: create / rotate / delete / list (tenant isolation).
+- Token lookup goes through the keyed-hash index column, falling back to
+  rows not yet indexed (hashes NULL) on a miss.
+- Token endpoints: create / rotate / delete / list (tenant isolation),
+  keeping ``webhook_token_hashes`` in step with ``oauth_config``.
 - Rotation preserves the previous token with a 5-minute grace window.
 - Events endpoint reads AuditLog rows filtered by actor_type='webhook'.
 - Webhook receiver writes to AuditLog with the right shape.
@@ -23,6 +26,7 @@ from fastapi import HTTPException
 from freezegun import freeze_time
 
 from empla.api.v1.endpoints import webhooks as webhooks_ep
+from empla.services.webhook_routing import webhook_token_digest
 
 # ---------------------------------------------------------------------------
 # Fixtures / helpers
@@ -53,6 +57,7 @@ class _FakeIntegration:
         self.status = "active"
         self.deleted_at = None
         self.oauth_config = dict(oauth_config or {})
+        self.webhook_token_hashes = None
         self.created_at = datetime.now(UTC)
 
 
@@ -140,6 +145,53 @@ class TestFindTenantByWebhookToken:
         match = await webhooks_ep._find_tenant_by_webhook_token(db, "hubspot", "new-token")
         assert match == (tid, iid)
 
+    @pytest.mark.asyncio
+    async def test_lookup_filters_on_token_hash(self):
+        """Candidates come from the hash index, not a scan of every token."""
+        from sqlalchemy.dialects import postgresql
+
+        db = self._db_with_rows([])
+        await webhooks_ep._find_tenant_by_webhook_token(db, "hubspot", "good-token")
+
+        stmt = db.execute.await_args_list[0].args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert "webhook_token_hashes @>" in str(compiled)
+        assert [webhook_token_digest("good-token")] in compiled.params.values()
+
+    @pytest.mark.asyncio
+    async def test_hash_hit_still_requires_matching_token(self):
+        """A stale index entry never authenticates on its own."""
+        tid, iid = uuid4(), uuid4()
+        db = self._db_with_rows([(iid, tid, {"webhook_token": "other-token"})])
+        match = await webhooks_ep._find_tenant_by_webhook_token(db, "hubspot", "good-token")
+        assert match is None
+
+    @pytest.mark.asyncio
+    async def test_index_hit_skips_unindexed_fallback(self):
+        tid, iid = uuid4(), uuid4()
+        db = self._db_with_rows([(iid, tid, {"webhook_token": "good-token"})])
+        await webhooks_ep._find_tenant_by_webhook_token(db, "hubspot", "good-token")
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unindexed_rows_match_before_reindex(self):
+        """Rows whose hashes are still NULL (not yet reindexed) keep authenticating."""
+        from sqlalchemy.dialects import postgresql
+
+        tid, iid = uuid4(), uuid4()
+        indexed, unindexed = Mock(), Mock()
+        indexed.all.return_value = []
+        unindexed.all.return_value = [(iid, tid, {"webhook_token": "good-token"})]
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[indexed, unindexed])
+
+        match = await webhooks_ep._find_tenant_by_webhook_token(db, "hubspot", "good-token")
+
+        assert match == (tid, iid)
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "integrations.webhook_token_hashes IS NULL" in sql
+        assert "integrations.deleted_at IS NULL" in sql
+
 
 # ---------------------------------------------------------------------------
 # Token CRUD endpoints
@@ -167,6 +219,7 @@ class TestTokenEndpoints:
         # Fresh create clears any rotation state
         assert "webhook_token_prev" not in integ.oauth_config
         assert "rotated_at" not in integ.oauth_config
+        assert integ.webhook_token_hashes == [webhook_token_digest(resp.token)]
 
     @pytest.mark.asyncio
     async def test_create_404_on_cross_tenant(self):
@@ -239,6 +292,11 @@ class TestTokenEndpoints:
         assert integ.oauth_config["webhook_token_prev"] == "original"
         assert "rotated_at" in integ.oauth_config
         assert resp.rotated_at is not None
+        # Both tokens stay findable through the index during the grace window
+        assert integ.webhook_token_hashes == [
+            webhook_token_digest(resp.token),
+            webhook_token_digest("original"),
+        ]
 
     @pytest.mark.asyncio
     async def test_rotate_409_when_no_existing_token(self):
@@ -270,6 +328,7 @@ class TestTokenEndpoints:
         assert "webhook_token" not in integ.oauth_config
         assert "webhook_token_prev" not in integ.oauth_config
         assert "rotated_at" not in integ.oauth_config
+        assert integ.webhook_token_hashes is None
 
     @pytest.mark.asyncio
     async def test_delete_is_idempotent(self):
@@ -359,7 +418,7 @@ class TestEventsEndpoint:
         scalars = Mock()
         scalars.all = Mock(return_value=rows)
         fetch_result.scalars = Mock(return_value=scalars)
-        db.execute = AsyncMock(side_effect=[count_result, fetch_result])
+        db.execute = AsyncMock(side_effect=[fetch_result, count_result])
         return db
 
     def _audit_row(self, tenant_id: UUID, integration_id: UUID, provider: str):
@@ -406,7 +465,8 @@ class TestEventsEndpoint:
     async def test_list_events_pagination(self):
         auth = _auth()
         iid = uuid4()
-        rows = [self._audit_row(auth.tenant_id, iid, "hubspot")]
+        # A full page plus one: more pages follow, so the total is counted
+        rows = [self._audit_row(auth.tenant_id, iid, "hubspot") for _ in range(51)]
         db = self._db_for_events(rows, total=237)
 
         resp = await webhooks_ep.list_webhook_events(
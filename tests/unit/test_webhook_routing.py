@@ -0,0 +1,229 @@
+"""
+Unit tests for the webhook token index and employee routing cache.
+
+Covers keyed token hashing, WebhookRoutingCache (TTL, invalidation,
+eviction), the cached _find_employees_for_provider, the ORM commit hooks
+that invalidate routing, and the reindex helper.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from empla.api.v1.endpoints import webhooks as webhooks_ep
+from empla.models.employee import Employee
+from empla.models.integration import IntegrationCredential
+from empla.services import webhook_routing
+from empla.services.webhook_routing import (
+    WebhookRoutingCache,
+    reindex_webhook_tokens,
+    webhook_token_digest,
+    webhook_token_hashes,
+)
+from empla.settings import clear_settings_cache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def routing_cache(monkeypatch):
+    cache = WebhookRoutingCache(ttl_seconds=60)
+    monkeypatch.setattr(webhook_routing, "_routing_cache", cache)
+    return cache
+
+
+# ============================================================================
+# Token hashing
+# ============================================================================
+
+
+def test_digest_is_keyed(monkeypatch):
+    default = webhook_token_digest("tok-123")
+    assert len(default) == 64
+
+    monkeypatch.setenv("EMPLA_WEBHOOK_TOKEN_HASH_KEY", "another-key")
+    clear_settings_cache()
+    try:
+        assert webhook_token_digest("tok-123") != default
+    finally:
+        monkeypatch.delenv("EMPLA_WEBHOOK_TOKEN_HASH_KEY")
+        clear_settings_cache()
+
+
+def test_hashes_cover_current_and_previous_token():
+    assert webhook_token_hashes({}) is None
+    assert webhook_token_hashes(None) is None
+    assert webhook_token_hashes({"webhook_token": "a"}) == [webhook_token_digest("a")]
+    assert webhook_token_hashes({"webhook_token": "a", "webhook_token_prev": "b"}) == [
+        webhook_token_digest("a"),
+        webhook_token_digest("b"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reindex_updates_only_stale_rows():
+    current = SimpleNamespace(
+        oauth_config={"webhook_token": "a"}, webhook_token_hashes=[webhook_token_digest("a")]
+    )
+    stale = SimpleNamespace(oauth_config={"webhook_token": "b"}, webhook_token_hashes=["old"])
+    emptied = SimpleNamespace(oauth_config={}, webhook_token_hashes=["old"])
+    session = AsyncMock()
+    result = Mock()
+    result.scalars.return_value.all.return_value = [current, stale, emptied]
+    session.execute = AsyncMock(return_value=result)
+
+    assert await reindex_webhook_tokens(session) == 2
+    assert stale.webhook_token_hashes == [webhook_token_digest("b")]
+    assert emptied.webhook_token_hashes is None
+    session.commit.assert_awaited_once()
+
+
+# ============================================================================
+# WebhookRoutingCache
+# ============================================================================
+
+
+def test_cache_expires_after_ttl():
+    clock = FakeClock()
+    cache = WebhookRoutingCache(ttl_seconds=60, clock=clock)
+    tenant, emp = uuid4(), uuid4()
+
+    assert cache.get(tenant, "hubspot") is None
+    cache.put(tenant, "hubspot", [emp])
+    assert cache.get(tenant, "hubspot") == [emp]
+
+    clock.now += 61
+    assert cache.get(tenant, "hubspot") is None
+    assert len(cache) == 0
+
+
+def test_cache_keeps_empty_answers():
+    cache = WebhookRoutingCache()
+    tenant = uuid4()
+    cache.put(tenant, "hubspot", [])
+    assert cache.get(tenant, "hubspot") == []
+
+
+def test_invalidate_provider_or_whole_tenant():
+    cache = WebhookRoutingCache()
+    tenant, other = uuid4(), uuid4()
+    for provider in ("hubspot", "google_calendar"):
+        cache.put(tenant, provider, [uuid4()])
+    cache.put(other, "hubspot", [uuid4()])
+
+    cache.invalidate(tenant, "hubspot")
+    assert cache.get(tenant, "hubspot") is None
+    assert cache.get(tenant, "google_calendar") is not None
+
+    cache.invalidate(tenant)
+    assert cache.get(tenant, "google_calendar") is None
+    assert cache.get(other, "hubspot") is not None
+
+
+def test_evicts_oldest_beyond_max_entries():
+    cache = WebhookRoutingCache(max_entries=2)
+    tenants = [uuid4() for _ in range(3)]
+    for tenant in tenants:
+        cache.put(tenant, "hubspot", [])
+    assert cache.get(tenants[0], "hubspot") is None
+    assert cache.get(tenants[2], "hubspot") == []
+
+
+def test_zero_ttl_disables_caching():
+    cache = WebhookRoutingCache(ttl_seconds=0)
+    tenant = uuid4()
+    cache.put(tenant, "hubspot", [uuid4()])
+    assert cache.get(tenant, "hubspot") is None
+
+
+# ============================================================================
+# Cached routing lookup
+# ============================================================================
+
+
+def _db_with_tenant_credential(employee_ids: list) -> AsyncMock:
+    tenant_cred = Mock()
+    tenant_cred.scalar_one_or_none.return_value = uuid4()
+    employees = Mock()
+    employees.scalars.return_value.all.return_value = employee_ids
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=[tenant_cred, employees])
+    return db
+
+
+@pytest.mark.asyncio
+async def test_repeat_deliveries_skip_the_database(routing_cache):
+    tenant, emp = uuid4(), uuid4()
+    db = _db_with_tenant_credential([emp])
+
+    first = await webhooks_ep._find_employees_for_provider(db, tenant, "hubspot")
+    second = await webhooks_ep._find_employees_for_provider(db, tenant, "hubspot")
+
+    assert first == second == [emp]
+    assert db.execute.await_count == 2  # both queries ran once, for the first call
+
+
+@pytest.mark.asyncio
+async def test_invalidation_forces_requery(routing_cache):
+    tenant = uuid4()
+    await webhooks_ep._find_employees_for_provider(
+        _db_with_tenant_credential([uuid4()]), tenant, "hubspot"
+    )
+    webhook_routing.invalidate_webhook_routing(tenant)
+
+    db = _db_with_tenant_credential([])
+    assert await webhooks_ep._find_employees_for_provider(db, tenant, "hubspot") == []
+    assert db.execute.await_count == 2
+
+
+# ============================================================================
+# Commit hooks
+# ============================================================================
+
+
+def _session(*, new=(), dirty=(), deleted=()) -> SimpleNamespace:
+    return SimpleNamespace(new=set(new), dirty=set(dirty), deleted=set(deleted), info={})
+
+
+def test_commit_touching_credentials_or_employees_invalidates(routing_cache):
+    tenant, other = uuid4(), uuid4()
+    routing_cache.put(tenant, "hubspot", [uuid4()])
+    routing_cache.put(other, "hubspot", [uuid4()])
+
+    credential = IntegrationCredential(tenant_id=tenant)
+    session = _session(new=[credential])
+    webhook_routing._collect_routing_changes(session, None)
+    # Not yet committed: a concurrent delivery may still use the old answer
+    assert routing_cache.get(tenant, "hubspot") is not None
+
+    webhook_routing._invalidate_committed(session)
+    assert routing_cache.get(tenant, "hubspot") is None
+    assert routing_cache.get(other, "hubspot") is not None
+
+    employee = Employee(tenant_id=other)
+    session = _session(dirty=[employee])
+    webhook_routing._collect_routing_changes(session, None)
+    webhook_routing._invalidate_committed(session)
+    assert routing_cache.get(other, "hubspot") is None
+
+
+def test_rollback_discards_pending_invalidation(routing_cache):
+    tenant = uuid4()
+    routing_cache.put(tenant, "hubspot", [uuid4()])
+
+    session = _session(deleted=[Employee(tenant_id=tenant)])
+    webhook_routing._collect_routing_changes(session, None)
+    webhook_routing._discard_pending(session)
+    webhook_routing._invalidate_committed(session)
+
+    assert routing_cache.get(tenant, "hubspot") is not None
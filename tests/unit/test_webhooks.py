@@ -44,7 +44,8 @@ class TestHealthServerWake:
     def test_drain_events_clears_queue(self):
         """drain_events returns events and clears the queue."""
         server = self._make_server()
-        server._pending_events.extend([{"provider": "hubspot"}, {"provider": "google"}])
+        server.enqueue_event({"provider": "hubspot"})
+        server.enqueue_event({"provider": "google"})
 
         events = server.drain_events()
         assert len(events) == 2
@@ -53,7 +54,7 @@ class TestHealthServerWake:
     def test_drain_events_returns_list(self):
         """drain_events returns a list of pending events."""
         server = self._make_server()
-        server._pending_events.append({"provider": "test"})
+        server.enqueue_event({"provider": "test"})
 
         result = server.drain_events()
         assert isinstance(result, list)
@@ -119,6 +120,75 @@ class TestHealthServerWake:
         finally:
             await server.stop()
 
+    @pytest.mark.asyncio
+    async def test_debounced_wake_fires_once_per_burst(self):
+        """With debounce, a burst of deliveries wakes the loop once."""
+        from empla.runner.health import HealthServer
+
+        callback = Mock()
+        server = HealthServer(
+            employee_id=uuid4(),
+            port=0,
+            wake_callback=callback,
+            debounce_seconds=0.05,
+            max_debounce_seconds=1.0,
+        )
+        for i in range(20):
+            server.enqueue_event({"provider": "hubspot", "event_type": "deal.updated", "i": i})
+            server._schedule_wake()
+        callback.assert_not_called()
+
+        await asyncio.sleep(0.15)
+        callback.assert_called_once()
+        assert len(server.drain_events()) == 1
+
+    @pytest.mark.asyncio
+    async def test_debounce_capped_by_max_wait(self):
+        """A continuous stream still wakes the loop within max_debounce_seconds."""
+        from empla.runner.health import HealthServer
+
+        callback = Mock()
+        server = HealthServer(
+            employee_id=uuid4(),
+            port=0,
+            wake_callback=callback,
+            debounce_seconds=0.2,
+            max_debounce_seconds=0.3,
+        )
+        # Each event would push a plain debounce out to t+0.2 (fire at 0.4)
+        for _ in range(3):
+            server._schedule_wake()
+            await asyncio.sleep(0.1)
+        await asyncio.sleep(0.05)
+        callback.assert_called_once()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_wake_endpoint_invalidates_cached_tool_results(self):
+        """POST /wake should drop the provider's cached tool results."""
+        from empla.runner.health import HealthServer
+
+        tool_router = Mock()
+        server = HealthServer(employee_id=uuid4(), port=0, tool_router=tool_router)
+        await server.start()
+
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            body = json.dumps({"provider": "hubspot", "event_type": "deal.updated"}).encode()
+            request = (
+                f"POST /wake HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
+            ).encode() + body
+
+            writer.write(request)
+            await writer.drain()
+            await asyncio.wait_for(reader.read(4096), timeout=2.0)
+            writer.close()
+            await writer.wait_closed()
+
+            tool_router.invalidate_cached_results.assert_called_once_with("hubspot")
+        finally:
+            await server.stop()
+
     @pytest.mark.asyncio
     async def test_wake_endpoint_invalid_json(self):
         """POST /wake with invalid JSON should return 400."""
@@ -192,23 +262,19 @@ class TestHealthServerWake:
             await server.stop()
 
     @pytest.mark.asyncio
-    async def test_queue_overflow_drops_oldest(self):
-        """When queue is full, POST /wake should drop oldest and accept new."""
+    async def test_queue_overflow_counts_instead_of_dropping(self):
+        """When the pending set is full, new objects are counted, not dropped."""
         from empla.runner.health import _MAX_PENDING_EVENTS
 
         server = self._make_server()
         await server.start()
 
         try:
-            # Fill queue to max
             for i in range(_MAX_PENDING_EVENTS):
-                server._pending_events.append({"provider": "fill", "index": i})
-
-            assert len(server._pending_events) == _MAX_PENDING_EVENTS
+                server.enqueue_event({"provider": "fill", "event_type": f"type{i}", "index": i})
 
-            # Send one more event via actual endpoint
             reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
-            body = json.dumps({"provider": "new", "index": 999}).encode()
+            body = json.dumps({"provider": "new", "event_type": "x", "index": 999}).encode()
             request = (
                 f"POST /wake HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
             ).encode() + body
@@ -220,11 +286,17 @@ class TestHealthServerWake:
             await writer.wait_closed()
 
             assert b"200 OK" in response
-            # Queue still at max
-            assert len(server._pending_events) == _MAX_PENDING_EVENTS
-            # Oldest (index=0) was dropped, newest is last
-            assert server._pending_events[0]["index"] == 1
-            assert server._pending_events[-1]["index"] == 999
+            events = server.drain_events()
+            # Oldest entry kept; the newcomer is delivered as a counted aggregate
+            assert events[0]["index"] == 0
+            assert events[-1] == {
+                "provider": "new",
+                "event_type": "x",
+                "count": 1,
+                "overflow": True,
+                "received_at": "",
+                "summary": "1 more changes not itemized",
+            }
         finally:
             await server.stop()
 
@@ -254,7 +326,8 @@ class TestHealthServerWake:
     async def test_health_endpoint_shows_pending_count(self):
         """GET /health should include pending_events count."""
         server = self._make_server()
-        server._pending_events.extend([{"a": 1}, {"b": 2}])
+        server.enqueue_event({"provider": "hubspot"})
+        server.enqueue_event({"provider": "google"})
         await server.start()
 
         try:
@@ -341,7 +414,7 @@ class TestCheckPendingEvents:
 
     @pytest.mark.asyncio
     async def test_multiple_events(self):
-        """Multiple events should all be injected."""
+        """Multiple events are injected as one batch observation with counts."""
         loop = self._make_loop()
 
         mock_health = Mock()
@@ -357,7 +430,57 @@ class TestCheckPendingEvents:
 
         await loop._check_pending_events()
 
-        assert loop.memory.working.add_item.call_count == 2
+        loop.memory.working.add_item.assert_called_once()
+        content = loop.memory.working.add_item.call_args.kwargs["content"]
+        assert content["subtype"] == "external_event_batch"
+        assert content["event_count"] == 2
+        assert content["counts"] == {"hubspot deal.updated": 1, "google_calendar event.created": 1}
+        assert [e["summary"] for e in content["events"]] == ["", "Meeting added"]
+
+    @pytest.mark.asyncio
+    async def test_burst_summarized_with_counts(self):
+        """Merged counts add up and only the most recent items are listed."""
+        from empla.core.loop.execution import _MAX_BATCH_EVENT_ITEMS
+
+        loop = self._make_loop()
+        events = [
+            {"provider": "hubspot", "event_type": "deal.propertyChange", "summary": f"deal {i}"}
+            for i in range(40)
+        ]
+        events[-1]["count"] = 11
+        mock_health = Mock()
+        mock_health.drain_events.return_value = events
+        loop._health_server = mock_health
+
+        await loop._check_pending_events()
+
+        content = loop.memory.working.add_item.call_args.kwargs["content"]
+        assert content["event_count"] == 50
+        assert content["item_count"] == 40
+        assert "EVENT BATCH: 50 external changes" in content["description"]
+        assert len(content["events"]) == _MAX_BATCH_EVENT_ITEMS
+        assert content["events"][-1]["summary"] == "deal 39"
+        assert content["omitted_items"] == 40 - _MAX_BATCH_EVENT_ITEMS
+
+    @pytest.mark.asyncio
+    async def test_merged_single_event_mentions_count(self):
+        loop = self._make_loop()
+        mock_health = Mock()
+        mock_health.drain_events.return_value = [
+            {
+                "provider": "hubspot",
+                "event_type": "deal.propertyChange",
+                "summary": "deal 7",
+                "count": 3,
+            }
+        ]
+        loop._health_server = mock_health
+
+        await loop._check_pending_events()
+
+        content = loop.memory.working.add_item.call_args.kwargs["content"]
+        assert content["description"] == "EVENT: hubspot deal.propertyChange — deal 7 (3 changes)"
+        assert content["count"] == 3
 
     @pytest.mark.asyncio
     async def test_empty_events_is_noop(self):
@@ -445,6 +568,34 @@ class TestProviderParsers:
         )
         assert event_type == "contact.creation"
 
+    def test_hubspot_object_extractor(self):
+        from empla.integrations.hubspot.webhook import extract_hubspot_objects
+        from empla.integrations.webhooks import get_webhook_object_extractor
+
+        objects = extract_hubspot_objects(
+            [
+                {
+                    "subscriptionType": "deal.propertyChange",
+                    "objectId": 42,
+                    "propertyName": "dealstage",
+                    "propertyValue": "closedwon",
+                },
+                {"subscriptionType": "contact.creation", "objectId": 7},
+                {"subscriptionType": "contact.creation"},
+            ]
+        )
+        assert objects == [
+            {
+                "object_type": "deal",
+                "object_id": "42",
+                "event_type": "deal.propertyChange",
+                "detail": {"dealstage": "closedwon"},
+            },
+            {"object_type": "contact", "object_id": "7", "event_type": "contact.creation"},
+        ]
+        assert get_webhook_object_extractor("hubspot") is extract_hubspot_objects
+        assert get_webhook_object_extractor("nonexistent_provider") is None
+
     def test_google_parser(self):
         from empla.integrations.google_calendar.webhook import parse_google_webhook
 
@@ -667,6 +818,14 @@ class TestWebhookEndpoint:
             assert wake_call[0][0] == emp_id
             event_dict = wake_call[0][1]
             assert event_dict["provider"] == "hubspot"
+            assert event_dict["objects"] == [
+                {
+                    "object_type": "deal",
+                    "object_id": "123",
+                    "event_type": "deal.updated",
+                    "detail": {},
+                }
+            ]
 
     @pytest.mark.asyncio
     async def test_no_active_employees(self):
@@ -781,3 +940,50 @@ class TestWebhookEndpoint:
 
             assert resp.status_code == 200
             assert resp.json()["employees_notified"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_state_handler_still_wakes_employees(self):
+        """A broken provider state handler (e.g. CRM mirror) must not drop the event."""
+        from httpx import ASGITransport, AsyncClient
+
+        from empla.api.v1.endpoints import webhooks
+
+        emp_id = uuid4()
+        handler = AsyncMock(side_effect=RuntimeError("mirror table missing"))
+
+        app = self._make_app()
+        transport = ASGITransport(app=app)
+
+        with (
+            patch.object(
+                webhooks,
+                "_find_tenant_by_webhook_token",
+                new_callable=AsyncMock,
+                return_value=(uuid4(), uuid4()),
+            ),
+            patch.object(
+                webhooks,
+                "_find_employees_for_provider",
+                new_callable=AsyncMock,
+                return_value=[emp_id],
+            ),
+            patch(
+                "empla.integrations.webhooks.get_webhook_handlers",
+                return_value=[handler],
+            ),
+            patch("empla.api.v1.endpoints.webhooks.get_employee_manager") as mock_get_mgr,
+        ):
+            mock_manager = Mock()
+            mock_manager.wake_employee = AsyncMock(return_value=True)
+            mock_get_mgr.return_value = mock_manager
+
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                resp = await client.post(
+                    "/api/v1/webhooks/hubspot",
+                    headers={"X-Webhook-Token": "valid-token-1234567890"},
+                    json=[{"subscriptionType": "deal.propertyChange", "objectId": 1}],
+                )
+
+            assert resp.status_code == 200
+            assert resp.json()["employees_notified"] == 1
+            handler.assert_awaited_once()